@@ -568,14 +568,14 @@ static final function AddRoundKey(
     Offset_6 = Offset + 6;
     Offset_7 = Offset + 7;
 
-    Q[Offset  ] = Q[Offset  ] ^ SK[Offset  ];
-    Q[Offset_1] = Q[Offset_1] ^ SK[Offset_1];
-    Q[Offset_2] = Q[Offset_2] ^ SK[Offset_2];
-    Q[Offset_3] = Q[Offset_3] ^ SK[Offset_3];
-    Q[Offset_4] = Q[Offset_4] ^ SK[Offset_4];
-    Q[Offset_5] = Q[Offset_5] ^ SK[Offset_5];
-    Q[Offset_6] = Q[Offset_6] ^ SK[Offset_6];
-    Q[Offset_7] = Q[Offset_7] ^ SK[Offset_7];
+    Q[0] = Q[0] ^ SK[Offset  ];
+    Q[1] = Q[1] ^ SK[Offset_1];
+    Q[2] = Q[2] ^ SK[Offset_2];
+    Q[3] = Q[3] ^ SK[Offset_3];
+    Q[4] = Q[4] ^ SK[Offset_4];
+    Q[5] = Q[5] ^ SK[Offset_5];
+    Q[6] = Q[6] ^ SK[Offset_6];
+    Q[7] = Q[7] ^ SK[Offset_7];
 }
 
 `if(`isdefined(FCBENCHMARK))
@@ -585,14 +585,14 @@ static final function AddRoundKey_NoTempVars(
     optional int Offset = 0
 )
 {
-    Q[Offset    ] = Q[Offset    ] ^ SK[Offset    ];
-    Q[Offset + 1] = Q[Offset + 1] ^ SK[Offset + 1];
-    Q[Offset + 2] = Q[Offset + 2] ^ SK[Offset + 2];
-    Q[Offset + 3] = Q[Offset + 3] ^ SK[Offset + 3];
-    Q[Offset + 4] = Q[Offset + 4] ^ SK[Offset + 4];
-    Q[Offset + 5] = Q[Offset + 5] ^ SK[Offset + 5];
-    Q[Offset + 6] = Q[Offset + 6] ^ SK[Offset + 6];
-    Q[Offset + 7] = Q[Offset + 7] ^ SK[Offset + 7];
+    Q[0] = Q[0] ^ SK[Offset    ];
+    Q[1] = Q[1] ^ SK[Offset + 1];
+    Q[2] = Q[2] ^ SK[Offset + 2];
+    Q[3] = Q[3] ^ SK[Offset + 3];
+    Q[4] = Q[4] ^ SK[Offset + 4];
+    Q[5] = Q[5] ^ SK[Offset + 5];
+    Q[6] = Q[6] ^ SK[Offset + 6];
+    Q[7] = Q[7] ^ SK[Offset + 7];
 }
 `endif
 
@@ -649,7 +649,7 @@ static final function InvShiftRows(out array<int> Q)
 // {
 //     return (X << 16) | (X >>> 16);
 // }
-`define ROTR16(X) (((`X << 16) | (`X >>> 16)))
+`define ROTR16(X) ((((`X) << 16) | ((`X) >>> 16)))
 
 static final function InvMixColumns(out array<int> Q)
 {
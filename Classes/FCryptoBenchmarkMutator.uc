@@ -0,0 +1,1781 @@
+/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+// Generated by DevUtils/bench_codegen.py.
+
+/**
+ * Static versus dynamic array and call overhead microbenchmarks.
+ * Logs "BENCH|op|kind|size|mode|iterations|clock" lines.
+ */
+class FCryptoBenchmarkMutator extends Mutator;
+
+`include(FCrypto\Classes\FCryptoMacros.uci);
+
+function PostBeginPlay()
+{
+    super.PostBeginPlay();
+    RunBenchmarks();
+}
+
+final function RunBenchmarks()
+{
+    `fclog("running 40 benchmark cases");
+    Bench_Noop_S8_Inline();
+    Bench_Noop_S8_Call();
+    Bench_Noop_S37_Inline();
+    Bench_Noop_S37_Call();
+    Bench_Noop_D8_Inline();
+    Bench_Noop_D8_Call();
+    Bench_Noop_D37_Inline();
+    Bench_Noop_D37_Call();
+    Bench_Read_S8_Inline();
+    Bench_Read_S8_Call();
+    Bench_Read_S37_Inline();
+    Bench_Read_S37_Call();
+    Bench_Read_D8_Inline();
+    Bench_Read_D8_Call();
+    Bench_Read_D37_Inline();
+    Bench_Read_D37_Call();
+    Bench_Write_S8_Inline();
+    Bench_Write_S8_Call();
+    Bench_Write_S37_Inline();
+    Bench_Write_S37_Call();
+    Bench_Write_D8_Inline();
+    Bench_Write_D8_Call();
+    Bench_Write_D37_Inline();
+    Bench_Write_D37_Call();
+    Bench_Xor_S8_Inline();
+    Bench_Xor_S8_Call();
+    Bench_Xor_S37_Inline();
+    Bench_Xor_S37_Call();
+    Bench_Xor_D8_Inline();
+    Bench_Xor_D8_Call();
+    Bench_Xor_D37_Inline();
+    Bench_Xor_D37_Call();
+    Bench_Copy_S8_Inline();
+    Bench_Copy_S8_Call();
+    Bench_Copy_S37_Inline();
+    Bench_Copy_S37_Call();
+    Bench_Copy_D8_Inline();
+    Bench_Copy_D8_Call();
+    Bench_Copy_D37_Inline();
+    Bench_Copy_D37_Call();
+}
+
+static final function int Noop_S8(
+    out int A[8],
+    out int B[8]
+)
+{
+    return 0;
+}
+
+static final function int Noop_S37(
+    out int A[37],
+    out int B[37]
+)
+{
+    return 0;
+}
+
+static final function int Noop_D8(
+    out array<int> A,
+    out array<int> B
+)
+{
+    return 0;
+}
+
+static final function int Noop_D37(
+    out array<int> A,
+    out array<int> B
+)
+{
+    return 0;
+}
+
+static final function int Read_S8(
+    out int A[8],
+    out int B[8]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        Acc += A[J];
+    }
+    return Acc;
+}
+
+static final function int Read_S37(
+    out int A[37],
+    out int B[37]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        Acc += A[J];
+    }
+    return Acc;
+}
+
+static final function int Read_D8(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        Acc += A[J];
+    }
+    return Acc;
+}
+
+static final function int Read_D37(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        Acc += A[J];
+    }
+    return Acc;
+}
+
+static final function int Write_S8(
+    out int A[8],
+    out int B[8]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+    }
+    return Acc;
+}
+
+static final function int Write_S37(
+    out int A[37],
+    out int B[37]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+    }
+    return Acc;
+}
+
+static final function int Write_D8(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+    }
+    return Acc;
+}
+
+static final function int Write_D37(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+    }
+    return Acc;
+}
+
+static final function int Xor_S8(
+    out int A[8],
+    out int B[8]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = A[J] ^ B[J];
+    }
+    return Acc;
+}
+
+static final function int Xor_S37(
+    out int A[37],
+    out int B[37]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = A[J] ^ B[J];
+    }
+    return Acc;
+}
+
+static final function int Xor_D8(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = A[J] ^ B[J];
+    }
+    return Acc;
+}
+
+static final function int Xor_D37(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = A[J] ^ B[J];
+    }
+    return Acc;
+}
+
+static final function int Copy_S8(
+    out int A[8],
+    out int B[8]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        B[J] = A[J];
+    }
+    return Acc;
+}
+
+static final function int Copy_S37(
+    out int A[37],
+    out int B[37]
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        B[J] = A[J];
+    }
+    return Acc;
+}
+
+static final function int Copy_D8(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 8; ++J)
+    {
+        B[J] = A[J];
+    }
+    return Acc;
+}
+
+static final function int Copy_D37(
+    out array<int> A,
+    out array<int> B
+)
+{
+    local int J;
+    local int Acc;
+
+    Acc = 0;
+    for (J = 0; J < 37; ++J)
+    {
+        B[J] = A[J];
+    }
+    return Acc;
+}
+
+final function Bench_Noop_S8_Inline()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|static|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_S8_Call()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Noop_S8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|static|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_S37_Inline()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|static|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_S37_Call()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Noop_S37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|static|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_D8_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|dynamic|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_D8_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Noop_D8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|dynamic|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_D37_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|dynamic|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Noop_D37_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Noop_D37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|noop|dynamic|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_S8_Inline()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                Acc += A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|static|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_S8_Call()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Read_S8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|static|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_S37_Inline()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                Acc += A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|static|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_S37_Call()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Read_S37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|static|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_D8_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                Acc += A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|dynamic|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_D8_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Read_D8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|dynamic|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_D37_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                Acc += A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|dynamic|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Read_D37_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Read_D37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|read|dynamic|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_S8_Inline()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                A[J] = J;
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|static|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_S8_Call()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Write_S8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|static|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_S37_Inline()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                A[J] = J;
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|static|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_S37_Call()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Write_S37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|static|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_D8_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                A[J] = J;
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|dynamic|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_D8_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Write_D8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|dynamic|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_D37_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                A[J] = J;
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|dynamic|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Write_D37_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Write_D37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|write|dynamic|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_S8_Inline()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                A[J] = A[J] ^ B[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|static|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_S8_Call()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Xor_S8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|static|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_S37_Inline()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                A[J] = A[J] ^ B[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|static|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_S37_Call()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Xor_S37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|static|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_D8_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                A[J] = A[J] ^ B[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|dynamic|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_D8_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Xor_D8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|dynamic|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_D37_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                A[J] = A[J] ^ B[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|dynamic|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Xor_D37_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Xor_D37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|xor|dynamic|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_S8_Inline()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                B[J] = A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|static|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_S8_Call()
+{
+    local int A[8];
+    local int B[8];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Copy_S8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|static|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_S37_Inline()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                B[J] = A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|static|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_S37_Call()
+{
+    local int A[37];
+    local int B[37];
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Copy_S37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|static|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_D8_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 8; ++J)
+            {
+                B[J] = A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|dynamic|8|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_D8_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 8;
+    B.Length = 8;
+    for (J = 0; J < 8; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Copy_D8(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|dynamic|8|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_D37_Inline()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            for (J = 0; J < 37; ++J)
+            {
+                B[J] = A[J];
+            }
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|dynamic|37|inline|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+final function Bench_Copy_D37_Call()
+{
+    local array<int> A;
+    local array<int> B;
+    local int I;
+    local int J;
+    local int Acc;
+    local int Rep;
+    local float Time;
+
+    A.Length = 37;
+    B.Length = 37;
+    for (J = 0; J < 37; ++J)
+    {
+        A[J] = J;
+        B[J] = ~J;
+    }
+    Acc = 0;
+
+    for (Rep = 0; Rep < 3; ++Rep)
+    {
+        Time = 0;
+        Clock(Time);
+        for (I = 0; I < 2000; ++I)
+        {
+            Acc += Copy_D37(A, B);
+        }
+        UnClock(Time);
+        `fclog("BENCH|copy|dynamic|37|call|2000|" $ Time);
+    }
+
+    // Results are not used, keep the compiler quiet.
+    B[0] = Acc;
+}
+
+DefaultProperties
+{
+}
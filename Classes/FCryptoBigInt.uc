@@ -60,6 +60,7 @@ class FCryptoBigInt extends Object
 /*
  * Negate a boolean.
  */
+// @inline
 static final function int NOT(int Ctl)
 {
     return Ctl ^ 1;
@@ -68,6 +69,7 @@ static final function int NOT(int Ctl)
 /*
  * Multiplexer: returns X if ctl == 1, y if ctl == 0.
  */
+// @inline
 static final function int MUX(int Ctl, int X, Int Y)
 {
     return Y ^ ((-Ctl) & (X ^ Y));
@@ -76,6 +78,7 @@ static final function int MUX(int Ctl, int X, Int Y)
 /*
  * Equality check: returns 1 if X == y, 0 otherwise.
  */
+// @inline
 static final function int EQ(int X, int Y)
 {
     local int Q;
@@ -87,6 +90,7 @@ static final function int EQ(int X, int Y)
 /*
  * Inequality check: returns 1 if x != y, 0 otherwise.
  */
+// @inline
 static final function int NEQ(int X, int Y)
 {
     local int Q;
@@ -95,6 +99,7 @@ static final function int NEQ(int X, int Y)
     return (Q | (-Q)) >>> 31;
 }
 
+// @inline
 static final function int GT(int X, int Y)
 {
     /*
@@ -137,6 +142,7 @@ static final function int BIT_LENGTH(int X)
  * General comparison: returned value is -1, 0 or 1, depending on
  * whether x is lower than, equal to, or greater than y.
  */
+// @inline
 static final function int CMP(int X, int Y)
 {
     return GT(X, Y) | (-GT(Y, X));
@@ -145,6 +151,7 @@ static final function int CMP(int X, int Y)
 /*
  * Returns 1 if x == 0, 0 otherwise. Take care that the operand is signed.
  */
+// @inline
 static final function int EQ0(int X)
 {
     return (~(X | -X)) >>> 31;
@@ -284,6 +291,7 @@ static final function MemMove_Byte(
  * Offset is the number of uint16_t values
  * to ignore from the beginning of S.
  */
+// @specialize MemSet_UInt16_Static37(S[37])
 static final function MemSet_UInt16(
     out array<int> S,
     byte C,
@@ -310,39 +318,12 @@ static final function MemSet_UInt16(
     }
 }
 
-// See MemSet_UInt16.
-// TODO: move to dedicated memory class.
-static final function MemSet_UInt16_Static37(
-    out int S[37],
-    byte C,
-    int NumBytes,
-    optional int Offset = 0
-)
-{
-    local int IntIndex;
-    local int ByteIndex;
-    local int Shift;
-    local int Mask;
-
-    Shift = 8;
-    Mask = 0xff << Shift;
-    IntIndex = Offset;
-    for (ByteIndex = 0; ByteIndex < NumBytes; ++ByteIndex)
-    {
-        S[IntIndex] = (S[IntIndex] & ~Mask) | ((C & 0xff) << Shift);
-        // Shift = (Shift + 8) % 16;
-        Shift = (Shift + 8) & 15;
-        // IntIndex += ByteIndex % 2;
-        IntIndex += ByteIndex & 1;
-        Mask = 0xff << Shift;
-    }
-}
-
 /**
  * C-style memset operation.
  * Offset is the number of byte values
  * to ignore from the beginning of S.
  */
+// @specialize MemSet_Byte_Static66(S[66])
 static final function MemSet_Byte(
     out array<byte> S,
     byte C,
@@ -358,22 +339,6 @@ static final function MemSet_Byte(
     }
 }
 
-// See MemSet_Byte.
-static final function MemSet_Byte_Static66(
-    out byte S[66],
-    byte C,
-    int NumBytes,
-    optional int Offset = 0
-)
-{
-    local int ByteIndex;
-
-    for (ByteIndex = Offset; ByteIndex < NumBytes; ++ByteIndex)
-    {
-        S[ByteIndex] = C;
-    }
-}
-
 /**
  * C-style memcpy operation.
  * Offsets are the number of uint16_t values
@@ -475,6 +440,7 @@ static final function CCOPY(
  * Zeroize an integer. The announced bit length is set to the provided
  * value, and the corresponding words are set to 0.
  */
+// @specialize Zero_Static37(X[37])
 static final function Zero(
     out array<int> X,
     int BitLen
@@ -486,18 +452,6 @@ static final function Zero(
     MemSet_UInt16(X, 0, ((BitLen + 15) >>> 4) * SIZEOF_UINT16_T, 1);
 }
 
-// See Zero.
-static final function Zero_Static37(
-    out int X[37],
-    int BitLen
-)
-{
-    // *x ++ = bit_len;
-    // memset(x, 0, ((bit_len + 15) >> 4) * sizeof *x);
-    X[0] = BitLen & 0xFFFF; // @ALIGN-32-16.
-    MemSet_UInt16_Static37(X, 0, ((BitLen + 15) >>> 4) * SIZEOF_UINT16_T, 1);
-}
-
 /*
  * Add b[] to a[] and return the carry (0 or 1). If ctl is 0, then a[]
  * is unmodified, but the carry is still computed and returned. The
@@ -505,6 +459,8 @@ static final function Zero_Static37(
  *
  * a[] and b[] MAY be the same array, but partial overlap is not allowed.
  */
+// @specialize Add_Static37(A[37], B[37])
+// @specialize Add_Static37_DynB(A[37])
 static final function int Add(
     out array<int> A,
     const out array<int> B,
@@ -533,64 +489,6 @@ static final function int Add(
     return Cc;
 }
 
-// See Add.
-static final function int Add_Static37(
-    out int A[37],
-    const out int B[37],
-    int Ctl
-)
-{
-    local int Cc;
-    local int U;
-    local int M;
-    local int Aw;
-    local int Bw;
-    local int Naw;
-
-    Cc = 0;
-    M = (A[0] + 31) >>> 4;
-
-    for (U = 1; U < M; ++U)
-    {
-        Aw = A[U];
-        Bw = B[U];
-        Naw = Aw + Bw + Cc;
-        Cc = Naw >>> 15;
-        A[U] = MUX(Ctl, Naw & 0x7FFF, Aw) & 0xFFFF; // @ALIGN-32-16.
-    }
-
-    return Cc;
-}
-
-// See Add.
-static final function int Add_Static37_DynB(
-    out int A[37],
-    const out array<int> B,
-    int Ctl
-)
-{
-    local int Cc;
-    local int U;
-    local int M;
-    local int Aw;
-    local int Bw;
-    local int Naw;
-
-    Cc = 0;
-    M = (A[0] + 31) >>> 4;
-
-    for (U = 1; U < M; ++U)
-    {
-        Aw = A[U];
-        Bw = B[U];
-        Naw = Aw + Bw + Cc;
-        Cc = Naw >>> 15;
-        A[U] = MUX(Ctl, Naw & 0x7FFF, Aw) & 0xFFFF; // @ALIGN-32-16.
-    }
-
-    return Cc;
-}
-
 /*
  * Subtract b[] from a[] and return the carry (0 or 1). If ctl is 0,
  * then a[] is unmodified, but the carry is still computed and returned.
@@ -598,6 +496,8 @@ static final function int Add_Static37_DynB(
  *
  * a[] and b[] MAY be the same array, but partial overlap is not allowed.
  */
+// @specialize Sub_Static37_DynB(A[37])
+// @specialize Sub_Static37(A[37], B[37])
 static final function int Sub(
     out array<int> A,
     const out array<int> B,
@@ -631,65 +531,6 @@ static final function int Sub(
     return Cc;
 }
 
-// See Sub.
-static final function int Sub_Static37_DynB(
-    out int A[37],
-    const out array<int> B,
-    int Ctl
-)
-{
-    local int Cc;
-    local int U;
-    local int M;
-    local int Aw;
-    local int Bw;
-    local int Naw;
-
-    Cc = 0;
-    M = (A[0] + 31) >>> 4;
-
-    for (U = 1; U < M; ++U)
-    {
-        Aw = A[U];
-        Bw = B[U];
-        Naw = Aw - Bw - Cc;
-        CC = Naw >>> 31;
-        A[U] = MUX(Ctl, Naw & 0x7FFF, Aw) & 0xFFFF; // @ALIGN-32-16.
-    }
-
-    return Cc;
-}
-
-// See Sub.
-static final function int Sub_Static37(
-    out int A[37],
-    const out int B[37],
-    int Ctl
-)
-{
-    local int Cc;
-    local int U;
-    local int M;
-    local int Aw;
-    local int Bw;
-    local int Naw;
-
-    Cc = 0;
-    M = (A[0] + 31) >>> 4;
-
-    for (U = 1; U < M; ++U)
-    {
-        Aw = A[U];
-        Bw = B[U];
-        Naw = Aw - Bw - Cc;
-        CC = Naw >>> 31;
-        A[U] = MUX(Ctl, Naw & 0x7FFF, Aw) & 0xFFFF; // @ALIGN-32-16.
-    }
-
-    return Cc;
-}
-
-
 /*
  * Compute the actual bit length of an integer. The argument X should
  * point to the first (least significant) value word of the integer.
@@ -1287,6 +1128,7 @@ static final function RShift(
  * is too short then the integer is appropriately truncated; if it is
  * too long then the extra bytes are set to 0.
  */
+// @specialize Encode_Static66(Dst[66])
 static final function Encode(
     out array<byte> Dst,
     int Len,
@@ -1334,54 +1176,6 @@ static final function Encode(
     }
 }
 
-// See Encode.
-static final function Encode_Static66(
-    out byte Dst[66],
-    int Len,
-    const out array<int> X
-)
-{
-    local int U;
-    local int XLen;
-    local int Acc;
-    local int AccLen;
-
-    XLen = (X[0] + 15) >>> 4;
-    if (XLen == 0)
-    {
-        // NOTE: BearSSL assumes all parameters are user-allocated.
-        // In UnrealScript we'll make an exception here to avoid a bug
-        // where MemSet is called with Len == 0. TODO: SHOULD WE DO THIS?
-        // Probably no way to avoid this since we are not dealing with
-        // pointers in UScript like original BearSSL code does.
-        if (Len == 0)
-        {
-            Len = 1;
-        }
-
-        // memset(dst, 0, len);
-        MemSet_Byte_Static66(Dst, 0, Len);
-        return;
-    }
-    U = 1;
-    Acc = 0;
-    AccLen = 0;
-    while (Len-- > 0)
-    {
-        if (AccLen < 8)
-        {
-            if (U <= XLen)
-            {
-                Acc += X[U++] << AccLen;
-            }
-            AccLen += 15;
-        }
-        Dst[Len] = Acc;
-        Acc = Acc >>> 8;
-        AccLen -= 8;
-    }
-}
-
 /*
  * Convert a modular integer back from Montgomery representation. The
  * integer x[] MUST be lower than m[], but with the same announced bit
@@ -1477,6 +1271,7 @@ static final function ToMonty(
  * This function is called "BIsZero" because
  * "IsZero" would clash with Object::IsZero.
  */
+// @specialize BIsZero_Static37(X[37])
 static final function int BIsZero(const out array<int> X)
 {
     local int Z;
@@ -1490,20 +1285,6 @@ static final function int BIsZero(const out array<int> X)
     return ~(Z | -Z) >>> 31;
 }
 
-// See IsZero.
-static final function int BIsZero_Static37(const out int X[37])
-{
-    local int Z;
-    local int U;
-
-    Z = 0;
-    for (U = (X[0] + 15) >>> 4; U > 0; --U)
-    {
-        Z = Z | X[U];
-    }
-    return ~(Z | -Z) >>> 31;
-}
-
 /*
  * Negate big integer conditionally. The value consists of 'len' words,
  * with 15 bits in each word (the top bit of each word should be 0,
@@ -2109,6 +1890,7 @@ static final function ModPow_S37_S66_Dyn_S37_S37(
  * significant value word of m[] (this works only if m[] is an odd
  * integer).
  */
+// @specialize MontyMul_S37_S37_S37_DynM(D[37], X[37], Y[37])
 static final function MontyMul(
     out array<int> D,
     const out array<int> X,
@@ -2178,76 +1960,6 @@ static final function MontyMul(
     Sub(D, M, NEQ(DH, 0) | NOT(Sub(D, M, 0)));
 }
 
-// See MontyMul.
-static final function MontyMul_S37_S37_S37_DynM(
-    out int D[37],
-    const out int X[37],
-    const out int Y[37],
-    const out array<int> M,
-    int M0I
-)
-{
-    local int Len;
-    local int Len4;
-    local int U;
-    local int V;
-    local int Dh;
-    local int F;
-    local int Xu;
-    local int R;
-    local int Zh;
-    local int Z;
-
-    Len = (M[0] + 15) >>> 4;
-    Len4 = Len & ~3;
-    Zero_Static37(D, M[0]);
-    Dh = 0;
-    for (U = 0; U < Len; ++U)
-    {
-        Xu = X[U + 1];
-        // f = MUL15((d[1] + MUL15(x[u + 1], y[1])) & 0x7FFF, m0i) & 0x7FFF;
-        F = (((D[1] + (X[U + 1] * Y[1])) & 0x7FFF) * M0I) & 0x7FFF;
-        R = 0;
-        for (V = 0; V < Len4; V += 4)
-        {
-            Z = D[V + 1] + (Xu * Y[V + 1]) + (F * M[V + 1]) + R;
-            R = Z >>> 15;
-            D[V/*+0*/] = Z & 0x7FFF;
-            Z = D[V + 2] + (Xu * Y[V + 2]) + (F * M[V + 2]) + R;
-            R = Z >>> 15;
-            D[V + 1] = Z & 0x7FFF;
-            Z = D[V + 3] + (Xu * Y[V + 3]) + (F * M[V + 3]) + R;
-            R = Z >>> 15;
-            D[V + 2] = Z & 0x7FFF;
-            Z = D[V + 4] + (Xu * Y[V + 4]) + (F * M[V + 4]) + R;
-            R = Z >>> 15;
-            D[V + 3] = Z & 0x7FFF;
-        }
-
-        for (Z = 0; V < Len; ++V)
-        {
-            Z = D[V + 1] + (Xu * Y[V + 1]) + (F * M[V + 1]) + R;
-            R = Z >>> 15;
-            D[V/*+0*/] = Z & 0x7FFF;
-        }
-
-        Zh = Dh + R;
-        D[Len] = Zh & 0x7FFF;
-        Dh = Zh >>> 15;
-    }
-
-    /*
-     * Restore the bit length (it was overwritten in the loop above).
-     */
-    D[0] = M[0];
-
-    /*
-     * d[] may be greater than m[], but it is still lower than twice
-     * the modulus.
-     */
-    Sub_Static37_DynB(D, M, NEQ(DH, 0) | NOT(Sub_Static37_DynB(D, M, 0)));
-}
-
 /*
  * Compute a modular exponentiation. x[] MUST be an integer modulo m[]
  * (same announced bit length, lower value). m[] MUST be odd. The
@@ -2596,31 +2308,12 @@ static final function BytesFromHex(
     string HexString
 )
 {
-    local int K;
-    local int J;
-    local int LenStr;
-    local string ByteS;
-    local bool bSuccess;
-    local int Temp;
-
-    LenStr = Len(HexString);
-    if ((LenStr % 2) != 0)
-    {
-        HexString = "0" $ HexString;
-        ++LenStr;
-    }
-    K = 0;
-    J = 0;
-    Dst.Length = LenStr / 2;
-    while (J < LenStr)
+    if (!class'FCryptoUtils'.static.BytesFromHex(Dst, HexString))
     {
-        ByteS = Mid(HexString, J, 2);
-        bSuccess = class'FCryptoUtils'.static.FromHex(Bytes, Temp);
-        if (!bSuccess)
-        {
-            `fcserror("failed to convert Bytes:" @ Bytes @ "to an integer");
-        }
-        Dst[K++] = Temp;
-        J += 2;
+        `fcserror("failed to convert HexString:" @ HexString @ "to bytes");
     }
 }
+
+// Fixed-size static array specializations of the functions
+// annotated with @specialize above. See DevUtils/bigint_codegen.py.
+`include(FCrypto\Classes\FCryptoBigIntSpecializations.uci);
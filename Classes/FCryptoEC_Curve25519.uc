@@ -28,6 +28,7 @@ class FCryptoEC_Curve25519 extends Object
     notplaceable;
 
 `include(FCrypto\Classes\FCryptoMacros.uci);
+`include(FCrypto\Classes\FCryptoEC_Curve25519Tables.uci);
 
 var private const array<byte> _GEN;
 var private const array<byte> _ORDER;
@@ -46,6 +47,16 @@ var private const array<int> C255_A24;
 
 const ILEN = 32; // 18 * SIZEOF_UINT16_T.
 
+/*
+ * Precomputed fixed-base comb table for the Ed25519 base point,
+ * which maps to the Curve25519 generator (u = 9). Generated with
+ * DevUtils/ec_tables.py. Entries are in Niels form (y+x, y-x, 2*d*x*y),
+ * each coordinate multiplied by R mod p, ENTRY_WORDS words per entry.
+ * After an Edwards fixed-base multiplication, the Curve25519
+ * u-coordinate is (1 + y) / (1 - y).
+ */
+var private const array<int> C255_GComb;
+
 static function array<byte> Generator(EFCEllipticCurve Curve, out int Len)
 {
     Len = 32;
@@ -410,6 +421,8 @@ DefaultProperties
         0x0000
     )}
 
+    C255_GComb={(`C255_G_COMB_VALUES)}
+
     C255_A24={(
         0x0110,
         0x45D3, 0x0046, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
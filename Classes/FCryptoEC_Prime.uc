@@ -31,6 +31,7 @@ class FCryptoEC_Prime extends Object
 
 `include(FCrypto\Classes\FCryptoMacros.uci);
 `include(FCrypto\Classes\FCryptoEllipticCurveMacros.uci);
+`include(FCrypto\Classes\FCryptoEC_PrimeTables.uci);
 
 /*
  * Parameters for supported curves:
@@ -49,6 +50,14 @@ var const array<int> P521_P;
 var const array<int> P521_R2;
 var const array<int> P521_B;
 
+/*
+ * Precomputed fixed-base comb table for P-256, generated with
+ * DevUtils/ec_tables.py. Entry J-1 (1 <= J < 2^TEETH) holds
+ * sum(((J >>> I) & 1) * 2^(SPACING * I) * G) as affine coordinates
+ * (x*R mod p, y*R mod p), ENTRY_WORDS words per entry. Z is R mod p.
+ */
+var const array<int> P256_GComb;
+
 struct CurveParams
 {
     var const array<int> P;
@@ -245,9 +254,7 @@ static final function int RunCode(
     local int U;
     local int Op;
     local int D;
-    local int D_Tmp;
     local int A;
-    local int A_Tmp;
     local int B;
     local int Ctl;
     local int PLen;
@@ -357,83 +364,7 @@ static final function int RunCode(
         {
             case 0:
                 // memcpy(t[d], t[a], I15_LEN * sizeof(uint16_t));
-                T[D    ].X[ 0] = T[A    ].X[ 0];
-                T[D    ].X[ 1] = T[A    ].X[ 1];
-                T[D    ].X[ 2] = T[A    ].X[ 2];
-                T[D    ].X[ 3] = T[A    ].X[ 3];
-                T[D    ].X[ 4] = T[A    ].X[ 4];
-                T[D    ].X[ 5] = T[A    ].X[ 5];
-                T[D    ].X[ 6] = T[A    ].X[ 6];
-                T[D    ].X[ 7] = T[A    ].X[ 7];
-                T[D    ].X[ 8] = T[A    ].X[ 8];
-                T[D    ].X[ 9] = T[A    ].X[ 9];
-                T[D    ].X[10] = T[A    ].X[10];
-                T[D    ].X[11] = T[A    ].X[11];
-                T[D    ].X[12] = T[A    ].X[12];
-                T[D    ].X[13] = T[A    ].X[13];
-                T[D    ].X[14] = T[A    ].X[14];
-                T[D    ].X[15] = T[A    ].X[15];
-                T[D    ].X[16] = T[A    ].X[16];
-                T[D    ].X[17] = T[A    ].X[17];
-                T[D    ].X[18] = T[A    ].X[18];
-                T[D    ].X[19] = T[A    ].X[19];
-                T[D    ].X[20] = T[A    ].X[20];
-                T[D    ].X[21] = T[A    ].X[21];
-                T[D    ].X[22] = T[A    ].X[22];
-                T[D    ].X[23] = T[A    ].X[23];
-                T[D    ].X[24] = T[A    ].X[24];
-                T[D    ].X[25] = T[A    ].X[25];
-                T[D    ].X[26] = T[A    ].X[26];
-                T[D    ].X[27] = T[A    ].X[27];
-                T[D    ].X[28] = T[A    ].X[28];
-                T[D    ].X[29] = T[A    ].X[29];
-                T[D    ].X[30] = T[A    ].X[30];
-                T[D    ].X[31] = T[A    ].X[31];
-                T[D    ].X[32] = T[A    ].X[32];
-                T[D    ].X[33] = T[A    ].X[33];
-                T[D    ].X[34] = T[A    ].X[34];
-                T[D    ].X[35] = T[A    ].X[35];
-                T[D    ].X[36] = T[A    ].X[36];
-
-                D_Tmp = D + 1;
-                A_Tmp = A + 1;
-                T[D_Tmp].X[ 0] = T[A_Tmp].X[ 0];
-                T[D_Tmp].X[ 1] = T[A_Tmp].X[ 1];
-                T[D_Tmp].X[ 2] = T[A_Tmp].X[ 2];
-                T[D_Tmp].X[ 3] = T[A_Tmp].X[ 3];
-                T[D_Tmp].X[ 4] = T[A_Tmp].X[ 4];
-                T[D_Tmp].X[ 5] = T[A_Tmp].X[ 5];
-                T[D_Tmp].X[ 6] = T[A_Tmp].X[ 6];
-                T[D_Tmp].X[ 7] = T[A_Tmp].X[ 7];
-                T[D_Tmp].X[ 8] = T[A_Tmp].X[ 8];
-                T[D_Tmp].X[ 9] = T[A_Tmp].X[ 9];
-                T[D_Tmp].X[10] = T[A_Tmp].X[10];
-                T[D_Tmp].X[11] = T[A_Tmp].X[11];
-                T[D_Tmp].X[12] = T[A_Tmp].X[12];
-                T[D_Tmp].X[13] = T[A_Tmp].X[13];
-                T[D_Tmp].X[14] = T[A_Tmp].X[14];
-                T[D_Tmp].X[15] = T[A_Tmp].X[15];
-                T[D_Tmp].X[16] = T[A_Tmp].X[16];
-                T[D_Tmp].X[17] = T[A_Tmp].X[17];
-                T[D_Tmp].X[18] = T[A_Tmp].X[18];
-                T[D_Tmp].X[19] = T[A_Tmp].X[19];
-                T[D_Tmp].X[20] = T[A_Tmp].X[20];
-                T[D_Tmp].X[21] = T[A_Tmp].X[21];
-                T[D_Tmp].X[22] = T[A_Tmp].X[22];
-                T[D_Tmp].X[23] = T[A_Tmp].X[23];
-                T[D_Tmp].X[24] = T[A_Tmp].X[24];
-                T[D_Tmp].X[25] = T[A_Tmp].X[25];
-                T[D_Tmp].X[26] = T[A_Tmp].X[26];
-                T[D_Tmp].X[27] = T[A_Tmp].X[27];
-                T[D_Tmp].X[28] = T[A_Tmp].X[28];
-                T[D_Tmp].X[29] = T[A_Tmp].X[29];
-                T[D_Tmp].X[30] = T[A_Tmp].X[30];
-                T[D_Tmp].X[31] = T[A_Tmp].X[31];
-                T[D_Tmp].X[32] = T[A_Tmp].X[32];
-                T[D_Tmp].X[33] = T[A_Tmp].X[33];
-                T[D_Tmp].X[34] = T[A_Tmp].X[34];
-                T[D_Tmp].X[35] = T[A_Tmp].X[35];
-                T[D_Tmp].X[36] = T[A_Tmp].X[36];
+                T[D] = T[A];
                 break;
             case 1:
                 Ctl = class'FCryptoBigInt'.static.Add_Static37(T[D].X, T[A].X, 1);
@@ -457,7 +388,7 @@ static final function int RunCode(
                     T[D].X, Tp, PLen, Cc.P, Cc.P0i, T[A].X, T[B].X);
                 break;
             default:
-                R = R & class'FCryptoBigInt'.static.BIsZero_Static37(T[D].X);
+                R = R & ~class'FCryptoBigInt'.static.BIsZero_Static37(T[D].X);
                 break;
         }
     }
@@ -535,12 +466,20 @@ static final function PointZero(
     P.C[2].X[0] = Cc.P[0];
 }
 
+/*
+ * Straight-line versions of the Code* programs without the interpreter
+ * dispatch and register copies of RunCode, compiled with
+ * DevUtils/ec_opcodes.py.
+ */
+`include(FCrypto\Classes\FCryptoEC_PrimeCode.uci);
+
 static final function PointDouble(
     out Jacobian P,
     const out CurveParams Cc
 )
 {
-    RunCode(P, P, Cc, default.CodeDouble);
+    // RunCode(P, P, Cc, default.CodeDouble);
+    RunCodeDouble(P, Cc);
 }
 
 static final function int PointAdd(
@@ -549,7 +488,8 @@ static final function int PointAdd(
     const out CurveParams Cc
 )
 {
-    return RunCode(P1, P2, Cc, default.CodeAdd);
+    // return RunCode(P1, P2, Cc, default.CodeAdd);
+    return RunCodeAdd(P1, P2, Cc);
 }
 
 static final function PointMul(
@@ -668,7 +608,8 @@ static final function int PointDecode(
     // memcpy(Q.c[0], cc->R2, zlen);
 	// memcpy(Q.c[1], cc->b, zlen);
 	// SetOne(Q.C[2], Cc.P); TODO: need another variant for this.
-	R = R & ~RunCode(P, Q, Cc, default.CodeCheck);
+	// R = R & ~RunCode(P, Q, Cc, default.CodeCheck);
+	R = R & ~RunCodeCheck(P, Q, Cc);
     return R;
 }
 
@@ -762,6 +703,8 @@ DefaultProperties
     P521_R2 = {(`P521_R2_VALUES)}
     P521_B  = {(`P521_B_VALUES)}
 
+    P256_GComb={(`P256_G_COMB_VALUES)}
+
     _PP(0)={(P=(`P256_P_VALUES), B=(`P256_B_VALUES), R2=(`P256_R2_VALUES), P0i=0x001, PointLen=65)}
     _PP(1)={(P=(`P384_P_VALUES), B=(`P384_B_VALUES), R2=(`P384_R2_VALUES), P0i=0x001, PointLen=97)}
     _PP(2)={(P=(`P521_P_VALUES), B=(`P521_B_VALUES), R2=(`P521_R2_VALUES), P0i=0x001, PointLen=133)}
@@ -846,11 +789,194 @@ DefaultProperties
     )}
 
     CodeAdd={(
+        /*
+        * Compute u1 = x1*z2^2 (in t1) and s1 = y1*z2^3 (in t3).
+        */
+        // `MMUL(`t3, `P2z, `P2z),
+        // `MMUL(`t1, `P1x, `t3),
+        // `MMUL(`t4, `P2z, `t3),
+        // `MMUL(`t3, `P1y, `t4),
+        14421,
+        13832,
+        14680,
+        14361,
+
+        /*
+        * Compute u2 = x2*z1^2 (in t2) and s2 = y2*z1^3 (in t4).
+        */
+        // `MMUL(`t4, `P1z, `P1z),
+        // `MMUL(`t2, `P2x, `t4),
+        // `MMUL(`t5, `P1z, `t4),
+        // `MMUL(`t4, `P2y, `t5),
+        14626,
+        14137,
+        14889,
+        14666,
+
+        /*
+        * Compute h = u2 - u1 (in t2) and r = s2 - s1 (in t4).
+        */
+        // `MSUB(`t2, `t1),
+        // `MSUB(`t4, `t3),
+        10080,
+        10624,
+
+        /*
+        * Report cases where r = 0 through the returned flag.
+        */
+        // `MTZ(`t4),
+        22784,
+
+        /*
+        * Compute u1*h^2 (in t6) and h^3 (in t5).
+        */
+        // `MMUL(`t7, `t2, `t2),
+        // `MMUL(`t6, `t1, `t7),
+        // `MMUL(`t5, `t7, `t2),
+        15479,
+        15212,
+        15047,
+
+        /*
+        * Compute x3 = r^2 - h^3 - 2*u1*h^2.
+        * t1 and t7 can be used as scratch registers.
+        */
+        // `MMUL(`P1x, `t4, `t4),
+        // `MSUB(`P1x, `t5),
+        // `MSUB(`P1x, `t6),
+        // `MSUB(`P1x, `t6),
+        12441,
+        8352,
+        8368,
+        8368,
+
+        /*
+        * Compute y3 = r*(u1*h^2 - x3) - s1*h^3.
+        */
+        // `MSUB(`t6, `P1x),
+        // `MMUL(`P1y, `t4, `t6),
+        // `MMUL(`t1, `t5, `t3),
+        // `MSUB(`P1y, `t1),
+        11008,
+        12699,
+        13992,
+        8544,
+
+        /*
+        * Compute z3 = h*z1*z2.
+        */
+        // `MMUL(`t1, `P1z, `P2z),
+        // `MMUL(`P1z, `t1, `t2),
+        13861,
+        12903,
 
         `ENCODE
     )}
 
     CodeCheck={(
+        /*
+        * Convert x and y to Montgomery representation.
+        */
+        // `MMUL(`t1, `P1x, `P2x),
+        // `MMUL(`t2, `P1y, `P2x),
+        // `MSET(`P1x, `t1),
+        // `MSET(`P1y, `t2),
+        13827,
+        14099,
+        96,
+        368,
+
+        /*
+        * Compute x^3 in t1.
+        */
+        // `MMUL(`t2, `P1x, `P1x),
+        // `MMUL(`t1, `P1x, `t2),
+        14080,
+        13831,
+
+        /*
+        * Subtract 3*x from t1.
+        */
+        // `MSUB(`t1, `P1x),
+        // `MSUB(`t1, `P1x),
+        // `MSUB(`t1, `P1x),
+        9728,
+        9728,
+        9728,
+
+        /*
+        * Add b.
+        */
+        // `MADD(`t1, `P2y),
+        5696,
+
+        /*
+        * Compute y^2 in t2.
+        */
+        // `MMUL(`t2, `P1y, `P1y),
+        14097,
+
+        /*
+        * Compare y^2 with x^3 - 3*x + b; they must match.
+        */
+        // `MSUB(`t1, `t2),
+        // `MTZ(`t1),
+        9840,
+        22016,
+
+        /*
+        * Set z to 1 (in Montgomery representation).
+        */
+        // `MMUL(`P1z, `P2x, `P2z),
+        12853,
+
+        `ENCODE
+    )}
+
+    CodeAffine={(
+        /*
+        * Save z*R in t1.
+        */
+        // `MSET(`t1, `P1z),
+        1568,
+
+        /*
+        * Compute z^3 in t2.
+        */
+        // `MMUL(`t2, `P1z, `P1z),
+        // `MMUL(`t3, `P1z, `t2),
+        // `MMUL(`t2, `t3, `P2z),
+        14114,
+        14375,
+        14213,
+
+        /*
+        * Invert to (1/z^3) in t2.
+        */
+        // `MINV(`t2, `t3, `t4),
+        18313,
+
+        /*
+        * Compute y.
+        */
+        // `MSET(`t3, `P1y),
+        // `MMUL(`P1y, `t2, `t3),
+        2064,
+        12664,
+
+        /*
+        * Compute (1/z^2) in t3.
+        */
+        // `MMUL(`t3, `t2, `t1),
+        14454,
+
+        /*
+        * Compute x.
+        */
+        // `MSET(`t2, `P1x),
+        // `MMUL(`P1x, `t2, `t3),
+        1792,
+        12408,
 
         `ENCODE
     )}
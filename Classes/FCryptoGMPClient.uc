@@ -201,13 +201,7 @@ simulated final function LogTransferRates()
 simulated event Tick(float DeltaTime)
 {
     local int I;
-    // local int J;
-    // local int K;
-    // local int LenResult;
-    // local string ByteS;
     local int Fail;
-    local int Temp;
-    local bool bSuccess;
 
     if (bDone && bTestMutatorDone)
     {
@@ -230,35 +224,10 @@ simulated event Tick(float DeltaTime)
         R_GMPOperandName = R_Array[1];
         R_Result = R_Array[2];
 
-        if (Len(R_Result) < 3)
+        if (!class'FCryptoUtils'.static.BytesFromHex(R_ResultBytes, R_Result))
         {
-            R_ResultBytes.Length = 1;
-            bSuccess = class'FCryptoUtils'.static.FromHex(R_Result, Temp);
-            if (!bSuccess)
-            {
-                `fcerror("failed to convert R_Result:" @ R_Result @ "to an integer");
-                ++Failures;
-            }
-            R_ResultBytes[0] = Temp;
-        }
-        else
-        {
-            // LenResult = Len(R_Result);
-            // if ((LenResult % 2) != 0)
-            // {
-            //     R_Result = "0" $ R_Result;
-            //     ++LenResult;
-            // }
-            // K = 0;
-            // J = 0;
-            // R_ResultBytes.Length = LenResult / 2;
-            // while (J < LenResult)
-            // {
-            //     ByteS = Mid(R_Result, J, 2);
-            //     R_ResultBytes[K++] = class'WebAdminUtils'.static.FromHex(ByteS);
-            //     J += 2;
-            // }
-            class'FCryptoBigInt'.static.BytesFromHex(R_ResultBytes, R_Result);
+            `fcerror("failed to convert R_Result:" @ R_Result @ "to bytes");
+            ++Failures;
         }
 
         if (R_TID == ID_PRIME)
@@ -170,7 +170,7 @@ static final function MemSet_SBytes64(
 {
     local int ByteIndex;
 
-    for (ByteIndex = Offset; ByteIndex < NumBytes; ++ByteIndex)
+    for (ByteIndex = Offset; ByteIndex < Offset + NumBytes; ++ByteIndex)
     {
         S[ByteIndex] = C;
     }
@@ -42,53 +42,7 @@ var const array<int> SHA256_IV;
 var const array<int> K_SMALL;
 var const array<FCQWORD> K_BIG;
 
-static final function Sha2SmallRound(
-    const out array<byte> Buf,
-    out array<int> Val
-)
-{
-    local int T1;
-    local int T2;
-    local int A;
-    local int B;
-    local int C;
-    local int D;
-    local int E;
-    local int F;
-    local int G;
-    local int H;
-    local array<int> W;
-
-    W.Length = 64;
-
-    RangeDec32BE(W, 16, Buf);
-
-    `SHA_224_BODY();
-}
-
-// TODO: use more macros to reduce duplication between variants
-//       of this function.
-static final function Sha2SmallRound_SBuf64_SVal8(
-    const out byte Buf[64],
-    out int Val[8]
-)
-{
-    local int T1;
-    local int T2;
-    local int A;
-    local int B;
-    local int C;
-    local int D;
-    local int E;
-    local int F;
-    local int G;
-    local int H;
-    local int W[64];
-
-    RangeDec32BE_Static64(W, 16, Buf);
-
-    `SHA_224_BODY();
-}
+`include(FCrypto\Classes\FCryptoSHA2Code.uci);
 
 static final function Sha2SmallUpdate(
     out FCryptoSHA224Context Cc,
@@ -106,25 +60,39 @@ static final function Sha2SmallUpdate(
     // TODO: if not, use QWORDs?
     Ptr = Cc.Count & 63;
     Cc.Count += Len;
-    while (Len > 0)
+
+    // Complete the partial block left over from the previous call.
+    if (Ptr > 0)
     {
         CLen = 64 - Ptr;
         if (CLen > Len)
         {
             CLen = Len;
         }
-        // TODO: move all memory functions to dedicated file.
-        // TODO: use MemCpy here?
         class'FCryptoMemory'.static.MemMove_SBytes_DBytes_64(Cc.Buf, Data, CLen, Ptr, DataIdx);
         Ptr += CLen;
         DataIdx += CLen;
         Len -= CLen;
 
-        if (Ptr == 64)
+        if (Ptr < 64)
         {
-            Sha2SmallRound_SBuf64_SVal8(Cc.Buf, Cc.Val);
-            Ptr = 0;
+            return;
         }
+        Sha2SmallRound_SBuf64_SVal8(Cc.Buf, Cc.Val);
+    }
+
+    // Whole blocks are compressed straight from Data,
+    // without copying them to Cc.Buf first.
+    if (Len >= 64)
+    {
+        Sha2SmallBlocks(Data, DataIdx, Len >>> 6, Cc.Val);
+        DataIdx += Len & ~63;
+        Len = Len & 63;
+    }
+
+    if (Len > 0)
+    {
+        class'FCryptoMemory'.static.MemMove_SBytes_DBytes_64(Cc.Buf, Data, Len, 0, DataIdx);
     }
 }
 
@@ -137,10 +105,14 @@ static final function Sha2SmallOut(
     local byte Buf[64];
     local int Val[8];
     local int Ptr;
+    local int I;
 
     Ptr = Cc.Count & 63;
     class'FCryptoMemory'.static.MemCpy_SBytes_SBytes_64(Buf, Cc.Buf, Ptr);
-    class'FCryptoMemory'.static.MemCpy_SInts_SInts_8(Val, CC.Val, 32 /* sizeof Val */);
+    for (I = 0; I < 8; ++I)
+    {
+        Val[I] = Cc.Val[I];
+    }
     Buf[Ptr++] = 0x80;
     if (Ptr > 56)
     {
@@ -153,7 +125,8 @@ static final function Sha2SmallOut(
         class'FCryptoMemory'.static.MemSet_SBytes64(Buf, 0, 56 - Ptr, Ptr);
     }
 
-    Enc64BE_Static64(Buf, Cc.Count << 3, 56); // TODO: QWORD impl?
+    // Message length in bits.
+    Enc64BE_Static64(Buf, Cc.Count >>> 29, Cc.Count << 3, 56);
     Sha2SmallRound_SBuf64_SVal8(Buf, Val);
     RangeEnc32BE_SVal8(Dst, Val, Num);
 }
@@ -224,15 +197,13 @@ static final function int Dec32BE_Static64(
 // TODO: make this a macro for performance?
 static final function Enc64BE_Static64(
     out byte Dst[64],
-    int X, // TODO: need to use a QWORD here?
+    int Hi,
+    int Lo,
     optional int Offset = 0
 )
 {
-    // TODO: QWORD impl here?
-    // br_enc32be(buf, (uint32_t)(x >> 32));
-    // br_enc32be(buf + 4, (uint32_t)x);
-
-    Enc32BE_Static64(Dst, X, Offset);
+    Enc32BE_Static64(Dst, Hi, Offset);
+    Enc32BE_Static64(Dst, Lo, Offset + 4);
 }
 
 // TODO: make this a macro for performance?
@@ -289,8 +260,22 @@ static final function Sha224Init(out FCryptoSHA224Context Cc)
     Cc.Val[3] = default.SHA224_IV[3];
     Cc.Val[4] = default.SHA224_IV[4];
     Cc.Val[5] = default.SHA224_IV[5];
-    Cc.Val[5] = default.SHA224_IV[6];
-    Cc.Val[6] = default.SHA224_IV[7];
+    Cc.Val[6] = default.SHA224_IV[6];
+    Cc.Val[7] = default.SHA224_IV[7];
+    Cc.Count = 0;
+}
+
+static final function Sha256Init(out FCryptoSHA224Context Cc)
+{
+    Cc.Val[0] = default.SHA256_IV[0];
+    Cc.Val[1] = default.SHA256_IV[1];
+    Cc.Val[2] = default.SHA256_IV[2];
+    Cc.Val[3] = default.SHA256_IV[3];
+    Cc.Val[4] = default.SHA256_IV[4];
+    Cc.Val[5] = default.SHA256_IV[5];
+    Cc.Val[6] = default.SHA256_IV[6];
+    Cc.Val[7] = default.SHA256_IV[7];
+    Cc.Count = 0;
 }
 
 // TODO: what's the point of this abstraction?
@@ -46,6 +46,7 @@ class FCryptoTestMutator extends Mutator
 
 `include(FCrypto\Classes\FCryptoMacros.uci);
 `include(FCrypto\Classes\FCryptoEllipticCurveMacros.uci);
+`include(FCrypto\Classes\FCryptoAESTestVectors.uci);
 
 var private FCryptoGMPClient GMPClient;
 var private FCryptoUtils Utils;
@@ -68,7 +69,9 @@ var(FCryptoTests) editconst float TestDelay;
 // Number of times to repeat all test suites in a loop.
 // Overwrite with launch option ?NumTestLoops=INT_VALUE.
 var(FCryptoTests) editconst int NumTestLoops;
-// Current test iteration.
+// Current test iteration. Iterations CurrentTestIteration...NumTestLoops-1
+// are run, allowing the loops to be split between several servers.
+// Overwrite with launch option ?FirstTestLoop=INT_VALUE.
 var(FCryptoTests) editconst int CurrentTestIteration;
 
 var(FCryptoTests) bool bExitTimerSet;
@@ -82,7 +85,14 @@ var(FCryptoTests) editconst float GlobalClock;
 // Workaround for UScript not supporting nested arrays.
 struct PrimeWrapper
 {
+    // Big-endian bytes.
     var array<byte> P;
+    // Pre-decoded i15 words of P (see FCryptoBigInt::Decode),
+    // -(1/M[1]) mod 2^15 (see FCryptoBigInt::NInv15) and R^2 mod P.
+    // Only set for pre-generated primes.
+    var array<int> M;
+    var int M0I;
+    var array<int> R2;
 };
 
 // Pre-generated "random" primes with GMP (see BearSSL test_math.c rand_prime()).
@@ -132,6 +142,17 @@ var(FCryptoTests) editconst const array<string> KAT_AES_CBC;
  */
 var(FCryptoTests) editconst const array<string> KAT_AES_CTR;
 
+/*
+ * Bitsliced AES (AesCt*) vectors generated by DevUtils/aes_ct.py.
+ * See FCryptoAESTestVectors.uci for the record layouts.
+ */
+var(FCryptoTests) editconst const array<int> AesCtKeyVectors;
+var(FCryptoTests) editconst const array<int> AesCtBlockVectors;
+// All AesCtBlockVectors states are checked on the first test loop
+// only. Later loops check the known answers and every
+// AesCtSampleStride-th of the other states.
+var(FCryptoTests) editconst int AesCtSampleStride;
+
 var const FCryptoEC_Prime.Jacobian ZERO_JACOBIAN;
 
 // Callback to FCryptoGMPClient::RandPrime.
@@ -158,6 +179,11 @@ function InitMutator(string Options, out string ErrorMessage)
 {
     local string TestDelayOption;
     local string NumTestLoopsOption;
+    local string FirstTestLoopOption;
+    local string GMPPortOption;
+    local string TestsOption;
+    local array<string> SelectedTests;
+    local int I;
 
     TestDelayOption = class'GameInfo'.static.ParseOption(Options, "TestDelay");
     if (TestDelayOption != "")
@@ -173,6 +199,31 @@ function InitMutator(string Options, out string ErrorMessage)
         `fclog("Using NumTestLoops:" @ NumTestLoops);
     }
 
+    FirstTestLoopOption = class'GameInfo'.static.ParseOption(Options, "FirstTestLoop");
+    if (FirstTestLoopOption != "")
+    {
+        CurrentTestIteration = Max(0, int(FirstTestLoopOption));
+        `fclog("Using FirstTestLoop:" @ CurrentTestIteration);
+    }
+
+    // Comma separated test suite names, e.g. ?Tests=TestMath,TestSpeed.
+    // Test delegates are already set up in PreBeginPlay.
+    TestsOption = class'GameInfo'.static.ParseOption(Options, "Tests");
+    if (TestsOption != "")
+    {
+        ParseStringIntoArray(TestsOption, SelectedTests, ",", True);
+        for (I = TestDelegatesToRun.Length - 1; I >= 0; --I)
+        {
+            if (SelectedTests.Find(string(TestDelegatesToRun[I].TestName)) == INDEX_NONE)
+            {
+                TestDelegatesToRun.Remove(I, 1);
+            }
+        }
+        `fclog("Using Tests:" @ TestsOption @ "(" $ TestDelegatesToRun.Length @ "selected)");
+    }
+
+    GMPPortOption = class'GameInfo'.static.ParseOption(Options, "GMPPort");
+
     super.InitMutator(Options, ErrorMessage);
 
     GMPClient = Spawn(class'FCryptoGMPClient', self);
@@ -182,6 +233,11 @@ function InitMutator(string Options, out string ErrorMessage)
     }
     else
     {
+        if (GMPPortOption != "")
+        {
+            GMPClient.TargetPort = int(GMPPortOption);
+            `fclog("Using GMPPort:" @ GMPClient.TargetPort);
+        }
         GMPClient.ConnectToServer();
     }
 
@@ -576,20 +632,7 @@ static final simulated function string BytesWordsToString(
     optional string Delimiter = " "
 )
 {
-    local int I;
-    local string Str;
-
-    Str = "";
-    for (I = 0; I < X.Length; ++I)
-    {
-        Str $= Right(ToHex(X[I]), 2);
-        if (I < X.Length - 1 && Delimiter != "")
-        {
-            Str $= Delimiter;
-        }
-    }
-
-    return Str;
+    return class'FCryptoUtils'.static.BytesToHex(X, Delimiter);
 }
 
 static final simulated function LogBytes(
@@ -610,9 +653,13 @@ private final simulated function GetRandomPrime(
 }
 
 private final simulated function GetPrime(
-    out array<byte> Dst
+    out array<byte> Dst,
+    out array<int> M,
+    out int M0I
 )
 {
+    M = Primes[PrimeIndex].M;
+    M0I = Primes[PrimeIndex].M0I;
     Dst = Primes[PrimeIndex++].P;
     PrimeIndex = PrimeIndex % Primes.Length;
 }
@@ -1265,11 +1312,14 @@ private final simulated function int TestMath()
         {
             if (!bUseRandomPrimes)
             {
-                GetPrime(P);
+                // Pre-generated primes are already decoded.
+                GetPrime(P, Mp, MP0I);
             }
             else
             {
                 GetRandomPrime(P);
+                class'FCryptoBigInt'.static.Decode(Mp, P, P.Length);
+                MP0I = class'FCryptoBigInt'.static.NInv15(Mp[1]);
             }
 
             RandomBigInt(A, P);
@@ -1291,7 +1341,6 @@ private final simulated function int TestMath()
             TestFailures += IntsShouldBeEqual(Result, 7, "DivRem16");
             TestFailures += IntsShouldBeEqual(Remainder, 1, "DivRem16");
 
-            class'FCryptoBigInt'.static.Decode(Mp, P, P.Length);
             if (class'FCryptoBigInt'.static.DecodeMod(Ma, A, A.Length, Mp) != 1)
             {
                 `fclog("Decode error!");
@@ -1301,7 +1350,6 @@ private final simulated function int TestMath()
                 ++TestFailures;
             }
 
-            MP0I = class'FCryptoBigInt'.static.NInv15(Mp[1]);
             if (class'FCryptoBigInt'.static.DecodeMod(Mb, B, B.Length, Mp) != 1)
             {
                 `fclog("Decode error!");
@@ -1424,9 +1472,131 @@ private final simulated function int TestMath()
     return TestFailures;
 }
 
+private static final simulated function SliceInts(
+    out array<int> Dst,
+    const out array<int> Src,
+    int Offset,
+    int Num
+)
+{
+    local int I;
+
+    Dst.Length = Num;
+    for (I = 0; I < Num; ++I)
+    {
+        Dst[I] = Src[Offset + I];
+    }
+}
+
+// Load key KeyIndex of AesCtKeyVectors, return the key length.
+private final simulated function int AesCtVectorKey(
+    int KeyIndex,
+    out array<byte> Key
+)
+{
+    local int Rec;
+    local int KeyLen;
+    local int I;
+
+    Rec = KeyIndex * `AES_CT_KEYS_RECORD_WORDS;
+    KeyLen = AesCtKeyVectors[Rec];
+    Key.Length = KeyLen;
+    for (I = 0; I < KeyLen; ++I)
+    {
+        Key[I] = AesCtKeyVectors[Rec + 1 + I];
+    }
+    return KeyLen;
+}
+
 private final simulated function int TestAesCt()
 {
-    return 0;
+    local int TestFailures;
+    local int I;
+    local int Rec;
+    local int KeyLen;
+    local int KeyIndex;
+    local int NumRounds;
+    local int Step;
+    local array<byte> Key;
+    local array<int> CompSKey;
+    local array<int> SKey;
+    local array<int> Pt;
+    local array<int> Q;
+    local array<int> Round1;
+    local array<int> Expected;
+
+    TestFailures = 0;
+
+    `fclog("checking" @ `AES_CT_KEYS_COUNT @ "key schedules");
+    for (I = 0; I < `AES_CT_KEYS_COUNT; ++I)
+    {
+        Rec = I * `AES_CT_KEYS_RECORD_WORDS;
+        KeyLen = AesCtVectorKey(I, Key);
+        CompSKey.Length = 0;
+        NumRounds = class'FCryptoAES'.static.AesCtKeySched(CompSKey, Key, KeyLen);
+        TestFailures += IntsShouldBeEqual(NumRounds, (KeyLen >>> 2) + 6, "NumRounds" @ I);
+        SliceInts(Expected, AesCtKeyVectors, Rec + 33, (NumRounds + 1) << 2);
+        TestFailures += IntArraysShouldBeEqual(CompSKey, Expected, "CompSKey" @ I);
+    }
+
+    // Blocks after the known answers are sorted by key index,
+    // the expanded key only changes every few blocks.
+    if (CurrentTestIteration == 0)
+    {
+        `fclog("checking" @ `AES_CT_BLOCKS_COUNT @ "bitsliced states");
+    }
+    else
+    {
+        `fclog("checking every" @ AesCtSampleStride $ "th of"
+            @ `AES_CT_BLOCKS_COUNT @ "bitsliced states");
+    }
+    KeyIndex = -1;
+    for (I = 0; I < `AES_CT_BLOCKS_COUNT; I += Step)
+    {
+        Step = 1;
+        if (CurrentTestIteration > 0 && I >= `AES_CT_BLOCKS_KNOWN - 1)
+        {
+            Step = AesCtSampleStride;
+        }
+
+        Rec = I * `AES_CT_BLOCKS_RECORD_WORDS;
+        if (AesCtBlockVectors[Rec] != KeyIndex)
+        {
+            KeyIndex = AesCtBlockVectors[Rec];
+            KeyLen = AesCtVectorKey(KeyIndex, Key);
+            CompSKey.Length = 0;
+            NumRounds = class'FCryptoAES'.static.AesCtKeySched(CompSKey, Key, KeyLen);
+            SKey.Length = 0;
+            class'FCryptoAES'.static.AesCtSKeyExpand(SKey, NumRounds, CompSKey);
+        }
+
+        SliceInts(Pt, AesCtBlockVectors, Rec + 1, 8);
+        Q = Pt;
+        class'FCryptoAES'.static.AesCtOrtho(Q);
+        SliceInts(Expected, AesCtBlockVectors, Rec + 9, 8);
+        TestFailures += IntArraysShouldBeEqual(Q, Expected, "Ortho" @ I);
+
+        Round1 = Q;
+        class'FCryptoAES'.static.AddRoundKey(Round1, SKey);
+        class'FCryptoAES'.static.AesCtBitSliceSBox(Round1);
+        class'FCryptoAES'.static.ShiftRows(Round1);
+        class'FCryptoAES'.static.MixColumns(Round1);
+        class'FCryptoAES'.static.AddRoundKey(Round1, SKey, 8);
+        SliceInts(Expected, AesCtBlockVectors, Rec + 17, 8);
+        TestFailures += IntArraysShouldBeEqual(Round1, Expected, "Round1" @ I);
+
+        class'FCryptoAES'.static.AesCtBitSliceEncrypt(NumRounds, SKey, Q);
+        class'FCryptoAES'.static.AesCtOrtho(Q);
+        SliceInts(Expected, AesCtBlockVectors, Rec + 25, 8);
+        TestFailures += IntArraysShouldBeEqual(Q, Expected, "Ct" @ I);
+
+        class'FCryptoAES'.static.AesCtOrtho(Q);
+        class'FCryptoAES'.static.AesCtBitSliceDecrypt(NumRounds, SKey, Q);
+        class'FCryptoAES'.static.AesCtOrtho(Q);
+        TestFailures += IntArraysShouldBeEqual(Q, Pt, "Decrypt" @ I);
+    }
+
+    return TestFailures;
 }
 
 // TODO: refactor and clean up this.
@@ -1454,10 +1624,9 @@ private final simulated function int TestSpeed()
     local FCryptoEC_Prime.Jacobian Jacobian1;
     local FCryptoEC_Prime.Jacobian Jacobian2;
 
-    // TODO: need to benchmark whether using static arrays in some places
-    // actually offers a performance benefit over just using dynamic
-    // arrays everywhere. FCryptoEC_Prime would be a good candidate
-    // for such benchmarks.
+    // Static versus dynamic array and function call overhead
+    // microbenchmarks are generated into FCryptoBenchmarkMutator
+    // by DevUtils/bench_codegen.py.
 
     // TODO: Design for FCQWORD arithmetic.
     Dummy = 0xFFFFFFFF;
@@ -1700,6 +1869,10 @@ DefaultProperties
     Begin Object Class=FCryptoUtils Name=Utils
     End Object
 
+    AesCtKeyVectors={(`AES_CT_KEYS_VALUES)}
+    AesCtBlockVectors={(`AES_CT_BLOCKS_VALUES)}
+    AesCtSampleStride=64
+
     RepeatedBinaryRandoms={(
         255,    // 11111111
         255,    // 11111111
@@ -1742,1276 +1915,1276 @@ DefaultProperties
     Bytes_683384335291162482276352519(10)=194 // 0xC2
     Bytes_683384335291162482276352519(11)=7   // 0x07
 
-    Primes(0)=(P=(3))
-    Primes(1)=(P=(3))
-    Primes(2)=(P=(3))
-    Primes(3)=(P=(3))
-    Primes(4)=(P=(3))
-    Primes(5)=(P=(3))
-    Primes(6)=(P=(3))
-    Primes(7)=(P=(3))
-    Primes(8)=(P=(3))
-    Primes(9)=(P=(3))
-    Primes(10)=(P=(7))
-    Primes(11)=(P=(5))
-    Primes(12)=(P=(7))
-    Primes(13)=(P=(7))
-    Primes(14)=(P=(5))
-    Primes(15)=(P=(7))
-    Primes(16)=(P=(5))
-    Primes(17)=(P=(5))
-    Primes(18)=(P=(7))
-    Primes(19)=(P=(5))
-    Primes(20)=(P=(11))
-    Primes(21)=(P=(11))
-    Primes(22)=(P=(13))
-    Primes(23)=(P=(13))
-    Primes(24)=(P=(11))
-    Primes(25)=(P=(11))
-    Primes(26)=(P=(13))
-    Primes(27)=(P=(11))
-    Primes(28)=(P=(13))
-    Primes(29)=(P=(11))
-    Primes(30)=(P=(23))
-    Primes(31)=(P=(19))
-    Primes(32)=(P=(23))
-    Primes(33)=(P=(19))
-    Primes(34)=(P=(29))
-    Primes(35)=(P=(19))
-    Primes(36)=(P=(29))
-    Primes(37)=(P=(19))
-    Primes(38)=(P=(31))
-    Primes(39)=(P=(19))
-    Primes(40)=(P=(47))
-    Primes(41)=(P=(61))
-    Primes(42)=(P=(61))
-    Primes(43)=(P=(37))
-    Primes(44)=(P=(61))
-    Primes(45)=(P=(41))
-    Primes(46)=(P=(61))
-    Primes(47)=(P=(43))
-    Primes(48)=(P=(41))
-    Primes(49)=(P=(37))
-    Primes(50)=(P=(113))
-    Primes(51)=(P=(109))
-    Primes(52)=(P=(127))
-    Primes(53)=(P=(83))
-    Primes(54)=(P=(89))
-    Primes(55)=(P=(101))
-    Primes(56)=(P=(73))
-    Primes(57)=(P=(89))
-    Primes(58)=(P=(73))
-    Primes(59)=(P=(67))
-    Primes(60)=(P=(211))
-    Primes(61)=(P=(149))
-    Primes(62)=(P=(241))
-    Primes(63)=(P=(191))
-    Primes(64)=(P=(163))
-    Primes(65)=(P=(167))
-    Primes(66)=(P=(157))
-    Primes(67)=(P=(251))
-    Primes(68)=(P=(191))
-    Primes(69)=(P=(151))
-    Primes(70)=(P=(1,103))
-    Primes(71)=(P=(1,183))
-    Primes(72)=(P=(1,25))
-    Primes(73)=(P=(1,7))
-    Primes(74)=(P=(1,141))
-    Primes(75)=(P=(1,243))
-    Primes(76)=(P=(1,235))
-    Primes(77)=(P=(1,103))
-    Primes(78)=(P=(1,231))
-    Primes(79)=(P=(1,231))
-    Primes(80)=(P=(3,41))
-    Primes(81)=(P=(2,141))
-    Primes(82)=(P=(3,209))
-    Primes(83)=(P=(3,139))
-    Primes(84)=(P=(3,5))
-    Primes(85)=(P=(3,223))
-    Primes(86)=(P=(3,199))
-    Primes(87)=(P=(2,149))
-    Primes(88)=(P=(3,143))
-    Primes(89)=(P=(2,207))
-    Primes(90)=(P=(7,115))
-    Primes(91)=(P=(6,121))
-    Primes(92)=(P=(6,187))
-    Primes(93)=(P=(6,157))
-    Primes(94)=(P=(7,235))
-    Primes(95)=(P=(4,163))
-    Primes(96)=(P=(5,147))
-    Primes(97)=(P=(5,219))
-    Primes(98)=(P=(4,225))
-    Primes(99)=(P=(7,195))
-    Primes(100)=(P=(12,49))
-    Primes(101)=(P=(11,155))
-    Primes(102)=(P=(10,237))
-    Primes(103)=(P=(15,107))
-    Primes(104)=(P=(14,143))
-    Primes(105)=(P=(10,117))
-    Primes(106)=(P=(15,209))
-    Primes(107)=(P=(10,153))
-    Primes(108)=(P=(9,37))
-    Primes(109)=(P=(11,27))
-    Primes(110)=(P=(17,209))
-    Primes(111)=(P=(31,133))
-    Primes(112)=(P=(16,61))
-    Primes(113)=(P=(20,107))
-    Primes(114)=(P=(19,217))
-    Primes(115)=(P=(30,77))
-    Primes(116)=(P=(31,57))
-    Primes(117)=(P=(16,57))
-    Primes(118)=(P=(28,51))
-    Primes(119)=(P=(21,37))
-    Primes(120)=(P=(48,239))
-    Primes(121)=(P=(58,183))
-    Primes(122)=(P=(46,25))
-    Primes(123)=(P=(42,221))
-    Primes(124)=(P=(58,135))
-    Primes(125)=(P=(62,15))
-    Primes(126)=(P=(37,141))
-    Primes(127)=(P=(50,207))
-    Primes(128)=(P=(49,45))
-    Primes(129)=(P=(41,117))
-    Primes(130)=(P=(101,251))
-    Primes(131)=(P=(108,169))
-    Primes(132)=(P=(105,101))
-    Primes(133)=(P=(78,193))
-    Primes(134)=(P=(86,243))
-    Primes(135)=(P=(102,1))
-    Primes(136)=(P=(97,111))
-    Primes(137)=(P=(82,9))
-    Primes(138)=(P=(77,5))
-    Primes(139)=(P=(86,255))
-    Primes(140)=(P=(188,153))
-    Primes(141)=(P=(178,73))
-    Primes(142)=(P=(199,13))
-    Primes(143)=(P=(186,127))
-    Primes(144)=(P=(226,205))
-    Primes(145)=(P=(244,75))
-    Primes(146)=(P=(244,163))
-    Primes(147)=(P=(209,153))
-    Primes(148)=(P=(162,247))
-    Primes(149)=(P=(178,21))
-    Primes(150)=(P=(1,145,23))
-    Primes(151)=(P=(1,230,113))
-    Primes(152)=(P=(1,90,13))
-    Primes(153)=(P=(1,225,237))
-    Primes(154)=(P=(1,234,87))
-    Primes(155)=(P=(1,44,149))
-    Primes(156)=(P=(1,121,185))
-    Primes(157)=(P=(1,27,19))
-    Primes(158)=(P=(1,233,85))
-    Primes(159)=(P=(1,50,91))
-    Primes(160)=(P=(3,220,135))
-    Primes(161)=(P=(2,159,17))
-    Primes(162)=(P=(2,21,99))
-    Primes(163)=(P=(3,172,229))
-    Primes(164)=(P=(2,185,49))
-    Primes(165)=(P=(3,197,219))
-    Primes(166)=(P=(3,100,211))
-    Primes(167)=(P=(2,59,73))
-    Primes(168)=(P=(3,137,239))
-    Primes(169)=(P=(2,50,199))
-    Primes(170)=(P=(5,45,189))
-    Primes(171)=(P=(4,206,217))
-    Primes(172)=(P=(7,165,181))
-    Primes(173)=(P=(5,203,31))
-    Primes(174)=(P=(6,107,63))
-    Primes(175)=(P=(4,126,61))
-    Primes(176)=(P=(6,182,201))
-    Primes(177)=(P=(4,80,55))
-    Primes(178)=(P=(7,222,193))
-    Primes(179)=(P=(5,71,97))
-    Primes(180)=(P=(9,34,153))
-    Primes(181)=(P=(10,60,91))
-    Primes(182)=(P=(8,145,121))
-    Primes(183)=(P=(13,121,17))
-    Primes(184)=(P=(11,131,141))
-    Primes(185)=(P=(11,37,91))
-    Primes(186)=(P=(14,129,153))
-    Primes(187)=(P=(10,188,185))
-    Primes(188)=(P=(11,219,27))
-    Primes(189)=(P=(11,40,191))
-    Primes(190)=(P=(29,150,243))
-    Primes(191)=(P=(19,162,121))
-    Primes(192)=(P=(16,27,243))
-    Primes(193)=(P=(19,72,85))
-    Primes(194)=(P=(16,138,43))
-    Primes(195)=(P=(29,101,61))
-    Primes(196)=(P=(19,56,247))
-    Primes(197)=(P=(17,161,249))
-    Primes(198)=(P=(25,175,99))
-    Primes(199)=(P=(20,66,233))
-    Primes(200)=(P=(40,73,161))
-    Primes(201)=(P=(44,164,241))
-    Primes(202)=(P=(56,25,113))
-    Primes(203)=(P=(33,5,209))
-    Primes(204)=(P=(60,60,71))
-    Primes(205)=(P=(47,151,35))
-    Primes(206)=(P=(60,63,65))
-    Primes(207)=(P=(59,116,31))
-    Primes(208)=(P=(45,126,61))
-    Primes(209)=(P=(38,228,143))
-    Primes(210)=(P=(111,164,3))
-    Primes(211)=(P=(92,212,183))
-    Primes(212)=(P=(99,87,227))
-    Primes(213)=(P=(108,199,159))
-    Primes(214)=(P=(84,206,27))
-    Primes(215)=(P=(101,102,45))
-    Primes(216)=(P=(80,244,139))
-    Primes(217)=(P=(88,156,109))
-    Primes(218)=(P=(73,226,129))
-    Primes(219)=(P=(82,193,189))
-    Primes(220)=(P=(165,77,179))
-    Primes(221)=(P=(206,68,123))
-    Primes(222)=(P=(161,72,123))
-    Primes(223)=(P=(132,210,211))
-    Primes(224)=(P=(180,112,61))
-    Primes(225)=(P=(181,145,77))
-    Primes(226)=(P=(137,96,125))
-    Primes(227)=(P=(190,20,227))
-    Primes(228)=(P=(201,46,87))
-    Primes(229)=(P=(233,219,105))
-    Primes(230)=(P=(1,220,182,99))
-    Primes(231)=(P=(1,112,138,93))
-    Primes(232)=(P=(1,131,112,235))
-    Primes(233)=(P=(1,131,2,117))
-    Primes(234)=(P=(1,70,162,249))
-    Primes(235)=(P=(1,227,152,63))
-    Primes(236)=(P=(1,177,88,51))
-    Primes(237)=(P=(1,27,48,177))
-    Primes(238)=(P=(1,56,80,75))
-    Primes(239)=(P=(1,124,121,157))
-    Primes(240)=(P=(2,230,210,55))
-    Primes(241)=(P=(2,64,80,57))
-    Primes(242)=(P=(2,203,99,147))
-    Primes(243)=(P=(3,11,195,47))
-    Primes(244)=(P=(3,101,143,75))
-    Primes(245)=(P=(2,15,57,75))
-    Primes(246)=(P=(3,49,206,229))
-    Primes(247)=(P=(3,206,249,93))
-    Primes(248)=(P=(2,247,42,95))
-    Primes(249)=(P=(3,225,126,179))
-    Primes(250)=(P=(4,45,114,175))
-    Primes(251)=(P=(6,176,167,183))
-    Primes(252)=(P=(6,106,67,215))
-    Primes(253)=(P=(4,57,228,39))
-    Primes(254)=(P=(5,120,111,51))
-    Primes(255)=(P=(6,106,22,185))
-    Primes(256)=(P=(5,184,234,241))
-    Primes(257)=(P=(7,194,205,111))
-    Primes(258)=(P=(4,129,199,107))
-    Primes(259)=(P=(5,62,194,101))
-    Primes(260)=(P=(9,184,69,97))
-    Primes(261)=(P=(13,122,250,63))
-    Primes(262)=(P=(15,89,34,59))
-    Primes(263)=(P=(12,175,66,105))
-    Primes(264)=(P=(8,58,192,19))
-    Primes(265)=(P=(11,7,150,25))
-    Primes(266)=(P=(14,91,236,63))
-    Primes(267)=(P=(9,55,70,99))
-    Primes(268)=(P=(12,4,254,47))
-    Primes(269)=(P=(9,117,48,203))
-    Primes(270)=(P=(25,183,122,71))
-    Primes(271)=(P=(21,170,195,173))
-    Primes(272)=(P=(25,33,118,255))
-    Primes(273)=(P=(23,148,116,171))
-    Primes(274)=(P=(24,56,182,75))
-    Primes(275)=(P=(21,200,44,69))
-    Primes(276)=(P=(18,6,42,175))
-    Primes(277)=(P=(22,30,237,103))
-    Primes(278)=(P=(21,212,71,127))
-    Primes(279)=(P=(29,65,164,113))
-    Primes(280)=(P=(54,124,139,95))
-    Primes(281)=(P=(58,75,145,29))
-    Primes(282)=(P=(54,137,219,9))
-    Primes(283)=(P=(56,75,75,87))
-    Primes(284)=(P=(38,62,119,103))
-    Primes(285)=(P=(37,239,155,143))
-    Primes(286)=(P=(53,119,121,95))
-    Primes(287)=(P=(44,127,31,69))
-    Primes(288)=(P=(48,177,91,141))
-    Primes(289)=(P=(58,228,36,27))
-    Primes(290)=(P=(71,65,123,205))
-    Primes(291)=(P=(85,54,83,109))
-    Primes(292)=(P=(127,196,218,21))
-    Primes(293)=(P=(110,88,251,203))
-    Primes(294)=(P=(113,132,95,127))
-    Primes(295)=(P=(84,60,180,239))
-    Primes(296)=(P=(81,154,65,197))
-    Primes(297)=(P=(125,250,240,157))
-    Primes(298)=(P=(93,253,72,175))
-    Primes(299)=(P=(80,48,61,43))
-    Primes(300)=(P=(233,196,25,105))
-    Primes(301)=(P=(154,2,79,99))
-    Primes(302)=(P=(151,60,196,179))
-    Primes(303)=(P=(193,139,27,153))
-    Primes(304)=(P=(174,74,233,171))
-    Primes(305)=(P=(179,239,211,69))
-    Primes(306)=(P=(142,120,68,49))
-    Primes(307)=(P=(255,172,77,43))
-    Primes(308)=(P=(158,141,85,223))
-    Primes(309)=(P=(168,25,232,239))
-    Primes(310)=(P=(1,235,216,169,65))
-    Primes(311)=(P=(1,0,235,227,43))
-    Primes(312)=(P=(1,210,71,147,73))
-    Primes(313)=(P=(1,140,12,214,51))
-    Primes(314)=(P=(1,239,89,3,227))
-    Primes(315)=(P=(1,148,223,203,201))
-    Primes(316)=(P=(1,220,133,222,67))
-    Primes(317)=(P=(1,69,204,140,47))
-    Primes(318)=(P=(1,191,160,36,129))
-    Primes(319)=(P=(1,2,25,167,91))
-    Primes(320)=(P=(3,251,77,119,83))
-    Primes(321)=(P=(3,150,237,27,37))
-    Primes(322)=(P=(3,53,239,194,43))
-    Primes(323)=(P=(2,133,78,53,231))
-    Primes(324)=(P=(2,107,75,80,163))
-    Primes(325)=(P=(2,161,19,104,43))
-    Primes(326)=(P=(2,171,104,183,117))
-    Primes(327)=(P=(2,124,218,195,207))
-    Primes(328)=(P=(2,178,209,147,111))
-    Primes(329)=(P=(2,95,250,170,205))
-    Primes(330)=(P=(5,51,141,46,143))
-    Primes(331)=(P=(7,245,168,23,173))
-    Primes(332)=(P=(7,73,27,205,85))
-    Primes(333)=(P=(4,73,46,42,131))
-    Primes(334)=(P=(7,228,96,21,199))
-    Primes(335)=(P=(5,249,192,221,69))
-    Primes(336)=(P=(6,201,2,225,237))
-    Primes(337)=(P=(7,74,9,233,113))
-    Primes(338)=(P=(4,56,13,222,177))
-    Primes(339)=(P=(7,196,180,52,53))
-    Primes(340)=(P=(9,99,117,25,183))
-    Primes(341)=(P=(10,128,15,161,197))
-    Primes(342)=(P=(12,145,223,40,203))
-    Primes(343)=(P=(13,105,137,203,29))
-    Primes(344)=(P=(11,75,181,232,205))
-    Primes(345)=(P=(11,16,72,174,71))
-    Primes(346)=(P=(14,209,141,116,49))
-    Primes(347)=(P=(15,125,110,194,127))
-    Primes(348)=(P=(15,233,9,171,239))
-    Primes(349)=(P=(14,212,19,112,229))
-    Primes(350)=(P=(24,228,125,139,167))
-    Primes(351)=(P=(30,200,216,138,233))
-    Primes(352)=(P=(22,139,18,217,181))
-    Primes(353)=(P=(28,242,255,145,241))
-    Primes(354)=(P=(29,43,156,54,161))
-    Primes(355)=(P=(28,61,83,225,27))
-    Primes(356)=(P=(18,122,92,252,27))
-    Primes(357)=(P=(30,143,222,50,39))
-    Primes(358)=(P=(30,200,6,99,9))
-    Primes(359)=(P=(21,109,213,130,153))
-    Primes(360)=(P=(49,166,121,168,143))
-    Primes(361)=(P=(41,253,212,219,191))
-    Primes(362)=(P=(53,190,76,144,169))
-    Primes(363)=(P=(53,62,55,180,231))
-    Primes(364)=(P=(50,19,32,49,169))
-    Primes(365)=(P=(35,112,99,78,97))
-    Primes(366)=(P=(47,249,193,191,89))
-    Primes(367)=(P=(49,7,217,21,125))
-    Primes(368)=(P=(50,36,21,172,143))
-    Primes(369)=(P=(43,226,158,188,101))
-    Primes(370)=(P=(127,234,51,18,19))
-    Primes(371)=(P=(100,53,103,153,69))
-    Primes(372)=(P=(106,205,251,214,165))
-    Primes(373)=(P=(101,64,178,189,87))
-    Primes(374)=(P=(74,85,168,113,129))
-    Primes(375)=(P=(120,119,238,123,13))
-    Primes(376)=(P=(95,72,46,49,31))
-    Primes(377)=(P=(99,174,64,246,111))
-    Primes(378)=(P=(66,113,209,239,199))
-    Primes(379)=(P=(115,83,241,241,233))
-    Primes(380)=(P=(182,56,69,222,67))
-    Primes(381)=(P=(129,67,193,46,187))
-    Primes(382)=(P=(233,123,119,81,195))
-    Primes(383)=(P=(146,207,240,181,125))
-    Primes(384)=(P=(146,45,188,85,113))
-    Primes(385)=(P=(207,28,112,55,115))
-    Primes(386)=(P=(210,32,197,17,83))
-    Primes(387)=(P=(253,115,170,60,103))
-    Primes(388)=(P=(167,208,216,13,165))
-    Primes(389)=(P=(192,189,26,249,215))
-    Primes(390)=(P=(1,80,158,108,118,19))
-    Primes(391)=(P=(1,165,176,238,105,189))
-    Primes(392)=(P=(1,127,215,160,3,51))
-    Primes(393)=(P=(1,48,184,70,112,241))
-    Primes(394)=(P=(1,58,117,50,117,81))
-    Primes(395)=(P=(1,77,178,194,108,19))
-    Primes(396)=(P=(1,210,242,223,111,39))
-    Primes(397)=(P=(1,217,133,97,10,59))
-    Primes(398)=(P=(1,147,218,81,134,47))
-    Primes(399)=(P=(1,169,212,194,75,37))
-    Primes(400)=(P=(3,165,175,229,107,237))
-    Primes(401)=(P=(3,132,189,50,111,167))
-    Primes(402)=(P=(2,192,189,7,61,205))
-    Primes(403)=(P=(3,14,48,111,169,151))
-    Primes(404)=(P=(3,218,88,129,168,251))
-    Primes(405)=(P=(2,69,6,240,189,231))
-    Primes(406)=(P=(2,98,87,215,11,161))
-    Primes(407)=(P=(2,130,182,74,116,49))
-    Primes(408)=(P=(2,171,245,70,182,247))
-    Primes(409)=(P=(2,100,171,205,113,223))
-    Primes(410)=(P=(4,230,16,151,36,105))
-    Primes(411)=(P=(4,189,223,160,126,101))
-    Primes(412)=(P=(4,32,143,29,109,107))
-    Primes(413)=(P=(6,138,254,32,102,177))
-    Primes(414)=(P=(4,97,219,239,183,105))
-    Primes(415)=(P=(6,195,133,181,224,165))
-    Primes(416)=(P=(4,158,12,115,6,63))
-    Primes(417)=(P=(6,227,1,244,74,211))
-    Primes(418)=(P=(6,137,74,7,176,129))
-    Primes(419)=(P=(5,216,70,169,152,109))
-    Primes(420)=(P=(13,211,219,111,141,143))
-    Primes(421)=(P=(15,28,41,146,76,241))
-    Primes(422)=(P=(9,187,73,219,128,181))
-    Primes(423)=(P=(12,81,85,75,127,69))
-    Primes(424)=(P=(12,212,28,167,52,85))
-    Primes(425)=(P=(13,131,211,141,5,143))
-    Primes(426)=(P=(13,37,110,47,62,237))
-    Primes(427)=(P=(15,39,164,14,165,51))
-    Primes(428)=(P=(13,53,84,44,245,229))
-    Primes(429)=(P=(15,85,5,17,116,45))
-    Primes(430)=(P=(18,49,106,36,163,1))
-    Primes(431)=(P=(22,47,106,199,246,101))
-    Primes(432)=(P=(30,68,232,161,182,123))
-    Primes(433)=(P=(24,106,217,90,238,91))
-    Primes(434)=(P=(28,172,25,33,85,61))
-    Primes(435)=(P=(18,157,172,54,111,209))
-    Primes(436)=(P=(24,77,70,20,219,77))
-    Primes(437)=(P=(24,137,54,175,43,91))
-    Primes(438)=(P=(22,104,241,163,220,191))
-    Primes(439)=(P=(30,17,62,223,65,247))
-    Primes(440)=(P=(45,135,240,217,171,139))
-    Primes(441)=(P=(40,124,250,104,174,255))
-    Primes(442)=(P=(34,45,120,228,235,51))
-    Primes(443)=(P=(43,210,5,184,225,85))
-    Primes(444)=(P=(39,229,93,88,11,111))
-    Primes(445)=(P=(33,129,135,218,199,83))
-    Primes(446)=(P=(43,226,40,16,216,31))
-    Primes(447)=(P=(57,111,7,250,174,119))
-    Primes(448)=(P=(46,89,64,111,153,189))
-    Primes(449)=(P=(62,151,178,230,58,135))
-    Primes(450)=(P=(90,10,246,248,248,191))
-    Primes(451)=(P=(112,58,214,174,246,113))
-    Primes(452)=(P=(74,145,86,57,88,233))
-    Primes(453)=(P=(119,139,178,153,87,223))
-    Primes(454)=(P=(82,124,135,55,12,29))
-    Primes(455)=(P=(111,245,49,11,103,245))
-    Primes(456)=(P=(76,150,102,223,130,11))
-    Primes(457)=(P=(106,31,215,171,226,147))
-    Primes(458)=(P=(79,152,79,75,77,121))
-    Primes(459)=(P=(84,80,207,48,180,233))
-    Primes(460)=(P=(138,44,250,58,100,191))
-    Primes(461)=(P=(139,253,236,255,168,75))
-    Primes(462)=(P=(186,103,107,38,254,195))
-    Primes(463)=(P=(205,222,133,51,97,175))
-    Primes(464)=(P=(135,36,117,209,197,39))
-    Primes(465)=(P=(181,181,44,15,98,253))
-    Primes(466)=(P=(254,121,182,100,193,1))
-    Primes(467)=(P=(186,146,150,63,6,237))
-    Primes(468)=(P=(201,118,184,197,29,235))
-    Primes(469)=(P=(201,7,103,150,180,251))
-    Primes(470)=(P=(1,14,242,194,149,224,95))
-    Primes(471)=(P=(1,227,112,90,30,0,97))
-    Primes(472)=(P=(1,227,176,215,140,119,101))
-    Primes(473)=(P=(1,32,203,109,148,142,137))
-    Primes(474)=(P=(1,241,217,112,61,50,141))
-    Primes(475)=(P=(1,137,82,67,248,153,195))
-    Primes(476)=(P=(1,236,75,218,71,216,171))
-    Primes(477)=(P=(1,102,159,107,226,161,185))
-    Primes(478)=(P=(1,250,183,47,213,214,153))
-    Primes(479)=(P=(1,59,242,20,24,78,237))
-    Primes(480)=(P=(2,52,157,103,232,50,185))
-    Primes(481)=(P=(3,40,31,21,238,110,155))
-    Primes(482)=(P=(2,21,146,229,147,201,101))
-    Primes(483)=(P=(3,160,116,90,8,215,229))
-    Primes(484)=(P=(2,1,214,182,105,37,171))
-    Primes(485)=(P=(2,121,192,98,56,51,19))
-    Primes(486)=(P=(2,128,116,192,165,91,69))
-    Primes(487)=(P=(2,57,180,16,80,162,221))
-    Primes(488)=(P=(3,42,231,201,138,116,95))
-    Primes(489)=(P=(3,123,137,227,223,202,97))
-    Primes(490)=(P=(4,143,209,234,127,56,201))
-    Primes(491)=(P=(4,4,89,217,133,138,251))
-    Primes(492)=(P=(4,127,154,96,238,107,101))
-    Primes(493)=(P=(6,32,94,245,223,4,165))
-    Primes(494)=(P=(7,225,162,165,58,166,149))
-    Primes(495)=(P=(5,100,56,253,105,35,147))
-    Primes(496)=(P=(4,190,112,245,113,195,159))
-    Primes(497)=(P=(5,118,47,144,125,36,63))
-    Primes(498)=(P=(4,101,4,84,214,99,111))
-    Primes(499)=(P=(5,218,75,250,185,111,75))
-    Primes(500)=(P=(9,124,103,2,6,251,197))
-    Primes(501)=(P=(15,128,118,163,249,153,45))
-    Primes(502)=(P=(10,76,56,136,189,111,171))
-    Primes(503)=(P=(9,53,27,147,172,51,103))
-    Primes(504)=(P=(11,212,169,242,19,177,41))
-    Primes(505)=(P=(15,114,7,19,13,237,79))
-    Primes(506)=(P=(11,18,243,246,62,11,211))
-    Primes(507)=(P=(15,79,187,215,243,48,205))
-    Primes(508)=(P=(12,96,180,111,179,245,3))
-    Primes(509)=(P=(11,57,191,185,69,7,33))
-    Primes(510)=(P=(18,229,25,140,38,21,17))
-    Primes(511)=(P=(21,10,156,168,142,34,103))
-    Primes(512)=(P=(31,121,66,53,211,150,141))
-    Primes(513)=(P=(26,240,81,152,37,2,253))
-    Primes(514)=(P=(30,68,173,40,74,70,231))
-    Primes(515)=(P=(16,149,126,128,158,167,197))
-    Primes(516)=(P=(22,29,227,100,248,28,227))
-    Primes(517)=(P=(19,137,97,116,44,16,245))
-    Primes(518)=(P=(27,30,158,183,32,5,241))
-    Primes(519)=(P=(29,135,115,162,219,193,163))
-    Primes(520)=(P=(56,127,98,82,190,186,237))
-    Primes(521)=(P=(37,115,68,106,89,130,41))
-    Primes(522)=(P=(50,179,81,25,1,1,75))
-    Primes(523)=(P=(44,73,3,76,96,13,57))
-    Primes(524)=(P=(47,25,33,155,80,211,195))
-    Primes(525)=(P=(60,196,234,238,23,43,57))
-    Primes(526)=(P=(55,133,177,178,87,55,133))
-    Primes(527)=(P=(35,85,1,40,212,47,13))
-    Primes(528)=(P=(55,90,246,157,207,124,155))
-    Primes(529)=(P=(62,167,191,150,228,75,1))
-    Primes(530)=(P=(71,123,99,203,31,200,211))
-    Primes(531)=(P=(99,206,133,10,33,77,89))
-    Primes(532)=(P=(88,191,176,57,143,156,37))
-    Primes(533)=(P=(82,143,193,158,72,234,125))
-    Primes(534)=(P=(114,184,24,82,112,141,59))
-    Primes(535)=(P=(97,176,37,79,226,219,235))
-    Primes(536)=(P=(107,81,68,164,73,80,143))
-    Primes(537)=(P=(96,208,96,63,216,88,195))
-    Primes(538)=(P=(86,50,32,57,63,151,225))
-    Primes(539)=(P=(118,60,10,121,112,117,121))
-    Primes(540)=(P=(203,124,139,226,124,93,13))
-    Primes(541)=(P=(197,185,94,142,103,206,67))
-    Primes(542)=(P=(182,189,178,181,146,41,77))
-    Primes(543)=(P=(203,109,132,193,20,13,241))
-    Primes(544)=(P=(132,139,146,12,80,123,125))
-    Primes(545)=(P=(226,74,13,45,160,21,137))
-    Primes(546)=(P=(150,252,182,157,129,247,25))
-    Primes(547)=(P=(165,212,52,247,136,12,215))
-    Primes(548)=(P=(234,228,92,77,63,246,39))
-    Primes(549)=(P=(159,117,134,2,2,145,27))
-    Primes(550)=(P=(1,38,102,105,174,219,239,9))
-    Primes(551)=(P=(1,253,138,48,149,27,219,229))
-    Primes(552)=(P=(1,76,139,80,111,118,188,125))
-    Primes(553)=(P=(1,30,108,214,20,132,110,121))
-    Primes(554)=(P=(1,141,137,92,125,42,235,23))
-    Primes(555)=(P=(1,127,223,114,89,226,6,71))
-    Primes(556)=(P=(1,196,248,115,206,86,124,121))
-    Primes(557)=(P=(1,69,29,87,176,86,162,133))
-    Primes(558)=(P=(1,171,22,211,90,235,75,141))
-    Primes(559)=(P=(1,103,228,152,126,21,186,25))
-    Primes(560)=(P=(3,116,24,114,240,101,248,5))
-    Primes(561)=(P=(2,199,137,239,160,72,19,215))
-    Primes(562)=(P=(3,38,232,168,19,165,56,43))
-    Primes(563)=(P=(3,211,195,239,187,71,44,57))
-    Primes(564)=(P=(3,76,146,11,72,220,233,143))
-    Primes(565)=(P=(2,128,169,209,64,231,95,159))
-    Primes(566)=(P=(2,241,195,249,67,133,148,67))
-    Primes(567)=(P=(3,134,19,61,80,227,69,45))
-    Primes(568)=(P=(3,200,246,216,111,155,66,25))
-    Primes(569)=(P=(2,151,192,28,189,72,244,75))
-    Primes(570)=(P=(5,177,122,31,126,222,43,55))
-    Primes(571)=(P=(4,146,249,94,140,252,22,27))
-    Primes(572)=(P=(4,211,199,228,202,10,70,85))
-    Primes(573)=(P=(4,83,163,41,194,30,69,63))
-    Primes(574)=(P=(7,136,22,85,91,157,207,191))
-    Primes(575)=(P=(5,134,29,40,141,20,21,97))
-    Primes(576)=(P=(7,18,88,72,253,99,55,21))
-    Primes(577)=(P=(4,177,148,9,232,212,22,25))
-    Primes(578)=(P=(6,61,10,62,114,67,27,71))
-    Primes(579)=(P=(4,236,205,240,25,128,122,71))
-    Primes(580)=(P=(13,52,62,74,207,151,239,73))
-    Primes(581)=(P=(9,224,33,159,133,226,144,165))
-    Primes(582)=(P=(10,54,61,132,182,97,36,69))
-    Primes(583)=(P=(14,24,67,154,22,149,132,7))
-    Primes(584)=(P=(9,252,94,205,43,29,162,185))
-    Primes(585)=(P=(12,239,115,140,1,152,97,227))
-    Primes(586)=(P=(11,206,84,33,75,27,148,53))
-    Primes(587)=(P=(10,215,78,94,73,37,198,139))
-    Primes(588)=(P=(9,198,105,242,186,189,185,139))
-    Primes(589)=(P=(15,156,19,69,198,89,109,49))
-    Primes(590)=(P=(27,60,104,11,9,169,197,105))
-    Primes(591)=(P=(24,104,235,198,182,246,165,113))
-    Primes(592)=(P=(19,50,14,86,165,77,195,37))
-    Primes(593)=(P=(19,221,192,80,20,245,99,107))
-    Primes(594)=(P=(17,34,189,53,13,171,7,123))
-    Primes(595)=(P=(27,104,194,164,174,118,86,19))
-    Primes(596)=(P=(17,215,53,112,144,153,12,31))
-    Primes(597)=(P=(19,51,54,188,47,100,18,65))
-    Primes(598)=(P=(31,75,88,45,182,66,52,215))
-    Primes(599)=(P=(20,125,180,151,226,187,105,49))
-    Primes(600)=(P=(49,9,236,4,228,1,3,77))
-    Primes(601)=(P=(51,197,208,84,137,180,59,1))
-    Primes(602)=(P=(51,216,227,224,88,255,18,147))
-    Primes(603)=(P=(63,6,115,78,189,226,193,37))
-    Primes(604)=(P=(44,177,147,180,51,163,240,149))
-    Primes(605)=(P=(32,48,250,166,51,3,174,85))
-    Primes(606)=(P=(34,209,147,119,233,128,13,19))
-    Primes(607)=(P=(57,66,130,50,249,68,246,143))
-    Primes(608)=(P=(41,196,125,42,101,105,142,239))
-    Primes(609)=(P=(36,180,40,139,136,252,224,107))
-    Primes(610)=(P=(112,103,48,187,17,71,65,161))
-    Primes(611)=(P=(95,230,201,15,247,177,206,141))
-    Primes(612)=(P=(117,47,110,38,144,251,167,189))
-    Primes(613)=(P=(72,76,68,144,133,70,37,23))
-    Primes(614)=(P=(105,122,177,115,143,217,210,17))
-    Primes(615)=(P=(89,255,86,67,253,226,155,163))
-    Primes(616)=(P=(120,165,183,82,152,74,23,55))
-    Primes(617)=(P=(69,52,187,74,164,162,174,29))
-    Primes(618)=(P=(64,24,112,96,21,105,74,171))
-    Primes(619)=(P=(71,145,11,186,14,154,66,141))
-    Primes(620)=(P=(147,195,39,89,166,188,162,107))
-    Primes(621)=(P=(129,73,209,78,83,11,195,61))
-    Primes(622)=(P=(143,59,228,225,75,168,106,173))
-    Primes(623)=(P=(168,84,208,150,249,37,4,193))
-    Primes(624)=(P=(140,126,76,219,175,140,192,53))
-    Primes(625)=(P=(225,169,179,196,235,39,130,251))
-    Primes(626)=(P=(171,211,29,135,255,1,152,25))
-    Primes(627)=(P=(184,58,201,227,3,108,28,233))
-    Primes(628)=(P=(174,58,41,241,3,46,130,85))
-    Primes(629)=(P=(137,109,127,58,250,68,207,165))
-    Primes(630)=(P=(1,182,146,196,128,107,84,28,251))
-    Primes(631)=(P=(1,192,171,71,166,235,167,166,155))
-    Primes(632)=(P=(1,167,75,47,111,133,19,41,115))
-    Primes(633)=(P=(1,181,159,85,252,5,194,55,179))
-    Primes(634)=(P=(1,249,246,58,0,38,146,240,191))
-    Primes(635)=(P=(1,238,206,2,85,199,206,39,111))
-    Primes(636)=(P=(1,22,187,57,141,36,236,60,63))
-    Primes(637)=(P=(1,212,51,229,237,51,62,4,27))
-    Primes(638)=(P=(1,1,254,202,131,53,253,212,167))
-    Primes(639)=(P=(1,222,105,17,84,96,217,244,233))
-    Primes(640)=(P=(3,112,163,156,243,111,153,107,111))
-    Primes(641)=(P=(3,8,168,115,239,205,8,195,243))
-    Primes(642)=(P=(3,236,225,241,57,103,17,52,175))
-    Primes(643)=(P=(3,115,240,202,64,109,1,179,219))
-    Primes(644)=(P=(3,211,120,88,174,56,37,28,5))
-    Primes(645)=(P=(3,43,92,244,239,190,2,203,201))
-    Primes(646)=(P=(3,212,255,10,125,189,40,219,121))
-    Primes(647)=(P=(2,152,57,173,0,68,128,163,111))
-    Primes(648)=(P=(3,217,66,81,133,59,50,21,61))
-    Primes(649)=(P=(2,5,125,131,209,182,81,207,89))
-    Primes(650)=(P=(4,198,78,238,92,5,82,16,165))
-    Primes(651)=(P=(4,111,201,107,17,151,127,240,15))
-    Primes(652)=(P=(5,118,1,108,51,67,150,44,183))
-    Primes(653)=(P=(6,85,160,69,31,138,160,230,7))
-    Primes(654)=(P=(4,139,135,45,149,148,120,94,5))
-    Primes(655)=(P=(4,170,113,124,71,75,186,229,145))
-    Primes(656)=(P=(7,21,65,184,89,180,143,115,59))
-    Primes(657)=(P=(6,190,104,119,150,97,147,63,97))
-    Primes(658)=(P=(4,28,181,143,48,233,3,206,221))
-    Primes(659)=(P=(7,174,112,1,226,192,204,185,83))
-    Primes(660)=(P=(14,26,179,254,166,138,254,123,75))
-    Primes(661)=(P=(10,60,148,78,243,241,166,131,187))
-    Primes(662)=(P=(8,112,91,24,144,222,247,241,209))
-    Primes(663)=(P=(14,82,57,138,161,225,86,161,19))
-    Primes(664)=(P=(11,242,190,28,53,175,67,76,147))
-    Primes(665)=(P=(11,186,96,235,43,83,46,203,89))
-    Primes(666)=(P=(14,112,249,167,42,126,254,130,185))
-    Primes(667)=(P=(14,240,38,212,88,45,21,70,123))
-    Primes(668)=(P=(11,15,166,195,63,238,214,241,79))
-    Primes(669)=(P=(10,163,147,240,161,56,142,182,197))
-    Primes(670)=(P=(29,33,102,181,126,85,138,139,131))
-    Primes(671)=(P=(24,206,11,90,152,81,253,75,51))
-    Primes(672)=(P=(20,171,233,95,125,21,159,88,235))
-    Primes(673)=(P=(29,244,33,207,108,79,1,78,87))
-    Primes(674)=(P=(20,255,23,219,50,128,123,118,125))
-    Primes(675)=(P=(21,178,72,81,99,216,119,108,13))
-    Primes(676)=(P=(28,5,234,12,49,23,50,145,47))
-    Primes(677)=(P=(24,137,212,164,86,201,163,66,133))
-    Primes(678)=(P=(17,242,125,83,91,43,77,13,51))
-    Primes(679)=(P=(17,217,87,33,67,169,19,39,131))
-    Primes(680)=(P=(60,101,55,189,183,81,64,62,37))
-    Primes(681)=(P=(59,179,184,227,190,249,249,244,61))
-    Primes(682)=(P=(47,95,178,25,12,232,157,236,211))
-    Primes(683)=(P=(56,109,8,90,25,215,55,228,203))
-    Primes(684)=(P=(50,48,83,203,46,32,123,174,169))
-    Primes(685)=(P=(32,22,47,27,112,176,249,24,149))
-    Primes(686)=(P=(43,147,194,88,238,242,23,77,35))
-    Primes(687)=(P=(52,162,64,252,15,239,149,134,239))
-    Primes(688)=(P=(55,182,149,253,49,103,154,68,51))
-    Primes(689)=(P=(60,216,60,203,176,73,22,65,153))
-    Primes(690)=(P=(83,212,36,213,13,220,8,94,89))
-    Primes(691)=(P=(72,208,10,135,66,132,249,98,157))
-    Primes(692)=(P=(92,102,70,125,97,97,115,189,185))
-    Primes(693)=(P=(82,134,217,33,87,203,235,207,55))
-    Primes(694)=(P=(102,153,62,73,249,237,208,163,131))
-    Primes(695)=(P=(75,186,29,65,16,197,37,122,129))
-    Primes(696)=(P=(125,254,253,208,20,128,90,228,171))
-    Primes(697)=(P=(79,68,131,124,22,25,76,229,39))
-    Primes(698)=(P=(97,213,246,13,58,48,2,238,101))
-    Primes(699)=(P=(73,64,52,174,74,47,254,22,159))
-    Primes(700)=(P=(177,126,115,225,45,205,182,227,191))
-    Primes(701)=(P=(219,234,41,31,206,120,215,126,195))
-    Primes(702)=(P=(244,90,45,245,207,195,251,91,49))
-    Primes(703)=(P=(230,219,102,227,247,219,31,203,89))
-    Primes(704)=(P=(187,185,240,93,69,209,21,230,45))
-    Primes(705)=(P=(133,45,114,36,167,164,128,218,79))
-    Primes(706)=(P=(221,4,74,56,205,21,198,245,69))
-    Primes(707)=(P=(238,95,168,173,86,189,146,249,163))
-    Primes(708)=(P=(158,166,105,120,125,230,188,30,65))
-    Primes(709)=(P=(169,148,247,73,100,209,194,190,141))
-    Primes(710)=(P=(1,52,90,33,140,44,188,4,160,49))
-    Primes(711)=(P=(1,123,189,54,133,5,7,49,52,51))
-    Primes(712)=(P=(1,88,114,16,131,146,53,148,29,17))
-    Primes(713)=(P=(1,146,101,38,207,66,188,124,249,33))
-    Primes(714)=(P=(1,238,212,138,23,67,50,127,120,31))
-    Primes(715)=(P=(1,230,195,100,21,103,191,62,227,21))
-    Primes(716)=(P=(1,172,29,218,82,245,178,191,59,243))
-    Primes(717)=(P=(1,196,233,96,69,0,123,88,168,57))
-    Primes(718)=(P=(1,82,168,106,81,190,247,174,61,167))
-    Primes(719)=(P=(1,152,13,217,249,90,128,218,152,167))
-    Primes(720)=(P=(3,116,161,154,137,175,33,36,55,119))
-    Primes(721)=(P=(2,183,162,114,195,120,184,87,46,81))
-    Primes(722)=(P=(3,27,222,112,70,40,130,68,112,37))
-    Primes(723)=(P=(2,78,197,200,25,105,41,33,89,93))
-    Primes(724)=(P=(3,92,74,77,1,191,105,48,113,99))
-    Primes(725)=(P=(2,140,24,182,148,147,142,31,213,109))
-    Primes(726)=(P=(2,221,125,232,60,168,25,55,213,163))
-    Primes(727)=(P=(2,71,243,190,178,230,69,222,61,1))
-    Primes(728)=(P=(2,179,130,170,140,160,44,246,56,179))
-    Primes(729)=(P=(2,187,34,245,152,134,129,39,18,247))
-    Primes(730)=(P=(4,205,46,253,247,152,24,192,171,139))
-    Primes(731)=(P=(4,225,102,164,69,51,148,221,255,103))
-    Primes(732)=(P=(6,57,25,101,78,228,128,210,203,207))
-    Primes(733)=(P=(4,229,62,25,242,223,244,41,38,139))
-    Primes(734)=(P=(7,87,215,226,12,17,67,234,206,43))
-    Primes(735)=(P=(5,3,211,66,233,95,85,212,237,79))
-    Primes(736)=(P=(4,140,137,79,218,238,247,134,209,27))
-    Primes(737)=(P=(6,55,209,212,103,245,36,10,99,97))
-    Primes(738)=(P=(7,99,48,62,206,158,187,221,133,113))
-    Primes(739)=(P=(7,200,233,87,144,248,106,67,39,11))
-    Primes(740)=(P=(10,138,119,192,52,109,36,210,57,249))
-    Primes(741)=(P=(12,247,82,2,78,12,128,73,241,131))
-    Primes(742)=(P=(8,179,12,126,186,59,159,154,124,15))
-    Primes(743)=(P=(13,72,58,7,87,183,42,10,240,109))
-    Primes(744)=(P=(8,222,187,213,252,135,249,175,119,7))
-    Primes(745)=(P=(13,108,226,235,205,58,81,252,193,115))
-    Primes(746)=(P=(9,93,129,253,103,122,159,226,113,171))
-    Primes(747)=(P=(12,47,227,22,170,206,161,155,167,169))
-    Primes(748)=(P=(8,14,100,103,152,206,4,77,129,189))
-    Primes(749)=(P=(15,252,245,129,59,65,143,186,70,253))
-    Primes(750)=(P=(24,69,60,243,229,40,226,158,171,233))
-    Primes(751)=(P=(22,120,246,83,202,171,167,209,17,61))
-    Primes(752)=(P=(28,149,11,94,108,147,18,150,74,17))
-    Primes(753)=(P=(16,195,116,32,127,73,88,0,59,75))
-    Primes(754)=(P=(23,64,1,115,241,172,79,133,13,187))
-    Primes(755)=(P=(25,145,239,219,45,213,33,14,167,237))
-    Primes(756)=(P=(27,3,173,68,179,160,201,227,110,3))
-    Primes(757)=(P=(28,227,233,159,218,106,2,206,179,225))
-    Primes(758)=(P=(19,123,168,148,103,62,144,162,227,175))
-    Primes(759)=(P=(24,43,240,13,186,175,222,195,211,217))
-    Primes(760)=(P=(41,34,44,33,31,51,112,160,187,151))
-    Primes(761)=(P=(36,222,92,126,114,159,140,93,30,31))
-    Primes(762)=(P=(48,28,77,197,214,4,156,59,174,235))
-    Primes(763)=(P=(42,130,81,43,132,170,140,121,12,51))
-    Primes(764)=(P=(52,254,233,161,64,137,133,90,8,51))
-    Primes(765)=(P=(48,191,230,10,22,39,131,209,106,165))
-    Primes(766)=(P=(46,191,91,239,6,27,61,55,89,69))
-    Primes(767)=(P=(37,176,197,111,86,109,187,31,80,185))
-    Primes(768)=(P=(56,32,241,62,107,104,58,18,208,127))
-    Primes(769)=(P=(46,120,78,193,189,132,118,184,14,137))
-    Primes(770)=(P=(109,86,98,207,151,58,36,38,11,77))
-    Primes(771)=(P=(98,211,120,97,100,83,196,175,192,149))
-    Primes(772)=(P=(117,228,220,127,38,47,106,149,152,255))
-    Primes(773)=(P=(104,229,202,92,105,91,241,120,244,205))
-    Primes(774)=(P=(64,125,173,114,93,20,69,115,166,187))
-    Primes(775)=(P=(101,172,46,136,248,57,17,95,254,1))
-    Primes(776)=(P=(66,124,113,208,117,48,142,143,206,167))
-    Primes(777)=(P=(122,13,92,165,90,31,175,8,180,37))
-    Primes(778)=(P=(101,24,127,214,76,56,39,81,160,195))
-    Primes(779)=(P=(76,37,68,184,157,120,226,56,200,39))
-    Primes(780)=(P=(174,46,137,170,10,254,212,0,33,45))
-    Primes(781)=(P=(202,147,21,227,239,71,174,237,204,219))
-    Primes(782)=(P=(252,157,185,228,171,125,170,209,187,97))
-    Primes(783)=(P=(229,197,123,216,216,191,37,188,136,13))
-    Primes(784)=(P=(199,229,180,51,47,176,215,161,73,191))
-    Primes(785)=(P=(175,111,69,106,67,90,203,26,128,239))
-    Primes(786)=(P=(128,247,244,235,115,140,221,175,124,215))
-    Primes(787)=(P=(132,24,130,20,2,46,40,168,211,5))
-    Primes(788)=(P=(180,226,83,204,131,185,21,131,101,107))
-    Primes(789)=(P=(141,79,145,26,9,86,95,25,120,223))
-    Primes(790)=(P=(1,80,19,24,70,171,245,40,58,232,51))
-    Primes(791)=(P=(1,7,57,223,195,74,68,190,138,132,189))
-    Primes(792)=(P=(1,148,6,178,168,155,223,84,135,25,231))
-    Primes(793)=(P=(1,144,226,234,190,205,75,21,214,105,141))
-    Primes(794)=(P=(1,207,96,218,42,241,116,75,39,83,221))
-    Primes(795)=(P=(1,113,8,168,135,218,121,157,193,180,25))
-    Primes(796)=(P=(1,158,60,13,84,182,55,160,158,168,163))
-    Primes(797)=(P=(1,101,35,185,246,226,75,53,227,93,187))
-    Primes(798)=(P=(1,118,225,26,243,101,154,131,79,68,137))
-    Primes(799)=(P=(1,188,92,98,201,208,246,30,31,16,57))
-    Primes(800)=(P=(3,196,70,58,1,243,201,236,103,224,73))
-    Primes(801)=(P=(2,124,0,91,210,18,183,55,176,104,61))
-    Primes(802)=(P=(3,92,144,81,178,204,60,86,61,225,35))
-    Primes(803)=(P=(3,202,176,97,68,31,190,46,183,140,123))
-    Primes(804)=(P=(2,12,125,145,23,56,86,74,72,90,183))
-    Primes(805)=(P=(3,124,184,10,73,99,25,80,234,160,71))
-    Primes(806)=(P=(3,60,209,226,78,75,205,255,129,81,187))
-    Primes(807)=(P=(3,142,115,58,105,124,8,74,87,166,209))
-    Primes(808)=(P=(2,3,86,253,164,37,78,206,201,9,3))
-    Primes(809)=(P=(2,2,71,67,58,198,141,187,155,13,65))
-    Primes(810)=(P=(7,146,93,1,240,70,219,173,31,8,51))
-    Primes(811)=(P=(5,198,18,194,244,217,255,223,142,41,141))
-    Primes(812)=(P=(4,70,39,81,34,239,217,97,3,163,227))
-    Primes(813)=(P=(6,33,42,40,21,68,30,177,160,97,45))
-    Primes(814)=(P=(6,18,244,216,198,29,140,35,56,120,35))
-    Primes(815)=(P=(7,61,231,239,216,81,64,83,209,40,73))
-    Primes(816)=(P=(6,237,151,59,177,128,184,153,93,86,249))
-    Primes(817)=(P=(6,157,2,115,58,243,88,59,14,199,95))
-    Primes(818)=(P=(5,239,155,114,194,64,211,133,208,31,175))
-    Primes(819)=(P=(5,245,234,208,75,65,104,38,123,120,117))
-    Primes(820)=(P=(12,161,216,229,8,199,127,153,95,162,179))
-    Primes(821)=(P=(13,77,107,45,182,119,53,83,207,237,103))
-    Primes(822)=(P=(9,180,52,230,64,251,56,70,235,68,233))
-    Primes(823)=(P=(10,138,218,25,231,48,94,31,179,61,151))
-    Primes(824)=(P=(12,248,143,190,84,107,184,42,229,73,249))
-    Primes(825)=(P=(14,147,148,43,91,234,131,189,63,111,85))
-    Primes(826)=(P=(10,239,92,20,134,8,126,13,10,20,211))
-    Primes(827)=(P=(13,129,155,160,93,203,118,73,208,50,221))
-    Primes(828)=(P=(10,72,36,107,74,150,153,125,143,27,227))
-    Primes(829)=(P=(15,29,216,30,45,98,71,229,122,245,191))
-    Primes(830)=(P=(31,212,12,85,97,133,82,217,158,226,159))
-    Primes(831)=(P=(25,103,184,71,167,215,40,23,165,209,249))
-    Primes(832)=(P=(21,184,41,202,12,99,243,180,233,37,69))
-    Primes(833)=(P=(17,137,75,116,116,107,100,65,89,161,89))
-    Primes(834)=(P=(18,171,88,156,244,50,11,214,139,178,89))
-    Primes(835)=(P=(23,116,93,135,161,91,78,39,89,248,33))
-    Primes(836)=(P=(22,164,128,225,114,183,56,146,151,20,35))
-    Primes(837)=(P=(25,191,111,13,147,48,68,229,244,224,237))
-    Primes(838)=(P=(20,225,198,155,167,164,97,50,170,166,201))
-    Primes(839)=(P=(16,151,222,158,148,5,97,58,123,175,49))
-    Primes(840)=(P=(60,34,126,215,4,115,192,100,111,185,245))
-    Primes(841)=(P=(35,51,46,224,115,103,228,32,173,124,181))
-    Primes(842)=(P=(53,58,160,48,173,25,73,233,205,162,39))
-    Primes(843)=(P=(63,4,187,181,128,43,156,30,237,1,181))
-    Primes(844)=(P=(59,134,113,138,22,39,110,84,158,60,131))
-    Primes(845)=(P=(39,205,129,108,127,61,104,129,255,167,129))
-    Primes(846)=(P=(44,22,245,129,58,113,221,171,156,248,137))
-    Primes(847)=(P=(52,30,196,91,101,81,94,241,6,37,75))
-    Primes(848)=(P=(40,189,62,49,72,63,32,97,242,164,173))
-    Primes(849)=(P=(34,146,186,52,164,127,85,6,241,150,227))
-    Primes(850)=(P=(75,193,215,26,143,60,113,61,157,178,35))
-    Primes(851)=(P=(118,253,99,212,98,97,166,52,54,235,169))
-    Primes(852)=(P=(70,206,161,195,175,237,81,121,175,152,103))
-    Primes(853)=(P=(93,250,182,166,248,69,45,155,118,48,235))
-    Primes(854)=(P=(116,88,121,176,139,254,150,239,44,152,203))
-    Primes(855)=(P=(103,165,196,152,112,16,144,74,63,201,105))
-    Primes(856)=(P=(123,141,240,251,37,249,199,77,171,201,203))
-    Primes(857)=(P=(90,120,7,250,172,75,41,46,43,182,185))
-    Primes(858)=(P=(98,213,171,30,18,34,89,193,124,244,15))
-    Primes(859)=(P=(118,34,247,244,76,100,164,10,207,22,195))
-    Primes(860)=(P=(227,19,2,128,164,42,37,4,66,137,181))
-    Primes(861)=(P=(203,23,86,74,74,115,213,62,244,64,173))
-    Primes(862)=(P=(133,123,48,66,180,190,94,217,114,65,73))
-    Primes(863)=(P=(217,37,50,137,64,26,87,192,138,95,155))
-    Primes(864)=(P=(139,64,44,12,104,180,47,143,233,154,93))
-    Primes(865)=(P=(156,186,228,242,41,46,184,218,202,234,227))
-    Primes(866)=(P=(147,201,178,185,126,209,120,49,86,98,235))
-    Primes(867)=(P=(171,249,50,232,248,186,95,164,87,94,115))
-    Primes(868)=(P=(243,28,141,70,218,192,181,186,72,134,147))
-    Primes(869)=(P=(138,212,67,122,115,247,37,25,52,101,245))
-    Primes(870)=(P=(1,240,71,113,244,82,173,189,180,200,231,153))
-    Primes(871)=(P=(1,135,136,179,11,40,184,29,214,251,45,163))
-    Primes(872)=(P=(1,27,224,183,138,90,36,125,192,16,133,61))
-    Primes(873)=(P=(1,227,121,238,117,104,171,68,60,222,81,37))
-    Primes(874)=(P=(1,200,193,28,11,34,98,180,161,229,228,93))
-    Primes(875)=(P=(1,5,174,171,80,83,163,121,112,8,5,65))
-    Primes(876)=(P=(1,240,203,91,167,46,7,55,218,30,165,5))
-    Primes(877)=(P=(1,7,251,126,47,166,26,72,161,33,45,149))
-    Primes(878)=(P=(1,169,251,24,199,175,61,91,131,252,138,99))
-    Primes(879)=(P=(1,109,175,82,161,8,49,186,17,163,99,131))
-    Primes(880)=(P=(3,205,247,36,114,83,3,152,168,96,78,11))
-    Primes(881)=(P=(2,4,116,223,143,90,133,236,218,205,157,251))
-    Primes(882)=(P=(2,170,129,84,246,138,77,36,115,46,237,171))
-    Primes(883)=(P=(3,89,32,65,75,156,128,135,147,66,48,239))
-    Primes(884)=(P=(2,17,39,114,95,11,3,186,186,29,41,175))
-    Primes(885)=(P=(3,178,66,146,131,98,102,79,123,149,84,103))
-    Primes(886)=(P=(3,37,69,152,98,237,55,227,241,103,147,9))
-    Primes(887)=(P=(2,110,2,125,20,125,151,249,152,144,170,233))
-    Primes(888)=(P=(3,57,220,12,88,179,203,79,220,189,97,175))
-    Primes(889)=(P=(3,242,122,70,129,149,220,44,138,129,184,87))
-    Primes(890)=(P=(6,48,28,53,249,132,31,251,56,28,71,179))
-    Primes(891)=(P=(7,198,28,155,246,220,131,245,155,81,122,219))
-    Primes(892)=(P=(6,164,41,66,98,30,232,129,68,169,180,133))
-    Primes(893)=(P=(5,231,50,125,95,13,159,149,207,167,143,17))
-    Primes(894)=(P=(6,133,104,51,226,40,166,128,236,106,98,195))
-    Primes(895)=(P=(6,154,98,163,252,7,160,250,160,65,78,31))
-    Primes(896)=(P=(5,255,251,0,53,106,7,176,253,175,63,113))
-    Primes(897)=(P=(6,99,234,127,130,6,179,199,36,91,178,33))
-    Primes(898)=(P=(5,195,53,110,110,182,175,215,231,150,113,107))
-    Primes(899)=(P=(5,93,238,246,207,238,164,10,176,32,9,113))
-    Primes(900)=(P=(9,244,178,63,43,210,215,240,87,75,86,49))
-    Primes(901)=(P=(9,238,230,95,235,141,199,38,237,76,102,147))
-    Primes(902)=(P=(8,21,55,190,46,11,221,12,181,46,237,183))
-    Primes(903)=(P=(15,42,62,210,206,129,104,13,138,133,108,227))
-    Primes(904)=(P=(12,232,173,235,120,10,68,121,162,218,205,171))
-    Primes(905)=(P=(8,239,172,197,172,17,45,246,61,122,57,225))
-    Primes(906)=(P=(12,133,212,16,178,217,173,226,184,249,126,43))
-    Primes(907)=(P=(8,83,71,63,90,35,151,189,36,222,204,169))
-    Primes(908)=(P=(10,118,218,149,121,151,107,4,82,103,186,205))
-    Primes(909)=(P=(14,57,79,92,36,165,101,78,142,243,226,65))
-    Primes(910)=(P=(29,191,187,86,127,94,43,52,176,173,229,171))
-    Primes(911)=(P=(19,145,165,57,60,32,133,199,29,136,65,221))
-    Primes(912)=(P=(16,154,134,160,165,5,81,88,185,156,148,141))
-    Primes(913)=(P=(18,215,128,168,51,250,152,170,219,40,235,227))
-    Primes(914)=(P=(21,136,53,249,77,29,221,126,35,211,217,69))
-    Primes(915)=(P=(22,223,66,83,57,156,38,221,106,253,249,177))
-    Primes(916)=(P=(21,206,210,97,33,162,139,202,54,144,236,147))
-    Primes(917)=(P=(19,136,74,232,4,27,162,117,142,98,253,183))
-    Primes(918)=(P=(19,114,171,14,94,57,161,49,26,101,2,91))
-    Primes(919)=(P=(18,115,168,154,34,122,206,46,155,245,250,249))
-    Primes(920)=(P=(54,172,121,59,141,147,35,232,2,247,27,99))
-    Primes(921)=(P=(63,175,21,40,63,92,134,255,12,52,150,115))
-    Primes(922)=(P=(63,136,190,60,91,48,47,81,187,43,57,115))
-    Primes(923)=(P=(41,49,254,72,163,218,25,57,241,8,37,111))
-    Primes(924)=(P=(60,225,206,42,229,44,183,144,214,204,146,45))
-    Primes(925)=(P=(42,109,219,15,154,134,73,212,61,42,85,233))
-    Primes(926)=(P=(35,176,189,128,114,184,122,179,44,254,174,253))
-    Primes(927)=(P=(61,70,228,152,2,240,214,248,203,172,136,33))
-    Primes(928)=(P=(53,245,154,37,201,53,21,213,74,224,9,107))
-    Primes(929)=(P=(39,162,192,162,15,188,187,59,190,209,7,173))
-    Primes(930)=(P=(68,101,127,5,242,8,30,73,125,140,1,77))
-    Primes(931)=(P=(71,116,204,172,235,5,115,119,230,242,64,55))
-    Primes(932)=(P=(69,13,229,169,170,169,99,72,206,9,81,171))
-    Primes(933)=(P=(78,116,14,73,49,138,139,96,98,208,29,19))
-    Primes(934)=(P=(78,159,28,167,120,54,88,160,8,1,58,223))
-    Primes(935)=(P=(108,102,194,6,121,234,1,20,181,135,45,177))
-    Primes(936)=(P=(115,181,213,239,237,52,181,235,144,226,40,59))
-    Primes(937)=(P=(78,142,161,175,8,82,58,247,54,81,0,143))
-    Primes(938)=(P=(118,221,162,80,255,200,125,193,216,134,21,103))
-    Primes(939)=(P=(67,85,9,166,10,23,143,218,54,6,146,119))
-    Primes(940)=(P=(190,51,107,223,198,33,221,66,63,49,122,121))
-    Primes(941)=(P=(239,89,102,189,249,182,109,165,148,214,150,115))
-    Primes(942)=(P=(237,36,74,214,187,175,26,190,82,246,250,109))
-    Primes(943)=(P=(206,20,22,19,120,4,72,99,99,83,199,31))
-    Primes(944)=(P=(131,194,23,64,212,98,158,178,145,26,11,193))
-    Primes(945)=(P=(141,190,230,180,21,17,94,221,202,129,21,211))
-    Primes(946)=(P=(170,167,183,166,116,247,31,159,180,41,126,93))
-    Primes(947)=(P=(230,145,168,182,136,171,159,97,192,221,75,253))
-    Primes(948)=(P=(228,42,10,252,177,197,176,25,109,132,206,55))
-    Primes(949)=(P=(136,2,105,97,172,74,228,202,106,116,175,239))
-    Primes(950)=(P=(1,178,123,211,87,159,113,69,185,232,142,14,219))
-    Primes(951)=(P=(1,60,104,87,121,47,114,131,227,220,76,125,9))
-    Primes(952)=(P=(1,174,36,181,114,162,99,252,70,236,124,249,233))
-    Primes(953)=(P=(1,80,193,11,250,178,142,60,116,218,3,171,211))
-    Primes(954)=(P=(1,54,208,160,49,143,164,71,192,94,253,162,83))
-    Primes(955)=(P=(1,213,78,19,150,129,102,252,240,244,21,62,47))
-    Primes(956)=(P=(1,177,182,4,187,10,54,31,15,122,78,99,193))
-    Primes(957)=(P=(1,151,60,125,79,53,196,178,210,11,130,220,79))
-    Primes(958)=(P=(1,207,220,199,169,254,140,170,248,242,57,23,169))
-    Primes(959)=(P=(1,229,126,192,131,234,33,211,65,238,87,196,1))
-    Primes(960)=(P=(3,190,8,228,172,243,240,104,106,70,222,48,143))
-    Primes(961)=(P=(2,80,25,27,200,56,187,221,34,87,111,25,9))
-    Primes(962)=(P=(2,107,97,209,247,33,68,222,17,194,20,143,127))
-    Primes(963)=(P=(3,237,59,36,120,87,44,82,235,25,204,197,245))
-    Primes(964)=(P=(3,237,185,202,38,43,41,236,204,253,49,218,245))
-    Primes(965)=(P=(3,250,214,11,60,150,152,220,213,67,84,94,85))
-    Primes(966)=(P=(2,79,212,214,141,173,154,134,55,110,134,116,245))
-    Primes(967)=(P=(3,8,54,170,175,48,110,9,63,240,142,210,239))
-    Primes(968)=(P=(2,250,29,133,58,208,161,149,66,151,78,60,231))
-    Primes(969)=(P=(3,189,109,127,74,152,186,160,133,62,145,181,227))
-    Primes(970)=(P=(7,129,68,148,107,67,5,184,100,156,20,37,35))
-    Primes(971)=(P=(7,96,230,154,237,11,10,48,243,227,52,133,101))
-    Primes(972)=(P=(5,73,127,94,8,236,229,145,122,235,161,103,11))
-    Primes(973)=(P=(7,209,87,121,234,117,254,61,120,71,3,220,147))
-    Primes(974)=(P=(4,111,94,135,214,92,118,4,59,188,93,88,13))
-    Primes(975)=(P=(7,150,161,183,178,93,72,244,104,165,40,128,13))
-    Primes(976)=(P=(7,8,227,15,34,140,227,74,87,56,187,104,11))
-    Primes(977)=(P=(6,179,5,100,247,4,175,115,152,237,228,22,83))
-    Primes(978)=(P=(6,68,169,220,128,194,179,54,69,36,48,6,139))
-    Primes(979)=(P=(5,34,101,47,127,56,50,232,133,41,128,85,33))
-    Primes(980)=(P=(15,69,48,39,221,178,172,235,117,60,208,57,245))
-    Primes(981)=(P=(10,175,93,73,142,239,158,130,19,130,217,61,99))
-    Primes(982)=(P=(11,142,251,231,235,172,198,229,102,152,184,242,109))
-    Primes(983)=(P=(14,234,43,213,75,255,184,0,96,252,123,54,241))
-    Primes(984)=(P=(13,234,60,173,100,83,242,88,228,120,248,131,187))
-    Primes(985)=(P=(8,69,216,246,183,118,27,183,155,136,83,102,147))
-    Primes(986)=(P=(13,36,44,243,205,173,152,235,12,120,2,62,127))
-    Primes(987)=(P=(15,7,190,16,92,178,121,178,10,183,2,233,217))
-    Primes(988)=(P=(13,58,101,55,115,71,209,82,74,137,177,2,3))
-    Primes(989)=(P=(11,45,142,79,212,16,162,5,10,184,155,147,21))
-    Primes(990)=(P=(30,171,139,8,151,131,188,171,42,188,96,166,65))
-    Primes(991)=(P=(30,153,6,93,35,253,192,206,115,99,117,154,181))
-    Primes(992)=(P=(26,200,26,43,236,222,155,94,76,200,131,89,133))
-    Primes(993)=(P=(21,22,45,67,253,116,45,132,46,219,120,220,7))
-    Primes(994)=(P=(18,79,140,31,98,108,157,50,162,250,97,248,69))
-    Primes(995)=(P=(23,156,84,243,174,136,115,244,197,62,129,204,115))
-    Primes(996)=(P=(30,158,154,65,127,73,164,3,141,164,245,99,43))
-    Primes(997)=(P=(17,63,146,86,47,199,124,128,213,238,242,86,5))
-    Primes(998)=(P=(25,25,135,152,163,42,59,114,242,103,219,182,245))
-    Primes(999)=(P=(21,218,81,44,199,189,183,186,41,52,109,234,91))
-    Primes(1000)=(P=(63,168,55,49,131,95,155,54,95,57,47,132,25))
-    Primes(1001)=(P=(63,38,199,45,38,111,71,199,90,101,219,190,239))
-    Primes(1002)=(P=(62,255,222,96,251,148,216,11,159,126,181,112,19))
-    Primes(1003)=(P=(60,19,187,17,73,176,210,202,201,80,62,128,203))
-    Primes(1004)=(P=(47,200,186,199,245,128,85,101,173,53,43,54,177))
-    Primes(1005)=(P=(41,28,147,211,59,164,110,122,127,51,192,54,151))
-    Primes(1006)=(P=(41,35,66,252,165,61,76,226,209,192,42,8,105))
-    Primes(1007)=(P=(55,18,80,231,242,246,52,247,57,235,236,6,111))
-    Primes(1008)=(P=(60,133,200,254,105,123,136,226,227,168,87,45,253))
-    Primes(1009)=(P=(47,123,212,123,126,209,26,152,241,76,153,12,91))
-    Primes(1010)=(P=(84,41,184,23,168,232,161,6,98,111,187,145,113))
-    Primes(1011)=(P=(118,129,189,135,223,241,132,125,195,110,85,98,231))
-    Primes(1012)=(P=(121,50,227,45,192,159,127,208,62,143,119,170,55))
-    Primes(1013)=(P=(86,245,102,54,140,45,58,118,225,210,25,137,27))
-    Primes(1014)=(P=(127,189,61,34,22,254,176,146,238,114,198,91,61))
-    Primes(1015)=(P=(67,120,85,150,165,94,126,230,43,234,147,221,209))
-    Primes(1016)=(P=(83,161,42,18,54,228,190,174,198,101,69,69,127))
-    Primes(1017)=(P=(102,184,19,26,50,195,15,163,46,125,213,195,141))
-    Primes(1018)=(P=(73,42,17,149,43,102,162,95,26,137,205,67,249))
-    Primes(1019)=(P=(65,197,78,19,158,171,32,98,49,193,63,236,125))
-    Primes(1020)=(P=(178,251,46,189,237,255,87,68,60,55,24,210,249))
-    Primes(1021)=(P=(200,50,9,140,92,118,76,240,170,21,82,207,253))
-    Primes(1022)=(P=(154,135,127,226,209,66,190,110,193,144,33,95,129))
-    Primes(1023)=(P=(251,50,105,115,40,198,254,190,178,44,0,140,111))
-    Primes(1024)=(P=(215,222,131,165,248,11,164,188,208,171,251,16,177))
-    Primes(1025)=(P=(168,9,82,42,81,195,161,152,187,89,8,169,59))
-    Primes(1026)=(P=(233,164,125,42,31,146,101,233,203,188,45,208,113))
-    Primes(1027)=(P=(133,103,166,122,25,203,66,233,114,147,22,212,51))
-    Primes(1028)=(P=(173,240,152,182,15,174,213,9,143,163,142,203,19))
-    Primes(1029)=(P=(211,74,217,0,152,171,124,66,178,134,175,62,235))
-    Primes(1030)=(P=(1,172,236,73,169,164,149,173,248,168,227,220,131,1))
-    Primes(1031)=(P=(1,216,171,127,135,1,190,254,39,185,179,223,204,57))
-    Primes(1032)=(P=(1,178,110,166,137,201,201,97,147,122,46,103,188,5))
-    Primes(1033)=(P=(1,181,154,157,196,54,178,88,231,173,127,193,108,21))
-    Primes(1034)=(P=(1,221,44,195,108,21,8,46,137,76,113,56,10,105))
-    Primes(1035)=(P=(1,58,168,36,73,178,160,182,137,103,255,157,4,241))
-    Primes(1036)=(P=(1,103,113,224,230,133,226,235,11,199,194,80,127,141))
-    Primes(1037)=(P=(1,191,221,18,223,121,138,107,111,138,194,78,103,247))
-    Primes(1038)=(P=(1,183,95,91,6,237,74,55,162,85,185,12,174,237))
-    Primes(1039)=(P=(1,201,31,189,130,105,242,141,13,232,238,54,140,165))
-    Primes(1040)=(P=(3,212,30,85,38,5,198,28,141,18,139,164,3,225))
-    Primes(1041)=(P=(2,138,56,239,154,187,98,21,153,238,205,146,32,165))
-    Primes(1042)=(P=(3,242,63,130,155,231,183,254,164,140,92,184,103,37))
-    Primes(1043)=(P=(3,249,56,162,199,53,65,222,86,81,96,158,211,83))
-    Primes(1044)=(P=(3,86,220,42,190,80,31,43,157,205,31,230,99,171))
-    Primes(1045)=(P=(2,55,140,39,156,44,5,184,142,206,5,197,3,41))
-    Primes(1046)=(P=(2,101,240,255,134,206,226,49,25,193,82,233,31,225))
-    Primes(1047)=(P=(2,137,213,137,80,89,90,156,49,50,114,206,66,133))
-    Primes(1048)=(P=(2,116,167,49,4,220,2,22,231,143,236,17,140,57))
-    Primes(1049)=(P=(3,81,133,99,237,41,52,181,157,186,10,73,217,107))
-    Primes(1050)=(P=(7,1,131,177,216,109,30,175,97,209,6,200,93,231))
-    Primes(1051)=(P=(5,171,99,98,81,116,56,112,239,146,243,81,235,141))
-    Primes(1052)=(P=(7,86,112,167,76,59,220,247,79,99,59,70,225,151))
-    Primes(1053)=(P=(6,187,101,166,82,158,104,166,15,7,241,138,107,183))
-    Primes(1054)=(P=(7,3,189,104,38,29,104,92,9,212,65,80,39,53))
-    Primes(1055)=(P=(7,64,210,88,238,206,219,220,123,90,151,202,193,205))
-    Primes(1056)=(P=(6,87,74,174,215,168,2,89,142,172,202,197,236,77))
-    Primes(1057)=(P=(4,152,37,44,58,96,244,129,133,6,138,10,194,73))
-    Primes(1058)=(P=(6,44,114,250,222,224,96,17,233,90,100,177,21,43))
-    Primes(1059)=(P=(7,211,50,215,253,238,248,182,201,251,136,30,93,113))
-    Primes(1060)=(P=(9,53,246,216,53,227,161,13,47,252,128,116,242,41))
-    Primes(1061)=(P=(14,194,83,202,45,84,49,98,127,178,75,94,4,5))
-    Primes(1062)=(P=(9,96,140,6,65,98,55,43,193,54,147,12,45,79))
-    Primes(1063)=(P=(12,252,206,194,17,234,176,63,204,119,175,158,57,9))
-    Primes(1064)=(P=(15,144,167,92,30,5,170,23,40,195,98,157,52,151))
-    Primes(1065)=(P=(11,247,115,91,50,36,83,152,206,208,190,65,241,77))
-    Primes(1066)=(P=(11,208,194,132,171,36,147,174,206,54,46,21,110,237))
-    Primes(1067)=(P=(13,173,191,156,18,112,232,48,140,209,207,135,109,41))
-    Primes(1068)=(P=(11,72,131,224,195,81,0,73,91,189,100,66,9,131))
-    Primes(1069)=(P=(12,39,215,149,9,233,114,82,180,153,189,230,201,1))
-    Primes(1070)=(P=(23,213,44,78,217,141,239,255,224,81,167,31,246,133))
-    Primes(1071)=(P=(26,38,74,142,249,105,244,43,156,119,105,56,23,13))
-    Primes(1072)=(P=(24,226,37,103,232,192,206,142,8,24,215,173,142,113))
-    Primes(1073)=(P=(26,244,121,95,7,9,44,233,243,138,138,242,129,175))
-    Primes(1074)=(P=(24,233,123,253,121,159,195,13,31,127,30,174,57,19))
-    Primes(1075)=(P=(18,50,124,71,251,118,113,131,191,192,7,220,161,215))
-    Primes(1076)=(P=(24,91,74,170,191,97,0,195,99,183,134,126,54,85))
-    Primes(1077)=(P=(21,47,62,206,188,122,162,19,243,118,138,186,197,105))
-    Primes(1078)=(P=(17,236,226,224,211,158,158,39,4,109,58,188,39,185))
-    Primes(1079)=(P=(26,81,76,89,73,112,98,56,89,56,239,94,151,61))
-    Primes(1080)=(P=(32,14,40,65,35,42,191,202,162,246,92,33,236,171))
-    Primes(1081)=(P=(55,117,87,250,54,54,72,135,64,207,9,239,102,53))
-    Primes(1082)=(P=(45,193,32,25,203,55,46,13,20,11,179,249,45,25))
-    Primes(1083)=(P=(62,71,255,209,193,14,154,8,31,84,66,131,150,65))
-    Primes(1084)=(P=(37,90,5,119,129,128,210,186,50,174,108,216,183,149))
-    Primes(1085)=(P=(36,116,248,159,104,1,205,103,152,96,163,121,132,205))
-    Primes(1086)=(P=(36,197,110,198,16,93,175,224,84,219,191,70,6,233))
-    Primes(1087)=(P=(38,67,113,48,91,166,112,28,229,235,246,35,40,5))
-    Primes(1088)=(P=(44,99,17,142,249,143,44,55,48,67,120,81,171,249))
-    Primes(1089)=(P=(35,122,243,23,248,59,207,68,67,125,30,206,50,21))
-    Primes(1090)=(P=(90,230,151,17,25,103,71,13,111,143,188,17,10,155))
-    Primes(1091)=(P=(81,170,56,160,129,16,64,176,157,72,81,141,166,83))
-    Primes(1092)=(P=(127,3,194,245,96,244,31,10,86,106,127,58,194,103))
-    Primes(1093)=(P=(111,241,233,26,91,223,1,255,195,91,77,28,250,249))
-    Primes(1094)=(P=(79,154,21,96,177,233,21,237,227,153,129,108,239,87))
-    Primes(1095)=(P=(114,76,226,108,253,193,210,254,163,134,179,126,242,213))
-    Primes(1096)=(P=(79,14,201,190,97,5,37,63,33,93,30,79,0,157))
-    Primes(1097)=(P=(84,108,224,221,130,222,162,77,176,18,176,127,132,161))
-    Primes(1098)=(P=(97,232,4,192,133,145,147,58,219,213,96,115,48,219))
-    Primes(1099)=(P=(112,133,147,44,213,91,145,6,55,11,3,1,221,97))
-    Primes(1100)=(P=(228,134,94,100,65,76,98,193,201,81,110,103,128,185))
-    Primes(1101)=(P=(168,151,50,187,112,189,21,158,135,70,157,3,1,99))
-    Primes(1102)=(P=(248,88,96,21,79,113,232,124,164,103,120,28,34,39))
-    Primes(1103)=(P=(156,120,223,140,245,215,82,117,210,252,5,79,219,153))
-    Primes(1104)=(P=(181,53,170,132,140,172,232,27,113,202,99,254,144,233))
-    Primes(1105)=(P=(221,72,174,167,98,209,86,246,143,94,141,12,213,201))
-    Primes(1106)=(P=(249,226,24,205,7,45,66,165,90,101,14,179,64,151))
-    Primes(1107)=(P=(226,202,164,224,228,85,108,224,84,21,253,227,121,169))
-    Primes(1108)=(P=(193,12,129,4,234,146,78,134,97,103,82,131,100,143))
-    Primes(1109)=(P=(176,167,221,233,14,185,26,81,60,100,55,115,93,11))
-    Primes(1110)=(P=(1,162,243,177,55,151,42,108,28,184,244,149,235,228,197))
-    Primes(1111)=(P=(1,168,193,136,255,41,98,58,121,245,91,246,156,142,147))
-    Primes(1112)=(P=(1,185,239,61,78,197,193,237,204,82,47,207,30,69,181))
-    Primes(1113)=(P=(1,93,186,98,128,159,176,76,37,111,52,222,215,140,33))
-    Primes(1114)=(P=(1,67,243,207,91,197,228,144,39,97,191,117,51,221,205))
-    Primes(1115)=(P=(1,50,188,157,247,89,56,221,168,38,144,118,127,14,163))
-    Primes(1116)=(P=(1,31,7,49,234,147,101,165,45,153,77,135,40,157,105))
-    Primes(1117)=(P=(1,3,237,136,95,128,143,45,2,239,83,132,165,76,179))
-    Primes(1118)=(P=(1,219,244,214,149,76,217,3,194,60,77,74,134,12,25))
-    Primes(1119)=(P=(1,180,222,16,174,176,144,163,163,42,131,28,18,32,161))
-    Primes(1120)=(P=(3,107,224,251,200,254,139,153,85,165,217,86,145,94,225))
-    Primes(1121)=(P=(2,40,251,45,114,229,11,181,85,104,40,86,135,109,205))
-    Primes(1122)=(P=(3,102,3,234,99,93,24,231,40,253,190,40,155,125,107))
-    Primes(1123)=(P=(2,168,100,102,3,105,147,141,129,6,94,145,235,22,67))
-    Primes(1124)=(P=(3,140,38,43,249,118,245,120,103,44,150,121,199,29,155))
-    Primes(1125)=(P=(3,147,249,44,80,149,239,3,53,136,247,119,150,29,13))
-    Primes(1126)=(P=(2,111,41,215,55,113,167,253,189,64,255,239,66,199,247))
-    Primes(1127)=(P=(2,19,211,81,211,156,23,198,82,129,141,133,92,232,241))
-    Primes(1128)=(P=(2,252,173,201,22,88,27,208,134,229,128,93,105,244,195))
-    Primes(1129)=(P=(2,147,76,7,67,176,18,37,43,145,221,135,161,239,237))
-    Primes(1130)=(P=(5,219,171,82,209,169,87,165,128,36,4,153,190,212,233))
-    Primes(1131)=(P=(6,110,195,90,37,32,127,245,108,207,196,106,41,79,193))
-    Primes(1132)=(P=(7,107,139,175,179,109,162,81,201,21,214,86,27,30,149))
-    Primes(1133)=(P=(4,106,156,10,186,157,90,12,216,236,114,211,103,207,161))
-    Primes(1134)=(P=(5,57,123,14,218,85,88,162,229,33,117,193,197,201,59))
-    Primes(1135)=(P=(5,47,40,14,51,3,12,238,177,22,115,86,216,11,41))
-    Primes(1136)=(P=(5,194,211,65,61,209,106,94,67,249,76,85,85,61,155))
-    Primes(1137)=(P=(4,50,97,108,169,187,65,66,57,71,189,203,79,234,25))
-    Primes(1138)=(P=(6,114,9,175,201,163,221,120,120,190,80,221,221,68,27))
-    Primes(1139)=(P=(6,228,234,58,194,244,1,120,250,247,116,53,105,137,213))
-    Primes(1140)=(P=(10,111,250,197,71,81,58,76,91,193,215,181,222,95,145))
-    Primes(1141)=(P=(8,52,126,235,140,145,4,67,2,39,140,42,122,101,251))
-    Primes(1142)=(P=(9,18,150,240,240,207,167,207,87,213,47,183,243,125,47))
-    Primes(1143)=(P=(14,71,130,202,248,204,126,2,10,87,30,84,210,137,133))
-    Primes(1144)=(P=(14,85,161,161,13,12,18,8,194,47,149,251,166,169,141))
-    Primes(1145)=(P=(9,76,234,171,220,3,72,253,14,233,65,137,110,42,183))
-    Primes(1146)=(P=(13,83,173,32,133,157,38,220,141,36,8,209,226,181,89))
-    Primes(1147)=(P=(15,249,150,59,175,197,4,75,87,254,140,197,128,30,87))
-    Primes(1148)=(P=(15,193,129,225,229,149,18,189,50,254,123,28,243,195,163))
-    Primes(1149)=(P=(15,75,208,145,187,119,208,237,127,79,88,239,140,140,37))
-    Primes(1150)=(P=(22,203,156,96,177,84,208,67,64,233,143,0,26,175,73))
-    Primes(1151)=(P=(21,46,253,154,228,66,87,23,25,8,235,27,217,18,85))
-    Primes(1152)=(P=(18,68,132,247,32,240,241,170,204,17,51,50,152,139,133))
-    Primes(1153)=(P=(29,18,162,254,45,189,72,111,132,204,112,73,85,27,199))
-    Primes(1154)=(P=(21,232,172,14,2,129,232,23,25,238,161,139,214,124,247))
-    Primes(1155)=(P=(29,25,23,118,187,215,43,225,227,22,157,87,25,222,109))
-    Primes(1156)=(P=(31,241,216,194,246,199,190,155,174,145,180,62,184,239,123))
-    Primes(1157)=(P=(27,102,152,168,234,84,72,240,138,187,101,131,197,210,209))
-    Primes(1158)=(P=(16,80,191,5,116,10,100,88,216,74,93,245,215,186,127))
-    Primes(1159)=(P=(28,115,221,147,142,166,44,175,102,159,8,181,224,206,145))
-    Primes(1160)=(P=(40,247,103,185,94,154,224,12,250,244,113,228,139,25,25))
-    Primes(1161)=(P=(43,162,38,231,57,94,55,65,123,39,140,158,245,35,131))
-    Primes(1162)=(P=(33,33,88,130,214,86,144,95,111,45,3,63,157,119,237))
-    Primes(1163)=(P=(38,82,152,69,122,8,16,222,234,194,0,182,38,28,57))
-    Primes(1164)=(P=(57,58,244,84,113,130,157,55,118,255,47,12,200,212,161))
-    Primes(1165)=(P=(38,242,238,188,42,136,106,232,151,92,121,224,92,101,35))
-    Primes(1166)=(P=(63,114,31,84,135,29,200,230,42,129,81,71,221,149,73))
-    Primes(1167)=(P=(37,0,80,99,176,96,167,172,198,179,39,237,58,230,193))
-    Primes(1168)=(P=(52,163,168,150,168,194,31,197,105,116,61,118,29,173,109))
-    Primes(1169)=(P=(55,122,101,55,255,177,81,187,184,151,52,142,133,226,193))
-    Primes(1170)=(P=(83,96,192,139,177,99,44,45,55,45,71,100,146,37,137))
-    Primes(1171)=(P=(74,126,127,34,49,202,19,225,13,223,71,205,35,234,87))
-    Primes(1172)=(P=(73,222,186,187,48,216,56,96,160,27,34,160,48,36,249))
-    Primes(1173)=(P=(77,226,136,118,184,11,238,70,161,205,93,201,217,119,93))
-    Primes(1174)=(P=(126,219,19,157,113,171,208,14,214,208,124,198,134,163,19))
-    Primes(1175)=(P=(116,61,159,66,123,90,156,217,217,156,104,127,79,101,195))
-    Primes(1176)=(P=(103,230,148,139,153,3,234,252,96,71,198,87,111,166,221))
-    Primes(1177)=(P=(125,50,97,107,52,91,224,59,16,190,35,164,19,14,121))
-    Primes(1178)=(P=(93,56,185,7,131,240,209,14,168,39,73,197,98,89,5))
-    Primes(1179)=(P=(104,167,64,93,114,240,172,213,6,56,173,248,218,43,7))
-    Primes(1180)=(P=(191,39,92,59,2,0,138,206,102,236,83,221,252,44,181))
-    Primes(1181)=(P=(204,58,44,180,173,60,243,220,1,34,242,11,110,209,67))
-    Primes(1182)=(P=(227,127,192,130,20,128,246,192,185,82,236,133,12,7,137))
-    Primes(1183)=(P=(144,220,134,189,128,206,238,52,70,91,239,246,5,189,65))
-    Primes(1184)=(P=(175,67,148,158,244,129,125,174,105,68,203,185,228,198,197))
-    Primes(1185)=(P=(178,18,148,76,65,182,240,114,66,172,208,123,120,245,39))
-    Primes(1186)=(P=(145,80,69,69,26,247,106,246,13,85,124,106,115,120,137))
-    Primes(1187)=(P=(138,78,128,89,241,104,92,135,93,230,12,194,119,172,247))
-    Primes(1188)=(P=(132,222,203,132,93,213,137,190,110,2,15,73,45,93,133))
-    Primes(1189)=(P=(199,238,69,155,204,131,30,17,201,61,247,40,155,202,237))
-    Primes(1190)=(P=(1,183,111,34,212,6,207,162,60,240,202,178,242,57,204,29))
-    Primes(1191)=(P=(1,233,250,179,245,115,62,133,166,93,242,166,75,182,3,77))
-    Primes(1192)=(P=(1,174,144,50,67,183,91,193,196,239,223,211,76,128,250,67))
-    Primes(1193)=(P=(1,125,10,226,134,110,120,33,212,159,188,159,244,7,146,99))
-    Primes(1194)=(P=(1,116,218,41,99,158,35,88,25,197,195,229,230,55,35,215))
-    Primes(1195)=(P=(1,16,118,105,47,127,128,156,213,61,47,233,15,10,174,225))
-    Primes(1196)=(P=(1,95,69,246,123,209,42,254,194,117,212,99,142,189,188,161))
-    Primes(1197)=(P=(1,104,233,248,80,172,167,75,203,96,180,14,36,246,67,87))
-    Primes(1198)=(P=(1,9,255,98,157,239,0,202,99,97,156,177,183,9,45,39))
-    Primes(1199)=(P=(1,139,186,163,183,44,22,134,63,50,20,93,138,48,155,27))
-    Primes(1200)=(P=(2,128,89,91,146,231,103,251,211,163,33,23,88,138,176,3))
-    Primes(1201)=(P=(2,90,156,212,253,53,103,197,211,173,109,125,44,182,224,73))
-    Primes(1202)=(P=(2,62,23,111,58,232,163,211,93,94,96,182,34,219,182,9))
-    Primes(1203)=(P=(2,15,93,229,170,98,141,16,155,52,36,197,34,165,215,183))
-    Primes(1204)=(P=(2,57,63,236,135,191,185,78,139,72,134,224,103,87,216,77))
-    Primes(1205)=(P=(2,88,96,60,90,9,86,54,12,241,227,136,142,66,169,101))
-    Primes(1206)=(P=(3,204,189,237,192,73,82,2,172,58,131,59,143,222,248,147))
-    Primes(1207)=(P=(2,243,116,164,131,68,101,174,217,32,213,253,251,78,80,131))
-    Primes(1208)=(P=(3,72,103,11,19,197,128,238,175,206,39,59,116,95,92,93))
-    Primes(1209)=(P=(3,254,12,2,233,46,138,15,72,5,202,142,53,27,210,183))
-    Primes(1210)=(P=(5,224,64,183,198,244,115,28,19,179,197,55,140,193,182,157))
-    Primes(1211)=(P=(6,114,99,107,188,182,144,112,168,143,206,189,103,1,80,245))
-    Primes(1212)=(P=(6,116,65,23,153,136,54,222,89,172,215,189,101,229,67,199))
-    Primes(1213)=(P=(4,9,186,239,112,56,144,54,86,94,2,211,126,54,201,11))
-    Primes(1214)=(P=(5,64,2,134,214,0,102,211,24,34,238,81,4,54,181,105))
-    Primes(1215)=(P=(7,163,192,111,194,215,31,131,17,81,137,1,19,199,91,33))
-    Primes(1216)=(P=(7,33,88,53,180,189,76,209,62,227,169,175,244,91,166,177))
-    Primes(1217)=(P=(7,2,219,109,4,103,203,158,187,239,230,108,131,97,89,123))
-    Primes(1218)=(P=(4,166,102,88,221,216,68,209,140,145,161,112,70,192,141,97))
-    Primes(1219)=(P=(7,248,189,87,121,149,209,115,3,60,178,62,218,4,97,121))
-    Primes(1220)=(P=(9,142,75,12,142,47,204,137,14,146,103,65,229,202,220,81))
-    Primes(1221)=(P=(15,194,74,5,14,198,165,108,118,204,14,244,230,198,243,197))
-    Primes(1222)=(P=(13,17,137,26,84,160,105,227,104,7,46,208,135,208,232,255))
-    Primes(1223)=(P=(11,36,252,237,142,244,88,29,170,184,131,61,138,194,87,127))
-    Primes(1224)=(P=(11,216,115,56,113,21,27,221,147,179,93,0,132,119,105,3))
-    Primes(1225)=(P=(15,85,244,134,112,200,63,79,73,89,228,214,44,45,232,169))
-    Primes(1226)=(P=(11,181,106,193,127,57,219,165,185,23,145,115,251,188,88,195))
-    Primes(1227)=(P=(15,148,131,97,74,75,214,28,204,160,195,39,27,23,223,205))
-    Primes(1228)=(P=(13,209,179,79,22,105,181,88,129,40,46,37,120,230,86,219))
-    Primes(1229)=(P=(8,51,88,107,236,250,29,21,131,46,40,18,67,109,152,43))
-    Primes(1230)=(P=(18,90,75,51,32,79,86,136,252,201,153,206,24,69,7,133))
-    Primes(1231)=(P=(28,248,144,154,212,148,93,118,151,39,132,66,233,80,115,251))
-    Primes(1232)=(P=(30,165,83,107,36,232,245,85,19,214,229,49,13,161,183,217))
-    Primes(1233)=(P=(22,138,10,112,158,163,68,196,6,53,107,144,42,108,242,85))
-    Primes(1234)=(P=(26,62,248,224,17,185,66,208,141,87,93,94,104,176,153,79))
-    Primes(1235)=(P=(30,247,110,217,236,78,7,172,170,222,229,29,169,30,51,21))
-    Primes(1236)=(P=(22,122,239,216,195,193,184,125,151,35,132,33,66,0,228,85))
-    Primes(1237)=(P=(19,114,234,142,195,93,219,8,8,230,25,67,87,72,98,67))
-    Primes(1238)=(P=(25,23,171,95,200,216,106,28,56,208,124,53,176,110,70,51))
-    Primes(1239)=(P=(24,104,155,26,18,34,105,42,221,128,172,83,77,74,25,219))
-    Primes(1240)=(P=(46,103,33,163,74,203,102,87,177,96,56,41,50,170,156,217))
-    Primes(1241)=(P=(60,44,27,111,56,219,177,161,1,51,181,129,149,101,187,193))
-    Primes(1242)=(P=(47,117,185,49,53,142,184,190,79,102,220,46,219,55,232,149))
-    Primes(1243)=(P=(61,180,179,237,165,235,234,246,189,127,132,131,19,102,15,5))
-    Primes(1244)=(P=(52,77,174,17,231,134,106,57,102,176,88,234,232,232,174,61))
-    Primes(1245)=(P=(52,209,94,136,65,150,222,86,155,128,250,200,94,34,87,119))
-    Primes(1246)=(P=(62,44,224,193,162,146,80,51,12,249,111,127,97,183,32,145))
-    Primes(1247)=(P=(40,145,27,57,32,20,243,26,73,100,5,29,125,60,116,43))
-    Primes(1248)=(P=(32,189,141,90,205,44,145,184,158,239,139,116,152,220,14,183))
-    Primes(1249)=(P=(59,3,128,252,87,101,171,192,75,74,48,139,220,91,7,199))
-    Primes(1250)=(P=(117,110,16,41,205,184,233,127,132,23,203,23,80,192,33,157))
-    Primes(1251)=(P=(88,234,122,100,36,184,57,17,105,142,158,30,148,90,72,111))
-    Primes(1252)=(P=(83,209,227,95,115,250,42,114,110,161,27,174,224,86,26,189))
-    Primes(1253)=(P=(102,99,124,169,211,94,36,222,37,142,191,169,74,181,32,51))
-    Primes(1254)=(P=(74,241,179,241,134,72,182,117,77,85,26,109,117,196,10,23))
-    Primes(1255)=(P=(86,2,11,125,166,105,203,14,198,148,80,65,165,235,2,247))
-    Primes(1256)=(P=(124,253,37,12,226,244,218,24,192,69,57,61,37,127,138,33))
-    Primes(1257)=(P=(75,235,17,220,204,191,138,60,104,69,208,117,18,239,135,59))
-    Primes(1258)=(P=(243,170,250,231,244,79,20,98,183,253,45,214,16,74,118,229))
-    Primes(1259)=(P=(214,1,175,198,181,146,188,235,225,186,128,195,82,68,148,193))
-    Primes(1260)=(P=(173,143,12,137,208,68,7,85,93,22,221,176,100,14,0,55))
-    Primes(1261)=(P=(200,41,243,91,131,116,26,72,122,99,213,20,24,68,178,119))
-    Primes(1262)=(P=(163,172,194,237,52,50,86,107,125,253,61,112,24,130,189,207))
-    Primes(1263)=(P=(170,223,56,25,28,57,44,215,202,57,73,239,121,139,86,87))
-    Primes(1264)=(P=(153,118,85,170,7,57,199,70,78,81,179,245,206,29,169,51))
-    Primes(1265)=(P=(209,186,224,89,31,148,190,170,160,165,85,180,172,128,27,195))
-    Primes(1266)=(P=(130,238,124,63,112,134,0,110,6,49,103,64,176,197,252,23))
-    Primes(1267)=(P=(192,241,87,10,47,148,53,12,212,231,149,108,98,123,48,187))
-    Primes(1268)=(P=(224,131,247,119,141,116,26,32,147,67,197,218,168,137,44,195))
-    Primes(1269)=(P=(175,178,230,249,202,185,151,211,151,22,96,169,198,45,41,71))
+    Primes(0)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(1)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(2)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(3)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(4)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(5)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(6)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(7)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(8)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(9)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))
+    Primes(10)=(P=(7),M=(3,7),M0I=4681,R2=(3,1))
+    Primes(11)=(P=(5),M=(3,5),M0I=13107,R2=(3,4))
+    Primes(12)=(P=(7),M=(3,7),M0I=4681,R2=(3,1))
+    Primes(13)=(P=(7),M=(3,7),M0I=4681,R2=(3,1))
+    Primes(14)=(P=(5),M=(3,5),M0I=13107,R2=(3,4))
+    Primes(15)=(P=(7),M=(3,7),M0I=4681,R2=(3,1))
+    Primes(16)=(P=(5),M=(3,5),M0I=13107,R2=(3,4))
+    Primes(17)=(P=(5),M=(3,5),M0I=13107,R2=(3,4))
+    Primes(18)=(P=(7),M=(3,7),M0I=4681,R2=(3,1))
+    Primes(19)=(P=(5),M=(3,5),M0I=13107,R2=(3,4))
+    Primes(20)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(21)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(22)=(P=(13),M=(4,13),M0I=12603,R2=(4,12))
+    Primes(23)=(P=(13),M=(4,13),M0I=12603,R2=(4,12))
+    Primes(24)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(25)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(26)=(P=(13),M=(4,13),M0I=12603,R2=(4,12))
+    Primes(27)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(28)=(P=(13),M=(4,13),M0I=12603,R2=(4,12))
+    Primes(29)=(P=(11),M=(4,11),M0I=29789,R2=(4,1))
+    Primes(30)=(P=(23),M=(5,23),M0I=18521,R2=(5,3))
+    Primes(31)=(P=(19),M=(5,19),M0I=13797,R2=(5,11))
+    Primes(32)=(P=(23),M=(5,23),M0I=18521,R2=(5,3))
+    Primes(33)=(P=(19),M=(5,19),M0I=13797,R2=(5,11))
+    Primes(34)=(P=(29),M=(5,29),M0I=15819,R2=(5,4))
+    Primes(35)=(P=(19),M=(5,19),M0I=13797,R2=(5,11))
+    Primes(36)=(P=(29),M=(5,29),M0I=15819,R2=(5,4))
+    Primes(37)=(P=(19),M=(5,19),M0I=13797,R2=(5,11))
+    Primes(38)=(P=(31),M=(5,31),M0I=1057,R2=(5,1))
+    Primes(39)=(P=(19),M=(5,19),M0I=13797,R2=(5,11))
+    Primes(40)=(P=(47),M=(6,47),M0I=14641,R2=(6,34))
+    Primes(41)=(P=(61),M=(6,61),M0I=26859,R2=(6,60))
+    Primes(42)=(P=(61),M=(6,61),M0I=26859,R2=(6,60))
+    Primes(43)=(P=(37),M=(6,37),M0I=25683,R2=(6,11))
+    Primes(44)=(P=(61),M=(6,61),M0I=26859,R2=(6,60))
+    Primes(45)=(P=(41),M=(6,41),M0I=25575,R2=(6,40))
+    Primes(46)=(P=(61),M=(6,61),M0I=26859,R2=(6,60))
+    Primes(47)=(P=(43),M=(6,43),M0I=16765,R2=(6,4))
+    Primes(48)=(P=(41),M=(6,41),M0I=25575,R2=(6,40))
+    Primes(49)=(P=(37),M=(6,37),M0I=25683,R2=(6,11))
+    Primes(50)=(P=(113),M=(7,113),M0I=16239,R2=(7,4))
+    Primes(51)=(P=(109),M=(7,109),M0I=30363,R2=(7,46))
+    Primes(52)=(P=(127),M=(7,127),M0I=16513,R2=(7,4))
+    Primes(53)=(P=(83),M=(7,83),M0I=15397,R2=(7,40))
+    Primes(54)=(P=(89),M=(7,89),M0I=14359,R2=(7,78))
+    Primes(55)=(P=(101),M=(7,101),M0I=20115,R2=(7,17))
+    Primes(56)=(P=(73),M=(7,73),M0I=3591,R2=(7,8))
+    Primes(57)=(P=(89),M=(7,89),M0I=14359,R2=(7,78))
+    Primes(58)=(P=(73),M=(7,73),M0I=3591,R2=(7,8))
+    Primes(59)=(P=(67),M=(7,67),M0I=13205,R2=(7,25))
+    Primes(60)=(P=(211),M=(8,211),M0I=10405,R2=(8,171))
+    Primes(61)=(P=(149),M=(8,149),M0I=13635,R2=(8,144))
+    Primes(62)=(P=(241),M=(8,241),M0I=4079,R2=(8,64))
+    Primes(63)=(P=(191),M=(8,191),M0I=4289,R2=(8,180))
+    Primes(64)=(P=(163),M=(8,163),M0I=19701,R2=(8,25))
+    Primes(65)=(P=(167),M=(8,167),M0I=22761,R2=(8,127))
+    Primes(66)=(P=(157),M=(8,157),M0I=31307,R2=(8,141))
+    Primes(67)=(P=(251),M=(8,251),M0I=30157,R2=(8,219))
+    Primes(68)=(P=(191),M=(8,191),M0I=4289,R2=(8,180))
+    Primes(69)=(P=(151),M=(8,151),M0I=217,R2=(8,1))
+    Primes(70)=(P=(1,103),M=(9,359,0),M0I=30121,R2=(9,108))
+    Primes(71)=(P=(1,183),M=(9,439,0),M0I=21497,R2=(9,65))
+    Primes(72)=(P=(1,25),M=(9,281,0),M0I=13527,R2=(9,79))
+    Primes(73)=(P=(1,7),M=(9,263,0),M0I=25417,R2=(9,140))
+    Primes(74)=(P=(1,141),M=(9,397,0),M0I=22203,R2=(9,141))
+    Primes(75)=(P=(1,243),M=(9,499,0),M0I=197,R2=(9,111))
+    Primes(76)=(P=(1,235),M=(9,491,0),M0I=24893,R2=(9,438))
+    Primes(77)=(P=(1,103),M=(9,359,0),M0I=30121,R2=(9,108))
+    Primes(78)=(P=(1,231),M=(9,487,0),M0I=32297,R2=(9,328))
+    Primes(79)=(P=(1,231),M=(9,487,0),M0I=32297,R2=(9,328))
+    Primes(80)=(P=(3,41),M=(10,809,0),M0I=14055,R2=(10,619))
+    Primes(81)=(P=(2,141),M=(10,653,0),M0I=28603,R2=(10,211))
+    Primes(82)=(P=(3,209),M=(10,977,0),M0I=19151,R2=(10,261))
+    Primes(83)=(P=(3,139),M=(10,907,0),M0I=29661,R2=(10,758))
+    Primes(84)=(P=(3,5),M=(10,773,0),M0I=11827,R2=(10,763))
+    Primes(85)=(P=(3,223),M=(10,991,0),M0I=2017,R2=(10,261))
+    Primes(86)=(P=(3,199),M=(10,967,0),M0I=12809,R2=(10,496))
+    Primes(87)=(P=(2,149),M=(10,661,0),M0I=18243,R2=(10,204))
+    Primes(88)=(P=(3,143),M=(10,911,0),M0I=17553,R2=(10,784))
+    Primes(89)=(P=(2,207),M=(10,719,0),M0I=15313,R2=(10,166))
+    Primes(90)=(P=(7,115),M=(11,1907,0),M0I=2629,R2=(11,1660))
+    Primes(91)=(P=(6,121),M=(11,1657,0),M0I=31799,R2=(11,853))
+    Primes(92)=(P=(6,187),M=(11,1723,0),M0I=12685,R2=(11,961))
+    Primes(93)=(P=(6,157),M=(11,1693,0),M0I=20555,R2=(11,592))
+    Primes(94)=(P=(7,235),M=(11,2027,0),M0I=5949,R2=(11,1411))
+    Primes(95)=(P=(4,163),M=(11,1187,0),M0I=12533,R2=(11,616))
+    Primes(96)=(P=(5,147),M=(11,1427,0),M0I=8037,R2=(11,1382))
+    Primes(97)=(P=(5,219),M=(11,1499,0),M0I=4525,R2=(11,629))
+    Primes(98)=(P=(4,225),M=(11,1249,0),M0I=16607,R2=(11,255))
+    Primes(99)=(P=(7,195),M=(11,1987,0),M0I=24341,R2=(11,803))
+    Primes(100)=(P=(12,49),M=(12,3121,0),M0I=13103,R2=(12,2347))
+    Primes(101)=(P=(11,155),M=(12,2971,0),M0I=7533,R2=(12,1627))
+    Primes(102)=(P=(10,237),M=(12,2797,0),M0I=7451,R2=(12,1494))
+    Primes(103)=(P=(15,107),M=(12,3947,0),M0I=23229,R2=(12,3891))
+    Primes(104)=(P=(14,143),M=(12,3727,0),M0I=12177,R2=(12,578))
+    Primes(105)=(P=(10,117),M=(12,2677,0),M0I=2595,R2=(12,2478))
+    Primes(106)=(P=(15,209),M=(12,4049,0),M0I=22223,R2=(12,3710))
+    Primes(107)=(P=(10,153),M=(12,2713,0),M0I=22103,R2=(12,1536))
+    Primes(108)=(P=(9,37),M=(12,2341,0),M0I=5459,R2=(12,36))
+    Primes(109)=(P=(11,27),M=(12,2843,0),M0I=10477,R2=(12,427))
+    Primes(110)=(P=(17,209),M=(13,4561,0),M0I=6351,R2=(13,326))
+    Primes(111)=(P=(31,133),M=(13,8069,0),M0I=32435,R2=(13,8063))
+    Primes(112)=(P=(16,61),M=(13,4157,0),M0I=30955,R2=(13,1195))
+    Primes(113)=(P=(20,107),M=(13,5227,0),M0I=1981,R2=(13,1030))
+    Primes(114)=(P=(19,217),M=(13,5081,0),M0I=17303,R2=(13,4580))
+    Primes(115)=(P=(30,77),M=(13,7757,0),M0I=13691,R2=(13,2370))
+    Primes(116)=(P=(31,57),M=(13,7993,0),M0I=24823,R2=(13,2169))
+    Primes(117)=(P=(16,57),M=(13,4153,0),M0I=8695,R2=(13,286))
+    Primes(118)=(P=(28,51),M=(13,7219,0),M0I=16645,R2=(13,2202))
+    Primes(119)=(P=(21,37),M=(13,5413,0),M0I=339,R2=(13,2905))
+    Primes(120)=(P=(48,239),M=(14,12527,0),M0I=497,R2=(14,2546))
+    Primes(121)=(P=(58,183),M=(14,15031,0),M0I=15609,R2=(14,2339))
+    Primes(122)=(P=(46,25),M=(14,11801,0),M0I=12759,R2=(14,4237))
+    Primes(123)=(P=(42,221),M=(14,10973,0),M0I=651,R2=(14,855))
+    Primes(124)=(P=(58,135),M=(14,14983,0),M0I=5321,R2=(14,112))
+    Primes(125)=(P=(62,15),M=(14,15887,0),M0I=3857,R2=(14,3042))
+    Primes(126)=(P=(37,141),M=(14,9613,0),M0I=23227,R2=(14,8176))
+    Primes(127)=(P=(50,207),M=(14,13007,0),M0I=27601,R2=(14,967))
+    Primes(128)=(P=(49,45),M=(14,12589,0),M0I=14683,R2=(14,836))
+    Primes(129)=(P=(41,117),M=(14,10613,0),M0I=24867,R2=(14,3388))
+    Primes(130)=(P=(101,251),M=(15,26107,0),M0I=8909,R2=(15,13128))
+    Primes(131)=(P=(108,169),M=(15,27817,0),M0I=2151,R2=(15,5624))
+    Primes(132)=(P=(105,101),M=(15,26981,0),M0I=24467,R2=(15,5948))
+    Primes(133)=(P=(78,193),M=(15,20161,0),M0I=16063,R2=(15,7286))
+    Primes(134)=(P=(86,243),M=(15,22259,0),M0I=19909,R2=(15,12182))
+    Primes(135)=(P=(102,1),M=(15,26113,0),M0I=26111,R2=(15,1377))
+    Primes(136)=(P=(97,111),M=(15,24943,0),M0I=25201,R2=(15,20503))
+    Primes(137)=(P=(82,9),M=(15,21001,0),M0I=9159,R2=(15,2696))
+    Primes(138)=(P=(77,5),M=(15,19717,0),M0I=2099,R2=(15,13155))
+    Primes(139)=(P=(86,255),M=(15,22271,0),M0I=22273,R2=(15,12372))
+    Primes(140)=(P=(188,153),M=(17,15513,1),M0I=10327,R2=(17,12293,1))
+    Primes(141)=(P=(178,73),M=(17,12873,1),M0I=8199,R2=(17,32080,0))
+    Primes(142)=(P=(199,13),M=(17,18189,1),M0I=8251,R2=(17,6697,0))
+    Primes(143)=(P=(186,127),M=(17,14975,1),M0I=31361,R2=(17,20964,0))
+    Primes(144)=(P=(226,205),M=(17,25293,1),M0I=9723,R2=(17,15435,1))
+    Primes(145)=(P=(244,75),M=(17,29771,1),M0I=19101,R2=(17,14475,1))
+    Primes(146)=(P=(244,163),M=(17,29859,1),M0I=8437,R2=(17,11915,0))
+    Primes(147)=(P=(209,153),M=(17,20889,1),M0I=3415,R2=(17,25967,0))
+    Primes(148)=(P=(162,247),M=(17,8951,1),M0I=16697,R2=(17,15113,0))
+    Primes(149)=(P=(178,21),M=(17,12821,1),M0I=29379,R2=(17,24389,0))
+    Primes(150)=(P=(1,145,23),M=(18,4375,3),M0I=18777,R2=(18,12369,1))
+    Primes(151)=(P=(1,230,113),M=(18,26225,3),M0I=25967,R2=(18,25421,0))
+    Primes(152)=(P=(1,90,13),M=(18,23053,2),M0I=31547,R2=(18,28489,1))
+    Primes(153)=(P=(1,225,237),M=(18,25069,3),M0I=23579,R2=(18,2356,1))
+    Primes(154)=(P=(1,234,87),M=(18,27223,3),M0I=24217,R2=(18,22949,2))
+    Primes(155)=(P=(1,44,149),M=(18,11413,2),M0I=16707,R2=(18,24231,1))
+    Primes(156)=(P=(1,121,185),M=(18,31161,2),M0I=17271,R2=(18,24588,2))
+    Primes(157)=(P=(1,27,19),M=(18,6931,2),M0I=6373,R2=(18,9777,1))
+    Primes(158)=(P=(1,233,85),M=(18,26965,3),M0I=13315,R2=(18,10802,2))
+    Primes(159)=(P=(1,50,91),M=(18,12891,2),M0I=21037,R2=(18,12620,1))
+    Primes(160)=(P=(3,220,135),M=(19,23687,7),M0I=22217,R2=(19,24944,3))
+    Primes(161)=(P=(2,159,17),M=(19,7953,5),M0I=19983,R2=(19,16702,2))
+    Primes(162)=(P=(2,21,99),M=(19,5475,4),M0I=27573,R2=(19,19034,3))
+    Primes(163)=(P=(3,172,229),M=(19,11493,7),M0I=20243,R2=(19,1377,0))
+    Primes(164)=(P=(2,185,49),M=(19,14641,5),M0I=47,R2=(19,16384,0))
+    Primes(165)=(P=(3,197,219),M=(19,17883,7),M0I=20909,R2=(19,2811,4))
+    Primes(166)=(P=(3,100,211),M=(19,25811,6),M0I=27813,R2=(19,32553,1))
+    Primes(167)=(P=(2,59,73),M=(19,15177,4),M0I=22791,R2=(19,22586,1))
+    Primes(168)=(P=(3,137,239),M=(19,2543,7),M0I=15089,R2=(19,31582,5))
+    Primes(169)=(P=(2,50,199),M=(19,12999,4),M0I=4361,R2=(19,1604,4))
+    Primes(170)=(P=(5,45,189),M=(20,11709,10),M0I=2667,R2=(20,13662,2))
+    Primes(171)=(P=(4,206,217),M=(20,20185,9),M0I=11927,R2=(20,15634,4))
+    Primes(172)=(P=(7,165,181),M=(20,9653,15),M0I=8035,R2=(20,19100,6))
+    Primes(173)=(P=(5,203,31),M=(20,19231,11),M0I=3873,R2=(20,30243,3))
+    Primes(174)=(P=(6,107,63),M=(20,27455,12),M0I=31553,R2=(20,11766,12))
+    Primes(175)=(P=(4,126,61),M=(20,32317,8),M0I=30443,R2=(20,14664,8))
+    Primes(176)=(P=(6,182,201),M=(20,14025,13),M0I=15495,R2=(20,8020,6))
+    Primes(177)=(P=(4,80,55),M=(20,20535,8),M0I=6777,R2=(20,4413,4))
+    Primes(178)=(P=(7,222,193),M=(20,24257,15),M0I=20159,R2=(20,19289,6))
+    Primes(179)=(P=(5,71,97),M=(20,18273,10),M0I=25439,R2=(20,20657,5))
+    Primes(180)=(P=(9,34,153),M=(21,8857,18),M0I=28247,R2=(21,19484,8))
+    Primes(181)=(P=(10,60,91),M=(21,15451,20),M0I=27693,R2=(21,19121,14))
+    Primes(182)=(P=(8,145,121),M=(21,4473,17),M0I=30519,R2=(21,20606,13))
+    Primes(183)=(P=(13,121,17),M=(21,30993,26),M0I=26639,R2=(21,7656,15))
+    Primes(184)=(P=(11,131,141),M=(21,909,23),M0I=2235,R2=(21,3145,15))
+    Primes(185)=(P=(11,37,91),M=(21,9563,22),M0I=32045,R2=(21,2454,8))
+    Primes(186)=(P=(14,129,153),M=(21,409,29),M0I=15703,R2=(21,12844,4))
+    Primes(187)=(P=(10,188,185),M=(21,15545,21),M0I=30327,R2=(21,31477,12))
+    Primes(188)=(P=(11,219,27),M=(21,23323,23),M0I=30957,R2=(21,28194,4))
+    Primes(189)=(P=(11,40,191),M=(21,10431,22),M0I=14529,R2=(21,4643,11))
+    Primes(190)=(P=(29,150,243),M=(22,5875,59),M0I=3525,R2=(22,25674,22))
+    Primes(191)=(P=(19,162,121),M=(22,8825,39),M0I=22583,R2=(22,1949,18))
+    Primes(192)=(P=(16,27,243),M=(22,7155,32),M0I=2757,R2=(22,11692,0))
+    Primes(193)=(P=(19,72,85),M=(22,18517,38),M0I=2819,R2=(22,9131,29))
+    Primes(194)=(P=(16,138,43),M=(22,2603,33),M0I=7037,R2=(22,8302,8))
+    Primes(195)=(P=(29,101,61),M=(22,25917,58),M0I=26091,R2=(22,10402,32))
+    Primes(196)=(P=(19,56,247),M=(22,14583,38),M0I=30521,R2=(22,22348,26))
+    Primes(197)=(P=(17,161,249),M=(22,8697,35),M0I=12215,R2=(22,25295,27))
+    Primes(198)=(P=(25,175,99),M=(22,12131,51),M0I=13749,R2=(22,9134,7))
+    Primes(199)=(P=(20,66,233),M=(22,17129,40),M0I=19111,R2=(22,21971,7))
+    Primes(200)=(P=(40,73,161),M=(23,18849,80),M0I=9631,R2=(23,3,66))
+    Primes(201)=(P=(44,164,241),M=(23,9457,89),M0I=13295,R2=(23,15900,20))
+    Primes(202)=(P=(56,25,113),M=(23,6513,112),M0I=30831,R2=(23,22852,48))
+    Primes(203)=(P=(33,5,209),M=(23,1489,66),M0I=3279,R2=(23,18210,2))
+    Primes(204)=(P=(60,60,71),M=(23,15431,120),M0I=21129,R2=(23,22642,20))
+    Primes(205)=(P=(47,151,35),M=(23,5923,95),M0I=12149,R2=(23,12793,35))
+    Primes(206)=(P=(60,63,65),M=(23,16193,120),M0I=12095,R2=(23,32011,77))
+    Primes(207)=(P=(59,116,31),M=(23,29727,118),M0I=30753,R2=(23,20949,113))
+    Primes(208)=(P=(45,126,61),M=(23,32317,90),M0I=30443,R2=(23,23627,79))
+    Primes(209)=(P=(38,228,143),M=(23,25743,77),M0I=17809,R2=(23,11791,1))
+    Primes(210)=(P=(111,164,3),M=(24,9219,223),M0I=22869,R2=(24,7727,107))
+    Primes(211)=(P=(92,212,183),M=(24,21687,185),M0I=14073,R2=(24,15170,167))
+    Primes(212)=(P=(99,87,227),M=(24,22499,198),M0I=23093,R2=(24,30424,161))
+    Primes(213)=(P=(108,199,159),M=(24,18335,217),M0I=27553,R2=(24,30104,80))
+    Primes(214)=(P=(84,206,27),M=(24,19995,169),M0I=9197,R2=(24,26694,138))
+    Primes(215)=(P=(101,102,45),M=(24,26157,202),M0I=9819,R2=(24,10164,163))
+    Primes(216)=(P=(80,244,139),M=(24,29835,161),M0I=11485,R2=(24,1598,96))
+    Primes(217)=(P=(88,156,109),M=(24,7277,177),M0I=12955,R2=(24,14709,51))
+    Primes(218)=(P=(73,226,129),M=(24,25217,147),M0I=8831,R2=(24,26171,20))
+    Primes(219)=(P=(82,193,189),M=(24,16829,165),M0I=32363,R2=(24,23894,13))
+    Primes(220)=(P=(165,77,179),M=(25,19891,330),M0I=22149,R2=(25,19160,54))
+    Primes(221)=(P=(206,68,123),M=(25,17531,412),M0I=1357,R2=(25,10519,204))
+    Primes(222)=(P=(161,72,123),M=(25,18555,322),M0I=10573,R2=(25,10668,102))
+    Primes(223)=(P=(132,210,211),M=(25,21203,265),M0I=10917,R2=(25,5326,62))
+    Primes(224)=(P=(180,112,61),M=(25,28733,360),M0I=22763,R2=(25,11093,93))
+    Primes(225)=(P=(181,145,77),M=(25,4429,363),M0I=28795,R2=(25,8285,282))
+    Primes(226)=(P=(137,96,125),M=(25,24701,274),M0I=26411,R2=(25,19143,238))
+    Primes(227)=(P=(190,20,227),M=(25,5347,380),M0I=12085,R2=(25,16601,73))
+    Primes(228)=(P=(201,46,87),M=(25,11863,402),M0I=25241,R2=(25,32253,324))
+    Primes(229)=(P=(233,219,105),M=(25,23401,467),M0I=6951,R2=(25,26302,219))
+    Primes(230)=(P=(1,220,182,99),M=(26,13923,953,0),M0I=1205,R2=(26,18694,905))
+    Primes(231)=(P=(1,112,138,93),M=(26,2653,737,0),M0I=26123,R2=(26,351,205))
+    Primes(232)=(P=(1,131,112,235),M=(26,28907,774,0),M0I=18493,R2=(26,14636,240))
+    Primes(233)=(P=(1,131,2,117),M=(26,629,774,0),M0I=16931,R2=(26,5088,360))
+    Primes(234)=(P=(1,70,162,249),M=(26,8953,653,0),M0I=183,R2=(26,19984,62))
+    Primes(235)=(P=(1,227,152,63),M=(26,6207,967,0),M0I=10305,R2=(26,1819,894))
+    Primes(236)=(P=(1,177,88,51),M=(26,22579,866,0),M0I=7429,R2=(26,24528,828))
+    Primes(237)=(P=(1,27,48,177),M=(26,12465,566,0),M0I=26543,R2=(26,31314,299))
+    Primes(238)=(P=(1,56,80,75),M=(26,20555,624,0),M0I=1693,R2=(26,7220,259))
+    Primes(239)=(P=(1,124,121,157),M=(26,31133,760,0),M0I=11083,R2=(26,25924,674))
+    Primes(240)=(P=(2,230,210,55),M=(27,21047,1485,0),M0I=31865,R2=(27,24318,730))
+    Primes(241)=(P=(2,64,80,57),M=(27,20537,1152,0),M0I=25079,R2=(27,5537,791))
+    Primes(242)=(P=(2,203,99,147),M=(27,25491,1430,0),M0I=19813,R2=(27,11961,1281))
+    Primes(243)=(P=(3,11,195,47),M=(27,17199,1559,0),M0I=7217,R2=(27,14015,1358))
+    Primes(244)=(P=(3,101,143,75),M=(27,3915,1739,0),M0I=32157,R2=(27,28025,1506))
+    Primes(245)=(P=(2,15,57,75),M=(27,14667,1054,0),M0I=30621,R2=(27,2046,138))
+    Primes(246)=(P=(3,49,206,229),M=(27,20197,1635,0),M0I=16659,R2=(27,5642,907))
+    Primes(247)=(P=(3,206,249,93),M=(27,31069,1949,0),M0I=23819,R2=(27,27618,1186))
+    Primes(248)=(P=(2,247,42,95),M=(27,10847,1518,0),M0I=20065,R2=(27,3842,1185))
+    Primes(249)=(P=(3,225,126,179),M=(27,32435,1986,0),M0I=8069,R2=(27,29593,762))
+    Primes(250)=(P=(4,45,114,175),M=(28,29359,2138,0),M0I=23473,R2=(28,15203,1786))
+    Primes(251)=(P=(6,176,167,183),M=(28,10167,3425,0),M0I=6649,R2=(28,6411,340))
+    Primes(252)=(P=(6,106,67,215),M=(28,17367,3284,0),M0I=8217,R2=(28,19424,838))
+    Primes(253)=(P=(4,57,228,39),M=(28,25639,2163,0),M0I=13417,R2=(28,10379,1249))
+    Primes(254)=(P=(5,120,111,51),M=(28,28467,2800,0),M0I=23557,R2=(28,8384,2161))
+    Primes(255)=(P=(6,106,22,185),M=(28,5817,3284,0),M0I=28791,R2=(28,18251,1795))
+    Primes(256)=(P=(5,184,234,241),M=(28,27377,2929,0),M0I=14831,R2=(28,17157,322))
+    Primes(257)=(P=(7,194,205,111),M=(28,19823,3973,0),M0I=20081,R2=(28,16389,1778))
+    Primes(258)=(P=(4,129,199,107),M=(28,18283,2307,0),M0I=21181,R2=(28,1091,807))
+    Primes(259)=(P=(5,62,194,101),M=(28,16997,2685,0),M0I=24723,R2=(28,13565,613))
+    Primes(260)=(P=(9,184,69,97),M=(29,17761,4976,0),M0I=24927,R2=(29,32243,266))
+    Primes(261)=(P=(13,122,250,63),M=(29,31295,6901,0),M0I=2625,R2=(29,5501,6010))
+    Primes(262)=(P=(15,89,34,59),M=(29,8763,7858,0),M0I=6413,R2=(29,28085,573))
+    Primes(263)=(P=(12,175,66,105),M=(29,17001,6494,0),M0I=4647,R2=(29,1061,2323))
+    Primes(264)=(P=(8,58,192,19),M=(29,16403,4213,0),M0I=30181,R2=(29,7718,1659))
+    Primes(265)=(P=(11,7,150,25),M=(29,5657,5647,0),M0I=6615,R2=(29,20146,2707))
+    Primes(266)=(P=(14,91,236,63),M=(29,27711,7351,0),M0I=31809,R2=(29,17199,3846))
+    Primes(267)=(P=(9,55,70,99),M=(29,18019,4718,0),M0I=5301,R2=(29,11223,1767))
+    Primes(268)=(P=(12,4,254,47),M=(29,32303,6153,0),M0I=30513,R2=(29,11275,1497))
+    Primes(269)=(P=(9,117,48,203),M=(29,12491,4842,0),M0I=19229,R2=(29,16210,2530))
+    Primes(270)=(P=(25,183,122,71),M=(30,31303,13166,0),M0I=28809,R2=(30,21311,2075))
+    Primes(271)=(P=(21,170,195,173),M=(30,17325,11093,0),M0I=26587,R2=(30,19992,3835))
+    Primes(272)=(P=(25,33,118,255),M=(30,30463,12866,0),M0I=30465,R2=(30,27550,12596))
+    Primes(273)=(P=(23,148,116,171),M=(30,29867,12072,0),M0I=6653,R2=(30,429,7799))
+    Primes(274)=(P=(24,56,182,75),M=(30,13899,12401,0),M0I=7325,R2=(30,32536,11377))
+    Primes(275)=(P=(21,200,44,69),M=(30,11333,11152,0),M0I=31091,R2=(30,1945,10061))
+    Primes(276)=(P=(18,6,42,175),M=(30,10927,9228,0),M0I=5041,R2=(30,16002,153))
+    Primes(277)=(P=(22,30,237,103),M=(30,28007,11325,0),M0I=8617,R2=(30,19544,7017))
+    Primes(278)=(P=(21,212,71,127),M=(30,18303,11176,0),M0I=1921,R2=(30,17721,7911))
+    Primes(279)=(P=(29,65,164,113),M=(30,9329,14979,0),M0I=25455,R2=(30,19936,10925))
+    Primes(280)=(P=(54,124,139,95),M=(31,2911,27897,0),M0I=28513,R2=(31,1260,15241))
+    Primes(281)=(P=(58,75,145,29),M=(31,4381,29847,0),M0I=18123,R2=(31,8389,81))
+    Primes(282)=(P=(54,137,219,9),M=(31,23305,27923,0),M0I=23751,R2=(31,27031,8477))
+    Primes(283)=(P=(56,75,75,87),M=(31,19287,28822,0),M0I=12185,R2=(31,28558,4174))
+    Primes(284)=(P=(38,62,119,103),M=(31,30567,19580,0),M0I=19369,R2=(31,10029,12924))
+    Primes(285)=(P=(37,239,155,143),M=(31,7055,19423,0),M0I=23697,R2=(31,6212,14945))
+    Primes(286)=(P=(53,119,121,95),M=(31,31071,27374,0),M0I=23905,R2=(31,3625,20770))
+    Primes(287)=(P=(44,127,31,69),M=(31,8005,22782,0),M0I=25715,R2=(31,16309,21632))
+    Primes(288)=(P=(48,177,91,141),M=(31,23437,24930,0),M0I=8379,R2=(31,25940,7440))
+    Primes(289)=(P=(58,228,36,27),M=(31,9243,30152,0),M0I=27117,R2=(31,22408,22575))
+    Primes(290)=(P=(71,65,123,205),M=(33,31693,3714,1),M0I=5883,R2=(33,31942,12203,0))
+    Primes(291)=(P=(85,54,83,109),M=(33,21357,10860,1),M0I=20891,R2=(33,17999,7576,0))
+    Primes(292)=(P=(127,196,218,21),M=(33,23061,32649,1),M0I=23235,R2=(33,31256,17959,1))
+    Primes(293)=(P=(110,88,251,203),M=(33,31691,23729,1),M0I=11805,R2=(33,15742,7469,1))
+    Primes(294)=(P=(113,132,95,127),M=(33,24447,25352,1),M0I=8065,R2=(33,7802,494,1))
+    Primes(295)=(P=(84,60,180,239),M=(33,13551,10361,1),M0I=1521,R2=(33,16238,12096,0))
+    Primes(296)=(P=(81,154,65,197),M=(33,16837,9012,1),M0I=27379,R2=(33,28254,23208,0))
+    Primes(297)=(P=(125,250,240,157),M=(33,28829,31733,1),M0I=27211,R2=(33,805,19651,0))
+    Primes(298)=(P=(93,253,72,175),M=(33,18607,15354,1),M0I=29105,R2=(33,5088,1609,1))
+    Primes(299)=(P=(80,48,61,43),M=(33,15659,8288,1),M0I=26237,R2=(33,25255,17958,0))
+    Primes(300)=(P=(233,196,25,105),M=(34,6505,21384,3),M0I=31015,R2=(34,1085,31225,0))
+    Primes(301)=(P=(154,2,79,99),M=(34,20323,13316,2),M0I=21941,R2=(34,15608,12128,2))
+    Primes(302)=(P=(151,60,196,179),M=(34,17587,11897,2),M0I=30085,R2=(34,12807,9017,1))
+    Primes(303)=(P=(193,139,27,153),M=(34,7065,790,3),M0I=30551,R2=(34,2982,24971,2))
+    Primes(304)=(P=(174,74,233,171),M=(34,27051,23701,2),M0I=14077,R2=(34,7303,13827,1))
+    Primes(305)=(P=(179,239,211,69),M=(34,21317,26591,2),M0I=14451,R2=(34,32554,10412,2))
+    Primes(306)=(P=(142,120,68,49),M=(34,17457,7408,2),M0I=27439,R2=(34,1451,9206,0))
+    Primes(307)=(P=(255,172,77,43),M=(34,19755,32600,3),M0I=30333,R2=(34,4184,12514,0))
+    Primes(308)=(P=(158,141,85,223),M=(34,21983,15642,2),M0I=23009,R2=(34,10991,273,1))
+    Primes(309)=(P=(168,25,232,239),M=(34,26863,20531,2),M0I=14833,R2=(34,7054,4093,1))
+    Primes(310)=(P=(1,235,216,169,65),M=(35,10561,22449,7),M0I=6463,R2=(35,10735,28036,6))
+    Primes(311)=(P=(1,0,235,227,43),M=(35,25387,471,4),M0I=15485,R2=(35,7269,17614,1))
+    Primes(312)=(P=(1,210,71,147,73),M=(35,4937,9359,7),M0I=12551,R2=(35,27551,6889,4))
+    Primes(313)=(P=(1,140,12,214,51),M=(35,22067,6169,6),M0I=27397,R2=(35,30319,19743,0))
+    Primes(314)=(P=(1,239,89,3,227),M=(35,995,24242,7),M0I=9781,R2=(35,28742,24896,1))
+    Primes(315)=(P=(1,148,223,203,201),M=(35,19401,10687,6),M0I=16775,R2=(35,19399,2963,1))
+    Primes(316)=(P=(1,220,133,222,67),M=(35,24131,14603,7),M0I=8597,R2=(35,26361,32457,5))
+    Primes(317)=(P=(1,69,204,140,47),M=(35,3119,2969,5),M0I=17713,R2=(35,8076,19109,2))
+    Primes(318)=(P=(1,191,160,36,129),M=(35,9345,32576,6),M0I=25727,R2=(35,1845,20931,1))
+    Primes(319)=(P=(1,2,25,167,91),M=(35,10075,1075,4),M0I=20269,R2=(35,18827,31401,0))
+    Primes(320)=(P=(3,251,77,119,83),M=(36,30547,30362,15),M0I=6949,R2=(36,14769,6839,9))
+    Primes(321)=(P=(3,150,237,27,37),M=(36,6949,11738,14),M0I=30547,R2=(36,25221,9611,5))
+    Primes(322)=(P=(3,53,239,194,43),M=(36,16939,27615,12),M0I=4989,R2=(36,28629,29111,11))
+    Primes(323)=(P=(2,133,78,53,231),M=(36,13799,2716,10),M0I=29225,R2=(36,31188,4597,5))
+    Primes(324)=(P=(2,107,75,80,163),M=(36,20643,22166,9),M0I=7413,R2=(36,4123,13373,2))
+    Primes(325)=(P=(2,161,19,104,43),M=(36,26667,16934,10),M0I=27005,R2=(36,19769,1432,7))
+    Primes(326)=(P=(2,171,104,183,117),M=(36,14197,22225,10),M0I=24355,R2=(36,13121,16804,5))
+    Primes(327)=(P=(2,124,218,195,207),M=(36,17359,31157,9),M0I=7377,R2=(36,4769,5990,1))
+    Primes(328)=(P=(2,178,209,147,111),M=(36,4975,26019,10),M0I=21617,R2=(36,2991,5039,3))
+    Primes(329)=(P=(2,95,250,170,205),M=(36,10957,16373,9),M0I=11771,R2=(36,2116,29094,1))
+    Primes(330)=(P=(5,51,141,46,143),M=(37,11919,26394,20),M0I=20369,R2=(37,24963,26629,12))
+    Primes(331)=(P=(7,245,168,23,173),M=(37,6061,27472,31),M0I=7131,R2=(37,26399,2512,20))
+    Primes(332)=(P=(7,73,27,205,85),M=(37,19797,4663,29),M0I=14339,R2=(37,17256,17157,21))
+    Primes(333)=(P=(4,73,46,42,131),M=(37,10883,4700,17),M0I=3029,R2=(37,4462,21176,0))
+    Primes(334)=(P=(7,228,96,21,199),M=(37,5575,18624,31),M0I=25609,R2=(37,26717,3649,21))
+    Primes(335)=(P=(5,249,192,221,69),M=(37,23877,29569,23),M0I=21107,R2=(37,7677,21421,22))
+    Primes(336)=(P=(6,201,2,225,237),M=(37,25069,4613,27),M0I=23579,R2=(37,728,20141,2))
+    Primes(337)=(P=(7,74,9,233,113),M=(37,26993,5139,29),M0I=18543,R2=(37,27174,18933,17))
+    Primes(338)=(P=(4,56,13,222,177),M=(37,24241,28699,16),M0I=21935,R2=(37,15168,16698,2))
+    Primes(339)=(P=(7,196,180,52,53),M=(37,13365,2408,31),M0I=483,R2=(37,6289,17261,6))
+    Primes(340)=(P=(9,99,117,25,183),M=(38,6583,18154,37),M0I=27641,R2=(38,26763,26096,23))
+    Primes(341)=(P=(10,128,15,161,197),M=(38,8645,31,42),M0I=19187,R2=(38,29924,32511,4))
+    Primes(342)=(P=(12,145,223,40,203),M=(38,10443,9150,50),M0I=797,R2=(38,22222,28348,39))
+    Primes(343)=(P=(13,105,137,203,29),M=(38,19229,21267,53),M0I=12491,R2=(38,26020,10218,34))
+    Primes(344)=(P=(11,75,181,232,205),M=(38,26829,5995,45),M0I=15355,R2=(38,24081,28487,30))
+    Primes(345)=(P=(11,16,72,174,71),M=(38,11847,8337,44),M0I=25737,R2=(38,9050,26100,8))
+    Primes(346)=(P=(14,209,141,116,49),M=(38,29745,8986,59),M0I=6959,R2=(38,12378,24974,46))
+    Primes(347)=(P=(15,125,110,194,127),M=(38,17023,31453,61),M0I=641,R2=(38,7497,21071,15))
+    Primes(348)=(P=(15,233,9,171,239),M=(38,11247,21011,63),M0I=7409,R2=(38,15548,780,18))
+    Primes(349)=(P=(14,212,19,112,229),M=(38,28901,10278,59),M0I=13075,R2=(38,24099,10168,5))
+    Primes(350)=(P=(24,228,125,139,167),M=(39,2983,18683,99),M0I=5097,R2=(39,22316,12345,65))
+    Primes(351)=(P=(30,200,216,138,233),M=(39,2793,4529,123),M0I=4775,R2=(39,19855,27550,95))
+    Primes(352)=(P=(22,139,18,217,181),M=(39,22965,5669,90),M0I=29539,R2=(39,20732,31359,45))
+    Primes(353)=(P=(28,242,255,145,241),M=(39,4593,26111,115),M0I=16623,R2=(39,22743,7969,56))
+    Primes(354)=(P=(29,43,156,54,161),M=(39,13985,22328,116),M0I=21151,R2=(39,26370,22566,68))
+    Primes(355)=(P=(28,61,83,225,27),M=(39,24859,31399,112),M0I=28397,R2=(39,13465,25885,6))
+    Primes(356)=(P=(18,122,92,252,27),M=(39,31771,29881,73),M0I=493,R2=(39,28064,29548,58))
+    Primes(357)=(P=(30,143,222,50,39),M=(39,12839,8124,122),M0I=25193,R2=(39,16172,18454,117))
+    Primes(358)=(P=(30,200,6,99,9),M=(39,25353,4108,123),M0I=25799,R2=(39,5430,5948,109))
+    Primes(359)=(P=(21,109,213,130,153),M=(39,665,23467,85),M0I=20055,R2=(39,1313,22690,67))
+    Primes(360)=(P=(49,166,121,168,143),M=(40,10383,19699,198),M0I=2449,R2=(40,9133,8148,63))
+    Primes(361)=(P=(41,253,212,219,191),M=(40,23487,31657,167),M0I=27585,R2=(40,2960,3750,103))
+    Primes(362)=(P=(53,190,76,144,169),M=(40,4265,31897,214),M0I=27751,R2=(40,26225,21573,123))
+    Primes(363)=(P=(53,62,55,180,231),M=(40,13543,31855,212),M0I=24873,R2=(40,16720,27819,97))
+    Primes(364)=(P=(50,19,32,49,169),M=(40,12713,9792,200),M0I=32103,R2=(40,19556,31677,170))
+    Primes(365)=(P=(35,112,99,78,97),M=(40,20065,24774,141),M0I=10847,R2=(40,24845,16098,67))
+    Primes(366)=(P=(47,249,193,191,89),M=(40,16217,29571,191),M0I=26391,R2=(40,24332,5715,17))
+    Primes(367)=(P=(49,7,217,21,125),M=(40,5501,4018,196),M0I=13355,R2=(40,9724,25682,141))
+    Primes(368)=(P=(50,36,21,172,143),M=(40,11407,18475,200),M0I=3473,R2=(40,15640,4953,39))
+    Primes(369)=(P=(43,226,158,188,101),M=(40,15461,17725,175),M0I=27283,R2=(40,30399,26466,68))
+    Primes(370)=(P=(127,234,51,18,19),M=(41,4627,21606,511),M0I=30693,R2=(41,30468,4440,271))
+    Primes(371)=(P=(100,53,103,153,69),M=(41,6469,27343,400),M0I=28275,R2=(41,15144,26621,85))
+    Primes(372)=(P=(106,205,251,214,165),M=(41,22181,7159,427),M0I=24275,R2=(41,14392,9650,9))
+    Primes(373)=(P=(101,64,178,189,87),M=(41,15703,357,405),M0I=409,R2=(41,5330,14953,390))
+    Primes(374)=(P=(74,85,168,113,129),M=(41,29057,11088,297),M0I=12671,R2=(41,8446,6404,228))
+    Primes(375)=(P=(120,119,238,123,13),M=(41,31501,28636,481),M0I=13371,R2=(41,5676,8639,138))
+    Primes(376)=(P=(95,72,46,49,31),M=(41,12575,4188,381),M0I=29985,R2=(41,32413,26259,255))
+    Primes(377)=(P=(99,174,64,246,111),M=(41,30319,23681,398),M0I=22385,R2=(41,25187,22290,89))
+    Primes(378)=(P=(66,113,209,239,199),M=(41,28615,25507,265),M0I=24073,R2=(41,21630,25865,245))
+    Primes(379)=(P=(115,83,241,241,233),M=(41,29161,10211,461),M0I=2471,R2=(41,16875,12972,138))
+    Primes(380)=(P=(182,56,69,222,67),M=(42,24131,28811,728),M0I=8597,R2=(42,12173,25020,429))
+    Primes(381)=(P=(129,67,193,46,187),M=(42,11963,1922,517),M0I=6541,R2=(42,6789,3492,443))
+    Primes(382)=(P=(233,123,119,81,195),M=(42,20931,30446,933),M0I=22805,R2=(42,28766,15873,808))
+    Primes(383)=(P=(146,207,240,181,125),M=(42,13693,8161,587),M0I=21547,R2=(42,9757,11012,143))
+    Primes(384)=(P=(146,45,188,85,113),M=(42,21873,23416,584),M0I=13423,R2=(42,11017,26769,325))
+    Primes(385)=(P=(207,28,112,55,115),M=(42,14195,14560,828),M0I=14917,R2=(42,6913,12583,26))
+    Primes(386)=(P=(210,32,197,17,83),M=(42,4435,16778,840),M0I=9509,R2=(42,13926,4826,75))
+    Primes(387)=(P=(253,115,170,60,103),M=(42,15463,26452,1013),M0I=24745,R2=(42,26640,13954,486))
+    Primes(388)=(P=(167,208,216,13,165),M=(42,3493,8624,671),M0I=28115,R2=(42,31624,21476,538))
+    Primes(389)=(P=(192,189,26,249,215),M=(42,31191,31285,770),M0I=30233,R2=(42,15178,9901,176))
+    Primes(390)=(P=(1,80,158,108,118,19),M=(43,30227,15576,1346,0),M0I=15333,R2=(43,2260,877,4))
+    Primes(391)=(P=(1,165,176,238,105,189),M=(43,27069,25052,1686,0),M0I=26219,R2=(43,22351,26957,981))
+    Primes(392)=(P=(1,127,215,160,3,51),M=(43,819,12096,1535,0),M0I=20485,R2=(43,5489,19761,1393))
+    Primes(393)=(P=(1,48,184,70,112,241),M=(43,28913,28812,1218,0),M0I=32751,R2=(43,9806,1848,780))
+    Primes(394)=(P=(1,58,117,50,117,81),M=(43,30033,27236,1257,0),M0I=3151,R2=(43,22037,28665,392))
+    Primes(395)=(P=(1,77,178,194,108,19),M=(43,27667,25988,1334,0),M0I=16869,R2=(43,1313,5700,779))
+    Primes(396)=(P=(1,210,242,223,111,39),M=(43,28455,26046,1867,0),M0I=28521,R2=(43,12244,17535,1179))
+    Primes(397)=(P=(1,217,133,97,10,59),M=(43,2619,2754,1894,0),M0I=16653,R2=(43,14156,25798,1432))
+    Primes(398)=(P=(1,147,218,81,134,47),M=(43,1583,13475,1615,0),M0I=32561,R2=(43,28966,23682,567))
+    Primes(399)=(P=(1,169,212,194,75,37),M=(43,19237,10628,1703,0),M0I=10067,R2=(43,12838,26221,1633))
+    Primes(400)=(P=(3,165,175,229,107,237),M=(44,27629,24522,3734,0),M0I=22043,R2=(44,12622,26523,3721))
+    Primes(401)=(P=(3,132,189,50,111,167),M=(44,28583,31332,3602,0),M0I=14313,R2=(44,12417,19166,1376))
+    Primes(402)=(P=(2,192,189,7,61,205),M=(44,15821,31246,2818,0),M0I=2299,R2=(44,13771,10388,2371))
+    Primes(403)=(P=(3,14,48,111,169,151),M=(44,10647,24799,3128,0),M0I=6617,R2=(44,22077,27204,896))
+    Primes(404)=(P=(3,218,88,129,168,251),M=(44,10491,12547,3945,0),M0I=24013,R2=(44,5345,10027,2168))
+    Primes(405)=(P=(2,69,6,240,189,231),M=(44,15847,3553,2324,0),M0I=31273,R2=(44,27414,9626,2085))
+    Primes(406)=(P=(2,98,87,215,11,161),M=(44,2977,12206,2441,0),M0I=26527,R2=(44,10841,10491,1832))
+    Primes(407)=(P=(2,130,182,74,116,49),M=(44,29745,27796,2570,0),M0I=6959,R2=(44,16808,31308,1385))
+    Primes(408)=(P=(2,171,245,70,182,247),M=(44,14071,27277,2735,0),M0I=5433,R2=(44,9639,3863,1106))
+    Primes(409)=(P=(2,100,171,205,113,223),M=(44,29151,22426,2450,0),M0I=30177,R2=(44,2387,5065,629))
+    Primes(410)=(P=(4,230,16,151,36,105),M=(45,9321,8494,5016,0),M0I=21543,R2=(45,3891,8541,4671))
+    Primes(411)=(P=(4,189,223,160,126,101),M=(45,32357,16192,4855,0),M0I=31891,R2=(45,310,24016,857))
+    Primes(412)=(P=(4,32,143,29,109,107),M=(45,28011,7738,4226,0),M0I=10429,R2=(45,2971,18445,1212))
+    Primes(413)=(P=(6,138,254,32,102,177),M=(45,26289,31808,6699,0),M0I=23983,R2=(45,5014,1949,171))
+    Primes(414)=(P=(4,97,219,239,183,105),M=(45,14185,14303,4487,0),M0I=14119,R2=(45,22521,4606,2416))
+    Primes(415)=(P=(6,195,133,181,224,165),M=(45,24741,2923,6926,0),M0I=30931,R2=(45,13829,9858,6345))
+    Primes(416)=(P=(4,158,12,115,6,63),M=(45,1599,6374,4728,0),M0I=5697,R2=(45,23851,11302,277))
+    Primes(417)=(P=(6,227,1,244,74,211),M=(45,19155,1000,7052,0),M0I=25253,R2=(45,32256,3405,6144))
+    Primes(418)=(P=(6,137,74,7,176,129),M=(45,12417,5135,6693,0),M0I=28799,R2=(45,6034,12271,1999))
+    Primes(419)=(P=(5,216,70,169,152,109),M=(45,6253,3411,5985,0),M0I=20123,R2=(45,5977,11777,1370))
+    Primes(420)=(P=(13,211,219,111,141,143),M=(46,3471,14047,14159,0),M0I=3729,R2=(46,22863,8186,5627))
+    Primes(421)=(P=(15,28,41,146,76,241),M=(46,19697,21284,15472,0),M0I=23535,R2=(46,4194,7399,12430))
+    Primes(422)=(P=(9,187,73,219,128,181),M=(46,181,5047,9965,0),M0I=4707,R2=(46,2952,13425,2216))
+    Primes(423)=(P=(12,81,85,75,127,69),M=(46,32581,10902,12613,0),M0I=17523,R2=(46,1090,937,2112))
+    Primes(424)=(P=(12,212,28,167,52,85),M=(46,13397,14670,13136,0),M0I=22275,R2=(46,20763,22805,410))
+    Primes(425)=(P=(13,131,211,141,5,143),M=(46,1423,10010,13839,0),M0I=1681,R2=(46,26820,29721,11921))
+    Primes(426)=(P=(13,37,110,47,62,237),M=(46,16109,23646,13461,0),M0I=12571,R2=(46,3725,15219,4685))
+    Primes(427)=(P=(15,39,164,14,165,51),M=(46,9523,18461,15518,0),M0I=8709,R2=(46,14317,5870,12671))
+    Primes(428)=(P=(13,53,84,44,245,229),M=(46,30181,10329,13525,0),M0I=16403,R2=(46,2009,23787,3569))
+    Primes(429)=(P=(15,85,5,17,116,45),M=(46,29741,2594,15700,0),M0I=1115,R2=(46,15973,1649,6775))
+    Primes(430)=(P=(18,49,106,36,163,1),M=(47,8961,21577,18629,0),M0I=8959,R2=(47,32173,30106,8033))
+    Primes(431)=(P=(22,47,106,199,246,101),M=(47,30309,21903,22717,0),M0I=13459,R2=(47,12629,28755,19751))
+    Primes(432)=(P=(30,68,232,161,182,123),M=(47,13947,20803,30995,0),M0I=18253,R2=(47,29078,22567,1760))
+    Primes(433)=(P=(24,106,217,90,238,91),M=(47,28251,12981,25003,0),M0I=28205,R2=(47,19814,27075,2646))
+    Primes(434)=(P=(28,172,25,33,85,61),M=(47,21821,12866,29360,0),M0I=21995,R2=(47,23594,24002,3650))
+    Primes(435)=(P=(18,157,172,54,111,209),M=(47,28625,22636,19062,0),M0I=14031,R2=(47,10481,7615,16797))
+    Primes(436)=(P=(24,77,70,20,219,77),M=(47,23373,3113,24885,0),M0I=10875,R2=(47,18214,31126,22555))
+    Primes(437)=(P=(24,137,54,175,43,91),M=(47,11099,27998,25124,0),M0I=29485,R2=(47,6913,20050,7556))
+    Primes(438)=(P=(22,104,241,163,220,191),M=(47,23743,25415,22947,0),M0I=27841,R2=(47,30595,32035,1668))
+    Primes(439)=(P=(30,17,62,223,65,247),M=(47,16887,32190,30788,0),M0I=12345,R2=(47,29283,27413,18114))
+    Primes(440)=(P=(45,135,240,217,171,139),M=(49,11147,25011,13855,1),M0I=23517,R2=(49,11554,11864,12279,0))
+    Primes(441)=(P=(40,124,250,104,174,255),M=(49,12031,29905,8691,1),M0I=12033,R2=(49,23161,13306,20844,0))
+    Primes(442)=(P=(34,45,120,228,235,51),M=(49,27443,29129,2229,1),M0I=30725,R2=(49,23340,28258,10158,0))
+    Primes(443)=(P=(43,210,5,184,225,85),M=(49,24917,2929,12104,1),M0I=27651,R2=(49,16922,22746,2052,0))
+    Primes(444)=(P=(39,229,93,88,11,111),M=(49,2927,15024,8085,1),M0I=19569,R2=(49,5233,12172,1278,1))
+    Primes(445)=(P=(33,129,135,218,199,83),M=(49,18259,4021,1542,1),M0I=27429,R2=(49,4374,468,22930,0))
+    Primes(446)=(P=(43,226,40,16,216,31),M=(49,22559,20513,12168,1),M0I=23585,R2=(49,21473,2808,1759,0))
+    Primes(447)=(P=(57,111,7,250,174,119),M=(49,11895,4085,26044,1),M0I=29881,R2=(49,18988,25492,3791,1))
+    Primes(448)=(P=(46,89,64,111,153,189),M=(49,6589,223,14693,1),M0I=5739,R2=(49,25766,22597,10091,0))
+    Primes(449)=(P=(62,151,178,230,58,135),M=(49,14983,26060,31326,1),M0I=5321,R2=(49,28018,17558,29992,0))
+    Primes(450)=(P=(90,10,246,248,248,191),M=(50,30911,28145,26667,2),M0I=2241,R2=(50,7882,3688,20308,0))
+    Primes(451)=(P=(112,58,214,174,246,113),M=(50,30321,11613,16619,3),M0I=30063,R2=(50,6638,19435,21932,1))
+    Primes(452)=(P=(74,145,86,57,88,233),M=(50,22761,11378,10821,2),M0I=167,R2=(50,3926,293,9365,0))
+    Primes(453)=(P=(119,139,178,153,87,223),M=(50,22495,25906,24110,3),M0I=23521,R2=(50,20990,30892,9306,2))
+    Primes(454)=(P=(82,124,135,55,12,29),M=(50,3101,3694,18930,2),M0I=27083,R2=(50,22105,29984,4658,2))
+    Primes(455)=(P=(111,245,49,11,103,245),M=(50,26613,25110,16340,3),M0I=13219,R2=(50,13122,9614,17689,0))
+    Primes(456)=(P=(76,150,102,223,130,11),M=(50,523,19903,12889,2),M0I=1629,R2=(50,18889,11833,22061,0))
+    Primes(457)=(P=(106,31,215,171,226,147),M=(50,25235,12119,10367,3),M0I=29797,R2=(50,24740,26718,15110,1))
+    Primes(458)=(P=(79,152,79,75,77,121),M=(50,19833,7830,15969,2),M0I=29495,R2=(50,4992,28394,9396,0))
+    Primes(459)=(P=(84,80,207,48,180,233),M=(50,13545,7777,20803,2),M0I=7335,R2=(50,7096,17540,6339,1))
+    Primes(460)=(P=(138,44,250,58,100,191),M=(51,25791,29812,10419,4),M0I=29889,R2=(51,16875,17853,13639,0))
+    Primes(461)=(P=(139,253,236,255,168,75),M=(51,10315,23039,12279,4),M0I=7837,R2=(51,11859,4384,29202,3))
+    Primes(462)=(P=(186,103,107,38,254,195),M=(51,32451,22093,27037,5),M0I=24085,R2=(51,32756,13133,5532,0))
+    Primes(463)=(P=(205,222,133,51,97,175),M=(51,25007,2662,14202,6),M0I=27313,R2=(51,35,24069,21293,1))
+    Primes(464)=(P=(135,36,117,209,197,39),M=(51,17703,27555,7313,4),M0I=9577,R2=(51,13297,14573,19780,1))
+    Primes(465)=(P=(181,181,44,15,98,253),M=(51,25341,22558,22228,5),M0I=13739,R2=(51,29677,28647,4732,0))
+    Primes(466)=(P=(254,121,182,100,193,1),M=(51,16641,27849,31206,7),M0I=16639,R2=(51,3291,12422,8984,6))
+    Primes(467)=(P=(186,146,150,63,6,237),M=(51,1773,11390,27210,5),M0I=14619,R2=(51,15816,9872,6580,4))
+    Primes(468)=(P=(201,118,184,197,29,235),M=(51,7659,29066,9690,6),M0I=23869,R2=(51,11301,30644,22123,1))
+    Primes(469)=(P=(201,7,103,150,180,251),M=(51,13563,20269,9245,6),M0I=18893,R2=(51,7106,11722,32607,2))
+    Primes(470)=(P=(1,14,242,194,149,224,95),M=(52,24671,1323,15307,8),M0I=1121,R2=(52,16156,13696,17012,2))
+    Primes(471)=(P=(1,227,112,90,30,0,97),M=(52,97,13372,3521,15),M0I=23647,R2=(52,26401,31899,28580,12))
+    Primes(472)=(P=(1,227,176,215,140,119,101),M=(52,30565,12056,3779,15),M0I=7571,R2=(52,18385,13196,18606,14))
+    Primes(473)=(P=(1,32,203,109,148,142,137),M=(52,3721,23337,813,9),M0I=14407,R2=(52,31493,23136,6389,1))
+    Primes(474)=(P=(1,241,217,112,61,50,141),M=(52,12941,24698,18277,15),M0I=8123,R2=(52,23864,21920,14464,2))
+    Primes(475)=(P=(1,137,82,67,248,153,195),M=(52,6595,2033,9545,12),M0I=24853,R2=(52,2390,25051,13846,6))
+    Primes(476)=(P=(1,236,75,218,71,216,171),M=(52,22699,13455,12591,15),M0I=7677,R2=(52,2368,13717,14740,0))
+    Primes(477)=(P=(1,102,159,107,226,161,185),M=(52,8633,22469,6781,11),M0I=27511,R2=(52,31709,21584,18024,5))
+    Primes(478)=(P=(1,250,183,47,213,214,153),M=(52,22169,24491,27356,15),M0I=25175,R2=(52,16672,30408,25881,9))
+    Primes(479)=(P=(1,59,242,20,24,78,237),M=(52,20205,10288,28616,9),M0I=16667,R2=(52,11268,5279,305,8))
+    Primes(480)=(P=(2,52,157,103,232,50,185),M=(53,12985,20432,21109,17),M0I=19575,R2=(53,21412,7733,17268,12))
+    Primes(481)=(P=(3,40,31,21,238,110,155),M=(53,28315,11228,8316,25),M0I=14445,R2=(53,8987,28780,28984,0))
+    Primes(482)=(P=(2,21,146,229,147,201,101),M=(53,18789,19239,22091,16),M0I=16275,R2=(53,25025,32524,826,7))
+    Primes(483)=(P=(3,160,116,90,8,215,229),M=(53,22501,13329,465,29),M0I=29203,R2=(53,1271,5411,29735,27))
+    Primes(484)=(P=(2,1,214,182,105,37,171),M=(53,9643,27858,1882,16),M0I=21245,R2=(53,27196,11141,6414,8))
+    Primes(485)=(P=(2,121,192,98,56,51,19),M=(53,13075,17520,26369,19),M0I=28901,R2=(53,22354,20700,13835,13))
+    Primes(486)=(P=(2,128,116,192,165,91,69),M=(53,23365,330,467,20),M0I=115,R2=(53,15983,15731,3744,4))
+    Primes(487)=(P=(2,57,180,16,80,162,221),M=(53,8925,8353,26320,17),M0I=14987,R2=(53,15838,22945,32182,15))
+    Primes(488)=(P=(3,42,231,201,138,116,95),M=(53,29791,4884,11167,25),M0I=6241,R2=(53,15409,27944,32606,22))
+    Primes(489)=(P=(3,123,137,227,223,202,97),M=(53,19041,18367,28199,27),M0I=9823,R2=(53,3621,29092,11189,23))
+    Primes(490)=(P=(4,143,209,234,127,56,201),M=(54,14537,21758,16199,36),M0I=7815,R2=(54,25333,13053,27600,33))
+    Primes(491)=(P=(4,4,89,217,133,138,251),M=(54,2811,13067,4455,32),M0I=4045,R2=(54,31952,10880,6826,4))
+    Primes(492)=(P=(4,127,154,96,238,107,101),M=(54,27493,16860,32361,35),M0I=12691,R2=(54,1469,12837,7979,24))
+    Primes(493)=(P=(6,32,94,245,223,4,165),M=(54,1189,27582,379,49),M0I=15571,R2=(54,19891,12853,4838,13))
+    Primes(494)=(P=(7,225,162,165,58,166,149),M=(54,9877,19061,1674,63),M0I=2883,R2=(54,19546,29787,5202,47))
+    Primes(495)=(P=(5,100,56,253,105,35,147),M=(54,9107,31442,4323,43),M0I=3429,R2=(54,8251,27956,2004,26))
+    Primes(496)=(P=(4,190,112,245,113,195,159),M=(54,17311,27363,31171,37),M0I=26529,R2=(54,20952,1348,26697,23))
+    Primes(497)=(P=(5,118,47,144,125,36,63),M=(54,9279,8442,22718,43),M0I=13377,R2=(54,19960,14474,20028,16))
+    Primes(498)=(P=(4,101,4,84,214,99,111),M=(54,25455,10668,5137,35),M0I=9329,R2=(54,16179,9749,8001,1))
+    Primes(499)=(P=(5,218,75,250,185,111,75),M=(54,28491,30066,26927,46),M0I=23965,R2=(54,24613,30050,12620,26))
+    Primes(500)=(P=(9,124,103,2,6,251,197),M=(55,31685,1037,29084,75),M0I=13555,R2=(55,8692,7282,4952,44))
+    Primes(501)=(P=(15,128,118,163,249,153,45),M=(55,6445,18419,474,124),M0I=24923,R2=(55,2004,24777,28590,74))
+    Primes(502)=(P=(10,76,56,136,189,111,171),M=(55,28587,4474,12514,82),M0I=27901,R2=(55,7961,651,15602,5))
+    Primes(503)=(P=(9,53,27,147,172,51,103),M=(55,13159,10072,21614,73),M0I=18345,R2=(55,5031,25788,19324,43))
+    Primes(504)=(P=(11,212,169,242,19,177,41),M=(55,12585,25639,21159,94),M0I=1255,R2=(55,14025,515,10317,14))
+    Primes(505)=(P=(15,114,7,19,13,237,79),M=(55,27983,9755,18460,123),M0I=30289,R2=(55,27799,23122,17220,78))
+    Primes(506)=(P=(11,18,243,246,62,11,211),M=(55,3027,27772,19407,88),M0I=31653,R2=(55,8463,7254,4056,57))
+    Primes(507)=(P=(15,79,187,215,243,48,205),M=(55,12493,12262,16111,122),M0I=17403,R2=(55,25886,29997,6123,20))
+    Primes(508)=(P=(12,96,180,111,179,245,3),M=(55,29955,24423,721,99),M0I=25173,R2=(55,7251,25676,9646,45))
+    Primes(509)=(P=(11,57,191,185,69,7,33),M=(55,1825,29322,26366,89),M0I=17183,R2=(55,534,5466,2901,80))
+    Primes(510)=(P=(18,229,25,140,38,21,17),M=(56,5393,6220,5222,151),M0I=1039,R2=(56,26875,1087,25610,15))
+    Primes(511)=(P=(21,10,156,168,142,34,103),M=(56,8807,20764,10866,168),M0I=9897,R2=(56,23432,26450,12763,162))
+    Primes(512)=(P=(31,121,66,53,211,150,141),M=(56,5773,27559,25864,251),M0I=25531,R2=(56,30761,27617,10915,158))
+    Primes(513)=(P=(26,240,81,152,37,2,253),M=(56,765,12362,16710,215),M0I=21931,R2=(56,11160,28076,21604,181))
+    Primes(514)=(P=(30,68,173,40,74,70,231),M=(56,18151,20628,4788,242),M0I=4905,R2=(56,7718,20107,9095,19))
+    Primes(515)=(P=(16,149,126,128,158,167,197),M=(56,10181,317,22010,132),M0I=16627,R2=(56,29196,32211,16603,23))
+    Primes(516)=(P=(22,29,227,100,248,28,227),M=(56,7395,18928,30605,176),M0I=30517,R2=(56,6772,13791,30298,133))
+    Primes(517)=(P=(19,137,97,116,44,16,245),M=(56,4341,26712,9605,156),M0I=25763,R2=(56,4560,31342,17345,126))
+    Primes(518)=(P=(27,30,158,183,32,5,241),M=(56,1521,28224,31354,216),M0I=13551,R2=(56,20421,21149,12847,121))
+    Primes(519)=(P=(29,135,115,162,219,193,163),M=(56,16803,17847,7630,236),M0I=1525,R2=(56,15089,26554,30335,235))
+    Primes(520)=(P=(56,127,98,82,190,186,237),M=(57,15085,9597,32137,451),M0I=19739,R2=(57,28228,21428,7497,177))
+    Primes(521)=(P=(37,115,68,106,89,130,41),M=(57,553,21683,19729,299),M0I=17895,R2=(57,12267,20679,27935,280))
+    Primes(522)=(P=(50,179,81,25,1,1,75),M=(57,331,12802,19780,405),M0I=32669,R2=(57,28250,28854,24289,108))
+    Primes(523)=(P=(44,73,3,76,96,13,57),M=(57,3385,6336,9229,354),M0I=12023,R2=(57,18592,13695,4714,216))
+    Primes(524)=(P=(47,25,33,155,80,211,195),M=(57,21443,13985,25734,376),M0I=19221,R2=(57,5771,12331,4682,315))
+    Primes(525)=(P=(60,196,234,238,23,43,57),M=(57,11065,23598,5035,486),M0I=11511,R2=(57,5924,11028,14486,103))
+    Primes(526)=(P=(55,133,177,178,87,55,133),M=(57,14213,25774,5830,444),M0I=22195,R2=(57,13889,8200,5635,316))
+    Primes(527)=(P=(35,85,1,40,212,47,13),M=(57,12045,20904,21508,282),M0I=18491,R2=(57,28613,8337,12230,90))
+    Primes(528)=(P=(55,90,246,157,207,124,155),M=(57,31899,15262,27610,442),M0I=30317,R2=(57,7258,10716,30045,307))
+    Primes(529)=(P=(62,167,191,150,228,75,1),M=(57,19201,11720,7934,501),M0I=19199,R2=(57,30742,18110,28540,326))
+    Primes(530)=(P=(71,123,99,203,31,200,211),M=(58,18643,5695,28047,571),M0I=12453,R2=(58,24452,25329,3147,93))
+    Primes(531)=(P=(99,206,133,10,33,77,89),M=(58,19801,5186,14868,798),M0I=21783,R2=(58,8254,7500,26458,573))
+    Primes(532)=(P=(88,191,176,57,143,156,37),M=(58,7205,29471,32448,709),M0I=24659,R2=(58,26784,19586,15153,485))
+    Primes(533)=(P=(82,143,193,158,72,234,125),M=(58,27261,15505,16134,660),M0I=8491,R2=(58,10291,11591,12380,105))
+    Primes(534)=(P=(114,184,24,82,112,141,59),M=(58,3387,9441,24673,917),M0I=15373,R2=(58,18665,22785,1093,455))
+    Primes(535)=(P=(97,176,37,79,226,219,235),M=(58,23531,8133,16533,781),M0I=2877,R2=(58,25178,7145,8863,545))
+    Primes(536)=(P=(107,81,68,164,73,80,143),M=(58,20623,18578,17682,858),M0I=12689,R2=(58,3258,6973,31614,663))
+    Primes(537)=(P=(96,208,96,63,216,88,195),M=(58,22723,32688,16768,774),M0I=26645,R2=(58,19251,15037,647,298))
+    Primes(538)=(P=(86,50,32,57,63,151,225),M=(58,6113,29311,18560,689),M0I=5087,R2=(58,24347,10904,18954,663))
+    Primes(539)=(P=(118,60,10,121,112,117,121),M=(58,30073,29408,28713,945),M0I=6967,R2=(58,28677,29936,30211,118))
+    Primes(540)=(P=(203,124,139,226,124,93,13),M=(59,23821,17656,29231,1627),M0I=17979,R2=(59,28704,15639,10603,654))
+    Primes(541)=(P=(197,185,94,142,103,206,67),M=(59,20035,7375,25978,1581),M0I=4501,R2=(59,31943,12832,16252,602))
+    Primes(542)=(P=(182,189,178,181,146,41,77),M=(59,10573,27428,30410,1461),M0I=18555,R2=(59,19338,792,29583,910))
+    Primes(543)=(P=(203,109,132,193,20,13,241),M=(59,3569,552,13843,1627),M0I=15599,R2=(59,18267,1698,2146,1069))
+    Primes(544)=(P=(132,139,146,12,80,123,125),M=(59,31613,6304,11848,1060),M0I=27179,R2=(59,9156,13662,16725,614))
+    Primes(545)=(P=(226,74,13,45,160,21,137),M=(59,5513,23360,10292,1810),M0I=3911,R2=(59,20399,32176,3741,1029))
+    Primes(546)=(P=(150,252,182,157,129,247,25),M=(59,30489,15107,29402,1207),M0I=2775,R2=(59,31096,10273,16056,122))
+    Primes(547)=(P=(165,212,52,247,136,12,215),M=(59,3287,28432,20691,1326),M0I=22809,R2=(59,32348,10013,17452,996))
+    Primes(548)=(P=(234,228,92,77,63,246,39),M=(59,30247,6783,4465,1879),M0I=26217,R2=(59,32286,9157,21791,956))
+    Primes(549)=(P=(159,117,134,2,2,145,27),M=(59,4379,1029,22040,1275),M0I=7917,R2=(59,22393,10104,5445,486))
+    Primes(550)=(P=(1,38,102,105,174,219,239,9),M=(60,28425,23991,6566,2355,0),M0I=12487,R2=(60,23299,31381,26028,1268))
+    Primes(551)=(P=(1,253,138,48,149,27,219,229),M=(60,23525,10807,10434,4076,0),M0I=5651,R2=(60,3283,7552,21844,1825))
+    Primes(552)=(P=(1,76,139,80,111,118,188,125),M=(60,15485,24301,11585,2660,0),M0I=25387,R2=(60,11948,1049,20236,1902))
+    Primes(553)=(P=(1,30,108,214,20,132,110,121),M=(60,28281,10504,13144,2291,0),M0I=25655,R2=(60,9122,15816,26644,320))
+    Primes(554)=(P=(1,141,137,92,125,42,235,23),M=(60,27415,31317,9585,3180,0),M0I=857,R2=(60,16171,25188,8299,211))
+    Primes(555)=(P=(1,127,223,114,89,226,6,71),M=(60,1607,13252,32201,3070,0),M0I=15497,R2=(60,5482,21247,15502,838))
+    Primes(556)=(P=(1,196,248,115,206,86,124,121),M=(60,31865,7340,25039,3623,0),M0I=21047,R2=(60,9082,13754,20987,2314))
+    Primes(557)=(P=(1,69,29,87,176,86,162,133),M=(60,8837,24749,30046,2600,0),M0I=31155,R2=(60,30729,8572,2273,2319))
+    Primes(558)=(P=(1,171,22,211,90,235,75,141),M=(60,19341,13782,23373,3416,0),M0I=4283,R2=(60,18933,28723,30572,2374))
+    Primes(559)=(P=(1,103,228,152,126,21,186,25),M=(60,14873,31787,4705,2879,0),M0I=32215,R2=(60,16739,10704,7655,359))
+    Primes(560)=(P=(3,116,24,114,240,101,248,5),M=(61,30725,24779,25035,7072,0),M0I=27443,R2=(61,6426,12699,5068,4696))
+    Primes(561)=(P=(2,199,137,239,160,72,19,215),M=(61,5079,16528,10174,5692,0),M0I=28697,R2=(61,17611,32334,9095,4444))
+    Primes(562)=(P=(3,38,232,168,19,165,56,43),M=(61,14379,10058,8864,6455,0),M0I=14717,R2=(61,12281,12292,16418,816))
+    Primes(563)=(P=(3,211,195,239,187,71,44,57),M=(61,11321,30350,4030,7838,0),M0I=32247,R2=(61,26298,13365,8162,4182))
+    Primes(564)=(P=(3,76,146,11,72,220,233,143),M=(61,27023,4537,18477,6756,0),M0I=27281,R2=(61,15739,30438,32349,1800))
+    Primes(565)=(P=(2,128,169,209,64,231,95,159),M=(61,24479,462,10053,5125,0),M0I=929,R2=(61,15564,4569,8555,4029))
+    Primes(566)=(P=(2,241,195,249,67,133,148,67),M=(61,5187,1803,4069,6030,0),M0I=10133,R2=(61,20194,28786,6123,3625))
+    Primes(567)=(P=(3,134,19,61,80,227,69,45),M=(61,17709,8646,19701,7216,0),M0I=11611,R2=(61,8586,16188,19123,1676))
+    Primes(568)=(P=(3,200,246,216,111,155,66,25),M=(61,16921,24374,23393,7751,0),M0I=1495,R2=(61,1339,22626,27498,5546))
+    Primes(569)=(P=(2,151,192,28,189,72,244,75),M=(61,29771,31377,114,5310,0),M0I=19101,R2=(61,32722,5151,5179,803))
+    Primes(570)=(P=(5,177,122,31,126,222,43,55),M=(62,11063,32188,26749,11659,0),M0I=1401,R2=(62,6301,25524,4645,9709))
+    Primes(571)=(P=(4,146,249,94,140,252,22,27),M=(62,5659,6648,25978,9367,0),M0I=11245,R2=(62,282,23903,31760,9313))
+    Primes(572)=(P=(4,211,199,228,202,10,70,85),M=(62,18005,5140,8083,9886,0),M0I=30979,R2=(62,27546,13538,5255,9695))
+    Primes(573)=(P=(4,83,163,41,194,30,69,63),M=(62,17727,1084,3239,8861,0),M0I=21825,R2=(62,32496,14565,7067,1818))
+    Primes(574)=(P=(7,136,22,85,91,157,207,191),M=(62,20415,14139,22869,15424,0),M0I=24513,R2=(62,18320,19180,31297,12763))
+    Primes(575)=(P=(5,134,29,40,141,20,21,97),M=(62,5473,6696,29858,11312,0),M0I=12639,R2=(62,31810,30469,11722,1679))
+    Primes(576)=(P=(7,18,88,72,253,99,55,21),M=(62,14101,31430,24867,14482,0),M0I=8131,R2=(62,30691,14761,14649,9460))
+    Primes(577)=(P=(4,177,148,9,232,212,22,25),M=(62,5657,20904,20519,9612,0),M0I=6615,R2=(62,25331,29309,5183,3481))
+    Primes(578)=(P=(6,61,10,62,114,67,27,71),M=(62,6983,25734,10489,12776,0),M0I=24969,R2=(62,31098,27462,10653,2130))
+    Primes(579)=(P=(4,236,205,240,25,128,122,71),M=(62,31303,13056,14272,10086,0),M0I=28809,R2=(62,23446,480,1269,6813))
+    Primes(580)=(P=(13,52,62,74,207,151,239,73),M=(63,28489,7983,31019,27041,0),M0I=19719,R2=(63,18376,21786,11549,15817))
+    Primes(581)=(P=(9,224,33,159,133,226,144,165),M=(63,4261,3013,1662,20225,0),M0I=10451,R2=(63,14754,19677,27465,15420))
+    Primes(582)=(P=(10,54,61,132,182,97,36,69),M=(63,9285,27842,30226,20913,0),M0I=12659,R2=(63,14927,18299,6778,1271))
+    Primes(583)=(P=(14,24,67,154,22,149,132,7),M=(63,1031,11563,3688,28866,0),M0I=22089,R2=(63,10336,19660,23356,7588))
+    Primes(584)=(P=(9,252,94,205,43,29,162,185),M=(63,8889,22075,31540,20450,0),M0I=15479,R2=(63,21392,27540,5487,1779))
+    Primes(585)=(P=(12,239,115,140,1,152,97,227),M=(63,25059,816,20016,26491,0),M0I=5173,R2=(63,13819,13070,768,9855))
+    Primes(586)=(P=(11,206,84,33,75,27,148,53),M=(63,5173,5687,20613,24178,0),M0I=25059,R2=(63,31565,3498,2737,4784))
+    Primes(587)=(P=(10,215,78,94,73,37,198,139),M=(63,18059,4683,14713,22202,0),M0I=3805,R2=(63,9906,21643,32612,17032))
+    Primes(588)=(P=(9,198,105,242,186,189,185,139),M=(63,14731,30075,10186,20019,0),M0I=23005,R2=(63,16901,26122,5757,13199))
+    Primes(589)=(P=(15,156,19,69,198,89,109,49),M=(63,27953,3250,19735,31968,0),M0I=13359,R2=(63,17006,520,8697,22619))
+    Primes(590)=(P=(27,60,104,11,9,169,197,105),M=(65,17769,4947,8236,23011,1),M0I=25895,R2=(65,28282,11404,16092,3997,1))
+    Primes(591)=(P=(24,104,235,198,182,246,165,113),M=(65,9585,28141,12058,17223,1),M0I=1135,R2=(65,14855,32646,12091,4921,1))
+    Primes(592)=(P=(19,50,14,86,165,77,195,37),M=(65,17189,19099,14682,6544,1),M0I=24403,R2=(65,13483,19113,18806,32515,0))
+    Primes(593)=(P=(19,221,192,80,20,245,99,107),M=(65,25451,10730,320,7918,1),M0I=20157,R2=(65,9309,8016,17828,21015,0))
+    Primes(594)=(P=(17,34,189,53,13,171,7,123),M=(65,1915,6998,29908,2325,1),M0I=16461,R2=(65,9949,2683,11439,3126,0))
+    Primes(595)=(P=(27,104,194,164,174,118,86,19),M=(65,22035,23788,2706,23366,1),M0I=7141,R2=(65,24172,13776,30864,4516,1))
+    Primes(596)=(P=(17,215,53,112,144,153,12,31),M=(65,3103,8498,21954,3769,1),M0I=4129,R2=(65,8693,29339,15786,32382,0))
+    Primes(597)=(P=(19,51,54,188,47,100,18,65),M=(65,4673,24264,23280,6553,1),M0I=575,R2=(65,211,31956,8957,1098,1))
+    Primes(598)=(P=(31,75,88,45,182,66,52,215),M=(65,13527,27780,24758,31322,1),M0I=281,R2=(65,18404,23224,14890,15635,0))
+    Primes(599)=(P=(20,125,180,151,226,187,105,49),M=(65,26929,17782,21087,9197,1),M0I=12335,R2=(65,23208,29656,14735,11037,0))
+    Primes(600)=(P=(49,9,236,4,228,1,3,77),M=(66,845,18434,12307,2127,3),M0I=4731,R2=(66,7666,2797,27739,24719,2))
+    Primes(601)=(P=(51,197,208,84,137,180,59,1),M=(66,15105,4968,16722,7726,3),M0I=15103,R2=(66,30620,7010,19937,12670,0))
+    Primes(602)=(P=(51,216,227,224,88,255,18,147),M=(66,4755,12798,3969,7879,3),M0I=9317,R2=(66,172,17370,10476,2119,1))
+    Primes(603)=(P=(63,6,115,78,189,226,193,37),M=(66,16677,31685,19770,30771,3),M0I=3411,R2=(66,19960,14740,26397,27945,0))
+    Primes(604)=(P=(44,177,147,180,51,163,240,149),M=(66,28821,26439,20176,25996,2),M0I=9539,R2=(66,22846,26775,11443,6135,2))
+    Primes(605)=(P=(32,48,250,166,51,3,174,85),M=(66,11861,26119,27288,391,2),M0I=8451,R2=(66,6668,2506,17016,22553,0))
+    Primes(606)=(P=(34,209,147,119,233,128,13,19),M=(66,3347,21248,19935,5772,2),M0I=15077,R2=(66,21566,5565,23755,27615,0))
+    Primes(607)=(P=(57,66,130,50,249,68,246,143),M=(66,30351,29321,2251,18964,3),M0I=6033,R2=(66,14422,25381,10345,5621,1))
+    Primes(608)=(P=(41,196,125,42,101,105,142,239),M=(66,3823,19155,29865,20003,2),M0I=8177,R2=(66,6898,32259,19317,10667,0))
+    Primes(609)=(P=(36,180,40,139,136,252,224,107),M=(66,24683,4601,8750,9633,2),M0I=13245,R2=(66,21422,7899,26935,10569,0))
+    Primes(610)=(P=(112,103,48,187,17,71,65,161),M=(67,16801,8846,17132,825,7),M0I=7583,R2=(67,19469,18437,18812,7720,2))
+    Primes(611)=(P=(95,230,201,15,247,177,206,141),M=(67,20109,28515,9279,32566,5),M0I=23483,R2=(67,111,17869,26255,22904,1))
+    Primes(612)=(P=(117,47,110,38,144,251,167,189),M=(67,10173,8695,14490,10619,7),M0I=13419,R2=(67,31658,29432,23550,17232,2))
+    Primes(613)=(P=(72,76,68,144,133,70,37,23),M=(67,9495,2700,4674,16994,4),M0I=7513,R2=(67,15611,25807,3331,18610,1))
+    Primes(614)=(P=(105,122,177,115,143,217,210,17),M=(67,21009,8115,17870,19413,6),M0I=8463,R2=(67,24689,29425,19912,5393,3))
+    Primes(615)=(P=(89,255,86,67,253,226,155,163),M=(67,7075,31685,22799,20474,5),M0I=4085,R2=(67,13731,28872,9739,21059,3))
+    Primes(616)=(P=(120,165,183,82,152,74,23,55),M=(67,5943,12436,23882,17709,7),M0I=12665,R2=(67,14920,27233,18237,655,3))
+    Primes(617)=(P=(69,52,187,74,164,162,174,29),M=(67,11805,18757,27946,10661,4),M0I=31691,R2=(67,2617,5541,18158,1129,4))
+    Primes(618)=(P=(64,24,112,96,21,105,74,171),M=(67,19115,10962,16768,195,4),M0I=8189,R2=(67,31004,20801,28632,9702,1))
+    Primes(619)=(P=(71,145,11,186,14,154,66,141),M=(67,17037,7476,12008,15496,4),M0I=12219,R2=(67,28001,8005,32005,22224,1))
+    Primes(620)=(P=(147,195,39,89,166,188,162,107),M=(68,8811,19833,7526,7705,9),M0I=1469,R2=(68,26630,32260,4604,31325,4))
+    Primes(621)=(P=(129,73,209,78,83,11,195,61),M=(68,17213,9751,17721,2638,8),M0I=21483,R2=(68,13442,19221,32434,4274,5))
+    Primes(622)=(P=(143,59,228,225,75,168,106,173),M=(68,27309,5968,4997,31199,8),M0I=30427,R2=(68,28323,17365,24226,11262,5))
+    Primes(623)=(P=(168,84,208,150,249,37,4,193),M=(68,1217,29258,16987,17062,10),M0I=29887,R2=(68,5692,25247,9781,14348,6))
+    Primes(624)=(P=(140,126,76,219,175,140,192,53),M=(68,16437,24345,13166,25586,8),M0I=28131,R2=(68,8132,19519,780,3745,0))
+    Primes(625)=(P=(225,169,179,196,235,39,130,251),M=(68,763,22095,20243,3405,14),M0I=18381,R2=(68,18756,24698,4618,15005,6))
+    Primes(626)=(P=(171,211,29,135,255,1,152,25),M=(68,6169,32259,30239,24216,10),M0I=15319,R2=(68,17185,29537,26592,28172,7))
+    Primes(627)=(P=(184,58,201,227,3,108,28,233),M=(68,7401,1752,10124,16854,11),M0I=1191,R2=(68,24743,7063,1355,8668,11))
+    Primes(628)=(P=(174,58,41,241,3,46,130,85),M=(68,597,1629,10180,29137,10),M0I=5379,R2=(68,17924,15718,26964,9575,4))
+    Primes(629)=(P=(137,109,127,58,250,68,207,165),M=(68,20389,29833,31979,19307,8),M0I=32723,R2=(68,15568,7298,10490,9607,2))
+    Primes(630)=(P=(1,182,146,196,128,107,84,28,251),M=(69,7419,22184,4609,13462,27),M0I=29133,R2=(69,16097,22839,259,28003,5))
+    Primes(631)=(P=(1,192,171,71,166,235,167,166,155),M=(69,9883,22351,7835,1370,28),M0I=12397,R2=(69,32708,5028,8921,13262,11))
+    Primes(632)=(P=(1,167,75,47,111,133,19,41,115),M=(69,10611,2598,15806,14937,26),M0I=23621,R2=(69,9546,903,16755,12361,3))
+    Primes(633)=(P=(1,181,159,85,252,5,194,55,179),M=(69,14259,2948,22512,11514,27),M0I=12421,R2=(69,8579,25052,6957,26067,3))
+    Primes(634)=(P=(1,249,246,58,0,38,146,240,191),M=(69,28863,19749,26624,20401,31),M0I=193,R2=(69,13136,24013,17155,12872,16))
+    Primes(635)=(P=(1,238,206,2,85,199,206,39,111),M=(69,10095,3996,2391,30320,30),M0I=26737,R2=(69,15034,31073,23169,14697,26))
+    Primes(636)=(P=(1,22,187,57,141,36,236,60,63),M=(69,15423,18904,26164,13785,17),M0I=19521,R2=(69,5512,17012,24269,14492,13))
+    Primes(637)=(P=(1,212,51,229,237,51,62,4,27),M=(69,1051,26236,6068,8607,29),M0I=18925,R2=(69,15920,12802,17649,30789,22))
+    Primes(638)=(P=(1,1,254,202,131,53,253,212,167),M=(69,21671,27643,10764,4086,16),M0I=27881,R2=(69,3338,4720,14999,29364,9))
+    Primes(639)=(P=(1,222,105,17,84,96,217,244,233),M=(69,29929,16819,17745,29512,29),M0I=23719,R2=(69,28379,20352,24361,5295,14))
+    Primes(640)=(P=(3,112,163,156,243,111,153,107,111),M=(70,27503,24370,29645,1308,55),M0I=11377,R2=(70,27820,14130,1697,19288,42))
+    Primes(641)=(P=(3,8,168,115,239,205,8,195,243),M=(70,17395,6673,20415,17731,48),M0I=29381,R2=(70,25092,10202,22908,29466,17))
+    Primes(642)=(P=(3,236,225,241,57,103,17,52,175),M=(70,13487,20002,17637,26383,62),M0I=23985,R2=(70,7128,32146,16547,26511,30))
+    Primes(643)=(P=(3,115,240,202,64,109,1,179,219),M=(70,13275,23043,10497,8070,55),M0I=28589,R2=(70,29649,11037,30420,21137,29))
+    Primes(644)=(P=(3,211,120,88,174,56,37,28,5),M=(70,7173,28746,25272,7106,61),M0I=12083,R2=(70,14773,29529,14478,20669,57))
+    Primes(645)=(P=(3,43,92,244,239,190,2,203,201),M=(70,19401,31749,21438,23271,50),M0I=16775,R2=(70,15788,28800,11429,11270,21))
+    Primes(646)=(P=(3,212,255,10,125,189,40,219,121),M=(70,23417,31313,10742,10232,61),M0I=24887,R2=(70,22677,19715,14853,23880,41))
+    Primes(647)=(P=(2,152,57,173,0,68,128,163,111),M=(70,9071,2305,13313,16845,41),M0I=25713,R2=(70,9185,5653,25878,32387,33))
+    Primes(648)=(P=(3,217,66,81,133,59,50,21,61),M=(70,5437,30308,17940,18962,61),M0I=5611,R2=(70,31836,23118,16749,23808,12))
+    Primes(649)=(P=(2,5,125,131,209,182,81,207,89),M=(70,20313,27811,3910,11244,32),M0I=30487,R2=(70,6019,24999,18439,6216,6))
+    Primes(650)=(P=(4,198,78,238,92,5,82,16,165),M=(71,4261,2724,14704,12919,76),M0I=10451,R2=(71,18707,17260,31410,9969,5))
+    Primes(651)=(P=(4,111,201,107,17,151,127,240,15),M=(71,28687,12031,11334,32331,70),M0I=273,R2=(71,26384,9594,21738,21520,7))
+    Primes(652)=(P=(5,118,1,108,51,67,150,44,183),M=(71,11447,1836,12493,12299,87),M0I=3833,R2=(71,8518,4950,30361,31526,5))
+    Primes(653)=(P=(6,85,160,69,31,138,160,230,7),M=(71,26119,5441,5246,11522,101),M0I=22601,R2=(71,3683,3108,5751,9022,93))
+    Primes(654)=(P=(4,139,135,45,149,148,120,94,5),M=(71,24069,10480,13910,23609,72),M0I=16691,R2=(71,3150,19554,473,12072,13))
+    Primes(655)=(P=(4,170,113,124,71,75,186,229,145),M=(71,26001,6005,28957,21387,74),M0I=1167,R2=(71,10350,8036,9678,3198,48))
+    Primes(656)=(P=(7,21,65,184,89,180,143,115,59),M=(71,29499,26910,24934,10765,113),M0I=4621,R2=(71,7981,22616,16451,16188,15))
+    Primes(657)=(P=(6,190,104,119,150,97,147,63,97),M=(71,16225,17190,24153,29507,107),M0I=23391,R2=(71,16622,27205,22782,3997,29))
+    Primes(658)=(P=(4,28,181,143,48,233,3,206,221),M=(71,20189,20999,15555,26028,65),M0I=1675,R2=(71,20612,27421,5189,13259,23))
+    Primes(659)=(P=(7,174,112,1,226,192,204,185,83),M=(71,14675,409,1931,29568,122),M0I=3365,R2=(71,1728,26798,6655,11865,57))
+    Primes(660)=(P=(14,26,179,254,166,138,254,123,75),M=(72,31563,5628,31386,21919,225),M0I=18845,R2=(72,24896,9573,25517,16473,180))
+    Primes(661)=(P=(10,60,148,78,243,241,166,131,187),M=(72,955,25421,15311,25762,163),M0I=13965,R2=(72,22369,21339,6673,15117,32))
+    Primes(662)=(P=(8,112,91,24,144,222,247,241,209),M=(72,29137,15855,25155,728,135),M0I=30927,R2=(72,20849,15797,613,10404,45))
+    Primes(663)=(P=(14,82,57,138,161,225,86,161,19),M=(72,8467,17069,10887,4556,229),M0I=12005,R2=(72,18408,28988,29353,11411,36))
+    Primes(664)=(P=(11,242,190,28,53,175,67,76,147),M=(72,19603,24198,28886,5616,191),M0I=20069,R2=(72,20576,15269,12518,10096,119))
+    Primes(665)=(P=(11,186,96,235,43,83,46,203,89),M=(72,19289,9821,11437,21255,187),M0I=13079,R2=(72,2008,17565,4116,595,98))
+    Primes(666)=(P=(14,112,249,167,42,126,254,130,185),M=(72,697,32253,7337,1997,231),M0I=7287,R2=(72,17318,6788,4530,27007,176))
+    Primes(667)=(P=(14,240,38,212,88,45,21,70,123),M=(72,18043,23082,20832,310,239),M0I=22349,R2=(72,17506,26028,26020,3542,55))
+    Primes(668)=(P=(11,15,166,195,63,238,214,241,79),M=(72,29007,23981,3327,32054,176),M0I=31313,R2=(72,22632,17580,26645,9771,64))
+    Primes(669)=(P=(10,163,147,240,161,56,142,182,197),M=(72,14021,28957,17028,7327,170),M0I=10227,R2=(72,30994,11762,6952,11726,50))
+    Primes(670)=(P=(29,33,102,181,126,85,138,139,131),M=(73,2947,11029,22009,2869,466),M0I=9429,R2=(73,22360,5565,20772,5047,233))
+    Primes(671)=(P=(24,206,11,90,152,81,253,75,51),M=(73,19251,9210,27233,28762,396),M0I=22533,R2=(73,26094,2916,10039,14677,210))
+    Primes(672)=(P=(20,171,233,95,125,21,159,88,235),M=(73,22763,11070,32244,24394,330),M0I=28733,R2=(73,14188,24603,3384,7227,80))
+    Primes(673)=(P=(29,244,33,207,108,79,1,78,87),M=(73,20055,7682,15793,8462,479),M0I=665,R2=(73,23308,18443,30589,12814,348))
+    Primes(674)=(P=(20,255,23,219,50,128,123,118,125),M=(73,30333,246,27850,30910,335),M0I=19755,R2=(73,28724,5979,31646,32722,78))
+    Primes(675)=(P=(21,178,72,81,99,216,119,108,13),M=(73,27661,12526,17807,4674,347),M0I=15675,R2=(73,18835,9260,24653,29555,92))
+    Primes(676)=(P=(28,5,234,12,49,23,50,145,47),M=(73,4399,11877,12484,12112,448),M0I=10801,R2=(73,27174,22568,32124,11411,153))
+    Primes(677)=(P=(24,137,212,164,86,201,163,66,133),M=(73,17029,4934,4443,20133,392),M0I=6579,R2=(73,14245,12664,18756,19137,167))
+    Primes(678)=(P=(17,242,125,83,91,43,77,13,51),M=(73,3379,22170,19820,5098,287),M0I=18949,R2=(73,26060,7876,30682,6936,27))
+    Primes(679)=(P=(17,217,87,33,67,169,19,39,131),M=(73,10115,21030,1294,19129,285),M0I=24789,R2=(73,5861,147,20566,8342,142))
+    Primes(680)=(P=(60,101,55,189,183,81,64,62,37),M=(74,15909,8832,30429,10685,966),M0I=21075,R2=(74,11727,29404,816,29356,381))
+    Primes(681)=(P=(59,179,184,227,190,249,249,244,61),M=(74,29757,29683,3835,7623,955),M0I=15595,R2=(74,7869,1245,3991,22335,779))
+    Primes(682)=(P=(47,95,178,25,12,232,157,236,211),M=(74,27859,20795,25651,32144,757),M0I=13477,R2=(74,828,1284,11511,14710,638))
+    Primes(683)=(P=(56,109,8,90,25,215,55,228,203),M=(74,25803,11887,26727,26690,902),M0I=7965,R2=(74,29175,22649,1686,6786,674))
+    Primes(684)=(P=(50,48,83,203,46,32,123,174,169),M=(74,11945,16631,11448,670,803),M0I=10855,R2=(74,14887,24313,20081,14194,147))
+    Primes(685)=(P=(32,22,47,27,112,176,249,24,149),M=(74,6293,25074,28098,12664,513),M0I=3395,R2=(74,27178,12003,15582,18329,394))
+    Primes(686)=(P=(43,147,194,88,238,242,23,77,35),M=(74,19747,25646,25531,7698,697),M0I=13685,R2=(74,15119,25003,20471,852,336))
+    Primes(687)=(P=(52,162,64,252,15,239,149,134,239),M=(74,1775,24363,28735,4615,842),M0I=6129,R2=(74,32037,23538,4281,1732,443))
+    Primes(688)=(P=(55,182,149,253,49,103,154,68,51),M=(74,17459,20276,29893,13487,891),M0I=10501,R2=(74,2296,26547,30751,15565,13))
+    Primes(689)=(P=(60,216,60,203,176,73,22,65,153),M=(74,16793,4652,11969,16870,973),M0I=32087,R2=(74,26230,15210,7935,6596,361))
+    Primes(690)=(P=(83,212,36,213,13,220,8,94,89),M=(75,24153,14352,21559,8486,1341),M0I=30231,R2=(75,8607,30007,6356,7312,960))
+    Primes(691)=(P=(72,208,10,135,66,132,249,98,157),M=(75,25245,2546,7434,84,1165),M0I=19531,R2=(75,25643,11847,10929,24731,1103))
+    Primes(692)=(P=(92,102,70,125,97,97,115,189,185),M=(75,15801,17127,30085,12851,1478),M0I=18295,R2=(75,1106,2864,596,26206,546))
+    Primes(693)=(P=(82,134,217,33,87,203,235,207,55),M=(75,20279,6103,1375,14025,1320),M0I=27001,R2=(75,29217,29187,11876,17155,602))
+    Primes(694)=(P=(102,153,62,73,249,237,208,163,131),M=(75,9091,23457,10215,18930,1641),M0I=31957,R2=(75,19299,27446,1543,5952,186))
+    Primes(695)=(P=(75,186,29,65,16,197,37,122,129),M=(75,31361,2634,1091,20714,1211),M0I=14975,R2=(75,180,30494,7619,13965,187))
+    Primes(696)=(P=(125,254,253,208,20,128,90,228,171),M=(75,25771,181,16466,30702,2015),M0I=2557,R2=(75,902,27989,27891,18533,796))
+    Primes(697)=(P=(79,68,131,124,22,25,76,229,39),M=(75,25895,12953,28760,9243,1268),M0I=17769,R2=(75,30403,4517,15664,9055,706))
+    Primes(698)=(P=(97,213,246,13,58,48,2,238,101),M=(75,28261,24581,13544,12208,1565),M0I=27795,R2=(75,4330,2941,19854,1851,158))
+    Primes(699)=(P=(73,64,52,174,74,47,254,22,159),M=(75,5791,24572,14632,421,1172),M0I=31393,R2=(75,842,31420,7069,6507,956))
+    Primes(700)=(P=(177,126,115,225,45,205,182,227,191),M=(76,25535,7021,1207,29599,2839),M0I=29633,R2=(76,25008,13639,22114,10565,1755))
+    Primes(701)=(P=(219,234,41,31,206,120,215,126,195),M=(76,32451,29102,32569,20808,3518),M0I=24085,R2=(76,24060,3564,21645,28651,3177))
+    Primes(702)=(P=(244,90,45,245,207,195,251,91,49),M=(76,23345,2038,22335,20847,3909),M0I=25135,R2=(76,1020,23900,23583,17227,3560))
+    Primes(703)=(P=(230,219,102,227,247,219,31,203,89),M=(76,19289,13887,4063,23351,3693),M0I=13079,R2=(76,22414,6285,21560,10095,1798))
+    Primes(704)=(P=(187,185,240,93,69,209,21,230,45),M=(76,26157,8747,29975,20354,3003),M0I=9819,R2=(76,17873,21748,31725,22060,2653))
+    Primes(705)=(P=(133,45,114,36,167,164,128,218,79),M=(76,23119,18689,4766,27537,2130),M0I=849,R2=(76,20279,5148,8184,11172,890))
+    Primes(706)=(P=(221,4,74,56,205,21,198,245,69),M=(76,30021,11149,25396,8785,3536),M0I=10867,R2=(76,19074,18106,27079,11708,2924))
+    Primes(707)=(P=(238,95,168,173,86,189,146,249,163),M=(76,31139,31525,13658,32069,3813),M0I=32245,R2=(76,130,11581,28692,23814,2733))
+    Primes(708)=(P=(158,166,105,120,125,230,188,30,65),M=(76,7745,19832,25079,13131,2538),M0I=3647,R2=(76,10618,8991,7164,23522,2437))
+    Primes(709)=(P=(169,148,247,73,100,209,194,190,141),M=(76,16013,9093,9619,10170,2713),M0I=19387,R2=(76,5832,25628,11158,10536,1814))
+    Primes(710)=(P=(1,52,90,33,140,44,188,4,160,49),M=(77,8241,30729,12466,20748,4933,0),M0I=18223,R2=(77,24289,1592,10687,15107,912))
+    Primes(711)=(P=(1,123,189,54,133,5,7,49,52,51),M=(77,13363,3682,5140,27060,6075,0),M0I=6405,R2=(77,2216,26645,16273,3573,5798))
+    Primes(712)=(P=(1,88,114,16,131,146,53,148,29,17),M=(77,7441,27432,3656,4228,5511,0),M0I=3087,R2=(77,9042,32325,26418,13233,2166))
+    Primes(713)=(P=(1,146,101,38,207,66,188,124,249,33),M=(77,31009,30969,15626,10550,6438,0),M0I=13599,R2=(77,2942,31617,2753,16244,3757))
+    Primes(714)=(P=(1,238,212,138,23,67,50,127,120,31),M=(77,30751,25854,23820,9296,7917,0),M0I=31777,R2=(77,16879,10776,9305,27778,148))
+    Primes(715)=(P=(1,230,195,100,21,103,191,62,227,21),M=(77,25365,32381,21918,6944,7788,0),M0I=11203,R2=(77,15017,28023,23080,17149,6075))
+    Primes(716)=(P=(1,172,29,218,82,245,178,191,59,243),M=(77,15347,25982,19414,28370,6849,0),M0I=10949,R2=(77,30868,9106,25095,12338,1013))
+    Primes(717)=(P=(1,196,233,96,69,0,123,88,168,57),M=(77,10297,30385,5121,19202,7246,0),M0I=14839,R2=(77,19890,4803,27625,13416,591))
+    Primes(718)=(P=(1,82,168,106,81,190,247,174,61,167),M=(77,15783,28508,18171,17234,5418,0),M0I=26089,R2=(77,25505,16590,23660,30187,185))
+    Primes(719)=(P=(1,152,13,217,249,90,128,218,152,167),M=(77,6311,437,25962,28367,6528,0),M0I=28905,R2=(77,9455,6348,3758,15090,5305))
+    Primes(720)=(P=(3,116,161,154,137,175,33,36,55,119),M=(78,14199,16968,9916,3284,14154,0),M0I=11705,R2=(78,20523,22131,26826,18729,3052))
+    Primes(721)=(P=(2,183,162,114,195,120,184,87,46,81),M=(78,11857,28846,3554,5014,11130,0),M0I=9551,R2=(78,24946,14422,19526,14770,1056))
+    Primes(722)=(P=(3,27,222,112,70,40,130,68,112,37),M=(78,28709,1160,6306,29570,12733,0),M0I=21587,R2=(78,4331,432,7129,23070,9833))
+    Primes(723)=(P=(2,78,197,200,25,105,41,33,89,93),M=(78,22877,21058,26020,11840,9452,0),M0I=15627,R2=(78,5431,16895,2275,7990,2737))
+    Primes(724)=(P=(3,92,74,77,1,191,105,48,113,99),M=(78,29027,21088,1789,21096,13764,0),M0I=26549,R2=(78,19595,30231,3506,4633,3457))
+    Primes(725)=(P=(2,140,24,182,148,147,142,31,213,109),M=(78,21869,7231,21070,17844,10433,0),M0I=923,R2=(78,5137,17633,382,8868,7389))
+    Primes(726)=(P=(2,221,125,232,60,168,25,55,213,163),M=(78,21923,12911,29344,28481,11735,0),M0I=31221,R2=(78,17139,28713,18389,3087,1259))
+    Primes(727)=(P=(2,71,243,190,178,230,69,222,61,1),M=(78,15617,3004,19353,7669,9343,0),M0I=15615,R2=(78,12350,23138,25136,7447,4867))
+    Primes(728)=(P=(2,179,130,170,140,160,44,246,56,179),M=(78,14515,23020,12928,5460,11064,0),M0I=18821,R2=(78,23362,18672,31488,9166,9948))
+    Primes(729)=(P=(2,187,34,245,152,134,129,39,18,247),M=(78,4855,590,25114,6060,11186,0),M0I=12601,R2=(78,30963,10616,1797,4834,2929))
+    Primes(730)=(P=(4,205,46,253,247,152,24,192,171,139),M=(79,11147,12673,24160,30703,19666,0),M0I=23517,R2=(79,13351,28068,16555,19183,8393))
+    Primes(731)=(P=(4,225,102,164,69,51,148,221,255,103),M=(79,32615,10683,5326,13602,19990,0),M0I=21417,R2=(79,10389,13146,970,15808,15974))
+    Primes(732)=(P=(6,57,25,101,78,228,128,210,203,207),M=(79,19407,421,15250,19242,25489,0),M0I=9425,R2=(79,7801,25748,8944,13490,1340))
+    Primes(733)=(P=(4,229,62,25,242,223,244,41,38,139),M=(79,9867,26706,19327,28879,20051,0),M0I=28381,R2=(79,32648,13647,28667,28818,9903))
+    Primes(734)=(P=(7,87,215,226,12,17,67,234,206,43),M=(79,20011,2005,12357,16144,30077,0),M0I=32637,R2=(79,2052,3420,684,12192,17313))
+    Primes(735)=(P=(5,3,211,66,233,95,85,212,237,79),M=(79,27983,11177,9597,6679,20541,0),M0I=30289,R2=(79,2093,22470,28312,21935,14186))
+    Primes(736)=(P=(4,140,137,79,218,238,247,134,209,27),M=(79,20763,28429,27579,19070,18632,0),M0I=24301,R2=(79,16529,15251,29379,5765,780))
+    Primes(737)=(P=(6,55,209,212,103,245,36,10,99,97),M=(79,25441,18452,8148,3747,25469,0),M0I=32607,R2=(79,19025,6852,13806,15483,18501))
+    Primes(738)=(P=(7,99,48,62,206,158,187,221,133,113),M=(79,1393,30651,14970,502,30259,0),M0I=25711,R2=(79,27379,31851,10416,21732,12801))
+    Primes(739)=(P=(7,200,233,87,144,248,106,67,39,11),M=(79,9995,21638,17377,19132,31886,0),M0I=4957,R2=(79,5398,6472,8372,26613,18828))
+    Primes(740)=(P=(10,138,119,192,52,109,36,210,57,249),M=(81,14841,18852,20916,15873,10407,1),M0I=18359,R2=(81,22393,12327,16977,5317,15901,0))
+    Primes(741)=(P=(12,247,82,2,78,12,128,73,241,131),M=(81,29059,147,14386,4114,20341,1),M0I=23253,R2=(81,15761,31402,5420,25160,4582,1))
+    Primes(742)=(P=(8,179,12,126,186,59,159,154,124,15),M=(81,31759,16180,26862,25589,2864,1),M0I=3345,R2=(81,6976,854,28514,8990,10246,0))
+    Primes(743)=(P=(13,72,58,7,87,183,42,10,240,109),M=(81,28781,21525,24284,20538,21635,1),M0I=26267,R2=(81,16893,10118,16879,24038,6756,0))
+    Primes(744)=(P=(8,222,187,213,252,135,249,175,119,7),M=(81,30471,29534,29215,24239,3563,1),M0I=14665,R2=(81,28104,11191,23365,25952,5535,0))
+    Primes(745)=(P=(13,108,226,235,205,58,81,252,193,115),M=(81,16755,9209,13545,5982,22222,1),M0I=13381,R2=(81,24445,26918,5564,21025,4294,0))
+    Primes(746)=(P=(9,93,129,253,103,122,159,226,113,171),M=(81,29099,16324,7658,4075,5592,1),M0I=32509,R2=(81,5375,27428,4011,27340,12764,0))
+    Primes(747)=(P=(12,47,227,22,170,206,161,155,167,169),M=(81,10153,17207,11066,6325,17150,1),M0I=4967,R2=(81,27984,26793,2258,17018,21833,0))
+    Primes(748)=(P=(8,14,100,103,152,206,4,77,129,189),M=(81,445,2203,25400,9020,230,1),M0I=15979,R2=(81,9461,15316,4782,29726,29249,0))
+    Primes(749)=(P=(15,252,245,129,59,65,143,186,70,253),M=(81,18173,8052,27910,11273,32719,1),M0I=31147,R2=(81,7030,18128,24785,8284,29751,1))
+    Primes(750)=(P=(24,69,60,243,229,40,226,158,171,233),M=(82,11241,17725,5283,26527,1107,3),M0I=9127,R2=(82,22515,2412,1361,11665,3084,1))
+    Primes(751)=(P=(22,120,246,83,202,171,167,209,17,61),M=(82,4413,20386,10926,12958,26511,2),M0I=12779,R2=(82,16522,320,22993,8176,24720,2))
+    Primes(752)=(P=(28,149,11,94,108,147,18,150,74,17),M=(82,18961,9516,12876,23283,18768,3),M0I=6415,R2=(82,7905,4276,5948,7556,21260,0))
+    Primes(753)=(P=(16,195,116,32,127,73,88,0,59,75),M=(82,15179,12288,32037,8451,3127,2),M0I=2461,R2=(82,22408,25648,16936,23791,6783,0))
+    Primes(754)=(P=(23,64,1,115,241,172,79,133,13,187),M=(82,3515,7946,18097,2975,29696,2),M0I=20621,R2=(82,29385,20694,14494,11972,7521,2))
+    Primes(755)=(P=(25,145,239,219,45,213,33,14,167,237),M=(82,10221,16925,14164,32473,6430,3),M0I=12827,R2=(82,23216,24537,12996,24312,32468,0))
+    Primes(756)=(P=(27,3,173,68,179,160,201,227,110,3),M=(82,28163,5062,20099,27173,12346,3),M0I=21333,R2=(82,4930,11977,1648,27630,13004,0))
+    Primes(757)=(P=(28,227,233,159,218,106,2,206,179,225),M=(82,13281,1437,27048,19710,20030,3),M0I=12255,R2=(82,27535,12767,28229,1761,2295,1))
+    Primes(758)=(P=(19,123,168,148,103,62,144,162,227,175),M=(82,25519,8517,7418,17571,14266,2),M0I=11441,R2=(82,15572,814,4095,17031,18782,1))
+    Primes(759)=(P=(24,43,240,13,186,175,222,195,211,217),M=(82,21465,15751,27327,109,703,3),M0I=919,R2=(82,27636,10849,1311,8299,5310,0))
+    Primes(760)=(P=(41,34,44,33,31,51,112,160,187,151),M=(83,15255,24897,31949,24840,4642,5),M0I=3033,R2=(83,27377,24577,16772,15483,25270,3))
+    Primes(761)=(P=(36,222,92,126,114,159,140,93,30,31),M=(83,7711,6330,19070,25587,19941,4),M0I=8737,R2=(83,7461,15790,4763,8307,32551,0))
+    Primes(762)=(P=(48,28,77,197,214,4,156,59,174,235),M=(83,12011,14455,22546,28206,452,6),M0I=30269,R2=(83,2823,19358,29231,16656,306,3))
+    Primes(763)=(P=(42,130,81,43,132,170,140,121,12,51),M=(83,3123,6386,4778,2396,10277,5),M0I=12549,R2=(83,27937,18676,22363,1279,29964,3))
+    Primes(764)=(P=(52,254,233,161,64,137,133,90,8,51),M=(83,2099,2740,550,19722,20462,6),M0I=19717,R2=(83,28388,267,20870,12981,13402,1))
+    Primes(765)=(P=(48,191,230,10,22,39,131,209,106,165),M=(83,27301,1954,22686,12368,3070,6),M0I=4819,R2=(83,22947,14029,28724,12466,6186,0))
+    Primes(766)=(P=(46,191,91,239,6,27,61,55,89,69),M=(83,22853,31342,6252,24440,27637,5),M0I=11891,R2=(83,7632,24408,15122,28038,18576,5))
+    Primes(767)=(P=(37,176,197,111,86,109,187,31,80,185),M=(83,20665,30270,22966,11130,23308,4),M0I=19063,R2=(83,18532,23422,4197,6238,2884,3))
+    Primes(768)=(P=(56,32,241,62,107,104,58,18,208,127),M=(83,20607,29733,11680,2547,527,7),M0I=4225,R2=(83,5588,23097,1365,28462,32644,1))
+    Primes(769)=(P=(46,120,78,193,189,132,118,184,14,137),M=(83,3721,28016,30225,30221,26500,5),M0I=14407,R2=(83,32023,16011,8374,14564,9251,2))
+    Primes(770)=(P=(109,86,98,207,151,58,36,38,11,77),M=(84,2893,18508,23784,5756,21862,13),M0I=23163,R2=(84,2573,18104,1066,13921,1284,0))
+    Primes(771)=(P=(98,211,120,97,100,83,196,175,192,149),M=(84,16533,2399,4431,17163,11575,12),M0I=30019,R2=(84,7783,13085,23,22849,6182,10))
+    Primes(772)=(P=(117,228,220,127,38,47,106,149,152,255),M=(84,6399,21803,6333,25593,24141,14),M0I=6401,R2=(84,9115,29112,7690,3192,31454,6))
+    Primes(773)=(P=(104,229,202,92,105,91,241,120,244,205),M=(84,29901,25329,9583,21219,3676,13),M0I=26619,R2=(84,6488,27834,27724,15300,31278,11))
+    Primes(774)=(P=(64,125,173,114,93,20,69,115,166,187),M=(84,9915,2791,29777,27538,2010,8),M0I=20877,R2=(84,32613,32484,10875,11985,8484,6))
+    Primes(775)=(P=(101,172,46,136,248,57,17,95,254,1),M=(84,32257,8895,24804,29767,23234,12),M0I=32255,R2=(84,26556,24228,28213,3759,25649,5))
+    Primes(776)=(P=(66,124,113,208,117,48,142,143,206,167),M=(84,20135,7455,21698,3715,10183,8),M0I=1769,R2=(84,18253,1444,15210,23625,30755,4))
+    Primes(777)=(P=(122,13,92,165,90,31,175,8,180,37),M=(84,13349,24081,26750,25898,8405,15),M0I=14419,R2=(84,17803,2258,26057,11963,25297,9))
+    Primes(778)=(P=(101,24,127,214,76,56,39,81,160,195),M=(84,8387,20131,12512,32434,20871,12),M0I=28693,R2=(84,7958,5519,10683,2567,13610,11))
+    Primes(779)=(P=(76,37,68,184,157,120,226,56,200,39),M=(84,18471,17521,30179,9668,16980,9),M0I=22633,R2=(84,30578,18433,15849,2250,25608,6))
+    Primes(780)=(P=(174,46,137,170,10,254,212,0,33,45),M=(85,8493,10240,11259,19792,25320,21),M0I=10587,R2=(85,29029,21486,12759,29650,8749,8))
+    Primes(781)=(P=(202,147,21,227,239,71,174,237,204,219),M=(85,19675,24027,15646,12063,10545,25),M0I=12461,R2=(85,20811,16108,2361,20041,22850,23))
+    Primes(782)=(P=(252,157,185,228,171,125,170,209,187,97),M=(85,15201,21923,11766,20261,18907,31),M0I=22367,R2=(85,30838,27510,12522,31033,32536,22))
+    Primes(783)=(P=(229,197,123,216,216,191,37,188,136,13),M=(85,2061,19321,25340,24262,23639,28),M0I=31035,R2=(85,20223,32651,14645,17567,32521,9))
+    Primes(784)=(P=(199,229,180,51,47,176,215,161,73,191),M=(85,18879,12098,16067,8601,32347,24),M0I=22977,R2=(85,5759,15388,21637,18606,21720,20))
+    Primes(785)=(P=(175,111,69,106,67,90,203,26,128,239),M=(85,239,5685,3435,11090,30452,21),M0I=20977,R2=(85,27680,4966,26491,8914,9092,8))
+    Primes(786)=(P=(128,247,244,235,115,140,221,175,124,215),M=(85,31959,15198,20019,10075,3967,16),M0I=18713,R2=(85,25622,28440,4203,30085,31820,10))
+    Primes(787)=(P=(132,24,130,20,2,46,40,168,211,5),M=(85,21253,20817,2232,4256,16776,16),M0I=32307,R2=(85,22294,10484,15208,22446,1963,2))
+    Primes(788)=(P=(180,226,83,204,131,185,21,131,101,107),M=(85,25963,11014,3812,7780,20005,22),M0I=24765,R2=(85,31410,26657,3921,21828,16148,4))
+    Primes(789)=(P=(141,79,145,26,9,86,95,25,120,223),M=(85,30943,15922,9561,2256,21753,17),M0I=15585,R2=(85,25020,2647,8088,19730,24412,12))
+    Primes(790)=(P=(1,80,19,24,70,171,245,40,58,232,51),M=(86,26675,20597,12244,16949,305,42),M0I=11525,R2=(86,2120,27824,29978,5708,4354,23))
+    Primes(791)=(P=(1,7,57,223,195,74,68,190,138,132,189),M=(86,1213,32021,10514,32282,29597,32),M0I=26987,R2=(86,32248,22250,28762,29576,26302,5))
+    Primes(792)=(P=(1,148,6,178,168,155,223,84,135,25,231),M=(86,6631,10510,28541,5444,16491,50),M0I=5673,R2=(86,16494,25359,12053,28393,28248,7))
+    Primes(793)=(P=(1,144,226,234,190,205,75,21,214,105,141),M=(86,27021,11180,13612,22006,3630,50),M0I=32443,R2=(86,30584,14215,11322,21333,1188,3))
+    Primes(794)=(P=(1,207,96,218,42,241,116,75,39,83,221),M=(86,21469,5710,17873,20823,30221,57),M0I=25483,R2=(86,13976,22284,32514,3720,11658,21))
+    Primes(795)=(P=(1,113,8,168,135,218,121,157,193,180,25),M=(86,13337,15235,27110,17470,4234,46),M0I=6103,R2=(86,28339,30952,4382,32417,21350,11))
+    Primes(796)=(P=(1,158,60,13,84,182,55,160,158,168,163),M=(86,10403,16701,22750,27301,25536,51),M0I=13557,R2=(86,14736,7318,28227,9110,29065,15))
+    Primes(797)=(P=(1,101,35,185,246,226,75,53,227,93,187),M=(86,23995,27590,2348,20407,21051,44),M0I=8333,R2=(86,3212,23234,31807,10131,8513,35))
+    Primes(798)=(P=(1,118,225,26,243,101,154,131,79,68,137),M=(86,17545,1694,5738,22427,28177,46),M0I=3655,R2=(86,28348,22369,9385,14474,5097,10))
+    Primes(799)=(P=(1,188,92,98,201,208,246,30,31,16,57),M=(86,4153,15422,17368,5710,17862,55),M0I=8695,R2=(86,921,12369,5164,21832,6284,2))
+    Primes(800)=(P=(3,196,70,58,1,243,201,236,103,224,73),M=(87,24649,22735,20263,20495,17507,120),M0I=28167,R2=(87,3633,30969,25503,10353,9693,110))
+    Primes(801)=(P=(2,124,0,91,210,18,183,55,176,104,61),M=(87,26685,28512,19164,24208,16389,79),M0I=4331,R2=(87,14082,23475,2555,12180,15535,7))
+    Primes(802)=(P=(3,92,144,81,178,204,60,86,61,225,35),M=(87,24867,11387,12529,3478,18693,107),M0I=10613,R2=(87,24131,13197,17788,27305,18864,45))
+    Primes(803)=(P=(3,202,176,97,68,31,190,46,183,140,123),M=(87,3195,23919,32504,2592,11014,121),M0I=3405,R2=(87,29199,13472,28147,14798,11982,6))
+    Primes(804)=(P=(2,12,125,145,23,56,86,74,72,90,183),M=(87,23223,5264,24921,2233,18393,65),M0I=23801,R2=(87,15823,32335,211,1799,23284,61))
+    Primes(805)=(P=(3,124,184,10,73,99,25,80,234,160,71),M=(87,8263,8661,3173,21067,19328,111),M0I=30345,R2=(87,26499,1548,3900,118,18699,31))
+    Primes(806)=(P=(3,60,209,226,78,75,205,255,129,81,187),M=(87,20923,32514,12087,4722,19742,103),M0I=13453,R2=(87,28699,13842,16190,25497,6668,90))
+    Primes(807)=(P=(3,142,115,58,105,124,8,74,87,166,209),M=(87,9937,5295,28705,21323,26419,113),M0I=3535,R2=(87,1205,12541,10934,24196,3933,68))
+    Primes(808)=(P=(2,3,86,253,164,37,78,206,201,9,3),M=(87,2307,7570,5435,27937,13679,64),M0I=22101,R2=(87,26011,21041,6,17838,7036,10))
+    Primes(809)=(P=(2,2,71,67,58,198,141,187,155,13,65),M=(87,3393,30518,6710,6614,9332,64),M0I=32063,R2=(87,20918,21935,19416,26783,24708,47))
+    Primes(810)=(P=(7,146,93,1,240,70,219,173,31,8,51),M=(88,2099,23102,7022,3970,9680,242),M0I=19717,R2=(88,21371,19046,31412,21550,16715,205))
+    Primes(811)=(P=(5,198,18,194,244,217,255,223,142,41,141),M=(88,10637,16156,26623,6054,24876,184),M0I=16059,R2=(88,20991,16196,12383,11284,15653,140))
+    Primes(812)=(P=(4,70,39,81,34,239,217,97,3,163,227),M=(88,9187,16903,16229,2327,25205,136),M0I=17973,R2=(88,5590,31992,27772,13315,7575,33))
+    Primes(813)=(P=(6,33,42,40,21,68,30,177,160,97,45),M=(88,24877,25408,4218,16554,4770,196),M0I=26971,R2=(88,8841,7364,25773,18724,8128,159))
+    Primes(814)=(P=(6,18,244,216,198,29,140,35,56,120,35),M=(88,30755,18032,30256,17968,12109,194),M0I=2165,R2=(88,13497,22792,5415,4978,20071,113))
+    Primes(815)=(P=(7,61,231,239,216,81,64,83,209,40,73),M=(88,10313,10146,17665,32450,24190,231),M0I=13831,R2=(88,20777,15040,21810,29188,26632,190))
+    Primes(816)=(P=(6,237,151,59,177,128,184,153,93,86,249),M=(88,22265,12986,738,23948,22899,221),M0I=29879,R2=(88,28580,11920,16270,14851,29779,19))
+    Primes(817)=(P=(6,157,2,115,58,243,88,59,14,199,95),M=(88,18271,30237,19808,6615,20519,211),M0I=11105,R2=(88,18042,2682,13846,630,22129,90))
+    Primes(818)=(P=(5,239,155,114,194,64,211,133,208,31,175),M=(88,8111,2976,846,5650,31159,189),M0I=26801,R2=(88,23143,8781,748,13504,14196,44))
+    Primes(819)=(P=(5,245,234,208,75,65,104,38,123,120,117),M=(88,30837,19702,1440,602,24237,190),M0I=26659,R2=(88,28871,26602,28503,3469,766,107))
+    Primes(820)=(P=(12,161,216,229,8,199,127,153,95,162,179),M=(89,8883,12991,7678,10310,7566,404),M0I=9093,R2=(89,10917,31976,6786,6019,16426,272))
+    Primes(821)=(P=(13,77,107,45,182,119,53,83,207,237,103),M=(89,28007,10143,23765,28083,22194,425),M0I=8617,R2=(89,13441,18468,12150,15739,25936,178))
+    Primes(822)=(P=(9,180,52,230,64,251,56,70,235,68,233),M=(89,17641,3542,27873,12807,17230,310),M0I=11431,R2=(89,13025,22516,25764,20348,2051,127))
+    Primes(823)=(P=(10,138,218,25,231,48,94,31,179,61,151),M=(89,15767,16230,16760,20281,11681,337),M0I=28121,R2=(89,32250,22197,4415,30329,29898,230))
+    Primes(824)=(P=(12,248,143,190,84,107,184,42,229,73,249),M=(89,18937,21962,12000,29347,2299,415),M0I=22455,R2=(89,14196,1783,6893,10849,25471,391))
+    Primes(825)=(P=(14,147,148,43,91,234,131,189,63,111,85),M=(89,28501,31358,10766,23263,14658,466),M0I=27139,R2=(89,22259,15460,1218,15834,13174,184))
+    Primes(826)=(P=(10,239,92,20,134,8,126,13,10,20,211),M=(89,5331,6676,8696,9264,30145,349),M0I=7333,R2=(89,27188,15314,14823,11228,13140,217))
+    Primes(827)=(P=(13,129,155,160,93,203,118,73,208,50,221),M=(89,13021,5024,11737,750,6586,432),M0I=19083,R2=(89,4847,21338,14006,20210,12293,311))
+    Primes(828)=(P=(10,72,36,107,74,150,153,125,143,27,227),M=(89,7139,31518,23141,23124,582,329),M0I=32309,R2=(89,23144,24109,17714,10962,14501,94))
+    Primes(829)=(P=(15,29,216,30,45,98,71,229,122,245,191),M=(89,30143,19189,2335,29035,23937,483),M0I=1473,R2=(89,27035,1652,18392,22872,11660,154))
+    Primes(830)=(P=(31,212,12,85,97,133,82,217,158,226,159),M=(90,25247,13117,5451,11020,16581,1018),M0I=18081,R2=(90,24907,15164,30310,6314,29994,667))
+    Primes(831)=(P=(25,103,184,71,167,215,40,23,165,209,249),M=(90,20985,12107,23712,15678,31620,812),M0I=24503,R2=(90,22383,19666,26853,981,20813,600))
+    Primes(832)=(P=(21,184,41,202,12,99,243,180,233,37,69),M=(90,9541,27090,4046,20579,668,695),M0I=23155,R2=(90,13180,17009,12133,23221,8126,325))
+    Primes(833)=(P=(17,137,75,116,116,107,100,65,89,161,89),M=(90,8537,691,11665,9123,5303,561),M0I=26903,R2=(90,10599,24597,23315,16549,24108,451))
+    Primes(834)=(P=(18,171,88,156,244,50,11,214,139,178,89),M=(90,12889,11543,18479,26529,13705,597),M0I=2583,R2=(90,32488,18556,12749,32634,31532,506))
+    Primes(835)=(P=(23,116,93,135,161,91,78,39,89,248,33),M=(90,30753,20147,27960,15626,17880,750),M0I=29727,R2=(90,10617,18007,11444,16200,9699,531))
+    Primes(836)=(P=(22,164,128,225,114,183,56,146,151,20,35),M=(90,5155,9518,23778,2965,18446,724),M0I=17525,R2=(90,1728,19874,10840,30100,22924,298))
+    Primes(837)=(P=(25,191,111,13,147,48,68,229,244,224,237),M=(90,24813,19433,16659,27801,30448,823),M0I=795,R2=(90,1729,8541,4975,10531,22131,152))
+    Primes(838)=(P=(20,225,198,155,167,164,97,50,170,166,201),M=(90,9929,25941,4484,23869,7273,668),M0I=11399,R2=(90,30579,5089,4135,1509,756,260))
+    Primes(839)=(P=(16,151,222,158,148,5,97,58,123,175,49),M=(90,12081,29943,5508,29856,32233,530),M0I=13871,R2=(90,284,4970,11017,11683,7507,484))
+    Primes(840)=(P=(60,34,126,215,4,115,192,100,111,185,245),M=(91,14837,18655,20225,14371,10221,1924),M0I=5539,R2=(91,23698,9927,27190,7313,8894,1639))
+    Primes(841)=(P=(35,51,46,224,115,103,228,32,173,124,181),M=(91,31925,16730,8080,923,13038,1126),M0I=28259,R2=(91,24288,10156,16241,743,26462,598))
+    Primes(842)=(P=(53,58,160,48,173,25,73,233,205,162,39),M=(91,8743,21403,25895,1384,10755,1703),M0I=21097,R2=(91,24962,8237,27142,3615,4674,1331))
+    Primes(843)=(P=(63,4,187,181,128,43,156,30,237,1,181),M=(91,437,15834,11888,11265,19387,2016),M0I=23395,R2=(91,12971,10652,2819,26332,15920,1772))
+    Primes(844)=(P=(59,134,113,138,22,39,110,84,158,60,131),M=(91,15491,10556,7609,20657,26392,1904),M0I=3541,R2=(91,19826,10112,4280,122,25340,133))
+    Primes(845)=(P=(39,205,129,108,127,61,104,129,255,167,129),M=(91,10113,1023,30114,25593,22550,1273),M0I=26495,R2=(91,23862,7080,6267,20156,17826,130))
+    Primes(846)=(P=(44,22,245,129,58,113,221,171,156,248,137),M=(91,30857,22329,18294,2515,28504,1410),M0I=583,R2=(91,16559,26685,19546,22123,29204,203))
+    Primes(847)=(P=(52,30,196,91,101,81,94,241,6,37,75),M=(91,9547,25100,17787,23338,27717,1667),M0I=17309,R2=(91,8457,19222,28120,11806,30051,336))
+    Primes(848)=(P=(40,189,62,49,72,63,32,97,242,164,173),M=(91,9389,17381,31873,2625,21475,1303),M0I=8411,R2=(91,4407,14737,32114,5149,7319,1196))
+    Primes(849)=(P=(34,146,186,52,164,127,85,6,241,150,227),M=(91,5859,3555,32084,9507,11171,1106),M0I=8501,R2=(91,26540,44,26252,17481,22347,668))
+    Primes(850)=(P=(75,193,215,26,143,60,113,61,157,178,35),M=(92,12835,31547,29124,21625,7537,2424),M0I=29301,R2=(92,17205,8937,22888,10179,21807,350))
+    Primes(851)=(P=(118,253,99,212,98,97,166,52,54,235,169),M=(92,27561,26733,1688,8979,22077,3807),M0I=5991,R2=(92,10027,23760,19604,29301,282,2923))
+    Primes(852)=(P=(70,206,161,195,175,237,81,121,175,152,103),M=(92,6247,29535,13637,7551,27164,2265),M0I=31913,R2=(92,8026,10019,32526,31659,21463,136))
+    Primes(853)=(P=(93,250,182,166,248,69,45,155,118,48,235),M=(92,12523,14060,5302,14274,11114,3007),M0I=2109,R2=(92,15708,2949,10628,25197,24937,210))
+    Primes(854)=(P=(116,88,121,176,139,254,150,239,44,152,203),M=(92,6347,24153,31323,1119,1947,3723),M0I=29469,R2=(92,25850,14549,3951,22343,21327,2207))
+    Primes(855)=(P=(103,165,196,152,112,16,144,74,63,201,105),M=(92,18793,5247,16961,17280,23625,3316),M0I=10535,R2=(92,15002,10982,25936,4683,14050,392))
+    Primes(856)=(P=(123,141,240,251,37,249,199,77,171,201,203),M=(92,18891,6999,26397,22831,24335,3953),M0I=27677,R2=(92,12356,14712,9441,9823,26538,1350))
+    Primes(857)=(P=(90,120,7,250,172,75,41,46,43,182,185),M=(92,14009,23639,11428,21858,127,2895),M0I=4215,R2=(92,21985,19483,9077,7645,6271,492))
+    Primes(858)=(P=(98,213,171,30,18,34,89,193,124,244,15),M=(92,29711,761,2407,28817,23217,3162),M0I=1297,R2=(92,26801,7944,3583,20233,3231,1233))
+    Primes(859)=(P=(118,34,247,244,76,100,164,10,207,22,195),M=(92,5827,5534,4752,8803,12159,3780),M0I=13845,R2=(92,7396,19004,31578,12064,19824,2882))
+    Primes(860)=(P=(227,19,2,128,164,42,37,4,66,137,181),M=(93,2485,2181,10388,1313,12328,7266),M0I=9059,R2=(93,16657,1594,31029,12011,1319,1926))
+    Primes(861)=(P=(203,23,86,74,74,115,213,62,244,64,173),M=(93,16557,32232,20308,21075,30052,6498),M0I=23771,R2=(93,17379,554,29048,25103,1760,3550))
+    Primes(862)=(P=(133,123,48,66,180,190,94,217,114,65,73),M=(93,16713,13028,31099,5541,13060,4271),M0I=32519,R2=(93,246,31637,4150,24401,5877,2639))
+    Primes(863)=(P=(217,37,50,137,64,26,87,192,138,95,155),M=(93,24475,276,26975,18944,21288,6948),M0I=4461,R2=(93,1144,11885,14198,4678,277,780))
+    Primes(864)=(P=(139,64,44,12,104,180,47,143,233,154,93),M=(93,6749,8147,20670,25413,704,4456),M0I=30219,R2=(93,3981,5318,30332,23993,10513,3892))
+    Primes(865)=(P=(156,186,228,242,41,46,184,218,202,234,227),M=(93,27363,13717,15075,4425,11855,5015),M0I=21813,R2=(93,7412,5780,19261,14293,11357,105))
+    Primes(866)=(P=(147,201,178,185,126,209,120,49,86,98,235),M=(93,25323,25260,17888,19446,6955,4729),M0I=19005,R2=(93,8770,10712,8163,27740,29201,676))
+    Primes(867)=(P=(171,249,50,232,248,186,95,164,87,94,115),M=(93,24179,18606,27006,18373,4910,5503),M0I=2373,R2=(93,15849,6773,19578,32542,26009,4458))
+    Primes(868)=(P=(243,28,141,70,218,192,181,186,72,134,147),M=(93,1683,29841,726,14038,18644,7779),M0I=30821,R2=(93,3583,30244,19533,16957,29704,6771))
+    Primes(869)=(P=(138,212,67,122,115,247,37,25,52,101,245),M=(93,26101,12904,23700,21407,17463,4442),M0I=8611,R2=(93,10718,16426,25579,18940,21123,3395))
+    Primes(870)=(P=(1,240,71,113,244,82,173,189,180,200,231,153),M=(94,26521,27025,14070,8853,30495,15880,0),M0I=855,R2=(94,27076,21098,2715,12197,20628,8287))
+    Primes(871)=(P=(1,135,136,179,11,40,184,29,214,251,45,163),M=(94,11683,11766,24695,22853,2864,12529,0),M0I=4597,R2=(94,18669,12956,12651,12962,21221,7230))
+    Primes(872)=(P=(1,27,224,183,138,90,36,125,192,16,133,61),M=(94,1341,33,4599,21201,2936,9084,0),M0I=1515,R2=(94,26670,22863,12612,12422,6360,8981))
+    Primes(873)=(P=(1,227,121,238,117,104,171,68,60,222,81,37),M=(94,20773,31164,11536,11077,7911,15471,0),M0I=7507,R2=(94,29930,5193,16074,29944,32200,8783))
+    Primes(874)=(P=(1,200,193,28,11,34,98,180,161,229,228,93),M=(94,25693,17355,2770,22803,4544,14616,0),M0I=28683,R2=(94,9812,27001,28681,20865,27447,12898))
+    Primes(875)=(P=(1,5,174,171,80,83,163,121,112,8,5,65),M=(94,1345,24592,3557,669,27317,8373,0),M0I=30015,R2=(94,9097,19200,32144,30562,5928,7005))
+    Primes(876)=(P=(1,240,203,91,167,46,7,55,218,30,165,5),M=(94,9477,13373,7391,14704,13754,15897,0),M0I=8243,R2=(94,32548,17701,16547,21003,20050,11787))
+    Primes(877)=(P=(1,7,251,126,47,166,26,72,161,33,45,149),M=(94,11669,16962,26914,32048,14306,8447,0),M0I=19011,R2=(94,18944,14244,26537,25255,6479,3377))
+    Primes(878)=(P=(1,169,251,24,199,175,61,91,131,252,138,99),M=(94,2659,2041,30062,15737,12684,13631,0),M0I=14517,R2=(94,14530,25546,4560,11073,984,11268))
+    Primes(879)=(P=(1,109,175,82,161,8,49,186,17,163,99,131),M=(94,25475,9030,18152,2113,29994,11701,0),M0I=15573,R2=(94,5966,23641,11327,14515,20859,10428))
+    Primes(880)=(P=(3,205,247,36,114,83,3,152,168,96,78,11),M=(95,19979,20672,3682,4760,29255,31166,0),M0I=12893,R2=(95,5307,12396,15049,17500,27881,3512))
+    Primes(881)=(P=(2,4,116,223,143,90,133,236,218,205,157,251),M=(95,7675,13723,6067,31444,19960,16526,0),M0I=6861,R2=(95,11803,15409,16964,619,26195,2471))
+    Primes(882)=(P=(2,170,129,84,246,138,77,36,115,46,237,171),M=(95,28075,26205,13457,13394,5455,21840,0),M0I=23293,R2=(95,8100,23825,15502,15178,28549,3881))
+    Primes(883)=(P=(3,89,32,65,75,156,128,135,147,66,48,239),M=(95,12527,9860,542,23780,1044,27428,0),M0I=497,R2=(95,26164,22149,30241,23194,9079,2778))
+    Primes(884)=(P=(2,17,39,114,95,11,3,186,186,29,41,175),M=(95,10671,29754,3818,30808,30501,16932,0),M0I=12977,R2=(95,26041,2085,28297,9412,18029,11485))
+    Primes(885)=(P=(3,178,66,146,131,98,102,79,123,149,84,103),M=(95,21607,30506,6461,6931,10536,30280,0),M0I=30889,R2=(95,20012,17124,2686,13203,10692,10473))
+    Primes(886)=(P=(3,37,69,152,98,237,55,227,241,103,147,9),M=(95,4873,25295,24463,5993,22918,25768,0),M0I=5319,R2=(95,12670,28177,6719,24550,5409,14960))
+    Primes(887)=(P=(2,110,2,125,20,125,151,249,152,144,170,233),M=(95,10985,12577,24550,9196,10193,19904,0),M0I=12967,R2=(95,31249,23997,13594,20613,14395,601))
+    Primes(888)=(P=(3,57,220,12,88,179,203,79,220,189,97,175),M=(95,25007,14714,11583,17822,16581,26427,0),M0I=27313,R2=(95,31125,12598,6565,9928,376,7027))
+    Primes(889)=(P=(3,242,122,70,129,149,220,44,138,129,184,87),M=(95,14423,5379,28850,3246,9320,32335,0),M0I=19609,R2=(95,25369,17704,13254,17609,15992,32218))
+    Primes(890)=(P=(6,48,28,53,249,132,31,251,56,28,71,179),M=(97,18355,28728,32748,19488,17247,17923,1),M0I=16517,R2=(97,31692,8280,10927,14267,19636,11668,1))
+    Primes(891)=(P=(7,198,28,155,246,220,131,245,155,81,122,219),M=(97,31451,13986,4054,14052,18879,30915,1),M0I=3757,R2=(97,21684,9035,916,25557,8840,31919,0))
+    Primes(892)=(P=(6,164,41,66,98,30,232,129,68,169,180,133),M=(97,13445,2387,8709,4343,5158,21637,1),M0I=23475,R2=(97,16221,28678,4628,12153,26600,19131,0))
+    Primes(893)=(P=(5,231,50,125,95,13,159,149,207,167,143,17),M=(97,3857,8015,32343,30828,10197,15590,1),M0I=15887,R2=(97,7393,7288,22049,3508,32046,25356,0))
+    Primes(894)=(P=(6,133,104,51,226,40,166,128,236,106,98,195),M=(97,25283,22740,6659,4421,830,20653,1),M0I=8725,R2=(97,11225,13448,16927,1064,12608,24355,0))
+    Primes(895)=(P=(6,154,98,163,252,7,160,250,160,65,78,31),M=(97,19999,16514,1002,24637,10815,21324,1),M0I=21025,R2=(97,15368,10863,19560,23027,5063,9722,1))
+    Primes(896)=(P=(5,255,251,0,53,106,7,176,253,175,63,113),M=(97,16241,31582,7875,11088,12291,16383,1),M0I=24175,R2=(97,10569,5553,9041,27310,28000,26962,0))
+    Primes(897)=(P=(6,99,234,127,130,6,179,199,36,91,178,33),M=(97,12833,18615,20252,4149,10232,19581,1),M0I=11807,R2=(97,30305,238,15649,31642,22935,20622,0))
+    Primes(898)=(P=(5,195,53,110,110,182,175,215,231,150,113,107),M=(97,29035,20268,16223,30133,22246,14438,1),M0I=19645,R2=(97,12970,11854,28442,12572,23153,31254,0))
+    Primes(899)=(P=(5,93,238,246,207,238,164,10,176,32,9,113),M=(97,2417,24640,4138,32629,28524,11197,1),M0I=26735,R2=(97,7910,22043,14583,20512,8699,4350,0))
+    Primes(900)=(P=(9,244,178,63,43,210,215,240,87,75,86,49),M=(98,22065,11926,24513,24214,9202,16022,2),M0I=15663,R2=(98,19419,17666,3551,29251,15420,14968,1))
+    Primes(901)=(P=(9,238,230,95,235,141,199,38,237,76,102,147),M=(98,26259,23192,7323,23662,26110,15836,2),M0I=22629,R2=(98,15197,9822,17276,8472,1985,24693,0))
+    Primes(902)=(P=(8,21,55,190,46,11,221,12,181,46,237,183),M=(98,28087,27229,29746,28766,31714,678,2),M0I=32761,R2=(98,21233,25997,27041,586,5694,2896,0))
+    Primes(903)=(P=(15,42,62,210,206,129,104,13,138,133,108,227),M=(98,27875,5386,8246,29707,27948,25927,3),M0I=18229,R2=(98,26284,3856,8824,23583,6654,17623,3))
+    Primes(904)=(P=(12,232,173,235,120,10,68,121,162,218,205,171),M=(98,19883,17845,4582,16466,24247,7445,3),M0I=15101,R2=(98,186,8492,22141,28805,14197,17114,2))
+    Primes(905)=(P=(8,239,172,197,172,17,45,246,61,122,57,225),M=(98,14817,31476,14296,24713,19546,7669,2),M0I=13791,R2=(98,9146,31003,16629,27296,278,24896,1))
+    Primes(906)=(P=(12,133,212,16,178,217,173,226,184,249,126,43),M=(98,32299,29170,14218,5837,16651,4282,3),M0I=12157,R2=(98,16608,13128,19561,19093,2950,7954,1))
+    Primes(907)=(P=(8,83,71,63,90,35,151,189,36,222,204,169),M=(98,19625,18877,24308,20764,29685,2664,2),M0I=26727,R2=(98,2821,15408,9765,31606,2030,27369,1))
+    Primes(908)=(P=(10,118,218,149,121,151,107,4,82,103,186,205),M=(98,15053,9423,11281,19643,10583,20187,2),M0I=15867,R2=(98,9446,16460,2716,4726,5799,5743,2))
+    Primes(909)=(P=(14,57,79,92,36,165,101,78,142,243,226,65),M=(98,25153,7655,5434,9515,30146,18217,3),M0I=21055,R2=(98,32650,26789,5987,25324,24930,12197,3))
+    Primes(910)=(P=(29,191,187,86,127,94,43,52,176,173,229,171),M=(99,26027,24923,11474,31473,13671,14327,7),M0I=4861,R2=(99,183,2653,9549,3983,17546,20546,6))
+    Primes(911)=(P=(19,145,165,57,60,32,133,199,29,136,65,221),M=(99,16861,15120,5916,24836,21395,29236,4),M0I=24971,R2=(99,5572,21882,23287,12956,23136,12765,0))
+    Primes(912)=(P=(16,154,134,160,165,5,81,88,185,156,148,141),M=(99,5261,29497,17762,10282,27146,4944,4),M0I=12731,R2=(99,26676,16194,20072,1122,3269,17938,0))
+    Primes(913)=(P=(18,215,128,168,51,250,152,170,219,40,235,227),M=(99,27619,13905,25259,8148,2691,23280,4),M0I=20021,R2=(99,4422,1591,393,16865,26560,9393,3))
+    Primes(914)=(P=(21,136,53,249,77,29,221,126,35,211,217,69),M=(99,22853,18343,30200,26862,24468,12550,5),M0I=11891,R2=(99,9235,14949,25853,29486,84,28518,3))
+    Primes(915)=(P=(22,223,66,83,57,156,38,221,106,253,249,177),M=(99,31153,22011,7029,19681,9523,23528,5),M0I=20655,R2=(99,16005,3368,29987,12741,462,985,0))
+    Primes(916)=(P=(21,206,210,97,33,162,139,202,54,144,236,147),M=(99,27795,27937,12072,3348,9746,14810,5),M0I=28261,R2=(99,20627,21168,17184,18871,2430,2081,5))
+    Primes(917)=(P=(19,136,74,232,4,27,162,117,142,98,253,183),M=(99,32183,7365,2518,8413,11904,28937,4),M0I=4089,R2=(99,24741,20656,11969,262,20766,19512,1))
+    Primes(918)=(P=(19,114,171,14,94,57,161,49,26,101,2,91),M=(99,603,13514,1220,29133,12517,28245,4),M0I=8749,R2=(99,32585,18418,6670,9106,9699,31444,0))
+    Primes(919)=(P=(18,115,168,154,34,122,206,46,155,245,250,249),M=(99,31481,14315,14522,5078,2466,20085,4),M0I=22711,R2=(99,2882,18452,30307,21071,16080,27554,0))
+    Primes(920)=(P=(54,172,121,59,141,147,35,232,2,247,27,99),M=(100,7011,1518,4000,27801,5048,21903,13),M0I=16821,R2=(100,8215,29797,22127,10758,12238,31542,0))
+    Primes(921)=(P=(63,175,21,40,63,92,134,255,12,52,150,115),M=(100,5747,6249,7164,31460,21123,30178,15),M0I=325,R2=(100,11414,3874,14795,27001,31586,19972,10))
+    Primes(922)=(P=(63,136,190,60,91,48,47,81,187,43,57,115),M=(100,14707,30294,15686,22913,25541,28951,15),M0I=27717,R2=(100,23154,22676,3846,9271,32357,19561,10))
+    Primes(923)=(P=(41,49,254,72,163,218,25,57,241,8,37,111),M=(100,9583,25104,25831,7888,25738,9791,10),M0I=9841,R2=(100,5470,10632,20099,9861,5939,22975,1))
+    Primes(924)=(P=(60,225,206,42,229,44,183,144,214,204,146,45),M=(100,4653,11673,24131,10597,25262,7225,15),M0I=29275,R2=(100,25353,24718,20741,2052,6548,13851,8))
+    Primes(925)=(P=(42,109,219,15,154,134,73,212,61,42,85,233),M=(100,21993,31316,10064,21554,12537,19899,10),M0I=11687,R2=(100,30946,7486,14603,17295,13667,13541,6))
+    Primes(926)=(P=(35,176,189,128,114,184,122,179,44,254,174,253),M=(100,12029,23037,27340,5571,22535,30231,8),M0I=8619,R2=(100,30770,31399,32143,6454,21539,24263,7))
+    Primes(927)=(P=(61,70,228,152,2,240,214,248,203,172,136,33),M=(100,2081,5977,23523,6022,18816,10460,15),M0I=1055,R2=(100,10658,16572,9558,28376,3981,25598,12))
+    Primes(928)=(P=(53,245,154,37,201,53,21,213,74,224,9,107),M=(100,2411,5568,22357,18856,8796,16051,13),M0I=9405,R2=(100,16217,18907,20789,31152,26096,14882,5))
+    Primes(929)=(P=(39,162,192,162,15,188,187,59,190,209,7,173),M=(100,1965,32162,27886,32229,2592,29784,9),M0I=3035,R2=(100,27592,17817,435,27245,6684,1907,6))
+    Primes(930)=(P=(68,101,127,5,242,8,30,73,125,140,1,77),M=(101,333,31512,31013,4160,28767,3247,17),M0I=24699,R2=(101,21061,29216,13226,19747,21629,3147,12))
+    Primes(931)=(P=(71,116,204,172,235,5,115,119,230,242,64,55),M=(101,16439,19940,19935,22571,19150,28313,17),M0I=2681,R2=(101,17072,18948,11212,21337,26432,9193,4))
+    Primes(932)=(P=(69,13,229,169,170,169,99,72,206,9,81,171),M=(101,20907,7186,3363,21835,23194,8636,17),M0I=24317,R2=(101,21839,20362,7366,5009,20433,23517,2))
+    Primes(933)=(P=(78,116,14,73,49,138,139,96,98,208,29,19),M=(101,7443,17824,11649,3156,25747,20097,19),M0I=19173,R2=(101,29811,15936,24534,18142,18142,5410,5))
+    Primes(934)=(P=(78,159,28,167,120,54,88,160,8,1,58,223),M=(101,15071,4098,25216,16818,19063,21475,19),M0I=32481,R2=(101,6594,14900,4556,3686,11886,22191,17))
+    Primes(935)=(P=(108,102,194,6,121,234,1,20,181,135,45,177),M=(101,11697,27406,1106,20304,8295,3288,27),M0I=1199,R2=(101,15134,23815,28345,18029,4112,3074,0))
+    Primes(936)=(P=(115,181,213,239,237,52,181,235,144,226,40,59),M=(101,10299,8644,22446,27045,24318,30394,28),M0I=3853,R2=(101,7856,11945,9822,8633,18720,19127,12))
+    Primes(937)=(P=(78,142,161,175,8,82,58,247,54,81,0,143),M=(101,143,27810,27612,17041,6896,20948,19),M0I=24977,R2=(101,1661,12846,1186,30602,8478,16993,12))
+    Primes(938)=(P=(118,221,162,80,255,200,125,193,216,134,21,103),M=(101,5479,12556,30471,32323,9487,23476,29),M0I=18857,R2=(101,21764,29986,21552,23306,753,24581,24))
+    Primes(939)=(P=(67,85,9,166,10,23,143,218,54,6,146,119),M=(101,4727,27661,16232,20668,6752,27297,16),M0I=6329,R2=(101,24667,10215,7170,5738,22791,11197,4))
+    Primes(940)=(P=(190,51,107,223,198,33,221,66,63,49,122,121),M=(102,31353,32354,29960,12558,15868,18029,47),M0I=12343,R2=(102,18286,16344,31638,3575,1601,2138,30))
+    Primes(941)=(P=(239,89,102,189,249,182,109,165,148,214,150,115),M=(102,5747,10669,13974,19891,27615,27436,59),M0I=325,R2=(102,32663,26997,10170,32341,21976,19483,28))
+    Primes(942)=(P=(237,36,74,214,187,175,26,190,82,246,250,109),M=(102,31341,9709,27385,23928,11627,9353,59),M0I=24731,R2=(102,6873,25797,25566,26504,27256,15619,13))
+    Primes(943)=(P=(206,20,22,19,120,4,72,99,99,83,199,31),M=(102,18207,18087,8589,16418,24887,17026,51),M0I=2849,R2=(102,19701,12555,6625,28857,13808,25798,17))
+    Primes(944)=(P=(131,194,23,64,212,98,158,178,145,26,11,193),M=(102,3009,8756,31434,8980,29709,30786,32),M0I=31679,R2=(102,31049,22878,22416,6289,29,16543,1))
+    Primes(945)=(P=(141,190,230,180,21,17,94,221,202,129,21,211),M=(102,5587,5378,31607,10378,27457,14300,35),M0I=30117,R2=(102,8999,10875,4976,15596,13381,23078,10))
+    Primes(946)=(P=(170,167,183,166,116,247,31,159,180,41,126,93),M=(102,32349,26706,32382,10168,31335,21750,42),M0I=14859,R2=(102,2574,5091,25928,30601,10371,24532,24))
+    Primes(947)=(P=(230,145,168,182,136,171,159,97,192,221,75,253),M=(102,19453,442,32135,17756,2920,21045,57),M0I=5803,R2=(102,16484,2941,17685,11778,2193,11738,28))
+    Primes(948)=(P=(228,42,10,252,177,197,176,25,109,132,206,55),M=(102,20023,23305,16485,3629,12235,1345,57),M0I=14457,R2=(102,16114,8592,14213,15091,14012,27504,47))
+    Primes(949)=(P=(136,2,105,97,172,74,228,202,106,116,175,239),M=(102,12271,21737,4905,25175,5658,77,34),M0I=8433,R2=(102,25884,6499,20139,28205,18353,11392,12))
+    Primes(950)=(P=(1,178,123,211,87,159,113,69,185,232,142,14,219),M=(103,3803,20764,5863,31626,13689,20346,108),M0I=17069,R2=(103,7153,15421,11135,7011,29987,6230,41))
+    Primes(951)=(P=(1,60,104,87,121,47,114,131,227,220,76,125,9),M=(103,32009,14488,3983,31636,30610,3338,79),M0I=24263,R2=(103,31191,6873,25503,1236,31307,30515,38))
+    Primes(952)=(P=(1,174,36,181,114,162,99,252,70,236,124,249,233),M=(103,31209,22777,28955,4895,22314,17558,107),M0I=4519,R2=(103,29827,9434,2382,5915,13985,17861,97))
+    Primes(953)=(P=(1,80,193,11,250,178,142,60,116,218,3,171,211),M=(103,11219,13319,29139,5233,16299,6177,84),M0I=7077,R2=(103,940,28040,31539,300,19824,3830,51))
+    Primes(954)=(P=(1,54,208,160,49,143,164,71,192,94,253,162,83),M=(103,8787,15867,7937,32034,792,23060,77),M0I=3621,R2=(103,17624,21027,15524,22594,15001,29007,53))
+    Primes(955)=(P=(1,213,78,19,150,129,102,252,240,244,21,62,47),M=(103,15919,26666,29635,2871,14696,10690,117),M0I=14129,R2=(103,16091,30499,9578,18399,8372,20321,23))
+    Primes(956)=(P=(1,177,182,4,187,10,54,31,15,122,78,99,193),M=(103,25537,29852,31805,20912,19376,14016,108),M0I=21439,R2=(103,27413,23680,27145,6330,2649,15314,100))
+    Primes(957)=(P=(1,151,60,125,79,53,196,178,210,11,130,220,79),M=(103,23631,5893,19272,11813,21747,26511,101),M0I=17745,R2=(103,11133,27909,29734,31254,31805,4201,85))
+    Primes(958)=(P=(1,207,220,199,169,254,140,170,248,242,57,23,169),M=(103,6057,25714,11235,29797,31391,31640,115),M0I=871,R2=(103,22410,9666,29418,11071,25622,832,23))
+    Primes(959)=(P=(1,229,126,192,131,234,33,211,65,238,87,196,1),M=(103,17409,23727,19719,20750,2110,12248,121),M0I=17407,R2=(103,28170,16445,16111,14753,10218,8749,109))
+    Primes(960)=(P=(3,190,8,228,172,243,240,104,106,70,222,48,143),M=(104,12431,3516,8617,8067,19151,16668,239),M0I=4497,R2=(104,3835,9346,22876,23352,31310,24372,175))
+    Primes(961)=(P=(2,80,25,27,200,56,187,221,34,87,111,25,9),M=(104,6409,11998,29833,17886,15491,803,148),M0I=15047,R2=(104,21301,9295,8374,16667,12576,1081,137))
+    Primes(962)=(P=(2,107,97,209,247,33,68,222,17,194,20,143,127),M=(104,3967,1065,30791,2598,8050,27706,154),M0I=20353,R2=(104,13922,9036,26977,17932,5189,8826,62))
+    Primes(963)=(P=(3,237,59,36,120,87,44,82,235,25,204,197,245),M=(104,17909,13209,19372,14690,18309,10084,251),M0I=419,R2=(104,16226,21279,7157,11395,26247,14389,187))
+    Primes(964)=(P=(3,237,185,202,38,43,41,236,204,253,49,218,245),M=(104,23285,31331,13107,22863,8802,14137,251),M0I=32419,R2=(104,32764,11036,7357,11676,2412,26182,199))
+    Primes(965)=(P=(3,250,214,11,60,150,152,220,213,67,84,94,85),M=(104,24149,1704,29525,13510,13257,23233,254),M0I=20739,R2=(104,14048,26644,7612,25513,15560,17805,139))
+    Primes(966)=(P=(2,79,212,214,141,173,154,134,55,110,134,116,245),M=(104,29941,23820,6365,27860,26842,31386,147),M0I=26787,R2=(104,24127,9927,30011,21506,18234,27787,54))
+    Primes(967)=(P=(3,8,54,170,175,48,110,9,63,240,142,210,239),M=(104,21231,24861,9471,880,10995,1749,194),M0I=25585,R2=(104,12232,10514,21850,20850,14943,5531,186))
+    Primes(968)=(P=(2,250,29,133,58,208,161,149,66,151,78,60,231),M=(104,15591,11932,21770,1292,21421,17328,190),M0I=26921,R2=(104,3314,20647,15245,7265,22936,26157,108))
+    Primes(969)=(P=(3,189,109,127,74,152,186,160,133,62,145,181,227),M=(104,13795,32035,532,17877,29865,11695,239),M0I=18485,R2=(104,16822,23028,7328,3760,16641,14575,135))
+    Primes(970)=(P=(7,129,68,148,107,67,5,184,100,156,20,37,35),M=(105,9507,14376,24978,6189,18100,10386,480),M0I=19829,R2=(105,16508,2188,24389,2852,20779,10962,286))
+    Primes(971)=(P=(7,96,230,154,237,11,10,48,243,227,52,133,101),M=(105,1381,18025,17359,22609,11984,7379,472),M0I=23443,R2=(105,5223,19841,12675,31841,27255,32342,439))
+    Primes(972)=(P=(5,73,127,94,8,236,229,145,122,235,161,103,11),M=(105,26379,22338,17899,26412,24718,12267,338),M0I=21341,R2=(105,6316,21142,28598,9474,4637,27012,217))
+    Primes(973)=(P=(7,209,87,121,234,117,254,61,120,71,3,220,147),M=(105,23699,3591,30177,12273,7847,10991,500),M0I=24165,R2=(105,3005,15000,13143,2816,11829,10107,271))
+    Primes(974)=(P=(4,111,94,135,214,92,118,4,59,188,93,88,13),M=(105,22541,30906,4334,25520,32101,27600,283),M0I=18747,R2=(105,11993,10170,1153,26738,19748,27671,134))
+    Primes(975)=(P=(7,150,161,183,178,93,72,244,104,165,40,128,13),M=(105,13,19025,20898,27207,31525,21558,485),M0I=12603,R2=(105,21045,11354,12469,23571,16656,20279,438))
+    Primes(976)=(P=(7,8,227,15,34,140,227,74,87,56,187,104,11),M=(105,26635,29046,10588,26394,29224,7265,450),M0I=7261,R2=(105,2667,4261,28209,9333,26240,15779,234))
+    Primes(977)=(P=(6,179,5,100,247,4,175,115,152,237,228,22,83),M=(105,5715,23496,20067,9595,20336,24748,428),M0I=25125,R2=(105,29342,4239,29198,1426,25429,6783,116))
+    Primes(978)=(P=(6,68,169,220,128,194,179,54,69,36,48,6,139),M=(105,1675,18528,22804,5529,18444,5435,401),M0I=20189,R2=(105,5528,28383,21996,29775,25526,31075,158))
+    Primes(979)=(P=(5,34,101,47,127,56,50,232,133,41,128,85,33),M=(105,21793,21248,8724,16791,30707,19621,328),M0I=4383,R2=(105,10513,5890,12762,11774,2933,24109,294))
+    Primes(980)=(P=(15,69,48,39,221,178,172,235,117,60,208,57,245),M=(106,14837,31136,11732,5479,32219,9732,977),M0I=5539,R2=(106,25788,26412,11611,32355,24534,31359,470))
+    Primes(981)=(P=(10,175,93,73,142,239,158,130,19,130,217,61,99),M=(106,15715,1458,2126,31988,6382,27561,683),M0I=21429,R2=(106,25109,11227,2101,19253,11699,29315,140))
+    Primes(982)=(P=(11,142,251,231,235,172,198,229,102,152,184,242,109),M=(106,29293,12657,5530,26167,32442,24444,739),M0I=6299,R2=(106,17712,23295,23510,13851,6445,12208,491))
+    Primes(983)=(P=(14,234,43,213,75,255,184,0,96,252,123,54,241),M=(106,14065,30966,387,32192,21695,17786,954),M0I=1519,R2=(106,19746,21239,15446,18898,21819,21236,737))
+    Primes(984)=(P=(13,234,60,173,100,83,242,88,228,120,248,131,187),M=(106,955,29169,25489,8082,22085,18325,890),M0I=13965,R2=(106,4264,32341,13352,12184,30048,17643,567))
+    Primes(985)=(P=(8,69,216,246,183,118,27,183,155,136,83,102,147),M=(106,26259,4262,24174,12509,27511,15134,529),M0I=22629,R2=(106,19377,28202,12665,14418,982,31555,11))
+    Primes(986)=(P=(13,36,44,243,205,173,152,235,12,120,2,62,127),M=(106,15999,28676,11313,27847,15578,1438,841),M0I=32385,R2=(106,16915,11957,26467,3023,28353,14005,252))
+    Primes(987)=(P=(15,7,190,16,92,178,121,178,10,183,2,233,217),M=(106,27097,28165,18474,5069,1483,30658,961),M0I=31127,R2=(106,32578,20731,13264,10060,10253,27845,85))
+    Primes(988)=(P=(13,58,101,55,115,71,209,82,74,137,177,2,3),M=(106,515,4962,18730,16010,30516,19622,846),M0I=18261,R2=(106,28900,348,8936,3091,11418,23835,378))
+    Primes(989)=(P=(11,45,142,79,212,16,162,5,10,184,155,147,21),M=(106,4885,28983,5162,1296,32065,12745,715),M0I=23491,R2=(106,449,12048,24083,29965,32729,23490,685))
+    Primes(990)=(P=(30,171,139,8,151,131,188,171,42,188,96,166,65),M=(107,9793,30913,11434,7653,2424,29025,1962),M0I=5695,R2=(107,29341,15136,22769,15515,13435,15925,1019))
+    Primes(991)=(P=(30,153,6,93,35,253,192,206,115,99,117,154,181),M=(107,6837,18155,14797,28166,21055,8395,1958),M0I=31843,R2=(107,15728,9945,7273,31112,22238,11923,1105))
+    Primes(992)=(P=(26,200,26,43,236,222,155,94,76,200,131,89,133),M=(107,22917,4358,31027,29914,16077,837,1714),M0I=18611,R2=(107,7688,14303,13483,8899,30481,19327,69))
+    Primes(993)=(P=(21,22,45,67,253,116,45,132,46,219,120,220,7),M=(107,23559,14065,4283,8556,16343,17832,1349),M0I=11849,R2=(107,30,17334,22322,17827,32180,17088,1127))
+    Primes(994)=(P=(18,79,140,31,98,108,157,50,162,250,97,248,69),M=(107,30789,29891,19083,25833,30246,29059,1171),M0I=9587,R2=(107,11402,26763,18199,2105,21445,19930,676))
+    Primes(995)=(P=(23,156,84,243,174,136,115,244,197,62,129,204,115),M=(107,19571,32003,21268,17311,15080,2718,1511),M0I=18245,R2=(107,16199,30534,21712,6103,10905,3282,1450))
+    Primes(996)=(P=(30,158,154,65,127,73,164,3,141,164,245,99,43),M=(107,25387,18922,3638,19744,6132,21320,1959),M0I=15485,R2=(107,13685,28638,10788,549,21975,12100,1759))
+    Primes(997)=(P=(17,63,146,86,47,199,124,128,213,238,242,86,5),M=(107,22021,24036,855,15332,25340,29258,1103),M0I=31027,R2=(107,2104,12638,14936,21877,15077,17247,730))
+    Primes(998)=(P=(25,25,135,152,163,42,59,114,242,103,219,182,245),M=(107,14069,20407,19401,20955,2610,12531,1606),M0I=15011,R2=(107,28288,21873,26888,12969,5893,8278,375))
+    Primes(999)=(P=(21,218,81,44,199,189,183,186,41,52,109,234,91),M=(107,27227,26843,26788,28093,19579,18981,1398),M0I=18989,R2=(107,20454,12041,28929,6239,9791,23182,1129))
+    Primes(1000)=(P=(63,168,55,49,131,95,155,54,95,57,47,132,25),M=(108,1049,29279,22908,31961,6197,1766,4074),M0I=26583,R2=(108,11922,21549,24465,14905,6847,6822,3835))
+    Primes(1001)=(P=(63,38,199,45,38,111,71,199,90,101,219,190,239),M=(108,16111,19383,7529,31294,21094,22757,4041),M0I=20465,R2=(108,2319,7313,26115,20460,28229,14817,1247))
+    Primes(1002)=(P=(62,255,222,96,251,148,216,11,159,126,181,112,19),M=(108,28691,32106,11901,9920,4025,31692,4031),M0I=9701,R2=(108,25408,24841,13944,14626,32303,2503,3577))
+    Primes(1003)=(P=(60,19,187,17,73,176,210,202,201,80,62,128,203),M=(108,203,8317,11045,1686,5275,30562,3844),M0I=6941,R2=(108,3832,21352,27021,4391,2908,2745,12))
+    Primes(1004)=(P=(47,200,186,199,245,128,85,101,173,53,43,54,177),M=(108,14001,27222,5812,683,32600,5976,3058),M0I=11695,R2=(108,6293,30297,4961,14272,22847,30845,2301))
+    Primes(1005)=(P=(41,28,147,211,59,164,110,122,127,51,192,54,151),M=(108,13975,26496,27132,9075,13242,4730,2631),M0I=22233,R2=(108,1637,7874,28559,2609,1362,6559,2434))
+    Primes(1006)=(P=(41,35,66,252,165,61,76,226,209,192,42,8,105),M=(108,2153,84,2887,27239,19027,26719,2632),M0I=30759,R2=(108,7160,7292,20659,30618,20817,19028,1834))
+    Primes(1007)=(P=(55,18,80,231,242,246,52,247,57,235,236,6,111),M=(108,1647,22488,23783,12711,32559,18972,3524),M0I=26481,R2=(108,27779,32174,11180,17722,26572,5713,18))
+    Primes(1008)=(P=(60,133,200,254,105,123,136,226,227,168,87,45,253),M=(108,11773,20654,2958,23623,26263,14623,3873),M0I=26795,R2=(108,3567,30841,7287,17054,1397,27828,1849))
+    Primes(1009)=(P=(47,123,212,123,126,209,26,152,241,76,153,12,91),M=(108,3163,6450,25541,2260,14317,31375,3038),M0I=15405,R2=(108,3601,26796,32582,18770,6622,20411,1401))
+    Primes(1010)=(P=(84,41,184,23,168,232,161,6,98,111,187,145,113),M=(109,4465,24439,6537,17672,31374,14082,5386),M0I=28783,R2=(109,3366,27626,6398,28164,14719,32416,1631))
+    Primes(1011)=(P=(118,129,189,135,223,241,132,125,195,110,85,98,231),M=(109,25319,23722,30477,3107,32255,14256,7584),M0I=28457,R2=(109,18859,4255,6115,20717,20051,21545,3021))
+    Primes(1012)=(P=(121,50,227,45,192,159,127,208,62,143,119,170,55),M=(109,10807,7919,16634,31742,23561,23653,7756),M0I=21625,R2=(109,18657,16881,2936,16967,13783,23150,736))
+    Primes(1013)=(P=(86,245,102,54,140,45,58,118,225,210,25,137,27),M=(109,2331,9267,23431,27091,26818,11462,5565),M0I=22253,R2=(109,7496,18523,32133,12730,1510,30241,2271))
+    Primes(1014)=(P=(127,189,61,34,22,254,176,146,238,114,198,91,61),M=(109,23357,25996,19385,30084,8559,10148,8175),M0I=11243,R2=(109,29477,30849,9850,2627,32108,2071,1447))
+    Primes(1015)=(P=(67,120,85,150,165,94,126,230,43,234,147,221,209),M=(109,24017,21799,6319,29687,27221,2738,4318),M0I=25807,R2=(109,11489,5068,7105,16515,13609,1703,1257))
+    Primes(1016)=(P=(83,161,42,18,54,228,190,174,198,101,69,69,127),M=(109,17791,19082,15129,9717,9070,9538,5352),M0I=1409,R2=(109,19175,7263,27832,5538,7337,7795,1643))
+    Primes(1017)=(P=(102,184,19,26,50,195,15,163,46,125,213,195,141),M=(109,17293,31659,3257,6269,9004,611,6574),M0I=18619,R2=(109,16048,27039,23641,5200,7341,22768,2961))
+    Primes(1018)=(P=(73,42,17,149,43,102,162,95,26,137,205,67,249),M=(109,17401,5018,31850,13586,21174,16946,4682),M0I=29111,R2=(109,21421,8348,25120,16634,15656,5714,4403))
+    Primes(1019)=(P=(65,197,78,19,158,171,32,98,49,193,63,236,125),M=(109,27773,639,2247,22787,14826,10690,4209),M0I=4907,R2=(109,27488,3658,24009,10290,14788,265,327))
+    Primes(1020)=(P=(178,251,46,189,237,255,87,68,60,55,24,210,249),M=(110,21241,28209,4336,31418,24287,26071,11454),M0I=12471,R2=(110,21129,29624,15215,4068,4133,20813,4131))
+    Primes(1021)=(P=(200,50,9,140,92,118,76,240,170,21,82,207,253),M=(110,20477,10917,17064,12903,17863,16689,12812),M0I=31403,R2=(110,14833,9639,1827,24667,12839,30849,1283))
+    Primes(1022)=(P=(154,135,127,226,209,66,190,110,193,144,33,95,129),M=(110,24449,8258,15110,5619,11540,28668,9889),M0I=8063,R2=(110,23112,11724,8368,17544,13307,781,5109))
+    Primes(1023)=(P=(251,50,105,115,40,198,254,190,178,44,0,140,111),M=(110,3183,22529,31432,14325,12940,19758,16076),M0I=11633,R2=(110,1095,19374,18801,26565,14773,30396,13275))
+    Primes(1024)=(P=(215,222,131,165,248,11,164,188,208,171,251,16,177),M=(110,4273,22518,29506,23845,24448,20596,13815),M0I=18351,R2=(110,2782,5009,16973,26918,5584,32439,13264))
+    Primes(1025)=(P=(168,9,82,42,81,195,161,152,187,89,8,169,59),M=(110,10555,12817,25325,7436,9500,10821,10754),M0I=14349,R2=(110,22752,27624,1376,15947,23554,105,4891))
+    Primes(1026)=(P=(233,164,125,42,31,146,101,233,203,188,45,208,113),M=(110,20593,30811,10030,4911,8697,4005,14953),M0I=3951,R2=(110,5979,6407,29543,2258,31726,2966,10910))
+    Primes(1027)=(P=(133,103,166,122,25,203,66,233,114,147,22,212,51),M=(110,21555,9773,9674,23063,8604,29903,8537),M0I=14597,R2=(110,6778,1007,12980,14551,31037,7582,5031))
+    Primes(1028)=(P=(173,240,152,182,15,174,213,9,143,163,142,203,19),M=(110,19219,18205,9790,30376,24826,4886,11132),M0I=18661,R2=(110,3169,23179,27246,13380,9173,6221,8878))
+    Primes(1029)=(P=(211,74,217,0,152,171,124,66,178,134,175,62,235),M=(110,16107,3422,2762,23522,2442,23328,13522),M0I=1597,R2=(110,24004,16703,31347,22872,328,21007,12669))
+    Primes(1030)=(P=(1,172,236,73,169,164,149,173,248,168,227,220,131,1),M=(111,769,18361,25251,11631,6729,2357,27451,0),M0I=767,R2=(111,3545,14090,1174,1276,25631,10648,12247))
+    Primes(1031)=(P=(1,216,171,127,135,1,190,254,39,185,179,223,204,57),M=(111,19513,26559,7910,30705,28699,28656,30250,0),M0I=7671,R2=(111,2241,13957,14420,3456,28075,13548,9709))
+    Primes(1032)=(P=(1,178,110,166,137,201,201,97,147,122,46,103,188,5),M=(111,15365,23759,19944,19212,7324,21713,27803,0),M0I=20275,R2=(111,1102,9700,36,7444,29873,32709,15811))
+    Primes(1033)=(P=(1,181,154,157,196,54,178,88,231,173,127,193,108,21),M=(111,27669,32642,7861,4807,17259,21432,28006,0),M0I=31939,R2=(111,13937,5878,469,9016,12350,5106,14200))
+    Primes(1034)=(P=(1,221,44,195,108,21,8,46,137,76,113,56,10,105),M=(111,2665,25200,9521,16756,16720,6253,30539,0),M0I=23079,R2=(111,29518,5240,22900,16073,31262,20844,6229))
+    Primes(1035)=(P=(1,58,168,36,73,178,160,182,137,103,255,157,4,241),M=(111,1265,32570,9631,1460,6954,1161,20138,0),M0I=5103,R2=(111,12603,24584,21840,30087,9396,29993,10330))
+    Primes(1036)=(P=(1,103,113,224,230,133,226,235,11,199,194,80,127,141),M=(111,32653,1184,12063,5976,26718,15388,23004,0),M0I=9403,R2=(111,11899,27781,15165,25563,18657,19583,10991))
+    Primes(1037)=(P=(1,191,221,18,223,121,138,107,111,138,194,78,103,247),M=(111,26615,1180,15915,21339,30616,8795,28663,0),M0I=30265,R2=(111,13390,21573,22141,7603,13370,27258,28329))
+    Primes(1038)=(P=(1,183,95,91,6,237,74,55,162,85,185,12,174,237),M=(111,12013,29209,2390,20925,28372,27488,28119,0),M0I=8475,R2=(111,10151,4531,23999,28435,3482,4796,12270))
+    Primes(1039)=(P=(1,201,31,189,130,105,242,141,13,232,238,54,140,165),M=(111,3237,23661,14243,5224,9887,30640,29255,0),M0I=1235,R2=(111,3541,17821,11815,31454,25610,1694,11839))
+    Primes(1040)=(P=(3,212,30,85,38,5,198,28,141,18,139,164,3,225),M=(113,993,5960,13386,12516,24668,19108,29959,1),M0I=32735,R2=(113,31853,26705,4156,10305,12747,32658,19416,1))
+    Primes(1041)=(P=(2,138,56,239,154,187,98,21,153,238,205,146,32,165),M=(113,8357,6948,26555,4268,11190,7667,8846,1),M0I=14547,R2=(113,30558,4729,30046,19884,17384,15544,1417,0))
+    Primes(1042)=(P=(3,242,63,130,155,231,183,254,164,140,92,184,103,37),M=(113,26405,14704,4657,16373,15995,28755,31887,1),M0I=9043,R2=(113,29905,13800,15937,1134,10915,28557,2536,0))
+    Primes(1043)=(P=(3,249,56,162,199,53,65,222,86,81,96,158,211,83),M=(113,21331,16701,22853,3826,29524,5208,32334,1),M0I=5925,R2=(113,24021,9677,15944,1528,13343,4174,817,0))
+    Primes(1044)=(P=(3,86,220,42,190,80,31,43,157,205,31,230,99,171),M=(113,25515,16332,30516,31068,25857,1367,21943,1),M0I=253,R2=(113,17791,18686,10754,26988,24499,11374,19230,1))
+    Primes(1045)=(P=(2,55,140,39,156,44,5,184,142,206,5,197,3,41),M=(113,809,2954,15160,11716,17088,1267,3555,1),M0I=14055,R2=(113,28014,6487,502,29653,30279,17417,7105,0))
+    Primes(1046)=(P=(2,101,240,255,134,206,226,49,25,193,82,233,31,225),M=(113,8161,9682,26373,4488,27886,8176,6524,1),M0I=7135,R2=(113,19641,24708,9067,28990,14085,7413,4825,0))
+    Primes(1047)=(P=(2,137,213,137,80,89,90,156,49,50,114,206,66,133),M=(113,17029,26012,17609,21729,1429,12586,8821,1),M0I=6579,R2=(113,24000,12135,2726,31774,32464,5201,18858,0))
+    Primes(1048)=(P=(2,116,167,49,4,220,2,22,231,143,236,17,140,57),M=(113,3129,22563,7743,4279,19904,26144,7465,1),M0I=24055,R2=(113,27301,28210,8990,19556,28638,5630,6128,0))
+    Primes(1049)=(P=(3,81,133,99,237,41,52,181,157,186,10,73,217,107),M=(113,22891,5267,30440,9644,21139,11389,21601,1),M0I=29885,R2=(113,14852,12660,27956,28414,8110,27586,10215,1))
+    Primes(1050)=(P=(7,1,131,177,216,109,30,175,97,209,6,200,93,231),M=(114,24039,3472,1860,30075,1745,30267,16480,3),M0I=6697,R2=(114,14273,7581,26118,2569,13111,9537,12631,3))
+    Primes(1051)=(P=(5,171,99,98,81,116,56,112,239,146,243,81,235,141),M=(114,27533,26275,15947,17287,5955,27722,27352,2),M0I=12475,R2=(114,4074,8670,26118,5614,29386,2189,12992,1))
+    Primes(1052)=(P=(7,86,112,167,76,59,220,247,79,99,59,70,225,151),M=(114,24983,30349,15756,26554,17341,5353,21916,3),M0I=20953,R2=(114,5558,7223,18739,5987,3901,31824,21153,0))
+    Primes(1053)=(P=(6,187,101,166,82,158,104,166,15,7,241,138,107,183),M=(114,27575,25364,15391,17712,10726,13514,11993,3),M0I=7673,R2=(114,14024,16777,30083,91,16751,7133,22826,2))
+    Primes(1054)=(P=(7,3,189,104,38,29,104,92,9,212,65,80,39,53),M=(114,10037,672,10065,17120,25046,11524,16623,3),M0I=19683,R2=(114,4869,28291,24437,4896,614,4320,2404,0))
+    Primes(1055)=(P=(7,64,210,88,238,206,219,220,123,90,151,202,193,205),M=(114,16845,12181,28010,24291,27885,19229,20532,3),M0I=27899,R2=(114,28939,32616,26229,13469,4157,21671,16412,1))
+    Primes(1056)=(P=(6,87,74,174,215,168,2,89,142,172,202,197,236,77),M=(114,27725,5515,15027,4812,31360,21978,5586,3),M0I=21371,R2=(114,17388,29868,21064,2725,32661,17694,255,0))
+    Primes(1057)=(P=(4,152,37,44,58,96,244,129,133,6,138,10,194,73),M=(114,16969,5141,5146,9228,9743,9607,9737,2),M0I=12295,R2=(114,10602,30458,3570,1560,21556,16592,7828,0))
+    Primes(1058)=(P=(6,44,114,250,222,224,96,17,233,90,100,177,21,43),M=(114,5419,18786,9577,143,28166,24411,2844,3),M0I=32381,R2=(114,19234,15842,10955,1215,26006,9909,26706,2))
+    Primes(1059)=(P=(7,211,50,215,253,238,248,182,201,251,136,30,93,113),M=(114,23921,4156,10222,17846,24303,23295,29900,3),M0I=15471,R2=(114,4361,30360,9596,15274,12118,28919,29227,0))
+    Primes(1060)=(P=(9,53,246,216,53,227,161,13,47,252,128,116,242,41),M=(115,29225,233,16370,2153,24122,23302,19837,4),M0I=13799,R2=(115,19169,22701,8490,13000,10004,20239,17559,1))
+    Primes(1061)=(P=(14,194,83,202,45,84,49,98,127,178,75,94,4,5),M=(115,1029,5820,32457,2835,21827,31045,12436,7),M0I=22323,R2=(115,22212,4681,4250,8903,29369,18642,28136,6))
+    Primes(1062)=(P=(9,96,140,6,65,98,55,43,193,54,147,12,45,79),M=(115,11599,9752,1242,14686,5667,200,22563,4),M0I=13905,R2=(115,7500,29740,13860,16901,22086,19758,13925,3))
+    Primes(1063)=(P=(12,252,206,194,17,234,176,63,204,119,175,158,57,9),M=(115,14601,24380,12766,510,7851,22594,16179,6),M0I=23239,R2=(115,30403,20582,2580,15777,2102,31358,6399,1))
+    Primes(1064)=(P=(15,144,167,92,30,5,170,23,40,195,98,157,52,151),M=(115,13463,17722,8973,20665,24666,27523,25641,7),M0I=29913,R2=(115,15741,14557,9848,9669,25599,15384,9813,1))
+    Primes(1065)=(P=(11,247,115,91,50,36,83,152,206,208,190,65,241,77),M=(115,29005,31875,15170,7366,8773,27494,32220,5),M0I=20603,R2=(115,10114,5247,29533,10803,1739,6426,29225,2))
+    Primes(1066)=(P=(11,208,194,132,171,36,147,174,206,54,46,21,110,237),M=(115,28397,23594,14552,7542,12873,20629,29744,5),M0I=24859,R2=(115,914,8236,28046,17510,16979,22069,25918,3))
+    Primes(1067)=(P=(13,173,191,156,18,112,232,48,140,209,207,135,109,41),M=(115,27945,7950,13127,16772,9998,29570,27503,6),M0I=231,R2=(115,6308,3851,5722,29099,1620,5464,26559,1))
+    Primes(1068)=(P=(11,72,131,224,195,81,0,73,91,189,100,66,9,131),M=(115,2435,18564,28405,586,13584,31768,21024,5),M0I=13013,R2=(115,15440,20398,8670,22863,3054,21210,20281,2))
+    Primes(1069)=(P=(12,39,215,149,9,233,114,82,180,153,189,230,201,1),M=(115,18689,31693,21094,4757,7831,29345,2549,6),M0I=18687,R2=(115,5520,5218,12495,11070,4470,26923,9328,5))
+    Primes(1070)=(P=(23,213,44,78,217,141,239,255,224,81,167,31,246,133),M=(116,30341,20031,326,32767,6366,2523,30027,11),M0I=28083,R2=(116,3674,11736,5780,3314,15763,18797,16543,4))
+    Primes(1071)=(P=(26,38,74,142,249,105,244,43,156,119,105,56,23,13),M=(116,5901,21104,29149,8540,5791,20959,2450,13),M0I=28731,R2=(116,26633,6585,1053,27307,8597,16616,20278,5))
+    Primes(1072)=(P=(24,226,37,103,232,192,206,142,8,24,215,173,142,113),M=(116,3697,12123,8291,29808,3084,11517,14473,12),M0I=3439,R2=(116,31908,21125,32223,23165,32143,21736,24224,4))
+    Primes(1073)=(P=(26,244,121,95,7,9,44,233,243,138,138,242,129,175),M=(116,431,5605,20010,26447,28818,11232,15646,13),M0I=2737,R2=(116,27759,1132,10094,4922,18038,31781,15389,5))
+    Primes(1074)=(P=(24,233,123,253,121,159,195,13,31,127,30,174,57,19),M=(116,14611,15708,32252,6248,6652,32687,14942,12),M0I=1765,R2=(116,8202,4192,15910,25514,14899,12493,4376,0))
+    Primes(1075)=(P=(18,50,124,71,251,118,113,131,191,192,7,220,161,215),M=(116,8663,4025,32512,3101,14183,2303,3231,9),M0I=7705,R2=(116,22045,24942,22399,5794,27710,30444,1268,1))
+    Primes(1076)=(P=(24,91,74,170,191,97,0,195,99,183,134,126,54,85),M=(116,13909,3324,3806,1563,30224,21847,5842,12),M0I=26883,R2=(116,27232,9773,12862,12843,10772,19584,29400,5))
+    Primes(1077)=(P=(21,47,62,206,188,122,162,19,243,118,138,186,197,105),M=(116,17769,5493,19930,4255,18346,22999,19407,10),M0I=25895,R2=(116,8687,4404,31428,14537,1753,13748,14949,3))
+    Primes(1078)=(P=(17,236,226,224,211,158,158,39,4,109,58,188,39,185),M=(116,10169,30072,4532,28984,14825,23578,31544,8),M0I=20855,R2=(116,779,22236,26614,1527,20156,6147,422,1))
+    Primes(1079)=(P=(26,81,76,89,73,112,98,56,89,56,239,94,151,61),M=(116,5949,24253,25827,4546,5894,2857,5203,13),M0I=2027,R2=(116,4046,27754,7633,16067,7605,1103,25583,9))
+    Primes(1080)=(P=(32,14,40,65,35,42,191,202,162,246,92,33,236,171),M=(117,27819,14403,3033,32341,12971,2084,906,16),M0I=20989,R2=(117,1215,24562,26888,31558,4258,30700,30782,3))
+    Primes(1081)=(P=(55,117,87,250,54,54,72,135,64,207,9,239,102,53),M=(117,26165,5086,828,17466,25444,32582,23893,27),M0I=17379,R2=(117,20996,4143,21759,1619,5882,6171,18691,8))
+    Primes(1082)=(P=(45,193,32,25,203,55,46,13,20,11,179,249,45,25),M=(117,11545,26610,20526,28776,13170,825,28744,22),M0I=8407,R2=(117,31093,7458,11010,2482,23440,1497,30877,18))
+    Primes(1083)=(P=(62,71,255,209,193,14,154,8,31,84,66,131,150,65),M=(117,5697,1287,32081,20544,4329,31288,4607,31),M0I=1599,R2=(117,18655,2322,14879,27999,20137,29195,2818,6))
+    Primes(1084)=(P=(37,90,5,119,129,128,210,186,50,174,108,216,183,149),M=(117,14229,22961,19129,5585,6157,12016,22145,18),M0I=9283,R2=(117,30289,4414,9998,8990,15083,23109,13201,3))
+    Primes(1085)=(P=(36,116,248,159,104,1,205,103,152,96,163,121,132,205),M=(117,1229,18163,24962,27452,28,5101,7486,18),M0I=30715,R2=(117,19399,15185,6624,30079,12626,25464,2768,11))
+    Primes(1086)=(P=(36,197,110,198,16,93,175,224,84,219,191,70,6,233),M=(117,1769,32396,21358,32514,1498,22722,12635,18),M0I=20135,R2=(117,13424,2190,6164,14096,15032,6779,5537,1))
+    Primes(1087)=(P=(38,67,113,48,91,166,112,28,229,235,246,35,40,5),M=(117,10245,27718,6063,231,14951,9739,4316,19),M0I=6963,R2=(117,30069,31227,11340,10978,23222,28809,9800,17))
+    Primes(1088)=(P=(44,99,17,142,249,143,44,55,48,67,120,81,171,249),M=(117,11257,28835,16653,25017,6386,12767,6340,22),M0I=22967,R2=(117,23311,30897,18242,4229,19318,2918,27595,19))
+    Primes(1089)=(P=(35,122,243,23,248,59,207,68,67,125,30,206,50,21),M=(117,12821,15772,3572,31266,956,25343,24252,17),M0I=29379,R2=(117,18130,31752,22818,32536,28174,3470,10676,4))
+    Primes(1090)=(P=(90,230,151,17,25,103,71,13,111,143,188,17,10,155),M=(118,2715,30754,15934,14443,5748,25123,14757,45),M0I=13421,R2=(118,10061,5623,19307,4778,6025,16391,28731,30))
+    Primes(1091)=(P=(81,170,56,160,129,16,64,176,157,72,81,141,166,83),M=(118,9811,8987,29985,1412,4356,5136,27278,40),M0I=29221,R2=(118,13876,29880,1619,24040,31040,18980,14736,1))
+    Primes(1092)=(P=(127,3,194,245,96,244,31,10,86,106,127,58,194,103),M=(118,16999,32373,22953,30802,3905,24236,16624,63),M0I=18089,R2=(118,7232,13886,5509,31474,21824,18570,121,51))
+    Primes(1093)=(P=(111,241,233,26,91,223,1,255,195,91,77,28,250,249),M=(118,31481,6713,3437,4094,15856,9035,31866,55),M0I=22711,R2=(118,9124,23906,5782,12653,31562,23425,11186,20))
+    Primes(1094)=(P=(79,154,21,96,177,233,21,237,227,153,129,108,239,87),M=(118,28503,729,3686,12143,7825,11286,26245,39),M0I=5017,R2=(118,6965,28931,31828,25172,26908,8490,19376,31))
+    Primes(1095)=(P=(114,76,226,108,253,193,210,254,163,134,179,126,242,213),M=(118,29397,26365,3610,6133,23581,19871,4920,57),M0I=18819,R2=(118,470,3605,27552,22943,32049,3873,4427,54))
+    Primes(1096)=(P=(79,14,201,190,97,5,37,63,33,93,30,79,0,157),M=(118,157,15518,1396,10745,4178,14284,17330,39),M0I=31307,R2=(118,8709,24366,37,2489,5367,26239,13534,2))
+    Primes(1097)=(P=(84,108,224,221,130,222,162,77,176,18,176,127,132,161),M=(118,1185,24831,16458,4717,11754,7088,6968,42),M0I=8351,R2=(118,25468,31335,28391,10992,28673,14305,28264,17))
+    Primes(1098)=(P=(97,232,4,192,133,145,147,58,219,213,96,115,48,219),M=(118,12507,16614,28501,6614,22809,6160,31233,48),M0I=13485,R2=(118,18592,14398,22605,32644,28538,23929,32170,12))
+    Primes(1099)=(P=(112,133,147,44,213,91,145,6,55,11,3,1,221,97),M=(118,23905,1539,23596,2097,21945,26010,8548,56),M0I=31071,R2=(118,9798,25351,21907,17425,25164,14997,20818,52))
+    Primes(1100)=(P=(228,134,94,100,65,76,98,193,201,81,110,103,128,185),M=(119,185,23759,9541,5646,5318,19592,8599,114),M0I=31351,R2=(119,2506,1228,30361,21334,31281,1245,31755,36))
+    Primes(1101)=(P=(168,151,50,187,112,189,21,158,135,70,157,3,1,99),M=(119,355,14854,7450,11508,3025,22382,9676,84),M0I=30645,R2=(119,8420,6337,4748,22272,22094,29923,485,0))
+    Primes(1102)=(P=(248,88,96,21,79,113,232,124,164,103,120,28,34,39),M=(119,8743,28728,4509,17381,30494,681,5656,124),M0I=21097,R2=(119,20792,25058,2747,27420,15006,22844,26350,93))
+    Primes(1103)=(P=(156,120,223,140,245,215,82,117,210,252,5,79,219,153),M=(119,23449,2719,19440,5038,23925,29086,7735,78),M0I=14167,R2=(119,21710,13708,27379,6830,1214,10454,6892,30))
+    Primes(1104)=(P=(181,53,170,132,140,172,232,27,113,202,99,254,144,233),M=(119,4329,18429,18217,16603,19150,20625,19818,90),M0I=14503,R2=(119,6652,6395,1682,24520,22769,12630,6055,60))
+    Primes(1105)=(P=(221,72,174,167,98,209,86,246,143,94,141,12,213,201),M=(119,21961,6681,15738,14260,11541,21740,21035,110),M0I=11143,R2=(119,5023,500,12134,21534,30891,19820,26094,87))
+    Primes(1106)=(P=(249,226,24,205,7,45,66,165,90,101,14,179,64,151),M=(119,16535,7526,27028,5418,29396,6560,30854,124),M0I=16601,R2=(119,17085,23467,19567,3011,24812,30997,13008,109))
+    Primes(1107)=(P=(226,202,164,224,228,85,108,224,84,21,253,227,121,169),M=(119,31145,31686,20567,26370,17750,7196,12969,113),M0I=17767,R2=(119,8734,19087,10369,21678,28289,512,18269,108))
+    Primes(1108)=(P=(193,12,129,4,234,146,78,134,97,103,82,131,100,143),M=(119,25743,9478,1437,29747,10532,8349,17184,96),M0I=17809,R2=(119,32064,4202,17934,28387,22954,26806,21097,83))
+    Primes(1109)=(P=(176,167,221,233,14,185,26,81,60,100,55,115,93,11),M=(119,23819,28390,29072,21129,27537,15649,10743,88),M0I=31069,R2=(119,24901,30513,18153,11927,29016,6361,245,12))
+    Primes(1110)=(P=(1,162,243,177,55,151,42,108,28,184,244,149,235,228,197),M=(120,25797,11223,25554,24805,29350,9970,15596,209),M0I=1523,R2=(120,15780,7549,31228,8214,12577,11763,27378,171))
+    Primes(1111)=(P=(1,168,193,136,255,41,98,58,121,245,91,246,156,142,147),M=(120,3731,27961,21871,21455,5667,8165,12386,212),M0I=16485,R2=(120,26228,12746,31782,32272,8824,9561,31235,61))
+    Primes(1112)=(P=(1,185,239,61,78,197,193,237,204,82,47,207,30,69,181),M=(120,17845,7740,18623,28258,23582,10712,31695,220),M0I=16227,R2=(120,26360,11906,4398,32116,10978,5729,16372,157))
+    Primes(1113)=(P=(1,93,186,98,128,159,176,76,37,111,52,222,215,140,33),M=(120,3105,15791,15571,24875,31492,20499,28312,174),M0I=2079,R2=(120,15635,23108,11302,11894,26624,29552,29301,172))
+    Primes(1114)=(P=(1,67,243,207,91,197,228,144,39,97,191,117,51,221,205),M=(120,24013,27239,1789,315,24137,27512,31987,161),M0I=10491,R2=(120,27297,28588,10099,29338,18254,7744,2412,149))
+    Primes(1115)=(P=(1,50,188,157,247,89,56,221,168,38,144,118,127,14,163),M=(120,3747,27902,6721,27969,5005,16107,12071,153),M0I=27381,R2=(120,2213,17224,25758,29462,31972,20148,16041,33))
+    Primes(1116)=(P=(1,31,7,49,234,147,101,165,45,153,77,135,40,157,105),M=(120,7529,3665,25910,10604,13914,15698,16844,143),M0I=15655,R2=(120,21184,16164,13123,20055,30719,12862,28936,91))
+    Primes(1117)=(P=(1,3,237,136,95,128,143,45,2,239,83,132,165,76,179),M=(120,19635,2378,15694,26647,2290,3056,31586,129),M0I=15749,R2=(120,28916,27207,7630,10694,441,28116,18312,113))
+    Primes(1118)=(P=(1,219,244,214,149,76,217,3,194,60,77,74,134,12,25),M=(120,3097,5388,28981,7697,19856,21161,32053,237),M0I=28631,R2=(120,1726,505,7895,3338,20271,17923,12745,208))
+    Primes(1119)=(P=(1,180,222,16,174,176,144,163,163,42,131,28,18,32,161),M=(120,8353,14372,10764,7449,2314,5590,14212,218),M0I=15519,R2=(120,5155,1889,1914,6497,18079,27159,22353,91))
+    Primes(1120)=(P=(3,107,224,251,200,254,139,153,85,165,217,86,145,94,225),M=(121,24289,11554,5989,19117,26809,31007,30782,437),M0I=6879,R2=(121,12758,14154,16454,23665,6311,14123,18104,202))
+    Primes(1121)=(P=(2,40,251,45,114,229,11,181,85,104,40,86,135,109,205),M=(121,28109,11534,8353,10923,20667,11868,16075,276),M0I=14587,R2=(121,25161,4334,16889,18952,25683,28792,12055,112))
+    Primes(1122)=(P=(3,102,3,234,99,93,24,231,40,253,190,40,155,125,107),M=(121,32107,20790,30456,14663,20878,19563,250,435),M0I=14525,R2=(121,24562,20092,23037,13455,14635,5493,25841,434))
+    Primes(1123)=(P=(2,168,100,102,3,105,147,141,129,6,94,145,235,22,67),M=(121,5699,9174,6522,27656,6456,16493,6425,340),M0I=6549,R2=(121,8918,10939,11635,18673,32049,7492,31218,119))
+    Primes(1124)=(P=(3,140,38,43,249,118,245,120,103,44,150,121,199,29,155),M=(121,7579,29582,12889,17209,28503,32558,2442,454),M0I=32621,R2=(121,8225,16171,20950,9491,20801,17400,938,270))
+    Primes(1125)=(P=(3,147,249,44,80,149,239,3,53,136,247,119,150,29,13),M=(121,7437,28460,9181,6572,24304,2578,32331,457),M0I=1595,R2=(121,26621,2522,32210,1669,29559,18667,4131,234))
+    Primes(1126)=(P=(2,111,41,215,55,113,167,253,189,64,255,239,66,199,247),M=(121,18423,24197,1023,28138,6783,26350,19061,311),M0I=22073,R2=(121,15292,16256,3917,25833,223,3853,23906,272))
+    Primes(1127)=(P=(2,19,211,81,211,156,23,198,82,129,141,133,92,232,241),M=(121,26865,2745,1590,12948,16764,14963,29908,265),M0I=30703,R2=(121,11871,27095,20324,27137,27278,715,26428,265))
+    Primes(1128)=(P=(2,252,173,201,22,88,27,208,134,229,128,93,105,244,195),M=(121,29891,15059,5633,1079,445,8907,11122,382),M0I=9237,R2=(121,14040,8381,27241,3040,6384,14550,18351,183))
+    Primes(1129)=(P=(2,147,76,7,67,176,18,37,43,145,221,135,161,239,237),M=(121,28653,3907,18294,10588,290,26742,21249,329),M0I=14875,R2=(121,23119,14346,25516,29269,22262,8560,9740,329))
+    Primes(1130)=(P=(5,219,171,82,209,169,87,165,128,36,4,153,190,212,233),M=(122,21737,13181,4114,11265,5498,23093,27348,749),M0I=15527,R2=(122,11106,12376,15973,22367,5462,14791,27190,20))
+    Primes(1131)=(P=(6,110,195,90,37,32,127,245,108,207,196,106,41,79,193),M=(122,20417,21586,16145,11110,2047,17572,12502,823),M0I=16319,R2=(122,12451,4539,32377,30536,9220,22087,31054,323))
+    Primes(1132)=(P=(7,107,139,175,179,109,162,81,201,21,214,86,27,30,149),M=(122,7829,11318,22361,3656,23077,30317,25323,949),M0I=17219,R2=(122,32463,14070,5949,23679,22271,25496,24735,358))
+    Primes(1133)=(P=(4,106,156,10,186,157,90,12,216,236,114,211,103,207,161),M=(122,20385,9935,12747,26311,21920,22355,9986,565),M0I=11167,R2=(122,29256,10464,7282,805,28610,29613,526,530))
+    Primes(1134)=(P=(5,57,123,14,218,85,88,162,229,33,117,193,197,201,59),M=(122,18747,907,1495,5929,21898,23370,24259,668),M0I=22541,R2=(122,3055,14800,10130,6125,27115,6008,25027,423))
+    Primes(1135)=(P=(5,47,40,14,51,3,12,238,177,22,115,86,216,11,41),M=(122,2857,11696,22989,30088,12494,18016,18947,663),M0I=16103,R2=(122,28679,13823,20417,6666,21551,21899,4018,572))
+    Primes(1136)=(P=(5,194,211,65,61,209,106,94,67,249,76,85,85,61,155),M=(122,15771,10922,25905,29215,5797,10170,13520,737),M0I=8045,R2=(122,3775,28142,31380,13843,29149,11764,5866,424))
+    Primes(1137)=(P=(4,50,97,108,169,187,65,66,57,71,189,203,79,234,25),M=(122,27161,5791,7927,4554,13332,5431,6235,537),M0I=11735,R2=(122,17798,27719,29684,16865,18664,20344,2417,97))
+    Primes(1138)=(P=(6,114,9,175,201,163,221,120,120,190,80,221,221,68,27),M=(122,17435,15290,31043,17349,15831,31028,619,825),M0I=2541,R2=(122,29682,7523,29148,32148,12933,28766,29660,227))
+    Primes(1139)=(P=(6,228,234,58,194,244,1,120,250,247,116,53,105,137,213),M=(122,2517,27347,24016,18391,16407,22622,14990,882),M0I=6275,R2=(122,15048,24744,17883,28948,23788,22067,24315,215))
+    Primes(1140)=(P=(10,111,250,197,71,81,58,76,91,193,215,181,222,95,145),M=(123,24465,27580,1886,25310,5028,10474,32433,1335),M0I=16015,R2=(123,3117,8336,11991,16456,15902,22081,1922,42))
+    Primes(1141)=(P=(8,52,126,235,140,145,4,67,2,39,140,42,122,101,251),M=(123,26107,21748,7728,6161,4164,29074,8122,1050),M0I=8909,R2=(123,10145,2503,17422,6397,5269,16502,30901,888))
+    Primes(1142)=(P=(9,18,150,240,240,207,167,207,87,213,47,183,243,125,47),M=(123,32047,28646,21694,31422,31356,7705,9660,1161),M0I=5681,R2=(123,32317,22976,29866,14756,13288,2468,2285,813))
+    Primes(1143)=(P=(14,71,130,202,248,204,126,2,10,87,30,84,210,137,133),M=(123,2437,10661,23673,4178,18400,24345,24754,1827),M0I=30899,R2=(123,478,19419,15525,18719,24132,3835,32261,1140))
+    Primes(1144)=(P=(14,85,161,161,13,12,18,8,194,47,149,251,166,169,141),M=(123,10637,30541,15959,17937,16672,8609,26728,1834),M0I=16059,R2=(123,12300,9717,18544,29830,7081,23080,4883,1705))
+    Primes(1145)=(P=(9,76,234,171,220,3,72,253,14,233,65,137,110,42,183),M=(123,10935,4828,9478,26743,13455,31616,15018,1190),M0I=11513,R2=(123,29346,21087,6342,19449,7111,26248,27676,775))
+    Primes(1146)=(P=(13,83,173,32,133,157,38,220,141,36,8,209,226,181,89),M=(123,13657,9157,4131,25705,21101,4275,27464,1705),M0I=15639,R2=(123,10606,28553,25793,11649,3375,3793,13198,1544))
+    Primes(1147)=(P=(15,249,150,59,175,197,4,75,87,254,140,197,128,30,87),M=(123,7767,2816,31283,23231,20548,30200,25998,2044),M0I=21145,R2=(123,29776,21143,2272,5002,22704,29199,28413,1843))
+    Primes(1148)=(P=(15,193,129,225,229,149,18,189,50,254,123,28,243,195,163),M=(123,17315,14823,31212,27031,20779,15538,24696,2016),M0I=30709,R2=(123,27930,1858,2028,28933,4442,17967,4670,679))
+    Primes(1149)=(P=(15,75,208,145,187,119,208,237,127,79,88,239,140,140,37),M=(123,3109,24345,15715,27642,32014,14190,29732,1957),M0I=20563,R2=(123,32471,27806,31662,5410,8821,2008,21570,1332))
+    Primes(1150)=(P=(22,203,156,96,177,84,208,67,64,233,143,0,26,175,73),M=(124,12105,53,9788,6663,19716,5674,26392,2917),M0I=3335,R2=(124,22998,17568,560,21536,25213,23938,25659,2221))
+    Primes(1151)=(P=(21,46,253,154,228,66,87,23,25,8,235,27,217,18,85),M=(124,4693,14258,9132,14536,9585,23688,16230,2711),M0I=9475,R2=(124,28216,3379,22986,13754,10804,3604,9891,437))
+    Primes(1152)=(P=(18,68,132,247,32,240,241,170,204,17,51,50,152,139,133),M=(124,2949,25905,17612,22112,3866,25630,8509,2338),M0I=19123,R2=(124,9320,15106,13785,7455,20179,18396,27140,885))
+    Primes(1153)=(P=(29,18,162,254,45,189,72,111,132,204,112,73,85,27,199),M=(124,7111,4778,12737,31782,21638,17847,10431,3721),M0I=18953,R2=(124,1250,4551,2406,7056,5286,9687,25158,17))
+    Primes(1154)=(P=(21,232,172,14,2,129,232,23,25,238,161,139,214,124,247),M=(124,31991,6060,14982,14543,7809,16464,11011,2804),M0I=31545,R2=(124,14149,18131,7634,26691,32703,17545,28218,1302))
+    Primes(1155)=(P=(29,25,23,118,187,215,43,225,227,22,157,87,25,222,109),M=(124,24173,11827,23157,3864,29374,22394,17885,3724),M0I=9371,R2=(124,13620,1834,233,25705,8291,5158,21829,1910))
+    Primes(1156)=(P=(31,241,216,194,246,199,190,155,174,145,180,62,184,239,123),M=(124,28539,32113,18128,23924,31721,24280,30256,4088),M0I=26701,R2=(124,28612,14076,7336,9704,12409,23151,20929,2603))
+    Primes(1157)=(P=(27,102,152,168,234,84,72,240,138,187,101,131,197,210,209),M=(124,21201,1931,28054,1109,17551,7498,9770,3507),M0I=14799,R2=(124,26874,17618,27066,13273,2119,19556,15656,1041))
+    Primes(1158)=(P=(16,80,191,5,116,10,100,88,216,74,93,245,215,186,127),M=(124,14975,27567,10615,18114,9797,11905,12225,2088),M0I=31361,R2=(124,15758,14032,2656,30263,24936,24856,26820,1843))
+    Primes(1159)=(P=(28,115,221,147,142,166,44,175,102,159,8,181,224,206,145),M=(124,20113,27585,31778,31540,25290,29140,30564,3641),M0I=19855,R2=(124,6384,18281,5732,23180,15189,15817,28508,779))
+    Primes(1160)=(P=(40,247,103,185,94,154,224,12,250,244,113,228,139,25,25),M=(125,6425,18710,20935,26583,11776,11219,23022,5243),M0I=19671,R2=(125,19497,6014,20114,30740,26889,74,25553,607))
+    Primes(1161)=(P=(43,162,38,231,57,94,55,65,123,39,140,158,245,35,131),M=(125,9091,15850,7730,3033,25460,26411,2489,5585),M0I=31957,R2=(125,12670,12391,23467,13459,8122,32516,3306,445))
+    Primes(1162)=(P=(33,33,88,130,214,86,144,95,111,45,3,63,157,119,237),M=(125,30701,32570,13324,31609,26885,23242,22048,4240),M0I=539,R2=(125,28892,2062,13784,3010,9704,26203,10161,97))
+    Primes(1163)=(P=(38,82,152,69,122,8,16,222,234,194,0,182,38,28,57),M=(125,7225,27724,2050,30550,269,12097,9745,4905),M0I=28151,R2=(125,2718,4516,11072,2287,8543,7147,7243,3704))
+    Primes(1164)=(P=(57,58,244,84,113,130,157,55,118,255,47,12,200,212,161),M=(125,21665,6545,31932,15287,10707,3632,15637,7325),M0I=28831,R2=(125,20817,243,28018,12768,3792,22028,15296,873))
+    Primes(1165)=(P=(38,242,238,188,42,136,106,232,151,92,121,224,92,101,35),M=(125,25891,16568,29159,17594,1710,1361,15279,4985),M0I=3445,R2=(125,12395,2663,6022,2468,20691,13020,32296,1547))
+    Primes(1166)=(P=(63,114,31,84,135,29,200,230,42,129,81,71,221,149,73),M=(125,5449,4027,1349,12628,23694,4323,2005,8121),M0I=4871,R2=(125,14835,810,17965,1409,30028,178,4064,3986))
+    Primes(1167)=(P=(37,0,80,99,176,96,167,172,198,179,39,237,58,230,193),M=(125,26305,23157,19615,26165,2682,30220,5144,4736),M0I=22207,R2=(125,16235,13235,19694,16273,11632,26451,11857,3007))
+    Primes(1168)=(P=(52,163,168,150,168,194,31,197,105,116,61,118,29,173,109),M=(125,11629,27707,20725,11083,8700,21784,27173,6737),M0I=7067,R2=(125,27081,5150,15852,25170,14576,8631,13955,3176))
+    Primes(1169)=(P=(55,122,101,55,255,177,81,187,184,151,52,142,133,226,193),M=(125,25281,7435,23762,24004,5403,32758,6477,7101),M0I=21183,R2=(125,12188,28111,11014,2254,15744,22208,14170,2360))
+    Primes(1170)=(P=(83,96,192,139,177,99,44,45,55,45,71,100,146,37,137),M=(126,9609,18724,13597,27065,12994,30252,12322,10672),M0I=8007,R2=(126,26354,32500,13360,26490,29523,21550,11424,5273))
+    Primes(1171)=(P=(74,126,127,34,49,202,19,225,13,223,71,205,35,234,87),M=(126,27223,6727,32031,2158,8510,17977,8136,9535),M0I=24217,R2=(126,12522,18936,7096,6352,7918,1237,17990,966))
+    Primes(1172)=(P=(73,222,186,187,48,216,56,96,160,27,34,160,48,36,249),M=(126,9465,16480,27786,1280,902,26139,11950,9455),M0I=8887,R2=(126,18519,20121,2544,7203,24932,8906,6613,1095))
+    Primes(1173)=(P=(77,226,136,118,184,11,238,70,161,205,93,201,217,119,93),M=(126,30557,5042,13687,13582,16100,22273,8733,9969),M0I=27403,R2=(126,25906,25814,633,9922,24080,29163,5006,159))
+    Primes(1174)=(P=(126,219,19,157,113,171,208,14,214,208,124,198,134,163,19),M=(126,8979,3341,16883,30390,15616,11829,17639,16237),M0I=24805,R2=(126,30528,9704,14914,7523,22913,23227,6902,7923))
+    Primes(1175)=(P=(116,61,159,66,123,90,156,217,217,156,104,127,79,101,195),M=(126,26051,32414,29089,20172,10701,20331,26576,14878),M0I=19733,R2=(126,14444,20456,11298,8293,26265,23210,9535,4470))
+    Primes(1176)=(P=(103,230,148,139,153,3,234,252,96,71,198,87,111,166,221),M=(126,9949,11999,7961,25346,16047,29472,9506,13299),M0I=7819,R2=(126,2034,11046,21318,8559,185,18526,31727,10517))
+    Primes(1177)=(P=(125,50,97,107,52,91,224,59,16,190,35,164,19,14,121),M=(126,3705,18470,30862,22661,15875,26251,6234,16025),M0I=1079,R2=(126,24020,3042,26986,25535,19905,10507,28778,1956))
+    Primes(1178)=(P=(93,56,185,7,131,240,209,14,168,39,73,197,98,89,5),M=(126,22789,2756,7463,30017,3344,28798,11841,11932),M0I=29747,R2=(126,5875,2391,12522,4028,7380,16258,3388,7419))
+    Primes(1179)=(P=(104,167,64,93,114,240,172,213,6,56,173,248,218,43,7),M=(126,11015,29108,25271,10289,2765,11870,20503,13395),M0I=11593,R2=(126,633,14829,10703,17010,997,27015,13841,1049))
+    Primes(1180)=(P=(191,39,92,59,2,0,138,206,102,236,83,221,252,44,181),M=(127,11445,15352,12623,29495,2220,24640,22286,24467),M0I=7779,R2=(127,26436,27400,8355,4209,27825,11659,28621,11583))
+    Primes(1181)=(P=(204,58,44,180,173,60,243,220,1,34,242,11,110,209,67),M=(127,20803,5853,3016,24585,20285,5543,2861,26141),M0I=15509,R2=(127,5848,11559,20176,23994,25831,20226,20682,24684))
+    Primes(1182)=(P=(227,127,192,130,20,128,246,192,185,82,236,133,12,7,137),M=(127,1929,2584,19378,1482,3948,17040,28704,29119),M0I=24903,R2=(127,15984,4267,3528,32233,21632,18069,29752,13521))
+    Primes(1183)=(P=(144,220,134,189,128,206,238,52,70,91,239,246,5,189,65),M=(127,15681,27659,28607,8754,28387,12313,8623,18542),M0I=11583,R2=(127,4047,138,28689,24844,1477,11618,10213,15843))
+    Primes(1184)=(P=(175,67,148,158,244,129,125,174,105,68,203,185,228,198,197),M=(127,18117,29641,4910,29514,6106,24208,25895,22433),M0I=14323,R2=(127,21097,17696,9874,13323,29959,1131,30147,19834))
+    Primes(1185)=(P=(178,18,148,76,65,182,240,114,66,172,208,123,120,245,39),M=(127,29991,30449,13121,4629,28423,2102,9491,22793),M0I=21865,R2=(127,8452,12251,3068,21768,26952,29918,32579,6920))
+    Primes(1186)=(P=(145,80,69,69,26,247,106,246,13,85,124,106,115,120,137),M=(127,30857,21734,22001,12394,30383,9054,4433,18600),M0I=583,R2=(127,10189,27254,28248,15951,17276,6628,18969,11997))
+    Primes(1187)=(P=(138,78,128,89,241,104,92,135,93,230,12,194,119,172,247),M=(127,11511,1263,6195,15087,1480,15917,8214,17703),M0I=11065,R2=(127,1200,964,7912,9629,27561,17913,26864,13440))
+    Primes(1188)=(P=(132,222,203,132,93,213,137,190,110,2,15,73,45,93,133),M=(127,23941,4698,2109,29552,22683,3002,13025,17007),M0I=27827,R2=(127,11357,10159,13986,28488,16961,32764,27147,183))
+    Primes(1189)=(P=(199,238,69,155,204,131,30,17,201,61,247,40,155,202,237),M=(127,19181,20791,30684,3657,12769,31120,4454,25591),M0I=23835,R2=(127,18794,18998,22750,15107,21878,31912,24803,19254))
+    Primes(1190)=(P=(1,183,111,34,212,6,207,162,60,240,202,178,242,57,204,29),M=(129,19485,25715,10955,26502,31267,217,18613,23479,1),M0I=10699,R2=(129,26517,1585,4850,31778,29379,6583,1867,16469,0))
+    Primes(1191)=(P=(1,233,250,179,245,115,62,133,166,93,242,166,75,182,3,77),M=(129,845,5996,19097,13039,26714,11879,11517,29949,1),M0I=4731,R2=(129,15759,8746,3485,2348,19527,18463,24157,5172,1))
+    Primes(1192)=(P=(1,174,144,50,67,183,91,193,196,239,223,211,76,128,250,67),M=(129,31299,6401,32589,10110,15388,30443,3216,22344,1),M0I=23957,R2=(129,26609,25089,31763,3505,14027,18692,19170,14453,0))
+    Primes(1193)=(P=(1,125,10,226,134,110,120,33,212,159,188,159,244,7,146,99),M=(129,4707,26639,29311,9469,541,19919,14497,16005,1),M0I=181,R2=(129,7736,24517,26752,18278,30513,23259,26319,23511,0))
+    Primes(1194)=(P=(1,116,218,41,99,158,35,88,25,197,195,229,230,55,35,215),M=(129,9175,19566,3991,20014,13697,29636,2648,14957,1),M0I=25,R2=(129,31931,11587,14723,10567,16741,19631,20645,15603,0))
+    Primes(1195)=(P=(1,16,118,105,47,127,128,156,213,61,47,233,15,10,174,225),M=(129,12001,7701,16292,10729,2509,28656,6731,2107,1),M0I=27359,R2=(129,32196,31051,15635,31228,3807,13874,11799,19601,0))
+    Primes(1196)=(P=(1,95,69,246,123,209,42,254,194,117,212,99,142,189,188,161),M=(129,15521,7547,20878,5038,12268,31269,32158,12194,1),M0I=22687,R2=(129,3502,23940,30867,2130,18754,26135,23082,9356,1))
+    Primes(1197)=(P=(1,104,233,248,80,172,167,75,203,96,180,14,36,246,67,87),M=(129,17239,18924,20536,23301,29884,5524,32276,13428,1),M0I=10137,R2=(129,28350,12073,11330,21427,26796,9372,3435,8765,1))
+    Primes(1198)=(P=(1,9,255,98,157,239,0,202,99,97,156,177,183,9,45,39),M=(129,11559,28178,29382,6924,3238,15840,22695,1279,1),M0I=3433,R2=(129,27931,20660,22760,21840,31720,15418,29571,27921,0))
+    Primes(1199)=(P=(1,139,186,163,183,44,22,134,63,50,20,93,138,48,155,27),M=(129,6939,5217,20854,31120,26723,25986,10477,17885,1),M0I=14573,R2=(129,16442,1070,29790,28212,11398,990,22629,13494,0))
+    Primes(1200)=(P=(2,128,89,91,146,231,103,251,211,163,33,23,88,138,176,3),M=(130,12291,12565,1117,7449,32701,23788,22244,16428,2),M0I=1365,R2=(130,32403,20777,19681,30547,19179,13802,18068,783,2))
+    Primes(1201)=(P=(2,90,156,212,253,53,103,197,211,173,109,125,44,182,224,73),M=(130,24649,22893,13812,7531,31837,9900,13631,11598,2),M0I=28167,R2=(130,4919,21054,18996,19053,16229,12818,11731,10741,1))
+    Primes(1202)=(P=(2,62,23,111,58,232,163,211,93,94,96,182,34,219,182,9),M=(130,13833,17847,728,27379,15669,23828,23502,7947,2),M0I=18375,R2=(130,3832,14819,3388,31515,22211,25889,28547,760,1))
+    Primes(1203)=(P=(2,15,93,229,170,98,141,16,155,52,36,197,34,165,215,183),M=(130,22455,17739,4884,22945,20745,19537,31082,1966,2),M0I=18937,R2=(130,27322,22626,18598,4982,3496,27615,11500,32735,0))
+    Primes(1204)=(P=(2,57,63,236,135,191,185,78,139,72,134,224,103,87,216,77),M=(130,22605,20143,7041,23108,5352,30711,31521,7327,2),M0I=24443,R2=(130,18430,20322,4743,8729,9662,3376,7350,25623,0))
+    Primes(1205)=(P=(2,88,96,60,90,9,86,54,12,241,227,136,142,66,169,101),M=(130,10597,7301,3618,26511,25440,16682,3862,11312,2),M0I=8083,R2=(130,25498,28629,29311,2656,25214,16831,2168,30567,1))
+    Primes(1206)=(P=(3,204,189,237,192,73,82,2,172,58,131,59,143,222,248,147),M=(130,30867,8125,3310,25044,8234,2346,31600,26206,3),M0I=6757,R2=(130,22178,13457,7019,20023,27946,13140,21960,14561,1))
+    Primes(1207)=(P=(2,243,116,164,131,68,101,174,217,32,213,253,251,78,80,131),M=(130,20611,30364,22519,18694,23277,26764,10528,31162,2),M0I=469,R2=(130,7466,11873,15218,2246,32584,6159,27361,3568,0))
+    Primes(1208)=(P=(3,72,103,11,19,197,128,238,175,206,39,59,116,95,92,93),M=(130,23645,26814,7405,32369,3818,30896,17092,9267,3),M0I=10251,R2=(130,18619,17148,8920,5634,28645,18954,21777,593,2))
+    Primes(1209)=(P=(3,254,12,2,233,46,138,15,72,5,202,142,53,27,210,183),M=(130,21175,27191,10808,16430,8436,9681,186,32518,3),M0I=21753,R2=(130,3764,18441,23503,25014,24310,32242,26623,21763,1))
+    Primes(1210)=(P=(5,224,64,183,198,244,115,28,19,179,197,55,140,193,182,157),M=(131,13981,6531,5342,7582,12737,24206,11761,28704,5),M0I=75,R2=(131,1304,10473,17387,5086,2907,8386,10484,7934,1))
+    Primes(1211)=(P=(6,114,99,107,188,182,144,112,168,143,206,189,103,1,80,245),M=(131,20725,19970,15093,17534,1802,5842,23279,14641,6),M0I=9379,R2=(131,4708,9235,31604,18482,25903,5953,2393,12759,4))
+    Primes(1212)=(P=(6,116,65,23,153,136,54,222,89,172,215,189,101,229,67,199),M=(131,17351,19402,24309,19814,28133,12550,17894,14880,6),M0I=29193,R2=(131,28475,31009,4764,29945,31944,19995,6556,10356,4))
+    Primes(1213)=(P=(4,9,186,239,112,56,144,54,86,94,2,211,126,54,201,11),M=(131,18699,31853,2893,13040,869,1810,15324,1245,4),M0I=17757,R2=(131,24057,8103,8102,21177,31517,3426,21188,16795,1))
+    Primes(1214)=(P=(5,64,2,134,214,0,102,211,24,34,238,81,4,54,181,105),M=(131,13673,2157,14660,16663,27953,16396,8629,8193,5),M0I=21799,R2=(131,5378,22927,20949,28574,21719,12514,29623,3724,3))
+    Primes(1215)=(P=(7,163,192,111,194,215,31,131,17,81,137,1,19,199,91,33),M=(131,23329,10126,9220,2700,30769,23267,7152,20960,7),M0I=5919,R2=(131,25851,12461,21190,26491,2553,16581,29366,4541,5))
+    Primes(1216)=(P=(7,33,88,53,180,189,76,209,62,227,169,175,244,91,166,177),M=(131,9905,26807,9919,30493,19731,6057,3437,4268,7),M0I=7599,R2=(131,20686,12801,32764,2264,12614,10445,11685,14369,5))
+    Primes(1217)=(P=(7,2,219,109,4,103,203,158,187,239,230,108,131,97,89,123),M=(131,22907,1730,6578,24447,14827,3321,23361,365,7),M0I=25165,R2=(131,9139,1975,21910,3616,24721,25278,28792,15466,2))
+    Primes(1218)=(P=(4,166,102,88,221,216,68,209,140,145,161,112,70,192,141,97),M=(131,3425,3457,1473,25741,19736,15112,5687,21299,4),M0I=10591,R2=(131,25003,4051,26372,22068,10240,791,9596,12592,2))
+    Primes(1219)=(P=(7,248,189,87,121,149,209,115,3,60,178,62,218,4,97,121),M=(131,24953,13320,18683,6629,5936,12986,21982,31838,7),M0I=18231,R2=(131,16860,20956,21473,6515,19658,5083,19860,25687,2))
+    Primes(1220)=(P=(9,142,75,12,142,47,204,137,14,146,103,65,229,202,220,81),M=(132,23633,19349,7431,29843,18576,17913,17187,18213,9),M0I=4943,R2=(132,12845,17168,18817,400,24794,31376,17763,28114,0))
+    Primes(1221)=(P=(15,194,74,5,14,198,165,108,118,204,14,244,230,198,243,197),M=(132,29637,19853,15315,13920,22215,22740,323,24869,15),M0I=27891,R2=(132,28387,4830,27127,25454,1330,16773,30615,829,12))
+    Primes(1222)=(P=(13,17,137,26,84,160,105,227,104,7,46,208,135,208,232,255),M=(132,26879,4001,15170,16441,7734,5133,18069,2244,13),M0I=26881,R2=(132,2888,17387,29514,20117,3533,19778,27821,15799,7))
+    Primes(1223)=(P=(11,36,252,237,142,244,88,29,170,184,131,61,138,194,87,127),M=(132,22399,5508,3318,21956,474,24203,15203,4734,11),M0I=6017,R2=(132,12327,20890,18032,16662,22588,29995,9548,6393,9))
+    Primes(1224)=(P=(11,216,115,56,113,21,27,221,147,179,93,0,132,119,105,3),M=(132,26883,2286,29698,7578,15833,8867,19996,27705,11),M0I=13909,R2=(132,32282,17875,24422,31798,16336,15685,24523,23724,5))
+    Primes(1225)=(P=(15,85,244,134,112,200,63,79,73,89,228,214,44,45,232,169),M=(132,26793,22619,4952,19151,29940,6407,8604,11002,15),M0I=17511,R2=(132,7328,18871,31240,980,18053,7865,19318,25206,5))
+    Primes(1226)=(P=(11,181,106,193,127,57,219,165,185,23,145,115,251,188,88,195),M=(132,22723,30584,17871,18620,14939,26427,12383,23221,11),M0I=26645,R2=(132,12139,21675,11895,26707,16261,32551,28414,29645,8))
+    Primes(1227)=(P=(15,148,131,97,74,75,214,28,204,160,195,39,27,23,223,205),M=(132,24525,13871,3228,25862,25036,18810,22610,19009,15),M0I=23291,R2=(132,25265,5901,31764,9059,18361,19514,7535,18387,9))
+    Primes(1228)=(P=(13,209,179,79,22,105,181,88,129,40,46,37,120,230,86,219),M=(132,22235,29132,14485,2369,21896,19766,21445,26841,13),M0I=19117,R2=(132,30279,13697,30269,29537,19108,22533,18683,32556,9))
+    Primes(1229)=(P=(8,51,88,107,236,250,29,21,131,46,40,18,67,109,152,43),M=(132,6187,1755,8265,6513,20824,8003,6907,6572,8),M0I=6525,R2=(132,13122,24389,20753,10676,13286,20703,9820,4928,2))
+    Primes(1230)=(P=(18,90,75,51,32,79,86,136,252,201,153,206,24,69,7,133),M=(133,1925,12426,26424,26188,26767,2538,19656,11557,18),M0I=9907,R2=(133,32380,2012,3362,14098,30109,30099,869,10514,9))
+    Primes(1231)=(P=(28,248,144,154,212,148,93,118,151,39,132,66,233,80,115,251),M=(133,29691,21152,4363,14652,22377,4747,9909,31816,28),M0I=24781,R2=(133,32308,15819,23774,25784,668,30978,4657,17236,8))
+    Primes(1232)=(P=(30,165,83,107,36,232,245,85,19,214,229,49,13,161,183,217),M=(133,14297,6979,5316,7863,21841,7454,23241,21161,30),M0I=10135,R2=(133,23836,1818,11183,5950,208,3881,13828,4071,28))
+    Primes(1233)=(P=(22,138,10,112,158,163,68,196,6,53,107,144,42,108,242,85),M=(133,29269,21721,11840,12715,19520,21608,7207,17669,22),M0I=1283,R2=(133,13495,23160,2967,9149,29411,28049,27321,9824,10))
+    Primes(1234)=(P=(26,62,248,224,17,185,66,208,141,87,93,94,104,176,153,79),M=(133,6479,20833,30073,27322,11528,14120,14340,8060,26),M0I=8785,R2=(133,24868,19420,14795,18193,26317,30393,271,26988,6))
+    Primes(1235)=(P=(30,247,110,217,236,78,7,172,170,222,229,29,169,30,51,21),M=(133,13077,21052,5238,22263,31434,2496,13947,31671,30),M0I=31683,R2=(133,32587,27590,15748,5726,18265,8915,9500,2012,20))
+    Primes(1236)=(P=(22,122,239,216,195,193,184,125,151,35,132,33,66,0,228,85),M=(133,25685,1025,4229,14620,2009,30775,30256,15735,22),M0I=1795,R2=(133,16100,27566,29255,9009,0,11802,31631,13997,20))
+    Primes(1237)=(P=(19,114,234,142,195,93,219,8,8,230,25,67,87,72,98,67),M=(133,25155,11920,25869,18224,12416,27579,9136,14709,19),M0I=1429,R2=(133,16777,14836,15877,6991,986,9467,12350,22785,15))
+    Primes(1238)=(P=(25,23,171,95,200,216,106,28,56,208,124,53,176,110,70,51),M=(133,17971,24796,28886,18051,8643,6925,22514,3029,25),M0I=23301,R2=(133,726,15965,18983,27185,29888,13428,31889,1974,8))
+    Primes(1239)=(P=(24,104,155,26,18,34,105,42,221,128,172,83,77,74,25,219),M=(133,6619,6804,12621,27653,4781,17485,18052,13389,24),M0I=17837,R2=(133,15247,8228,7370,4752,32683,2875,31020,2334,8))
+    Primes(1240)=(P=(46,103,33,163,74,203,102,87,177,96,56,41,50,170,156,217),M=(134,7385,25941,24740,2817,25979,22892,26834,13200,46),M0I=23703,R2=(134,4434,12488,22442,17579,17172,27295,2711,4577,4))
+    Primes(1241)=(P=(60,44,27,111,56,219,177,161,1,51,181,129,149,101,187,193),M=(134,15297,10955,22022,2461,6672,7030,23502,5645,60),M0I=11199,R2=(134,28160,3651,2077,25835,18365,6096,5224,20138,41))
+    Primes(1242)=(P=(47,117,185,49,53,142,184,190,79,102,220,46,219,55,232,149),M=(134,26773,13935,28859,31542,3044,12759,19533,15068,47),M0I=23875,R2=(134,17852,15555,27075,29604,31255,14141,18168,14659,42))
+    Primes(1243)=(P=(61,180,179,237,165,235,234,246,189,127,132,131,19,102,15,5),M=(134,3845,9932,4620,27644,12139,15741,31593,23129,61),M0I=6707,R2=(134,13403,4980,20419,21017,29609,20718,16226,20905,51))
+    Primes(1244)=(P=(52,77,174,17,231,134,106,57,102,176,88,234,232,232,174,61),M=(134,11837,20945,25515,13698,9110,28877,1145,9943,52),M0I=9963,R2=(134,9411,6714,4304,8779,15903,20990,9815,23340,37))
+    Primes(1245)=(P=(52,209,94,136,65,150,222,86,155,128,250,200,94,34,87,119),M=(134,22391,15428,27425,23559,25961,13019,8720,26799,52),M0I=19897,R2=(134,14622,28397,27104,14729,27502,32301,9797,12755,52))
+    Primes(1246)=(P=(62,44,224,193,162,146,80,51,12,249,111,127,97,183,32,145),M=(134,8337,17262,15869,26571,816,21066,12392,5744,62),M0I=24463,R2=(134,10906,29699,13923,16878,9975,11262,15261,9697,25))
+    Primes(1247)=(P=(40,145,27,57,32,20,243,26,73,100,5,29,125,60,116,43),M=(134,29739,31352,5237,19232,12708,670,20040,18573,40),M0I=21885,R2=(134,30638,7436,10172,28683,844,15269,15020,7187,21))
+    Primes(1248)=(P=(32,189,141,90,205,44,145,184,158,239,139,116,152,220,14,183),M=(134,3767,12728,11730,30588,7049,9618,22195,24262,32),M0I=20729,R2=(134,17595,19454,13302,3697,9237,9960,13974,11627,6))
+    Primes(1249)=(P=(59,3,128,252,87,101,171,192,75,74,48,139,220,91,7,199),M=(134,1991,14518,16943,23121,15364,27829,16149,448,59),M0I=30217,R2=(134,9592,9207,27745,30854,25946,1237,23346,16146,48))
+    Primes(1250)=(P=(117,110,16,41,205,184,233,127,132,23,203,23,80,192,33,157),M=(135,8605,8576,11357,8382,6136,14109,2675,14088,117),M0I=4939,R2=(135,5271,23960,12687,18182,22434,22425,23432,25176,93))
+    Primes(1251)=(P=(88,234,122,100,36,184,57,17,105,142,158,30,148,90,72,111),M=(135,18543,10420,30842,19572,4374,5895,6409,30013,88),M0I=26993,R2=(135,8969,9962,12628,13344,31484,31684,9868,10464,73))
+    Primes(1252)=(P=(83,209,227,95,115,250,42,114,110,161,27,174,224,86,26,189),M=(135,6845,16556,28347,29960,10022,32581,22492,26865,83),M0I=20331,R2=(135,2712,8040,6710,1876,9396,20200,161,1267,42))
+    Primes(1253)=(P=(102,99,124,169,211,94,36,222,37,142,191,169,74,181,32,51),M=(135,8243,5482,32421,11381,19938,27588,10868,12734,102),M0I=9477,R2=(135,14387,6067,25970,16782,30425,6706,14386,18574,54))
+    Primes(1254)=(P=(74,241,179,241,134,72,182,117,77,85,26,109,117,196,10,23),M=(135,2583,27528,27061,27304,26452,18710,31841,30937,74),M0I=12889,R2=(135,26373,7645,13797,30494,23246,24537,28227,28931,70))
+    Primes(1255)=(P=(86,2,11,125,166,105,203,14,198,148,80,65,165,235,2,247),M=(135,759,19414,16646,13474,12524,19769,24425,261,86),M0I=8505,R2=(135,32681,46,2740,12650,28397,14950,30003,5329,5))
+    Primes(1256)=(P=(124,253,37,12,226,244,218,24,192,69,57,61,37,127,138,33),M=(135,2593,19199,25844,553,8588,24219,17208,32402,124),M0I=1567,R2=(135,3913,25741,24465,12496,31288,31454,4827,19062,110))
+    Primes(1257)=(P=(75,235,17,220,204,191,138,60,104,69,208,117,18,239,135,59),M=(135,1851,9695,16852,16942,9158,6129,30515,30088,75),M0I=17933,R2=(135,17154,15323,19815,6429,1792,24901,29952,14656,6))
+    Primes(1258)=(P=(243,170,250,231,244,79,20,98,183,253,45,214,16,74,118,229),M=(136,30437,8340,14168,16361,17963,2530,14845,21885,243),M0I=10515,R2=(136,16459,25824,32186,6947,14404,24502,6593,31832,65))
+    Primes(1259)=(P=(214,1,175,198,181,146,188,235,225,186,128,195,82,68,148,193),M=(136,5313,9353,781,3540,20158,12887,29101,215,214),M0I=1215,R2=(136,31631,25745,14966,24985,13158,19197,22827,22577,199))
+    Primes(1260)=(P=(173,143,12,137,208,68,7,85,93,22,221,176,100,14,0,55),M=(136,55,18460,30401,26806,30037,2176,8820,18310,173),M0I=19065,R2=(136,3722,4190,6646,27372,28291,8785,10415,11987,66))
+    Primes(1261)=(P=(200,41,243,91,131,116,26,72,122,99,213,20,24,68,178,119),M=(136,12919,12425,21584,21278,9351,28291,22240,5369,200),M0I=14521,R2=(136,16241,24417,30711,7691,20713,32293,28759,23137,0))
+    Primes(1262)=(P=(163,172,194,237,52,50,86,107,125,253,61,112,24,130,189,207),M=(136,15823,12549,30144,28649,26295,1610,15181,22113,163),M0I=22225,R2=(136,1971,26578,17469,23436,7356,22089,20887,32060,1))
+    Primes(1263)=(P=(170,223,56,25,28,57,44,215,202,57,73,239,121,139,86,87),M=(136,22103,29462,10173,20938,19836,1829,1607,28572,170),M0I=2713,R2=(136,10961,16963,6410,1906,17070,16495,13322,21787,1))
+    Primes(1264)=(P=(153,118,85,170,7,57,199,70,78,81,179,245,206,29,169,51),M=(136,10547,7227,20439,29325,29796,26424,27265,15146,153),M0I=1541,R2=(136,31438,24875,11156,28518,29352,26096,28341,23955,23))
+    Primes(1265)=(P=(209,186,224,89,31,148,190,170,160,165,85,180,172,128,27,195),M=(136,7107,22784,22226,1322,27306,29335,5703,23920,209),M0I=21269,R2=(136,11769,4502,20230,15668,9103,32728,28746,11992,164))
+    Primes(1266)=(P=(130,238,124,63,112,134,0,110,6,49,103,64,176,197,252,23),M=(136,31767,24971,7426,12683,1760,4288,4060,30526,130),M0I=1113,R2=(136,18009,17777,22232,20104,8967,27090,31898,1450,73))
+    Primes(1267)=(P=(192,241,87,10,47,148,53,12,212,231,149,108,98,123,48,187),M=(136,12475,17654,21937,10044,20685,29318,17035,30891,192),M0I=27533,R2=(136,11785,8654,20469,6696,14417,28600,17144,25728,110))
+    Primes(1268)=(P=(224,131,247,119,141,116,26,32,147,67,197,218,168,137,44,195),M=(136,11459,20754,5994,6686,8713,11907,24035,16891,224),M0I=7189,R2=(136,27249,27031,26041,18810,6329,19782,20317,1003,132))
+    Primes(1269)=(P=(175,178,230,249,202,185,151,211,151,22,96,169,198,45,41,71),M=(136,10567,3162,679,14515,32057,22322,15986,22899,175),M0I=20361,R2=(136,15574,29432,5810,9615,2375,14208,31749,31327,5))
 
     KAT_AES={(
         /*
@@ -25,6 +25,7 @@ class FCryptoUtils extends Object
     notplaceable;
 
 `include(FCrypto\Classes\FCryptoMacros.uci);
+`include(FCrypto\Classes\FCryptoHexTables.uci);
 
 var private int Year;
 var private int Month;
@@ -35,6 +36,11 @@ var private int Min;
 var private int Sec;
 var private int MSec;
 
+// Hexadecimal codec lookup tables, see DevUtils/hex_codec.py.
+var const array<int> HexDecodeHi;
+var const array<int> HexDecodeLo;
+var const array<string> HexEncode;
+
 // Warning: only takes MSec, Sec, Min and Hour into account.
 simulated final function float GetSystemTimeStamp()
 {
@@ -42,72 +48,168 @@ simulated final function float GetSystemTimeStamp()
     return (Hour * 3600) + (Min * 60) + Sec + (MSec / 1000);
 }
 
+// Decode the hexadecimal character pair at HexString[J + Offset] into V.
+// Invalid characters set bits above the low byte of V, they are
+// accumulated into Err and checked once instead of per character.
+`define HEX_DECODE_PAIR(Offset)                                             \
+    C0 = Asc(Mid(HexString, J + `Offset, 1));                               \
+    C1 = Asc(Mid(HexString, J + `Offset + 1, 1));                           \
+    V = default.HexDecodeHi[C0 & 0xFF] | default.HexDecodeLo[C1 & 0xFF]     \
+        | ((C0 | C1) & ~0xFF);                                              \
+    Err = Err | V
+
+// Bytes per concatenated chunk in BytesToHex.
+const HEX_CHUNK_BYTES = 32;
+
 static final function bool FromHex(string HexString, out int Result)
 {
+    local int LenStr;
     local int Res;
-    local int i;
-    local int t;
-    local int s;
+    local int Err;
+    local int I;
+    local int C;
+    local int V;
 
-    if (Len(HexString) > 8)
+    LenStr = Len(HexString);
+    if (LenStr > 8)
     {
         Result = -1;
         return False;
     }
 
-    HexString = Caps(HexString);
-    s = 0;
-
-    for (i = Len(HexString) - 1; i >= 0; --i)
+    Res = 0;
+    Err = 0;
+    for (I = 0; I < LenStr; ++I)
     {
-        t = Asc(Mid(HexString, i, 1));
-
-        if (t >= 48 && t <= 57)
-        {
-            t -= 48;
-        }
-        else if (t >= 65 && t <= 70)
-        {
-            t -= 55;
-        }
-        else
-        {
-            Result = -1;
-            return False;
-        }
-
-        if (s > 0)
-        {
-            t = t << s;
-        }
+        C = Asc(Mid(HexString, I, 1));
+        V = default.HexDecodeLo[C & 0xFF] | (C & ~0xFF);
+        Err = Err | V;
+        Res = (Res << 4) | V;
+    }
 
-        Res = Res | t;
-        s += 4;
+    if ((Err & ~0xFF) != 0)
+    {
+        Result = -1;
+        return False;
     }
 
     Result = Res;
     return True;
 }
 
-// TODO: just use BytesFromHex from FCryptoBigInt? And move it here?
 /*
- * Decode a hexadecimal string. Returned value is the number of decoded
- * bytes.
+ * Decode a hexadecimal string into Dst, two characters per byte.
+ * Odd length strings have an implicit leading zero. Returns False
+ * if the string contains non-hexadecimal characters, the contents
+ * of Dst are unspecified in that case.
  */
-// static final function int HexToBin(out string Dst, string Src)
-// {
-//     local int Num;
-//     local int Acc;
-//     local int Z;
+static final function bool BytesFromHex(
+    out array<byte> Dst,
+    string HexString
+)
+{
+    local int LenStr;
+    local int J;
+    local int K;
+    local int C0;
+    local int C1;
+    local int V;
+    local int Err;
+
+    LenStr = Len(HexString);
+    Dst.Length = (LenStr + 1) / 2;
+    Err = 0;
+    J = 0;
+    K = 0;
+
+    if ((LenStr & 1) != 0)
+    {
+        C0 = Asc(Mid(HexString, 0, 1));
+        V = default.HexDecodeLo[C0 & 0xFF] | (C0 & ~0xFF);
+        Err = V;
+        Dst[K++] = V;
+        J = 1;
+    }
 
-//     Num = 0;
-//     Z = 0;
-//     Acc = 0;
+    // Four bytes per iteration.
+    while (J + 8 <= LenStr)
+    {
+        `HEX_DECODE_PAIR(0);
+        Dst[K    ] = V;
+        `HEX_DECODE_PAIR(2);
+        Dst[K + 1] = V;
+        `HEX_DECODE_PAIR(4);
+        Dst[K + 2] = V;
+        `HEX_DECODE_PAIR(6);
+        Dst[K + 3] = V;
+        J += 8;
+        K += 4;
+    }
+    while (J < LenStr)
+    {
+        `HEX_DECODE_PAIR(0);
+        Dst[K++] = V;
+        J += 2;
+    }
+
+    return (Err & ~0xFF) == 0;
+}
 
-//     while (False)
-//     {
+/*
+ * Encode X as uppercase hexadecimal, two characters per byte,
+ * with Delimiter between bytes. The output is built in chunks of
+ * HEX_CHUNK_BYTES bytes, so the result string is copied once per
+ * chunk instead of once per byte.
+ */
+static final function string BytesToHex(
+    const out array<byte> X,
+    optional string Delimiter = ""
+)
+{
+    local string Str;
+    local string Chunk;
+    local int I;
+    local int End;
+
+    Str = "";
+    for (I = 0; I < X.Length; I = End)
+    {
+        End = Min(I + HEX_CHUNK_BYTES, X.Length);
+        Chunk = "";
+        if (Delimiter == "")
+        {
+            // Four bytes per step.
+            while (I + 4 <= End)
+            {
+                Chunk $= default.HexEncode[X[I    ]] $ default.HexEncode[X[I + 1]]
+                       $ default.HexEncode[X[I + 2]] $ default.HexEncode[X[I + 3]];
+                I += 4;
+            }
+            while (I < End)
+            {
+                Chunk $= default.HexEncode[X[I++]];
+            }
+        }
+        else
+        {
+            while (I < End)
+            {
+                Chunk $= default.HexEncode[X[I++]] $ Delimiter;
+            }
+        }
+        Str $= Chunk;
+    }
 
-//     }
+    if (Delimiter != "" && X.Length > 0)
+    {
+        Str = Left(Str, Len(Str) - Len(Delimiter));
+    }
+    return Str;
+}
 
-//     return Num;
-// }
+DefaultProperties
+{
+    HexDecodeHi={(`HEX_DECODE_HI_VALUES)}
+    HexDecodeLo={(`HEX_DECODE_LO_VALUES)}
+    HexEncode={(`HEX_ENCODE_VALUES)}
+}
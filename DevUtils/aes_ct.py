@@ -0,0 +1,556 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""NumPy reference model of the bitsliced AES in FCryptoAES.uc
+(BearSSL aes_ct) and the test vector generator for TestAesCt.
+
+The model works on the same state layout as the UnrealScript code.
+A state Q is eight 32-bit words holding two AES blocks. The blocks are
+loaded as little-endian words W0[0..3] and W1[0..3] interleaved as
+Q[I * 2] = W0[I], Q[I * 2 + 1] = W1[I] and then bitsliced by
+AesCtOrtho. After AesCtOrtho, Q[K] holds bit K of all 32 state bytes.
+Every function here takes an array of shape (N, 8) and processes
+N states at once.
+
+The S-box is modelled by transposing the 32 byte lanes back to bytes,
+applying the AES S-box table (computed from the GF(2^8) inverse) and
+transposing again, so it does not share any code with the
+Boyar-Peralta circuit of AesCtBitSliceSBox. The other routines are
+direct transcriptions of BearSSL.
+
+The generated vectors are flat int arrays for DefaultProperties:
+
+  keys:   AES_CT_KEYS_RECORD_WORDS words per key:
+          KeyLen, Key[0..31] (bytes, zero padded),
+          CompSKey[0..59] (AesCtKeySched output, zero padded)
+
+  blocks: AES_CT_BLOCKS_RECORD_WORDS words per state:
+          KeyIndex, Pt[0..7] (Q before AesCtOrtho),
+          Ortho[0..7] (Q after AesCtOrtho),
+          Round1[0..7] (Q after the first full round),
+          Ct[0..7] (Q after AesCtBitSliceEncrypt and AesCtOrtho)
+
+The first keys are the FIPS-197 Appendix C known answer keys and the
+first AES_CT_BLOCKS_KNOWN states hold the matching plaintext in both
+blocks. The other keys and states are random, the states are sorted by
+key index.
+
+Usage:
+    python aes_ct.py                    # Validate and regenerate the vectors.
+    python aes_ct.py --check            # Fail if the vectors file is stale.
+    python aes_ct.py --benchmark        # Reference model throughput.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoAESTestVectors.uci"
+
+DEFAULT_KEYS = 48
+DEFAULT_BLOCKS = 1024
+DEFAULT_SEED = 0
+
+# FIPS-197 Appendix C (key, plaintext, ciphertext).
+KNOWN_ANSWERS = [
+    ("000102030405060708090a0b0c0d0e0f",
+     "00112233445566778899aabbccddeeff",
+     "69c4e0d86a7b0430d8cdb78070b4c55a"),
+    ("000102030405060708090a0b0c0d0e0f1011121314151617",
+     "00112233445566778899aabbccddeeff",
+     "dda97ca4864cdfe06eaf70a0ec0d7191"),
+    ("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f",
+     "00112233445566778899aabbccddeeff",
+     "8ea2b7ca516745bfeafc49904b496089"),
+]
+
+KEY_RECORD_WORDS = 1 + 32 + 60
+BLOCK_RECORD_WORDS = 1 + 4 * 8
+
+VALUES_PER_LINE = 8
+
+NUM_ROUNDS = {16: 10, 24: 12, 32: 14}
+RCON = (0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36)
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+"""
+
+
+def _gf_mul(a: int, b: int) -> int:
+    r = 0
+    while b:
+        if b & 1:
+            r ^= a
+        a = ((a << 1) ^ (0x11B if a & 0x80 else 0)) & 0xFF
+        b >>= 1
+    return r
+
+
+def _make_sbox() -> np.ndarray:
+    inv = [0] * 256
+    for a in range(1, 256):
+        for b in range(1, 256):
+            if _gf_mul(a, b) == 1:
+                inv[a] = b
+                break
+    sbox = []
+    for x in inv:
+        s = x
+        for shift in range(1, 5):
+            s ^= ((x << shift) | (x >> (8 - shift))) & 0xFF
+        sbox.append(s ^ 0x63)
+    return np.array(sbox, dtype=np.uint8)
+
+
+SBOX = _make_sbox()
+INV_SBOX = np.argsort(SBOX).astype(np.uint8)
+
+_BIT_POS = np.arange(32, dtype=np.uint32)
+_BIT_K = np.arange(8, dtype=np.uint32)
+
+
+def _swapn(q: np.ndarray, x: int, y: int, cl: int, ch: int, s: int):
+    a = q[:, x].copy()
+    b = q[:, y].copy()
+    q[:, x] = (a & cl) | ((b & cl) << s)
+    q[:, y] = ((a & ch) >> s) | (b & ch)
+
+
+def ortho(q: np.ndarray) -> np.ndarray:
+    """AesCtOrtho. Converts between the interleaved word layout
+    and the bitsliced layout, it is its own inverse.
+    """
+    q = np.array(q, dtype=np.uint32).reshape(-1, 8)
+    for x in (0, 2, 4, 6):
+        _swapn(q, x, x + 1, 0x55555555, 0xAAAAAAAA, 1)
+    for x, y in ((0, 2), (1, 3), (4, 6), (5, 7)):
+        _swapn(q, x, y, 0x33333333, 0xCCCCCCCC, 2)
+    for x in (0, 1, 2, 3):
+        _swapn(q, x, x + 4, 0x0F0F0F0F, 0xF0F0F0F0, 4)
+    return q
+
+
+def _apply_table(q: np.ndarray, table: np.ndarray) -> np.ndarray:
+    bits = (q[:, :, None] >> _BIT_POS) & 1
+    lanes = (bits << _BIT_K[:, None]).sum(axis=1, dtype=np.uint32)
+    out = table[lanes].astype(np.uint32)
+    out_bits = (out[:, None, :] >> _BIT_K[:, None]) & 1
+    return (out_bits << _BIT_POS).sum(axis=2, dtype=np.uint32)
+
+
+def bitslice_sbox(q: np.ndarray) -> np.ndarray:
+    """AesCtBitSliceSBox."""
+    return _apply_table(q, SBOX)
+
+
+def bitslice_inv_sbox(q: np.ndarray) -> np.ndarray:
+    """AesCtBitSliceInvSBox."""
+    return _apply_table(q, INV_SBOX)
+
+
+def shift_rows(q: np.ndarray) -> np.ndarray:
+    return (
+            (q & 0x000000FF)
+            | ((q & 0x0000FC00) >> 2) | ((q & 0x00000300) << 6)
+            | ((q & 0x00F00000) >> 4) | ((q & 0x000F0000) << 4)
+            | ((q & 0xC0000000) >> 6) | ((q & 0x3F000000) << 2)
+    )
+
+
+def inv_shift_rows(q: np.ndarray) -> np.ndarray:
+    return (
+            (q & 0x000000FF)
+            | ((q & 0x00003F00) << 2) | ((q & 0x0000C000) >> 6)
+            | ((q & 0x000F0000) << 4) | ((q & 0x00F00000) >> 4)
+            | ((q & 0x03000000) << 6) | ((q & 0xFC000000) >> 2)
+    )
+
+
+def _rotr16(x: np.ndarray) -> np.ndarray:
+    return (x << 16) | (x >> 16)
+
+
+def mix_columns(q: np.ndarray) -> np.ndarray:
+    q0, q1, q2, q3, q4, q5, q6, q7 = q.T
+    r0, r1, r2, r3, r4, r5, r6, r7 = ((q >> 8) | (q << 24)).T
+    return np.stack([
+        q7 ^ r7 ^ r0 ^ _rotr16(q0 ^ r0),
+        q0 ^ r0 ^ q7 ^ r7 ^ r1 ^ _rotr16(q1 ^ r1),
+        q1 ^ r1 ^ r2 ^ _rotr16(q2 ^ r2),
+        q2 ^ r2 ^ q7 ^ r7 ^ r3 ^ _rotr16(q3 ^ r3),
+        q3 ^ r3 ^ q7 ^ r7 ^ r4 ^ _rotr16(q4 ^ r4),
+        q4 ^ r4 ^ r5 ^ _rotr16(q5 ^ r5),
+        q5 ^ r5 ^ r6 ^ _rotr16(q6 ^ r6),
+        q6 ^ r6 ^ r7 ^ _rotr16(q7 ^ r7),
+    ], axis=1)
+
+
+def inv_mix_columns(q: np.ndarray) -> np.ndarray:
+    q0, q1, q2, q3, q4, q5, q6, q7 = q.T
+    r0, r1, r2, r3, r4, r5, r6, r7 = ((q >> 8) | (q << 24)).T
+    return np.stack([
+        q5 ^ q6 ^ q7 ^ r0 ^ r5 ^ r7 ^ _rotr16(q0 ^ q5 ^ q6 ^ r0 ^ r5),
+        q0 ^ q5 ^ r0 ^ r1 ^ r5 ^ r6 ^ r7 ^ _rotr16(q1 ^ q5 ^ q7 ^ r1 ^ r5 ^ r6),
+        q0 ^ q1 ^ q6 ^ r1 ^ r2 ^ r6 ^ r7 ^ _rotr16(q0 ^ q2 ^ q6 ^ r2 ^ r6 ^ r7),
+        (q0 ^ q1 ^ q2 ^ q5 ^ q6 ^ r0 ^ r2 ^ r3 ^ r5
+         ^ _rotr16(q0 ^ q1 ^ q3 ^ q5 ^ q6 ^ q7 ^ r0 ^ r3 ^ r5 ^ r7)),
+        (q1 ^ q2 ^ q3 ^ q5 ^ r1 ^ r3 ^ r4 ^ r5 ^ r6 ^ r7
+         ^ _rotr16(q1 ^ q2 ^ q4 ^ q5 ^ q7 ^ r1 ^ r4 ^ r5 ^ r6)),
+        (q2 ^ q3 ^ q4 ^ q6 ^ r2 ^ r4 ^ r5 ^ r6 ^ r7
+         ^ _rotr16(q2 ^ q3 ^ q5 ^ q6 ^ r2 ^ r5 ^ r6 ^ r7)),
+        q3 ^ q4 ^ q5 ^ q7 ^ r3 ^ r5 ^ r6 ^ r7 ^ _rotr16(q3 ^ q4 ^ q6 ^ q7 ^ r3 ^ r6 ^ r7),
+        q4 ^ q5 ^ q6 ^ r4 ^ r6 ^ r7 ^ _rotr16(q4 ^ q5 ^ q7 ^ r4 ^ r7),
+    ], axis=1)
+
+
+def add_round_key(q: np.ndarray, skey: np.ndarray, offset: int = 0) -> np.ndarray:
+    """skey is either one expanded key or one key per state."""
+    return q ^ skey[..., offset:offset + 8]
+
+
+def sub_word(x: int) -> int:
+    """SubWord, the S-box applied to each byte of x."""
+    return int.from_bytes(SBOX[np.frombuffer(x.to_bytes(4, "little"), np.uint8)], "little")
+
+
+def keysched(key: bytes) -> tuple[int, list[int]]:
+    """AesCtKeySched, returns (NumRounds, CompSKey)."""
+    if len(key) not in NUM_ROUNDS:
+        return 0, []
+    num_rounds = NUM_ROUNDS[len(key)]
+    nk = len(key) >> 2
+    nkf = (num_rounds + 1) << 2
+    skey = [0] * (nkf * 2)
+    tmp = 0
+    for i in range(nk):
+        tmp = int.from_bytes(key[i << 2:(i << 2) + 4], "little")
+        skey[i << 1] = skey[(i << 1) + 1] = tmp
+    j = k = 0
+    for i in range(nk, nkf):
+        if j == 0:
+            tmp = ((tmp << 24) | (tmp >> 8)) & 0xFFFFFFFF
+            tmp = sub_word(tmp) ^ RCON[k]
+        elif nk > 6 and j == 4:
+            tmp = sub_word(tmp)
+        tmp ^= skey[(i - nk) << 1]
+        skey[i << 1] = skey[(i << 1) + 1] = tmp
+        j += 1
+        if j == nk:
+            j = 0
+            k += 1
+    sk = ortho(np.array(skey, dtype=np.uint32)).reshape(-1)
+    comp = (sk[0::2] & 0x55555555) | (sk[1::2] & 0xAAAAAAAA)
+    return num_rounds, [int(x) for x in comp]
+
+
+def skey_expand(comp_skey: np.ndarray | list[int]) -> np.ndarray:
+    """AesCtSKeyExpand for one key (shape (M,)) or one key per state
+    (shape (N, M)). Returns words (NumRounds + 1) * 8.
+    """
+    comp = np.asarray(comp_skey, dtype=np.uint32)
+    x = comp & 0x55555555
+    y = comp & 0xAAAAAAAA
+    skey = np.empty(comp.shape[:-1] + (comp.shape[-1] * 2,), dtype=np.uint32)
+    skey[..., 0::2] = x | (x << 1)
+    skey[..., 1::2] = y | (y >> 1)
+    return skey
+
+
+def first_round(q: np.ndarray, skey: np.ndarray) -> np.ndarray:
+    """State after AddRoundKey and the first full round."""
+    q = add_round_key(q, skey)
+    q = mix_columns(shift_rows(bitslice_sbox(q)))
+    return add_round_key(q, skey, 8)
+
+
+def bitslice_encrypt(num_rounds: int, skey: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """AesCtBitSliceEncrypt."""
+    q = add_round_key(q, skey)
+    for u in range(1, num_rounds):
+        q = mix_columns(shift_rows(bitslice_sbox(q)))
+        q = add_round_key(q, skey, u << 3)
+    q = shift_rows(bitslice_sbox(q))
+    return add_round_key(q, skey, num_rounds << 3)
+
+
+def bitslice_decrypt(num_rounds: int, skey: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """AesCtBitSliceDecrypt."""
+    q = add_round_key(q, skey, num_rounds << 3)
+    for u in range(num_rounds - 1, 0, -1):
+        q = bitslice_inv_sbox(inv_shift_rows(q))
+        q = inv_mix_columns(add_round_key(q, skey, u << 3))
+    q = bitslice_inv_sbox(inv_shift_rows(q))
+    return add_round_key(q, skey)
+
+
+def load_blocks(blocks: np.ndarray) -> np.ndarray:
+    """Interleave an even number of 16 byte blocks, two per state,
+    into the (not yet bitsliced) Q layout.
+    """
+    w = np.ascontiguousarray(blocks, dtype=np.uint8).view("<u4").reshape(-1, 2, 4)
+    q = np.empty((w.shape[0], 8), dtype=np.uint32)
+    q[:, 0::2] = w[:, 0]
+    q[:, 1::2] = w[:, 1]
+    return q
+
+
+def store_blocks(q: np.ndarray) -> np.ndarray:
+    w = np.stack([q[:, 0::2], q[:, 1::2]], axis=1).astype("<u4")
+    return w.view(np.uint8).reshape(-1, 16)
+
+
+def _crypt(key: bytes, blocks: np.ndarray, decrypt: bool) -> np.ndarray:
+    blocks = np.asarray(blocks, dtype=np.uint8).reshape(-1, 16)
+    num = blocks.shape[0]
+    if num % 2:
+        blocks = np.concatenate([blocks, np.zeros((1, 16), dtype=np.uint8)])
+    num_rounds, comp = keysched(key)
+    if not num_rounds:
+        raise ValueError(f"invalid AES key length {len(key)}")
+    skey = skey_expand(comp)
+    q = ortho(load_blocks(blocks))
+    func = bitslice_decrypt if decrypt else bitslice_encrypt
+    return store_blocks(ortho(func(num_rounds, skey, q)))[:num]
+
+
+def encrypt(key: bytes, blocks: np.ndarray) -> np.ndarray:
+    """AES-ECB encrypt (N, 16) byte blocks."""
+    return _crypt(key, blocks, decrypt=False)
+
+
+def decrypt(key: bytes, blocks: np.ndarray) -> np.ndarray:
+    """AES-ECB decrypt (N, 16) byte blocks."""
+    return _crypt(key, blocks, decrypt=True)
+
+
+def generate_vectors(
+        num_keys: int,
+        num_blocks: int,
+        seed: int = DEFAULT_SEED,
+) -> tuple[list[int], list[int]]:
+    """Return the flat key and block records, see the module docstring."""
+    rng = np.random.default_rng(seed)
+    key_records: list[int] = []
+    comps = []
+    for i in range(num_keys):
+        key_len = (16, 24, 32)[i % 3]
+        if i < len(KNOWN_ANSWERS):
+            key = bytes.fromhex(KNOWN_ANSWERS[i][0])
+        else:
+            key = rng.integers(0, 256, key_len, dtype=np.uint8).tobytes()
+        num_rounds, comp = keysched(key)
+        comps.append((num_rounds, comp))
+        key_records += [key_len, *key, *[0] * (32 - key_len), *comp, *[0] * (60 - len(comp))]
+
+    num_known = min(len(KNOWN_ANSWERS), num_keys, num_blocks)
+    num_random = num_blocks - num_known
+    key_index = np.concatenate([
+        np.arange(num_known),
+        np.arange(num_random) * num_keys // max(num_random, 1),
+    ])
+    pt = np.concatenate([
+        load_blocks(np.frombuffer(
+            b"".join(bytes.fromhex(pt) * 2 for _, pt, _ in KNOWN_ANSWERS[:num_known]),
+            dtype=np.uint8)),
+        rng.integers(0, 1 << 32, (num_random, 8), dtype=np.uint32),
+    ])
+    q_ortho = ortho(pt)
+    round1 = np.empty_like(pt)
+    ct = np.empty_like(pt)
+    for i, (num_rounds, comp) in enumerate(comps):
+        sel = key_index == i
+        skey = skey_expand(comp)
+        round1[sel] = first_round(q_ortho[sel], skey)
+        ct[sel] = ortho(bitslice_encrypt(num_rounds, skey, q_ortho[sel]))
+
+    block_records = np.concatenate(
+        [key_index[:, None].astype(np.uint32), pt, q_ortho, round1, ct], axis=1)
+    return key_records, [int(x) for x in block_records.reshape(-1)]
+
+
+def format_macro(name: str, params: dict[str, int], values: list[int]) -> str:
+    lines = [f"`define {name}_{key} {value}" for key, value in params.items()]
+    hex_values = [f"0x{v:08X}" for v in values]
+    value_lines = [
+        "    " + ", ".join(hex_values[i:i + VALUES_PER_LINE])
+        for i in range(0, len(hex_values), VALUES_PER_LINE)
+    ]
+    # UnrealScript macros need a line continuation on each line.
+    body = [f"`define {name}_VALUES"] + [line + "," for line in value_lines[:-1]]
+    lines += [f"{line} \\" for line in body]
+    lines.append(value_lines[-1])
+    return "\n".join(lines) + "\n"
+
+
+def generate(
+        num_keys: int = DEFAULT_KEYS,
+        num_blocks: int = DEFAULT_BLOCKS,
+        seed: int = DEFAULT_SEED,
+) -> str:
+    key_records, block_records = generate_vectors(num_keys, num_blocks, seed)
+    return "\n".join([
+        HEADER + f"// Generated by DevUtils/aes_ct.py"
+                 f" --keys {num_keys} --blocks {num_blocks} --seed {seed}.\n",
+        "// AesCtKeySched vectors: KeyLen, Key[32], CompSKey[60].\n"
+        + format_macro("AES_CT_KEYS", {
+            "COUNT": num_keys,
+            "RECORD_WORDS": KEY_RECORD_WORDS,
+        }, key_records),
+        "// AesCtBitSliceEncrypt vectors: KeyIndex, Pt[8], Ortho[8],\n"
+        "// Round1[8], Ct[8].\n"
+        + format_macro("AES_CT_BLOCKS", {
+            "COUNT": num_blocks,
+            "KNOWN": min(len(KNOWN_ANSWERS), num_keys, num_blocks),
+            "RECORD_WORDS": BLOCK_RECORD_WORDS,
+        }, block_records),
+    ])
+
+
+def validate(rng: np.random.Generator, num_blocks: int = 64):
+    """Check the known answers and that decryption inverts encryption
+    for every key size.
+    """
+    for key_hex, pt_hex, ct_hex in KNOWN_ANSWERS:
+        block = np.frombuffer(bytes.fromhex(pt_hex), dtype=np.uint8)
+        if encrypt(bytes.fromhex(key_hex), block).tobytes().hex() != ct_hex:
+            raise AssertionError(f"AES-{len(key_hex) * 4} known answer failed")
+    for key_len in NUM_ROUNDS:
+        key = rng.integers(0, 256, key_len, dtype=np.uint8).tobytes()
+        blocks = rng.integers(0, 256, (num_blocks, 16), dtype=np.uint8)
+        if not np.array_equal(decrypt(key, encrypt(key, blocks)), blocks):
+            raise AssertionError(f"AES-{key_len * 8} roundtrip failed")
+
+
+def benchmark(num_blocks: int, repeat: int) -> dict[int, float]:
+    """Best-of-repeat reference model throughput in blocks per second
+    for each key size.
+    """
+    rng = np.random.default_rng(DEFAULT_SEED)
+    blocks = rng.integers(0, 256, (num_blocks, 16), dtype=np.uint8)
+    result = {}
+    for key_len in NUM_ROUNDS:
+        key = rng.integers(0, 256, key_len, dtype=np.uint8).tobytes()
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            encrypt(key, blocks)
+            best = min(best, time.perf_counter() - start)
+        result[key_len] = num_blocks / best
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--keys",
+        type=int,
+        default=DEFAULT_KEYS,
+        help="number of key schedule vectors (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--blocks",
+        type=int,
+        default=DEFAULT_BLOCKS,
+        help="number of two block state vectors (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="random seed (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    ap.add_argument(
+        "--benchmark",
+        type=int,
+        nargs="?",
+        const=1 << 16,
+        metavar="BLOCKS",
+        help="measure the reference model throughput on BLOCKS "
+             "blocks (default: %(const)s) instead of generating",
+    )
+    args = ap.parse_args()
+
+    if args.benchmark:
+        for key_len, rate in benchmark(args.benchmark, repeat=5).items():
+            print(f"AES-{key_len * 8}: {rate:12.0f} blocks/s"
+                  f" {rate * 16 / (1 << 20):8.2f} MiB/s")
+        return
+
+    if args.keys < 1 or args.blocks < args.keys:
+        ap.error("need at least one key and at least as many blocks as keys")
+
+    validate(np.random.default_rng(args.seed))
+    generated = generate(args.keys, args.blocks, args.seed)
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generator for FCryptoBenchmarkMutator, a microbenchmark mutator
+for static versus dynamic array and call overhead questions.
+
+A benchmark matrix spec is a JSON object:
+
+    {
+        "iterations": 2000,
+        "repeat": 3,
+        "matrix": [
+            {
+                "op": ["read", "write"],
+                "kind": ["static", "dynamic"],
+                "size": [8, 37],
+                "mode": ["inline", "call"],
+                "iterations": 500
+            }
+        ]
+    }
+
+Each matrix entry is expanded to the cartesian product of its axes,
+an axis may be a single value or a list. "iterations" and "repeat"
+are optional per entry and default to the top level values.
+
+    op          noop, read, write, xor or copy over Size int words
+                (noop measures the bare loop or call overhead)
+    kind        static (local int A[Size]) or dynamic (array<int>)
+    size        number of words
+    mode        inline (loop in the benchmark function) or call
+                (loop in a static function called once per iteration)
+    iterations  timed iterations per sample
+
+Each case logs one line per sample (repeat) from RunBenchmarks:
+
+    BENCH|<op>|<kind>|<size>|<mode>|<iterations>|<Clock() time>
+
+which UDKTests/timings.py collects and UDKTests/benchreport.py turns
+into comparison tables. The mutator runs all cases in PostBeginPlay,
+the test harness runs it alongside FCryptoTestMutator when
+FCRYPTO_BENCHMARK is enabled.
+
+Usage:
+    python bench_codegen.py                    # Default matrix.
+    python bench_codegen.py --spec spec.json   # Custom matrix.
+    python bench_codegen.py --check            # Fail if the output file is stale.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoBenchmarkMutator.uc"
+CLASS_NAME = "FCryptoBenchmarkMutator"
+
+OPS = ("noop", "read", "write", "xor", "copy")
+KINDS = ("static", "dynamic")
+MODES = ("inline", "call")
+
+# Sizes are a small array and the FCryptoEC_Prime I15_LEN.
+DEFAULT_SPEC: dict[str, Any] = {
+    "iterations": 2000,
+    "repeat": 3,
+    "matrix": [
+        {
+            "op": list(OPS),
+            "kind": list(KINDS),
+            "size": [8, 37],
+            "mode": list(MODES),
+        },
+    ],
+}
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+"""
+
+# Loop bodies over word J, Acc is the accumulated result.
+OP_BODIES = {
+    "noop": None,
+    "read": "Acc += A[J];",
+    "write": "A[J] = J;",
+    "xor": "A[J] = A[J] ^ B[J];",
+    "copy": "B[J] = A[J];",
+}
+
+
+class SpecError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    op: str
+    kind: str
+    size: int
+    mode: str
+    iterations: int
+    repeat: int
+
+    @property
+    def suffix(self) -> str:
+        return f"{self.kind[0].upper()}{self.size}"
+
+    @property
+    def name(self) -> str:
+        return f"Bench_{self.op.capitalize()}_{self.suffix}_{self.mode.capitalize()}"
+
+    @property
+    def helper(self) -> str:
+        return f"{self.op.capitalize()}_{self.suffix}"
+
+
+def _axis(entry: dict[str, Any], key: str, default: Any = None) -> list[Any]:
+    value = entry.get(key, default)
+    if value is None:
+        raise SpecError(f"matrix entry is missing '{key}'")
+    return value if isinstance(value, list) else [value]
+
+
+def expand(spec: dict[str, Any]) -> list[BenchCase]:
+    """Expand the matrix of spec to unique cases, in spec order."""
+    cases: dict[tuple, BenchCase] = {}
+    for entry in spec.get("matrix", []):
+        for op, kind, size, mode, iterations, repeat in itertools.product(
+                _axis(entry, "op"),
+                _axis(entry, "kind"),
+                _axis(entry, "size"),
+                _axis(entry, "mode"),
+                _axis(entry, "iterations", spec.get("iterations")),
+                _axis(entry, "repeat", spec.get("repeat", 1)),
+        ):
+            if op not in OPS:
+                raise SpecError(f"unknown op '{op}', expected one of {OPS}")
+            if kind not in KINDS:
+                raise SpecError(f"unknown array kind '{kind}', expected one of {KINDS}")
+            if mode not in MODES:
+                raise SpecError(f"unknown mode '{mode}', expected one of {MODES}")
+            if not isinstance(size, int) or size < 1:
+                raise SpecError(f"invalid size {size!r}")
+            if not isinstance(iterations, int) or iterations < 1:
+                raise SpecError(f"invalid iteration count {iterations!r}")
+            if not isinstance(repeat, int) or repeat < 1:
+                raise SpecError(f"invalid repeat count {repeat!r}")
+            case = BenchCase(op, kind, size, mode, iterations, repeat)
+            # Later entries override the counts of earlier ones.
+            cases[(op, kind, size, mode)] = case
+    if not cases:
+        raise SpecError("empty benchmark matrix")
+    return list(cases.values())
+
+
+def _array_decls(kind: str, size: int, prefix: str) -> list[str]:
+    if kind == "static":
+        return [f"{prefix}int A[{size}]", f"{prefix}int B[{size}]"]
+    return [f"{prefix}array<int> A", f"{prefix}array<int> B"]
+
+
+def _loop(op: str, size: int, indent: str) -> list[str]:
+    body = OP_BODIES[op]
+    if body is None:
+        return []
+    return [
+        f"{indent}for (J = 0; J < {size}; ++J)",
+        f"{indent}{{",
+        f"{indent}    {body}",
+        f"{indent}}}",
+    ]
+
+
+def render_helper(case: BenchCase) -> list[str]:
+    params = ",\n".join(f"    {d}" for d in _array_decls(case.kind, case.size, "out "))
+    lines = [
+        f"static final function int {case.helper}(",
+        params,
+        ")",
+        "{",
+    ]
+    loop = _loop(case.op, case.size, "    ")
+    if loop:
+        lines += ["    local int J;", "    local int Acc;", "", "    Acc = 0;"]
+        lines += loop
+        lines += ["    return Acc;"]
+    else:
+        lines += ["    return 0;"]
+    lines.append("}")
+    return lines
+
+
+def render_case(case: BenchCase) -> list[str]:
+    lines = [
+        f"final function {case.name}()",
+        "{",
+        *(f"    local {d};" for d in _array_decls(case.kind, case.size, "")),
+        "    local int I;",
+        "    local int J;",
+        "    local int Acc;",
+        "    local int Rep;",
+        "    local float Time;",
+        "",
+    ]
+    if case.kind == "dynamic":
+        lines += [f"    A.Length = {case.size};", f"    B.Length = {case.size};"]
+    lines += [
+        f"    for (J = 0; J < {case.size}; ++J)",
+        "    {",
+        "        A[J] = J;",
+        "        B[J] = ~J;",
+        "    }",
+        "    Acc = 0;",
+        "",
+        f"    for (Rep = 0; Rep < {case.repeat}; ++Rep)",
+        "    {",
+        "        Time = 0;",
+        "        Clock(Time);",
+        f"        for (I = 0; I < {case.iterations}; ++I)",
+        "        {",
+    ]
+    if case.mode == "call":
+        lines.append(f"            Acc += {case.helper}(A, B);")
+    else:
+        lines += _loop(case.op, case.size, "            ")
+    lines += [
+        "        }",
+        "        UnClock(Time);",
+        f'        `fclog("BENCH|{case.op}|{case.kind}|{case.size}|{case.mode}|'
+        f'{case.iterations}|" $ Time);',
+        "    }",
+        "",
+        "    // Results are not used, keep the compiler quiet.",
+        "    B[0] = Acc;",
+        "}",
+    ]
+    return lines
+
+
+def generate(spec: dict[str, Any]) -> str:
+    cases = expand(spec)
+    helpers: dict[str, BenchCase] = {}
+    for case in cases:
+        if case.mode == "call":
+            helpers.setdefault(case.helper, case)
+
+    parts = [
+        HEADER + "// Generated by DevUtils/bench_codegen.py.",
+        "/**\n"
+        " * Static versus dynamic array and call overhead microbenchmarks.\n"
+        " * Logs \"BENCH|op|kind|size|mode|iterations|clock\" lines.\n"
+        " */\n"
+        f"class {CLASS_NAME} extends Mutator;\n\n"
+        "`include(FCrypto\\Classes\\FCryptoMacros.uci);",
+        "\n".join([
+            "function PostBeginPlay()",
+            "{",
+            "    super.PostBeginPlay();",
+            "    RunBenchmarks();",
+            "}",
+        ]),
+        "\n".join([
+            "final function RunBenchmarks()",
+            "{",
+            f'    `fclog("running {len(cases)} benchmark cases");',
+            *(f"    {case.name}();" for case in cases),
+            "}",
+        ]),
+    ]
+    parts += ["\n".join(render_helper(case)) for case in helpers.values()]
+    parts += ["\n".join(render_case(case)) for case in cases]
+    parts.append("DefaultProperties\n{\n}")
+    return "\n\n".join(parts) + "\n"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--spec",
+        type=Path,
+        help="benchmark matrix spec JSON file (default: built-in matrix)",
+    )
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    args = ap.parse_args()
+
+    spec = json.loads(args.spec.read_text()) if args.spec else DEFAULT_SPEC
+    try:
+        generated = generate(spec)
+    except SpecError as e:
+        ap.error(str(e))
+
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()} ({len(expand(spec))} cases)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+#!/usr/bin/env python
+
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generates fixed-size static array specializations of the generic
+dynamic array functions in FCryptoBigInt.uc.
+
+Static arrays are considerably faster than dynamic arrays in the
+UnrealScript VM, but keeping hand-written copies of each function
+in sync with the generic version is error-prone. Instead, generic
+functions are annotated with one or more @specialize comments placed
+directly above the function header:
+
+    // @specialize Add_Static37(A[37], B[37])
+    // @specialize Add_Static37_DynB(A[37])
+    static final function int Add(
+        out array<int> A,
+        ...
+
+Each name inside the parentheses refers to an array<T> parameter or
+local variable of the generic function, which is turned into a static
+array T Name[N] in the generated function. Calls to other annotated
+functions are redirected to the specialization whose static arguments
+match the caller's. Dynamic array resizing (X.Length = ...) is removed
+for static arrays and the remaining X.Length reads are replaced with
+ArrayCount(X).
+
+Usage:
+    python bigint_codegen.py          # Regenerate the output file.
+    python bigint_codegen.py --check  # Fail if the output file is stale.
+"""
+
+import argparse
+import dataclasses
+import re
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_SOURCE = CLASSES_DIR / "FCryptoBigInt.uc"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoBigIntSpecializations.uci"
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+// Generated by DevUtils/bigint_codegen.py from the @specialize
+// annotations in FCryptoBigInt.uc. Edit the generic functions
+// instead and re-run the generator.
+"""
+
+FUNC_HEADER_RE = re.compile(
+    r"^static\s+final\s+function\s+(?:(?P<ret>\w+)\s+)?(?P<name>\w+)\s*\(",
+    re.MULTILINE,
+)
+SPECIALIZE_RE = re.compile(
+    r"^//\s*@specialize\s+(?P<name>\w+)\s*\((?P<args>[^)]*)\)\s*$")
+SPEC_ARG_RE = re.compile(r"^(?P<name>\w+)\s*\[\s*(?P<size>\d+)\s*]$")
+PARAM_NAME_RE = re.compile(r"(\w+)\s*(?:\[\s*\d+\s*])?\s*(?:=\s*[^,]+)?$")
+CALL_RE = re.compile(r"(?<![\w.'])(?P<name>\w+)\s*\(")
+
+
+class CodegenError(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class Specialization:
+    name: str
+    # Array name -> static size.
+    sizes: dict[str, int]
+
+
+@dataclasses.dataclass
+class GenericFunction:
+    name: str
+    # Full function text, starting from "static final function".
+    text: str
+    # Index of the opening parenthesis of the parameter list in text.
+    params_start: int
+    # Index of the closing parenthesis of the parameter list in text.
+    params_end: int
+    param_names: list[str]
+    specializations: list[Specialization]
+
+    @property
+    def header(self) -> str:
+        return self.text[:self.params_end + 1]
+
+    @property
+    def body(self) -> str:
+        return self.text[self.params_end + 1:]
+
+    def static_args(self, spec: Specialization) -> tuple[int | None, ...]:
+        """Static sizes of the parameters of spec, by position."""
+        return tuple(spec.sizes.get(p) for p in self.param_names)
+
+
+def skip_code(text: str, i: int) -> int:
+    """If text[i] starts a comment or a string literal, return
+    the index right after it. Otherwise, return i unchanged.
+    """
+    if text.startswith("//", i):
+        end = text.find("\n", i)
+        return len(text) if end == -1 else end
+    if text.startswith("/*", i):
+        end = text.find("*/", i + 2)
+        if end == -1:
+            raise CodegenError("unterminated block comment")
+        return end + 2
+    if text[i] in "\"'":
+        quote = text[i]
+        i += 1
+        while i < len(text) and text[i] != quote:
+            i += 2 if text[i] == "\\" else 1
+        return i + 1
+    return i
+
+
+def find_closing(text: str, start: int, open_ch: str, close_ch: str) -> int:
+    """Return the index of the bracket closing the one at text[start]."""
+    depth = 0
+    i = start
+    while i < len(text):
+        j = skip_code(text, i)
+        if j != i:
+            i = j
+            continue
+        if text[i] == open_ch:
+            depth += 1
+        elif text[i] == close_ch:
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise CodegenError(f"unbalanced '{open_ch}' at offset {start}")
+
+
+def split_args(args: str) -> list[str]:
+    """Split a call argument list or a parameter list at top level commas."""
+    parts = []
+    depth = 0
+    current = []
+    i = 0
+    while i < len(args):
+        j = skip_code(args, i)
+        if j != i:
+            current.append(args[i:j])
+            i = j
+            continue
+        ch = args[i]
+        if ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        if ch == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    if "".join(current).strip():
+        parts.append("".join(current))
+    return [p.strip() for p in parts]
+
+
+def strip_comments(text: str) -> str:
+    out = []
+    i = 0
+    while i < len(text):
+        j = skip_code(text, i)
+        if j != i:
+            if text[i] in "\"'":
+                out.append(text[i:j])
+            i = j
+            continue
+        out.append(text[i])
+        i += 1
+    return "".join(out)
+
+
+def parse_specialization(line: str) -> Specialization:
+    match = SPECIALIZE_RE.match(line.strip())
+    if not match:
+        raise CodegenError(f"invalid @specialize annotation: '{line.strip()}'")
+    sizes = {}
+    for arg in split_args(match.group("args")):
+        arg_match = SPEC_ARG_RE.match(arg)
+        if not arg_match:
+            raise CodegenError(
+                f"invalid @specialize argument '{arg}' in '{line.strip()}'")
+        sizes[arg_match.group("name")] = int(arg_match.group("size"))
+    return Specialization(name=match.group("name"), sizes=sizes)
+
+
+def parse_functions(source: str) -> dict[str, GenericFunction]:
+    """Parse all functions annotated with @specialize from source."""
+    functions = {}
+    for match in FUNC_HEADER_RE.finditer(source):
+        preceding = source[:match.start()].rstrip("\n").split("\n")
+        annotations = []
+        while preceding and SPECIALIZE_RE.match(preceding[-1].strip()):
+            annotations.append(preceding.pop())
+        if not annotations:
+            continue
+
+        start = match.start()
+        params_start = match.end() - 1
+        params_end = find_closing(source, params_start, "(", ")")
+        body_start = source.index("{", params_end)
+        body_end = find_closing(source, body_start, "{", "}")
+        text = source[start:body_end + 1]
+
+        param_names = []
+        params = strip_comments(source[params_start + 1:params_end])
+        for param in split_args(params):
+            name_match = PARAM_NAME_RE.search(param)
+            if not name_match:
+                raise CodegenError(
+                    f"cannot parse parameter '{param}' of {match['name']}")
+            param_names.append(name_match.group(1))
+
+        functions[match["name"]] = GenericFunction(
+            name=match["name"],
+            text=text,
+            params_start=params_start - start,
+            params_end=params_end - start,
+            param_names=param_names,
+            specializations=[
+                parse_specialization(a) for a in reversed(annotations)
+            ],
+        )
+    return functions
+
+
+def make_static_decl(text: str, name: str, size: int, func: str) -> str:
+    """Turn the declaration 'array<T> Name' into 'T Name[Size]'."""
+    decl_re = re.compile(rf"array<(\w+)>(\s+){name}\b")
+    new_text, count = decl_re.subn(rf"\1\g<2>{name}[{size}]", text)
+    if count != 1:
+        raise CodegenError(
+            f"{func}: expected exactly one array declaration "
+            f"for '{name}', found {count}")
+    return new_text
+
+
+def remove_statement(text: str, start: int) -> str:
+    """Remove the statement (with any attached block) starting
+    at text[start] along with its indentation and line break.
+    """
+    line_start = text.rfind("\n", 0, start) + 1
+    i = start
+    if re.match(r"if\s*\(", text[i:]):
+        i = find_closing(text, text.index("(", i), "(", ")") + 1
+        while text[i].isspace():
+            i += 1
+        if text[i] == "{":
+            end = find_closing(text, i, "{", "}") + 1
+        else:
+            end = text.index(";", i) + 1
+    else:
+        end = text.index(";", i) + 1
+    if text.startswith("\n", end):
+        end += 1
+    return text[:line_start] + text[end:]
+
+
+def remove_dynamic_resizes(body: str, name: str, func: str) -> str:
+    """Remove statements resizing array Name and replace other
+    Name.Length reads with ArrayCount(Name).
+    """
+    length_re = re.compile(rf"\b{name}\s*\.\s*Length\b")
+    stmt_re = re.compile(
+        rf"^[ \t]*(?P<stmt>if\s*\(|{name}\s*\.\s*Length\s*=(?!=))",
+        re.MULTILINE)
+    pos = 0
+    while True:
+        match = stmt_re.search(body, pos)
+        if not match:
+            break
+        start = match.start("stmt")
+        if match.group("stmt").startswith("if"):
+            cond_end = find_closing(body, body.index("(", start), "(", ")")
+            if not length_re.search(strip_comments(body[start:cond_end])):
+                pos = match.end()
+                continue
+        body = remove_statement(body, start)
+        pos = body.rfind("\n", 0, start) + 1
+
+    body = re.sub(r"\n([ \t]*\n){2,}", "\n\n", body)
+    return length_re.sub(f"ArrayCount({name})", body)
+
+
+def check_no_assignment(body: str, name: str, func: str):
+    assign_re = re.compile(rf"^[ \t]*{name}\s*=(?!=)", re.MULTILINE)
+    if assign_re.search(strip_comments(body)):
+        raise CodegenError(
+            f"{func}: static array '{name}' cannot be assigned to")
+
+
+def redirect_calls(
+        body: str,
+        sizes: dict[str, int],
+        functions: dict[str, GenericFunction],
+        func: str,
+) -> str:
+    """Redirect calls to specialized functions based on which
+    arguments are static arrays in the calling specialization.
+    """
+    out = []
+    pos = 0
+    code = body
+    i = 0
+    while i < len(code):
+        j = skip_code(code, i)
+        if j != i:
+            i = j
+            continue
+        match = CALL_RE.match(code, i)
+        if not match:
+            # Skip the rest of the current identifier.
+            if code[i].isalnum() or code[i] == "_":
+                while i < len(code) and (code[i].isalnum() or code[i] == "_"):
+                    i += 1
+            else:
+                i += 1
+            continue
+
+        callee = functions.get(match.group("name"))
+        if callee is None:
+            i = match.end()
+            continue
+
+        args_start = match.end() - 1
+        args_end = find_closing(code, args_start, "(", ")")
+        args = split_args(strip_comments(code[args_start + 1:args_end]))
+        static_args = tuple(sizes.get(a) for a in args)
+        static_args += (None,) * (len(callee.param_names) - len(static_args))
+        if any(s is not None for s in static_args):
+            candidates = [
+                s for s in callee.specializations
+                if callee.static_args(s) == static_args
+            ]
+            if not candidates:
+                raise CodegenError(
+                    f"{func}: no specialization of {callee.name} matches "
+                    f"call '{code[i:args_end + 1]}'")
+            out.append(code[pos:i])
+            out.append(candidates[0].name)
+            pos = match.start() + len(match.group("name"))
+        # Continue scanning inside the argument list.
+        i = args_start + 1
+
+    out.append(code[pos:])
+    return "".join(out)
+
+
+def specialize(
+        func: GenericFunction,
+        spec: Specialization,
+        functions: dict[str, GenericFunction],
+) -> str:
+    header = func.header
+    body = func.body
+    name_re = re.compile(rf"\b{func.name}(\s*\()")
+    header = name_re.sub(rf"{spec.name}\1", header, count=1)
+
+    for name, size in spec.sizes.items():
+        if name in func.param_names:
+            header = make_static_decl(header, name, size, spec.name)
+        else:
+            body = make_static_decl(body, name, size, spec.name)
+        check_no_assignment(body, name, spec.name)
+        body = remove_dynamic_resizes(body, name, spec.name)
+
+    body = redirect_calls(body, spec.sizes, functions, spec.name)
+    return f"// See {func.name}.\n{header}{body}\n"
+
+
+def generate(source: str) -> str:
+    functions = parse_functions(source)
+    names = set()
+    parts = [HEADER]
+    for func in functions.values():
+        for spec in func.specializations:
+            if spec.name in names:
+                raise CodegenError(f"duplicate specialization '{spec.name}'")
+            names.add(spec.name)
+            for name in spec.sizes:
+                if not re.search(rf"array<\w+>\s+{name}\b", func.text):
+                    raise CodegenError(
+                        f"{spec.name}: '{name}' is not an array "
+                        f"parameter or local of {func.name}")
+            parts.append(specialize(func, spec, functions))
+    return "\n".join(parts)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--source",
+        type=Path,
+        default=DEFAULT_SOURCE,
+        help="annotated UnrealScript source file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    args = ap.parse_args()
+
+    generated = generate(args.source.read_text())
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
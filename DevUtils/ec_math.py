@@ -0,0 +1,378 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Reference elliptic curve arithmetic for the curves supported by
+FCryptoEC_Prime and FCryptoEC_Curve25519.
+
+These are plain (not constant time) implementations meant for
+generating tables and test vectors, and for checking UnrealScript
+results. They must never be used to handle real secrets.
+"""
+
+import dataclasses
+from typing import Optional
+
+# Affine point, None is the point at infinity.
+Point = Optional[tuple[int, int]]
+
+
+@dataclasses.dataclass(frozen=True)
+class WeierstrassCurve:
+    """Short Weierstrass curve y^2 = x^3 - 3x + b over GF(p)."""
+    name: str
+    p: int
+    b: int
+    gx: int
+    gy: int
+    n: int
+    # Header word of the i15 encoded field modulus.
+    i15_header: int
+
+    @property
+    def bits(self) -> int:
+        return self.p.bit_length()
+
+    @property
+    def generator(self) -> tuple[int, int]:
+        return self.gx, self.gy
+
+    @property
+    def point_len(self) -> int:
+        """Length of an uncompressed encoded point."""
+        return 1 + 2 * ((self.bits + 7) // 8)
+
+    def is_on_curve(self, pt: Point) -> bool:
+        if pt is None:
+            return True
+        x, y = pt
+        return (y * y - (x * x * x - 3 * x + self.b)) % self.p == 0
+
+    def add(self, p1: Point, p2: Point) -> Point:
+        if p1 is None:
+            return p2
+        if p2 is None:
+            return p1
+        p = self.p
+        x1, y1 = p1
+        x2, y2 = p2
+        if x1 == x2:
+            if (y1 + y2) % p == 0:
+                return None
+            lam = (3 * x1 * x1 - 3) * pow(2 * y1, -1, p) % p
+        else:
+            lam = (y2 - y1) * pow(x2 - x1, -1, p) % p
+        x3 = (lam * lam - x1 - x2) % p
+        y3 = (lam * (x1 - x3) - y1) % p
+        return x3, y3
+
+    def double(self, pt: Point) -> Point:
+        return self.add(pt, pt)
+
+    def mul(self, k: int, pt: Point) -> Point:
+        result: Point = None
+        addend = pt
+        while k:
+            if k & 1:
+                result = self.add(result, addend)
+            addend = self.double(addend)
+            k >>= 1
+        return result
+
+    def _jacobian_double(self, x1: int, y1: int, z1: int) -> tuple[int, int, int]:
+        p = self.p
+        if y1 == 0 or z1 == 0:
+            return 1, 1, 0
+        delta = z1 * z1 % p
+        gamma = y1 * y1 % p
+        beta = x1 * gamma % p
+        alpha = 3 * (x1 - delta) * (x1 + delta) % p
+        x3 = (alpha * alpha - 8 * beta) % p
+        z3 = ((y1 + z1) ** 2 - gamma - delta) % p
+        y3 = (alpha * (4 * beta - x3) - 8 * gamma * gamma) % p
+        return x3, y3, z3
+
+    def _jacobian_add_affine(
+            self, x1: int, y1: int, z1: int, x2: int, y2: int,
+    ) -> tuple[int, int, int]:
+        p = self.p
+        if z1 == 0:
+            return x2, y2, 1
+        zz = z1 * z1 % p
+        u2 = x2 * zz % p
+        s2 = y2 * zz * z1 % p
+        h = (u2 - x1) % p
+        r = (s2 - y1) % p
+        if h == 0:
+            if r == 0:
+                return self._jacobian_double(x1, y1, z1)
+            return 1, 1, 0
+        hh = h * h % p
+        hhh = hh * h % p
+        v = x1 * hh % p
+        x3 = (r * r - hhh - 2 * v) % p
+        y3 = (r * (v - x3) - y1 * hhh) % p
+        z3 = z1 * h % p
+        return x3, y3, z3
+
+    def mul_jacobian(self, k: int, pt: tuple[int, int]) -> tuple[int, int, int]:
+        """k * pt in Jacobian coordinates (X, Y, Z), x = X/Z^2 and
+        y = Y/Z^3. Z is 0 for the point at infinity. Avoids the
+        per-step inversions of mul.
+        """
+        x, y, z = 1, 1, 0
+        for i in range(k.bit_length() - 1, -1, -1):
+            x, y, z = self._jacobian_double(x, y, z)
+            if (k >> i) & 1:
+                x, y, z = self._jacobian_add_affine(x, y, z, pt[0], pt[1])
+        return x, y, z
+
+    def mul_batch(self, jobs: list[tuple[int, tuple[int, int]]]) -> list[Point]:
+        """Compute k * pt for each (k, pt) of jobs, sharing a single
+        field inversion for the conversion of all results to affine.
+        """
+        p = self.p
+        results = [self.mul_jacobian(k, pt) for k, pt in jobs]
+        inverses = batch_inverse([z for _, _, z in results], p)
+        points: list[Point] = []
+        for (x, y, z), zi in zip(results, inverses):
+            if z == 0:
+                points.append(None)
+                continue
+            zi2 = zi * zi % p
+            points.append((x * zi2 % p, y * zi2 * zi % p))
+        return points
+
+    def encode_point(self, pt: tuple[int, int]) -> bytes:
+        size = (self.bits + 7) // 8
+        return b"\x04" + pt[0].to_bytes(size, "big") + pt[1].to_bytes(size, "big")
+
+    def decode_point(self, data: bytes) -> tuple[int, int]:
+        size = (self.bits + 7) // 8
+        if len(data) != 1 + 2 * size or data[0] != 0x04:
+            raise ValueError("invalid uncompressed point encoding")
+        pt = (
+            int.from_bytes(data[1:1 + size], "big"),
+            int.from_bytes(data[1 + size:], "big"),
+        )
+        if pt[0] >= self.p or pt[1] >= self.p or not self.is_on_curve(pt):
+            raise ValueError("point is not on the curve")
+        return pt
+
+
+P256 = WeierstrassCurve(
+    name="P256",
+    p=0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+    b=0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+    gx=0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+    gy=0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5,
+    n=0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551,
+    i15_header=0x0111,
+)
+
+P384 = WeierstrassCurve(
+    name="P384",
+    p=int(
+        "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFE"
+        "FFFFFFFF0000000000000000FFFFFFFF", 16),
+    b=int(
+        "B3312FA7E23EE7E4988E056BE3F82D19181D9C6EFE8141120314088F5013875A"
+        "C656398D8A2ED19D2A85C8EDD3EC2AEF", 16),
+    gx=int(
+        "AA87CA22BE8B05378EB1C71EF320AD746E1D3B628BA79B9859F741E082542A38"
+        "5502F25DBF55296C3A545E3872760AB7", 16),
+    gy=int(
+        "3617DE4A96262C6F5D9E98BF9292DC29F8F41DBD289A147CE9DA3113B5F0B8C0"
+        "0A60B1CE1D7E819D7A431D7C90EA0E5F", 16),
+    n=int(
+        "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFC7634D81F4372DDF"
+        "581A0DB248B0A77AECEC196ACCC52973", 16),
+    i15_header=0x0199,
+)
+
+P521 = WeierstrassCurve(
+    name="P521",
+    p=(1 << 521) - 1,
+    b=int(
+        "0051953EB9618E1C9A1F929A21A0B68540EEA2DA725B99B315F3B8B489918EF1"
+        "09E156193951EC7E937B1652C0BD3BB1BF073573DF883D2C34F1EF451FD46B50"
+        "3F00", 16),
+    gx=int(
+        "00C6858E06B70404E9CD9E3ECB662395B4429C648139053FB521F828AF606B4D"
+        "3DBAA14B5E77EFE75928FE1DC127A2FFA8DE3348B3C1856A429BF97E7E31C2E5"
+        "BD66", 16),
+    gy=int(
+        "011839296A789A3BC0045C8A5FB42C7D1BD998F54449579B446817AFBD17273E"
+        "662C97EE72995EF42640C550B9013FAD0761353C7086A272C24088BE94769FD1"
+        "6650", 16),
+    n=int(
+        "01FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF"
+        "FFFA51868783BF2F966B7FCC0148F709A5D03BB5C9B8899C47AEBB6FB71E9138"
+        "6409", 16),
+    i15_header=0x022B,
+)
+
+WEIERSTRASS_CURVES = {c.name: c for c in (P256, P384, P521)}
+
+# Curve25519 / Ed25519 field and constants.
+C25519_P = (1 << 255) - 19
+C25519_A24 = 121665
+C25519_ORDER = (1 << 252) + 27742317777372353535851937790883648493
+# Header word used by FCryptoEC_Curve25519 for its 17 word field elements.
+C25519_I15_HEADER = 0x0110
+ED25519_D = (-121665 * pow(121666, -1, C25519_P)) % C25519_P
+ED25519_SQRT_M1 = pow(2, (C25519_P - 1) // 4, C25519_P)
+
+
+def _ed25519_recover_x(y: int, sign: int) -> int:
+    p = C25519_P
+    xx = (y * y - 1) * pow(ED25519_D * y * y + 1, -1, p) % p
+    x = pow(xx, (p + 3) // 8, p)
+    if (x * x - xx) % p != 0:
+        x = (x * ED25519_SQRT_M1) % p
+    if (x * x - xx) % p != 0:
+        raise ValueError("not a valid Ed25519 y coordinate")
+    if (x & 1) != sign:
+        x = p - x
+    return x
+
+
+ED25519_BY = (4 * pow(5, -1, C25519_P)) % C25519_P
+ED25519_BX = _ed25519_recover_x(ED25519_BY, 0)
+ED25519_BASE = (ED25519_BX, ED25519_BY)
+
+
+def ed25519_add(p1: tuple[int, int], p2: tuple[int, int]) -> tuple[int, int]:
+    """Add two affine points on the twisted Edwards curve
+    -x^2 + y^2 = 1 + d*x^2*y^2 (complete formulas).
+    """
+    p = C25519_P
+    x1, y1 = p1
+    x2, y2 = p2
+    t = ED25519_D * x1 * x2 * y1 * y2 % p
+    x3 = (x1 * y2 + x2 * y1) * pow(1 + t, -1, p) % p
+    y3 = (y1 * y2 + x1 * x2) * pow(1 - t, -1, p) % p
+    return x3, y3
+
+
+def ed25519_mul(k: int, pt: tuple[int, int]) -> tuple[int, int]:
+    result = (0, 1)
+    addend = pt
+    while k:
+        if k & 1:
+            result = ed25519_add(result, addend)
+        addend = ed25519_add(addend, addend)
+        k >>= 1
+    return result
+
+
+def ed25519_to_montgomery_u(pt: tuple[int, int]) -> int:
+    """Map an Edwards point to the Curve25519 u-coordinate,
+    u = (1 + y) / (1 - y).
+    """
+    p = C25519_P
+    y = pt[1]
+    return (1 + y) * pow(1 - y, -1, p) % p
+
+
+def x25519_clamp(k: bytes) -> int:
+    kb = bytearray(k)
+    kb[0] &= 248
+    kb[31] &= 127
+    kb[31] |= 64
+    return int.from_bytes(kb, "little")
+
+
+def batch_inverse(values: list[int], p: int) -> list[int]:
+    """Invert all values modulo prime p with one modular inversion
+    (Montgomery's trick). Zero values map to zero.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        if v % p:
+            acc = acc * v % p
+    inv = pow(acc, -1, p)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        v = values[i] % p
+        if v:
+            result[i] = inv * prefix[i] % p
+            inv = inv * v % p
+    return result
+
+
+def _x25519_ladder(k: bytes, u: bytes) -> tuple[int, int]:
+    """Montgomery ladder of RFC 7748 X25519, returns the projective
+    result (x, z), u = x / z.
+    """
+    p = C25519_P
+    scalar = x25519_clamp(k)
+    x1 = int.from_bytes(u, "little") & ((1 << 255) - 1)
+    x2, z2, x3, z3 = 1, 0, x1, 1
+    swap = 0
+    for t in range(254, -1, -1):
+        k_t = (scalar >> t) & 1
+        swap ^= k_t
+        if swap:
+            x2, x3 = x3, x2
+            z2, z3 = z3, z2
+        swap = k_t
+        a = (x2 + z2) % p
+        aa = a * a % p
+        b = (x2 - z2) % p
+        bb = b * b % p
+        e = (aa - bb) % p
+        c = (x3 + z3) % p
+        d = (x3 - z3) % p
+        da = d * a % p
+        cb = c * b % p
+        x3 = (da + cb) ** 2 % p
+        z3 = x1 * (da - cb) ** 2 % p
+        x2 = aa * bb % p
+        z2 = e * (aa + C25519_A24 * e) % p
+    if swap:
+        x2, z2 = x3, z3
+    return x2, z2
+
+
+def x25519(k: bytes, u: bytes) -> bytes:
+    """X25519 function from RFC 7748."""
+    p = C25519_P
+    x2, z2 = _x25519_ladder(k, u)
+    return (x2 * pow(z2, p - 2, p) % p).to_bytes(32, "little")
+
+
+def x25519_batch(jobs: list[tuple[bytes, bytes]]) -> list[bytes]:
+    """X25519 of each (k, u) of jobs, sharing a single field
+    inversion between all of them.
+    """
+    p = C25519_P
+    results = [_x25519_ladder(k, u) for k, u in jobs]
+    inverses = batch_inverse([z for _, z in results], p)
+    return [
+        (x * zi % p).to_bytes(32, "little")
+        for (x, _), zi in zip(results, inverses)
+    ]
+
+
+X25519_BASE_U = (9).to_bytes(32, "little")
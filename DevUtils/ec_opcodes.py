@@ -0,0 +1,867 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Parser, reference interpreter and straight-line compiler for the
+FCryptoEC_Prime opcode programs.
+
+FCryptoEC_Prime.RunCode is a port of the small register machine of
+BearSSL's ec_prime_i15.c: 13 registers of I15_LEN words (P1x, P1y,
+P1z, P2x, P2y, P2z and the temporaries T1...T7) and six operations
+encoded as 16-bit words:
+
+    MSET(d, a)       copy a into d
+    MADD(d, a)       d = d+a (modular)
+    MSUB(d, a)       d = d-a (modular)
+    MMUL(d, a, b)    d = a*b (Montgomery multiplication)
+    MINV(d, a, b)    invert d modulo p; a and b are used as scratch registers
+    MTZ(d)           clear return value if d = 0
+
+interpret() runs a program on i15 words exactly like RunCode does,
+using the word level operations of i15.py. compile_program() turns a
+program into a dispatch-free UnrealScript function:
+
+- Programs are converted to SSA form. MSET becomes a renaming and only
+  costs a copy when an in-place MADD, MSUB or MINV would otherwise
+  clobber a value that is still needed.
+- Values are assigned to storage with a linear scan over the program.
+  Inputs are read in place from P1 and P2, results go directly to P1
+  where possible and other values share as few T slots as possible.
+  P1 and P2 may be the same variable, so a P1 coordinate is only
+  written once the same P2 coordinate is no longer needed.
+- Copies are whole _Monty struct assignments instead of per-word
+  statements.
+
+execute() runs the compiled form in Python, which is how the tests
+check the register allocation against the interpreter.
+
+Usage:
+    python ec_opcodes.py          # Validate and regenerate the output file.
+    python ec_opcodes.py --check  # Fail if the output file is stale.
+"""
+
+import argparse
+import dataclasses
+import enum
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Sequence
+
+import ec_math
+import i15
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_SOURCE = CLASSES_DIR / "FCryptoEC_Prime.uc"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoEC_PrimeCode.uci"
+
+I15_LEN = 37
+NUM_REGISTERS = 13
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+// Generated by DevUtils/ec_opcodes.py from the Code* opcode programs
+// of FCryptoEC_Prime.uc. Edit the programs and re-run the generator.
+"""
+
+REGISTERS = {
+    "P1x": 0, "P1y": 1, "P1z": 2,
+    "P2x": 3, "P2y": 4, "P2z": 5,
+    "Px": 0, "Py": 1, "Pz": 2,
+    "T1": 6, "T2": 7, "T3": 8, "T4": 9, "T5": 10, "T6": 11, "T7": 12,
+    "T8": 3, "T9": 4, "T10": 5,
+}
+REGISTER_NAMES = ["P1x", "P1y", "P1z", "P2x", "P2y", "P2z",
+                  "T1", "T2", "T3", "T4", "T5", "T6", "T7"]
+
+CODE_ARRAY_RE = re.compile(r"^\s*Code(\w+)\s*=\s*\{\((.*?)\)\}", re.MULTILINE | re.DOTALL)
+COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class OpKind(enum.IntEnum):
+    MSET = 0
+    MADD = 1
+    MSUB = 2
+    MMUL = 3
+    MINV = 4
+    MTZ = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class Op:
+    kind: OpKind
+    d: int
+    a: int = 0
+    b: int = 0
+
+    def encode(self) -> int:
+        return (self.kind << 12) + (self.d << 8) + (self.a << 4) + self.b
+
+    @classmethod
+    def decode(cls, word: int) -> "Op":
+        if not 0 < word < 0x6000:
+            raise ValueError(f"invalid opcode: {word:#06x}")
+        kind = OpKind(word >> 12)
+        d, a, b = (word >> 8) & 0x0F, (word >> 4) & 0x0F, word & 0x0F
+        if max(d, a, b) >= NUM_REGISTERS:
+            raise ValueError(f"invalid register in opcode: {word:#06x}")
+        return cls(kind, d, a, b)
+
+    def __str__(self) -> str:
+        regs = [self.d, self.a, self.b][:{
+            OpKind.MMUL: 3, OpKind.MINV: 3, OpKind.MTZ: 1}.get(self.kind, 2)]
+        return f"{self.kind.name}({', '.join(REGISTER_NAMES[r] for r in regs)})"
+
+
+def _op(kind: OpKind, *regs: str) -> Op:
+    return Op(kind, *(REGISTERS[r] for r in regs))
+
+
+def MSET(d: str, a: str) -> Op:
+    return _op(OpKind.MSET, d, a)
+
+
+def MADD(d: str, a: str) -> Op:
+    return _op(OpKind.MADD, d, a)
+
+
+def MSUB(d: str, a: str) -> Op:
+    return _op(OpKind.MSUB, d, a)
+
+
+def MMUL(d: str, a: str, b: str) -> Op:
+    return _op(OpKind.MMUL, d, a, b)
+
+
+def MINV(d: str, a: str, b: str) -> Op:
+    return _op(OpKind.MINV, d, a, b)
+
+
+def MTZ(d: str) -> Op:
+    return _op(OpKind.MTZ, d)
+
+
+# The programs of ec_prime_i15.c, as (comment, ops) sections.
+# See FCryptoEC_Prime.uc for the formulas.
+Program = list[tuple[str, list[Op]]]
+
+PROGRAMS: dict[str, Program] = {
+    "Double": [
+        ("Compute z^2 (in t1).", [
+            MMUL("T1", "Pz", "Pz"),
+        ]),
+        ("Compute x-z^2 (in t2) and then x+z^2 (in t1).", [
+            MSET("T2", "Px"),
+            MSUB("T2", "T1"),
+            MADD("T1", "Px"),
+        ]),
+        ("Compute m = 3*(x+z^2)*(x-z^2) (in t1).", [
+            MMUL("T3", "T1", "T2"),
+            MSET("T1", "T3"),
+            MADD("T1", "T3"),
+            MADD("T1", "T3"),
+        ]),
+        ("Compute s = 4*x*y^2 (in t2) and 2*y^2 (in t3).", [
+            MMUL("T3", "Py", "Py"),
+            MADD("T3", "T3"),
+            MMUL("T2", "Px", "T3"),
+            MADD("T2", "T2"),
+        ]),
+        ("Compute x' = m^2 - 2*s.", [
+            MMUL("Px", "T1", "T1"),
+            MSUB("Px", "T2"),
+            MSUB("Px", "T2"),
+        ]),
+        ("Compute z' = 2*y*z.", [
+            MMUL("T4", "Py", "Pz"),
+            MSET("Pz", "T4"),
+            MADD("Pz", "T4"),
+        ]),
+        ("Compute y' = m*(s - x') - 8*y^4. Note that we already have\n"
+         "2*y^2 in t3.", [
+            MSUB("T2", "Px"),
+            MMUL("Py", "T1", "T2"),
+            MMUL("T4", "T3", "T3"),
+            MSUB("Py", "T4"),
+            MSUB("Py", "T4"),
+        ]),
+    ],
+    "Add": [
+        ("Compute u1 = x1*z2^2 (in t1) and s1 = y1*z2^3 (in t3).", [
+            MMUL("T3", "P2z", "P2z"),
+            MMUL("T1", "P1x", "T3"),
+            MMUL("T4", "P2z", "T3"),
+            MMUL("T3", "P1y", "T4"),
+        ]),
+        ("Compute u2 = x2*z1^2 (in t2) and s2 = y2*z1^3 (in t4).", [
+            MMUL("T4", "P1z", "P1z"),
+            MMUL("T2", "P2x", "T4"),
+            MMUL("T5", "P1z", "T4"),
+            MMUL("T4", "P2y", "T5"),
+        ]),
+        ("Compute h = u2 - u1 (in t2) and r = s2 - s1 (in t4).", [
+            MSUB("T2", "T1"),
+            MSUB("T4", "T3"),
+        ]),
+        ("Report cases where r = 0 through the returned flag.", [
+            MTZ("T4"),
+        ]),
+        ("Compute u1*h^2 (in t6) and h^3 (in t5).", [
+            MMUL("T7", "T2", "T2"),
+            MMUL("T6", "T1", "T7"),
+            MMUL("T5", "T7", "T2"),
+        ]),
+        ("Compute x3 = r^2 - h^3 - 2*u1*h^2.\n"
+         "t1 and t7 can be used as scratch registers.", [
+            MMUL("P1x", "T4", "T4"),
+            MSUB("P1x", "T5"),
+            MSUB("P1x", "T6"),
+            MSUB("P1x", "T6"),
+        ]),
+        ("Compute y3 = r*(u1*h^2 - x3) - s1*h^3.", [
+            MSUB("T6", "P1x"),
+            MMUL("P1y", "T4", "T6"),
+            MMUL("T1", "T5", "T3"),
+            MSUB("P1y", "T1"),
+        ]),
+        ("Compute z3 = h*z1*z2.", [
+            MMUL("T1", "P1z", "P2z"),
+            MMUL("P1z", "T1", "T2"),
+        ]),
+    ],
+    "Check": [
+        ("Convert x and y to Montgomery representation.", [
+            MMUL("T1", "P1x", "P2x"),
+            MMUL("T2", "P1y", "P2x"),
+            MSET("P1x", "T1"),
+            MSET("P1y", "T2"),
+        ]),
+        ("Compute x^3 in t1.", [
+            MMUL("T2", "P1x", "P1x"),
+            MMUL("T1", "P1x", "T2"),
+        ]),
+        ("Subtract 3*x from t1.", [
+            MSUB("T1", "P1x"),
+            MSUB("T1", "P1x"),
+            MSUB("T1", "P1x"),
+        ]),
+        ("Add b.", [
+            MADD("T1", "P2y"),
+        ]),
+        ("Compute y^2 in t2.", [
+            MMUL("T2", "P1y", "P1y"),
+        ]),
+        ("Compare y^2 with x^3 - 3*x + b; they must match.", [
+            MSUB("T1", "T2"),
+            MTZ("T1"),
+        ]),
+        ("Set z to 1 (in Montgomery representation).", [
+            MMUL("P1z", "P2x", "P2z"),
+        ]),
+    ],
+    "Affine": [
+        ("Save z*R in t1.", [
+            MSET("T1", "P1z"),
+        ]),
+        ("Compute z^3 in t2.", [
+            MMUL("T2", "P1z", "P1z"),
+            MMUL("T3", "P1z", "T2"),
+            MMUL("T2", "T3", "P2z"),
+        ]),
+        ("Invert to (1/z^3) in t2.", [
+            MINV("T2", "T3", "T4"),
+        ]),
+        ("Compute y.", [
+            MSET("T3", "P1y"),
+            MMUL("P1y", "T2", "T3"),
+        ]),
+        ("Compute (1/z^2) in t3.", [
+            MMUL("T3", "T2", "T1"),
+        ]),
+        ("Compute x.", [
+            MSET("T2", "P1x"),
+            MMUL("P1x", "T2", "T3"),
+        ]),
+    ],
+}
+
+
+def program_ops(program: Program) -> list[Op]:
+    return [op for _, ops in program for op in ops]
+
+
+def parse_code_arrays(source: str) -> dict[str, list[int]]:
+    """Code* opcode arrays in the DefaultProperties of source, without
+    the terminating `ENCODE (0) word.
+    """
+    arrays = {}
+    for m in CODE_ARRAY_RE.finditer(source):
+        words = []
+        for token in COMMENT_RE.sub(" ", m.group(2)).split(","):
+            token = token.strip()
+            if not token:
+                continue
+            word = 0 if token == "`ENCODE" else int(token, 0)
+            if word == 0:
+                break
+            words.append(word)
+        arrays[m.group(1)] = words
+    return arrays
+
+
+def decode_program(words: Sequence[int]) -> list[Op]:
+    return [Op.decode(w) for w in words]
+
+
+def format_code_array(name: str, program: Program, indent: str = "    ") -> str:
+    """DefaultProperties entry for a program, in the style of the
+    hand-written ones in FCryptoEC_Prime.uc.
+    """
+    lines = [f"{indent}Code{name}={{("]
+    for i, (comment, ops) in enumerate(program):
+        if i:
+            lines.append("")
+        lines.append(f"{indent * 2}/*")
+        lines.extend(f"{indent * 2}* {line}" for line in comment.split("\n"))
+        lines.append(f"{indent * 2}*/")
+        for op in ops:
+            regs = re.sub(r"\b(\w+)\b", r"`\1", str(op).split("(", 1)[1])
+            lines.append(f"{indent * 2}// `{op.kind.name}({regs},")
+        lines.extend(f"{indent * 2}{op.encode()}," for op in ops)
+    lines.append("")
+    lines.append(f"{indent * 2}`ENCODE")
+    lines.append(f"{indent})}}")
+    return "\n".join(lines)
+
+
+@dataclasses.dataclass(frozen=True)
+class CurveParams:
+    m: list[int]
+    m0i: int
+
+    @classmethod
+    def from_curve(cls, curve: ec_math.WeierstrassCurve) -> "CurveParams":
+        m = i15.to_words(curve.p, curve.i15_header)
+        return cls(m=m, m0i=i15.ninv15(m[1]))
+
+    def inv_exponent(self) -> bytes:
+        """p - 2, encoded like RunCode does for MINV."""
+        plen = (self.m[0] - (self.m[0] >> 4) + 7) >> 3
+        tp = bytearray(i15.from_words(self.m).to_bytes(plen, "big"))
+        tp[plen - 1] -= 2
+        return bytes(tp)
+
+
+def pad(words: Sequence[int]) -> list[int]:
+    return list(words) + [0] * (I15_LEN - len(words))
+
+
+# FCryptoEC_Prime::RunCode
+def interpret(
+        program: Sequence[Op],
+        p1: Sequence[Sequence[int]],
+        p2: Sequence[Sequence[int]],
+        cc: CurveParams,
+) -> tuple[int, list[list[int]]]:
+    """Run program on the Jacobian points p1 and p2 (three lists of
+    i15 words each). Returns the flag and the new p1.
+    """
+    t = [pad(w) for w in p1] + [pad(w) for w in p2]
+    t += [[0] * I15_LEN for _ in range(NUM_REGISTERS - 6)]
+    r = 1
+    for op in program:
+        d, a, b = t[op.d], t[op.a], t[op.b]
+        match op.kind:
+            case OpKind.MSET:
+                t[op.d] = list(a)
+            case OpKind.MADD:
+                ctl = i15.add(d, a, 1)
+                ctl |= i15.sub(d, cc.m, 0) ^ 1
+                i15.sub(d, cc.m, ctl)
+            case OpKind.MSUB:
+                i15.add(d, cc.m, i15.sub(d, a, 1))
+            case OpKind.MMUL:
+                i15.montymul(d, a, b, cc.m, cc.m0i)
+            case OpKind.MINV:
+                i15.modpow(d, cc.inv_exponent(), cc.m, cc.m0i, a, b)
+            case OpKind.MTZ:
+                r &= i15.iszero(d) ^ 1
+    return r, [t[0], t[1], t[2]]
+
+
+# Storage locations of the compiled code, ("P1", k), ("P2", k) or ("T", i).
+Loc = tuple[str, int]
+
+
+@dataclasses.dataclass(frozen=True)
+class Instr:
+    kind: str  # "copy" or the lower case OpKind name without the "M".
+    dst: Loc
+    srcs: tuple[Loc, ...] = ()
+    comment: str = ""
+
+
+@dataclasses.dataclass
+class CompiledFunction:
+    name: str
+    instrs: list[Instr]
+    num_temps: int
+    uses_p2: bool
+
+    @property
+    def num_copies(self) -> int:
+        return sum(i.kind == "copy" for i in self.instrs)
+
+
+@dataclasses.dataclass
+class _SsaOp:
+    op: Op
+    dst: int | None
+    srcs: tuple[int, ...]
+
+
+def _to_ssa(program: Sequence[Op]) -> tuple[list[_SsaOp], list[int], int]:
+    """Returns the SSA ops, the values of P1x, P1y and P1z at the end
+    and the number of values. Values 0...5 are the inputs.
+    """
+    undefined = -1
+    cur = list(range(6)) + [undefined] * (NUM_REGISTERS - 6)
+    num_values = 6
+    ops = []
+
+    def read(reg: int, op: Op) -> int:
+        if cur[reg] == undefined:
+            raise ValueError(f"{op} reads undefined register {REGISTER_NAMES[reg]}")
+        return cur[reg]
+
+    for op in program:
+        if op.kind == OpKind.MSET:
+            cur[op.d] = read(op.a, op)
+            continue
+        if op.kind == OpKind.MTZ:
+            ops.append(_SsaOp(op, None, (read(op.d, op),)))
+            continue
+        srcs: tuple[int, ...]
+        if op.kind == OpKind.MMUL:
+            if op.d in (op.a, op.b):
+                raise ValueError(f"{op}: destination must differ from the operands")
+            srcs = (read(op.a, op), read(op.b, op))
+        elif op.kind == OpKind.MINV:
+            srcs = (read(op.d, op),)
+        else:
+            srcs = (read(op.d, op), read(op.a, op))
+        ops.append(_SsaOp(op, num_values, srcs))
+        cur[op.d] = num_values
+        num_values += 1
+        if op.kind == OpKind.MINV:
+            # Scratch registers are clobbered.
+            cur[op.a] = cur[op.b] = undefined
+    return ops, [read(r, Op(OpKind.MSET, r)) for r in range(3)], num_values
+
+
+def compile_program(name: str, program: Sequence[Op]) -> CompiledFunction:
+    ops, outputs, num_values = _to_ssa(program)
+
+    # Dead code elimination.
+    needed = set(outputs)
+    live_ops = []
+    for sop in reversed(ops):
+        if sop.dst is None or sop.dst in needed:
+            live_ops.append(sop)
+            needed.update(sop.srcs)
+    ops = live_ops[::-1]
+
+    end = len(ops)
+    last_use = {v: -1 for v in range(num_values)}
+    for i, sop in enumerate(ops):
+        for v in sop.srcs:
+            last_use[v] = i
+    for v in outputs:
+        last_use[v] = end
+    uses_p2 = any(last_use[v] >= 0 for v in (3, 4, 5))
+
+    # Preferred P1 coordinate of values that end up as outputs,
+    # possibly through in-place operations.
+    hint: dict[int, int] = {}
+    for k, v in enumerate(outputs):
+        hint.setdefault(v, k)
+    for i in range(end - 1, -1, -1):
+        sop = ops[i]
+        if sop.dst in hint and sop.op.kind != OpKind.MMUL and last_use[sop.srcs[0]] == i:
+            hint.setdefault(sop.srcs[0], hint[sop.dst])
+
+    loc: dict[int, Loc] = {}
+    holder: dict[Loc, int] = {}
+    for k in range(3):
+        loc[k] = ("P1", k)
+        holder[("P1", k)] = k
+        if uses_p2:
+            loc[3 + k] = ("P2", k)
+            holder[("P2", k)] = 3 + k
+    temps: list[Loc] = []
+    instrs: list[Instr] = []
+
+    def is_free(l: Loc, i: int) -> bool:
+        return l not in holder or last_use[holder[l]] < i
+
+    def is_writable(l: Loc, i: int) -> bool:
+        if l[0] == "P2":
+            return False
+        # P2 may be the same variable as P1.
+        return not (l[0] == "P1" and uses_p2 and last_use[3 + l[1]] >= i)
+
+    def pick(v: int | None, i: int, exclude: set[Loc]) -> Loc:
+        candidates = []
+        if v in hint:
+            candidates.append(("P1", hint[v]))
+        candidates += temps
+        for l in candidates:
+            if l not in exclude and is_free(l, i) and is_writable(l, i):
+                return l
+        temps.append(("T", len(temps)))
+        return temps[-1]
+
+    def store(v: int, l: Loc):
+        loc[v] = l
+        holder[l] = v
+
+    for i, sop in enumerate(ops):
+        op = sop.op
+        comment = str(op)
+        srcs = tuple(loc[v] for v in sop.srcs)
+        if sop.dst is None:
+            # MTZ, the only op without a result.
+            instrs.append(Instr("tz", srcs[0], (), comment))
+            continue
+        match op.kind:
+            case OpKind.MMUL:
+                dst = pick(sop.dst, i, set(srcs))
+                instrs.append(Instr("mul", dst, srcs, comment))
+                store(sop.dst, dst)
+            case _:
+                dst = srcs[0]
+                if last_use[sop.srcs[0]] != i or not is_writable(dst, i):
+                    dst = pick(sop.dst, i, set(srcs))
+                    instrs.append(Instr("copy", dst, (srcs[0],), f"MSET for {comment}"))
+                if op.kind == OpKind.MINV:
+                    scratch: list[Loc] = []
+                    for _ in range(2):
+                        scratch.append(pick(None, i, {dst, *scratch}))
+                    instrs.append(Instr("inv", dst, tuple(scratch), comment))
+                else:
+                    kind = "add" if op.kind == OpKind.MADD else "sub"
+                    instrs.append(Instr(kind, dst, srcs[1:], comment))
+                store(sop.dst, dst)
+
+    # Move the results into P1. Writing P1 k is safe once no pending
+    # move reads P1 k (or P2 k, which may be the same variable).
+    moves = {("P1", k): loc[v] for k, v in enumerate(outputs) if loc[v] != ("P1", k)}
+    while moves:
+        pending_reads = {(("P1", s[1]) if s[0] == "P2" else s) for s in moves.values()}
+        ready = [d for d in moves if d not in pending_reads]
+        if not ready:
+            # Break a cycle through a temporary.
+            d, s = next(iter(moves.items()))
+            tmp = pick(None, end + 1, set(moves) | set(moves.values()))
+            instrs.append(Instr("copy", tmp, (s,), "result"))
+            moves[d] = tmp
+            continue
+        for d in ready:
+            instrs.append(Instr("copy", d, (moves.pop(d),), "result"))
+
+    return CompiledFunction(f"RunCode{name}", instrs, len(temps), uses_p2)
+
+
+def execute(
+        func: CompiledFunction,
+        p1: Sequence[Sequence[int]],
+        p2: Sequence[Sequence[int]] | None,
+        cc: CurveParams,
+) -> tuple[int, list[list[int]]]:
+    """Run a compiled function like UnrealScript would. If p2 is
+    p1, P2 is the same variable as P1.
+    """
+    aliased = p2 is p1
+    mem: dict[Loc, list[int]] = {("P1", k): pad(p1[k]) for k in range(3)}
+    if p2 is not None:
+        for k in range(3):
+            mem[("P2", k)] = mem[("P1", k)] if aliased else pad(p2[k])
+    for i in range(func.num_temps):
+        mem[("T", i)] = [0] * I15_LEN
+    r = 1
+    for ins in func.instrs:
+        d = mem[ins.dst]
+        s = [mem[l] for l in ins.srcs]
+        match ins.kind:
+            case "copy":
+                d[:] = s[0]
+            case "add":
+                ctl = i15.add(d, s[0], 1)
+                ctl |= i15.sub(d, cc.m, 0) ^ 1
+                i15.sub(d, cc.m, ctl)
+            case "sub":
+                i15.add(d, cc.m, i15.sub(d, s[0], 1))
+            case "mul":
+                i15.montymul(d, s[0], s[1], cc.m, cc.m0i)
+            case "inv":
+                i15.modpow(d, cc.inv_exponent(), cc.m, cc.m0i, s[0], s[1])
+            case "tz":
+                r &= i15.iszero(d) ^ 1
+    return r, [mem[("P1", k)] for k in range(3)]
+
+
+def _ref(l: Loc, field: bool = True) -> str:
+    kind, index = l
+    name = f"T[{index}]" if kind == "T" else f"{kind}.C[{index}]"
+    return f"{name}.X" if field else name
+
+
+def render(func: CompiledFunction) -> str:
+    params = ["    out Jacobian P1"]
+    if func.uses_p2:
+        params.append("    const out Jacobian P2")
+    params.append("    const out CurveParams Cc")
+    kinds = {i.kind for i in func.instrs}
+    has_tz = "tz" in kinds
+
+    lines = [f"static final function int {func.name}(", ",\n".join(params), ")", "{"]
+    if has_tz:
+        lines.append("    local int R;")
+    if func.num_temps:
+        lines.append(f"    local _Monty T[{func.num_temps}];")
+    if "add" in kinds:
+        lines.append("    local int Ctl;")
+    if "inv" in kinds:
+        lines.append("    local int PLen;")
+        lines.append("    local byte Tp[66]; /* (BR_MAX_EC_SIZE + 7) >> 3 */")
+    lines.append("")
+    if has_tz:
+        lines.append("    R = 1;")
+    if "inv" in kinds:
+        lines.append("    PLen = (Cc.P[0] - (Cc.P[0] >>> 4) + 7) >>> 3;")
+        lines.append("    class'FCryptoBigInt'.static.Encode_Static66(Tp, PLen, Cc.P);")
+        lines.append("    Tp[PLen - 1] -= 2;")
+    if has_tz or "inv" in kinds:
+        lines.append("")
+
+    big_int = "class'FCryptoBigInt'.static"
+    for ins in func.instrs:
+        d = _ref(ins.dst)
+        s = [_ref(l) for l in ins.srcs]
+        lines.append(f"    // {ins.comment}")
+        match ins.kind:
+            case "copy":
+                lines.append(f"    {_ref(ins.dst, False)} = {_ref(ins.srcs[0], False)};")
+            case "add":
+                lines.append(f"    Ctl = {big_int}.Add_Static37({d}, {s[0]}, 1);")
+                lines.append(f"    Ctl = Ctl | {big_int}.NOT(")
+                lines.append(f"        {big_int}.Sub_Static37_DynB({d}, Cc.P, 0));")
+                lines.append(f"    {big_int}.Sub_Static37_DynB({d}, Cc.P, Ctl);")
+            case "sub":
+                lines.append(f"    {big_int}.Add_Static37_DynB({d}, Cc.P,")
+                lines.append(f"        {big_int}.Sub_Static37({d}, {s[0]}, 1));")
+            case "mul":
+                lines.append(f"    {big_int}.MontyMul_S37_S37_S37_DynM(")
+                lines.append(f"        {d}, {s[0]}, {s[1]}, Cc.P, Cc.P0i);")
+            case "inv":
+                lines.append(f"    {big_int}.ModPow_S37_S66_Dyn_S37_S37(")
+                lines.append(f"        {d}, Tp, PLen, Cc.P, Cc.P0i, {s[0]}, {s[1]});")
+            case "tz":
+                lines.append(f"    R = R & ~{big_int}.BIsZero_Static37({d});")
+    lines.append("")
+    lines.append(f"    return {'R' if has_tz else '1'};")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def check_programs(source: str) -> dict[str, list[Op]]:
+    """Return the programs of source, which must match PROGRAMS."""
+    arrays = parse_code_arrays(source)
+    programs = {}
+    for name, program in PROGRAMS.items():
+        expected = [op.encode() for op in program_ops(program)]
+        if arrays.get(name) != expected:
+            raise ValueError(f"Code{name} does not match the reference program")
+        programs[name] = decode_program(arrays[name])
+    return programs
+
+
+def generate(source: str) -> str:
+    programs = check_programs(source)
+    funcs = [render(compile_program(name, ops)) for name, ops in programs.items()]
+    return HEADER + "\n" + "\n\n".join(funcs) + "\n"
+
+
+def to_jacobian(
+        curve: ec_math.WeierstrassCurve,
+        pt: tuple[int, int],
+        z: int,
+        cc: CurveParams,
+) -> list[list[int]]:
+    """Montgomery representation of pt in Jacobian coordinates
+    (x*z^2, y*z^3, z).
+    """
+    x, y = pt
+    p = curve.p
+    return [i15.to_monty(v % p, cc.m) for v in (x * z * z, y * z ** 3, z)]
+
+
+def from_jacobian(
+        curve: ec_math.WeierstrassCurve,
+        jac: Sequence[Sequence[int]],
+        cc: CurveParams,
+) -> ec_math.Point:
+    x, y, z = (i15.from_monty(w, cc.m) for w in jac)
+    if z == 0:
+        return None
+    zi = pow(z, -1, curve.p)
+    return x * zi * zi % curve.p, y * zi ** 3 % curve.p
+
+
+def validate(curve: ec_math.WeierstrassCurve, rounds: int, rng: random.Random):
+    """Check the programs against the reference curve arithmetic and
+    the compiled functions against the interpreter.
+    """
+    cc = CurveParams.from_curve(curve)
+    ops = {name: program_ops(program) for name, program in PROGRAMS.items()}
+    compiled = {name: compile_program(name, program) for name, program in ops.items()}
+    one = [i15.to_words(1, cc.m[0])] * 3
+    n = i15.num_words(cc.m[0]) + 1
+
+    def run_both(name, p1, p2):
+        expected = interpret(ops[name], p1, p2 if p2 is not None else one, cc)
+        actual = execute(compiled[name], p1, p2, cc)
+        actual = actual[0], [w[:n] for w in actual[1]]
+        expected = expected[0], [w[:n] for w in expected[1]]
+        if actual != expected:
+            raise AssertionError(f"{curve.name}: compiled {name} differs from the interpreter")
+        return expected
+
+    for _ in range(rounds):
+        a = curve.mul(rng.randrange(1, curve.n), curve.generator)
+        b = curve.mul(rng.randrange(1, curve.n), curve.generator)
+        assert a is not None and b is not None
+        ja = to_jacobian(curve, a, rng.randrange(1, curve.p), cc)
+        jb = to_jacobian(curve, b, rng.randrange(1, curve.p), cc)
+
+        _, dbl = run_both("Double", ja, ja)
+        if from_jacobian(curve, dbl, cc) != curve.double(a):
+            raise AssertionError(f"{curve.name}: CodeDouble is wrong")
+
+        r, added = run_both("Add", ja, jb)
+        if r != 1 or from_jacobian(curve, added, cc) != curve.add(a, b):
+            raise AssertionError(f"{curve.name}: CodeAdd is wrong")
+        r, _ = run_both("Add", ja, ja)
+        if r != 0:
+            raise AssertionError(f"{curve.name}: CodeAdd does not flag P1 == P2")
+
+        p2 = [i15.r2_mod(cc.m), i15.to_monty(curve.b, cc.m), i15.to_words(1, cc.m[0])]
+        plain = [i15.to_words(a[0], cc.m[0]), i15.to_words(a[1], cc.m[0]),
+                 i15.to_words(0, cc.m[0])]
+        r, checked = run_both("Check", plain, p2)
+        if r != 0 or from_jacobian(curve, checked, cc) != a:
+            raise AssertionError(f"{curve.name}: CodeCheck rejects a valid point")
+        plain[1] = i15.to_words((a[1] + 1) % curve.p, cc.m[0])
+        r, _ = run_both("Check", plain, p2)
+        if r != 1:
+            raise AssertionError(f"{curve.name}: CodeCheck accepts an invalid point")
+
+        _, affine = run_both("Affine", ja, one)
+        if (i15.from_words(affine[0]), i15.from_words(affine[1])) != a:
+            raise AssertionError(f"{curve.name}: CodeAffine is wrong")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--source",
+        type=Path,
+        default=DEFAULT_SOURCE,
+        help="UnrealScript source file with the Code* arrays (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    ap.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="random points validated per curve (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    for curve in ec_math.WEIERSTRASS_CURVES.values():
+        validate(curve, args.rounds, rng)
+
+    generated = generate(args.source.read_text())
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    for name, program in PROGRAMS.items():
+        func = compile_program(name, program_ops(program))
+        print(f"{func.name}: {len(program_ops(program))} opcodes -> "
+              f"{len(func.instrs)} statements, {func.num_copies} copies, "
+              f"{func.num_temps} T slots")
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
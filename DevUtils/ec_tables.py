@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generates precomputed fixed-base elliptic curve tables (multiples
+of the curve generator) into UnrealScript macros for use in
+DefaultProperties blocks.
+
+Table values are already in i15 word encoding and Montgomery
+representation (x*R mod p), so the curve code can use them directly.
+
+The tables are Lim-Lee combs with T teeth and spacing
+D = ceil(bits / T). Entry J-1 (1 <= J < 2^T) holds
+sum(bit(J, I) * 2^(D*I) * G). A scalar multiplication costs
+D doublings and D additions.
+
+Prime curve (P-256, P-384, P-521) entries are affine (x, y) pairs,
+Z is implicitly R mod p (one in Montgomery representation). Each
+entry is 2 * (N + 1) words, where N is the number of value words.
+
+Curve25519 uses an x-only Montgomery ladder, which cannot benefit
+from fixed-base tables directly. Curve25519 tables are therefore
+computed on the birationally equivalent Ed25519 curve in "Niels"
+form (y+x, y-x, 2*d*x*y). A fixed-base u-coordinate is obtained with
+u = (1 + y) / (1 - y) after the Edwards scalar multiplication.
+The scalar can be reduced modulo the group order first, so tables
+only need to cover 253 bits. Each entry is 3 * 18 words.
+
+Usage:
+    python ec_tables.py                      # P-256 and Curve25519.
+    python ec_tables.py --curves P256 P384 P521 C25519 --teeth 5
+"""
+
+import argparse
+import math
+from pathlib import Path
+from typing import Callable
+from typing import Iterable
+from typing import TypeVar
+
+import ec_math
+import i15
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+PRIME_TABLES_OUT = CLASSES_DIR / "FCryptoEC_PrimeTables.uci"
+C25519_TABLES_OUT = CLASSES_DIR / "FCryptoEC_Curve25519Tables.uci"
+
+VALUES_PER_LINE = 8
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+// Generated by DevUtils/ec_tables.py.
+"""
+
+P = TypeVar("P")
+
+
+def comb_multiples(
+        base: P,
+        teeth: int,
+        spacing: int,
+        add: Callable[[P, P], P],
+        mul: Callable[[int, P], P],
+) -> list[P]:
+    """Comb table entries for J = 1 ... 2^teeth - 1."""
+    columns = [mul(1 << (spacing * i), base) for i in range(teeth)]
+    table: list[P] = []
+    for j in range(1, 1 << teeth):
+        # Entry J is entry (J without its top bit) plus one column.
+        top = j.bit_length() - 1
+        rest = j & ~(1 << top)
+        table.append(columns[top] if rest == 0 else add(table[rest - 1], columns[top]))
+    return table
+
+
+def comb_mul(
+        table: list[P],
+        k: int,
+        teeth: int,
+        spacing: int,
+        zero: P,
+        add: Callable[[P, P], P],
+) -> P:
+    """Reference fixed-base multiplication using a comb table."""
+    q = zero
+    for col in range(spacing - 1, -1, -1):
+        q = add(q, q)
+        j = 0
+        for i in range(teeth):
+            j |= ((k >> ((spacing * i) + col)) & 1) << i
+        if j:
+            q = add(q, table[j - 1])
+    return q
+
+
+def weierstrass_entry_words(
+        curve: ec_math.WeierstrassCurve,
+        pt: tuple[int, int],
+) -> list[int]:
+    m = i15.to_words(curve.p, curve.i15_header)
+    return i15.to_monty(pt[0], m) + i15.to_monty(pt[1], m)
+
+
+def ed25519_niels(pt: tuple[int, int]) -> tuple[int, int, int]:
+    p = ec_math.C25519_P
+    x, y = pt
+    return (y + x) % p, (y - x) % p, (2 * ec_math.ED25519_D * x * y) % p
+
+
+def ed25519_entry_words(pt: tuple[int, int]) -> list[int]:
+    m = i15.to_words(ec_math.C25519_P, ec_math.C25519_I15_HEADER)
+    words = []
+    for v in ed25519_niels(pt):
+        words += i15.to_monty(v, m)
+    return words
+
+
+def weierstrass_table(
+        curve: ec_math.WeierstrassCurve,
+        teeth: int,
+) -> list[ec_math.Point]:
+    bits = curve.n.bit_length()
+    return comb_multiples(
+        curve.generator, teeth, math.ceil(bits / teeth), curve.add, curve.mul)
+
+
+def ed25519_table(teeth: int) -> list[tuple[int, int]]:
+    bits = ec_math.C25519_ORDER.bit_length()
+    return comb_multiples(
+        ec_math.ED25519_BASE, teeth, math.ceil(bits / teeth),
+        ec_math.ed25519_add, ec_math.ed25519_mul)
+
+
+def format_values(values: Iterable[int], indent: str = "    ") -> list[str]:
+    hex_values = [f"0x{v:04X}" for v in values]
+    return [
+        indent + ", ".join(hex_values[i:i + VALUES_PER_LINE])
+        for i in range(0, len(hex_values), VALUES_PER_LINE)
+    ]
+
+
+def format_macro(name: str, params: dict[str, int], values: list[int]) -> str:
+    lines = [f"`define {name}_{key} {value}" for key, value in params.items()]
+    value_lines = format_values(values)
+    # UnrealScript macros need a line continuation on each line.
+    body = [f"`define {name}_VALUES"] + [line + "," for line in value_lines[:-1]]
+    width = max(len(line) for line in body) + 4
+    lines += [f"{line:<{width}}\\" for line in body]
+    lines.append(value_lines[-1])
+    return "\n".join(lines) + "\n"
+
+
+def table_params(teeth: int, bits: int, entry_words: int) -> dict[str, int]:
+    return {
+        "TEETH": teeth,
+        "SPACING": math.ceil(bits / teeth),
+        "ENTRIES": (1 << teeth) - 1,
+        "ENTRY_WORDS": entry_words,
+    }
+
+
+def generate_prime_tables(curves: list[str], teeth: int) -> str:
+    parts = [HEADER]
+    for name in curves:
+        curve = ec_math.WEIERSTRASS_CURVES[name]
+        table = weierstrass_table(curve, teeth)
+        values = []
+        for pt in table:
+            # Sums of distinct multiples 2^k * G with 2^k < n.
+            assert pt is not None
+            values += weierstrass_entry_words(curve, pt)
+        entry_words = 2 * (i15.num_words(curve.i15_header) + 1)
+        params = table_params(teeth, curve.n.bit_length(), entry_words)
+        parts.append(
+            f"// {name} fixed-base comb table of generator multiples,\n"
+            f"// affine (x*R mod p, y*R mod p) in i15 words.\n"
+            + format_macro(f"{name}_G_COMB", params, values)
+        )
+    return "\n".join(parts)
+
+
+def generate_c25519_tables(teeth: int) -> str:
+    table = ed25519_table(teeth)
+    values = []
+    for pt in table:
+        values += ed25519_entry_words(pt)
+    entry_words = 3 * (i15.num_words(ec_math.C25519_I15_HEADER) + 1)
+    params = table_params(teeth, ec_math.C25519_ORDER.bit_length(), entry_words)
+    return "\n".join([
+        HEADER,
+        "// Ed25519 fixed-base comb table of base point multiples,\n"
+        "// Niels form (y+x, y-x, 2*d*x*y) * R mod p in i15 words.\n"
+        + format_macro("C255_G_COMB", params, values),
+    ])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--curves",
+        nargs="+",
+        choices=[*ec_math.WEIERSTRASS_CURVES, "C25519"],
+        default=["P256", "C25519"],
+        help="curves to generate tables for (default: %(default)s)",
+    )
+    ap.add_argument(
+        "-t",
+        "--teeth",
+        type=int,
+        default=4,
+        help="number of comb teeth (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--prime-out",
+        type=Path,
+        default=PRIME_TABLES_OUT,
+        help="prime curve output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--c25519-out",
+        type=Path,
+        default=C25519_TABLES_OUT,
+        help="Curve25519 output file (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    if not 1 <= args.teeth <= 8:
+        ap.error("teeth must be in range [1, 8]")
+
+    prime_curves = [c for c in args.curves if c in ec_math.WEIERSTRASS_CURVES]
+    if prime_curves:
+        args.prime_out.write_text(
+            generate_prime_tables(prime_curves, args.teeth))
+        print(f"wrote {args.prime_out.resolve()}")
+    if "C25519" in args.curves:
+        args.c25519_out.write_text(generate_c25519_tables(args.teeth))
+        print(f"wrote {args.c25519_out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
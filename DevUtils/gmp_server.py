@@ -34,40 +34,197 @@ import sys
 import threading
 import time
 import queue
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Dict
 from typing import List
 
 import gmpy2
 from loguru import logger
 
+from primegen import rand_prime
+
 HOST = "127.0.0.1"
 PORT = 65432
+MAX_LINE_SIZE = 1 << 20
+RECV_SIZE = 64 * 1024
 
 _log_format = "[{time:YYYY-MM-DD HH:mm:ss.SSSZZ}] [{level}] [{function}] {message}"
 
-logger.remove()
-logger.add(
-    sys.stdout,
-    format=_log_format,
-    level="DEBUG",
-    enqueue=True,
-)
-logger.add(
-    "gmp_server.log",
-    format=_log_format,
-    rotation="50 MB",
-    level="DEBUG",
-    enqueue=True,
-)
+
+def setup_logging(verbose: bool = False):
+    """Per-request traces go to the log file only, unless verbose.
+    Both sinks are enqueued, records are written by loguru's worker
+    thread instead of the request handler threads.
+    """
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format=_log_format,
+        level="DEBUG" if verbose else "INFO",
+        enqueue=True,
+    )
+    logger.add(
+        "gmp_server.log",
+        format=_log_format,
+        rotation="50 MB",
+        level="DEBUG",
+        enqueue=True,
+    )
+
+
+class ParseError(ValueError):
+    pass
+
+
+@dataclass
+class Transaction:
+    t_id: str
+    mpz_vars: Dict[str, gmpy2.mpz] = field(default_factory=dict)
+    mpz_ops: List[List[str]] = field(default_factory=list)
+
+
+class TransactionParser:
+    """Incremental parser for transaction lines of the form
+
+        T<id> [var <name> '<hex digits>'] ... [op <op> <dst> <a> <b>] ...
+
+    Bytes are fed in chunks as they arrive from the socket. Commands
+    are parsed as soon as their closing bracket arrives, so only the
+    incomplete command at the end of the buffer is kept around, and
+    var operands are built as mpz values from a single copy of their
+    digits. Lines longer than max_line_size bytes are rejected and
+    skipped up to the next newline.
+
+    An empty line marks the end of the input (closed is set).
+    """
+
+    _id_regex = re.compile(rb"T(\w+)")
+
+    def __init__(self, max_line_size: int = MAX_LINE_SIZE):
+        self.max_line_size = max_line_size
+        self.closed = False
+        self._buf = bytearray()
+        # Length of the current line consumed by earlier feeds.
+        self._line_len = 0
+        self._blank = True
+        self._tx: Transaction | None = None
+        self._error: ParseError | None = None
+
+    def feed(self, data: bytes) -> List[Transaction | ParseError]:
+        """Consume data, return the transactions of completed lines
+        and a ParseError for each rejected line.
+        """
+        out: List[Transaction | ParseError] = []
+        if self.closed:
+            return out
+        buf = self._buf
+        buf += data
+        pos = 0
+        while not self.closed:
+            line_start = pos
+            nl = buf.find(b"\n", pos)
+            end = nl if nl >= 0 else len(buf)
+            if not self._error and self._line_len + end - line_start > self.max_line_size:
+                self._error = ParseError(
+                    f"line exceeds maximum size of {self.max_line_size} bytes")
+            if not self._error:
+                try:
+                    pos = self._parse(buf, pos, end, nl >= 0)
+                except ValueError as e:
+                    self._error = e if isinstance(e, ParseError) else ParseError(str(e))
+            if self._error:
+                self._blank = False
+                pos = end
+            if nl < 0:
+                self._line_len += pos - line_start
+                break
+            self._end_line(out)
+            pos = nl + 1
+        del buf[:pos]
+        return out
+
+    def _end_line(self, out: List[Transaction | ParseError]):
+        if self._error:
+            out.append(self._error)
+        elif self._tx is not None:
+            out.append(self._tx)
+        elif self._blank:
+            self.closed = True
+        self._tx = None
+        self._error = None
+        self._line_len = 0
+        self._blank = True
+
+    def _parse(self, buf: bytearray, pos: int, end: int, complete: bool) -> int:
+        """Parse buf[pos:end], return the position of the first byte
+        that is not consumed yet.
+        """
+        if self._tx is None:
+            while pos < end and buf[pos] in b" \t\r":
+                pos += 1
+            if pos == end:
+                return pos
+            self._blank = False
+            ws = pos
+            while ws < end and buf[ws] not in b" \t\r":
+                ws += 1
+            if ws == end:
+                if not complete:
+                    return pos
+                raise ParseError("invalid t_id")
+            if not (m := self._id_regex.fullmatch(buf, pos, ws)):
+                raise ParseError("invalid t_id")
+            self._tx = Transaction(m.group(1).decode("ascii"))
+            pos = ws
+
+        tx = self._tx
+        while True:
+            lb = buf.find(b"[", pos, end)
+            if lb < 0:
+                return end
+            rb = buf.find(b"]", lb + 1, end)
+            if rb < 0:
+                return end if complete else lb
+            self._command(tx, buf, lb + 1, rb)
+            pos = rb + 1
+
+    def _command(self, tx: Transaction, buf: bytearray, start: int, end: int):
+        sp = buf.find(b" ", start, end)
+        c_type = bytes(buf[start:sp if sp >= 0 else end]).lower()
+        match c_type:
+            case b"var":
+                if sp < 0:
+                    raise ParseError("invalid var")
+                name_end = buf.find(b" ", sp + 1, end)
+                if name_end < 0:
+                    raise ParseError("invalid var")
+                name = buf[sp + 1:name_end].decode("ascii")
+                value_start = name_end + 1
+                value_end = buf.find(b" ", value_start, end)
+                if value_end < 0:
+                    value_end = end
+                if buf.startswith(b"'", value_start, value_end):
+                    value_start += 1
+                if value_end > value_start and buf.endswith(b"'", value_start, value_end):
+                    value_end -= 1
+                with memoryview(buf) as mv:
+                    digits = mv[value_start:value_end].tobytes()
+                tx.mpz_vars[name] = gmpy2.mpz(digits or b"0", 16)
+            case b"op":
+                if sp < 0:
+                    raise ParseError("invalid op")
+                parts = buf[start:end].decode("ascii").split(" ")
+                if len(parts) < 5:
+                    raise ParseError("invalid op")
+                tx.mpz_ops.append(parts[1:5])
 
 
 class GMPTCPHandler(socketserver.StreamRequestHandler):
-    id_regex = re.compile(r"T(\w+)\s.*")
-    cmd_regex = re.compile(r"\[(.*?)]")
+    max_line_size = MAX_LINE_SIZE
 
     def setup(self):
         super().setup()
-        self.data = b""
         self.response_queue = queue.Queue()
         self.writer_thread = threading.Thread(target=self._writer, daemon=True)
         self.writer_thread.start()
@@ -75,25 +232,27 @@ class GMPTCPHandler(socketserver.StreamRequestHandler):
     def handle(self):
         self.rng = gmpy2.random_state(int(time.time()))
         
-        while True:
+        parser = TransactionParser(self.max_line_size)
+        while not parser.closed:
             try:
-                self.data = self.rfile.readline().strip()
+                data = self.rfile.read1(RECV_SIZE)
             except ConnectionResetError as e:
                 logger.info("connection closed: {}: {}", type(e).__name__, e)
                 break
-
-            cmd_data = self.data.decode("utf-8")
-            if not cmd_data.strip():
+            if not data:
                 break
 
-            try:
-                out = self.calculate(cmd_data)
-                if out:
-                    self.response_queue.put(out)
-            except Exception as e:
-                self.wfile.write(bytes("SERVER_ERROR\n", "utf-8"))
-                logger.error(e)
-                logger.exception(e)
+            for tx in parser.feed(data):
+                try:
+                    if isinstance(tx, ParseError):
+                        raise tx
+                    out = self.calculate(tx)
+                    if out:
+                        self.response_queue.put(out)
+                except Exception as e:
+                    self.response_queue.put(bytes("SERVER_ERROR\n", "utf-8"))
+                    logger.error(e)
+                    logger.exception(e)
 
         logger.info("done")
 
@@ -102,27 +261,11 @@ class GMPTCPHandler(socketserver.StreamRequestHandler):
 
         sys.stdout.flush()
 
-    def calculate(self, cmd_data: str) -> bytes:
-        if match := self.id_regex.match(cmd_data):
-            t_id = match.group(1)
-        else:
-            raise ValueError("invalid t_id")
-
-        cmds: List[str] = self.cmd_regex.findall(cmd_data)
-        logger.info("cmds: {}", cmds)
-
-        mpz_vars: Dict[str, gmpy2.mpz] = {}
-        mpz_ops: List[List[str]] = []
-
-        for cmd in cmds:
-            parts = cmd.split(" ")
-            c_type = parts[0]
-            match c_type.lower():
-                case "var":
-                    digits = parts[2].replace("'", "") or "0"
-                    mpz_vars[parts[1]] = gmpy2.mpz(digits, 16)
-                case "op":
-                    mpz_ops.append([parts[1], parts[2], parts[3], parts[4]])
+    def calculate(self, tx: Transaction) -> bytes:
+        t_id = tx.t_id
+        mpz_vars = tx.mpz_vars
+        mpz_ops = tx.mpz_ops
+        logger.debug("ops: {}", mpz_ops)
 
         dst = ""
         for op in mpz_ops:
@@ -134,42 +277,32 @@ class GMPTCPHandler(socketserver.StreamRequestHandler):
                 case "mpz_add":
                     mpz_vars[dst] = a + b
                     # print(f"\t{dst} = {op[2]} + {op[3]} ({a} + {b})")
-                    logger.info("\t{} = {} + {} ({} + {})", dst, op[2], op[3], a, b)
+                    logger.debug("\t{} = {} + {} ({} + {})", dst, op[2], op[3], a, b)
                 case "mpz_sub":
                     mpz_vars[dst] = a - b
                     # print(f"\t{dst} = {op[2]} - {op[3]} ({a} - {b})")
-                    logger.info("\t{} = {} - {} ({} - {})", dst, op[2], op[3], a, b)
+                    logger.debug("\t{} = {} - {} ({} - {})", dst, op[2], op[3], a, b)
                 case "mpz_mod":
                     mpz_vars[dst] = a % b
                     # print(f"\t{dst} = {op[2]} % {op[3]} ({a} % {b})")
-                    logger.info("\t{} = {} % {} ({} % {})", dst, op[2], op[3], a, b)
+                    logger.debug("\t{} = {} % {} ({} % {})", dst, op[2], op[3], a, b)
                 case "mpz_mul":
                     mpz_vars[dst] = a * b
                     # print(f"\t{dst} = {op[2]} * {op[3]} ({a} * {b})")
-                    logger.info("\t{} = {} * {} ({} * {})", dst, op[2], op[3], a, b)
+                    logger.debug("\t{} = {} * {} ({} * {})", dst, op[2], op[3], a, b)
                 case "mpz_mul_2exp":
                     mpz_vars[dst] = a << b
                     # mpz_vars[dst] = gmpy2.mpz(gmpy2.mul_2exp(a, b))
                     # print(f"\t{dst} = {op[2]} << {op[3]} ({a} << {b})")
-                    logger.info("\t{} = {} << {} ({} << {})", dst, op[2], op[3], a, b)
+                    logger.debug("\t{} = {} << {} ({} << {})", dst, op[2], op[3], a, b)
                 case "nop":
                     mpz_vars[dst] = a
                     # print(f"\t{dst} = {op[2]} (NO OPERATION)")
-                    logger.info("\t{} = {} (NO OPERATION)", dst, op[2])
+                    logger.debug("\t{} = {} (NO OPERATION)", dst, op[2])
                 case "rand_prime":
-                    while True:
-                        x = gmpy2.mpz_urandomb(self.rng, a - 1)
-                        x = x.bit_set(0)
-                        x = x.bit_set(a - 1)
-                        if x.is_prime(50):
-                            x -= 1
-                            if x.is_divisible(65537):
-                                continue
-                            x += 1
-                            mpz_vars[dst] = x
-                            break
+                    mpz_vars[dst] = rand_prime(self.rng, a)
                     # print(f"\t{dst} = rand_prime({a}) ({mpz_vars[dst]})")
-                    logger.info("\t{} = rand_prime({}) ({})", dst, a, mpz_vars[dst])
+                    logger.debug("\t{} = rand_prime({}) ({})", dst, a, mpz_vars[dst])
 
         if not dst:
             raise ValueError("no operations with dst")
@@ -180,7 +313,7 @@ class GMPTCPHandler(socketserver.StreamRequestHandler):
             f"{t_id} {dst} {mpz_vars[dst].digits(16)}\n",
             encoding="utf-8",
         )
-        logger.info("out: {}", out)
+        logger.debug("out: {}", out)
         return out
 
     def _writer(self):
@@ -212,11 +345,25 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--port", type=int, default=PORT)
     ap.add_argument("--host", default=HOST)
+    ap.add_argument(
+        "--verbose",
+        action="store_true",
+        help="log every request and operation to the console, not only to the log file",
+    )
+    ap.add_argument(
+        "--max-line-size",
+        type=int,
+        default=MAX_LINE_SIZE,
+        help="reject transaction lines longer than this many bytes (default: %(default)s)",
+    )
     args = ap.parse_args()
+    setup_logging(args.verbose)
     PORT = args.port
     HOST = args.host
+    GMPTCPHandler.max_line_size = args.max_line_size
 
     with TCPServer((HOST, PORT), GMPTCPHandler) as server:
+        logger.info("listening on {}:{}", HOST, PORT)
         server.serve_forever()
 
 
@@ -0,0 +1,518 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generates the hexadecimal codec lookup tables of FCryptoUtils
+(FCryptoHexTables.uci) and models the UnrealScript hex codecs to
+compare their operation costs.
+
+Tables, indexed by character code & 0xFF:
+
+    HEX_DECODE_HI   hex digit value << 4
+    HEX_DECODE_LO   hex digit value
+    HEX_ENCODE      byte value -> two uppercase hex characters,
+                    the same as Right(ToHex(B), 2)
+
+Invalid characters decode to INVALID, a bit above the low byte, so
+errors can be accumulated with | and checked once per string.
+
+LegacyCodec and TableCodec follow the UnrealScript code of the old
+(per character branching, Caps, Mid + FromHex per byte, ToHex +
+Right + $= per byte) and the new table-driven FCryptoUtils routines
+statement by statement, counting:
+
+    calls   script and native function calls (Len, Mid, Asc, ...)
+    ops     other bytecode level operations (arithmetic, comparisons,
+            array accesses, assignments)
+    chars   characters copied into newly created strings
+
+Usage:
+    python hex_codec.py              # Generate FCryptoHexTables.uci.
+    python hex_codec.py --check      # Fail if the output file is stale.
+    python hex_codec.py --compare    # Print the cost comparison.
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoHexTables.uci"
+
+INVALID = 0x100
+HEX_DIGITS = "0123456789ABCDEF"
+# Bytes per concatenated chunk in TableCodec.bytes_to_hex,
+# FCryptoUtils.HEX_CHUNK_BYTES.
+CHUNK_BYTES = 32
+VALUES_PER_LINE = 8
+STRINGS_PER_LINE = 16
+COMPARE_SIZES = (4, 32, 256)
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+"""
+
+
+def _digit(c: int) -> int | None:
+    ch = chr(c).upper()
+    return HEX_DIGITS.index(ch) if ch in HEX_DIGITS and c < 0x80 else None
+
+
+def decode_hi_table() -> list[int]:
+    return [INVALID if (d := _digit(c)) is None else d << 4 for c in range(256)]
+
+
+def decode_lo_table() -> list[int]:
+    return [INVALID if (d := _digit(c)) is None else d for c in range(256)]
+
+
+def encode_table() -> list[str]:
+    return [f"{b:02X}" for b in range(256)]
+
+
+def _format_macro(name: str, values: list[str], per_line: int) -> str:
+    lines = [
+        "    " + ", ".join(values[i:i + per_line])
+        for i in range(0, len(values), per_line)
+    ]
+    # UnrealScript macros need a line continuation on each line.
+    body = [f"`define {name}_VALUES"] + [line + "," for line in lines[:-1]]
+    width = max(len(line) for line in body) + 4
+    return "\n".join([f"{line:<{width}}\\" for line in body] + [lines[-1]]) + "\n"
+
+
+def generate() -> str:
+    return "\n".join([
+        HEADER + "// Generated by DevUtils/hex_codec.py.\n",
+        "// Hex digit value << 4 by character code & 0xFF, "
+        f"0x{INVALID:X} if not a hex digit.\n"
+        + _format_macro(
+            "HEX_DECODE_HI",
+            [f"0x{v:03X}" for v in decode_hi_table()],
+            VALUES_PER_LINE,
+        ),
+        "// Hex digit value by character code & 0xFF, "
+        f"0x{INVALID:X} if not a hex digit.\n"
+        + _format_macro(
+            "HEX_DECODE_LO",
+            [f"0x{v:03X}" for v in decode_lo_table()],
+            VALUES_PER_LINE,
+        ),
+        "// Byte value to two uppercase hex characters.\n"
+        + _format_macro("HEX_ENCODE", [f'"{v}"' for v in encode_table()], STRINGS_PER_LINE),
+    ])
+
+
+def _wrap32(x: int) -> int:
+    x &= 0xFFFFFFFF
+    return x - (1 << 32) if x & 0x80000000 else x
+
+
+@dataclass
+class Cost:
+    calls: int = 0
+    ops: int = 0
+    chars: int = 0
+
+    def call(self, copied: int = 0):
+        self.calls += 1
+        self.chars += copied
+
+    def op(self, count: int = 1):
+        self.ops += count
+
+    def concat(self, result: str):
+        """A $ or $= producing result."""
+        self.ops += 1
+        self.chars += len(result)
+
+
+class _Codec:
+    def __init__(self):
+        self.cost = Cost()
+
+    # UnrealScript natives.
+    def len_(self, s: str) -> int:
+        self.cost.call()
+        return len(s)
+
+    def mid(self, s: str, i: int, n: int) -> str:
+        r = s[i:i + n]
+        self.cost.call(len(r))
+        return r
+
+    def asc(self, s: str) -> int:
+        self.cost.call()
+        return ord(s[0]) if s else 0
+
+
+class LegacyCodec(_Codec):
+    """The per character FCryptoUtils.FromHex, FCryptoBigInt.BytesFromHex
+    and FCryptoTestMutator.BytesWordsToString.
+    """
+
+    def from_hex(self, hex_string: str) -> tuple[bool, int]:
+        c = self.cost
+        c.call()  # FromHex.
+        c.op()
+        if self.len_(hex_string) > 8:
+            c.op()
+            return False, -1
+        hex_string = hex_string.upper()
+        c.call(len(hex_string))  # Caps.
+        c.op()
+        s = 0
+        c.op()
+        res = 0
+        i = self.len_(hex_string) - 1
+        c.op(2)
+        while True:
+            c.op()
+            if i < 0:
+                break
+            t = self.asc(self.mid(hex_string, i, 1))
+            c.op()
+            c.op(2)
+            if 48 <= t <= 57:
+                t -= 48
+                c.op()
+            else:
+                c.op(2)
+                if 65 <= t <= 70:
+                    t -= 55
+                    c.op()
+                else:
+                    c.op()
+                    return False, -1
+            c.op()
+            if s > 0:
+                t = t << s
+                c.op()
+            res = _wrap32(res | t)
+            s += 4
+            i -= 1
+            c.op(3)
+        c.op()
+        return True, res
+
+    def bytes_from_hex(self, hex_string: str) -> tuple[bool, list[int]]:
+        c = self.cost
+        c.call()  # BytesFromHex.
+        len_str = self.len_(hex_string)
+        c.op(2)
+        if len_str % 2:
+            hex_string = "0" + hex_string
+            c.concat(hex_string)
+            len_str += 1
+            c.op()
+        c.op(4)
+        dst = []
+        ok = True
+        j = 0
+        while True:
+            c.op()
+            if j >= len_str:
+                break
+            byte_s = self.mid(hex_string, j, 2)
+            c.op()
+            success, temp = self.from_hex(byte_s)
+            c.op()
+            if not success:
+                ok = False
+            dst.append(temp & 0xFF)
+            j += 2
+            c.op(3)
+        return ok, dst
+
+    def bytes_to_hex(self, x: list[int], delimiter: str = "") -> str:
+        c = self.cost
+        c.call()  # BytesWordsToString.
+        s = ""
+        c.op()
+        for i, b in enumerate(x):
+            c.op(2)
+            h = f"{b:08X}"
+            c.call(len(h))  # ToHex.
+            h = h[-2:]
+            c.call(len(h))  # Right.
+            s += h
+            c.concat(s)
+            c.op(3)
+            if i < len(x) - 1 and delimiter != "":
+                s += delimiter
+                c.concat(s)
+        c.op()
+        return s
+
+
+class TableCodec(_Codec):
+    """The table-driven FCryptoUtils.FromHex, BytesFromHex and BytesToHex."""
+
+    def __init__(self):
+        super().__init__()
+        self.hi = decode_hi_table()
+        self.lo = decode_lo_table()
+        self.enc = encode_table()
+
+    def from_hex(self, hex_string: str) -> tuple[bool, int]:
+        c = self.cost
+        c.call()  # FromHex.
+        len_str = self.len_(hex_string)
+        c.op(2)
+        if len_str > 8:
+            c.op()
+            return False, -1
+        c.op(3)
+        res = 0
+        err = 0
+        for i in range(len_str):
+            ch = self.asc(self.mid(hex_string, i, 1))
+            v = self.lo[ch & 0xFF] | (ch & ~0xFF)
+            err |= v
+            res = _wrap32((res << 4) | v)
+            # Loop compare and increment, assignments, &, |, array read.
+            c.op(12)
+        c.op(3)
+        if err & ~0xFF:
+            c.op()
+            return False, -1
+        c.op()
+        return True, res
+
+    def _pair(self, hex_string: str, j: int) -> int:
+        c0 = self.asc(self.mid(hex_string, j, 1))
+        c1 = self.asc(self.mid(hex_string, j + 1, 1))
+        # Index arithmetic, 2 array reads, &s and |s, assignments.
+        self.cost.op(16)
+        return self.hi[c0 & 0xFF] | self.lo[c1 & 0xFF] | ((c0 | c1) & ~0xFF)
+
+    def bytes_from_hex(self, hex_string: str) -> tuple[bool, list[int]]:
+        c = self.cost
+        c.call()  # BytesFromHex.
+        len_str = self.len_(hex_string)
+        c.op(8)
+        dst = [0] * ((len_str + 1) // 2)
+        err = 0
+        j = 0
+        k = 0
+        c.op(2)
+        if len_str & 1:
+            ch = self.asc(self.mid(hex_string, 0, 1))
+            v = self.lo[ch & 0xFF] | (ch & ~0xFF)
+            err = v
+            dst[k] = v & 0xFF
+            k += 1
+            j = 1
+            c.op(10)
+        while True:
+            c.op(2)
+            if j + 8 > len_str:
+                break
+            for step in range(4):
+                v = self._pair(hex_string, j + 2 * step)
+                err |= v
+                dst[k + step] = v & 0xFF
+                c.op(3)
+            j += 8
+            k += 4
+            c.op(2)
+        while True:
+            c.op()
+            if j >= len_str:
+                break
+            v = self._pair(hex_string, j)
+            err |= v
+            dst[k] = v & 0xFF
+            k += 1
+            j += 2
+            c.op(4)
+        c.op(3)
+        return not err & ~0xFF, dst
+
+    def bytes_to_hex(self, x: list[int], delimiter: str = "") -> str:
+        c = self.cost
+        c.call()  # BytesToHex.
+        s = ""
+        c.op()
+        i = 0
+        while True:
+            c.op()
+            if i >= len(x):
+                break
+            end = min(i + CHUNK_BYTES, len(x))
+            c.call()  # Min.
+            c.op(2)
+            chunk = ""
+            c.op(2)
+            if delimiter == "":
+                while True:
+                    c.op(2)
+                    if i + 4 > end:
+                        break
+                    part = ""
+                    for b in x[i:i + 4]:
+                        part += self.enc[b]
+                        # Array reads of X and HexEncode, index math.
+                        c.op(3)
+                        if len(part) > 2:
+                            c.concat(part)
+                    chunk += part
+                    c.concat(chunk)
+                    i += 4
+                    c.op()
+                while True:
+                    c.op()
+                    if i >= end:
+                        break
+                    chunk += self.enc[x[i]]
+                    c.op(3)
+                    c.concat(chunk)
+                    i += 1
+            else:
+                while True:
+                    c.op()
+                    if i >= end:
+                        break
+                    part = self.enc[x[i]] + delimiter
+                    c.op(3)
+                    c.concat(part)
+                    chunk += part
+                    c.concat(chunk)
+                    i += 1
+            s += chunk
+            c.concat(s)
+        c.op(3)
+        if delimiter and x:
+            s = s[:len(s) - len(delimiter)]
+            c.call()  # Len.
+            c.call()  # Len.
+            c.call(len(s))  # Left.
+            c.op()
+        return s
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    legacy: Cost
+    table: Cost
+
+
+def compare(sizes: tuple[int, ...] = COMPARE_SIZES) -> list[Comparison]:
+    """Cost of both codecs on the same inputs of each size in bytes."""
+    result = []
+    for size in sizes:
+        data = [(i * 151 + 7) & 0xFF for i in range(size)]
+        hex_string = "".join(f"{b:02x}" for b in data)
+        cases = {
+            "BytesFromHex": lambda codec: codec.bytes_from_hex(hex_string),
+            "BytesToHex": lambda codec: codec.bytes_to_hex(data),
+            "BytesToHex ' '": lambda codec: codec.bytes_to_hex(data, " "),
+        }
+        for name, run in cases.items():
+            legacy = LegacyCodec()
+            table = TableCodec()
+            if run(legacy) != run(table):
+                raise AssertionError(f"{name} results differ for size {size}")
+            result.append(Comparison(name, size, legacy.cost, table.cost))
+    return result
+
+
+def format_comparison(rows: list[Comparison]) -> list[str]:
+    lines = [
+        f"{'function':<16} {'bytes':>6} "
+        f"{'calls':>13} {'ops':>15} {'chars':>15}",
+    ]
+    for r in rows:
+        cols = [
+            f"{getattr(r.legacy, f)}->{getattr(r.table, f)}"
+            for f in ("calls", "ops", "chars")
+        ]
+        lines.append(
+            f"{r.name:<16} {r.size:>6} {cols[0]:>13} {cols[1]:>15} {cols[2]:>15}")
+    return lines
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    ap.add_argument(
+        "--compare",
+        action="store_true",
+        help="print the legacy and table-driven codec costs instead of generating",
+    )
+    args = ap.parse_args()
+
+    if args.compare:
+        print("\n".join(format_comparison(compare())))
+        return
+
+    generated = generate()
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
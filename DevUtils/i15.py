@@ -0,0 +1,224 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Python model of the "i15" big integer encoding used by FCryptoBigInt.
+
+Integers are stored as arrays of 15-bit words, least significant
+word first, preceded by a header word holding the "announced bit
+length" of the integer. The announced bit length is encoded as
+(k << 4) + b, where k is the index of the top word and b is the
+number of bits used in it (see FCryptoBigInt::BitLength).
+
+Montgomery representation uses R = 2^(15 * N), where N is the
+number of value words of the modulus.
+"""
+
+from typing import Sequence
+
+WORD_SIZE = 15
+WORD_MASK = 0x7FFF
+UINT32_MASK = 0xFFFFFFFF
+
+
+def encode_bit_length(bit_length: int) -> int:
+    """Encode a bit length into the i15 header word format."""
+    if bit_length <= 0:
+        return 0
+    k = (bit_length - 1) // WORD_SIZE
+    return (k << 4) + (bit_length - (k * WORD_SIZE))
+
+
+def decode_bit_length(header: int) -> int:
+    """Decode an i15 header word into a bit length."""
+    return ((header >> 4) * WORD_SIZE) + (header & 15)
+
+
+def num_words(header: int) -> int:
+    """Number of value words (excluding the header) for a header word."""
+    return (header + 15) >> 4
+
+
+def to_words(x: int, header: int) -> list[int]:
+    """Convert x into i15 words with the given header word."""
+    n = num_words(header)
+    if x >> (n * WORD_SIZE):
+        raise ValueError(f"{x:#x} does not fit in {n} words")
+    return [header] + [(x >> (WORD_SIZE * i)) & WORD_MASK for i in range(n)]
+
+
+def from_words(words: Sequence[int]) -> int:
+    """Convert i15 words (including the header) back into an integer."""
+    n = num_words(words[0])
+    x = 0
+    for i in range(n, 0, -1):
+        x = (x << WORD_SIZE) | (words[i] & WORD_MASK)
+    return x
+
+
+# FCryptoBigInt::Decode
+def decode(src: bytes) -> list[int]:
+    """Decode big-endian bytes into i15 words. All words covering
+    the full source length are set, the header word holds the actual
+    bit length of the decoded value.
+    """
+    x = int.from_bytes(src, "big")
+    n = ((len(src) * 8) + WORD_SIZE - 1) // WORD_SIZE
+    words = [(x >> (WORD_SIZE * i)) & WORD_MASK for i in range(n)]
+    return [encode_bit_length(x.bit_length())] + words
+
+
+# FCryptoBigInt::DecodeMod
+def decode_mod(src: bytes, m: Sequence[int]) -> tuple[int, list[int]]:
+    """Decode big-endian bytes as an integer modulo m. Returns a tuple
+    of the success flag (1 if the value is lower than m, 0 otherwise)
+    and the decoded words. On failure, the value words are zero.
+    """
+    x = int.from_bytes(src, "big")
+    ok = int(x < from_words(m))
+    return ok, to_words(x if ok else 0, m[0])
+
+
+# FCryptoBigInt::NInv15
+def ninv15(x: int) -> int:
+    """Compute -(1/x) mod 2^15. Returns 0 for even x."""
+    x &= UINT32_MASK
+    y = (2 - x) & UINT32_MASK
+    y = (y * (2 - (x * y))) & UINT32_MASK
+    y = (y * (2 - (x * y))) & UINT32_MASK
+    y = (y * (2 - (x * y))) & UINT32_MASK
+    return (-y if x & 1 else 0) & WORD_MASK
+
+
+def monty_r(header: int) -> int:
+    """Montgomery factor R for a modulus with the given header word."""
+    return 1 << (WORD_SIZE * num_words(header))
+
+
+def to_monty(x: int, m: Sequence[int]) -> list[int]:
+    """Convert x into Montgomery representation modulo m,
+    with the same announced bit length as m.
+    """
+    p = from_words(m)
+    return to_words((x * monty_r(m[0])) % p, m[0])
+
+
+def from_monty(words: Sequence[int], m: Sequence[int]) -> int:
+    """Convert Montgomery representation words back into an integer."""
+    p = from_words(m)
+    return (from_words(words) * pow(monty_r(m[0]), -1, p)) % p
+
+
+def r2_mod(m: Sequence[int]) -> list[int]:
+    """Compute R^2 mod m as i15 words."""
+    p = from_words(m)
+    return to_words(pow(monty_r(m[0]), 2, p), m[0])
+
+
+# Word level operations, mirroring BearSSL's i15 code. They work in
+# place on word lists (header word first), like the UnrealScript ports.
+
+def _mux(ctl: int, a: int, b: int) -> int:
+    return a if ctl else b
+
+
+# FCryptoBigInt::Add
+def add(a: list[int], b: Sequence[int], ctl: int) -> int:
+    """a = a + b if ctl is 1, returns the carry either way."""
+    cc = 0
+    for u in range(1, num_words(a[0]) + 1):
+        aw = a[u]
+        naw = aw + b[u] + cc
+        cc = naw >> WORD_SIZE
+        a[u] = _mux(ctl, naw & WORD_MASK, aw)
+    return cc
+
+
+# FCryptoBigInt::Sub
+def sub(a: list[int], b: Sequence[int], ctl: int) -> int:
+    """a = a - b if ctl is 1, returns the borrow either way."""
+    cc = 0
+    for u in range(1, num_words(a[0]) + 1):
+        aw = a[u]
+        naw = (aw - b[u] - cc) & UINT32_MASK
+        cc = naw >> 31
+        a[u] = _mux(ctl, naw & WORD_MASK, aw)
+    return cc
+
+
+# FCryptoBigInt::BIsZero
+def iszero(x: Sequence[int]) -> int:
+    z = 0
+    for u in range(num_words(x[0]), 0, -1):
+        z |= x[u]
+    return int(z == 0)
+
+
+# FCryptoBigInt::MontyMul
+def montymul(
+        d: list[int],
+        x: Sequence[int],
+        y: Sequence[int],
+        m: Sequence[int],
+        m0i: int,
+):
+    """d = x * y / R mod m. d must not be x or y."""
+    n = num_words(m[0])
+    d[:n + 1] = [0] * (n + 1)
+    dh = 0
+    for u in range(n):
+        xu = x[u + 1]
+        f = (((d[1] + xu * y[1]) & WORD_MASK) * m0i) & WORD_MASK
+        r = 0
+        for v in range(n):
+            z = d[v + 1] + xu * y[v + 1] + f * m[v + 1] + r
+            r = z >> WORD_SIZE
+            d[v] = z & WORD_MASK
+        zh = dh + r
+        d[n] = zh & WORD_MASK
+        dh = zh >> WORD_SIZE
+    d[0] = m[0]
+    # d < 2*m here.
+    sub(d, m, int(dh != 0) | (sub(d, m, 0) ^ 1))
+
+
+# FCryptoBigInt::ModPow
+def modpow(
+        x: list[int],
+        e: bytes,
+        m: Sequence[int],
+        m0i: int,
+        t1: list[int],
+        t2: list[int],
+):
+    """x = x^e mod m, with x not in Montgomery representation.
+    t1 and t2 are scratch buffers.
+    """
+    n = num_words(m[0]) + 1
+    t1[:n] = to_monty(from_words(x), m)
+    x[:n] = to_words(1, m[0])
+    for k in range(len(e) * 8):
+        ctl = (e[len(e) - 1 - (k >> 3)] >> (k & 7)) & 1
+        montymul(t2, x, t1, m, m0i)
+        if ctl:
+            x[:n] = t2[:n]
+        montymul(t2, t1, t1, m, m0i)
+        t1[:n] = t2[:n]
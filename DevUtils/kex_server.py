@@ -0,0 +1,494 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""ECDHE key exchange service for FCrypto clients.
+
+The server side of the README use case: game servers (or other FCrypto
+clients) send an ephemeral public key, the service answers with its
+own ephemeral public key, and both sides derive the same session key.
+Session keys stay in a bounded, expiring in-memory cache, where other
+backend code (e.g. msgcodec HMAC verification) looks them up by
+session ID.
+
+The protocol is line based (TcpLink MODE_Line), one request per line,
+binary values as lowercase hex in the FCrypto encodings: Curve25519
+keys are 32 byte little-endian u-coordinates, Secp256r1 keys are 65
+byte uncompressed points and the Secp256r1 shared secret is the X
+coordinate. Curve names are EFCEllipticCurve names without FCEC_.
+
+    <id> KEX <curve> <client public key>
+        -> <id> <server public key> <session id>
+    <id> STATS
+        -> <id> <JSON stats>
+    errors
+        -> <id> SERVER_ERROR <reason>
+
+Responses may arrive out of order, match them by id.
+
+session id  = SHA-256(curve | client public key | server public key)[:16]
+session key = HKDF-SHA256(shared secret, salt=session id,
+                          info="FCrypto session key")[:32]
+
+Concurrent requests are queued per curve and computed in batches on a
+worker thread, a batch shares one field inversion for all of its
+scalar multiplications (see ec_math.mul_batch and x25519_batch).
+
+The curve arithmetic is ec_math, which is not constant time. The same
+caveats as for the rest of FCrypto apply, see README.md.
+"""
+
+import argparse
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import secrets
+import sys
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+
+from loguru import logger
+
+import ec_math
+
+HOST = "127.0.0.1"
+PORT = 65433
+
+CURVE25519 = "Curve25519"
+SECP256R1 = "Secp256r1"
+CURVES = (CURVE25519, SECP256R1)
+
+SESSION_ID_SIZE = 16
+SESSION_KEY_SIZE = 32
+SESSION_KEY_INFO = b"FCrypto session key"
+
+DEFAULT_CACHE_SIZE = 100000
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MAX_DELAY = 0.002
+
+_log_format = "[{time:YYYY-MM-DD HH:mm:ss.SSSZZ}] [{level}] [{function}] {message}"
+
+
+def setup_logging(verbose: bool = False):
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format=_log_format,
+        level="DEBUG" if verbose else "INFO",
+        enqueue=True,
+    )
+
+
+class KexError(Exception):
+    pass
+
+
+def hkdf_sha256(ikm: bytes, salt: bytes, info: bytes, length: int) -> bytes:
+    """RFC 5869 HKDF with SHA-256."""
+    prk = hmac.digest(salt, ikm, "sha256")
+    okm = b""
+    block = b""
+    counter = 1
+    while len(okm) < length:
+        block = hmac.digest(prk, block + info + bytes([counter]), "sha256")
+        okm += block
+        counter += 1
+    return okm[:length]
+
+
+def derive_session(
+        curve: str,
+        client_public: bytes,
+        server_public: bytes,
+        shared: bytes,
+) -> tuple[bytes, bytes]:
+    """Return (session ID, session key) of an exchange."""
+    transcript = curve.encode("ascii") + client_public + server_public
+    session_id = hashlib.sha256(transcript).digest()[:SESSION_ID_SIZE]
+    key = hkdf_sha256(shared, session_id, SESSION_KEY_INFO, SESSION_KEY_SIZE)
+    return session_id, key
+
+
+def decode_public_key(curve: str, data: bytes):
+    """Validate and decode a client public key."""
+    if curve == CURVE25519:
+        if len(data) != 32:
+            raise KexError("Curve25519 public key must be 32 bytes")
+        return data
+    if curve == SECP256R1:
+        try:
+            return ec_math.P256.decode_point(data)
+        except ValueError as e:
+            raise KexError(str(e)) from e
+    raise KexError(f"unsupported curve: {curve}")
+
+
+def exchange_batch(curve: str, client_keys: list) -> list[tuple[bytes, bytes] | KexError]:
+    """Generate an ephemeral key pair per decoded client public key and
+    compute the shared secrets. Returns (server public key, shared
+    secret) or a KexError per client key.
+    """
+    n = len(client_keys)
+    results: list[tuple[bytes, bytes] | KexError] = []
+    if curve == CURVE25519:
+        scalars = [secrets.token_bytes(32) for _ in range(n)]
+        out = ec_math.x25519_batch(
+            [(k, ec_math.X25519_BASE_U) for k in scalars]
+            + list(zip(scalars, client_keys))
+        )
+        for public, shared in zip(out[:n], out[n:]):
+            if shared == bytes(32):
+                results.append(KexError("low order Curve25519 public key"))
+            else:
+                results.append((public, shared))
+        return results
+
+    curve_ = ec_math.P256
+    size = (curve_.bits + 7) // 8
+    private_keys = [secrets.randbelow(curve_.n - 1) + 1 for _ in range(n)]
+    points = curve_.mul_batch(
+        [(k, curve_.generator) for k in private_keys]
+        + list(zip(private_keys, client_keys))
+    )
+    for public_pt, shared_pt in zip(points[:n], points[n:]):
+        if public_pt is None or shared_pt is None:
+            results.append(KexError("invalid Secp256r1 public key"))
+        else:
+            results.append(
+                (curve_.encode_point(public_pt), shared_pt[0].to_bytes(size, "big")))
+    return results
+
+
+class SessionCache:
+    """Bounded mapping of session ID to session key. Entries expire
+    ttl seconds after they were added, the oldest entries are evicted
+    first when the cache is full.
+    """
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_CACHE_SIZE,
+            ttl: float = DEFAULT_TTL,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: collections.OrderedDict[bytes, tuple[bytes, float]] = \
+            collections.OrderedDict()
+        self.evicted = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, session_id: bytes, key: bytes):
+        self.purge()
+        self._entries[session_id] = (key, self._clock() + self._ttl)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def get(self, session_id: bytes) -> bytes | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        key, expires = entry
+        if self._clock() >= expires:
+            del self._entries[session_id]
+            self.expired += 1
+            return None
+        return key
+
+    def purge(self):
+        """Remove expired entries."""
+        # Entries are in insertion order, which is also expiry order.
+        now = self._clock()
+        while self._entries:
+            session_id, (_, expires) = next(iter(self._entries.items()))
+            if now < expires:
+                break
+            del self._entries[session_id]
+            self.expired += 1
+
+
+@dataclass
+class KexStats:
+    started: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    errors: int = 0
+    batches: int = 0
+    batched: int = 0
+    # Request latencies in seconds, most recent last.
+    latencies: collections.deque[float] = field(
+        default_factory=lambda: collections.deque(maxlen=10000))
+
+    def record(self, latency: float, ok: bool):
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.latencies.append(latency)
+
+    def to_dict(self) -> dict[str, float | int]:
+        elapsed = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_second": self.requests / elapsed if elapsed > 0 else 0.0,
+            "mean_batch": self.batched / self.batches if self.batches else 0.0,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p99_ms": percentile(0.99),
+        }
+
+
+class EcdhBatcher:
+    """Collects concurrent exchanges per curve and runs them with
+    exchange_batch once max_batch are pending or max_delay seconds
+    after the first one was queued.
+    """
+
+    def __init__(
+            self,
+            max_batch: int = DEFAULT_MAX_BATCH,
+            max_delay: float = DEFAULT_MAX_DELAY,
+            executor: Executor | None = None,
+            stats: KexStats | None = None,
+    ):
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._executor = executor
+        self._stats = stats or KexStats()
+        self._pending: dict[str, list[tuple[object, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def exchange(self, curve: str, client_public: bytes) -> tuple[bytes, bytes]:
+        """Return (server public key, shared secret)."""
+        client_key = decode_public_key(curve, client_public)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(curve, [])
+        pending.append((client_key, future))
+        if len(pending) >= self._max_batch:
+            self._flush(curve)
+        elif curve not in self._timers:
+            self._timers[curve] = loop.call_later(self._max_delay, self._flush, curve)
+        return await future
+
+    def _flush(self, curve: str):
+        timer = self._timers.pop(curve, None)
+        if timer is not None:
+            timer.cancel()
+        jobs = self._pending.pop(curve, [])
+        if jobs:
+            task = asyncio.create_task(self._run(curve, jobs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, curve: str, jobs: list[tuple[object, asyncio.Future]]):
+        self._stats.batches += 1
+        self._stats.batched += len(jobs)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, exchange_batch, curve, [k for k, _ in jobs])
+        except Exception as e:
+            logger.exception(e)
+            results = [KexError("internal error")] * len(jobs)
+        for (_, future), result in zip(jobs, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class KexServer:
+    def __init__(
+            self,
+            cache: SessionCache | None = None,
+            max_batch: int = DEFAULT_MAX_BATCH,
+            max_delay: float = DEFAULT_MAX_DELAY,
+            executor: Executor | None = None,
+    ):
+        self.cache = cache or SessionCache()
+        self.stats = KexStats()
+        self._batcher = EcdhBatcher(max_batch, max_delay, executor, self.stats)
+
+    def session_key(self, session_id: bytes) -> bytes | None:
+        return self.cache.get(session_id)
+
+    async def handle_line(self, line: str) -> str:
+        if not line.isascii():
+            # Responses echo the request id, which must be ASCII.
+            raise KexError("non-ASCII request")
+        parts = line.split()
+        if not parts:
+            raise KexError("empty request")
+        req_id = parts[0]
+        start = time.perf_counter()
+        ok = False
+        try:
+            match [p.upper() for p in parts[1:2]] + parts[2:]:
+                case ["KEX", curve, client_hex]:
+                    try:
+                        client_public = bytes.fromhex(client_hex)
+                    except ValueError:
+                        raise KexError("invalid hex") from None
+                    server_public, shared = await self._batcher.exchange(
+                        curve, client_public)
+                    session_id, key = derive_session(
+                        curve, client_public, server_public, shared)
+                    self.cache.put(session_id, key)
+                    out = f"{req_id} {server_public.hex()} {session_id.hex()}"
+                case ["STATS"]:
+                    stats = self.stats.to_dict() | {"sessions": len(self.cache)}
+                    out = f"{req_id} {json.dumps(stats, separators=(',', ':'))}"
+                case _:
+                    raise KexError("invalid request")
+            ok = True
+            return out
+        except KexError as e:
+            logger.debug("{}: {}", req_id, e)
+            return f"{req_id} SERVER_ERROR {e}"
+        finally:
+            self.stats.record(time.perf_counter() - start, ok)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        logger.info("connection from {}", peer)
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(line: str):
+            try:
+                out = await self.handle_line(line)
+            except KexError as e:
+                out = f"SERVER_ERROR {e}"
+            writer.write(out.encode("ascii") + b"\n")
+
+        try:
+            # Requests are handled concurrently so that pipelined
+            # requests of a single client end up in the same batch.
+            while data := await reader.readline():
+                line = data.decode("ascii", errors="replace").strip()
+                if not line:
+                    break
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                # One failed request must not drop the other responses.
+                for result in await asyncio.gather(*tasks, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logger.error("request failed: {}: {}", type(result).__name__, result)
+            await writer.drain()
+        except ConnectionResetError as e:
+            logger.info("connection closed: {}: {}", type(e).__name__, e)
+        finally:
+            writer.close()
+        logger.info("done: {}", peer)
+
+    async def serve(self, host: str = HOST, port: int = PORT) -> asyncio.Server:
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def _log_stats(server: KexServer, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        server.cache.purge()
+        logger.info("stats: {} sessions={}", server.stats.to_dict(), len(server.cache))
+
+
+async def _main(args: argparse.Namespace):
+    kex = KexServer(
+        SessionCache(args.cache_size, args.ttl),
+        max_batch=args.max_batch,
+        max_delay=args.max_delay,
+    )
+    server = await kex.serve(args.host, args.port)
+    logger.info("listening on {}:{}", args.host, args.port)
+    stats_task = asyncio.create_task(_log_stats(kex, args.stats_interval))
+    async with server:
+        await server.serve_forever()
+    stats_task.cancel()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--host", default=HOST)
+    ap.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="maximum number of cached session keys (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="session key lifetime in seconds (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help="maximum exchanges per ECDH batch (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--max-delay",
+        type=float,
+        default=DEFAULT_MAX_DELAY,
+        help="seconds to wait for a batch to fill up (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--stats-interval",
+        type=float,
+        default=60.0,
+        help="seconds between stats log lines (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--verbose",
+        action="store_true",
+        help="log every failed request",
+    )
+    args = ap.parse_args()
+    setup_logging(args.verbose)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Host-side codec for FCrypto [HEADER | DATA | HMAC] messages.
+
+Frame layout, all integers big-endian:
+
+    offset  size  field
+    0       2     magic, b"FC"
+    2       1     version, VERSION
+    3       1     flags, application defined
+    4       4     sequence number
+    8       4     data length N
+    12      N     data
+    12 + N  32    HMAC-SHA256 over header and data
+
+The HMAC key is the static key from the ECDH exchange (see README.md).
+Decoding does not copy: Frame.data is a memoryview slice of the input
+buffer, so the input must be kept alive (and unmodified) for as long as
+the frame is used. Call bytes(frame.data) to detach it.
+
+hashlib releases the GIL while hashing, so batches of messages are
+verified in parallel on a thread pool with decode_batch.
+
+Usage:
+    python msgcodec.py                       # Throughput benchmark.
+    python msgcodec.py --size 64 --size 4096 --workers 8
+"""
+
+import argparse
+import concurrent.futures
+import hmac
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Iterable
+from typing import Iterator
+
+MAGIC = b"FC"
+VERSION = 1
+HEADER = struct.Struct(">2sBBII")
+HEADER_SIZE = HEADER.size
+DIGEST = "sha256"
+TAG_SIZE = 32
+MAX_DATA_SIZE = 0xFFFFFFFF
+
+DEFAULT_SIZES = (64, 1024, 16384)
+DEFAULT_COUNT = 20000
+DEFAULT_CHUNK_SIZE = 256
+
+Buffer = bytes | bytearray | memoryview
+
+
+class MessageError(Exception):
+    pass
+
+
+class VerifyError(MessageError):
+    pass
+
+
+@dataclass(frozen=True)
+class Frame:
+    flags: int
+    sequence: int
+    data: memoryview
+
+    @property
+    def size(self) -> int:
+        """Encoded size of the frame in bytes."""
+        return encoded_size(len(self.data))
+
+
+def encoded_size(data_size: int) -> int:
+    return HEADER_SIZE + data_size + TAG_SIZE
+
+
+def encode_into(
+        key: bytes,
+        buf: bytearray | memoryview,
+        offset: int,
+        data: Buffer,
+        sequence: int,
+        flags: int = 0,
+) -> int:
+    """Encode a frame into buf at offset, return the offset past it."""
+    size = len(data)
+    if size > MAX_DATA_SIZE:
+        raise MessageError(f"data too large: {size} bytes")
+    end = offset + HEADER_SIZE + size
+    mv = memoryview(buf)
+    if len(mv) < end + TAG_SIZE:
+        raise MessageError("buffer too small")
+    HEADER.pack_into(mv, offset, MAGIC, VERSION, flags, sequence, size)
+    mv[offset + HEADER_SIZE:end] = data
+    mv[end:end + TAG_SIZE] = hmac.digest(key, mv[offset:end], DIGEST)
+    return end + TAG_SIZE
+
+
+def encode(key: bytes, data: Buffer, sequence: int, flags: int = 0) -> bytearray:
+    buf = bytearray(encoded_size(len(data)))
+    encode_into(key, buf, 0, data, sequence, flags)
+    return buf
+
+
+def decode_from(
+        key: bytes,
+        buf: Buffer,
+        offset: int = 0,
+        verify: bool = True,
+) -> Frame:
+    """Decode the frame at offset of buf. The frame may be followed
+    by other data, see Frame.size.
+    """
+    mv = memoryview(buf)
+    if len(mv) - offset < HEADER_SIZE + TAG_SIZE:
+        raise MessageError("truncated frame")
+    magic, version, flags, sequence, size = HEADER.unpack_from(mv, offset)
+    if magic != MAGIC:
+        raise MessageError(f"bad magic: {magic!r}")
+    if version != VERSION:
+        raise MessageError(f"unsupported version: {version}")
+    start = offset + HEADER_SIZE
+    end = start + size
+    if len(mv) < end + TAG_SIZE:
+        raise MessageError(f"truncated frame: expected {size} data bytes")
+    if verify:
+        tag = hmac.digest(key, mv[offset:end], DIGEST)
+        if not hmac.compare_digest(tag, mv[end:end + TAG_SIZE]):
+            raise VerifyError(f"HMAC mismatch (sequence {sequence})")
+    return Frame(flags, sequence, mv[start:end])
+
+
+def decode(key: bytes, buf: Buffer, verify: bool = True) -> Frame:
+    """Decode a buffer holding exactly one frame."""
+    frame = decode_from(key, buf, 0, verify)
+    if frame.size != len(buf):
+        raise MessageError(f"{len(buf) - frame.size} trailing bytes")
+    return frame
+
+
+def iter_frames(key: bytes, buf: Buffer, verify: bool = True) -> Iterator[Frame]:
+    """Decode a buffer of back-to-back frames."""
+    offset = 0
+    while offset < len(buf):
+        frame = decode_from(key, buf, offset, verify)
+        offset += frame.size
+        yield frame
+
+
+def _decode_chunk(key: bytes, bufs: list[Buffer]) -> list[Frame | MessageError]:
+    result: list[Frame | MessageError] = []
+    for buf in bufs:
+        try:
+            result.append(decode(key, buf))
+        except MessageError as e:
+            result.append(e)
+    return result
+
+
+def decode_batch(
+        key: bytes,
+        bufs: Iterable[Buffer],
+        executor: concurrent.futures.Executor | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[Frame | MessageError]:
+    """Decode and verify single frame buffers, in order. Failed
+    messages are returned as their MessageError instead of raising,
+    so one bad message does not discard the batch.
+
+    With an executor, the batch is split into chunks of chunk_size
+    decoded in parallel. Small messages are dominated by per-call
+    overhead, chunking keeps the pool scheduling cost per chunk.
+    """
+    bufs = list(bufs)
+    if executor is None:
+        return _decode_chunk(key, bufs)
+    futures = [
+        executor.submit(_decode_chunk, key, bufs[i:i + chunk_size])
+        for i in range(0, len(bufs), chunk_size)
+    ]
+    result: list[Frame | MessageError] = []
+    for future in futures:
+        result += future.result()
+    return result
+
+
+@dataclass
+class Throughput:
+    name: str
+    size: int
+    count: int
+    seconds: float
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.count / self.seconds
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.count * self.size / self.seconds / 1e6
+
+
+def benchmark(
+        sizes: Iterable[int],
+        count: int,
+        workers: int,
+        repeat: int = 3,
+) -> list[Throughput]:
+    """Best-of-repeat encode, serial decode and pooled decode
+    throughput for each data size.
+    """
+    key = os.urandom(32)
+    result = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for size in sizes:
+            data = os.urandom(size)
+            msgs = [encode(key, data, seq) for seq in range(count)]
+            cases = {
+                "encode": lambda: [encode(key, data, seq) for seq in range(count)],
+                "decode": lambda: decode_batch(key, msgs),
+                f"decode x{workers}": lambda: decode_batch(key, msgs, pool),
+            }
+            for name, func in cases.items():
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    best = min(best, time.perf_counter() - start)
+                result.append(Throughput(name, size, count, best))
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--size",
+        type=int,
+        action="append",
+        help=f"message data size in bytes, may be repeated "
+             f"(default: {', '.join(map(str, DEFAULT_SIZES))})",
+    )
+    ap.add_argument(
+        "--count",
+        type=int,
+        default=DEFAULT_COUNT,
+        help="messages per measurement (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="thread pool size for batch decoding (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    print(f"{'case':<12} {'size':>8} {'msg/s':>12} {'MB/s':>10}")
+    for t in benchmark(args.size or DEFAULT_SIZES, args.count, args.workers):
+        print(f"{t.name:<12} {t.size:>8} "
+              f"{t.messages_per_second:>12.0f} {t.megabytes_per_second:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
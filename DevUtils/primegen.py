@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generates "random" prime tables for FCryptoTestMutator directly
+into UnrealScript DefaultProperties syntax.
+
+Primes are generated with the same constraints as BearSSL test_math.c
+rand_prime() (and the rand_prime operation of gmp_server.py). Each
+table entry is deterministic given its (size, index, seed) triple,
+where index is the position of the entry among the primes of the same
+bit size. Generated entries are cached by that triple, so growing the
+schedule only computes the new entries.
+
+Schedules are comma separated lists of SIZES:COUNT items, where SIZES
+is a single bit size or an inclusive range of bit sizes. For example,
+"2-128:10" (the default) generates 10 primes of each size from 2 to
+128 bits, which matches the layout expected by TestMath.
+
+Usage:
+    python primegen.py --schedule 2-128:10,192:5,256:5 --output primes_out.txt
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import gmpy2
+
+import primes
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_CACHE = SCRIPT_DIR / ".cache" / "primegen_cache.json"
+DEFAULT_SCHEDULE = "2-128:10"
+
+# (size, index) pairs in table order.
+Schedule = list[tuple[int, int]]
+
+
+def rand_prime(rng, bits: int) -> gmpy2.mpz:
+    """Generate a random prime of exactly the given bit size,
+    such that x - 1 is not divisible by 65537. Mirrors BearSSL
+    test_math.c rand_prime().
+    """
+    if bits < 2:
+        raise ValueError(f"invalid prime size: {bits}")
+    while True:
+        x = gmpy2.mpz_urandomb(rng, bits - 1)
+        x = x.bit_set(0)
+        x = x.bit_set(bits - 1)
+        if x.is_prime(50) and not (x - 1).is_divisible(65537):
+            return x
+
+
+def parse_schedule(schedule: str) -> Schedule:
+    entries: Schedule = []
+    for item in schedule.split(","):
+        sizes, sep, count = item.strip().partition(":")
+        if not sep:
+            raise ValueError(f"invalid schedule item '{item}', expected SIZES:COUNT")
+        first, _, last = sizes.partition("-")
+        for size in range(int(first), int(last or first) + 1):
+            if size < 2:
+                raise ValueError(f"invalid prime size in schedule: {size}")
+            entries.extend((size, index) for index in range(int(count)))
+    return entries
+
+
+def cache_key(size: int, index: int, seed: int) -> str:
+    return f"{size}:{index}:{seed}"
+
+
+def entry_seed(size: int, index: int, seed: int) -> int:
+    digest = hashlib.sha256(cache_key(size, index, seed).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def generate_entry(size: int, index: int, seed: int) -> str:
+    """Generate a single table entry as a hex string."""
+    rng = gmpy2.random_state(entry_seed(size, index, seed))
+    return rand_prime(rng, size).digits(16)
+
+
+def _generate_entry_args(args: tuple[int, int, int]) -> str:
+    return generate_entry(*args)
+
+
+def load_cache(path: Path) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def write_cache(path: Path, cache: dict[str, str]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, indent=0, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def hex_to_spaced_bytes(x: str) -> str:
+    """'10d' -> '01 0D', the format produced by primes.split_words()."""
+    data = int(x, 16).to_bytes((int(x, 16).bit_length() + 7) // 8, "big")
+    return " ".join(f"{b:02X}" for b in data)
+
+
+def generate(
+        schedule: Schedule,
+        seed: int,
+        cache: dict[str, str],
+        workers: int | None = None,
+) -> Iterator[tuple[int, int, str]]:
+    """Yield (size, index, hex) for each schedule entry in table order,
+    computing missing entries in a process pool. The cache is updated
+    in place as results arrive.
+    """
+    # Overlapping schedule ranges repeat entries, each is computed once
+    # so the results line up with the keys consumed below.
+    missing = list(dict.fromkeys(
+        (size, index, seed) for size, index in schedule
+        if cache_key(size, index, seed) not in cache
+    ))
+    pending: Iterator[str] = iter(())
+    executor = None
+    if missing:
+        workers = workers or os.cpu_count() or 1
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        chunksize = max(1, len(missing) // (workers * 8))
+        pending = executor.map(_generate_entry_args, missing, chunksize=chunksize)
+
+    try:
+        for size, index in schedule:
+            key = cache_key(size, index, seed)
+            if key not in cache:
+                cache[key] = next(pending)
+            yield size, index, cache[key]
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--schedule",
+        default=DEFAULT_SCHEDULE,
+        help="prime size and count schedule (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="base seed for the table (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--mode",
+        choices=primes.MODES,
+        default="full",
+        help="output mode, see primes.py (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="UnrealScript output file, stdout if not given",
+    )
+    ap.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help="generated entry cache file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    args = ap.parse_args()
+
+    schedule = parse_schedule(args.schedule)
+    cache = load_cache(args.cache)
+    cached_before = len(cache)
+
+    out = args.output.open("w") if args.output else sys.stdout
+    try:
+        for i, (size, index, x) in enumerate(
+                generate(schedule, args.seed, cache, args.workers)):
+            line = primes.prime_to_uscript(i, hex_to_spaced_bytes(x), args.mode)
+            out.write(("\n" if i else "") + line)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.write("\n")
+        write_cache(args.cache, cache)
+
+    print(
+        f"{len(schedule)} primes, {len(cache) - cached_before} newly generated",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -24,12 +24,24 @@
 
 """Processes primes generated by GMP mpz export into UnrealScript
 syntax for use in DefaultProperties blocks.
+
+Output modes:
+  bytes: big-endian bytes only, Primes(i)=(P=(...)).
+  i15:   pre-decoded i15 words of the prime (as produced by
+         FCryptoBigInt::Decode), m0i (FCryptoBigInt::NInv15)
+         and R^2 mod p, Primes(i)=(M=(...),M0I=...,R2=(...)).
+  full:  both of the above, Primes(i)=(P=(...),M=(...),M0I=...,R2=(...)).
 """
 
+import argparse
 import itertools
 from pathlib import Path
 from typing import List
 
+import i15
+
+MODES = ("bytes", "i15", "full")
+
 
 def strip_leading_zeros(word: str) -> str:
     """Strip leading 'zero words'.
@@ -65,16 +77,56 @@ def bytes_to_uscript_array(words: str) -> str:
     return ",".join(x)
 
 
+def words_to_uscript_array(words: List[int]) -> str:
+    return ",".join(str(w) for w in words)
+
+
+def prime_to_uscript(index: int, prime_bytes: str, mode: str = "full") -> str:
+    """Format a single prime, given as space separated hex bytes
+    (see split_words), as a Primes DefaultProperties line.
+    """
+    fields = []
+    if mode in ("bytes", "full"):
+        fields.append(f"P=({bytes_to_uscript_array(prime_bytes)})")
+    if mode in ("i15", "full"):
+        m = i15.decode(bytes.fromhex(prime_bytes))
+        fields.append(f"M=({words_to_uscript_array(m)})")
+        fields.append(f"M0I={i15.ninv15(m[1])}")
+        fields.append(f"R2=({words_to_uscript_array(i15.r2_mod(m))})")
+    return f"    Primes({index})=({','.join(fields)})"
+
+
 def main():
-    primes_in = Path("primes.txt").read_text()
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--mode",
+        choices=MODES,
+        default="full",
+        help="output mode (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--input",
+        type=Path,
+        default=Path("primes.txt"),
+        help="GMP mpz export of 16-bit hex words (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--output",
+        type=Path,
+        default=Path("primes_out.txt"),
+        help="UnrealScript output file (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    primes_in = args.input.read_text()
     p_lines = [p for p in primes_in.split("\n") if p]
     p_lines = [p.split(" ") for p in p_lines]
     p_lines = [split_words(p) for p in p_lines]
     p_lines = [
-        f"    Primes({i})=(P=({bytes_to_uscript_array(p)}))"
+        prime_to_uscript(i, p, args.mode)
         for i, p in enumerate(p_lines)
     ]
-    Path("primes_out.txt").write_text("\n".join(p_lines))
+    args.output.write_text("\n".join(p_lines))
     for pl in p_lines:
         print(pl)
 
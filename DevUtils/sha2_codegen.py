@@ -0,0 +1,322 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generator for the fully unrolled FCryptoSHA2 compression functions.
+
+The SHA-224/256 compression function is emitted as straight-line code:
+
+- The eight working variables are never moved. Instead of the
+  a, b, ..., h shift at the end of each round, the roles of the local
+  variables A...H rotate by one position per round, exactly like the
+  SHA2_STEP sequence of BearSSL's sha2small.c.
+- The message schedule is kept in 16 rolling local variables W00...W15
+  instead of a 64 word array. Word i (i >= 16) overwrites word i - 16
+  right before round i needs it.
+- The round constants K are inlined as literals, so there are no
+  default.K_SMALL array lookups.
+
+The boolean and rotation functions are the CH, MAJ, BSG2_*, SSG2_*
+macros of FCryptoSHA2Macros.uci, which the output file uses as is.
+
+Three functions are generated:
+
+    Sha2SmallRound_SBuf64_SVal8  one block from a static 64 byte buffer
+    Sha2SmallRound               same for dynamic arrays
+    Sha2SmallBlocks              consecutive blocks straight from the
+                                 input array, used by Sha2SmallUpdate
+                                 for whole blocks to skip the copy to
+                                 the context buffer
+
+compress() runs the same round and schedule sequence in Python, and
+the generator checks it against hashlib before writing anything.
+
+Usage:
+    python sha2_codegen.py          # Validate and regenerate the output file.
+    python sha2_codegen.py --check  # Fail if the output file is stale.
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Iterator
+from typing import Sequence
+
+SCRIPT_DIR = Path(__file__).parent
+CLASSES_DIR = SCRIPT_DIR / "../Classes/"
+DEFAULT_SOURCE = CLASSES_DIR / "FCryptoSHA2.uc"
+DEFAULT_OUTPUT = CLASSES_DIR / "FCryptoSHA2Code.uci"
+
+HEADER = """/*
+ * Copyright (c) 2024 Tuomo Kriikkula <tuokri@tuta.io>
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+// GENERATED FILE, DO NOT EDIT BY HAND!
+// Generated by DevUtils/sha2_codegen.py from the K_SMALL constants
+// of FCryptoSHA2.uc and the macros of FCryptoSHA2Macros.uci.
+"""
+
+NUM_ROUNDS = 64
+VARS = "ABCDEFGH"
+MASK32 = 0xFFFFFFFF
+
+SHA256_IV = (
+    0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+    0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19,
+)
+
+K_SMALL_RE = re.compile(r"K_SMALL\s*=\s*\{\((?P<values>[^)]*)\)}", re.DOTALL)
+
+
+def parse_k_small(source: str) -> list[int]:
+    m = K_SMALL_RE.search(source)
+    if not m:
+        raise ValueError("K_SMALL not found")
+    k = [int(v, 16) for v in re.findall(r"0x[0-9A-Fa-f]+", m["values"])]
+    if len(k) != NUM_ROUNDS:
+        raise ValueError(f"expected {NUM_ROUNDS} K_SMALL values, got {len(k)}")
+    return k
+
+
+def round_vars(i: int) -> str:
+    """Roles a...h of the local variables in round i."""
+    shift = -i % 8
+    return VARS[shift:] + VARS[:shift]
+
+
+def schedule_sources(i: int) -> tuple[int, int, int, int]:
+    """W slots of w[i-2], w[i-7], w[i-15] and w[i-16] for round i >= 16."""
+    return (i - 2) % 16, (i - 7) % 16, (i - 15) % 16, i % 16
+
+
+def rounds() -> Iterator[tuple[int, str, int, tuple[int, int, int, int] | None]]:
+    """Yield (round, roles, W slot, schedule sources or None)."""
+    for i in range(NUM_ROUNDS):
+        yield i, round_vars(i), i % 16, schedule_sources(i) if i >= 16 else None
+
+
+def _rotr(x: int, n: int) -> int:
+    return ((x >> n) | (x << (32 - n))) & MASK32
+
+
+def compress(val: list[int], block: bytes, k: Sequence[int]):
+    """Compress one 64 byte block into val, in the generated order."""
+    w = list(struct.unpack(">16I", block))
+    regs = dict(zip(VARS, val))
+    for i, roles, slot, sources in rounds():
+        a, b, c, d, e, f, g, h = tuple(roles)
+        if sources:
+            s2, s7, s15, s16 = sources
+            x2, x15 = w[s2], w[s15]
+            w[slot] = (
+                (_rotr(x2, 17) ^ _rotr(x2, 19) ^ (x2 >> 10))
+                + w[s7]
+                + (_rotr(x15, 7) ^ _rotr(x15, 18) ^ (x15 >> 3))
+                + w[s16]
+            ) & MASK32
+        x = regs[e]
+        t1 = (regs[h] + (_rotr(x, 6) ^ _rotr(x, 11) ^ _rotr(x, 25))
+              + (((regs[f] ^ regs[g]) & x) ^ regs[g]) + k[i] + w[slot])
+        x = regs[a]
+        t2 = ((_rotr(x, 2) ^ _rotr(x, 13) ^ _rotr(x, 22))
+              + ((regs[b] & regs[c]) | ((regs[b] | regs[c]) & x)))
+        regs[d] = (regs[d] + t1) & MASK32
+        regs[h] = (t1 + t2) & MASK32
+    for j, name in enumerate(VARS):
+        val[j] = (val[j] + regs[name]) & MASK32
+
+
+def sha256(data: bytes, k: Sequence[int]) -> bytes:
+    val = list(SHA256_IV)
+    padded = data + b"\x80" + bytes(-(len(data) + 9) % 64) + struct.pack(">Q", len(data) * 8)
+    for off in range(0, len(padded), 64):
+        compress(val, padded[off:off + 64], k)
+    return struct.pack(">8I", *val)
+
+
+def validate(k: Sequence[int], num: int, rng: random.Random):
+    """Check compress() against hashlib on num random messages."""
+    for n in range(num):
+        data = rng.randbytes(rng.randrange(0, 300) if n else 0)
+        if sha256(data, k) != hashlib.sha256(data).digest():
+            raise AssertionError(f"SHA-256 mismatch for {data.hex()}")
+
+
+def _w(slot: int) -> str:
+    return f"W{slot:02}"
+
+
+def render_body(k: Sequence[int], src: str, off: str, val: str, indent: str) -> list[str]:
+    """Statements compressing the block at src[off] into val."""
+    lines = []
+    for slot in range(16):
+        idx = [f"{off} + {4 * slot + j}" if off else str(4 * slot + j) for j in range(4)]
+        if off and slot == 0:
+            idx[0] = off
+        lines.append(
+            f"{_w(slot)} = ({src}[{idx[0]}] << 24) | ({src}[{idx[1]}] << 16) "
+            f"| ({src}[{idx[2]}] << 8) | {src}[{idx[3]}];")
+    lines.append("")
+    for j, name in enumerate(VARS):
+        lines.append(f"{name} = {val}[{j}];")
+
+    for i, roles, slot, sources in rounds():
+        a, b, c, d, e, f, g, h = tuple(roles)
+        lines.append("")
+        if sources:
+            s2, s7, s15, s16 = sources
+            lines.append(
+                f"{_w(slot)} = `SSG2_1({_w(s2)}) + {_w(s7)} "
+                f"+ `SSG2_0({_w(s15)}) + {_w(s16)};")
+        lines.append(
+            f"T1 = {h} + `BSG2_1({e}) + `CH({e}, {f}, {g}) + 0x{k[i]:08X} + {_w(slot)};")
+        lines.append(f"{d} += T1;")
+        lines.append(f"{h} = T1 + `BSG2_0({a}) + `MAJ({a}, {b}, {c});")
+
+    lines.append("")
+    for j, name in enumerate(VARS):
+        lines.append(f"{val}[{j}] += {name};")
+    return [indent + line if line else "" for line in lines]
+
+
+def _locals() -> list[str]:
+    return (["    local int T1;"]
+            + [f"    local int {name};" for name in VARS]
+            + [f"    local int {_w(slot)};" for slot in range(16)])
+
+
+def render_round(k: Sequence[int], name: str, buf_decl: str, val_decl: str) -> str:
+    lines = [
+        f"static final function {name}(",
+        f"    const out {buf_decl},",
+        f"    out {val_decl}",
+        ")",
+        "{",
+        *_locals(),
+        "",
+        *render_body(k, "Buf", "", "Val", "    "),
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def render_blocks(k: Sequence[int]) -> str:
+    lines = [
+        "// Compress Num consecutive 64 byte blocks of Data, starting at Offset.",
+        "static final function Sha2SmallBlocks(",
+        "    const out array<byte> Data,",
+        "    int Offset,",
+        "    int Num,",
+        "    out int Val[8]",
+        ")",
+        "{",
+        *_locals(),
+        "",
+        "    while (Num-- > 0)",
+        "    {",
+        *render_body(k, "Data", "Offset", "Val", "        "),
+        "",
+        "        Offset += 64;",
+        "    }",
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate(source: str) -> str:
+    k = parse_k_small(source)
+    return "\n".join([
+        HEADER,
+        render_round(k, "Sha2SmallRound_SBuf64_SVal8", "byte Buf[64]", "int Val[8]"),
+        render_round(k, "Sha2SmallRound", "array<byte> Buf", "array<int> Val"),
+        render_blocks(k),
+    ])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--source",
+        type=Path,
+        default=DEFAULT_SOURCE,
+        help="UnrealScript source file with the K_SMALL constants (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="generated output file (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, exit with an error "
+             "if the output file is not up to date",
+    )
+    ap.add_argument(
+        "--messages",
+        type=int,
+        default=100,
+        help="random messages validated against hashlib (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    source = args.source.read_text()
+    validate(parse_k_small(source), args.messages, random.Random(0))
+
+    generated = generate(source)
+    if args.check:
+        if not args.out.exists() or args.out.read_text() != generated:
+            print(f"{args.out} is out of date, re-run {Path(__file__).name}",
+                  file=sys.stderr)
+            sys.exit(1)
+        return
+
+    args.out.write_text(generated)
+    print(f"wrote {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the bitsliced AES reference model and the generated
+TestAesCt vectors. The UnrealScript implementation is run with
+uscript_eval and compared against the model.
+"""
+
+import numpy as np
+import pytest
+
+import aes_ct
+import uscript_inline
+from uscript_eval import Interpreter
+
+# FIPS-197 Appendix C.
+PLAINTEXT = "00112233445566778899aabbccddeeff"
+FIPS_197 = [
+    ("000102030405060708090a0b0c0d0e0f",
+     "69c4e0d86a7b0430d8cdb78070b4c55a"),
+    ("000102030405060708090a0b0c0d0e0f1011121314151617",
+     "dda97ca4864cdfe06eaf70a0ec0d7191"),
+    ("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f",
+     "8ea2b7ca516745bfeafc49904b496089"),
+]
+
+
+@pytest.fixture(scope="module")
+def interp() -> Interpreter:
+    classes = {p.name: p.read_text()
+               for p in sorted(aes_ct.CLASSES_DIR.glob("*.uc*"))}
+    pp = uscript_inline.Preprocessor(classes)
+    return Interpreter(pp.process("FCryptoAES.uc"), pp.process("FCryptoEncDec.uc"))
+
+
+def words(q) -> list[int]:
+    return [int(x) & 0xFFFFFFFF for x in np.asarray(q).reshape(-1)]
+
+
+@pytest.mark.parametrize("key, expected", FIPS_197)
+def test_fips_197(key: str, expected: str):
+    block = np.frombuffer(bytes.fromhex(PLAINTEXT), dtype=np.uint8)
+    ct = aes_ct.encrypt(bytes.fromhex(key), block)
+    assert ct.tobytes().hex() == expected
+    assert aes_ct.decrypt(bytes.fromhex(key), ct).tobytes().hex() == PLAINTEXT
+
+
+def test_sbox():
+    assert aes_ct.SBOX[0x00] == 0x63
+    assert aes_ct.SBOX[0x53] == 0xED
+    assert sorted(aes_ct.SBOX) == list(range(256))
+    assert all(aes_ct.INV_SBOX[aes_ct.SBOX[x]] == x for x in range(256))
+
+
+def test_ortho_is_involution():
+    q = np.random.default_rng(0).integers(0, 1 << 32, (100, 8), dtype=np.uint32)
+    assert np.array_equal(aes_ct.ortho(aes_ct.ortho(q)), q)
+
+
+def test_roundtrip_odd_block_count():
+    rng = np.random.default_rng(1)
+    for key_len in aes_ct.NUM_ROUNDS:
+        key = rng.integers(0, 256, key_len, dtype=np.uint8).tobytes()
+        blocks = rng.integers(0, 256, (7, 16), dtype=np.uint8)
+        assert np.array_equal(aes_ct.decrypt(key, aes_ct.encrypt(key, blocks)), blocks)
+
+
+def test_invalid_key_length():
+    assert aes_ct.keysched(bytes(20)) == (0, [])
+    with pytest.raises(ValueError):
+        aes_ct.encrypt(bytes(20), np.zeros(16, dtype=np.uint8))
+
+
+def test_generated_file_is_up_to_date():
+    assert aes_ct.DEFAULT_OUTPUT.read_text() == aes_ct.generate()
+
+
+def test_vector_layout():
+    keys, blocks = aes_ct.generate_vectors(6, 12)
+    assert len(keys) == 6 * aes_ct.KEY_RECORD_WORDS
+    assert len(blocks) == 12 * aes_ct.BLOCK_RECORD_WORDS
+    key_indexes = blocks[::aes_ct.BLOCK_RECORD_WORDS]
+    assert key_indexes[:3] == [0, 1, 2]
+    assert key_indexes[3:] == sorted(key_indexes[3:])
+    assert set(key_indexes) == set(range(6))
+    for i in range(6):
+        rec = keys[i * aes_ct.KEY_RECORD_WORDS:(i + 1) * aes_ct.KEY_RECORD_WORDS]
+        num_rounds, comp = aes_ct.keysched(bytes(rec[1:1 + rec[0]]))
+        assert rec[33:33 + len(comp)] == comp
+        assert not any(rec[33 + len(comp):])
+
+
+def test_vectors_start_with_known_answers():
+    _, blocks = aes_ct.generate_vectors(aes_ct.DEFAULT_KEYS, aes_ct.DEFAULT_BLOCKS)
+    recs = np.array(blocks, dtype=np.uint32).reshape(-1, aes_ct.BLOCK_RECORD_WORDS)
+    for i, (_, expected) in enumerate(FIPS_197):
+        rec = recs[i]
+        assert rec[0] == i
+        pt = aes_ct.store_blocks(rec[None, 1:9])
+        ct = aes_ct.store_blocks(rec[None, 25:33])
+        assert [b.tobytes().hex() for b in pt] == [PLAINTEXT] * 2
+        assert [b.tobytes().hex() for b in ct] == [expected] * 2
+
+
+def test_uscript_primitives(interp: Interpreter):
+    q = np.random.default_rng(2).integers(0, 1 << 32, (1, 8), dtype=np.uint32)
+    for func, model in [
+        ("AesCtOrtho", aes_ct.ortho),
+        ("AesCtBitSliceSBox", aes_ct.bitslice_sbox),
+        ("AesCtBitSliceInvSBox", aes_ct.bitslice_inv_sbox),
+        ("ShiftRows", aes_ct.shift_rows),
+        ("InvShiftRows", aes_ct.inv_shift_rows),
+        ("MixColumns", aes_ct.mix_columns),
+        ("InvMixColumns", aes_ct.inv_mix_columns),
+    ]:
+        state = words(q)
+        interp.call(func, state)
+        assert words(state) == words(model(q)), func
+
+
+def test_uscript_against_vectors(interp: Interpreter):
+    keys, blocks = aes_ct.generate_vectors(3, 6, seed=3)
+    skeys = []
+    for i in range(3):
+        rec = keys[i * aes_ct.KEY_RECORD_WORDS:(i + 1) * aes_ct.KEY_RECORD_WORDS]
+        comp: list[int] = []
+        num_rounds = interp.call("AesCtKeySched", comp, rec[1:1 + rec[0]], rec[0])
+        assert num_rounds == aes_ct.NUM_ROUNDS[rec[0]]
+        assert words(comp) == rec[33:33 + len(comp)]
+        skey: list[int] = []
+        interp.call("AesCtSKeyExpand", skey, num_rounds, comp)
+        assert words(skey) == words(aes_ct.skey_expand(words(comp)))
+        skeys.append((num_rounds, skey))
+
+    for i in range(6):
+        rec = blocks[i * aes_ct.BLOCK_RECORD_WORDS:(i + 1) * aes_ct.BLOCK_RECORD_WORDS]
+        num_rounds, skey = skeys[rec[0]]
+        q = rec[1:9]
+        interp.call("AesCtOrtho", q)
+        assert words(q) == rec[9:17]
+
+        round1 = list(q)
+        interp.call("AddRoundKey", round1, skey)
+        interp.call("AesCtBitSliceSBox", round1)
+        interp.call("ShiftRows", round1)
+        interp.call("MixColumns", round1)
+        interp.call("AddRoundKey", round1, skey, 8)
+        assert words(round1) == rec[17:25]
+
+        interp.call("AesCtBitSliceEncrypt", num_rounds, skey, q)
+        interp.call("AesCtOrtho", q)
+        assert words(q) == rec[25:33]
+
+        interp.call("AesCtOrtho", q)
+        interp.call("AesCtBitSliceDecrypt", num_rounds, skey, q)
+        interp.call("AesCtOrtho", q)
+        assert words(q) == rec[1:9]
+
+
+def test_uscript_fips_197(interp: Interpreter):
+    key = bytes.fromhex(FIPS_197[0][0])
+    comp: list[int] = []
+    num_rounds = interp.call("AesCtKeySched", comp, list(key), len(key))
+    skey: list[int] = []
+    interp.call("AesCtSKeyExpand", skey, num_rounds, comp)
+    q = words(aes_ct.load_blocks(np.frombuffer(bytes.fromhex(PLAINTEXT) * 2, np.uint8)))
+    interp.call("AesCtOrtho", q)
+    interp.call("AesCtBitSliceEncrypt", num_rounds, skey, q)
+    interp.call("AesCtOrtho", q)
+    ct = aes_ct.store_blocks(np.array([words(q)], dtype=np.uint32))
+    assert ct[0].tobytes().hex() == FIPS_197[0][1]
+    assert ct[1].tobytes().hex() == FIPS_197[0][1]
+
+
+def test_benchmark():
+    rates = aes_ct.benchmark(64, repeat=1)
+    assert set(rates) == {16, 24, 32}
+    assert all(rate > 0 for rate in rates.values())
@@ -0,0 +1,104 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the microbenchmark mutator generator."""
+
+import re
+
+import pytest
+
+import bench_codegen
+from bench_codegen import BenchCase
+from bench_codegen import SpecError
+from uscript_eval import Interpreter
+
+
+def test_generated_file_is_up_to_date():
+    assert bench_codegen.DEFAULT_OUTPUT.read_text() == \
+           bench_codegen.generate(bench_codegen.DEFAULT_SPEC)
+
+
+def test_expand():
+    cases = bench_codegen.expand({
+        "iterations": 10,
+        "matrix": [
+            {"op": ["read", "xor"], "kind": "static", "size": [4, 8], "mode": "call"},
+            {"op": "read", "kind": "static", "size": 4, "mode": "call",
+             "iterations": 99, "repeat": 2},
+        ],
+    })
+    assert len(cases) == 4
+    assert cases[0] == BenchCase("read", "static", 4, "call", 99, 2)
+    assert cases[1] == BenchCase("read", "static", 8, "call", 10, 1)
+    assert cases[0].name == "Bench_Read_S4_Call"
+    assert cases[0].helper == "Read_S4"
+
+
+@pytest.mark.parametrize("entry", [
+    {"op": "add", "kind": "static", "size": 4, "mode": "call"},
+    {"op": "read", "kind": "packed", "size": 4, "mode": "call"},
+    {"op": "read", "kind": "static", "size": 0, "mode": "call"},
+    {"op": "read", "kind": "static", "size": 4, "mode": "unrolled"},
+    {"op": "read", "kind": "static", "size": 4},
+    {"op": "read", "kind": "static", "size": 4, "mode": "call", "iterations": 0},
+])
+def test_invalid_spec(entry: dict):
+    with pytest.raises(SpecError):
+        bench_codegen.expand({"iterations": 10, "matrix": [entry]})
+    with pytest.raises(SpecError):
+        bench_codegen.expand({"iterations": 10, "matrix": []})
+
+
+def test_output_lines():
+    spec = {
+        "iterations": 7,
+        "repeat": 2,
+        "matrix": [{"op": "copy", "kind": ["static", "dynamic"], "size": 3, "mode": "inline"}],
+    }
+    source = bench_codegen.generate(spec)
+    assert re.findall(r'fclog\(("BENCH\|[^"]*")', source) == [
+        '"BENCH|copy|static|3|inline|7|"',
+        '"BENCH|copy|dynamic|3|inline|7|"',
+    ]
+    assert "local int A[3];" in source
+    assert "A.Length = 3;" in source
+    # Only called cases get helpers.
+    assert "Copy_S3(" not in source
+
+
+@pytest.mark.parametrize("kind", ["static", "dynamic"])
+def test_helpers(kind: str):
+    spec = {
+        "iterations": 1,
+        "matrix": [{"op": list(bench_codegen.OPS), "kind": kind, "size": 4, "mode": "call"}],
+    }
+    interp = Interpreter(bench_codegen.generate(spec))
+    suffix = f"{kind[0].upper()}4"
+    a, b = [1, 2, 3, 4], [8, 8, 8, 8]
+    assert interp.call(f"Noop_{suffix}", a, b) == 0
+    assert interp.call(f"Read_{suffix}", a, b) == 10
+    interp.call(f"Xor_{suffix}", a, b)
+    assert a == [9, 10, 11, 12]
+    interp.call(f"Copy_{suffix}", a, b)
+    assert b == a
+    interp.call(f"Write_{suffix}", a, b)
+    assert a == [0, 1, 2, 3]
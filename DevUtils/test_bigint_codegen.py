@@ -0,0 +1,122 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for FCryptoBigInt static array specialization generator."""
+
+import pytest
+
+import bigint_codegen as bc
+
+SOURCE = """
+// @specialize Fill_Static8(S[8])
+static final function Fill(
+    out array<int> S,
+    int C
+)
+{
+    local int I;
+
+    if (S.Length < 8)
+    {
+        S.Length = 8;
+    }
+
+    for (I = 0; I < S.Length; ++I)
+    {
+        S[I] = C;
+    }
+}
+
+// @specialize Window_S8_Dyn(X[8], T1[8])
+// @specialize Window_Dyn_S8(Y[8])
+static final function int Window(
+    out array<int> X,
+    const out array<int> Y
+)
+{
+    local array<int> T1;
+
+    Fill(T1, 0);
+    Fill(X, Y[0]);
+    return class'FCryptoBigInt'.static.Fill(X, 1);
+}
+"""
+
+
+def test_generated_file_is_up_to_date():
+    generated = bc.generate(bc.DEFAULT_SOURCE.read_text())
+    assert bc.DEFAULT_OUTPUT.read_text() == generated
+
+
+def test_generated_contains_all_annotations():
+    source = bc.DEFAULT_SOURCE.read_text()
+    generated = bc.generate(source)
+    functions = bc.parse_functions(source)
+    for func in functions.values():
+        for spec in func.specializations:
+            assert f"function {spec.name}(" in generated \
+                   or f"function int {spec.name}(" in generated
+
+
+def test_static_params_and_resize_removal():
+    generated = bc.generate(SOURCE)
+    assert "static final function Fill_Static8(\n    out int S[8]," in generated
+    assert "S.Length = 8;" not in generated
+    assert "I < ArrayCount(S);" in generated
+    assert "\n\n\n" not in generated
+
+
+def test_static_locals_and_call_redirection():
+    generated = bc.generate(SOURCE)
+    window_s8_dyn = generated[generated.index("function int Window_S8_Dyn("):]
+    window_s8_dyn = window_s8_dyn[:window_s8_dyn.index("\n}\n")]
+    assert "local int T1[8];" in window_s8_dyn
+    assert "Fill_Static8(T1, 0);" in window_s8_dyn
+    assert "Fill_Static8(X, Y[0]);" in window_s8_dyn
+    # Calls through class references are left alone.
+    assert "class'FCryptoBigInt'.static.Fill(X, 1);" in window_s8_dyn
+
+    window_dyn_s8 = generated[generated.index("function int Window_Dyn_S8("):]
+    assert "const out int Y[8]" in window_dyn_s8
+    assert "Fill(T1, 0);" in window_dyn_s8
+
+
+def test_missing_specialization_is_an_error():
+    source = SOURCE.replace("// @specialize Fill_Static8(S[8])\n", "")
+    source = source.replace("static final function Fill(", (
+        "// @specialize Fill_Static4(S[4])\n"
+        "static final function Fill("
+    ))
+    with pytest.raises(bc.CodegenError, match="no specialization of Fill"):
+        bc.generate(source)
+
+
+def test_unknown_array_is_an_error():
+    source = SOURCE.replace("Fill_Static8(S[8])", "Fill_Static8(Q[8])")
+    with pytest.raises(bc.CodegenError, match="'Q' is not an array"):
+        bc.generate(source)
+
+
+def test_static_array_assignment_is_an_error():
+    source = SOURCE.replace("Fill(T1, 0);", "T1 = X;")
+    with pytest.raises(bc.CodegenError, match="cannot be assigned"):
+        bc.generate(source)
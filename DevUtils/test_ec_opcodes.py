@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the FCryptoEC_Prime opcode interpreter and compiler."""
+
+import random
+
+import pytest
+
+import ec_math
+import ec_opcodes
+import i15
+
+OPS = {name: ec_opcodes.program_ops(p) for name, p in ec_opcodes.PROGRAMS.items()}
+
+
+def test_code_arrays_match_reference_programs():
+    source = ec_opcodes.DEFAULT_SOURCE.read_text()
+    arrays = ec_opcodes.parse_code_arrays(source)
+    for name, ops in OPS.items():
+        assert ec_opcodes.decode_program(arrays[name]) == ops
+
+
+def test_opcode_encoding():
+    op = ec_opcodes.MMUL("T1", "Pz", "Pz")
+    assert op.encode() == 13858
+    assert ec_opcodes.Op.decode(13858) == op
+    assert str(op) == "MMUL(T1, P1z, P1z)"
+    assert ec_opcodes.MTZ("T4").encode() == 0x5900
+    with pytest.raises(ValueError):
+        ec_opcodes.Op.decode(0x6000)
+    with pytest.raises(ValueError):
+        ec_opcodes.Op.decode(0x3D00)
+
+
+@pytest.mark.parametrize("curve", ec_math.WEIERSTRASS_CURVES.values())
+def test_programs_match_reference_curve(curve: ec_math.WeierstrassCurve):
+    ec_opcodes.validate(curve, 2, random.Random(curve.bits))
+
+
+def test_compiled_double_with_aliased_operands():
+    curve = ec_math.P256
+    cc = ec_opcodes.CurveParams.from_curve(curve)
+    rng = random.Random(1)
+    a = curve.mul(rng.randrange(1, curve.n), curve.generator)
+    p = ec_opcodes.to_jacobian(curve, a, rng.randrange(1, curve.p), cc)
+    _, expected = ec_opcodes.interpret(OPS["Double"], p, p, cc)
+    func = ec_opcodes.compile_program("Double", OPS["Double"])
+    assert not func.uses_p2
+    _, actual = ec_opcodes.execute(func, p, None, cc)
+    assert actual == expected
+    assert ec_opcodes.from_jacobian(curve, actual, cc) == curve.double(a)
+
+
+def test_compiled_add_with_aliased_operands():
+    # PointAdd(P, P) must behave like RunCode, which copies both
+    # operands before writing P1.
+    curve = ec_math.P384
+    cc = ec_opcodes.CurveParams.from_curve(curve)
+    rng = random.Random(2)
+    a = curve.mul(rng.randrange(1, curve.n), curve.generator)
+    p = ec_opcodes.to_jacobian(curve, a, rng.randrange(1, curve.p), cc)
+    expected = ec_opcodes.interpret(OPS["Add"], p, p, cc)
+    func = ec_opcodes.compile_program("Add", OPS["Add"])
+    r, actual = ec_opcodes.execute(func, p, p, cc)
+    assert (r, actual) == expected
+    assert r == 0
+
+
+def test_compiler_removes_register_copies():
+    funcs = {name: ec_opcodes.compile_program(name, ops) for name, ops in OPS.items()}
+    assert funcs["Add"].num_copies == 0
+    for name, func in funcs.items():
+        assert func.num_temps <= 7
+        assert len(func.instrs) <= len(OPS[name]) + 3
+        assert all(i.kind != "copy" or i.srcs[0] != i.dst for i in func.instrs)
+
+
+def test_compiler_rejects_invalid_programs():
+    with pytest.raises(ValueError):
+        ec_opcodes.compile_program("X", [ec_opcodes.MMUL("T1", "T1", "Px")])
+    with pytest.raises(ValueError):
+        ec_opcodes.compile_program("X", [ec_opcodes.MADD("Px", "T2")])
+
+
+def test_mtz_clears_flag_only_for_zero():
+    curve = ec_math.P256
+    cc = ec_opcodes.CurveParams.from_curve(curve)
+    zero = i15.to_words(0, cc.m[0])
+    one = i15.to_words(1, cc.m[0])
+    program = [ec_opcodes.MTZ("Px")]
+    func = ec_opcodes.compile_program("Tz", program)
+    for x, flag in ((zero, 0), (one, 1)):
+        p = [x, one, one]
+        assert ec_opcodes.interpret(program, p, p, cc)[0] == flag
+        assert ec_opcodes.execute(func, p, None, cc)[0] == flag
+
+
+def test_generated_file_is_up_to_date():
+    source = ec_opcodes.DEFAULT_SOURCE.read_text()
+    assert ec_opcodes.DEFAULT_OUTPUT.read_text() == ec_opcodes.generate(source)
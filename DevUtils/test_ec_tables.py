@@ -0,0 +1,126 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the i15 model, reference curve arithmetic
+and the fixed-base EC table generator.
+"""
+
+import math
+import random
+import re
+
+import pytest
+
+import ec_math
+import ec_tables
+import i15
+
+MACROS_FILE = ec_tables.CLASSES_DIR / "FCryptoEllipticCurveMacros.uci"
+
+
+def parse_macro_values(text: str, name: str) -> list[int]:
+    match = re.search(rf"`define {name}\s*\\\n(.*?)(?:\n\n|\Z)", text, re.DOTALL)
+    assert match, name
+    values = match.group(1).replace("\\", "").replace("\n", " ")
+    return [int(v, 16) for v in values.split(",")]
+
+
+@pytest.mark.parametrize("curve", ec_math.WEIERSTRASS_CURVES.values())
+def test_i15_matches_curve_macros(curve: ec_math.WeierstrassCurve):
+    macros = MACROS_FILE.read_text()
+    m = i15.to_words(curve.p, curve.i15_header)
+    assert parse_macro_values(macros, f"{curve.name}_P_VALUES") == m
+    assert parse_macro_values(macros, f"{curve.name}_R2_VALUES") == i15.r2_mod(m)
+    assert parse_macro_values(macros, f"{curve.name}_B_VALUES") == \
+           i15.to_monty(curve.b, m)
+    assert i15.from_words(m) == curve.p
+    assert i15.encode_bit_length(curve.bits) == curve.i15_header
+    assert i15.ninv15(m[1]) == 1
+
+
+def test_i15_decode():
+    rng = random.Random(0)
+    for n in range(1, 40):
+        src = rng.randbytes(n)
+        words = i15.decode(src)
+        x = int.from_bytes(src, "big")
+        assert i15.from_words([i15.encode_bit_length(n * 8)] + words[1:]) == x
+        assert i15.decode_bit_length(words[0]) == x.bit_length()
+        assert len(words) - 1 == math.ceil((n * 8) / 15)
+
+
+def test_i15_ninv15():
+    for x in range(1, 1 << 15, 2):
+        assert (x * i15.ninv15(x)) & 0x7FFF == 0x7FFF
+
+
+def test_x25519_rfc7748():
+    k = bytes.fromhex(
+        "a546e36bf0527c9d3b16154b82465edd62144c0ac1fc5a18506a2244ba449ac4")
+    u = bytes.fromhex(
+        "e6db6867583030db3594c1a424b15f7c726624ec26b3353b10a903a6d0ab1c4c")
+    assert ec_math.x25519(k, u).hex() == (
+        "c3da55379de9c6908e94ea4df28d084f32eccf03491c71f754b4075577a28552")
+
+
+def test_ed25519_base_maps_to_x25519_base():
+    assert ec_math.ed25519_to_montgomery_u(ec_math.ED25519_BASE) == 9
+
+
+@pytest.mark.parametrize("teeth", [4, 5])
+def test_weierstrass_tables(teeth: int):
+    curve = ec_math.P256
+    table = ec_tables.weierstrass_table(curve, teeth)
+    bits = curve.n.bit_length()
+    rng = random.Random(teeth)
+    for k in [1, 2, curve.n - 1] + [rng.randrange(1, curve.n) for _ in range(4)]:
+        q = ec_tables.comb_mul(
+            table, k, teeth, math.ceil(bits / teeth), None, curve.add)
+        assert q == curve.mul(k, curve.generator)
+
+
+def test_weierstrass_entry_words():
+    curve = ec_math.P256
+    m = i15.to_words(curve.p, curve.i15_header)
+    words = ec_tables.weierstrass_entry_words(curve, curve.generator)
+    half = len(words) // 2
+    assert (i15.from_monty(words[:half], m), i15.from_monty(words[half:], m)) \
+           == curve.generator
+
+
+def test_ed25519_comb_table_gives_x25519_public_keys():
+    table = ec_tables.ed25519_table(4)
+    spacing = math.ceil(ec_math.C25519_ORDER.bit_length() / 4)
+    rng = random.Random(25519)
+    for _ in range(4):
+        sk = rng.randbytes(32)
+        k = ec_math.x25519_clamp(sk) % ec_math.C25519_ORDER
+        q = ec_tables.comb_mul(table, k, 4, spacing, (0, 1), ec_math.ed25519_add)
+        u = ec_math.ed25519_to_montgomery_u(q)
+        assert u.to_bytes(32, "little") == ec_math.x25519(sk, ec_math.X25519_BASE_U)
+
+
+def test_generated_tables_are_up_to_date():
+    assert ec_tables.PRIME_TABLES_OUT.read_text() == \
+           ec_tables.generate_prime_tables(["P256"], 4)
+    assert ec_tables.C25519_TABLES_OUT.read_text() == \
+           ec_tables.generate_c25519_tables(4)
@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the GMP test utility server transaction parser."""
+
+import socket
+import threading
+
+import gmpy2
+import pytest
+
+import gmp_server
+from gmp_server import ParseError
+from gmp_server import Transaction
+from gmp_server import TransactionParser
+
+BIG = "ab" * 4096
+
+LINES = (
+    b"T1 [var a '0a'] [var b 'ff'] [op mpz_add c a b]\n"
+    b"  T22\t[var x ''] [op nop y x x]  \r\n"
+    b"T3 [var s '" + BIG.encode() + b"'] junk [op mpz_mul r s s]\n"
+)
+
+EXPECTED = [
+    Transaction("1", {"a": gmpy2.mpz(10), "b": gmpy2.mpz(255)},
+                [["mpz_add", "c", "a", "b"]]),
+    Transaction("22", {"x": gmpy2.mpz(0)}, [["nop", "y", "x", "x"]]),
+    Transaction("3", {"s": gmpy2.mpz(BIG, 16)}, [["mpz_mul", "r", "s", "s"]]),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 100, 4096, len(LINES)])
+def test_chunked(chunk_size: int):
+    parser = TransactionParser()
+    out = []
+    for i in range(0, len(LINES), chunk_size):
+        out += parser.feed(LINES[i:i + chunk_size])
+    assert out == EXPECTED
+    assert not parser.closed
+    # Only incomplete input is buffered.
+    assert len(parser._buf) == 0
+
+
+def test_max_line_size():
+    parser = TransactionParser(max_line_size=64)
+    line = b"T1 [var a '" + b"f" * 100 + b"'] [op nop b a a]\n"
+    out = []
+    for i in range(0, len(line), 10):
+        out += parser.feed(line[i:i + 10])
+    assert len(out) == 1 and isinstance(out[0], ParseError)
+    assert len(parser._buf) == 0
+    # The next line is parsed normally.
+    assert parser.feed(b"T2 [var a '1'] [op nop b a a]\n") == [
+        Transaction("2", {"a": gmpy2.mpz(1)}, [["nop", "b", "a", "a"]])]
+
+
+@pytest.mark.parametrize("line", [
+    b"X1 [op nop a b c]\n",
+    b"T1\n",
+    b"T1 [var a 'xyz'] [op nop b a a]\n",
+    b"T1 [op nop]\n",
+    b"T1 ab [var] [op mpz_add c T1 T1]\n",
+    b"T1 [op]\n",
+])
+def test_invalid(line: bytes):
+    parser = TransactionParser()
+    out = parser.feed(line + b"T2 [op nop a b c]\n")
+    assert isinstance(out[0], ParseError)
+    assert out[1] == Transaction("2", {}, [["nop", "a", "b", "c"]])
+
+
+def test_empty_line_closes():
+    parser = TransactionParser()
+    assert parser.feed(b"T1 [op nop a b c]\n  \r\nT2 [op nop a b c]\n") == [
+        Transaction("1", {}, [["nop", "a", "b", "c"]])]
+    assert parser.closed
+    assert parser.feed(b"T3 [op nop a b c]\n") == []
+
+
+def test_server():
+    server = gmp_server.TCPServer(("127.0.0.1", 0), gmp_server.GMPTCPHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.create_connection(server.server_address) as sock:
+            sock.sendall(
+                b"T1 [var a '" + BIG.encode() + b"'] [var b '2'] [op mpz_mul c a b]\n"
+                b"T2 [var a 'nothex'] [op nop b a a]\n"
+                b"\n"
+            )
+            data = b""
+            while chunk := sock.recv(65536):
+                data += chunk
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert data.decode().splitlines() == [
+        f"1 c {(gmpy2.mpz(BIG, 16) * 2).digits(16)}",
+        "SERVER_ERROR",
+    ]
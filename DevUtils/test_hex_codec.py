@@ -0,0 +1,111 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the hex codec tables and the legacy and table-driven
+codec models.
+"""
+
+import itertools
+import random
+import re
+
+import pytest
+
+import hex_codec
+from hex_codec import LegacyCodec
+from hex_codec import TableCodec
+
+# The last two characters alias "0" and "A" in the low byte
+# of their character codes.
+CHARS = "09afAFgG :\u0130\u0441"
+
+
+def parse_macro_values(text: str, name: str) -> list[str]:
+    m = re.search(rf"`define {name}_VALUES\s*\\\n(.*?)(?:\n\n|\Z)", text, re.S)
+    assert m, name
+    return [v.strip() for v in m.group(1).replace("\\", "").split(",")]
+
+
+def test_generated_file_is_up_to_date():
+    assert hex_codec.DEFAULT_OUTPUT.read_text() == hex_codec.generate()
+
+
+def test_tables():
+    text = hex_codec.DEFAULT_OUTPUT.read_text()
+    hi = [int(v, 16) for v in parse_macro_values(text, "HEX_DECODE_HI")]
+    lo = [int(v, 16) for v in parse_macro_values(text, "HEX_DECODE_LO")]
+    enc = [v.strip('"') for v in parse_macro_values(text, "HEX_ENCODE")]
+    assert hi == hex_codec.decode_hi_table()
+    assert lo == hex_codec.decode_lo_table()
+    assert enc == hex_codec.encode_table()
+    for c in range(256):
+        ch = chr(c)
+        if ch in "0123456789abcdefABCDEF":
+            assert lo[c] == int(ch, 16)
+            assert hi[c] == int(ch, 16) << 4
+        else:
+            assert lo[c] == hi[c] == hex_codec.INVALID
+    assert enc[0x0A] == "0A"
+
+
+@pytest.mark.parametrize("length", range(4))
+def test_from_hex(length: int):
+    for chars in itertools.product(CHARS, repeat=length):
+        s = "".join(chars)
+        assert LegacyCodec().from_hex(s) == TableCodec().from_hex(s), s
+    for s in ("DEADBEEF", "7fffffff", "123456789"):
+        assert LegacyCodec().from_hex(s) == TableCodec().from_hex(s)
+    assert TableCodec().from_hex("FFFFFFFF") == (True, -1)
+
+
+def test_bytes_from_hex():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randrange(0, 40)
+        s = "".join(rng.choice("0123456789abcdefABCDEF") for _ in range(n))
+        if rng.random() < 0.3 and n:
+            i = rng.randrange(n)
+            s = s[:i] + rng.choice(CHARS[6:]) + s[i + 1:]
+        ok, expected = LegacyCodec().bytes_from_hex(s)
+        table_ok, result = TableCodec().bytes_from_hex(s)
+        assert ok == table_ok, s
+        if ok:
+            assert result == expected == list(bytes.fromhex(s.zfill(n + n % 2)))
+
+
+@pytest.mark.parametrize("size", [0, 1, 3, 4, 31, 32, 33, 100])
+@pytest.mark.parametrize("delimiter", ["", " ", ", "])
+def test_bytes_to_hex(size: int, delimiter: str):
+    data = [(b * 37) & 0xFF for b in range(size)]
+    expected = delimiter.join(f"{b:02X}" for b in data)
+    assert LegacyCodec().bytes_to_hex(data, delimiter) == expected
+    assert TableCodec().bytes_to_hex(data, delimiter) == expected
+
+
+def test_compare():
+    rows = hex_codec.compare((32, 256))
+    for row in rows:
+        assert row.table.calls < row.legacy.calls
+        assert row.table.chars < row.legacy.chars
+        assert row.table.ops < row.legacy.ops
+    lines = hex_codec.format_comparison(rows)
+    assert len(lines) == len(rows) + 1
@@ -0,0 +1,210 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the ECDHE key exchange service. A stand-in client does
+the client side of the exchange with the ec_math reference arithmetic.
+"""
+
+import asyncio
+import json
+import secrets
+
+import pytest
+
+import ec_math
+import kex_server
+from kex_server import KexServer
+from kex_server import SessionCache
+
+
+class StandInClient:
+    """Client side of the protocol, like an FCrypto game server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._next_id = 0
+
+    def key_pair(self, curve: str) -> tuple[object, bytes]:
+        if curve == kex_server.CURVE25519:
+            k = secrets.token_bytes(32)
+            return k, ec_math.x25519(k, ec_math.X25519_BASE_U)
+        d = secrets.randbelow(ec_math.P256.n - 1) + 1
+        public = ec_math.P256.mul(d, ec_math.P256.generator)
+        assert public is not None
+        return d, ec_math.P256.encode_point(public)
+
+    @staticmethod
+    def shared(curve: str, private, server_public: bytes) -> bytes:
+        if curve == kex_server.CURVE25519:
+            return ec_math.x25519(private, server_public)
+        pt = ec_math.P256.mul(private, ec_math.P256.decode_point(server_public))
+        assert pt is not None
+        return pt[0].to_bytes(32, "big")
+
+    async def request(self, lines: list[str]) -> dict[str, list[str]]:
+        """Send pipelined requests, return the responses by id."""
+        ids = []
+        for line in lines:
+            ids.append(f"T{self._next_id}")
+            self.writer.write(f"{ids[-1]} {line}\n".encode())
+            self._next_id += 1
+        await self.writer.drain()
+        responses: dict[str, list[str]] = {}
+        while len(responses) < len(ids):
+            parts = (await self.reader.readline()).decode().split()
+            responses[parts[0]] = parts[1:]
+        return {i: responses[i] for i in ids}
+
+    async def exchange(self, curve: str, count: int) -> list[tuple[bytes, bytes]]:
+        """Run count concurrent exchanges, return (session id, key) pairs."""
+        pairs = [self.key_pair(curve) for _ in range(count)]
+        responses = await self.request(
+            [f"KEX {curve} {public.hex()}" for _, public in pairs])
+        sessions = []
+        for (private, public), (server_hex, session_hex) in zip(pairs, responses.values()):
+            server_public = bytes.fromhex(server_hex)
+            shared = self.shared(curve, private, server_public)
+            session_id, key = kex_server.derive_session(curve, public, server_public, shared)
+            assert session_id.hex() == session_hex
+            sessions.append((session_id, key))
+        return sessions
+
+
+def run_with_server(test, **kwargs):
+    async def main():
+        kex = KexServer(**kwargs)
+        server = await kex.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            await test(kex, StandInClient(reader, writer))
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("curve", kex_server.CURVES)
+def test_exchange(curve: str):
+    async def test(kex: KexServer, client: StandInClient):
+        sessions = await client.exchange(curve, 5)
+        for session_id, key in sessions:
+            assert kex.session_key(session_id) == key
+        assert len({key for _, key in sessions}) == 5
+        assert kex.stats.batches < 5
+
+    run_with_server(test, max_batch=4, max_delay=0.05)
+
+
+def test_errors():
+    async def test(kex: KexServer, client: StandInClient):
+        responses = await client.request([
+            "KEX Curve448 " + "00" * 32,
+            "KEX Curve25519 zz",
+            "KEX Curve25519 " + "00" * 31,
+            "KEX Curve25519 " + "00" * 32,
+            "KEX Secp256r1 04" + "00" * 64,
+            "NOPE",
+        ])
+        for parts in responses.values():
+            assert parts[0] == "SERVER_ERROR"
+        # The connection still works after errors.
+        assert len(await client.exchange(kex_server.CURVE25519, 1)) == 1
+        stats = json.loads((await client.request(["STATS"]))["T7"][0])
+        assert stats["requests"] == 7
+        assert stats["errors"] == 6
+        assert stats["sessions"] == 1
+        assert stats["latency_p99_ms"] > 0
+
+    run_with_server(test)
+
+
+def test_non_ascii_request():
+    async def test(kex: KexServer, client: StandInClient):
+        _, public = client.key_pair(kex_server.CURVE25519)
+        kex_line = f"KEX {kex_server.CURVE25519} {public.hex()}".encode()
+        client.writer.write(b"1 " + kex_line + b"\n2\xff STATS\n3 " + kex_line + b"\n")
+        await client.writer.drain()
+        responses = []
+        for _ in range(3):
+            line = await asyncio.wait_for(client.reader.readline(), timeout=10)
+            responses.append(line.decode().split())
+        assert sorted(r[0] for r in responses) == ["1", "3", "SERVER_ERROR"]
+        assert ["SERVER_ERROR", "non-ASCII", "request"] in responses
+
+    run_with_server(test)
+
+
+def test_exchange_batch_matches_reference():
+    keys = [secrets.token_bytes(32) for _ in range(3)]
+    clients = [ec_math.x25519(k, ec_math.X25519_BASE_U) for k in keys]
+    results = kex_server.exchange_batch(kex_server.CURVE25519, clients)
+    for k, (server_public, shared) in zip(keys, results):
+        assert ec_math.x25519(k, server_public) == shared
+
+
+def test_batch_inverse():
+    p = ec_math.P256.p
+    values = [3, 0, p - 1, 12345, p]
+    assert ec_math.batch_inverse(values, p) == [
+        pow(3, -1, p), 0, pow(p - 1, -1, p), pow(12345, -1, p), 0]
+
+
+def test_mul_batch():
+    curve = ec_math.P256
+    g = curve.generator
+    jobs = [(1, g), (2, g), (curve.n, g), (12345, curve.mul(7, g))]
+    assert curve.mul_batch(jobs) == [curve.mul(k, pt) for k, pt in jobs]
+
+
+def test_hkdf_rfc5869():
+    okm = kex_server.hkdf_sha256(
+        bytes([0x0b] * 22),
+        bytes(range(13)),
+        bytes(range(0xf0, 0xfa)),
+        42,
+    )
+    assert okm.hex() == (
+        "3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c5db02d56ecc4c5bf"
+        "34007208d5b887185865")
+
+
+def test_session_cache():
+    now = 0.0
+    cache = SessionCache(max_size=3, ttl=10.0, clock=lambda: now)
+    for i in range(4):
+        cache.put(bytes([i]), b"key%d" % i)
+        now += 1.0
+    assert cache.get(b"\x00") is None
+    assert cache.evicted == 1
+    assert cache.get(b"\x01") == b"key1"
+    assert len(cache) == 3
+
+    now = 12.5
+    assert cache.get(b"\x01") is None
+    cache.purge()
+    assert len(cache) == 1
+    assert cache.get(b"\x03") == b"key3"
+    assert cache.expired == 2
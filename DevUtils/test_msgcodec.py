@@ -0,0 +1,127 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the [HEADER | DATA | HMAC] message codec."""
+
+import concurrent.futures
+import hashlib
+import hmac
+
+import pytest
+
+import msgcodec
+from msgcodec import Frame
+from msgcodec import MessageError
+from msgcodec import VerifyError
+
+KEY = bytes(range(32))
+
+
+def test_layout():
+    msg = msgcodec.encode(KEY, b"hello", sequence=0x01020304, flags=7)
+    assert bytes(msg[:12]) == b"FC\x01\x07\x01\x02\x03\x04\x00\x00\x00\x05"
+    assert bytes(msg[12:17]) == b"hello"
+    assert bytes(msg[17:]) == hmac.new(KEY, msg[:17], hashlib.sha256).digest()
+    assert len(msg) == msgcodec.encoded_size(5)
+
+
+@pytest.mark.parametrize("data", [b"", b"x", bytes(range(256)) * 20])
+def test_roundtrip(data: bytes):
+    msg = msgcodec.encode(KEY, data, sequence=42, flags=1)
+    frame = msgcodec.decode(KEY, msg)
+    assert frame.sequence == 42
+    assert frame.flags == 1
+    assert frame.data == data
+    assert frame.size == len(msg)
+
+
+def test_decode_does_not_copy():
+    msg = msgcodec.encode(KEY, b"abcd", sequence=1)
+    frame = msgcodec.decode(KEY, msg)
+    assert frame.data.obj is msg
+    msg[12] = ord("z")
+    assert bytes(frame.data) == b"zbcd"
+
+
+def test_verify():
+    msg = msgcodec.encode(KEY, b"payload", sequence=1)
+    for i in range(len(msg)):
+        bad = bytearray(msg)
+        bad[i] ^= 0x80
+        with pytest.raises(MessageError):
+            msgcodec.decode(KEY, bad)
+    with pytest.raises(VerifyError):
+        msgcodec.decode(bytes(32), msg)
+    assert msgcodec.decode(bytes(32), msg, verify=False).data == b"payload"
+
+
+@pytest.mark.parametrize("msg", [
+    b"",
+    b"FC\x01\x00",
+    msgcodec.encode(KEY, b"abc", 0)[:-1],
+    msgcodec.encode(KEY, b"abc", 0) + b"\x00",
+    b"XX" + msgcodec.encode(KEY, b"abc", 0)[2:],
+    b"FC\x02" + msgcodec.encode(KEY, b"abc", 0)[3:],
+])
+def test_malformed(msg: bytes):
+    with pytest.raises(MessageError):
+        msgcodec.decode(KEY, msg)
+
+
+def test_stream():
+    buf = bytearray(sum(msgcodec.encoded_size(n) for n in range(5)))
+    offset = 0
+    for n in range(5):
+        offset = msgcodec.encode_into(KEY, buf, offset, bytes([n]) * n, sequence=n)
+    assert offset == len(buf)
+    frames = list(msgcodec.iter_frames(KEY, buf))
+    assert [(f.sequence, bytes(f.data)) for f in frames] == [
+        (n, bytes([n]) * n) for n in range(5)
+    ]
+    with pytest.raises(MessageError):
+        msgcodec.encode_into(KEY, buf, offset - 1, b"", sequence=0)
+
+
+@pytest.mark.parametrize("workers", [None, 3])
+def test_decode_batch(workers: int | None):
+    msgs = [msgcodec.encode(KEY, f"msg {i}".encode(), i) for i in range(100)]
+    msgs[13][-1] ^= 1
+    msgs[77] = msgs[77][:-1]
+    if workers is None:
+        result = msgcodec.decode_batch(KEY, msgs)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            result = msgcodec.decode_batch(KEY, msgs, pool, chunk_size=7)
+    assert len(result) == len(msgs)
+    assert isinstance(result[13], VerifyError)
+    assert isinstance(result[77], MessageError)
+    for i, frame in enumerate(result):
+        if i not in (13, 77):
+            assert isinstance(frame, Frame)
+            assert frame.sequence == i
+            assert frame.data == f"msg {i}".encode()
+
+
+def test_benchmark():
+    result = msgcodec.benchmark([16], count=10, workers=2, repeat=1)
+    assert [t.name for t in result] == ["encode", "decode", "decode x2"]
+    assert all(t.megabytes_per_second > 0 for t in result)
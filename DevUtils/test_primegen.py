@@ -0,0 +1,89 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the parallel incremental prime table generator."""
+
+import gmpy2
+import pytest
+
+import primegen
+
+
+def test_parse_schedule():
+    assert primegen.parse_schedule("2-3:2,8:1") == [
+        (2, 0), (2, 1), (3, 0), (3, 1), (8, 0),
+    ]
+    assert len(primegen.parse_schedule(primegen.DEFAULT_SCHEDULE)) == 1270
+    with pytest.raises(ValueError):
+        primegen.parse_schedule("1-4:2")
+    with pytest.raises(ValueError):
+        primegen.parse_schedule("16")
+
+
+def test_rand_prime_constraints():
+    rng = gmpy2.random_state(1234)
+    for bits in range(2, 80):
+        x = primegen.rand_prime(rng, bits)
+        assert x.bit_length() == bits
+        assert gmpy2.is_prime(x, 50)
+        assert (x - 1) % 65537 != 0
+
+
+def test_generate_is_deterministic_and_incremental():
+    schedule = primegen.parse_schedule("16-20:3")
+    cache: dict[str, str] = {}
+    first = list(primegen.generate(schedule, 7, cache, workers=2))
+    assert len(cache) == len(schedule)
+    assert [(s, i) for s, i, _ in first] == schedule
+    for size, _, x in first:
+        assert int(x, 16).bit_length() == size
+
+    # Entries are keyed by (size, index, seed), growing the
+    # schedule keeps the existing entries as they were.
+    grown = primegen.parse_schedule("16-20:4")
+    second = list(primegen.generate(grown, 7, cache, workers=2))
+    assert len(cache) == len(grown)
+    assert set(first) <= set(second)
+
+    # Cached entries are not regenerated, even if they are bogus.
+    cache[primegen.cache_key(16, 0, 7)] = "ffff"
+    third = list(primegen.generate(grown, 7, cache, workers=2))
+    assert third[0] == (16, 0, "ffff")
+
+    assert primegen.generate_entry(16, 1, 7) == second[1][2]
+    assert primegen.generate_entry(16, 1, 8) != second[1][2]
+
+
+def test_generate_overlapping_schedule():
+    schedule = primegen.parse_schedule("30:1,29-30:2")
+    assert schedule.count((30, 0)) == 2
+    cache: dict[str, str] = {}
+    entries = list(primegen.generate(schedule, 0, cache, workers=2))
+    assert [(s, i) for s, i, _ in entries] == schedule
+    for size, index, x in entries:
+        assert x == primegen.generate_entry(size, index, 0)
+    assert cache[primegen.cache_key(30, 1, 0)] == primegen.generate_entry(30, 1, 0)
+
+
+def test_hex_to_spaced_bytes():
+    assert primegen.hex_to_spaced_bytes("3") == "03"
+    assert primegen.hex_to_spaced_bytes("10d") == "01 0D"
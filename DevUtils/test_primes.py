@@ -0,0 +1,69 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for UnrealScript prime table generation."""
+
+import re
+from pathlib import Path
+
+import i15
+import primes
+
+SCRIPT_DIR = Path(__file__).parent
+PRIMES_OUT = SCRIPT_DIR / "primes_out.txt"
+TEST_MUTATOR = SCRIPT_DIR / "../Classes/FCryptoTestMutator.uc"
+
+PRIME_RE = re.compile(
+    r"Primes\((\d+)\)=\(P=\(([\d,]+)\),M=\(([\d,]+)\),M0I=(\d+),R2=\(([\d,]+)\)\)")
+
+
+def ints(values: str) -> list[int]:
+    return [int(v) for v in values.split(",")]
+
+
+def test_prime_to_uscript_modes():
+    assert primes.prime_to_uscript(0, "03", "bytes") == "    Primes(0)=(P=(3))"
+    assert primes.prime_to_uscript(1, "01 0D", "i15") == \
+           "    Primes(1)=(M=(9,269,0),M0I=19003,R2=(9,79))"
+    assert primes.prime_to_uscript(2, "03", "full") == \
+           "    Primes(2)=(P=(3),M=(2,3),M0I=21845,R2=(2,1))"
+
+
+def test_primes_out_precomputed_values():
+    lines = PRIMES_OUT.read_text().split("\n")
+    assert len(lines) == 1270
+    for i, line in enumerate(lines):
+        match = PRIME_RE.fullmatch(line.strip())
+        assert match, line
+        assert int(match.group(1)) == i
+        p = bytes(ints(match.group(2)))
+        m = ints(match.group(3))
+        p_int = int.from_bytes(p, "big")
+        assert i15.from_words(m) == p_int
+        assert len(m) - 1 == -(-len(p) * 8 // 15)
+        assert (m[1] * int(match.group(4))) & 0x7FFF == 0x7FFF
+        r = i15.monty_r(m[0])
+        assert i15.from_words(ints(match.group(5))) == (r * r) % p_int
+
+
+def test_test_mutator_primes_are_up_to_date():
+    assert PRIMES_OUT.read_text() in TEST_MUTATOR.read_text()
@@ -0,0 +1,149 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the unrolled SHA-224/256 code generator."""
+
+import hashlib
+import random
+
+import pytest
+
+import sha2_codegen
+import uscript_inline
+from uscript_eval import Interpreter
+from uscript_eval import wrap32
+
+SHA224_IV = (
+    0xC1059ED8, 0x367CD507, 0x3070DD17, 0xF70E5939,
+    0xFFC00B31, 0x68581511, 0x64F98FA7, 0xBEFA4FA4,
+)
+
+# Lengths around the padding and block boundaries.
+LENGTHS = [0, 1, 55, 56, 63, 64, 65, 119, 120, 128, 200]
+
+
+@pytest.fixture(scope="module")
+def k_small() -> list[int]:
+    return sha2_codegen.parse_k_small(sha2_codegen.DEFAULT_SOURCE.read_text())
+
+
+@pytest.fixture(scope="module")
+def interp() -> Interpreter:
+    classes = {p.name: p.read_text()
+               for p in sorted(sha2_codegen.CLASSES_DIR.glob("*.uc*"))}
+    pp = uscript_inline.Preprocessor(classes)
+    return Interpreter(pp.process("FCryptoSHA2.uc"), pp.process("FCryptoMemory.uc"))
+
+
+def test_generated_file_is_up_to_date():
+    source = sha2_codegen.DEFAULT_SOURCE.read_text()
+    assert sha2_codegen.DEFAULT_OUTPUT.read_text() == sha2_codegen.generate(source)
+
+
+def test_round_constants(k_small: list[int]):
+    # First 32 bits of the fractional parts of the cube roots of the
+    # first 64 primes.
+    primes = [p for p in range(2, 312) if all(p % d for d in range(2, p))]
+    for p, k in zip(primes, k_small, strict=True):
+        root = round((p << 96) ** (1 / 3))
+        while root ** 3 > p << 96:
+            root -= 1
+        while (root + 1) ** 3 <= p << 96:
+            root += 1
+        assert root & sha2_codegen.MASK32 == k
+
+
+def test_register_rotation():
+    assert sha2_codegen.round_vars(0) == "ABCDEFGH"
+    assert sha2_codegen.round_vars(1) == "HABCDEFG"
+    assert sha2_codegen.round_vars(8) == "ABCDEFGH"
+    assert sha2_codegen.schedule_sources(16) == (14, 9, 1, 0)
+    assert sha2_codegen.schedule_sources(63) == (13, 8, 0, 15)
+
+
+def test_model_matches_hashlib(k_small: list[int]):
+    sha2_codegen.validate(k_small, 50, random.Random(1))
+    for n in LENGTHS:
+        data = bytes(range(n % 256)) * (n // 256) + bytes(range(n % 256))
+        assert sha2_codegen.sha256(data, k_small) == hashlib.sha256(data).digest()
+
+
+def _context(iv: tuple[int, ...]) -> dict:
+    return {"count": 0, "buf": [0] * 64, "val": [wrap32(v) for v in iv]}
+
+
+def _hash(interp: Interpreter, iv: tuple[int, ...], chunks: list[bytes], num: int) -> bytes:
+    cc = _context(iv)
+    for chunk in chunks:
+        interp.call("Sha2SmallUpdate", cc, list(chunk), len(chunk))
+    dst: list[int] = []
+    interp.call("Sha2SmallOut", cc, dst, num)
+    return bytes(dst)
+
+
+def _split(rng: random.Random, data: bytes) -> list[bytes]:
+    cuts = sorted(rng.randrange(len(data) + 1) for _ in range(rng.randrange(3)))
+    bounds = [0, *cuts, len(data)]
+    return [data[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_unrealscript_sha256_matches_hashlib(interp: Interpreter, length: int):
+    rng = random.Random(length)
+    data = rng.randbytes(length)
+    expected = hashlib.sha256(data).digest()
+    assert _hash(interp, sha2_codegen.SHA256_IV, [data], 8) == expected
+    assert _hash(interp, sha2_codegen.SHA256_IV, _split(rng, data), 8) == expected
+
+
+def test_unrealscript_random_messages(interp: Interpreter):
+    rng = random.Random(2)
+    for _ in range(6):
+        data = rng.randbytes(rng.randrange(300))
+        chunks = _split(rng, data)
+        assert _hash(interp, sha2_codegen.SHA256_IV, chunks, 8) == \
+               hashlib.sha256(data).digest()
+        assert _hash(interp, SHA224_IV, chunks, 7) == hashlib.sha224(data).digest()
+
+
+def test_unrealscript_round_variants(interp: Interpreter, k_small: list[int]):
+    rng = random.Random(3)
+    data = rng.randbytes(3 * 64)
+    expected = list(sha2_codegen.SHA256_IV)
+    for off in range(0, len(data), 64):
+        sha2_codegen.compress(expected, data[off:off + 64], k_small)
+    expected = [wrap32(v) for v in expected]
+
+    val = [wrap32(v) for v in sha2_codegen.SHA256_IV]
+    interp.call("Sha2SmallBlocks", list(data), 0, 3, val)
+    assert val == expected
+
+    # Blocks after an unaligned offset.
+    val = [wrap32(v) for v in sha2_codegen.SHA256_IV]
+    interp.call("Sha2SmallBlocks", [7] * 5 + list(data), 5, 3, val)
+    assert val == expected
+
+    for name in ("Sha2SmallRound_SBuf64_SVal8", "Sha2SmallRound"):
+        val = [wrap32(v) for v in sha2_codegen.SHA256_IV]
+        for off in range(0, len(data), 64):
+            interp.call(name, list(data[off:off + 64]), val)
+        assert val == expected, name
@@ -0,0 +1,333 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the UnrealScript preprocessor and helper inliner,
+checked against the untransformed code and the i15 reference model.
+"""
+
+import random
+import re
+from typing import Callable
+
+import pytest
+
+import i15
+import uscript_inline
+from bigint_codegen import CLASSES_DIR
+from bigint_codegen import CodegenError
+from uscript_eval import Interpreter
+from uscript_eval import wrap32
+
+UINT32_MASK = 0xFFFFFFFF
+
+WRAPPERS = """
+class FCryptoInlineTest extends Object;
+
+`define GE(X, Y) (class'FCryptoBigInt'.static.NOT(class'FCryptoBigInt'.static.GT(`Y, `X)))
+
+static final function int T_NOT(int A) { return class'FCryptoBigInt'.static.NOT(A); }
+static final function int T_MUX(int A, int B, int C) { return class'FCryptoBigInt'.static.MUX(A, B, C); }
+static final function int T_EQ(int A, int B) { return class'FCryptoBigInt'.static.EQ(A, B); }
+static final function int T_NEQ(int A, int B) { return class'FCryptoBigInt'.static.NEQ(A, B); }
+static final function int T_GT(int A, int B) { return class'FCryptoBigInt'.static.GT(A, B); }
+static final function int T_CMP(int A, int B) { return class'FCryptoBigInt'.static.CMP(A, B); }
+static final function int T_EQ0(int A) { return class'FCryptoBigInt'.static.EQ0(A); }
+static final function int T_GE(int A, int B) { return `GE(A, B); }
+"""
+
+
+def _unsigned(x: int) -> int:
+    return x & UINT32_MASK
+
+
+REFERENCE: dict[str, Callable[..., int]] = {
+    "T_NOT": lambda a: a ^ 1,
+    "T_MUX": lambda c, a, b: wrap32(a if c else b),
+    "T_EQ": lambda a, b: int(_unsigned(a) == _unsigned(b)),
+    "T_NEQ": lambda a, b: int(_unsigned(a) != _unsigned(b)),
+    "T_GT": lambda a, b: int(_unsigned(a) > _unsigned(b)),
+    "T_CMP": lambda a, b: (_unsigned(a) > _unsigned(b)) - (_unsigned(a) < _unsigned(b)),
+    "T_EQ0": lambda a: int(_unsigned(a) == 0),
+    "T_GE": lambda a, b: int(_unsigned(a) >= _unsigned(b)),
+}
+
+
+@pytest.fixture(scope="module")
+def classes() -> dict[str, str]:
+    return {p.name: p.read_text() for p in sorted(CLASSES_DIR.glob("*.uc*"))}
+
+
+@pytest.fixture(scope="module")
+def transformed(classes: dict[str, str]) -> uscript_inline.TransformResult:
+    return uscript_inline.transform_sources(
+        classes | {"FCryptoInlineTest.uc": WRAPPERS})
+
+
+def preprocess(files: dict[str, str], name: str) -> str:
+    return uscript_inline.Preprocessor(files).process(name)
+
+
+def test_preprocess_define():
+    text = preprocess({"a.uc": (
+        "`define ONE 1\n"
+        "`define ADD(X, Y) (`X + `{Y})\n"
+        "`define LONG(X) `X \\\n"
+        "    + 2 // Comment.\n"
+        "A = `ADD(`ONE, B) + `LONG(3); // `ONE\n"
+        "S = \"`ONE\";\n"
+        "`undefine(ONE)\n"
+        "`ONE;\n"
+        "`log(\"x\");\n"
+    )}, "a.uc")
+    lines = text.split("\n")
+    assert len(lines) == 10
+    assert lines[4] == "A = (1 + B) + 3 + 2; // `ONE"
+    assert lines[5] == "S = \"`ONE\";"
+    # Unknown macros are left for the UnrealScript compiler.
+    assert lines[7] == "`ONE;"
+    assert lines[8] == "`log(\"x\");"
+
+
+def test_preprocess_conditionals_and_include():
+    files = {
+        "Macros.uci": "`define FLAG 1\n`define VALUE 2\n",
+        "a.uc": (
+            "`include(FCrypto\\Classes\\Macros.uci)\n"
+            "`if(`isdefined(FLAG))\n"
+            "A = `VALUE;\n"
+            "`if(`notdefined(FLAG))\n"
+            "`define VALUE 3\n"
+            "`endif\n"
+            "`else\n"
+            "B = `VALUE;\n"
+            "`endif\n"
+            "`if(`MISSING)\n"
+            "C;\n"
+            "`endif\n"
+            "D = `VALUE;\n"
+        ),
+    }
+    text = preprocess(files, "a.uc")
+    assert [line for line in text.split("\n") if line.strip()] == ["A = 2;", "D = 2;"]
+    assert text.count("\n") == files["a.uc"].count("\n")
+    text = preprocess({
+        "Code.uci": "// Comment.\nA = 1;\n\n/* B */ B = \"//\";\n",
+        "a.uc": "X;\n`include(Code.uci)\nY;\n",
+    }, "a.uc")
+    assert text.split("\n") == ["X;", "A = 1; B = \"//\";", "Y;", ""]
+    with pytest.raises(CodegenError):
+        preprocess({"a.uc": "`if(1)\n"}, "a.uc")
+    with pytest.raises(CodegenError):
+        preprocess({"a.uc": "`include(Missing.uci)\n"}, "a.uc")
+
+
+HELPERS = """
+// @inline
+static final function int NOT(int Ctl)
+{
+    return Ctl ^ 1;
+}
+
+// @inline
+static final function int NEQ(int X, int Y)
+{
+    local int Q;
+
+    Q = X ^ Y;
+    return (Q | (-Q)) >>> 31;
+}
+
+// @inline
+static final function int EQ(int X, int Y)
+{
+    return NOT(NEQ(X, Y));
+}
+
+static final function int Next(out int I)
+{
+    return I++;
+}
+"""
+
+
+def inline(source: str) -> str:
+    helpers = uscript_inline.parse_inline_helpers(HELPERS, "A")
+    return uscript_inline.Inliner(helpers).inline(source, "A")
+
+
+def test_inline_expressions():
+    assert inline("X = NOT(Y) | Z;") == "X = (Y ^ 1) | Z;"
+    assert inline("X = NEQ(A[I], B & C);") == \
+        "X = (((A[I] ^ (B & C)) | (-(A[I] ^ (B & C)))) >>> 31);"
+    assert "NEQ" not in inline("X = EQ(A, B);")
+    assert inline("X = class'A'.static.NOT(int(Y));") == "X = ((int(Y)) ^ 1);"
+    # Helpers of other classes are not inlined without qualification.
+    assert inline("X = class'B'.static.NOT(Y);") == "X = class'B'.static.NOT(Y);"
+    assert uscript_inline.Inliner(
+        uscript_inline.parse_inline_helpers(HELPERS, "A")).inline("X = NOT(Y);", "B") \
+           == "X = NOT(Y);"
+
+
+def test_inline_keeps_calls_with_side_effects():
+    # Each argument is used once, but evaluation order would change.
+    assert inline("X = NEQ(Next(I), Y);") == "X = NEQ(Next(I), Y);"
+    # Single parameter used once is safe.
+    assert inline("X = NOT(Next(I));") == "X = ((Next(I)) ^ 1);"
+    assert inline("X = NOT(I++);") == "X = ((I++) ^ 1);"
+    # The result is not used.
+    assert inline("{\n    NOT(Y);\n}") == "{\n    NOT(Y);\n}"
+    # Function headers and comments are left alone.
+    assert inline("function int NOT(int Y) // NOT(Y)") == \
+        "function int NOT(int Y) // NOT(Y)"
+
+
+def test_interpreter_switch_and_defaults():
+    interp = Interpreter("""
+static final function int F(int X, out array<int> A)
+{
+    local int B;
+
+    A.Length = 2;
+    (B) = default.T[X];
+    switch (X)
+    {
+        case 0:
+            B += 10;
+        case 1:
+            B += 100;
+            break;
+        default:
+            return -1;
+    }
+    A.Length = A.Length + 1;
+    return B;
+}
+
+DefaultProperties
+{
+    // T=(9)
+    T=(1, 0x2)
+    S="ignored"
+}
+""")
+    assert interp.defaults == {"t": [1, 2]}
+    arr: list[int] = [5, 5, 5, 5]
+    assert interp.call("F", 0, arr) == 111
+    assert arr == [5, 5, 0]
+    assert interp.call("F", 1, arr) == 102
+    assert interp.call("F", 2, arr) == -1
+
+
+def test_unsupported_inline_helpers():
+    for body in ("if (X > 0) { return 1; } return 0;", "X = 1;", "Foo(X); return X;"):
+        with pytest.raises(CodegenError):
+            uscript_inline.parse_inline_helpers(
+                "// @inline\nstatic final function int F(int X)\n{\n" + body + "\n}\n", "A")
+
+
+def test_classes_are_transformed(
+        classes: dict[str, str], transformed: uscript_inline.TransformResult):
+    assert set(transformed.files) == {
+        name for name in classes if name.endswith(".uc")} | {"FCryptoInlineTest.uc"}
+    for name, text in transformed.files.items():
+        assert "`include" not in text
+        if name in classes:
+            # Compiler errors must point at the lines of the sources.
+            assert text.count("\n") == classes[name].count("\n"), name
+        assert "`define" not in uscript_inline.strip_comments(text)
+    bigint = uscript_inline.strip_comments(transformed.files["FCryptoBigInt.uc"])
+    for name in ("Add_Static37", "Sub_Static37", "MontyMul_S37_S37_S37_DynM", "CCOPY"):
+        header = re.search(rf"function (int )?{name}\(", bigint)
+        assert header is not None, name
+        start = bigint.index("{", header.end())
+        body = bigint[start:uscript_inline.find_closing(bigint, start, "{", "}")]
+        assert not re.search(r"\b(NOT|MUX|EQ|NEQ|GT)\(", body), name
+    for helper in ("NOT", "MUX", "EQ", "NEQ", "GT", "CMP", "EQ0"):
+        assert transformed.inlined[helper] > 0
+
+
+def _edge_values(rng: random.Random) -> list[int]:
+    values = [0, 1, -1, 2, 0x7FFF, 0x8000, 0xFFFF, 0x7FFFFFFF, -0x80000000, -2]
+    return values + [wrap32(rng.getrandbits(32)) for _ in range(20)]
+
+
+def test_helpers_match_reference(classes: dict[str, str], transformed: uscript_inline.TransformResult):
+    rng = random.Random(1)
+    original = Interpreter(
+        preprocess(classes, "FCryptoBigInt.uc"),
+        uscript_inline.Preprocessor(classes | {"t.uc": WRAPPERS}).process("t.uc"))
+    # Without FCryptoBigInt, every helper call must have been inlined.
+    inlined = Interpreter(transformed.files["FCryptoInlineTest.uc"])
+    values = _edge_values(rng)
+    for name, func in REFERENCE.items():
+        cases: list[tuple[int, ...]]
+        if name == "T_NOT":
+            cases = [(0,), (1,)]
+        elif name == "T_MUX":
+            cases = [(c, a, b) for c in (0, 1) for a in values[:8] for b in values[::3]]
+        elif name == "T_EQ0":
+            cases = [(a,) for a in values]
+        else:
+            cases = [(a, b) for a in values for b in values]
+            cases += [(a, a) for a in values]
+        for args in cases:
+            expected = func(*args)
+            assert original.call(name, *args) == expected, (name, args)
+            assert inlined.call(name, *args) == expected, (name, args)
+
+
+def _random_words(rng: random.Random, header: int) -> list[int]:
+    x = rng.getrandbits(i15.decode_bit_length(header))
+    return i15.to_words(x, header) + [0] * (37 - i15.num_words(header) - 1)
+
+
+@pytest.mark.parametrize("bits", [15, 130, 255, 521])
+def test_bigint_matches_i15(transformed: uscript_inline.TransformResult, bits: int):
+    rng = random.Random(bits)
+    interp = Interpreter(transformed.files["FCryptoBigInt.uc"])
+    header = i15.encode_bit_length(bits)
+    m = _random_words(rng, header)
+    m[1] |= 1
+    m0i = i15.ninv15(m[1])
+    for _ in range(4):
+        for func, ref in (("Add", i15.add), ("Sub", i15.sub)):
+            for ctl in (0, 1):
+                a = _random_words(rng, header)
+                b = _random_words(rng, header)
+                expected = a.copy()
+                carry = ref(expected, b, ctl)
+                for name in (f"{func}_Static37", f"{func}_Static37_DynB", func):
+                    actual = a.copy()
+                    assert interp.call(name, actual, b.copy(), ctl) == carry, name
+                    assert actual == expected, name
+
+        x = i15.to_words(rng.randrange(i15.from_words(m)), header)
+        y = i15.to_words(rng.randrange(i15.from_words(m)), header)
+        x += [0] * (37 - len(x))
+        y += [0] * (37 - len(y))
+        expected = [0] * 37
+        i15.montymul(expected, x, y, m, m0i)
+        for name in ("MontyMul_S37_S37_S37_DynM", "MontyMul"):
+            actual = [0] * 37
+            interp.call(name, actual, x.copy(), y.copy(), m.copy(), m0i)
+            assert actual[:i15.num_words(header) + 1] == \
+                   expected[:i15.num_words(header) + 1], name
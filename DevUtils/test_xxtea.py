@@ -0,0 +1,158 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the batched XXTEA cipher. The reference is written the way
+an UnrealScript port would be, on signed 32-bit ints with >>> for the
+unsigned shifts, and run with uscript_eval.
+"""
+
+import numpy as np
+import pytest
+
+import xxtea
+from uscript_eval import Interpreter
+from uscript_eval import wrap32
+
+USCRIPT_XXTEA = """
+static final function Encrypt(out array<int> V, int N, out array<int> K)
+{
+    local int Rounds;
+    local int Sum;
+    local int Y;
+    local int Z;
+    local int P;
+    local int E;
+
+    Sum = 0;
+    Z = V[N - 1];
+    for (Rounds = 6 + 52 / N; Rounds > 0; --Rounds)
+    {
+        Sum += 0x9E3779B9;
+        E = (Sum >>> 2) & 3;
+        for (P = 0; P < N - 1; ++P)
+        {
+            Y = V[P + 1];
+            V[P] += (((Z >>> 5) ^ (Y << 2)) + ((Y >>> 3) ^ (Z << 4)))
+                ^ ((Sum ^ Y) + (K[(P & 3) ^ E] ^ Z));
+            Z = V[P];
+        }
+        Y = V[0];
+        V[N - 1] += (((Z >>> 5) ^ (Y << 2)) + ((Y >>> 3) ^ (Z << 4)))
+            ^ ((Sum ^ Y) + (K[(P & 3) ^ E] ^ Z));
+        Z = V[N - 1];
+    }
+}
+"""
+
+
+def words(data: bytes) -> list[int]:
+    return [wrap32(w) for w in np.frombuffer(data, dtype="<u4").tolist()]
+
+
+@pytest.fixture(scope="module")
+def interp() -> Interpreter:
+    return Interpreter(USCRIPT_XXTEA)
+
+
+@pytest.mark.parametrize("size", [8, 12, 20, 52, 256])
+def test_matches_unrealscript(interp: Interpreter, size: int):
+    rng = np.random.default_rng(size)
+    key = rng.bytes(xxtea.KEY_SIZE)
+    data = rng.bytes(size)
+    v = words(data)
+    interp.call("Encrypt", v, len(v), words(key))
+
+    out = np.frombuffer(data, dtype="<u4").astype(np.uint32)
+    offsets = np.array([0, len(out)], dtype=np.int64)
+    xxtea.encrypt_words(out, offsets, xxtea.key_words(key).reshape(1, 4))
+    assert [wrap32(w) for w in out.tolist()] == v
+
+    xxtea.decrypt_words(out, offsets, xxtea.key_words(key).reshape(1, 4))
+    assert out.astype("<u4").tobytes() == data
+
+
+def test_batch():
+    rng = np.random.default_rng(1)
+    keys = [rng.bytes(16) for _ in range(50)]
+    plaintexts = [rng.bytes(int(n)) for n in rng.integers(0, 300, 50)]
+    ciphertexts = xxtea.encrypt_many(keys, plaintexts)
+    for key, p, c in zip(keys, plaintexts, ciphertexts):
+        assert len(c) == len(xxtea.pad(p))
+        assert c == xxtea.encrypt(key, p)
+    assert xxtea.decrypt_many(keys, ciphertexts) == plaintexts
+
+
+def test_padding():
+    assert xxtea.pad(b"") == bytes([8]) * 8
+    assert xxtea.pad(b"abcde") == b"abcde\x03\x03\x03"
+    for data in (b"", b"\x00" * 8, b"abc\x01\x02", b"abcdefg\x09"):
+        with pytest.raises(xxtea.XXTEAError):
+            xxtea.unpad(data)
+
+
+def test_errors():
+    key = bytes(16)
+    with pytest.raises(xxtea.XXTEAError):
+        xxtea.encrypt(bytes(15), b"abc")
+    with pytest.raises(xxtea.XXTEAError):
+        xxtea.decrypt(key, bytes(12))
+    with pytest.raises(xxtea.XXTEAError):
+        xxtea.decrypt(bytes([1]) * 16, xxtea.encrypt(key, b"abc"))
+    with pytest.raises(xxtea.XXTEAError):
+        xxtea.encrypt_many([key], [])
+    with pytest.raises(xxtea.XXTEAError):
+        xxtea.encrypt_words(
+            np.zeros(3, dtype=np.uint32),
+            np.array([0, 1, 3], dtype=np.int64),
+            np.zeros((2, 4), dtype=np.uint32),
+        )
+
+
+@pytest.mark.parametrize("size", [0, 7, 64, 65, 1000])
+@pytest.mark.parametrize("piece", [1, 13, 4096])
+def test_stream(size: int, piece: int):
+    rng = np.random.default_rng(size)
+    key = rng.bytes(16)
+    payload = rng.bytes(size)
+
+    enc = xxtea.StreamEncryptor(key, chunk_size=64)
+    ciphertext = b"".join(
+        enc.update(payload[i:i + piece]) for i in range(0, size, piece))
+    ciphertext += enc.finalize()
+    assert len(ciphertext) == size - size % 64 + len(xxtea.pad(payload[size - size % 64:]))
+
+    dec = xxtea.StreamDecryptor(key, chunk_size=64)
+    plaintext = b"".join(
+        dec.update(ciphertext[i:i + piece]) for i in range(0, len(ciphertext), piece))
+    assert plaintext + dec.finalize() == payload
+    with pytest.raises(xxtea.XXTEAError):
+        dec.finalize()
+
+
+def test_stream_chunks_differ():
+    enc = xxtea.StreamEncryptor(bytes(16), chunk_size=64)
+    ciphertext = enc.update(bytes(128)) + enc.finalize()
+    assert ciphertext[:64] != ciphertext[64:128]
+    dec = xxtea.StreamDecryptor(bytes(16), chunk_size=64)
+    with pytest.raises(xxtea.XXTEAError):
+        dec.update(ciphertext[:100])
+        dec.finalize()
@@ -0,0 +1,723 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Interpreter for the integer subset of UnrealScript used by the
+FCrypto big integer code.
+
+Used by the tests to check source-to-source transformations
+(uscript_inline.py) against the untransformed code and the Python
+reference models. Supports int and byte values, static and dynamic int
+arrays and structs (dicts keyed by lowercase member name) passed by
+reference, out parameters, the usual statements
+(if, switch, for, while, do-until, return, break, continue) and static
+function calls, optionally qualified with class'Name'.static.
+default.Name reads the int array defaults of DefaultProperties.
+
+Binary operators follow the UnrealScript precedence levels of
+Object.uc, which differ from C. Most notably, &, ^ and | share one
+level and are evaluated left to right, so 1 | 2 & 0 is 0.
+All arithmetic wraps to 32 bits.
+"""
+
+import dataclasses
+import re
+from typing import Any
+from typing import Callable
+
+import bigint_codegen as codegen
+
+# Lower binds tighter, all levels are left associative.
+BINARY_PRECEDENCE = {
+    "*": 16, "/": 16,
+    "%": 18,
+    "+": 20, "-": 20,
+    "<<": 22, ">>": 22, ">>>": 22,
+    "<": 24, ">": 24, "<=": 24, ">=": 24, "==": 24, "!=": 24,
+    "&": 28, "^": 28, "|": 28,
+    "&&": 30, "^^": 30,
+    "||": 32,
+}
+ASSIGN_OPS = {"=", "+=", "-=", "*=", "/="}
+
+# Not anchored to line starts, preprocessed includes are on a single line.
+CONST_RE = re.compile(r"(?<!\w)const\s+(\w+)\s*=\s*(0[xX][0-9A-Fa-f]+|\d+)\s*;")
+FUNC_RE = re.compile(
+    r"(?<![\w.])static\s+final\s+function\s+(?:(?P<ret>\w+)\s+)?(?P<name>\w+)\s*\(")
+DEFAULTS_START_RE = re.compile(r"^\s*DefaultProperties\s*\{", re.MULTILINE | re.IGNORECASE)
+# Name=(1, 2, ...) or Name={(1, 2, ...)}, other defaults are ignored.
+DEFAULTS_ARRAY_RE = re.compile(r"^\s*(\w+)\s*=\s*\{?\(([^()]*)\)\}?", re.MULTILINE)
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<num>0[xX][0-9A-Fa-f]+|\d+)
+  | (?P<name>'[^']*')
+  | (?P<ident>[A-Za-z_]\w*)
+  | (?P<op>>>>|<<|>>|<=|>=|==|!=|&&|\|\||\^\^|\+\+|--|\+=|-=|\*=|/=|[-+*/%<>=!~&|^()\[\]{};,.:])
+""", re.VERBOSE | re.DOTALL)
+
+
+class UScriptError(Exception):
+    pass
+
+
+def wrap32(x: int) -> int:
+    return ((x + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        m = TOKEN_RE.match(text, pos)
+        if not m:
+            raise UScriptError(f"unexpected character {text[pos]!r} at offset {pos}")
+        if m.lastgroup != "space":
+            tokens.append(m.group())
+        pos = m.end()
+    return tokens
+
+
+# Key of the target of an array's Length property.
+_LENGTH = object()
+
+
+class _Break(Exception):
+    pass
+
+
+class _Continue(Exception):
+    pass
+
+
+class _Return(Exception):
+    def __init__(self, value: Any):
+        self.value = value
+
+
+@dataclasses.dataclass
+class Param:
+    name: str
+    is_out: bool
+    size: int | None
+    is_array: bool
+    default: int = 0
+
+
+@dataclasses.dataclass
+class Function:
+    name: str
+    params: list[Param]
+    body: list[str]
+
+
+def _parse_decl(decl: str) -> Param:
+    decl, _, default = decl.partition("=")
+    words = decl.replace("[", " [").split()
+    is_out = "out" in (w.lower() for w in words)
+    m = re.search(r"(\w+)\s*(?:\[\s*(\d+)\s*])?\s*$", decl)
+    if not m:
+        raise UScriptError(f"cannot parse declaration '{decl}'")
+    size = int(m.group(2)) if m.group(2) else None
+    return Param(
+        name=m.group(1),
+        is_out=is_out,
+        size=size,
+        is_array=size is not None or "array<" in decl.replace(" ", ""),
+        default=int(default.strip(), 0) if default.strip() else 0,
+    )
+
+
+class Interpreter:
+    """Runs static functions parsed from UnrealScript sources.
+    Function and variable names are case-insensitive.
+    """
+
+    def __init__(self, *sources: str):
+        self._texts: dict[str, tuple[str, int]] = {}
+        self.constants: dict[str, int] = {}
+        self.defaults: dict[str, Any] = {}
+        for source in sources:
+            source = codegen.strip_comments(source)
+            for m in CONST_RE.finditer(source):
+                self.constants[m.group(1).lower()] = wrap32(int(m.group(2), 0))
+            for m in FUNC_RE.finditer(source):
+                self._texts[m["name"].lower()] = (source, m.end() - 1)
+            if defaults := DEFAULTS_START_RE.search(source):
+                self._parse_defaults(source[defaults.end():])
+        self._functions: dict[str, Function] = {}
+        self.natives: dict[str, Callable[..., int]] = {}
+
+    def _parse_defaults(self, text: str):
+        for m in DEFAULTS_ARRAY_RE.finditer(text):
+            try:
+                values = [wrap32(int(v, 0)) for v in m.group(2).split(",") if v.strip()]
+            except ValueError:
+                continue
+            self.defaults[m.group(1).lower()] = values
+
+    def function(self, name: str) -> Function:
+        key = name.lower()
+        if key not in self._functions:
+            if key not in self._texts:
+                raise UScriptError(f"unknown function '{name}'")
+            source, params_start = self._texts[key]
+            params_end = codegen.find_closing(source, params_start, "(", ")")
+            body_start = source.index("{", params_end)
+            body_end = codegen.find_closing(source, body_start, "{", "}")
+            params = codegen.split_args(
+                codegen.strip_comments(source[params_start + 1:params_end]))
+            self._functions[key] = Function(
+                name=name,
+                params=[_parse_decl(p) for p in params],
+                body=tokenize(source[body_start:body_end + 1]),
+            )
+        return self._functions[key]
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Call a function. Array arguments are lists that the function
+        modifies in place. Returns the return value, or None.
+        """
+        return self.invoke(name, list(args))[0]
+
+    def invoke(self, name: str, args: list[Any]) -> tuple[Any, dict[str, Any]]:
+        """Call a function, return the return value and the final
+        values of the parameters and locals.
+        """
+        if name.lower() in self.natives:
+            return self.natives[name.lower()](*args), {}
+        func = self.function(name)
+        if len(args) > len(func.params):
+            raise UScriptError(f"too many arguments for {func.name}")
+        env: dict[str, Any] = {}
+        for param, arg in zip(func.params, args):
+            env[param.name.lower()] = arg if isinstance(arg, (list, dict)) else wrap32(arg)
+        for param in func.params[len(args):]:
+            env[param.name.lower()] = \
+                [0] * (param.size or 0) if param.is_array else param.default
+        try:
+            _Frame(self, env, func.body).block()
+        except _Return as ret:
+            return ret.value, env
+        return None, env
+
+
+class _Frame:
+    def __init__(self, interp: Interpreter, env: dict[str, Any], tokens: list[str]):
+        self.interp = interp
+        self.env = env
+        self.tokens = tokens
+        self.pos = 0
+
+    # Token helpers.
+
+    def peek(self, offset: int = 0) -> str:
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else ""
+
+    def next(self) -> str:
+        tok = self.peek()
+        self.pos += 1
+        return tok
+
+    def expect(self, tok: str):
+        if self.next() != tok:
+            raise UScriptError(f"expected '{tok}', got '{self.tokens[self.pos - 1]}'")
+
+    def skip_statement(self):
+        """Skip one statement without executing it."""
+        tok = self.peek()
+        if tok == "{":
+            self.skip_group("{", "}")
+        elif tok.lower() in ("if", "for", "while", "switch"):
+            self.next()
+            self.skip_group("(", ")")
+            self.skip_statement()
+            if tok.lower() == "if" and self.peek().lower() == "else":
+                self.next()
+                self.skip_statement()
+        elif tok.lower() == "do":
+            self.next()
+            self.skip_statement()
+            self.next()  # until
+            self.skip_group("(", ")")
+            if self.peek() == ";":
+                self.next()
+        else:
+            while self.next() != ";":
+                pass
+
+    def skip_group(self, open_tok: str, close_tok: str):
+        depth = 0
+        while True:
+            tok = self.next()
+            if tok == open_tok:
+                depth += 1
+            elif tok == close_tok:
+                depth -= 1
+                if depth == 0:
+                    return
+            elif tok == "":
+                raise UScriptError(f"unbalanced '{open_tok}'")
+
+    # Statements.
+
+    def block(self):
+        self.expect("{")
+        while self.peek() != "}":
+            self.statement()
+        self.next()
+
+    def statement(self):
+        tok = self.peek().lower()
+        if tok == "{":
+            self.block()
+        elif tok == ";":
+            self.next()
+        elif tok == "local":
+            self.local()
+        elif tok == "if":
+            self.next()
+            self.expect("(")
+            cond = self.expr()
+            self.expect(")")
+            if cond:
+                self.statement()
+                if self.peek().lower() == "else":
+                    self.next()
+                    self.skip_statement()
+            else:
+                self.skip_statement()
+                if self.peek().lower() == "else":
+                    self.next()
+                    self.statement()
+        elif tok == "return":
+            self.next()
+            value = None if self.peek() == ";" else self.expr()
+            raise _Return(value)
+        elif tok == "break":
+            raise _Break()
+        elif tok == "continue":
+            raise _Continue()
+        elif tok == "switch":
+            self.switch()
+        elif tok == "for":
+            self.loop_for()
+        elif tok == "while":
+            self.loop_while()
+        elif tok == "do":
+            self.loop_do()
+        else:
+            self.expr()
+            self.expect(";")
+
+    def local(self):
+        self.next()
+        decl = []
+        while self.peek() != ";":
+            decl.append(self.next())
+        self.next()
+        text = " ".join(decl)
+        type_end = text.rindex(">") + 1 if "array <" in text else text.index(" ")
+        for name in codegen.split_args(text[type_end:]):
+            param = _parse_decl(text[:type_end] + " " + name)
+            self.env[param.name.lower()] = \
+                [0] * (param.size or 0) if param.is_array else 0
+
+    def switch(self):
+        self.next()
+        self.expect("(")
+        value = self.expr()
+        self.expect(")")
+        self.expect("{")
+        # Find the matching label and the end of the block first.
+        target = None
+        default = None
+        while self.peek() != "}":
+            tok = self.peek().lower()
+            if tok == "case":
+                self.next()
+                label = self.expr()
+                self.expect(":")
+                if target is None and label == value:
+                    target = self.pos
+            elif tok == "default" and self.peek(1) == ":":
+                self.pos += 2
+                default = self.pos
+            else:
+                self.skip_statement()
+        end = self.pos + 1
+        start = target if target is not None else default
+        if start is not None:
+            self.pos = start
+            try:
+                while self.peek() != "}":
+                    tok = self.peek().lower()
+                    if tok == "case":
+                        while self.next() != ":":
+                            pass
+                    elif tok == "default" and self.peek(1) == ":":
+                        self.pos += 2
+                    else:
+                        self.statement()
+            except _Break:
+                pass
+        self.pos = end
+
+    def loop_for(self):
+        self.next()
+        self.expect("(")
+        if self.peek() != ";":
+            self.expr()
+        self.expect(";")
+        cond_pos = self.pos
+        while True:
+            self.pos = cond_pos
+            cond = self.expr() if self.peek() != ";" else 1
+            self.expect(";")
+            step_pos = self.pos
+            self.skip_until_close()
+            body_pos = self.pos
+            if not cond:
+                self.skip_statement()
+                return
+            if self.run_body():
+                self.pos = body_pos
+                self.skip_statement()
+                return
+            self.pos = step_pos
+            if self.peek() != ")":
+                self.expr()
+
+    def loop_while(self):
+        self.next()
+        cond_pos = self.pos
+        while True:
+            self.pos = cond_pos
+            self.expect("(")
+            cond = self.expr()
+            self.expect(")")
+            if not cond:
+                self.skip_statement()
+                return
+            body_pos = self.pos
+            if self.run_body():
+                self.pos = body_pos
+                self.skip_statement()
+                return
+
+    def loop_do(self):
+        self.next()
+        body_pos = self.pos
+        while True:
+            self.pos = body_pos
+            broke = self.run_body()
+            self.pos = body_pos
+            self.skip_statement()
+            self.next()  # until
+            self.expect("(")
+            cond = self.expr()
+            self.expect(")")
+            if self.peek() == ";":
+                self.next()
+            if broke or cond:
+                return
+
+    def skip_until_close(self):
+        depth = 1
+        while depth:
+            tok = self.next()
+            if tok == "(":
+                depth += 1
+            elif tok == ")":
+                depth -= 1
+
+    def run_body(self) -> bool:
+        """Run a loop body, return True if it was left with break."""
+        start = self.pos
+        try:
+            self.statement()
+        except _Break:
+            return True
+        except _Continue:
+            self.pos = start
+            self.skip_statement()
+        return False
+
+    # Expressions.
+
+    def followed_by(self, toks: tuple[str, ...] | set[str]) -> bool:
+        """Return True if the tokens at pos form an lvalue followed by
+        one of toks. Nothing is evaluated, index expressions may have
+        side effects.
+        """
+        start = self.pos
+        try:
+            # Parenthesized lvalues come from macros, e.g. (`x) = ...
+            depth = 0
+            while self.peek() == "(":
+                self.next()
+                depth += 1
+            tok = self.peek()
+            if (not re.match(r"[A-Za-z_]", tok) or self.peek(1) == "("
+                    or self.peek(1).startswith("'")
+                    or tok.lower() in ("true", "false")):
+                return False
+            self.next()
+            while True:
+                if self.peek() == "[":
+                    self.skip_group("[", "]")
+                elif self.peek() == "." and self.peek(1).lower() != "length":
+                    self.pos += 2
+                else:
+                    if self.peek() == "." and self.peek(1).lower() == "length":
+                        self.pos += 2
+                    for _ in range(depth):
+                        if self.next() != ")":
+                            return False
+                    return self.peek() in toks
+        finally:
+            self.pos = start
+
+    def expr(self) -> Any:
+        if self.followed_by(ASSIGN_OPS):
+            target = self.lvalue(parens=True)
+            op = self.next()
+            value = self.expr()
+            if op != "=":
+                value = self.binary(op[0], self.load(target), value)
+            self.store(target, value)
+            return value
+        return self.binary_expr(max(BINARY_PRECEDENCE.values()))
+
+    def lvalue(self, parens: bool = False) -> tuple[Any, Any]:
+        target = self.lvalue_or_none(parens)
+        if target is None:
+            raise UScriptError(f"expected a variable at '{self.peek()}'")
+        return target
+
+    def lvalue_or_none(self, parens: bool = False) -> tuple[Any, Any] | None:
+        if parens and self.peek() == "(":
+            self.next()
+            target = self.lvalue_or_none(parens=True)
+            self.expect(")")
+            return target
+        tok = self.peek()
+        if (not re.match(r"[A-Za-z_]", tok) or self.peek(1) == "(" or self.peek(1).startswith("'")
+                or tok.lower() in ("true", "false")):
+            return None
+        self.next()
+        container: Any = self.env
+        key: Any = tok.lower()
+        while True:
+            if self.peek() == "[":
+                self.next()
+                index = self.expr()
+                self.expect("]")
+                container, key = self.load((container, key)), index
+            elif self.peek() == "." and self.peek(1).lower() != "length":
+                # Struct member, structs are dicts keyed by member name.
+                self.next()
+                container, key = self.load((container, key)), self.next().lower()
+            elif self.peek() == "." and self.peek(1).lower() == "length":
+                self.pos += 2
+                return self.load((container, key)), _LENGTH
+            else:
+                return container, key
+
+    def load(self, target: tuple[Any, Any]) -> Any:
+        container, key = target
+        if key is _LENGTH:
+            return len(container)
+        if isinstance(container, dict):
+            if key in container:
+                return container[key]
+            if container is self.env and key in self.interp.constants:
+                return self.interp.constants[key]
+            if container is self.env and key == "default":
+                return self.interp.defaults
+            raise UScriptError(f"unknown variable '{key}'")
+        return container[key] if 0 <= key < len(container) else 0
+
+    def store(self, target: tuple[Any, Any], value: Any):
+        container, key = target
+        if key is _LENGTH:
+            del container[value:]
+            container.extend([0] * (value - len(container)))
+            return
+        if isinstance(container, list):
+            if key < 0:
+                raise UScriptError(f"negative array index {key}")
+            if key >= len(container):
+                container.extend([0] * (key + 1 - len(container)))
+            value = wrap32(value)
+        elif not isinstance(value, (list, dict)):
+            value = wrap32(value)
+        container[key] = value
+
+    def binary_expr(self, max_prec: int) -> Any:
+        left = self.unary()
+        while True:
+            op = self.peek()
+            prec = BINARY_PRECEDENCE.get(op)
+            if prec is None or prec > max_prec:
+                return left
+            self.next()
+            if op in ("&&", "||"):
+                # Short-circuit, but the operand must still be parsed.
+                right_start = self.pos
+                if (op == "&&" and not left) or (op == "||" and left):
+                    self.binary_expr(prec - 1)
+                    left = int(op == "||")
+                    continue
+                self.pos = right_start
+            right = self.binary_expr(prec - 1)
+            left = self.binary(op, left, right)
+
+    @staticmethod
+    def binary(op: str, a: int, b: int) -> int:
+        match op:
+            case "*":
+                return wrap32(a * b)
+            case "/":
+                if b == 0:
+                    raise UScriptError("division by zero")
+                return wrap32(int(a / b))
+            case "%":
+                return wrap32(a - b * int(a / b))
+            case "+":
+                return wrap32(a + b)
+            case "-":
+                return wrap32(a - b)
+            case "<<":
+                return wrap32(a << (b & 31))
+            case ">>":
+                return a >> (b & 31)
+            case ">>>":
+                return wrap32((a & 0xFFFFFFFF) >> (b & 31))
+            case "<":
+                return int(a < b)
+            case ">":
+                return int(a > b)
+            case "<=":
+                return int(a <= b)
+            case ">=":
+                return int(a >= b)
+            case "==":
+                return int(a == b)
+            case "!=":
+                return int(a != b)
+            case "&":
+                return a & b
+            case "^":
+                return a ^ b
+            case "|":
+                return a | b
+            case "&&":
+                return int(bool(a) and bool(b))
+            case "^^":
+                return int(bool(a) != bool(b))
+            case "||":
+                return int(bool(a) or bool(b))
+        raise UScriptError(f"unknown operator '{op}'")
+
+    def unary(self) -> Any:
+        tok = self.peek()
+        if tok in ("-", "~", "!"):
+            self.next()
+            value = self.unary()
+            return {"-": wrap32(-value), "~": ~value, "!": int(not value)}[tok]
+        if tok in ("++", "--"):
+            self.next()
+            target = self.lvalue()
+            value = wrap32(self.load(target) + (1 if tok == "++" else -1))
+            self.store(target, value)
+            return value
+        return self.postfix()
+
+    def postfix(self) -> Any:
+        start = self.pos
+        target = self.lvalue_or_none()
+        if target is not None:
+            if self.peek() in ("++", "--"):
+                tok = self.next()
+                value = self.load(target)
+                self.store(target, value + (1 if tok == "++" else -1))
+                return value
+            return self.load(target)
+        self.pos = start
+        return self.primary()
+
+    def primary(self) -> Any:
+        tok = self.next()
+        if tok == "(":
+            value = self.expr()
+            self.expect(")")
+            return value
+        if re.match(r"\d", tok):
+            return wrap32(int(tok, 0))
+        if tok.lower() in ("true", "false"):
+            return int(tok.lower() == "true")
+        if tok.lower() == "class" and self.peek().startswith("'"):
+            # class'Name'.static.Func(...)
+            self.next()
+            self.expect(".")
+            self.next()
+            self.expect(".")
+            tok = self.next()
+        if not re.match(r"[A-Za-z_]", tok):
+            raise UScriptError(f"unexpected token '{tok}'")
+        if self.peek() != "(":
+            return self.load((self.env, tok.lower()))
+        return self.call(tok)
+
+    def call(self, name: str) -> Any:
+        self.expect("(")
+        lower = name.lower()
+        if lower in ("int", "byte"):
+            value = self.expr()
+            self.expect(")")
+            return value & 0xFF if lower == "byte" else value
+        if lower == "arraycount":
+            target = self.lvalue()
+            self.expect(")")
+            return len(self.load(target))
+
+        args: list[Any] = []
+        targets: list[tuple[Any, Any] | None] = []
+        while self.peek() != ")":
+            if self.followed_by((",", ")")):
+                target = self.lvalue(parens=True)
+                args.append(self.load(target))
+                targets.append(target)
+            else:
+                args.append(self.expr())
+                targets.append(None)
+            if self.peek() == ",":
+                self.next()
+        self.next()
+
+        result, env = self.interp.invoke(name, args)
+        if env:
+            for param, out_target in zip(self.interp.function(name).params, targets):
+                if param.is_out and not param.is_array and out_target is not None:
+                    self.store(out_target, env[param.name.lower()])
+        return result
@@ -0,0 +1,495 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Build-time preprocessing of the FCrypto UnrealScript classes.
+
+The UnrealScript VM pays for every function call with a new stack
+frame, which costs more than the arithmetic in small constant time
+helpers such as NOT, MUX or GT that the big integer code calls from its
+inner loops. Instead of hand-inlining them and making the sources hard
+to read, helpers are annotated with an @inline comment placed directly
+above the function header:
+
+    // @inline
+    static final function int MUX(int Ctl, int X, Int Y)
+    {
+        return Y ^ ((-Ctl) & (X ^ Y));
+    }
+
+The body of an inlined helper may only declare locals, assign them
+(or the parameters) and return an expression. Calls to it, both
+unqualified calls in the defining class and class'Name'.static.Func(...)
+calls elsewhere, are replaced with the return expression. Parameters
+and locals are substituted in parentheses, so the result does not
+depend on operator precedence, which in UnrealScript differs from C
+(&, ^ and | have the same precedence). A call is left alone if inlining
+could change its meaning: when its value is not used, or when an
+argument that has side effects or calls a function would be evaluated
+more than once or out of order.
+
+Before inlining, the .uc files are run through a small preprocessor
+that expands `include, `define, `undefine, `if/`else/`endif and
+`isdefined/`notdefined, so calls hidden in macros (e.g. `GE) are
+inlined too. Macros that are not defined in the sources, such as the
+engine's `log, are left for the UnrealScript compiler. Define
+continuation lines are joined, blank lines are left in place of
+directives and inactive blocks and included files are expanded on the
+line of the `include without their comments, so compiler errors point
+at the line numbers of the sources.
+
+The output is only meant for the compiler, the human-maintained
+sources are not modified.
+
+Usage:
+    python uscript_inline.py --out-dir DIR [FILE ...]
+"""
+
+import argparse
+import dataclasses
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from bigint_codegen import CLASSES_DIR
+from bigint_codegen import CodegenError
+from bigint_codegen import FUNC_HEADER_RE
+from bigint_codegen import find_closing
+from bigint_codegen import skip_code
+from bigint_codegen import split_args
+from bigint_codegen import strip_comments
+
+INLINE_RE = re.compile(r"^//\s*@inline\s*$")
+MACRO_NAME_RE = re.compile(r"\{(\w+)}|(\w+)")
+DEFINE_RE = re.compile(r"[ \t]*(\w+)(\([^)]*\))?")
+QUALIFIED_CALL_RE = re.compile(r"class\s*'(\w+)'\s*\.\s*static\s*\.\s*(\w+)\s*\(", re.IGNORECASE)
+CALL_RE = re.compile(r"(?<![\w.'])(\w+)\s*\(")
+ASSIGN_RE = re.compile(r"^(\w+)\s*(\+|-|\*|/)?=(?!=)\s*(.+)$", re.DOTALL)
+IDENT_RE = re.compile(r"(?<![\w.'])([A-Za-z_]\w*)\b(?!\s*\()")
+SIMPLE_ARG_RE = re.compile(r"[\w.]+(\s*\[[^\[\]()]*])*")
+SIDE_EFFECT_RE = re.compile(r"\+\+|--|(?<![=!<>])=(?!=)|\w\s*\(")
+CONVERSION_RE = re.compile(r"\b(?:int|byte)\s*\(", re.IGNORECASE)
+PLACEHOLDER_RE = re.compile("\x00(\\d+)\x00")
+MAX_DEPTH = 64
+
+
+@dataclasses.dataclass
+class Macro:
+    params: list[str] | None
+    body: str
+
+
+class Preprocessor:
+    """Expands macros of the given files, keyed by file name.
+    Macros are case-insensitive and local to each processed file
+    and the files it includes.
+    """
+
+    def __init__(self, files: dict[str, str]):
+        self._files = {name.lower(): text for name, text in files.items()}
+        self.macros: dict[str, Macro] = {}
+        self.unknown: Counter[str] = Counter()
+        self.expanded: Counter[str] = Counter()
+
+    def process(self, name: str) -> str:
+        self.macros = {}
+        return self._expand(self._file(name), 0)
+
+    def _file(self, path: str) -> str:
+        name = re.split(r"[\\/]", path.strip())[-1].lower()
+        if name not in self._files:
+            raise CodegenError(f"cannot include '{path}'")
+        return self._files[name]
+
+    def _args(self, text: str, i: int) -> tuple[list[str], int]:
+        """Split the argument list starting at text[i] == '('."""
+        end = find_closing(text, i, "(", ")")
+        return split_args(text[i + 1:end]), end + 1
+
+    def _define(self, text: str, i: int) -> tuple[int, int]:
+        """Parse a `define at text[i:], return the index of the
+        line break ending it and the number of joined lines.
+        """
+        m = DEFINE_RE.match(text, i)
+        if not m:
+            raise CodegenError("invalid `define")
+        params = None
+        if m.group(2):
+            params = [p.strip().lower() for p in m.group(2)[1:-1].split(",") if p.strip()]
+        lines = []
+        pos = m.end()
+        joined = 0
+        while True:
+            end = text.find("\n", pos)
+            end = len(text) if end == -1 else end
+            line = strip_comments(text[pos:end]).rstrip()
+            if not line.endswith("\\"):
+                lines.append(line)
+                break
+            lines.append(line[:-1])
+            pos = end + 1
+            joined += 1
+        body = " ".join(part.strip() for part in lines if part.strip())
+        self.macros[m.group(1).lower()] = Macro(params, body)
+        return end, joined
+
+    def _substitute(self, macro: Macro, args: list[str]) -> str:
+        params = macro.params
+        if params is None:
+            return macro.body
+        if len(args) > len(params):
+            raise CodegenError(f"too many macro arguments: {args}")
+        values = dict(zip(params, args))
+
+        def repl(m: re.Match) -> str:
+            name = (m.group(1) or m.group(2)).lower()
+            if name in params:
+                return values.get(name, "")
+            return m.group(0)
+
+        return re.sub(r"`(?:\{(\w+)}|(\w+))", repl, macro.body)
+
+    def _expand(self, text: str, depth: int) -> str:
+        if depth > MAX_DEPTH:
+            raise CodegenError("macro expansion too deep")
+        out = []
+        # (parent active, branch taken) for each open `if.
+        stack: list[tuple[bool, bool]] = []
+        active = True
+        i = 0
+        while i < len(text):
+            j = skip_code(text, i)
+            if j != i:
+                out.append(text[i:j] if active else "\n" * text.count("\n", i, j))
+                i = j
+                continue
+            if text[i] != "`":
+                if active or text[i] == "\n":
+                    out.append(text[i])
+                i += 1
+                continue
+            m = MACRO_NAME_RE.match(text, i + 1)
+            if not m:
+                if active:
+                    out.append("`")
+                i += 1
+                continue
+            name = m.group(1) or m.group(2)
+            key = name.lower()
+            end = m.end()
+            num_out = len(out)
+
+            if key == "if":
+                args, end = self._args(text, end)
+                # Undefined macros expand to nothing in conditions.
+                cond = self._expand(args[0], depth + 1) if args and active else ""
+                taken = active and re.sub(r"`\w+", "", cond).strip() != ""
+                stack.append((active, taken))
+                active = taken
+            elif key == "else":
+                if not stack:
+                    raise CodegenError("`else without `if")
+                parent, taken = stack[-1]
+                active = parent and not taken
+                stack[-1] = (parent, True)
+            elif key == "endif":
+                if not stack:
+                    raise CodegenError("`endif without `if")
+                active = stack.pop()[0]
+            elif not active:
+                pass
+            elif key == "define":
+                end, joined = self._define(text, end)
+                out.append("\n" * joined)
+            elif key == "undefine":
+                args, end = self._args(text, end)
+                self.macros.pop(args[0].lower(), None)
+            elif key == "include":
+                args, end = self._args(text, end)
+                included = strip_comments(self._expand(self._file(args[0]), depth + 1))
+                out.append(" ".join(
+                    line.strip() for line in included.split("\n") if line.strip()))
+            elif key in ("isdefined", "notdefined"):
+                args, end = self._args(text, end)
+                defined = args[0].strip().lower() in self.macros
+                out.append("1" if defined == (key == "isdefined") else "")
+            elif key in self.macros:
+                macro = self.macros[key]
+                args = []
+                # Like the UnrealScript preprocessor, an argument list
+                # is consumed even if the macro has no parameters.
+                if text.startswith("(", end) and not m.group(1):
+                    args, end = self._args(text, end)
+                self.expanded[key] += 1
+                out.append(self._expand(self._substitute(macro, args), depth + 1))
+            else:
+                self.unknown[key] += 1
+                out.append(text[i:end])
+            # Argument lists may span lines, keep the line count.
+            lost = text.count("\n", i, end) - sum(s.count("\n") for s in out[num_out:])
+            out.append("\n" * lost)
+            i = end
+        if stack:
+            raise CodegenError("unterminated `if")
+        return "".join(out)
+
+
+@dataclasses.dataclass
+class InlineHelper:
+    name: str
+    class_name: str
+    params: list[str]
+    # Return expression, parameter N is written as \x00N\x00.
+    template: str
+
+    def uses(self, index: int) -> int:
+        return self.template.count(f"\x00{index}\x00")
+
+
+def _wrap(expr: str) -> str:
+    expr = expr.strip()
+    if SIMPLE_ARG_RE.fullmatch(expr) or PLACEHOLDER_RE.fullmatch(expr):
+        return expr
+    return f"({expr})"
+
+
+def _has_side_effects(expr: str) -> bool:
+    return SIDE_EFFECT_RE.search(CONVERSION_RE.sub("(", strip_comments(expr))) is not None
+
+
+def parse_inline_helpers(source: str, class_name: str) -> dict[str, InlineHelper]:
+    """Parse the @inline annotated functions of source."""
+    helpers = {}
+    for match in FUNC_HEADER_RE.finditer(source):
+        preceding = source[:match.start()].rstrip("\n").rsplit("\n", 1)[-1]
+        if not INLINE_RE.match(preceding.strip()):
+            continue
+        name = match["name"]
+        if not match["ret"]:
+            raise CodegenError(f"@inline function {name} must return a value")
+        params_start = match.end() - 1
+        params_end = find_closing(source, params_start, "(", ")")
+        body_start = source.index("{", params_end)
+        body_end = find_closing(source, body_start, "{", "}")
+
+        env: dict[str, str] = {}
+        params = []
+        for i, param in enumerate(split_args(strip_comments(source[params_start + 1:params_end]))):
+            words = param.split()
+            if len(words) != 2 or "[" in param:
+                raise CodegenError(f"@inline function {name}: unsupported parameter '{param}'")
+            params.append(words[1])
+            env[words[1].lower()] = f"\x00{i}\x00"
+
+        def subst(expr: str) -> str:
+            return IDENT_RE.sub(
+                lambda m: env.get(m.group(1).lower(), m.group(1)), expr)
+
+        template = None
+        body = strip_comments(source[body_start + 1:body_end])
+        if "{" in body:
+            raise CodegenError(f"@inline function {name}: blocks are not supported")
+        for stmt in (s.strip() for s in body.split(";")):
+            if not stmt:
+                continue
+            if template is not None:
+                raise CodegenError(f"@inline function {name}: code after return")
+            if re.match(r"local\s", stmt, re.IGNORECASE):
+                continue
+            if re.match(r"return\s", stmt, re.IGNORECASE):
+                template = " ".join(subst(stmt[len("return"):]).split())
+                continue
+            m = ASSIGN_RE.match(stmt)
+            if not m:
+                raise CodegenError(f"@inline function {name}: unsupported statement '{stmt}'")
+            target, op, value = m.group(1).lower(), m.group(2), subst(m.group(3))
+            if op:
+                value = f"{env.get(target, target)} {op} ({value})"
+            env[target] = f"({' '.join(value.split())})"
+        if template is None:
+            raise CodegenError(f"@inline function {name}: missing return")
+        helpers[name.lower()] = InlineHelper(name, class_name, params, template)
+    return helpers
+
+
+class Inliner:
+    def __init__(self, helpers: dict[str, InlineHelper]):
+        self.helpers = helpers
+        self.inlined: Counter[str] = Counter()
+        self._resolving: set[str] = set()
+        for helper in helpers.values():
+            self._resolve(helper)
+
+    def _resolve(self, helper: InlineHelper):
+        """Inline calls to other helpers in the template of helper."""
+        key = helper.name.lower()
+        if key in self._resolving:
+            raise CodegenError(f"recursive @inline function {helper.name}")
+        self._resolving.add(key)
+        helper.template = self.inline(helper.template, helper.class_name, count=False)
+        self._resolving.discard(key)
+
+    def _expand(self, helper: InlineHelper, args: list[str]) -> str | None:
+        """Return the inlined expression, or None if the call must be kept."""
+        if len(args) != len(helper.params):
+            return None
+        impure = [_has_side_effects(a) for a in args]
+        if any(impure) and not (len(args) == 1 and helper.uses(0) == 1):
+            return None
+        # All at once, the arguments may contain placeholders themselves.
+        expr = PLACEHOLDER_RE.sub(lambda m: _wrap(args[int(m.group(1))]), helper.template)
+        return f"({expr})"
+
+    def inline(self, text: str, class_name: str, count: bool = True) -> str:
+        """Inline helper calls in text, which belongs to class_name."""
+        out = []
+        pos = 0
+        i = 0
+        while i < len(text):
+            j = skip_code(text, i)
+            if j != i:
+                i = j
+                continue
+            if not (text[i].isalpha() or text[i] == "_") or \
+                    (i and (text[i - 1].isalnum() or text[i - 1] in "_.'")):
+                i += 1
+                continue
+
+            qualified = QUALIFIED_CALL_RE.match(text, i)
+            if qualified:
+                owner, name, call_end = qualified.group(1), qualified.group(2), qualified.end()
+            else:
+                m = CALL_RE.match(text, i)
+                if not m:
+                    while i < len(text) and (text[i].isalnum() or text[i] == "_"):
+                        i += 1
+                    continue
+                owner, name, call_end = class_name, m.group(1), m.end()
+
+            helper = self.helpers.get(name.lower())
+            args_start = call_end - 1
+            if helper is None or helper.class_name.lower() != owner.lower() \
+                    or re.search(r"\bfunction\s+(\w+\s+)?$", text[max(0, i - 64):i]):
+                i = args_start + 1 if not qualified else call_end
+                continue
+            if helper.name.lower() in self._resolving and not count:
+                raise CodegenError(f"recursive @inline function {helper.name}")
+
+            args_end = find_closing(text, args_start, "(", ")")
+            inner = self.inline(text[args_start + 1:args_end], class_name, count)
+            before = text[:i].rstrip()
+            after = text[args_end + 1:].lstrip()
+            is_statement = (not before or before[-1] in ";{}") and after.startswith(";")
+            expanded = None if is_statement else self._expand(
+                helper, split_args(strip_comments(inner)))
+
+            out.append(text[pos:i])
+            if expanded is None:
+                out.append(text[i:args_start + 1] + inner + ")")
+            else:
+                # The expression is on one line, keep the line count.
+                out.append(expanded + "\n" * (
+                    text.count("\n", i, args_end) - expanded.count("\n")))
+                if count:
+                    self.inlined[helper.name] += 1
+            pos = i = args_end + 1
+
+        out.append(text[pos:])
+        return "".join(out)
+
+
+@dataclasses.dataclass
+class TransformResult:
+    # Output file name -> text, .uc files only.
+    files: dict[str, str]
+    inlined: Counter[str]
+    expanded: Counter[str]
+
+
+def transform_sources(files: dict[str, str]) -> TransformResult:
+    """Preprocess and inline the .uc files of files, keyed by file name."""
+    pp = Preprocessor(files)
+    expanded: Counter[str] = Counter()
+    preprocessed = {}
+    for name in files:
+        if name.lower().endswith(".uc"):
+            preprocessed[name] = pp.process(name)
+            expanded.update(pp.expanded)
+            pp.expanded.clear()
+
+    helpers = {}
+    for name, text in preprocessed.items():
+        for key, helper in parse_inline_helpers(text, Path(name).stem).items():
+            if key in helpers:
+                raise CodegenError(f"duplicate @inline function {helper.name}")
+            helpers[key] = helper
+
+    inliner = Inliner(helpers)
+    out = {
+        name: inliner.inline(text, Path(name).stem)
+        for name, text in preprocessed.items()
+    }
+    return TransformResult(out, inliner.inlined, expanded)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        help="UnrealScript sources, including the .uci files they "
+             "include (default: all files in %s)" % CLASSES_DIR.resolve(),
+    )
+    ap.add_argument(
+        "--out-dir",
+        type=Path,
+        help="write the processed .uc files here, only files whose "
+             "content changes are written; without this, "
+             "only print statistics",
+    )
+    args = ap.parse_args()
+
+    paths = args.files or sorted(CLASSES_DIR.glob("*.uc*"))
+    try:
+        result = transform_sources({p.name: p.read_text() for p in paths})
+    except CodegenError as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for name, num in sorted(result.inlined.items()):
+        print(f"inlined {name}: {num} call sites")
+
+    if args.out_dir is None:
+        return
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, text in result.files.items():
+        dst = args.out_dir / name
+        if not dst.exists() or dst.read_text() != text:
+            dst.write_text(text)
+            written += 1
+    print(f"wrote {written} of {len(result.files)} files to {args.out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Batched XXTEA session cipher for talking to FCrypto peers.
+
+XXTEA (Corrected Block TEA) encrypts a whole buffer of n >= 2 32-bit
+words as a single block. Words are little-endian, like
+FCryptoEncDec.Dec32LE, and keys are 16 bytes. Plaintexts are padded
+with PKCS #7 to a multiple of PAD_BLOCK bytes, which also guarantees
+the two word minimum.
+
+All arithmetic is modulo 2^32, so the results are bit-identical to an
+UnrealScript implementation on signed 32-bit ints, where the unsigned
+shifts of the reference code are >>> (see test_xxtea.py).
+
+Many independent sessions are processed in one call: the word buffers
+of all sessions are concatenated into one array with per-session
+offsets and keys, and a numba kernel loops over them, so the per
+message Python overhead is paid once per batch instead.
+
+Long payloads are split into CHUNK_SIZE byte chunks that are encrypted
+as independent XXTEA blocks (StreamEncryptor, StreamDecryptor). The
+chunk index is mixed into the last key word, so equal chunks do not
+encrypt to equal ciphertexts. Only the final chunk is padded.
+
+Usage:
+    python xxtea.py --benchmark      # MB/s per core.
+"""
+
+import argparse
+import time
+from typing import Sequence
+
+import numba
+import numpy as np
+
+DELTA = 0x9E3779B9
+KEY_SIZE = 16
+PAD_BLOCK = 8
+CHUNK_SIZE = 4096
+
+_M = 0xFFFFFFFF
+
+
+class XXTEAError(Exception):
+    pass
+
+
+@numba.njit(cache=False)
+def _encrypt_kernel(v: np.ndarray, offsets: np.ndarray, keys: np.ndarray):
+    m = np.int64(_M)
+    for s in range(len(offsets) - 1):
+        start = offsets[s]
+        n = offsets[s + 1] - start
+        if n < 2:
+            continue
+        k = keys[s].astype(np.int64)
+        total = np.int64(0)
+        z = np.int64(v[start + n - 1])
+        for _ in range(6 + 52 // n):
+            total = (total + DELTA) & m
+            e = (total >> 2) & 3
+            for p in range(n):
+                # The last word wraps around to the (updated) first one.
+                y = np.int64(v[start + p + 1] if p < n - 1 else v[start])
+                mx = (((z >> 5) ^ ((y << 2) & m)) + ((y >> 3) ^ ((z << 4) & m))) \
+                    ^ ((total ^ y) + (k[(p & 3) ^ e] ^ z))
+                z = (np.int64(v[start + p]) + mx) & m
+                v[start + p] = z
+
+
+@numba.njit(cache=False)
+def _decrypt_kernel(v: np.ndarray, offsets: np.ndarray, keys: np.ndarray):
+    m = np.int64(_M)
+    for s in range(len(offsets) - 1):
+        start = offsets[s]
+        n = offsets[s + 1] - start
+        if n < 2:
+            continue
+        k = keys[s].astype(np.int64)
+        rounds = 6 + 52 // n
+        total = (rounds * np.int64(DELTA)) & m
+        y = np.int64(v[start])
+        for _ in range(rounds):
+            e = (total >> 2) & 3
+            for p in range(n - 1, -1, -1):
+                z = np.int64(v[start + p - 1] if p > 0 else v[start + n - 1])
+                mx = (((z >> 5) ^ ((y << 2) & m)) + ((y >> 3) ^ ((z << 4) & m))) \
+                    ^ ((total ^ y) + (k[(p & 3) ^ e] ^ z))
+                y = (np.int64(v[start + p]) - mx) & m
+                v[start + p] = y
+            total = (total - DELTA) & m
+
+
+def key_words(key: bytes) -> np.ndarray:
+    if len(key) != KEY_SIZE:
+        raise XXTEAError(f"key must be {KEY_SIZE} bytes, got {len(key)}")
+    return np.frombuffer(key, dtype="<u4").astype(np.uint32)
+
+
+def _check_batch(v: np.ndarray, offsets: np.ndarray, keys: np.ndarray):
+    if v.dtype != np.uint32 or offsets.dtype != np.int64 or keys.dtype != np.uint32:
+        raise XXTEAError("expected uint32 words and keys and int64 offsets")
+    if keys.shape != (len(offsets) - 1, 4):
+        raise XXTEAError("expected one key per session")
+    if np.any(np.diff(offsets) < 2):
+        raise XXTEAError("XXTEA needs at least two words per session")
+
+
+def encrypt_words(v: np.ndarray, offsets: np.ndarray, keys: np.ndarray):
+    """Encrypt in place the sessions v[offsets[i]:offsets[i + 1]]
+    with keys[i] (shape (sessions, 4)).
+    """
+    _check_batch(v, offsets, keys)
+    _encrypt_kernel(v, offsets, keys)
+
+
+def decrypt_words(v: np.ndarray, offsets: np.ndarray, keys: np.ndarray):
+    """Inverse of encrypt_words."""
+    _check_batch(v, offsets, keys)
+    _decrypt_kernel(v, offsets, keys)
+
+
+def pad(data: bytes) -> bytes:
+    n = PAD_BLOCK - len(data) % PAD_BLOCK
+    return data + bytes([n]) * n
+
+
+def unpad(data: bytes) -> bytes:
+    n = data[-1] if data else 0
+    if not 1 <= n <= PAD_BLOCK or data[-n:] != bytes([n]) * n:
+        raise XXTEAError("invalid padding")
+    return data[:-n]
+
+
+def _pack(buffers: Sequence[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    sizes = np.fromiter((len(b) for b in buffers), dtype=np.int64, count=len(buffers))
+    if np.any(sizes % 4):
+        raise XXTEAError("buffer sizes must be multiples of 4 bytes")
+    offsets = np.zeros(len(buffers) + 1, dtype=np.int64)
+    np.cumsum(sizes // 4, out=offsets[1:])
+    v = np.frombuffer(b"".join(buffers), dtype="<u4").astype(np.uint32)
+    return v, offsets
+
+
+def _unpack(v: np.ndarray, offsets: np.ndarray) -> list[bytes]:
+    data = v.astype("<u4").tobytes()
+    return [data[4 * a:4 * b] for a, b in zip(offsets[:-1], offsets[1:])]
+
+
+def _keys(keys: Sequence[bytes]) -> np.ndarray:
+    if any(len(k) != KEY_SIZE for k in keys):
+        raise XXTEAError(f"keys must be {KEY_SIZE} bytes")
+    return np.frombuffer(b"".join(keys), dtype="<u4").astype(np.uint32).reshape(-1, 4)
+
+
+def encrypt_many(keys: Sequence[bytes], plaintexts: Sequence[bytes]) -> list[bytes]:
+    """Pad and encrypt plaintexts[i] with keys[i], in one batch."""
+    if len(keys) != len(plaintexts):
+        raise XXTEAError("expected one key per plaintext")
+    v, offsets = _pack([pad(p) for p in plaintexts])
+    encrypt_words(v, offsets, _keys(keys))
+    return _unpack(v, offsets)
+
+
+def decrypt_many(keys: Sequence[bytes], ciphertexts: Sequence[bytes]) -> list[bytes]:
+    """Decrypt and unpad ciphertexts[i] with keys[i], in one batch."""
+    if len(keys) != len(ciphertexts):
+        raise XXTEAError("expected one key per ciphertext")
+    if any(len(c) < PAD_BLOCK or len(c) % PAD_BLOCK for c in ciphertexts):
+        raise XXTEAError(f"ciphertext sizes must be multiples of {PAD_BLOCK} bytes")
+    v, offsets = _pack(ciphertexts)
+    decrypt_words(v, offsets, _keys(keys))
+    return [unpad(p) for p in _unpack(v, offsets)]
+
+
+def encrypt(key: bytes, plaintext: bytes) -> bytes:
+    return encrypt_many([key], [plaintext])[0]
+
+
+def decrypt(key: bytes, ciphertext: bytes) -> bytes:
+    return decrypt_many([key], [ciphertext])[0]
+
+
+class _Stream:
+    def __init__(self, key: bytes, chunk_size: int = CHUNK_SIZE):
+        if chunk_size < PAD_BLOCK or chunk_size % PAD_BLOCK:
+            raise XXTEAError(f"chunk size must be a multiple of {PAD_BLOCK}")
+        self._key = key_words(key)
+        self._chunk_size = chunk_size
+        self._buf = bytearray()
+        self._index = 0
+        self._finished = False
+
+    def _process(self, chunks: list[bytes], decrypt_: bool) -> bytes:
+        if not chunks:
+            return b""
+        keys = np.tile(self._key, (len(chunks), 1))
+        keys[:, 3] ^= np.arange(self._index, self._index + len(chunks), dtype=np.uint32)
+        self._index += len(chunks)
+        v, offsets = _pack(chunks)
+        if decrypt_:
+            decrypt_words(v, offsets, keys)
+        else:
+            encrypt_words(v, offsets, keys)
+        return v.astype("<u4").tobytes()
+
+    def _take(self, keep: int) -> list[bytes]:
+        """Remove whole chunks from the buffer, leaving at least keep bytes."""
+        count = max(0, (len(self._buf) - keep) // self._chunk_size)
+        size = count * self._chunk_size
+        chunks = [
+            bytes(self._buf[i:i + self._chunk_size])
+            for i in range(0, size, self._chunk_size)
+        ]
+        del self._buf[:size]
+        return chunks
+
+    def _check(self):
+        if self._finished:
+            raise XXTEAError("stream already finalized")
+
+
+class StreamEncryptor(_Stream):
+    """Encrypts a long payload incrementally. The output of all update
+    calls followed by finalize is the ciphertext.
+    """
+
+    def update(self, data: bytes) -> bytes:
+        self._check()
+        self._buf += data
+        return self._process(self._take(0), False)
+
+    def finalize(self) -> bytes:
+        self._check()
+        self._finished = True
+        return self._process([pad(bytes(self._buf))], False)
+
+
+class StreamDecryptor(_Stream):
+    """Inverse of StreamEncryptor, the chunk size must match."""
+
+    def update(self, data: bytes) -> bytes:
+        self._check()
+        self._buf += data
+        # The last chunk holds the padding, keep it for finalize.
+        return self._process(self._take(1), True)
+
+    def finalize(self) -> bytes:
+        self._check()
+        self._finished = True
+        if len(self._buf) < PAD_BLOCK or len(self._buf) % PAD_BLOCK:
+            raise XXTEAError("truncated stream")
+        return unpad(self._process([bytes(self._buf)], True))
+
+
+def benchmark(
+        session_size: int = 256,
+        sessions: int = 4096,
+        stream_size: int = 1 << 24,
+        repeat: int = 3,
+) -> dict[str, float]:
+    """Best-of-repeat single thread throughput in MB/s."""
+    rng = np.random.default_rng(0)
+    keys = [rng.bytes(KEY_SIZE) for _ in range(sessions)]
+    plaintexts = [rng.bytes(session_size) for _ in range(sessions)]
+    payload = rng.bytes(stream_size)
+    ciphertexts = encrypt_many(keys, plaintexts)
+
+    def stream():
+        enc = StreamEncryptor(keys[0])
+        enc.update(payload)
+        enc.finalize()
+
+    cases = {
+        f"encrypt_many {sessions}x{session_size}B":
+            (lambda: encrypt_many(keys, plaintexts), sessions * session_size),
+        f"decrypt_many {sessions}x{session_size}B":
+            (lambda: decrypt_many(keys, ciphertexts), sessions * session_size),
+        f"stream {stream_size >> 20}MB": (stream, stream_size),
+    }
+    result = {}
+    for name, (func, size) in cases.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        result[name] = size / best / 1e6
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="print single core throughput in MB/s",
+    )
+    args = ap.parse_args()
+    if args.benchmark:
+        # Compile the kernels outside of the measurement.
+        decrypt(bytes(KEY_SIZE), encrypt(bytes(KEY_SIZE), b""))
+        for name, mbps in benchmark().items():
+            print(f"{name:<28} {mbps:8.1f} MB/s")
+    else:
+        ap.print_help()
+
+
+if __name__ == "__main__":
+    main()
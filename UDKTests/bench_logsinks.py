@@ -0,0 +1,143 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks the per-line cost of logging UDK log lines.
+
+A synthetic log (see bench_logtail.py) is written in flush sized blocks
+and each block is tailed and classified, then logged. The "sync" method
+is the previous behaviour: NFKD normalization and one loguru call per
+line on the tailing thread, with blocking console and file sinks. The
+"forwarded" method is the current one, blocks are handed to a
+UdkLogForwarder and sinks are enqueued. Reported are the time spent on
+the tailing thread per line, which delays phase end and error detection,
+and the total time until everything has been written.
+
+Usage:
+    python bench_logsinks.py --size-mb 50 --flush-kb 64
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+
+from loguru import logger
+
+import logsinks
+from bench_logtail import generate_blocks
+from logtail import LogTailer
+from logtail import classify
+
+
+def sync_setup(log_file: Path, console):
+    logger.remove()
+    logger.add(console, format=logsinks.LOG_FORMAT, level="DEBUG")
+    logger.add(log_file, format=logsinks.LOG_FORMAT, level="DEBUG")
+
+
+def sync_process(text: str):
+    text = unicodedata.normalize("NFKD", text)
+    for line in text.splitlines():
+        logger.info(line.strip())
+
+
+def run(
+        name: str,
+        blocks: list[bytes],
+        tmp_dir: Path,
+        console,
+) -> tuple[float, float, int]:
+    log_file = tmp_dir / f"{name}.log"
+    log_file.write_bytes(b"")
+    out_file = tmp_dir / f"{name}.out.log"
+    forwarder = None
+    if name == "sync":
+        sync_setup(out_file, console)
+        process = sync_process
+    else:
+        logsinks.setup_logging(out_file, normalize=True, stream=console)
+        forwarder = logsinks.UdkLogForwarder()
+        process = forwarder.write
+
+    tailer = LogTailer(log_file)
+    lines = 0
+    elapsed = 0.0
+    start_total = time.perf_counter()
+    with log_file.open("ab", buffering=0) as f:
+        for block in blocks:
+            f.write(block)
+            start = time.perf_counter()
+            text = tailer.read()
+            for _ in classify(text):
+                pass
+            process(text)
+            elapsed += time.perf_counter() - start
+            lines += text.count("\n")
+    if forwarder is not None:
+        forwarder.close()
+    logger.remove()
+    total = time.perf_counter() - start_total
+    tailer.close()
+    return elapsed, total, lines
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--size-mb",
+        type=int,
+        default=50,
+        help="synthetic log size in megabytes (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--flush-kb",
+        type=int,
+        default=64,
+        help="bytes written per flush in kilobytes (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="random seed (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    blocks = generate_blocks(args.size_mb * 1024 * 1024, args.flush_kb * 1024, args.seed)
+    size_mb = sum(len(b) for b in blocks) / (1024 * 1024)
+    print(f"log size: {size_mb:.1f} MB in {len(blocks)} flushes")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as console:
+        for name in ("sync", "forwarded"):
+            elapsed, total, lines = run(name, blocks, Path(tmp), console)
+            results[name] = elapsed
+            print(f"{name:>10}: {elapsed / lines * 1e6:8.2f} us/line on the tailing thread, "
+                  f"{total:8.3f} s total ({lines} lines)")
+
+    print(f"tailing thread speedup: {results['sync'] / results['forwarded']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks UDK log processing on a synthetic log file.
+
+The log is appended to in flush sized blocks, like UDK does with
+-FORCELOGFLUSH, and each block is processed before the next one is
+written. Only processing time is measured. The "legacy" method is the
+previous LogWatcher implementation: a file handle opened per file system
+event, readline() and separate regular expressions per line.
+
+Usage:
+    python bench_logtail.py --size-mb 300 --flush-kb 64
+"""
+
+import argparse
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from logtail import LogTailer
+from logtail import classify
+
+LOG_RE = re.compile(r"^\[[\d.]+]\s(\w+):(.*)$")
+ARRAY_OOB_ACCESS_RE = re.compile(
+    r"^.*ScriptWarning:\sAccessed\sarray\s'\w+'\sout\sof\sbounds\s\([\d/]+\)")
+
+LINE_TEMPLATES = [
+    (0.90, "ScriptLog: [FCryptoTestMutator] TestMath: {n} {hex}"),
+    (0.05, "Log: Loaded package {hex}"),
+    (0.03, "DevNet: Connection {n} {hex}"),
+    (0.01, "Warning: Suspicious value {n}"),
+    (0.005, "ScriptWarning: Accessed array 'Arr' out of bounds ({n}/16)"),
+    (0.005, "Error: Something failed {n}"),
+]
+
+
+def generate_blocks(size: int, flush_size: int, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    weights = [w for w, _ in LINE_TEMPLATES]
+    templates = [t for _, t in LINE_TEMPLATES]
+    blocks = []
+    block: list[str] = []
+    block_size = 0
+    total = 0
+    clock = 0.0
+    while total < size:
+        clock += 0.01
+        template = rng.choices(templates, weights)[0]
+        line = f"[{clock:09.2f}] " + template.format(
+            n=rng.randrange(1 << 16), hex=rng.randbytes(rng.randrange(4, 48)).hex())
+        block.append(line)
+        block_size += len(line) + 1
+        if block_size >= flush_size:
+            blocks.append(("\n".join(block) + "\n").encode("utf-8"))
+            total += block_size
+            block = []
+            block_size = 0
+    # Ends with a line that is split across two blocks.
+    last = blocks.pop()
+    cut = len(last) // 2
+    blocks.extend((last[:cut], last[cut:]))
+    return blocks
+
+
+class LegacyWatcher:
+    def __init__(self, log_file: Path):
+        self._log_file = log_file
+        self._fh = None
+        self._pos = 0
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def on_event(self):
+        # Previous on_any_event() + on_modified() behaviour.
+        if self._fh:
+            self._fh.close()
+        self._fh = open(self._log_file, errors="replace", encoding="utf-8")
+        self._fh.seek(self._pos)
+        while line := self._fh.readline():
+            self._pos = self._fh.tell()
+            if match := LOG_RE.match(line):
+                if match.group(1).lower() == "error":
+                    if match.group(2):
+                        self.errors.append(line)
+                elif "##ERROR##" in match.group(2):
+                    self.errors.append(line)
+                elif ARRAY_OOB_ACCESS_RE.match(line):
+                    self.errors.append(line)
+                elif match.group(1).lower() == "warning":
+                    if match.group(2):
+                        self.warnings.append(line)
+            _ = "Log file closed" in line
+            _ = "Exit: Exiting" in line
+
+    def close(self):
+        if self._fh:
+            self._fh.close()
+
+
+class TailWatcher:
+    def __init__(self, log_file: Path):
+        self._tailer = LogTailer(log_file)
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def on_event(self):
+        for log_line in classify(self._tailer.read()):
+            if log_line.kind == "error":
+                self.errors.append(log_line.line)
+            elif log_line.kind == "warning":
+                self.warnings.append(log_line.line)
+
+    def close(self):
+        self._tailer.close()
+
+
+def run(
+        name: str,
+        make_watcher: Callable[[Path], LegacyWatcher | TailWatcher],
+        blocks: list[bytes],
+        tmp_dir: Path,
+) -> tuple[float, int, int]:
+    log_file = tmp_dir / f"{name}.log"
+    log_file.write_bytes(b"")
+    watcher = make_watcher(log_file)
+    elapsed = 0.0
+    with log_file.open("ab", buffering=0) as f:
+        for block in blocks:
+            f.write(block)
+            start = time.perf_counter()
+            watcher.on_event()
+            elapsed += time.perf_counter() - start
+    watcher.close()
+    log_file.unlink()
+    return elapsed, len(watcher.errors), len(watcher.warnings)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--size-mb",
+        type=int,
+        default=300,
+        help="synthetic log size in megabytes (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--flush-kb",
+        type=int,
+        default=64,
+        help="bytes written per flush in kilobytes (default: %(default)s)",
+    )
+    ap.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="random seed (default: %(default)s)",
+    )
+    args = ap.parse_args()
+
+    blocks = generate_blocks(args.size_mb * 1024 * 1024, args.flush_kb * 1024, args.seed)
+    size_mb = sum(len(b) for b in blocks) / (1024 * 1024)
+    print(f"log size: {size_mb:.1f} MB in {len(blocks)} flushes")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make_watcher in (("legacy", LegacyWatcher), ("tail", TailWatcher)):
+            elapsed, errors, warnings = run(name, make_watcher, blocks, Path(tmp))
+            results[name] = elapsed
+            print(f"{name:>8}: {elapsed:8.3f} s {size_mb / elapsed:8.1f} MB/s "
+                  f"({errors} errors, {warnings} warnings)")
+
+    print(f"speedup: {results['legacy'] / results['tail']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Comparison tables of FCryptoBenchmarkMutator results.
+
+Results are RunTimings.benchmarks, Clock() times per iteration keyed
+by "op|kind|size|mode" (see timings.py). The fastest sample of each
+case is used, slower samples are interference from the rest of the
+engine. Two tables are produced:
+
+- array kind: dynamic versus static arrays for each op, size and mode,
+- call overhead: called versus inlined loops for each op, size and kind.
+
+A ratio above 1 means the second variant (dynamic, call) is slower.
+"""
+
+from dataclasses import dataclass
+
+# Axis -> (base variant, compared variant).
+AXES = {
+    "kind": ("static", "dynamic"),
+    "mode": ("inline", "call"),
+}
+FIELDS = ("op", "kind", "size", "mode")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    # Values of the other axes, in FIELDS order without the compared axis.
+    group: tuple[str, ...]
+    base: float | None
+    other: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.base or self.other is None:
+            return None
+        return self.other / self.base
+
+
+def best_times(benchmarks: dict[str, list[float]]) -> dict[tuple[str, ...], float]:
+    return {
+        tuple(case.split("|")): min(samples)
+        for case, samples in benchmarks.items() if samples
+    }
+
+
+def _sort_key(group: tuple[str, ...]) -> tuple:
+    return tuple(int(v) if v.isdigit() else v for v in group)
+
+
+def compare(benchmarks: dict[str, list[float]], axis: str) -> list[Comparison]:
+    base_name, other_name = AXES[axis]
+    index = FIELDS.index(axis)
+    groups: dict[tuple[str, ...], dict[str, float]] = {}
+    for key, value in best_times(benchmarks).items():
+        group = key[:index] + key[index + 1:]
+        groups.setdefault(group, {})[key[index]] = value
+    return [
+        Comparison(group, variants.get(base_name), variants.get(other_name))
+        for group, variants in sorted(groups.items(), key=lambda x: _sort_key(x[0]))
+    ]
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def format_table(comparisons: list[Comparison], axis: str) -> list[str]:
+    base_name, other_name = AXES[axis]
+    headers = [f for f in FIELDS if f != axis] + [base_name, other_name, "ratio"]
+    rows = [
+        [*c.group, _fmt(c.base, ".4g"), _fmt(c.other, ".4g"), _fmt(c.ratio, ".2f")]
+        for c in comparisons
+    ]
+    widths = [max(len(r[i]) for r in [headers, *rows]) for i in range(len(headers))]
+    return [
+        "  ".join(cell.rjust(w) for cell, w in zip(row, widths))
+        for row in [headers, *rows]
+    ]
+
+
+def report(benchmarks: dict[str, list[float]]) -> list[str]:
+    """Both comparison tables as lines of text."""
+    lines = ["benchmark Clock() time per iteration, array kind:"]
+    lines += format_table(compare(benchmarks, "kind"), "kind")
+    lines += ["benchmark Clock() time per iteration, call overhead:"]
+    lines += format_table(compare(benchmarks, "mode"), "mode")
+    return lines
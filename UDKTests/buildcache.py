@@ -0,0 +1,116 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Content-hash manifests for incremental UnrealScript builds.
+
+The manifest maps each build input (FCrypto .uc/.uci sources and the
+config files that affect compilation) to its SHA-256 digest. The
+manifest of the last successful build is stored in the harness cache
+together with a stamp of the compiled package. A build is fresh, and
+can be skipped, when the current manifest equals the stored one and the
+compiled package still has the stamp it had after that build.
+
+Only sources whose digest changed (or which are missing from the
+destination directory) are copied. Sources removed since the last build
+are removed from the destination directory too.
+"""
+
+import hashlib
+import shutil
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+# Config manifest keys are prefixed to keep them apart from source names.
+CONFIG_PREFIX = "config:"
+
+
+def hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def package_stamp(package_file: Path) -> str:
+    """Size and modification time of the compiled package,
+    or an empty string if the package does not exist.
+    """
+    try:
+        st = package_file.stat()
+    except FileNotFoundError:
+        return ""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def build_manifest(sources: list[Path], config_files: list[Path]) -> dict[str, str]:
+    names = [src.name for src in sources]
+    if len(set(names)) != len(names):
+        raise ValueError("duplicate source file names")
+    manifest = {src.name: hash_file(src) for src in sources}
+    for cfg in config_files:
+        manifest[CONFIG_PREFIX + cfg.name] = hash_file(cfg) if cfg.exists() else ""
+    return manifest
+
+
+@dataclass
+class BuildPlan:
+    manifest: dict[str, str]
+    changed: list[Path] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    fresh: bool = False
+
+
+def plan_build(
+        sources: list[Path],
+        config_files: list[Path],
+        dst_dir: Path,
+        package_file: Path,
+        old_manifest: dict[str, str],
+        old_package_stamp: str,
+) -> BuildPlan:
+    manifest = build_manifest(sources, config_files)
+    plan = BuildPlan(manifest=manifest)
+    plan.changed = [
+        src for src in sources
+        if old_manifest.get(src.name) != manifest[src.name]
+           or not (dst_dir / src.name).exists()
+    ]
+    plan.removed = sorted(
+        name for name in old_manifest
+        if not name.startswith(CONFIG_PREFIX) and name not in manifest
+    )
+    plan.fresh = (
+            not plan.changed
+            and not plan.removed
+            and manifest == old_manifest
+            and old_package_stamp != ""
+            and package_stamp(package_file) == old_package_stamp
+    )
+    return plan
+
+
+def apply_sources(plan: BuildPlan, dst_dir: Path):
+    """Copy changed sources to dst_dir and remove deleted ones."""
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    for src in plan.changed:
+        shutil.copy2(src, dst_dir / src.name)
+    for name in plan.removed:
+        (dst_dir / name).unlink(missing_ok=True)
@@ -27,7 +27,52 @@ _FILE_DIR = Path(__file__).parent
 UDK_TEST_TIMEOUT = 300
 UDK_LITE_TAG = "1.0.2"
 UDK_LITE_ROOT = "./UDK-Lite/"
+# Overlay of UDK_LITE_ROOT the tests are run in,
+# run directly in UDK_LITE_ROOT when empty.
+UDK_RUN_TREE = "./.cache/trees/0/"
 UDK_LITE_RELEASE_URL = (f"https://github.com/tuokri/UDK-Lite/releases/download/{UDK_LITE_TAG}/UDK"
                         f"-Lite-{UDK_LITE_TAG}.7z")
+# Expected SHA-256 of the release archive, not checked when empty.
+UDK_LITE_SHA256 = ""
+UDK_LITE_DOWNLOAD_SEGMENTS = 4
 FCRYPTO_CLASSES_FILES = _FILE_DIR / "../Classes/*.uc*"
 FCRYPTO_NUM_TEST_LOOPS = 4
+# Compiled package, relative to UDK_LITE_ROOT.
+FCRYPTO_PACKAGE_FILE = "UDKGame/Unpublished/CookedPC/Script/FCrypto.u"
+# Overrides the UDK.com make command line when not empty.
+UDK_MAKE_COMMAND = ""
+# Overrides the UDK.com server command line when not empty,
+# the server URL is appended to it.
+UDK_SERVER_COMMAND = ""
+# Number of UDK server instances the test loops are split between.
+FCRYPTO_TEST_SHARDS = 1
+# GMP server port of the first shard, incremented for each shard.
+FCRYPTO_GMP_BASE_PORT = 65432
+# Game port of the first shard, incremented for each shard.
+UDK_SERVER_BASE_PORT = 7777
+# Test timing history, JSON lines, relative to this directory.
+FCRYPTO_TIMINGS_FILE = "./timings.jsonl"
+# Performance regression gate: "off", "warn" or "fail".
+FCRYPTO_PERF_GATE = "warn"
+# Comma separated test suites whose regressions fail the run
+# when FCRYPTO_PERF_GATE is "fail".
+FCRYPTO_PERF_HOT_SUITES = "TestMath,TestAesCt,TestSpeed"
+# Abort a phase on the first error line.
+UDK_FAIL_FAST = "0"
+# Abort a phase if the log has not grown in this many seconds, 0 disables.
+UDK_STALL_TIMEOUT = 60
+# Adaptive phase timeouts are the 95th percentile of previous
+# durations times this margin, capped at UDK_TEST_TIMEOUT.
+UDK_TIMEOUT_MARGIN = 2.0
+# Test suites to run: "auto" runs the suites affected by the sources
+# changed since the last passing run, "all" or comma separated names.
+FCRYPTO_TEST_SELECTION = "auto"
+# Show every UDK log line on the console, not only in the log file.
+UDK_LOG_VERBOSE = "0"
+# Inline small FCryptoBigInt helpers in the compiled sources,
+# see DevUtils/uscript_inline.py. Off by default so that the
+# sources are compiled as they are shipped.
+FCRYPTO_INLINE = "0"
+# Run FCryptoBenchmarkMutator (see DevUtils/bench_codegen.py) with
+# the tests and log comparison tables of its results.
+FCRYPTO_BENCHMARK = "0"
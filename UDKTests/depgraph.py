@@ -0,0 +1,193 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Change impact analysis for selecting FCryptoTestMutator test suites.
+
+The dependency graph has a node for each UnrealScript source file
+(.uc class or .uci macro include). A file depends on:
+
+- the files it `include()s,
+- the .uci files that define the macros it uses,
+- the classes it references by name, e.g. class'X'.static.Foo(),
+  `extends X` or `local X.SomeStruct S`.
+
+The test suites of the mutator (its `int TestXxx()` functions) depend
+on what their bodies, and the bodies of the mutator functions they
+call, reference. A class member variable of a class type (e.g. Utils)
+counts as a reference to that class.
+
+A suite is affected by a set of changed files if it depends on one of
+them, directly or transitively. Changes that cannot be attributed to
+individual suites, e.g. to the mutator itself or to unknown files,
+affect all suites.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+MUTATOR_CLASS = "FCryptoTestMutator"
+
+COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+INCLUDE_RE = re.compile(r"`include\(\s*([^)]+?)\s*\)")
+DEFINE_RE = re.compile(r"`define\s+(\w+)")
+MACRO_USE_RE = re.compile(r"`(\w+)")
+IDENT_RE = re.compile(r"\b[A-Za-z_]\w*\b")
+FUNCTION_RE = re.compile(
+    r"^[ \t]*(?:\w+[ \t]+)*(?:function|event)[ \t]+(?:[\w<>.]+[ \t]+)?(\w+)[ \t]*\(",
+    re.MULTILINE,
+)
+TEST_FUNCTION_RE = re.compile(r"\bint\s+(Test\w+)\s*\(\s*\)")
+MEMBER_VAR_RE = re.compile(
+    r"^[ \t]*var(?:\([^)]*\))?[ \t]+(?:\w+[ \t]+)*?(\w+)[ \t]+(\w+)[ \t]*;",
+    re.MULTILINE,
+)
+
+
+def strip_code(text: str) -> str:
+    """Remove comments and string literals."""
+    text = COMMENT_RE.sub(" ", text)
+    return STRING_RE.sub('""', text)
+
+
+def _function_bodies(text: str) -> dict[str, str]:
+    """Function name -> body, for code with braces on their own
+    lines at the start of the line, as in FCryptoTestMutator.
+    """
+    bodies = {}
+    for m in FUNCTION_RE.finditer(text):
+        start = text.find("\n{", m.end())
+        end = text.find("\n}", start + 1)
+        if start == -1 or end == -1:
+            continue
+        bodies[m.group(1)] = text[start:end]
+    return bodies
+
+
+@dataclass
+class DependencyGraph:
+    # File name -> names of files it depends on directly.
+    deps: dict[str, set[str]] = field(default_factory=dict)
+    # Class name -> file name.
+    classes: dict[str, str] = field(default_factory=dict)
+    # Macro name -> files defining it.
+    macros: dict[str, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_files(cls, files: list[Path]) -> "DependencyGraph":
+        graph = cls()
+        texts = {f.name: strip_code(f.read_text(encoding="utf-8", errors="replace"))
+                 for f in files}
+        graph.classes = {Path(name).stem: name for name in texts if name.endswith(".uc")}
+        macros: dict[str, set[str]] = defaultdict(set)
+        for name, text in texts.items():
+            for m in DEFINE_RE.finditer(text):
+                macros[m.group(1)].add(name)
+        graph.macros = dict(macros)
+        for name, text in texts.items():
+            graph.deps[name] = graph.references(text) - {name}
+        return graph
+
+    def references(self, code: str) -> set[str]:
+        """Files referenced by code."""
+        refs = set()
+        for m in INCLUDE_RE.finditer(code):
+            refs.add(m.group(1).replace("\\", "/").rsplit("/", 1)[-1])
+        for m in MACRO_USE_RE.finditer(code):
+            refs.update(self.macros.get(m.group(1), ()))
+        for ident in set(IDENT_RE.findall(code)):
+            if ident in self.classes:
+                refs.add(self.classes[ident])
+        return refs
+
+    def affected(self, changed: set[str]) -> set[str]:
+        """Changed files and all files that depend on them."""
+        dependents: dict[str, set[str]] = defaultdict(set)
+        for name, deps in self.deps.items():
+            for dep in deps:
+                dependents[dep].add(name)
+        result = set(changed)
+        stack = list(changed)
+        while stack:
+            for dependent in dependents[stack.pop()]:
+                if dependent not in result:
+                    result.add(dependent)
+                    stack.append(dependent)
+        return result
+
+
+def test_dependencies(graph: DependencyGraph, mutator_file: Path) -> dict[str, set[str]]:
+    """Test suite name -> files it depends on directly."""
+    code = strip_code(mutator_file.read_text(encoding="utf-8", errors="replace"))
+    bodies = _function_bodies(code)
+    member_classes = {
+        var: graph.classes[type_] for type_, var in MEMBER_VAR_RE.findall(code)
+        if type_ in graph.classes
+    }
+
+    def reachable(func: str) -> set[str]:
+        seen = {func}
+        stack = [func]
+        while stack:
+            for ident in set(IDENT_RE.findall(bodies[stack.pop()])):
+                if ident in bodies and ident not in seen:
+                    seen.add(ident)
+                    stack.append(ident)
+        return seen
+
+    tests = {}
+    for test in TEST_FUNCTION_RE.findall(code):
+        if test not in bodies:
+            continue
+        deps = set()
+        for func in reachable(test):
+            body = bodies[func]
+            deps |= graph.references(body)
+            deps.update(member_classes[i] for i in set(IDENT_RE.findall(body))
+                        if i in member_classes)
+        deps.discard(mutator_file.name)
+        tests[test] = deps
+    return tests
+
+
+def select_tests(files: list[Path], changed: set[str]) -> list[str] | None:
+    """Return the names of the test suites affected by the changed
+    files, or None if all suites should be run.
+    """
+    by_name = {f.name: f for f in files}
+    mutator_name = f"{MUTATOR_CLASS}.uc"
+    if mutator_name not in by_name or mutator_name in changed:
+        return None
+    if not changed <= by_name.keys():
+        # Removed or unknown files.
+        return None
+
+    graph = DependencyGraph.from_files(files)
+    # Classes referencing the mutator (e.g. FCryptoGMPClient calling back
+    # into it) must not make every change affect every user of the class.
+    del graph.deps[mutator_name]
+    affected = graph.affected(changed)
+    tests = test_dependencies(graph, by_name[mutator_name])
+    return sorted(name for name, deps in tests.items() if deps & affected)
@@ -0,0 +1,338 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Resumable, checksum-verified downloads and a content-addressed
+archive cache.
+
+Downloads are written to a "<name>.part" file next to the target.
+If the server supports HTTP Range requests, an interrupted download is
+resumed from where it left off, both within a run (transport errors
+are retried) and across runs. Single stream downloads are hashed while
+they are written. Large files can optionally be downloaded as parallel
+ranged segments, whose progress is kept in a "<name>.part.json" state
+file. Segments complete out of order, so the file is hashed once after
+all of them are done.
+
+ArchiveCache stores downloaded files as "<root>/<tag>/<sha256>/<name>",
+so previously downloaded tags are reused without downloading again.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx2
+import tqdm
+from loguru import logger
+
+CHUNK_SIZE = 1024 * 1024
+# Files smaller than this per segment are not worth segmenting.
+MIN_SEGMENT_SIZE = 8 * CHUNK_SIZE
+DEFAULT_RETRIES = 5
+TIMEOUT = 120.0
+
+
+class DigestMismatchError(Exception):
+    pass
+
+
+@dataclass
+class RemoteInfo:
+    size: int | None
+    accept_ranges: bool
+
+
+def hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def probe(client: httpx2.Client, url: str) -> RemoteInfo:
+    resp = client.head(url)
+    resp.raise_for_status()
+    size = resp.headers.get("Content-Length")
+    return RemoteInfo(
+        size=int(size) if size is not None else None,
+        accept_ranges=resp.headers.get("Accept-Ranges", "").lower() == "bytes",
+    )
+
+
+class _Progress:
+    def __init__(self, total: int | None, initial: int, enabled: bool):
+        self._lock = threading.Lock()
+        self._bar = None
+        if enabled:
+            self._bar = tqdm.tqdm(
+                total=total, initial=initial, unit_scale=True,
+                unit_divisor=1024, unit="B")
+
+    def update(self, n: int):
+        if self._bar is not None:
+            with self._lock:
+                self._bar.update(n)
+
+    def close(self):
+        if self._bar is not None:
+            self._bar.close()
+
+
+def _download_single(
+        client: httpx2.Client,
+        url: str,
+        part: Path,
+        info: RemoteInfo,
+        chunk_size: int,
+        retries: int,
+        progress_bar: bool,
+) -> str:
+    hasher = hashlib.sha256()
+    pos = 0
+    if info.accept_ranges and part.exists():
+        # Prime the hash with what is already on disk.
+        with part.open("rb") as f:
+            while data := f.read(chunk_size):
+                hasher.update(data)
+                pos += len(data)
+        if info.size is not None and pos > info.size:
+            hasher, pos = hashlib.sha256(), 0
+    if pos:
+        logger.info("resuming '{}' from byte {}", part, pos)
+
+    progress = _Progress(info.size, pos, progress_bar)
+    attempt = 0
+    try:
+        while info.size is None or pos < info.size:
+            headers = {"Range": f"bytes={pos}-"} if pos else {}
+            try:
+                with client.stream("GET", url, headers=headers) as resp:
+                    resp.raise_for_status()
+                    if pos and resp.status_code != httpx2.codes.PARTIAL_CONTENT:
+                        logger.info("server ignored range request, restarting")
+                        hasher, pos = hashlib.sha256(), 0
+                    with part.open("r+b" if pos else "wb") as f:
+                        f.seek(pos)
+                        f.truncate()
+                        for data in resp.iter_bytes(chunk_size=chunk_size):
+                            f.write(data)
+                            hasher.update(data)
+                            pos += len(data)
+                            progress.update(len(data))
+                if info.size is None:
+                    break
+            except httpx2.TransportError as e:
+                attempt += 1
+                if attempt > retries or not info.accept_ranges:
+                    raise
+                logger.warning("download interrupted at byte {} ({}), retrying", pos, e)
+    finally:
+        progress.close()
+
+    if not part.exists():
+        # Empty file, nothing was written.
+        part.touch()
+    return hasher.hexdigest()
+
+
+def _segment_bounds(size: int, segments: int) -> list[tuple[int, int]]:
+    step = -(-size // segments)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _download_segmented(
+        client: httpx2.Client,
+        url: str,
+        part: Path,
+        size: int,
+        segments: int,
+        chunk_size: int,
+        retries: int,
+        progress_bar: bool,
+):
+    state_file = part.with_name(part.name + ".json")
+    bounds = _segment_bounds(size, segments)
+    done = [0] * len(bounds)
+    try:
+        state = json.loads(state_file.read_text())
+        if state["url"] == url and state["size"] == size \
+                and len(state["done"]) == len(bounds) and part.exists():
+            done = state["done"]
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    if not any(done):
+        with part.open("wb") as f:
+            f.truncate(size)
+    else:
+        logger.info("resuming '{}' from {} of {} bytes", part, sum(done), size)
+
+    lock = threading.Lock()
+
+    def save_state():
+        with lock:
+            state_file.write_text(json.dumps({"url": url, "size": size, "done": done}))
+
+    save_state()
+    progress = _Progress(size, sum(done), progress_bar)
+
+    def fetch(i: int):
+        start, end = bounds[i]
+        attempt = 0
+        with part.open("r+b") as f:
+            while start + done[i] < end:
+                pos = start + done[i]
+                try:
+                    with client.stream(
+                            "GET", url, headers={"Range": f"bytes={pos}-{end - 1}"}) as resp:
+                        resp.raise_for_status()
+                        if resp.status_code != httpx2.codes.PARTIAL_CONTENT:
+                            raise RuntimeError("server ignored segment range request")
+                        f.seek(pos)
+                        since_save = 0
+                        for data in resp.iter_bytes(chunk_size=chunk_size):
+                            data = data[:end - start - done[i]]
+                            f.write(data)
+                            done[i] += len(data)
+                            progress.update(len(data))
+                            since_save += len(data)
+                            if since_save >= MIN_SEGMENT_SIZE:
+                                f.flush()
+                                save_state()
+                                since_save = 0
+                except httpx2.TransportError as e:
+                    attempt += 1
+                    if attempt > retries:
+                        raise
+                    logger.warning("segment {} interrupted ({}), retrying", i, e)
+                finally:
+                    f.flush()
+                    save_state()
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+            for future in [pool.submit(fetch, i) for i in range(len(bounds))]:
+                future.result()
+    finally:
+        progress.close()
+
+    state_file.unlink(missing_ok=True)
+
+
+def download(
+        url: str,
+        out_file: Path,
+        *,
+        client: httpx2.Client | None = None,
+        segments: int = 1,
+        chunk_size: int = CHUNK_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        progress_bar: bool = True,
+) -> str:
+    """Download url to out_file, resuming a previous partial download
+    if possible. Returns the SHA-256 hex digest of the file.
+    """
+    logger.info("downloading: '{}'", url)
+    own_client = client is None
+    if client is None:
+        client = httpx2.Client(timeout=TIMEOUT, follow_redirects=True)
+
+    part = out_file.with_name(out_file.name + ".part")
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        info = probe(client, url)
+        if (segments > 1 and info.accept_ranges and info.size is not None
+                and info.size >= segments * MIN_SEGMENT_SIZE):
+            _download_segmented(
+                client, url, part, info.size, segments,
+                chunk_size, retries, progress_bar)
+            digest = hash_file(part)
+        else:
+            digest = _download_single(
+                client, url, part, info, chunk_size, retries, progress_bar)
+    finally:
+        if own_client:
+            client.close()
+
+    os.replace(part, out_file)
+    logger.info("download finished, sha256={}", digest)
+    return digest
+
+
+class ArchiveCache:
+    def __init__(self, root: Path):
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def lookup(self, tag: str, name: str, digest: str | None = None) -> Path | None:
+        """Return the newest cached archive for tag, or None."""
+        pattern = f"{digest}/{name}" if digest else f"*/{name}"
+        found = [p for p in (self._root / tag).glob(pattern) if p.is_file()]
+        if not found:
+            return None
+        return max(found, key=lambda p: p.stat().st_mtime_ns)
+
+    def store(self, tag: str, file: Path, digest: str) -> Path:
+        dst = self._root / tag / digest / file.name
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(file, dst)
+        return dst
+
+    def fetch(
+            self,
+            tag: str,
+            url: str,
+            *,
+            digest: str | None = None,
+            client: httpx2.Client | None = None,
+            segments: int = 1,
+            chunk_size: int = CHUNK_SIZE,
+            progress_bar: bool = True,
+    ) -> Path:
+        """Return the cached archive for tag, downloading it first
+        if it is not cached. If digest is given, the archive must have
+        that SHA-256 digest.
+        """
+        name = Path(httpx2.URL(url).path).name
+        if cached := self.lookup(tag, name, digest):
+            logger.info("using cached archive: '{}'", cached)
+            return cached
+
+        tmp_dir = self._root / tag / ".download"
+        tmp_file = tmp_dir / name
+        actual = download(
+            url, tmp_file, client=client, segments=segments,
+            chunk_size=chunk_size, progress_bar=progress_bar)
+        if digest and actual != digest:
+            tmp_file.unlink(missing_ok=True)
+            raise DigestMismatchError(
+                f"'{url}' sha256 mismatch: expected {digest}, got {actual}")
+
+        dst = self.store(tag, tmp_file, actual)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return dst
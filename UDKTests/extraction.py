@@ -0,0 +1,201 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Manifest based incremental extraction of 7z archives.
+
+The extraction manifest maps each extracted archive member (relative to
+the output directory) to its size, CRC32 (as stored in the archive) and
+the modification time of the extracted file. On a warm run a member
+whose file still has the recorded size and mtime is trusted after a
+single stat() call. Only files whose stat data differs are hashed,
+in parallel, and only files that are missing or whose CRC32 no longer
+matches the archive are extracted again.
+
+Members that the caller modifies in place on purpose can be declared
+mutable, those are only extracted when missing.
+
+Members of a solid 7z archive are stored in "folders" that must be
+decompressed from the start, so extraction is parallelized per folder,
+each worker using its own archive handle.
+"""
+
+import concurrent.futures
+import os
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+import py7zr
+
+CHUNK_SIZE = 1024 * 1024
+
+# Relative member name -> {"size": ..., "crc32": ..., "mtime_ns": ...}.
+Manifest = dict[str, dict[str, int]]
+
+
+@dataclass(frozen=True, slots=True)
+class Member:
+    name: str
+    size: int
+    crc32: int
+    folder: int | None
+    is_dir: bool
+
+
+@dataclass
+class SyncResult:
+    manifest: Manifest
+    extracted: list[str]
+    hashed: int
+
+
+def read_members(archive: Path) -> dict[str, Member]:
+    with py7zr.SevenZipFile(archive) as pkg:
+        folders = pkg.header.main_streams.unpackinfo.folders \
+            if pkg.header.main_streams else []
+        folder_index = {id(f): i for i, f in enumerate(folders)}
+        return {
+            f.filename: Member(
+                name=f.filename,
+                size=f.uncompressed or 0,
+                crc32=f.crc32 or 0,
+                folder=folder_index.get(id(f.folder)) if f.folder is not None else None,
+                is_dir=f.is_directory,
+            )
+            for f in pkg.files
+        }
+
+
+def file_crc32(path: Path) -> int:
+    crc = 0
+    with path.open("rb") as f:
+        while data := f.read(CHUNK_SIZE):
+            crc = zlib.crc32(data, crc)
+    return crc
+
+
+def _entry(member: Member, st: os.stat_result) -> dict[str, int]:
+    return {"size": member.size, "crc32": member.crc32, "mtime_ns": st.st_mtime_ns}
+
+
+def plan_extraction(
+        members: dict[str, Member],
+        out_dir: Path,
+        manifest: Manifest,
+        workers: int | None = None,
+        mutable: frozenset[str] = frozenset(),
+) -> tuple[list[str], Manifest, int]:
+    """Return (targets, manifest, hashed), where targets are members
+    that need to be extracted, manifest contains the verified entries of
+    the other members and hashed is the number of files that were hashed.
+    """
+    targets: list[str] = []
+    verified: Manifest = {}
+    to_hash: list[tuple[Member, os.stat_result]] = []
+
+    for member in members.values():
+        if member.is_dir:
+            continue
+        try:
+            st = (out_dir / member.name).stat()
+        except FileNotFoundError:
+            targets.append(member.name)
+            continue
+        if member.name in mutable:
+            verified[member.name] = _entry(member, st)
+        elif st.st_size != member.size:
+            targets.append(member.name)
+        elif manifest.get(member.name) == _entry(member, st):
+            verified[member.name] = manifest[member.name]
+        else:
+            to_hash.append((member, st))
+
+    if to_hash:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            crcs = pool.map(lambda x: file_crc32(out_dir / x[0].name), to_hash)
+            for (member, st), crc in zip(to_hash, crcs):
+                if crc == member.crc32:
+                    verified[member.name] = _entry(member, st)
+                else:
+                    targets.append(member.name)
+
+    return targets, verified, len(to_hash)
+
+
+def _extract_group(archive: Path, out_dir: Path, targets: list[str]):
+    with py7zr.SevenZipFile(archive) as pkg:
+        pkg.extract(out_dir, targets)
+
+
+def extract(
+        archive: Path,
+        out_dir: Path,
+        members: dict[str, Member],
+        targets: list[str],
+        workers: int | None = None,
+):
+    groups: dict[int | None, list[str]] = defaultdict(list)
+    for name in targets:
+        groups[members[name].folder].append(name)
+
+    for name in targets:
+        # Replace rather than overwrite, in case of hardlinked files.
+        (out_dir / name).unlink(missing_ok=True)
+
+    if len(groups) <= 1 or workers == 1:
+        if targets:
+            _extract_group(archive, out_dir, targets)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_group, archive, out_dir, group)
+            for group in groups.values()
+        ]
+        for future in futures:
+            future.result()
+
+
+def sync_archive(
+        archive: Path,
+        out_dir: Path,
+        manifest: Manifest,
+        workers: int | None = None,
+        mutable: frozenset[str] = frozenset(),
+) -> SyncResult:
+    """Make out_dir contain the files of archive, extracting only
+    members that are missing or changed.
+    """
+    members = read_members(archive)
+    for member in members.values():
+        if member.is_dir:
+            (out_dir / member.name).mkdir(parents=True, exist_ok=True)
+
+    targets, verified, hashed = plan_extraction(
+        members, out_dir, manifest, workers, mutable)
+    extract(archive, out_dir, members, targets, workers)
+
+    for name in targets:
+        verified[name] = _entry(members[name], (out_dir / name).stat())
+
+    return SyncResult(manifest=verified, extracted=sorted(targets), hashed=hashed)
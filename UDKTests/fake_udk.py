@@ -0,0 +1,168 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fake UDK.com for testing the harness on platforms without UDK.
+
+Run in the root of a UDK tree, writes scripted output in the UDK log
+format to UDKGame/Logs/Launch.log, e.g.:
+
+    python fake_udk.py make
+    python fake_udk.py server "Entry?NumTestLoops=4?GMPPort=65433"
+
+The server mode parses the test mutator URL options (FirstTestLoop,
+NumTestLoops, GMPPort, Tests), connects to the GMP server like
+FCryptoGMPClient does and logs every test suite of every loop.
+The script is adjusted with environment variables:
+
+    FAKE_UDK_FAIL_LOOPS   comma separated loops that log an error
+    FAKE_UDK_WARN_LOOPS   comma separated loops that log a warning
+    FAKE_UDK_HANG_LOOP    loop at which the server stops logging and hangs
+    FAKE_UDK_LINE_DELAY   seconds to sleep after each log line
+    FAKE_UDK_EXIT_CODE    exit code of the process
+    FAKE_UDK_EXIT_DELAY   seconds to linger after the log is closed
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import TextIO
+
+LOG_FILE = Path("UDKGame/Logs/Launch.log")
+SUITES = (
+    "TestQWord",
+    "TestMemory",
+    "TestOperations",
+    "TestMath",
+    "TestAesCt",
+    "TestSpeed",
+)
+CONNECT_TIMEOUT = 30.0
+
+
+class FakeLog:
+    def __init__(self, f: TextIO):
+        self._f = f
+        self._start = time.perf_counter()
+        self._delay = float(os.environ.get("FAKE_UDK_LINE_DELAY", 0))
+
+    def __call__(self, tag: str, msg: str):
+        elapsed = time.perf_counter() - self._start
+        self._f.write(f"[{elapsed:07.2f}] {tag}: {msg}\n")
+        self._f.flush()
+        if self._delay:
+            time.sleep(self._delay)
+
+
+def parse_options(url: str) -> dict[str, str]:
+    # Like UE3 ParseOption, the first occurrence of an option wins.
+    options: dict[str, str] = {}
+    for option in url.split("?")[1:]:
+        key, _, value = option.partition("=")
+        options.setdefault(key.lower(), value)
+    return options
+
+
+def env_loops(name: str) -> set[int]:
+    return {int(x) for x in os.environ.get(name, "").split(",") if x.strip()}
+
+
+def connect(port: int) -> bool:
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def make(log: FakeLog):
+    log("Init", "Command line: make")
+    log("Log", "Compiling FCrypto")
+    log("Log", "Success - 0 error(s), 0 warning(s)")
+    log("Log", "Log file closed")
+
+
+def server(log: FakeLog, url: str):
+    options = parse_options(url)
+    first = int(options.get("firsttestloop", 0))
+    end = int(options.get("numtestloops", 1))
+    port = int(options.get("gmpport", 65432))
+    suites: tuple[str, ...] = SUITES
+    if tests := options.get("tests"):
+        suites = tuple(s for s in SUITES if s in tests.split(","))
+    fail_loops = env_loops("FAKE_UDK_FAIL_LOOPS")
+    warn_loops = env_loops("FAKE_UDK_WARN_LOOPS")
+    hang_loop = env_loops("FAKE_UDK_HANG_LOOP")
+    prefix = "FCryptoTestMutator::RunTest():"
+
+    log("Init", f"Command line: server {url}")
+    if connect(port):
+        log("FCrypto", f"FCryptoGMPClient::Opened(): connected to port {port}")
+    else:
+        log("Error", f"FCryptoGMPClient: could not connect to port {port}")
+
+    for i in range(first, end):
+        if i in hang_loop:
+            while True:
+                time.sleep(1)
+        for suite in suites:
+            log("FCrypto", f"{prefix} --- RUNNING {suite} ({i}) ---")
+            log("FCrypto", f"{prefix} Clock time : {1.5 + i:.4f}")
+        if i in warn_loops:
+            log("Warning", f"fake warning in loop {i}")
+        if i in fail_loops:
+            log("Error", f"{prefix} --- 1 (Iteration={i}) FAILED CHECKS ---")
+
+    log("FCrypto", "FCryptoTestMutator::RunNextTest(): --- TOTAL CLOCK TIME : 1.0 ---")
+    log("Exit", "Exiting.")
+    log("Log", "Log file closed")
+
+
+def main():
+    exit_code = int(os.environ.get("FAKE_UDK_EXIT_CODE", 0))
+    # The harness terminates UDK once the log says it is exiting,
+    # UDK shuts down cleanly when asked to.
+    # Log lines are flushed as they are written, nothing to clean up.
+    signal.signal(signal.SIGTERM, lambda *_: os._exit(exit_code))
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with LOG_FILE.open("a", encoding="utf-8") as f:
+        log = FakeLog(f)
+        match sys.argv[1:]:
+            case ["make", *_]:
+                make(log)
+            case ["server", url, *_]:
+                server(log, url)
+            case _:
+                raise SystemExit(f"usage: {sys.argv[0]} make|server URL")
+    # Like UDK, take a while to shut down after closing the log.
+    time.sleep(float(os.environ.get("FAKE_UDK_EXIT_DELAY", 2)))
+    raise SystemExit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Logging setup and non-blocking UDK log forwarding for the harness.
+
+All loguru sinks are enqueued, so records are written by loguru's
+worker thread instead of the thread that logs them. The console is a
+compact view: harness messages, UDK errors as they happen and a rate
+limited progress line per watched log. The file sink gets everything,
+including every UDK log line.
+
+The watchdog observer thread only tails and classifies the UDK log.
+The text it reads is handed to a UdkLogForwarder in whole blocks, one
+queue put per block, and the forwarder thread splits it into lines and
+logs them. The per-line cost of the logging itself therefore no longer
+delays the detection of phase ends and errors.
+"""
+
+import queue
+import sys
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable
+from typing import TextIO
+
+from loguru import logger
+
+LOG_FORMAT = "[{time:YYYY-MM-DD HH:mm:ss.SSSZZ}] [{level}] [{function}] {message}"
+# UDK lines have timestamps of their own.
+UDK_LOG_FORMAT = "{message}"
+
+# Errors shown on the console as they happen, per forwarder.
+# All of them are listed at the end of the run anyway.
+MAX_LIVE_ERRORS = 20
+
+
+def _format(record) -> str:
+    fmt = UDK_LOG_FORMAT if "udk" in record["extra"] else LOG_FORMAT
+    return fmt + "\n{exception}"
+
+
+def _not_udk_line(record) -> bool:
+    return "udk" not in record["extra"]
+
+
+def _console_sink(stream: TextIO, normalize: bool) -> Callable[[str], None]:
+    def write(message: str):
+        if normalize:
+            # Windows runner consoles choke on some UDK log characters.
+            message = unicodedata.normalize("NFKD", message)
+        stream.write(message)
+        stream.flush()
+
+    return write
+
+
+def setup_logging(
+        log_file: Path | str,
+        verbose: bool = False,
+        normalize: bool = False,
+        enqueue: bool = True,
+        stream: TextIO = sys.stdout,
+):
+    """Replace the loguru handlers with a compact console sink and a
+    full-fidelity, rotating file sink. With verbose, every UDK log line
+    is shown on the console as well.
+    """
+    logger.remove()
+    logger.add(
+        _console_sink(stream, normalize),
+        format=_format,
+        level="INFO",
+        filter=None if verbose else _not_udk_line,
+        enqueue=enqueue,
+        colorize=False,
+    )
+    logger.add(
+        log_file,
+        format=_format,
+        rotation="50 MB",
+        level="DEBUG",
+        enqueue=enqueue,
+    )
+
+
+class UdkLogForwarder:
+    """Logs blocks of UDK log text from a background thread. Each
+    block is logged as a single record, bound to udk=name, with every
+    line prefixed with the name. A loguru record per line would cost
+    more than all the other log processing together.
+    """
+
+    def __init__(self, name: str = "UDK"):
+        self._name = name
+        self._logger = logger.bind(udk=name)
+        self._queue: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._live_errors = 0
+        self._suppressed_errors = 0
+
+    @property
+    def suppressed_errors(self) -> int:
+        return self._suppressed_errors
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"log-forwarder-{self._name}", daemon=True)
+                self._thread.start()
+
+    def write(self, text: str):
+        """Queue a block of log text for logging."""
+        self._ensure_started()
+        self._queue.put(("line", text))
+
+    def error(self, line: str):
+        """Queue an error line to be shown on the console."""
+        if self._live_errors >= MAX_LIVE_ERRORS:
+            self._suppressed_errors += 1
+            return
+        self._live_errors += 1
+        self._ensure_started()
+        self._queue.put(("error", line))
+
+    def _run(self):
+        while (item := self._queue.get()) is not None:
+            kind, text = item
+            if kind == "error":
+                logger.error("{}: {}", self._name, text.strip())
+                continue
+            prefix = f"[{self._name}] "
+            self._logger.info(
+                "\n".join(prefix + line.rstrip() for line in text.splitlines()))
+
+    def close(self, timeout: float | None = None):
+        """Log everything queued so far and stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+class ProgressReporter:
+    """Logs a progress line at most once per interval seconds."""
+
+    def __init__(
+            self,
+            name: str = "UDK",
+            interval: float = 10.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._name = name
+        self._interval = interval
+        self._clock = clock
+        self._next = clock() + interval
+        self.lines = 0
+        self.bytes = 0
+
+    def update(self, text: str, state: str, warnings: int, errors: int, suites: int):
+        self.lines += text.count("\n")
+        self.bytes += len(text)
+        now = self._clock()
+        if now < self._next:
+            return
+        self._next = now + self._interval
+        logger.info(
+            "{} [{}]: {} lines ({:.1f} MB), {} suite runs, {} warnings, {} errors",
+            self._name, state, self.lines, self.bytes / (1024 * 1024),
+            suites, warnings, errors)
@@ -0,0 +1,199 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Incremental UDK log file tailing and line classification.
+
+LogTailer keeps a single file handle open and only ever reads the
+bytes appended since the previous read. Truncation (the file shrinks
+below the current read position) and rotation (the path points to a
+different file than the open handle) are detected on each read, in
+which case reading restarts from the beginning of the new file.
+Incomplete trailing lines are buffered until their line break arrives.
+
+Lines are classified with a single compiled pattern, which is run over
+each block of newly read text at once, so uninteresting lines cost
+no per-line Python work at all.
+"""
+
+import enum
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+from typing import Iterator
+
+
+class LineKind(enum.StrEnum):
+    ERROR = enum.auto()
+    WARNING = enum.auto()
+    # "Log file closed", end of the build phase.
+    LOG_CLOSED = enum.auto()
+    # "Exit: Exiting", end of the test phase.
+    EXITING = enum.auto()
+
+
+# Alternatives are tried in order, the first one that matches a line
+# determines its kind. Groups are named after LineKind values, the
+# ERROR kind has several alternatives, hence the numbered suffixes.
+LINE_RE = re.compile(
+    r"^\[[\d.]+]\s(?:"
+    r"(?P<error_0>(?i:error):[^\n]+)"
+    r"|(?P<error_1>\w+:[^\n]*?##ERROR##[^\n]*)"
+    r"|(?P<error_2>ScriptWarning:\sAccessed\sarray\s'\w+'\sout\sof\sbounds\s\([\d/]+\)[^\n]*)"
+    r"|(?P<warning>(?i:warning):[^\n]+)"
+    r"|(?P<log_closed>Log:\sLog\sfile\sclosed[^\n]*)"
+    r"|(?P<exiting>Exit:\sExiting[^\n]*)"
+    r")\r?$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LogLine:
+    kind: LineKind
+    line: str
+
+
+def classify(text: str) -> Iterator[LogLine]:
+    """Yield the interesting lines in text, which should
+    consist of complete lines.
+    """
+    for match in LINE_RE.finditer(text):
+        group = match.lastgroup
+        if group is None:
+            continue
+        kind = LineKind(group.partition("_")[0] if group.startswith("error") else group)
+        yield LogLine(kind, match.group(0).rstrip("\r"))
+
+
+def classify_line(line: str) -> LineKind | None:
+    """Classify a single line, returns None for uninteresting lines."""
+    for log_line in classify(line.rstrip("\n")):
+        return log_line.kind
+    return None
+
+
+class LogTailer:
+    def __init__(
+            self,
+            path: Path,
+            encoding: str = "utf-8",
+            chunk_size: int = 1024 * 1024,
+    ):
+        self._path = path
+        self._encoding = encoding
+        self._chunk_size = chunk_size
+        self._fh: BinaryIO | None = None
+        self._file_id: tuple[int, int] | None = None
+        self._pos = 0
+        self._partial = b""
+        self.rotations = 0
+        self.truncations = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def position(self) -> int:
+        return self._pos
+
+    def _open(self) -> bool:
+        try:
+            fh = self._path.open("rb")
+        except FileNotFoundError:
+            return False
+        st = os.fstat(fh.fileno())
+        self._fh = fh
+        self._file_id = (st.st_dev, st.st_ino)
+        self._pos = 0
+        self._partial = b""
+        return True
+
+    def _restart_if_replaced(self) -> bool:
+        """Restart from the beginning of the file if the file
+        was rotated or truncated, returns True if it was.
+        """
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return False
+        if (st.st_dev, st.st_ino) != self._file_id:
+            self.close()
+            self.rotations += 1
+            return self._open()
+        if st.st_size < self._pos:
+            assert self._fh is not None
+            self.truncations += 1
+            self._fh.seek(0)
+            self._pos = 0
+            return True
+        return False
+
+    def _read_all(self) -> bytes:
+        assert self._fh is not None
+        chunks = []
+        while data := self._fh.read(self._chunk_size):
+            chunks.append(data)
+        data = b"".join(chunks)
+        self._pos += len(data)
+        return data
+
+    def read(self) -> str:
+        """Return all complete lines appended since the previous
+        call, or an empty string if there are none.
+        """
+        if self._fh is None and not self._open():
+            return ""
+
+        # The old handle is drained before checking for rotation so
+        # that lines written just before the rotation are not lost.
+        data = self._partial + self._read_all()
+        self._partial = b""
+        if self._restart_if_replaced():
+            # Whatever was left of the old file is complete.
+            if data and not data.endswith(b"\n"):
+                data += b"\n"
+            data += self._read_all()
+
+        end = data.rfind(b"\n") + 1
+        self._partial = data[end:]
+        return data[:end].decode(self._encoding, errors="replace")
+
+    def read_lines(self) -> list[str]:
+        return self.read().splitlines()
+
+    def close(self):
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except OSError:
+                pass
+        self._fh = None
+        self._file_id = None
+
+    def __enter__(self) -> "LogTailer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
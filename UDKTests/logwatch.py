@@ -0,0 +1,272 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Watching the UDK log for the end of the build and test phases.
+
+LogWatcher is a watchdog handler that tails the log on every file
+system event, collects warnings and errors, and sets the asyncio
+event of the current phase (from the observer thread, through
+loop.call_soon_threadsafe) when the log says the phase is over.
+
+The watcher does not log the UDK lines itself, they are handed to a
+logsinks.UdkLogForwarder in whole blocks and logged from its thread.
+
+A phase can also end early. In fail-fast mode the first error line
+aborts it. It is also aborted when the log has not grown for the stall
+timeout, or when it takes longer than the phase timeout.
+"""
+
+import asyncio
+import enum
+import threading
+import time
+from pathlib import Path
+
+import watchdog.events
+from loguru import logger
+
+from logtail import LineKind
+from logtail import LogTailer
+from logtail import classify
+from logsinks import ProgressReporter
+from logsinks import UdkLogForwarder
+from supervisor import ProcessSupervisor
+from supervisor import WaitResult
+from timings import RunTimings
+from timings import TimingParser
+
+
+class RunAbortedError(RuntimeError):
+    pass
+
+
+class LogEndTimeoutError(RunAbortedError):
+    pass
+
+
+class LogStalledError(RunAbortedError):
+    pass
+
+
+class FailFastError(RunAbortedError):
+    pass
+
+
+class ExternalAbortError(RunAbortedError):
+    """The abort event passed to wait_for_log_end was set."""
+
+
+class State(enum.StrEnum):
+    NONE = enum.auto()
+    BUILDING = enum.auto()
+    TESTING = enum.auto()
+
+
+class LogWatcher(watchdog.events.FileSystemEventHandler):
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            building_event: asyncio.Event,
+            testing_event: asyncio.Event,
+            log_file: Path,
+            fail_fast: bool = False,
+            name: str = "UDK",
+            progress_interval: float = 10.0,
+    ):
+        self._loop = loop
+        self._building_event = building_event
+        self._testing_event = testing_event
+        self._log_file = log_file
+        self._log_filename = log_file.name
+        self._tailer = LogTailer(log_file)
+        self._lock = threading.Lock()
+        self._state = State.NONE
+        self._warnings: list[str] = []
+        self._errors: list[str] = []
+        self._timing_parser = TimingParser()
+        self._fail_fast = fail_fast
+        self._abort_event = asyncio.Event()
+        self._first_error: str | None = None
+        self._last_activity = time.monotonic()
+        self._forwarder = UdkLogForwarder(name)
+        self._progress = ProgressReporter(name, progress_interval)
+
+    @property
+    def warnings(self) -> list[str]:
+        return self._warnings
+
+    @property
+    def errors(self) -> list[str]:
+        return self._errors
+
+    @property
+    def abort_event(self) -> asyncio.Event:
+        """Set on the first error line in fail-fast mode."""
+        return self._abort_event
+
+    @property
+    def first_error(self) -> str | None:
+        return self._first_error
+
+    @property
+    def last_activity(self) -> float:
+        """time.monotonic() of the last time the log grew."""
+        return self._last_activity
+
+    @property
+    def timings(self) -> RunTimings:
+        return self._timing_parser.timings
+
+    @property
+    def state(self) -> State:
+        return self._state
+
+    @state.setter
+    def state(self, state: State):
+        logger.info("setting state: {}", state)
+        self._state = state
+
+    def on_any_event(self, event: watchdog.events.FileSystemEvent):
+        if Path(event.src_path).name == self._log_filename:
+            logger.debug("fs event: {} {}", event.event_type, event.src_path)
+
+    def on_modified(self, event: watchdog.events.FileSystemEvent):
+        if Path(event.src_path).name == self._log_filename:
+            self.poll()
+
+    def poll(self):
+        """Process all complete log lines written since the previous poll."""
+        with self._lock:
+            text = self._tailer.read()
+            if not text:
+                return
+            self._last_activity = time.monotonic()
+
+            self._forwarder.write(text)
+            self._timing_parser.feed(text)
+
+            log_end = False
+            for log_line in classify(text):
+                match log_line.kind:
+                    case LineKind.ERROR:
+                        self._errors.append(log_line.line)
+                        self._forwarder.error(log_line.line)
+                        if self._first_error is None:
+                            self._first_error = log_line.line
+                            if self._fail_fast:
+                                logger.info("fail-fast: setting abort event")
+                                self._loop.call_soon_threadsafe(self._abort_event.set)
+                    case LineKind.WARNING:
+                        self._warnings.append(log_line.line)
+                    case LineKind.LOG_CLOSED:
+                        log_end |= self._state == State.BUILDING
+                    case LineKind.EXITING:
+                        log_end |= self._state == State.TESTING
+
+            self._progress.update(
+                text, self._state, len(self._warnings), len(self._errors),
+                sum(len(v) for v in self._timing_parser.timings.suites.values()))
+
+            if log_end:
+                logger.info("setting stop event")
+                # Called from the observer thread, asyncio events
+                # must be set from the event loop thread.
+                if self._state == State.BUILDING:
+                    self._loop.call_soon_threadsafe(self._building_event.set)
+                elif self._state == State.TESTING:
+                    self._loop.call_soon_threadsafe(self._testing_event.set)
+
+    def close(self):
+        self._tailer.close()
+        self._forwarder.close()
+
+    def __del__(self):
+        self.close()
+
+
+async def wait_for_log_end(
+        supervisor: ProcessSupervisor,
+        watcher: LogWatcher,
+        proc: asyncio.subprocess.Process,
+        event: asyncio.Event,
+        timeout: float | None,
+        stall_timeout: float | None = None,
+        abort_event: asyncio.Event | None = None,
+) -> int:
+    """Wait for the log end event or the process to exit, then make
+    sure the process is gone. Returns the exit code of the process.
+
+    Raises a RunAbortedError, after terminating the process, if the
+    phase does not end within timeout seconds, the log does not grow
+    for stall_timeout seconds, an error line is logged in fail-fast
+    mode or abort_event is set.
+    """
+    events = [event, watcher.abort_event]
+    if abort_event is not None:
+        events.append(abort_event)
+
+    start = time.monotonic()
+    deadline = start + timeout if timeout is not None else None
+    while True:
+        now = time.monotonic()
+        # The stall window starts with the phase, log growth before
+        # it (e.g. the end of the build) doesn't count.
+        last_activity = max(watcher.last_activity, start)
+        waits = []
+        if deadline is not None:
+            waits.append(deadline - now)
+        if stall_timeout:
+            waits.append(last_activity + stall_timeout - now)
+        try:
+            result = await supervisor.wait(
+                proc, *events, timeout=max(0.0, min(waits)) if waits else None)
+            break
+        except TimeoutError:
+            pass
+
+        if deadline is not None and time.monotonic() >= deadline:
+            await supervisor.terminate(proc)
+            raise LogEndTimeoutError(
+                f"timed out after {timeout:.0f} s waiting for UDK.exe"
+                f" ({watcher.state}) stop event")
+        # The log may have grown without a file system event.
+        watcher.poll()
+        last_activity = max(watcher.last_activity, start)
+        if stall_timeout and time.monotonic() - last_activity >= stall_timeout:
+            await supervisor.terminate(proc)
+            raise LogStalledError(
+                f"UDK.exe ({watcher.state}) log has not grown"
+                f" in {stall_timeout:.0f} s")
+
+    if watcher.abort_event.is_set():
+        await supervisor.terminate(proc)
+        raise FailFastError(f"aborted on first error: {watcher.first_error}")
+    if abort_event is not None and abort_event.is_set() and not event.is_set():
+        await supervisor.terminate(proc)
+        raise ExternalAbortError(f"UDK.exe ({watcher.state}) aborted")
+
+    if result == WaitResult.EXITED:
+        logger.info("UDK.exe exited before log end event")
+        # The last writes may not have produced a file system event yet.
+        watcher.poll()
+
+    return await supervisor.terminate(proc)
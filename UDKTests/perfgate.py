@@ -0,0 +1,298 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test timing history and performance regression detection.
+
+Every passing test run appends a record with the timings of the run
+(see timings.py) to a JSON lines history file, keyed by the commit that
+was tested. Each run is compared against a rolling baseline: the
+timings of the latest runs on the same host that were not themselves
+flagged as regressions.
+
+A suite has regressed when it is slower than the baseline by at least
+min_slowdown and the slowdown is statistically significant, either by
+Welch's t-test over the individual samples, or, when there are too few
+samples for that, by the z-score of the run mean against the means of
+the baseline runs.
+
+Records also hold the wall clock durations of the build and test
+phases, from which adaptive phase timeouts are derived.
+"""
+
+import enum
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+
+from timings import RunTimings
+
+DEFAULT_WINDOW = 10
+DEFAULT_ALPHA = 0.01
+DEFAULT_MIN_SLOWDOWN = 0.05
+DEFAULT_Z_THRESHOLD = 3.0
+# Adaptive timeouts need at least this many previous durations.
+MIN_TIMEOUT_SAMPLES = 3
+
+
+class GateMode(enum.StrEnum):
+    OFF = enum.auto()
+    WARN = enum.auto()
+    FAIL = enum.auto()
+
+
+@dataclass
+class Comparison:
+    suite: str
+    current_mean: float
+    baseline_mean: float
+    # Relative change of the mean, positive is slower.
+    slowdown: float
+    # One-sided Welch's t-test p-value, None if not enough samples.
+    p_value: float | None
+    # z-score against the baseline run means, None if not enough runs.
+    z_score: float | None
+    regression: bool
+
+
+def git_commit(repo_dir: Path) -> tuple[str, bool]:
+    """Return the HEAD commit of repo_dir and whether the
+    working tree is dirty, or ("", False) if git is not available.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo_dir,
+            capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo_dir,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "", False
+    return commit, bool(status)
+
+
+def current_host() -> str:
+    return platform.node()
+
+
+def make_record(
+        timings: RunTimings,
+        commit: str,
+        dirty: bool,
+        **extra: Any,
+) -> dict[str, Any]:
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "host": current_host(),
+        "time": time.time(),
+        **extra,
+        "timings": timings.to_json(),
+    }
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    records = []
+    try:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A run killed mid-write, skip the partial line.
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_record(path: Path, record: dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def select_baseline(
+        history: list[dict[str, Any]],
+        host: str,
+        window: int = DEFAULT_WINDOW,
+) -> list[RunTimings]:
+    runs = [
+        r for r in history
+        if r.get("host") == host and not r.get("regressions")
+    ]
+    return [RunTimings.from_json(r["timings"]) for r in runs[-window:]]
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction of the incomplete beta function (modified Lentz)."""
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        for aa in (
+                m * (b - m) * x / ((a + m2 - 1.0) * (a + m2)),
+                -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0)),
+        ):
+            d = 1.0 + aa * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + aa / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    ln_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(ln_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(ln_front) * _betacf(b, a, 1.0 - x) / b
+
+
+def t_sf(t: float, df: float) -> float:
+    """Survival function P(T > t) of Student's t distribution."""
+    p = 0.5 * betainc(df / 2.0, 0.5, df / (df + t * t))
+    return p if t > 0 else 1.0 - p
+
+
+def welch_p_value(current: list[float], baseline: list[float]) -> float | None:
+    """One-sided p-value of the current samples having a larger mean
+    than the baseline samples, None if either has fewer than 2 samples.
+    """
+    if len(current) < 2 or len(baseline) < 2:
+        return None
+    m1, m2 = statistics.fmean(current), statistics.fmean(baseline)
+    v1 = statistics.variance(current) / len(current)
+    v2 = statistics.variance(baseline) / len(baseline)
+    if v1 + v2 == 0.0:
+        return 0.0 if m1 > m2 else 1.0
+    t = (m1 - m2) / math.sqrt(v1 + v2)
+    df = (v1 + v2) ** 2 / (
+            v1 ** 2 / (len(current) - 1) + v2 ** 2 / (len(baseline) - 1))
+    return t_sf(t, df)
+
+
+def z_score(current_mean: float, baseline_means: list[float]) -> float | None:
+    if len(baseline_means) < 3:
+        return None
+    sd = statistics.stdev(baseline_means)
+    if sd == 0.0:
+        return math.inf if current_mean > baseline_means[0] else 0.0
+    return (current_mean - statistics.fmean(baseline_means)) / sd
+
+
+def compare(
+        current: RunTimings,
+        baseline: Iterable[RunTimings],
+        alpha: float = DEFAULT_ALPHA,
+        min_slowdown: float = DEFAULT_MIN_SLOWDOWN,
+        z_threshold: float = DEFAULT_Z_THRESHOLD,
+) -> list[Comparison]:
+    baseline = list(baseline)
+    comparisons = []
+    for suite, samples in sorted(current.suites.items()):
+        base_runs = [b.suites[suite] for b in baseline if b.suites.get(suite)]
+        if not samples or not base_runs:
+            continue
+        base_samples = [x for run in base_runs for x in run]
+        cur_mean = statistics.fmean(samples)
+        base_mean = statistics.fmean(base_samples)
+        slowdown = cur_mean / base_mean - 1.0 if base_mean > 0 else 0.0
+        p = welch_p_value(samples, base_samples)
+        z = z_score(cur_mean, [statistics.fmean(run) for run in base_runs])
+        if p is not None:
+            significant = p < alpha
+        else:
+            significant = z is not None and z >= z_threshold
+        comparisons.append(Comparison(
+            suite=suite,
+            current_mean=cur_mean,
+            baseline_mean=base_mean,
+            slowdown=slowdown,
+            p_value=p,
+            z_score=z,
+            regression=significant and slowdown >= min_slowdown,
+        ))
+    return comparisons
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Linearly interpolated q-th percentile (0...100) of samples."""
+    xs = sorted(samples)
+    k = (len(xs) - 1) * q / 100.0
+    lo = math.floor(k)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (k - lo)
+
+
+def phase_durations(
+        history: list[dict[str, Any]],
+        host: str,
+        phase: str,
+        window: int = DEFAULT_WINDOW,
+) -> list[float]:
+    """Durations of phase in the latest runs on host. The test phase
+    duration is per test loop run by the slowest server.
+    """
+    durations = []
+    for r in history:
+        phases = r.get("phases", {})
+        if r.get("host") != host or phase not in phases:
+            continue
+        d = phases[phase]
+        if phase == "test":
+            d /= max(1, phases.get("test_loops", 1))
+        durations.append(d)
+    return durations[-window:]
+
+
+def adaptive_timeout(
+        durations: list[float],
+        margin: float,
+        floor: float,
+        ceiling: float,
+        scale: float = 1.0,
+) -> float:
+    """Return the 95th percentile of durations, times scale and
+    margin, clamped to floor...ceiling. Returns ceiling if there
+    are too few durations.
+    """
+    if len(durations) < MIN_TIMEOUT_SAMPLES:
+        return ceiling
+    return min(ceiling, max(floor, percentile(durations, 95) * scale * margin))
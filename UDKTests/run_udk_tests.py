@@ -22,182 +22,80 @@
 
 import argparse
 import asyncio
-import enum
 import glob
 import json
 import os
-import re
+import shlex
 import shutil
-import subprocess
 import sys
-import threading
 import time
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
-from typing import IO
-
-import httpx2
-import psutil
-import py7zr
-import tqdm
-import unicodedata
-import watchdog.events
+
 import watchdog.observers
+import watchdog.observers.api
 from loguru import logger
 from udk_configparser import UDKConfigParser
 
+import benchreport
+import buildcache
 import defaults
+import depgraph
+import download
+import extraction
+import logsinks
+import perfgate
+import shards
+import snapshot
+import timings
+from logwatch import LogWatcher
+from logwatch import RunAbortedError
+from logwatch import State
+from logwatch import wait_for_log_end
+from supervisor import ProcessSupervisor
 
 # TODO: leverage pytest?
-# TODO: reduce log spam? More verbose logging to a file,
-#       only general info straight to console?
-
-
-_log_format = "[{time:YYYY-MM-DD HH:mm:ss.SSSZZ}] [{level}] [{function}] {message}"
 
-logger.remove()
-logger.add(
-    sys.stdout,
-    format=_log_format,
-    level="DEBUG",
-)
-logger.add(
-    "run_udk_tests.log",
-    format=_log_format,
-    rotation="50 MB",
-    level="DEBUG",
-)
+LOG_FILE = "run_udk_tests.log"
 
 SCRIPT_DIR = Path(__file__).parent
 REPO_DIR = SCRIPT_DIR.parent
 CACHE_DIR = SCRIPT_DIR / ".cache/"
 UDK_FW_SCRIPT_PATH = SCRIPT_DIR / "allow_udk_fw.ps1"
+INLINER_PATH = REPO_DIR / "DevUtils/uscript_inline.py"
+BENCHMARK_MUTATOR = "FCrypto.FCryptoBenchmarkMutator"
+# Run alongside the benchmarks when no test suites are affected.
+BENCHMARK_FALLBACK_SUITE = "TestSpeed"
 
 UDK_TEST_TIMEOUT = defaults.UDK_TEST_TIMEOUT
+# Lower bound for adaptive phase timeouts, UDK startup alone
+# can take a while on a cold machine.
+MIN_PHASE_TIMEOUT = 30.0
 
-LOG_RE = re.compile(r"^\[[\d.]+]\s(\w+):(.*)$")
-ARRAY_OOB_ACCESS_RE = re.compile(r"^.*ScriptWarning:\sAccessed\sarray\s'\w+'\sout\sof\sbounds\s\([\d/]+\)")
-
-BUILDING_EVENT: threading.Event | None = None
-TESTING_EVENT: threading.Event | None = None
-POKER_EVENT: threading.Event | None = None
-
-FCRYPTO_GMP_SERVER_PROC: asyncio.subprocess.Process | None = None
-
-
-class State(enum.StrEnum):
-    NONE = enum.auto()
-    BUILDING = enum.auto()
-    TESTING = enum.auto()
-
-
-class LogWatcher(watchdog.events.FileSystemEventHandler):
-    def __init__(
-            self,
-            building_event: threading.Event,
-            testing_event: threading.Event,
-            log_file: Path,
-    ):
-        self._building_event = building_event
-        self._testing_event = testing_event
-        self._log_file = log_file
-        self._log_filename = log_file.name
-        self._fh: IO | None = None
-        self._pos = 0
-        self._state = State.NONE
-        self._warnings: list[str] = []
-        self._errors: list[str] = []
-
-    @property
-    def warnings(self) -> list[str]:
-        return self._warnings
-
-    @property
-    def errors(self) -> list[str]:
-        return self._errors
-
-    @property
-    def state(self) -> State:
-        return self._state
-
-    @state.setter
-    def state(self, state: State):
-        logger.info("setting state: {}", state)
-        self._state = state
-        self._pos = 0
-
-    def on_any_event(self, event: watchdog.events.FileSystemEvent):
-        if Path(event.src_path).name == self._log_filename:
-            logger.info("fs event: {} {}", event.event_type, event.src_path)
-            self._fh = open(self._log_file, errors="replace", encoding="utf-8")
-
-    # TODO: better state handling, this is a mess ATM.
-    def on_modified(self, event: watchdog.events.FileSystemEvent):
-        path = Path(event.src_path)
-        if path.name == self._log_filename:
-            if not self._fh:
-                raise RuntimeError("no log file handle")
-
-            size = self._log_file.stat().st_size
-            if size == 0:
-                logger.info("log file cleared")
-                self._pos = 0
-                return
-
-            self._fh.seek(self._pos)
-
-            log_end = False
-            # TODO: detect partial lines. Just read the entire
-            #   file again in the end to get fully intact data?
-            #   Or is this unnecessary due to using -FORCELOGFLUSH?
-            while line := self._fh.readline():
-                self._pos = self._fh.tell()
-
-                if match := LOG_RE.match(line):
-                    if match.group(1).lower() == "error":
-                        if match.group(2):
-                            self._errors.append(line)
-                    elif "##ERROR##" in match.group(2):
-                        self._errors.append(line)
-                    elif ARRAY_OOB_ACCESS_RE.match(line):
-                        self._errors.append(line)
-                    elif match.group(1).lower() == "warning":
-                        if match.group(2):
-                            self._warnings.append(line)
-
-                if os.getenv("GITHUB_ACTIONS"):
-                    line = unicodedata.normalize("NFKD", line)
-                logger.info(line.strip())
-
-                if self._state == State.BUILDING:
-                    if "Log file closed" in line:
-                        log_end = True
-                elif self._state == State.TESTING:
-                    if "Exit: Exiting" in line:
-                        log_end = True
-
-            if log_end:
-                logger.info("setting stop event")
-                if self._state == State.BUILDING:
-                    self._building_event.set()
-                elif self._state == State.TESTING:
-                    self._testing_event.set()
-
-    def __del__(self):
-        if self._fh:
-            try:
-                self._fh.close()
-            except OSError:
-                pass
+# Archive members the harness modifies in place when running
+# directly in the extracted tree, only extracted when they are missing.
+MUTABLE_ARCHIVE_MEMBERS = frozenset({
+    "Binaries/Win64/UDK.exe",
+    "UDKGame/Config/DefaultEngine.ini",
+})
 
 
 @dataclass
 class Cache:
     udk_lite_tag: str = ""
     pkg_archive: str = ""
-    pkg_archive_extracted_files: list[str] = field(default_factory=list)
+    # Directory the archive was extracted to and the extraction
+    # manifest of the members, relative to that directory.
+    pkg_archive_root: str = ""
+    pkg_archive_manifest: extraction.Manifest = field(default_factory=dict)
+    # Manifest of the inputs of the last successful build
+    # and the stamp of the package it produced.
+    build_manifest: dict[str, str] = field(default_factory=dict)
+    build_package_stamp: str = ""
+    # Source manifest of the last passing test run.
+    test_manifest: dict[str, str] = field(default_factory=dict)
 
 
 def resolve_script_path(path: str) -> Path:
@@ -215,123 +113,88 @@ def write_cache(file: Path, cache: Cache):
 def load_cache(path: Path) -> Cache:
     with path.open() as f:
         cache = json.load(f)
-    return Cache(**cache)
-
-
-def download_file(url: str, out_file: Path, progress_bar: bool = True):
-    logger.info("downloading: '{}'", url)
-    with out_file.open("wb") as f:
-        with httpx2.stream(
-                "GET",
-                url,
-                timeout=120.0,
-                follow_redirects=True) as resp:
-            resp.raise_for_status()
-            total = int(resp.headers["Content-Length"])
-
-            # TODO: refactor this.
-            if progress_bar:
-                with tqdm.tqdm(total=total, unit_scale=True, unit_divisor=1024,
-                               unit="B") as progress:
-                    num_bytes_downloaded = resp.num_bytes_downloaded
-                    for data in resp.iter_bytes(chunk_size=4096):
-                        f.write(data)
-                        progress.update(resp.num_bytes_downloaded - num_bytes_downloaded)
-                        num_bytes_downloaded = resp.num_bytes_downloaded
-
-            else:
-                for data in resp.iter_bytes(chunk_size=4096):
-                    f.write(data)
-
-    logger.info("download finished")
+    # Ignore fields from older harness versions.
+    return Cache(**{k: v for k, v in cache.items() if k in Cache.__dataclass_fields__})
 
 
 def remove_old_extracted(cache: Cache):
     logger.info("removing old extracted files, if any")
 
-    dirs: list[Path] = []
+    if not cache.pkg_archive_root:
+        return
+
+    root = Path(cache.pkg_archive_root)
+    dirs: set[Path] = set()
 
-    for file in cache.pkg_archive_extracted_files:
-        p = Path(file).resolve()
-        if p.exists() and p.is_file():
+    for name in cache.pkg_archive_manifest:
+        p = root / name
+        if p.is_file():
             logger.info("removing '{}'", p)
             p.unlink(missing_ok=True)
-        elif p.is_dir():
-            dirs.append(p)
+        dirs.update(d for d in p.parents if d.is_relative_to(root) and d != root)
 
-    for d in dirs:
-        is_empty = not any(d.iterdir())
-        if is_empty:
-            shutil.rmtree(d)
-        else:
+    # Deepest first, so that parents of removed directories can be empty.
+    for d in sorted(dirs, key=lambda x: len(x.parts), reverse=True):
+        if d.is_dir() and not any(d.iterdir()):
+            d.rmdir()
+        elif d.is_dir():
             logger.info("not removing non-empty directory: '{}'", d)
 
     logger.info("remove_old_extracted done")
 
 
-def already_extracted(archive_file: str, out_dir: Path, cache: Cache) -> bool:
-    cached = cache.pkg_archive_extracted_files
-
-    # Files in the archive are relative to the archive root.
-    # Make them relative to the extraction target directory
-    # for comparisons. Cached paths are absolute.
-    extracted_file = (out_dir / archive_file).resolve()
-    is_cached = str(extracted_file) in cached
-    return extracted_file.exists() and is_cached
-
-
-# Convince UDK.exe to flush the log file.
-# TODO: this is fucking stupid.
-# TODO: also not needed since -FORCELOGFLUSH is enabled.
-def poke_file(file: Path, event: threading.Event):
-    while not event.is_set():
-        file.stat()
-        time.sleep(1)
-
-
 def move_file(src: Path, dst: Path):
     logger.info("'{}' -> '{}'", src, dst)
     shutil.move(src, dst)
 
 
+async def run_inliner(
+        supervisor: ProcessSupervisor,
+        sources: list[Path],
+        dst_dir: Path,
+):
+    """Replace the copied sources in dst_dir with preprocessed
+    versions that have small helper functions inlined.
+    """
+    proc = await supervisor.spawn(
+        sys.executable, str(INLINER_PATH), "--out-dir", str(dst_dir),
+        *(str(src) for src in sources),
+    )
+    ec = await proc.wait()
+    if ec != 0:
+        raise RuntimeError(f"{INLINER_PATH.name} error: {ec}")
+
+
 async def run_udk_build(
+        supervisor: ProcessSupervisor,
         watcher: LogWatcher,
         udk_lite_root: Path,
-        building_event: threading.Event,
+        building_event: asyncio.Event,
+        timeout: float,
+        make_command: str = "",
+        stall_timeout: float | None = None,
 ) -> int:
     logger.info("starting UDK build phase")
 
-    udk_exe = (udk_lite_root / "Binaries/Win64/UDK.com").resolve()
-
-    watcher.state = State.BUILDING
-
-    proc = await asyncio.create_subprocess_exec(
-        udk_exe,
-        *[
+    if make_command:
+        make_args = shlex.split(make_command)
+    else:
+        make_args = [
+            str((udk_lite_root / "Binaries/Win64/UDK.com").resolve()),
             "make",
             "-intermediate",
             "-useunpublished",
             "-log",
             "-UNATTENDED",
             "-FORCELOGFLUSH",
-        ],
-    )
-
-    logger.info("proc: {}", proc)
-
-    ok = building_event.wait(timeout=UDK_TEST_TIMEOUT)
-
-    await (await asyncio.create_subprocess_exec(
-        *["taskkill", "/pid", str(proc.pid)],
-        stderr=subprocess.DEVNULL,
-    )).wait()
+        ]
 
-    if not ok:
-        raise RuntimeError("timed out waiting for UDK.exe (building_event) stop event")
+    watcher.state = State.BUILDING
 
-    logger.info("UDK.exe finished")
+    proc = await supervisor.spawn(*make_args, cwd=udk_lite_root)
 
-    ec = await proc.wait()
+    ec = await wait_for_log_end(
+        supervisor, watcher, proc, building_event, timeout, stall_timeout)
     logger.info("UDK.exe exited with code: {}", ec)
 
     if ec != 0:
@@ -340,94 +203,219 @@ async def run_udk_build(
     return ec
 
 
-async def run_udk_server(
-        watcher: LogWatcher,
-        udk_lite_root: Path,
-        testing_event: threading.Event,
-        udk_args: str,
-) -> int:
-    logger.info("starting UDK testing phase")
-
+def use_norunaway_exe(udk_lite_root: Path):
     udk_exe_norunaway = (udk_lite_root / "Binaries/Win64/UDK_norunaway.exe").resolve()
     udk_exe = (udk_lite_root / "Binaries/Win64/UDK.exe").resolve()
-    udk_com = (udk_lite_root / "Binaries/Win64/UDK.com").resolve()
 
     # Use UDK.exe with runaway loop detection patched out.
     if udk_exe_norunaway.exists():
         dst = udk_exe.with_name("UDK.exe.backup")
 
-        if dst.exists():
-            logger.info("{} exists, assuming runaway loop detection executable already in use", dst)
-        else:
-            logger.info("moving original UDK.exe to backup "
-                        "and replacing it with runaway loop detection patched variant")
+        if not dst.exists():
+            logger.info("moving original UDK.exe to backup")
             move_file(udk_exe, dst)
-            move_file(udk_exe_norunaway, udk_exe)
+        # Copied, not moved, so the extracted tree stays complete.
+        logger.info("replacing UDK.exe with runaway loop detection patched variant")
+        shutil.copy2(udk_exe_norunaway, udk_exe)
 
-    watcher.state = State.TESTING
-    test_proc = await asyncio.create_subprocess_exec(
-        udk_com,
-        *[
-            "server",
-            udk_args,
-            "-UNATTENDED",
-            "-log",
-            "-FORCELOGFLUSH",
-        ],
-    )
 
-    logger.info("proc: {}", test_proc)
+def udk_url(mutators: str, tests: list[str] | None) -> str:
+    """Return the server URL shared by all runs. The loop options are
+    appended per run: UE3 ParseOption returns the first match, so they
+    must not be given here as well.
+    """
+    url = f"Entry?Mutator={mutators}?bIsLanMatch=true?dedicated=true"
+    if tests:
+        url += f"?Tests={','.join(tests)}"
+    return url
 
-    ok = testing_event.wait(timeout=UDK_TEST_TIMEOUT)
 
-    await (await asyncio.create_subprocess_exec(
-        *["taskkill", "/pid", str(test_proc.pid)],
-        stderr=subprocess.DEVNULL,
-    )).wait()
+def udk_server_command(
+        udk_lite_root: Path,
+        udk_args: str,
+        server_command: str = "",
+        extra_args: tuple[str, ...] = (),
+) -> list[str]:
+    if server_command:
+        return [*shlex.split(server_command), udk_args, *extra_args]
+    return [
+        str((udk_lite_root / "Binaries/Win64/UDK.com").resolve()),
+        "server",
+        udk_args,
+        "-UNATTENDED",
+        "-log",
+        "-FORCELOGFLUSH",
+        *extra_args,
+    ]
 
-    if not ok:
-        raise RuntimeError("timed out waiting for UDK.exe (testing_event) stop event")
 
-    test_ec = await test_proc.wait()
+async def run_udk_server(
+        supervisor: ProcessSupervisor,
+        watcher: LogWatcher,
+        udk_lite_root: Path,
+        testing_event: asyncio.Event,
+        udk_args: str,
+        timeout: float,
+        server_command: str = "",
+        stall_timeout: float | None = None,
+) -> int:
+    logger.info("starting UDK testing phase")
+
+    use_norunaway_exe(udk_lite_root)
+
+    watcher.state = State.TESTING
+    test_proc = await supervisor.spawn(
+        *udk_server_command(udk_lite_root, udk_args, server_command),
+        cwd=udk_lite_root,
+    )
+
+    test_ec = await wait_for_log_end(
+        supervisor, watcher, test_proc, testing_event, timeout, stall_timeout)
     logger.info("UDK.exe FCrypto test run exited with code: {}", test_ec)
 
     return test_ec
 
 
-def print_udk_processes(event: threading.Event):
-    while not event.is_set():
-        sleep_time = 0.01
-        for proc in psutil.process_iter():
-            if "udk" in proc.name().lower():
-                logger.info("{} {}", '#' * 4, proc)
-                sleep_time = 5.0
+def gmp_server_command(echo_server_path: Path, port: int | None = None) -> list[str]:
+    cmd = [sys.executable, str(echo_server_path)]
+    if port is not None:
+        cmd += ["--port", str(port)]
+    return cmd
+
+
+async def start_gmp_server(
+        supervisor: ProcessSupervisor,
+        echo_server_path: Path,
+) -> asyncio.subprocess.Process:
+    proc = await supervisor.spawn(*gmp_server_command(echo_server_path))
+    logger.info("gmp_server proc={}", proc)
+    return proc
+
+
+async def stop_gmp_server(
+        supervisor: ProcessSupervisor,
+        proc: asyncio.subprocess.Process,
+):
+    # A windowless console process, taskkill without /F can't stop it.
+    ec = await supervisor.terminate(proc, tree=False)
+    logger.info("gmp_server exited with code: {}", ec)
+
+
+def select_test_suites(
+        selection: str,
+        sources: list[Path],
+        manifest: dict[str, str],
+        tested_manifest: dict[str, str],
+) -> list[str] | None:
+    """Return the test suites to run, or None to run all of them.
+    With selection "auto", only the suites affected by the sources
+    changed since the last passing test run are run.
+    """
+    if selection.lower() == "all":
+        return None
+    if selection.lower() != "auto":
+        return [s.strip() for s in selection.split(",") if s.strip()]
+
+    if not tested_manifest:
+        logger.info("no previous passing test run, running all test suites")
+        return None
+    changed = {
+        name for name in manifest.keys() | tested_manifest.keys()
+        if manifest.get(name) != tested_manifest.get(name)
+    }
+    if any(name.startswith(buildcache.CONFIG_PREFIX) for name in changed):
+        logger.info("configuration changed, running all test suites")
+        return None
+
+    tests = depgraph.select_tests(sources, changed)
+    if tests is None:
+        logger.info("changes affect all test suites: {}", sorted(changed))
+    else:
+        logger.info("changes {} affect test suites: {}", sorted(changed), tests)
+    return tests
 
-        time.sleep(sleep_time)
 
+def configure_engine(cfg_file: Path):
+    cfg = UDKConfigParser(comment_prefixes=";")
+    cfg.read(cfg_file)
 
-async def start_gmp_server(echo_server_path: Path):
-    global FCRYPTO_GMP_SERVER_PROC
+    pkg_name = "FCrypto"
+    edit_packages = cfg["UnrealEd.EditorEngine"].getlist("+EditPackages")
+    if pkg_name not in edit_packages:
+        edit_packages.append(pkg_name)
+        cfg["UnrealEd.EditorEngine"]["+EditPackages"] = "\n".join(edit_packages)
 
-    FCRYPTO_GMP_SERVER_PROC = await asyncio.create_subprocess_exec(
-        sys.executable,
-        str(echo_server_path)
-    )
+    if not cfg.has_section("IpDrv.TcpNetDriver"):
+        cfg.add_section("IpDrv.TcpNetDriver")
+    cfg["IpDrv.TcpNetDriver"]["NetServerMaxTickRate"] = "120"
+    cfg["IpDrv.TcpNetDriver"]["LanServerMaxTickRate"] = "120"
 
-    logger.info("FCRYPTO_GMP_SERVER_PROC={}", FCRYPTO_GMP_SERVER_PROC)
+    with cfg_file.open("w") as f:
+        cfg.write(f, space_around_delimiters=False)
 
 
-async def stop_gmp_server():
-    if FCRYPTO_GMP_SERVER_PROC:
-        FCRYPTO_GMP_SERVER_PROC.terminate()
-        ec = await FCRYPTO_GMP_SERVER_PROC.wait()
-        logger.info("FCRYPTO_GMP_SERVER_PROC exited with code: {}", ec)
+def stop_watching(obs: watchdog.observers.api.BaseObserver, watcher: LogWatcher):
+    obs.stop()
+    obs.join(timeout=UDK_TEST_TIMEOUT)
+
+    if obs.is_alive():
+        raise RuntimeError("timed out waiting for observer thread")
+
+    # Pick up anything written after the last file system event.
+    watcher.poll()
+    watcher.close()
+
+
+def check_performance(
+        run_timings: timings.RunTimings,
+        history_file: Path,
+        gate: perfgate.GateMode,
+        hot_suites: frozenset[str],
+        num_shards: int,
+        phases: dict[str, float],
+):
+    """Compare run_timings to the rolling baseline in history_file,
+    then append them and the phase durations to it. Raises if gate
+    is FAIL and a hot suite has regressed.
+    """
+    if not run_timings.suites:
+        logger.warning("no test timings found in the log")
+        return
+
+    history = perfgate.load_history(history_file)
+    commit, dirty = perfgate.git_commit(REPO_DIR)
+    record = perfgate.make_record(
+        run_timings, commit, dirty, shards=num_shards, phases=phases)
+    baseline = perfgate.select_baseline(history, record["host"])
+    comparisons = []
+    if gate != perfgate.GateMode.OFF:
+        comparisons = perfgate.compare(run_timings, baseline)
+
+    logger.info("timings of {} compared to {} baseline runs:",
+                commit[:12] + ("-dirty" if dirty else ""), len(baseline))
+    for c in comparisons:
+        p = f"{c.p_value:.4f}" if c.p_value is not None else "-"
+        z = f"{c.z_score:.2f}" if c.z_score is not None else "-"
+        logger.info("{:<16} {:>12.6f} {:>12.6f} {:>+8.1%} p={} z={}{}",
+                    c.suite, c.current_mean, c.baseline_mean, c.slowdown, p, z,
+                    " REGRESSION" if c.regression else "")
+    logger.info("GMP transfer rates (avg Mb/s): out={} in={}",
+                run_timings.gmp_out.avg_mbps, run_timings.gmp_in.avg_mbps)
+
+    regressions = [c.suite for c in comparisons if c.regression]
+    record["regressions"] = regressions
+    perfgate.append_record(history_file, record)
+
+    for suite in regressions:
+        logger.warning("performance regression: {}", suite)
+
+    failed = [s for s in regressions if s in hot_suites]
+    if failed and gate == perfgate.GateMode.FAIL:
+        raise RuntimeError(f"performance regressions detected: {', '.join(failed)}")
 
 
 async def main():
     global UDK_TEST_TIMEOUT
-    global BUILDING_EVENT
-    global TESTING_EVENT
-    global POKER_EVENT
 
     ap = argparse.ArgumentParser()
     ap.add_argument(
@@ -494,19 +482,74 @@ async def main():
     udk_lite_tag = os.environ.get("UDK_LITE_TAG", defaults.UDK_LITE_TAG)
     udk_lite_root = Path(os.environ.get("UDK_LITE_ROOT", defaults.UDK_LITE_ROOT))
     udk_lite_release_url = os.environ.get("UDK_LITE_RELEASE_URL", defaults.UDK_LITE_RELEASE_URL)
+    udk_lite_sha256 = os.environ.get("UDK_LITE_SHA256", defaults.UDK_LITE_SHA256)
+    udk_lite_download_segments = int(os.environ.get(
+        "UDK_LITE_DOWNLOAD_SEGMENTS", defaults.UDK_LITE_DOWNLOAD_SEGMENTS))
     fcrypto_classes_files = os.environ.get("FCRYPTO_CLASSES_FILES",
                                            defaults.FCRYPTO_CLASSES_FILES)
     fcrypto_num_test_loops = os.environ.get("FCRYPTO_NUM_TEST_LOOPS",
                                             defaults.FCRYPTO_NUM_TEST_LOOPS)
+    udk_make_command = os.environ.get("UDK_MAKE_COMMAND", defaults.UDK_MAKE_COMMAND)
+    udk_run_tree = os.environ.get("UDK_RUN_TREE", defaults.UDK_RUN_TREE)
+    fcrypto_test_selection = os.environ.get("FCRYPTO_TEST_SELECTION",
+                                            defaults.FCRYPTO_TEST_SELECTION)
+    udk_server_command = os.environ.get("UDK_SERVER_COMMAND", defaults.UDK_SERVER_COMMAND)
+    fcrypto_test_shards = int(os.environ.get("FCRYPTO_TEST_SHARDS",
+                                             defaults.FCRYPTO_TEST_SHARDS))
+    fcrypto_gmp_base_port = int(os.environ.get("FCRYPTO_GMP_BASE_PORT",
+                                               defaults.FCRYPTO_GMP_BASE_PORT))
+    udk_server_base_port = int(os.environ.get("UDK_SERVER_BASE_PORT",
+                                              defaults.UDK_SERVER_BASE_PORT))
+    fcrypto_timings_file = resolve_script_path(os.environ.get(
+        "FCRYPTO_TIMINGS_FILE", defaults.FCRYPTO_TIMINGS_FILE))
+    perf_gate = perfgate.GateMode(os.environ.get(
+        "FCRYPTO_PERF_GATE", defaults.FCRYPTO_PERF_GATE).lower())
+    udk_fail_fast = os.environ.get(
+        "UDK_FAIL_FAST", defaults.UDK_FAIL_FAST).lower() in ("1", "true", "yes")
+    fcrypto_inline = os.environ.get(
+        "FCRYPTO_INLINE", defaults.FCRYPTO_INLINE).lower() in ("1", "true", "yes")
+    fcrypto_benchmark = os.environ.get(
+        "FCRYPTO_BENCHMARK", defaults.FCRYPTO_BENCHMARK).lower() in ("1", "true", "yes")
+    udk_stall_timeout = float(os.environ.get("UDK_STALL_TIMEOUT",
+                                             defaults.UDK_STALL_TIMEOUT))
+    udk_timeout_margin = float(os.environ.get("UDK_TIMEOUT_MARGIN",
+                                              defaults.UDK_TIMEOUT_MARGIN))
+    perf_hot_suites = frozenset(
+        s.strip() for s in os.environ.get(
+            "FCRYPTO_PERF_HOT_SUITES", defaults.FCRYPTO_PERF_HOT_SUITES).split(",")
+        if s.strip()
+    )
 
     if not udk_lite_root.is_absolute():
         udk_lite_root = (SCRIPT_DIR / udk_lite_root).resolve()
+    if udk_run_tree:
+        udk_run_tree = resolve_script_path(udk_run_tree)
 
     logger.info("UDK_LITE_TAG={}", udk_lite_tag)
     logger.info("UDK_LITE_ROOT={}", udk_lite_root)
     logger.info("UDK_LITE_RELEASE_URL={}", udk_lite_release_url)
+    logger.info("UDK_LITE_SHA256={}", udk_lite_sha256)
+    logger.info("UDK_LITE_DOWNLOAD_SEGMENTS={}", udk_lite_download_segments)
     logger.info("FCRYPTO_CLASSES_FILES={}", fcrypto_classes_files)
     logger.info("FCRYPTO_NUM_TEST_LOOPS={}", fcrypto_num_test_loops)
+    logger.info("UDK_MAKE_COMMAND={}", udk_make_command)
+    logger.info("UDK_RUN_TREE={}", udk_run_tree)
+    logger.info("FCRYPTO_TEST_SELECTION={}", fcrypto_test_selection)
+    logger.info("UDK_SERVER_COMMAND={}", udk_server_command)
+    logger.info("FCRYPTO_TEST_SHARDS={}", fcrypto_test_shards)
+    logger.info("FCRYPTO_GMP_BASE_PORT={}", fcrypto_gmp_base_port)
+    logger.info("UDK_SERVER_BASE_PORT={}", udk_server_base_port)
+    logger.info("FCRYPTO_TIMINGS_FILE={}", fcrypto_timings_file)
+    logger.info("FCRYPTO_PERF_GATE={}", perf_gate)
+    logger.info("FCRYPTO_PERF_HOT_SUITES={}", ",".join(sorted(perf_hot_suites)))
+    logger.info("UDK_FAIL_FAST={}", udk_fail_fast)
+    logger.info("FCRYPTO_INLINE={}", fcrypto_inline)
+    logger.info("FCRYPTO_BENCHMARK={}", fcrypto_benchmark)
+    logger.info("UDK_STALL_TIMEOUT={}", udk_stall_timeout)
+    logger.info("UDK_TIMEOUT_MARGIN={}", udk_timeout_margin)
+
+    if fcrypto_test_shards > 1 and not udk_run_tree:
+        raise RuntimeError("FCRYPTO_TEST_SHARDS > 1 requires UDK_RUN_TREE")
 
     input_uscript_files = [
         resolve_script_path(path) for path in
@@ -519,31 +562,32 @@ async def main():
     # Check if cache tag, url, etc. match current ones, if not -> reinit.
     # Check if we have all pkg files in place. Compare to cache.
 
-    dl_pkg_archive = False
-    pkg_file = CACHE_DIR / Path(udk_lite_release_url).name
+    # Archives are cached by tag and digest, switching
+    # back to a previously used tag does not download again.
+    archives = download.ArchiveCache(CACHE_DIR / "archives")
+    pkg_file = archives.fetch(
+        udk_lite_tag,
+        udk_lite_release_url,
+        digest=udk_lite_sha256 or None,
+        segments=udk_lite_download_segments,
+        progress_bar=progress_bar,
+    )
 
     if cache.udk_lite_tag != udk_lite_tag:
         logger.info("cached UDK-Lite tag '{}' does not match '{}'",
                     cache.udk_lite_tag, udk_lite_tag)
-        dl_pkg_archive = True
 
-    pkg_file_outdated = cache.pkg_archive != str(pkg_file)
-    if pkg_file_outdated:
-        dl_pkg_archive = True
+    if cache.pkg_archive != str(pkg_file):
         logger.info("cached archive '{}' does not match '{}'",
                     cache.pkg_archive, pkg_file)
-
-    if not pkg_file.exists():
-        logger.info("'{}' does not exist", pkg_file)
-        dl_pkg_archive = True
-
-    if dl_pkg_archive:
-        download_file(udk_lite_release_url, pkg_file, progress_bar=progress_bar)
         cache.udk_lite_tag = udk_lite_tag
         remove_old_extracted(cache)
-        cache.pkg_archive_extracted_files = []
-    else:
-        logger.info("using cached archive: '{}'", pkg_file)
+        cache.pkg_archive_manifest = {}
+
+    if cache.pkg_archive_root != str(udk_lite_root):
+        remove_old_extracted(cache)
+        cache.pkg_archive_root = str(udk_lite_root)
+        cache.pkg_archive_manifest = {}
 
     # TODO: make a cache that updates itself automatically
     #   when fields are assigned. Just use diskcache?
@@ -551,61 +595,50 @@ async def main():
     write_cache(cache_file, cache)
 
     logger.info("extracting '{}'...", pkg_file)
-    with py7zr.SevenZipFile(pkg_file) as pkg:
-        filenames = pkg.getnames()
-        targets = [
-            fn for fn in filenames
-            if not already_extracted(fn, out_dir=udk_lite_root, cache=cache)
-        ]
-        dirs = [
-            t for t in targets
-            if (udk_lite_root / t).is_dir()
-        ]
-        targets = [t for t in targets if t not in dirs]
-
-        out_files = [
-            str((udk_lite_root / target).resolve())
-            for target in targets
-        ]
-
-        out_dirs = [
-            str(udk_lite_root / d)
-            for d in dirs
-        ]
-
-        for od in out_dirs:
-            Path(od).mkdir(parents=True, exist_ok=True)
-
-        if targets:
-            logger.info("extracting {} targets to '{}'", len(targets), udk_lite_root)
-            pkg.extract(udk_lite_root, targets)
-
-        cache.pkg_archive_extracted_files += out_files + out_dirs
-        cache.pkg_archive_extracted_files = list(set(cache.pkg_archive_extracted_files))
-        write_cache(cache_file, cache)
+    result = extraction.sync_archive(
+        pkg_file,
+        udk_lite_root,
+        cache.pkg_archive_manifest,
+        mutable=frozenset() if udk_run_tree else MUTABLE_ARCHIVE_MEMBERS,
+    )
+    logger.info("extracted {} files to '{}' ({} verified by hash)",
+                len(result.extracted), udk_lite_root, result.hashed)
+    cache.pkg_archive_manifest = result.manifest
+    write_cache(cache_file, cache)
 
-    for script_file in input_uscript_files:
-        dst_dir = udk_lite_root / "Development/Src/FCrypto/Classes/"
-        dst_dir.mkdir(parents=True, exist_ok=True)
-        dst = dst_dir / script_file.name
-        logger.info("'{}' -> '{}'", script_file, dst)
-        shutil.copy(script_file, dst)
+    if udk_run_tree:
+        # The extracted tree is kept pristine and the tests
+        # are run in an overlay that is reset on every run.
+        snap = snapshot.Snapshot(udk_lite_root, base_id=str(pkg_file))
+        if fcrypto_test_shards > 1:
+            # Shard trees are siblings of the run tree, the
+            # first one is used for building.
+            run_trees = snap.prepare_many(
+                udk_run_tree.parent, fcrypto_test_shards,
+                rebuild=bool(result.extracted))
+            logger.info("prepared {} shard trees in '{}'",
+                        len(run_trees), udk_run_tree.parent)
+        else:
+            if result.extracted:
+                # Re-extracted files are new inodes, old links are stale.
+                stats = snap.create(udk_run_tree)
+            else:
+                stats = snap.prepare(udk_run_tree)
+            logger.info("prepared '{}': {}", udk_run_tree, stats)
+            run_trees = [udk_run_tree]
+        udk_lite_root = run_trees[0]
+    else:
+        run_trees = [udk_lite_root]
 
     log_dir = udk_lite_root / "UDKGame/Logs/"
     log_file = log_dir / "Launch.log"
 
-    BUILDING_EVENT = threading.Event()
-    TESTING_EVENT = threading.Event()
-    POKER_EVENT = threading.Event()
-
-    udk_print_spam_thread = threading.Thread(
-        target=print_udk_processes,
-        args=(POKER_EVENT,),
-    )
-    udk_print_spam_thread.start()
+    loop = asyncio.get_running_loop()
+    building_event = asyncio.Event()
+    testing_event = asyncio.Event()
 
     obs = watchdog.observers.Observer()
-    watcher = LogWatcher(BUILDING_EVENT, TESTING_EVENT, log_file)
+    watcher = LogWatcher(loop, building_event, testing_event, log_file, udk_fail_fast)
 
     if not log_file.exists():
         logger.info("'{}' does not exist yet, touching...", log_file)
@@ -616,112 +649,235 @@ async def main():
     obs.start()
 
     cfg_file = udk_lite_root / "UDKGame/Config/DefaultEngine.ini"
-
-    poker = threading.Thread(
-        target=poke_file,
-        args=[log_file, POKER_EVENT],
+    for tree in run_trees:
+        configure_engine(tree / "UDKGame/Config/DefaultEngine.ini")
+
+    # Phase timeouts from the durations of previous runs, UDK_TEST_TIMEOUT
+    # until there is enough history and as the upper bound.
+    history = perfgate.load_history(fcrypto_timings_file)
+    host = perfgate.current_host()
+    loop_ranges = shards.split_loops(int(fcrypto_num_test_loops), len(run_trees))
+    test_loops = max(end - first for first, end in loop_ranges)
+    build_timeout = perfgate.adaptive_timeout(
+        perfgate.phase_durations(history, host, "build"),
+        margin=udk_timeout_margin,
+        floor=MIN_PHASE_TIMEOUT,
+        ceiling=UDK_TEST_TIMEOUT,
     )
-    poker.start()
-
-    cfg = UDKConfigParser(comment_prefixes=";")
-    cfg.read(cfg_file)
-
-    pkg_name = "FCrypto"
-    edit_packages = cfg["UnrealEd.EditorEngine"].getlist("+EditPackages")
-    if pkg_name not in edit_packages:
-        edit_packages.append(pkg_name)
-        cfg["UnrealEd.EditorEngine"]["+EditPackages"] = "\n".join(edit_packages)
-
-    if not cfg.has_section("IpDrv.TcpNetDriver"):
-        cfg.add_section("IpDrv.TcpNetDriver")
-    cfg["IpDrv.TcpNetDriver"]["NetServerMaxTickRate"] = "120"
-    cfg["IpDrv.TcpNetDriver"]["LanServerMaxTickRate"] = "120"
-
-    with cfg_file.open("w") as f:
-        cfg.write(f, space_around_delimiters=False)
-
-    if add_fw_rules:
-        logger.info("adding firewall rules for UDK.exe")
-        await (await asyncio.create_subprocess_exec(
-            *["powershell.exe", str(UDK_FW_SCRIPT_PATH)]
-        )).wait()
-
-    ec = await run_udk_build(
-        watcher=watcher,
-        udk_lite_root=udk_lite_root,
-        building_event=BUILDING_EVENT,
-    )
-
-    if not no_gmp_server:
-        await start_gmp_server(gmp_server_path)
-
-    ec += await run_udk_server(
-        watcher=watcher,
-        udk_lite_root=udk_lite_root,
-        testing_event=TESTING_EVENT,
-        udk_args=f"Entry?Mutator=FCrypto.FCryptoTestMutator?bIsLanMatch=true?"
-                 f"dedicated=true?NumTestLoops={fcrypto_num_test_loops}",
+    test_timeout = perfgate.adaptive_timeout(
+        perfgate.phase_durations(history, host, "test"),
+        margin=udk_timeout_margin,
+        floor=MIN_PHASE_TIMEOUT,
+        ceiling=UDK_TEST_TIMEOUT,
+        scale=test_loops,
     )
+    stall_timeout = udk_stall_timeout or None
+    logger.info("build timeout: {:.0f} s, test timeout: {:.0f} s",
+                build_timeout, test_timeout)
+    phases: dict[str, float] = {"test_loops": test_loops}
+
+    # Any processes still running when leaving this block, e.g. due to
+    # an error or KeyboardInterrupt, are terminated by the supervisor.
+    async with ProcessSupervisor() as supervisor:
+        if add_fw_rules:
+            logger.info("adding firewall rules for UDK.exe")
+            await (await supervisor.spawn(
+                *["powershell.exe", str(UDK_FW_SCRIPT_PATH)]
+            )).wait()
+
+        src_dst_dir = udk_lite_root / "Development/Src/FCrypto/Classes/"
+        package_file = udk_lite_root / defaults.FCRYPTO_PACKAGE_FILE
+        # The inliner is part of the build configuration. The copied
+        # sources are modified in place when it is used, so all of them
+        # are copied again when it is switched on or off.
+        config_files = [cfg_file]
+        old_manifest = cache.build_manifest
+        if fcrypto_inline:
+            config_files.append(INLINER_PATH)
+        if (buildcache.CONFIG_PREFIX + INLINER_PATH.name in old_manifest) != fcrypto_inline:
+            old_manifest = {}
+        plan = buildcache.plan_build(
+            sources=input_uscript_files,
+            config_files=config_files,
+            dst_dir=src_dst_dir,
+            package_file=package_file,
+            old_manifest=old_manifest,
+            old_package_stamp=cache.build_package_stamp,
+        )
+
+        if plan.fresh:
+            logger.info("'{}' is up to date, skipping build", package_file)
+            ec = 0
+        else:
+            for script_file in plan.changed:
+                logger.info("'{}' -> '{}'", script_file, src_dst_dir / script_file.name)
+            for name in plan.removed:
+                logger.info("removing '{}'", src_dst_dir / name)
+            buildcache.apply_sources(plan, src_dst_dir)
+            if fcrypto_inline:
+                await run_inliner(supervisor, input_uscript_files, src_dst_dir)
+
+            # Not fresh anymore until the build succeeds.
+            cache.build_package_stamp = ""
+            write_cache(cache_file, cache)
+
+            build_start = time.perf_counter()
+            ec = await run_udk_build(
+                supervisor=supervisor,
+                watcher=watcher,
+                udk_lite_root=udk_lite_root,
+                building_event=building_event,
+                timeout=build_timeout,
+                make_command=udk_make_command,
+                stall_timeout=stall_timeout,
+            )
+            phases["build"] = time.perf_counter() - build_start
+
+            cache.build_manifest = plan.manifest
+            cache.build_package_stamp = buildcache.package_stamp(package_file)
+            write_cache(cache_file, cache)
+
+        tests = select_test_suites(
+            fcrypto_test_selection,
+            input_uscript_files,
+            plan.manifest,
+            cache.test_manifest,
+        )
+
+        mutators = "FCrypto.FCryptoTestMutator"
+        if fcrypto_benchmark:
+            mutators += f",{BENCHMARK_MUTATOR}"
+            if tests == []:
+                logger.info("benchmarks requested, running {}", BENCHMARK_FALLBACK_SUITE)
+                tests = [BENCHMARK_FALLBACK_SUITE]
+        udk_args = udk_url(mutators, tests)
+        test_start = time.perf_counter()
+
+        if tests == []:
+            logger.info("no test suites affected, skipping test phase")
+            stop_watching(obs, watcher)
+            warnings, errors = watcher.warnings, watcher.errors
+            run_timings = timings.RunTimings()
+        elif len(run_trees) > 1:
+            # Each shard has its own watcher.
+            stop_watching(obs, watcher)
+
+            for tree in run_trees[1:]:
+                shards.copy_build_outputs(udk_lite_root, tree, snapshot.KEEP_PATHS)
+            for tree in run_trees:
+                use_norunaway_exe(tree)
+
+            report = await shards.run_shards(
+                supervisor=supervisor,
+                shards=shards.plan_shards(
+                    run_trees,
+                    int(fcrypto_num_test_loops),
+                    fcrypto_gmp_base_port,
+                    udk_server_base_port,
+                ),
+                server_command=lambda shard: udk_server_command(
+                    shard.root,
+                    udk_args + shard.url_options,
+                    udk_server_command,
+                    (f"-PORT={shard.game_port}",),
+                ),
+                gmp_command=None if no_gmp_server else (
+                    lambda shard: gmp_server_command(gmp_server_path, shard.gmp_port)),
+                timeout=test_timeout,
+                stall_timeout=stall_timeout,
+                fail_fast=udk_fail_fast,
+            )
+            ec += report.exit_code
+            warnings, errors = report.warnings, report.errors
+            run_timings = report.timings
+
+            for index, elapsed in report.shard_elapsed.items():
+                logger.info("shard {} took {:.2f} s", index, elapsed)
+            logger.info("sharded run took {:.2f} s", report.elapsed)
+        else:
+            gmp_server_proc = None
+            if not no_gmp_server:
+                gmp_server_proc = await start_gmp_server(supervisor, gmp_server_path)
 
-    if not no_gmp_server:
-        await stop_gmp_server()
-
-    obs.stop()
-    obs.join(timeout=UDK_TEST_TIMEOUT)
-
-    if obs.is_alive():
-        raise RuntimeError("timed out waiting for observer thread")
-
-    POKER_EVENT.set()
-    poker.join(timeout=5)
-
-    if poker.is_alive():
-        raise RuntimeError("timed out waiting for poker thread")
+            try:
+                ec += await run_udk_server(
+                    supervisor=supervisor,
+                    watcher=watcher,
+                    udk_lite_root=udk_lite_root,
+                    testing_event=testing_event,
+                    udk_args=udk_args + f"?NumTestLoops={fcrypto_num_test_loops}",
+                    timeout=test_timeout,
+                    server_command=udk_server_command,
+                    stall_timeout=stall_timeout,
+                )
+            except RunAbortedError as e:
+                # Reported with the other errors below.
+                watcher.errors.append(str(e))
+
+            if gmp_server_proc:
+                await stop_gmp_server(supervisor, gmp_server_proc)
+
+            stop_watching(obs, watcher)
+            warnings, errors = watcher.warnings, watcher.errors
+            run_timings = watcher.timings
+
+        # Only full runs are comparable for adaptive timeouts.
+        if tests is None:
+            phases["test"] = time.perf_counter() - test_start
 
     if ec != 0:
         raise RuntimeError(f"UDK.exe error (sum of all exit codes): {ec}")
 
-    udk_print_spam_thread.join(timeout=5)
-
-    logger.info("finished with {} warnings", len(watcher.warnings))
-    logger.info("finished with {} errors", len(watcher.errors))
+    logger.info("finished with {} warnings", len(warnings))
+    logger.info("finished with {} errors", len(errors))
 
     logger.info("WARNINGS:")
-    for warn in watcher.warnings:
+    for warn in warnings:
         logger.warning(warn.strip())
 
-    for err in watcher.errors:
+    for err in errors:
         logger.error(err.strip())
 
-    if watcher.errors:
+    if errors:
         raise RuntimeError("failed, errors detected")
 
+    # An explicit suite selection doesn't cover the other suites, the
+    # next auto run compares against the last run that did.
+    if tests is None or fcrypto_test_selection.lower() == "auto":
+        cache.test_manifest = plan.manifest
+        write_cache(cache_file, cache)
+
+    if run_timings.benchmarks:
+        for line in benchreport.report(run_timings.benchmarks):
+            logger.info(line)
+    elif fcrypto_benchmark:
+        logger.warning("no benchmark results found in the log")
+
+    if tests == []:
+        return
+
+    check_performance(
+        run_timings,
+        history_file=fcrypto_timings_file,
+        gate=perf_gate,
+        hot_suites=perf_hot_suites,
+        num_shards=len(run_trees),
+        phases=phases,
+    )
+
 
 if __name__ == "__main__":
+    logsinks.setup_logging(
+        LOG_FILE,
+        verbose=os.environ.get(
+            "UDK_LOG_VERBOSE", defaults.UDK_LOG_VERBOSE).lower() in ("1", "true", "yes"),
+        normalize=bool(os.getenv("GITHUB_ACTIONS")),
+    )
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.warning("exiting by KeyboardInterrupt")
-
-        # TODO: we need to properly forward the signal to all
-        #       subprocesses and threads!
-
-        if BUILDING_EVENT:
-            BUILDING_EVENT.set()
-        if TESTING_EVENT:
-            TESTING_EVENT.set()
-        if POKER_EVENT:
-            POKER_EVENT.set()
-
         raise
     except Exception as _e:
         logger.error("error running main: {}", _e)
-
-        if BUILDING_EVENT:
-            BUILDING_EVENT.set()
-        if TESTING_EVENT:
-            TESTING_EVENT.set()
-        if POKER_EVENT:
-            POKER_EVENT.set()
-
         raise
@@ -0,0 +1,263 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Sharded test runs: the test loops are split between several
+isolated UDK server instances that run concurrently.
+
+Every shard runs in its own overlay tree (see snapshot.py), with its
+own Launch.log, LogWatcher, game port and GMP server. The GMP server
+port is passed to the test mutator with the GMPPort URL option, which
+sets FCryptoGMPClient.TargetPort. The loop range of a shard is passed
+with the FirstTestLoop and NumTestLoops options.
+
+The results of the shards are merged into a single ShardReport.
+In fail-fast mode, a shard that fails aborts the other shards too.
+"""
+
+import asyncio
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Callable
+
+import watchdog.observers
+from loguru import logger
+
+from logwatch import ExternalAbortError
+from logwatch import LogWatcher
+from logwatch import RunAbortedError
+from logwatch import State
+from logwatch import wait_for_log_end
+from supervisor import ProcessSupervisor
+from timings import RunTimings
+
+LOG_FILE = "UDKGame/Logs/Launch.log"
+
+
+@dataclass(frozen=True)
+class Shard:
+    index: int
+    root: Path
+    # Test loop iterations first_loop...end_loop-1 are run.
+    first_loop: int
+    end_loop: int
+    gmp_port: int
+    game_port: int
+
+    @property
+    def log_file(self) -> Path:
+        return self.root / LOG_FILE
+
+    @property
+    def url_options(self) -> str:
+        return (f"?FirstTestLoop={self.first_loop}"
+                f"?NumTestLoops={self.end_loop}"
+                f"?GMPPort={self.gmp_port}")
+
+
+@dataclass
+class ShardResult:
+    shard: Shard
+    exit_code: int
+    warnings: list[str]
+    errors: list[str]
+    timings: RunTimings
+    # Wall clock seconds from spawning the server to its exit.
+    elapsed: float
+
+
+@dataclass
+class ShardReport:
+    results: list[ShardResult] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    timings: RunTimings = field(default_factory=RunTimings)
+    # Sum of the shard exit codes.
+    exit_code: int = 0
+    # Wall clock seconds of the whole sharded run.
+    elapsed: float = 0.0
+
+    @property
+    def shard_elapsed(self) -> dict[int, float]:
+        return {r.shard.index: r.elapsed for r in self.results}
+
+
+def split_loops(num_loops: int, num_shards: int) -> list[tuple[int, int]]:
+    """Split iterations 0...num_loops-1 into at most num_shards
+    contiguous (first, end) ranges of nearly equal size.
+    """
+    num_shards = max(1, min(num_shards, num_loops))
+    base, extra = divmod(num_loops, num_shards)
+    ranges = []
+    first = 0
+    for i in range(num_shards):
+        end = first + base + (i < extra)
+        ranges.append((first, end))
+        first = end
+    return ranges
+
+
+def plan_shards(
+        trees: list[Path],
+        num_loops: int,
+        gmp_base_port: int,
+        game_base_port: int,
+) -> list[Shard]:
+    return [
+        Shard(
+            index=i,
+            root=tree,
+            first_loop=first,
+            end_loop=end,
+            gmp_port=gmp_base_port + i,
+            game_port=game_base_port + i,
+        )
+        for i, (tree, (first, end)) in enumerate(
+            zip(trees, split_loops(num_loops, len(trees))))
+    ]
+
+
+def copy_build_outputs(src_root: Path, dst_root: Path, paths: tuple[str, ...]):
+    """Copy the build outputs under paths from src_root to dst_root,
+    skipping files that already have the same size and mtime.
+    """
+    for rel in paths:
+        src_dir = src_root / rel
+        for dirpath, _, filenames in os.walk(src_dir):
+            dst_dir = dst_root / Path(dirpath).relative_to(src_root)
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            for name in filenames:
+                src = Path(dirpath) / name
+                dst = dst_dir / name
+                src_st = src.stat()
+                try:
+                    dst_st = dst.stat()
+                    if (dst_st.st_size == src_st.st_size
+                            and dst_st.st_mtime_ns == src_st.st_mtime_ns):
+                        continue
+                except FileNotFoundError:
+                    pass
+                shutil.copy2(src, dst)
+
+
+def merge_results(results: list[ShardResult], elapsed: float) -> ShardReport:
+    report = ShardReport(results=results, elapsed=elapsed)
+    for result in sorted(results, key=lambda r: r.shard.index):
+        tag = f"[shard {result.shard.index}]"
+        report.warnings += [f"{tag} {w.strip()}" for w in result.warnings]
+        report.errors += [f"{tag} {e.strip()}" for e in result.errors]
+        report.exit_code += result.exit_code
+        report.timings = report.timings.merge(result.timings)
+    return report
+
+
+async def run_shard(
+        supervisor: ProcessSupervisor,
+        shard: Shard,
+        server_command: Callable[[Shard], list[str]],
+        gmp_command: Callable[[Shard], list[str]] | None,
+        timeout: float | None,
+        stall_timeout: float | None = None,
+        abort_event: asyncio.Event | None = None,
+) -> ShardResult:
+    """Run a single shard. If abort_event is given, it is set when
+    the shard fails and the shard is aborted when it is set.
+    """
+    loop = asyncio.get_running_loop()
+    testing_event = asyncio.Event()
+    fail_fast = abort_event is not None
+
+    log_file = shard.log_file
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    log_file.touch()
+
+    watcher = LogWatcher(loop, asyncio.Event(), testing_event, log_file, fail_fast,
+                         name=f"shard {shard.index}")
+    watcher.state = State.TESTING
+    obs = watchdog.observers.Observer()
+    obs.schedule(watcher, str(log_file.parent))
+    obs.start()
+
+    gmp_proc = None
+    ec = 0
+    start = time.perf_counter()
+    try:
+        if gmp_command is not None:
+            # Run in the shard tree to keep gmp_server.log per shard.
+            gmp_proc = await supervisor.spawn(*gmp_command(shard), cwd=shard.root)
+        logger.info("starting shard {}: loops {}...{}, GMP port {}",
+                    shard.index, shard.first_loop, shard.end_loop - 1, shard.gmp_port)
+        proc = await supervisor.spawn(*server_command(shard), cwd=shard.root)
+        try:
+            ec = await wait_for_log_end(
+                supervisor, watcher, proc, testing_event,
+                timeout, stall_timeout, abort_event)
+        except ExternalAbortError as e:
+            watcher.warnings.append(f"{e}, another shard failed")
+            ec = 0
+        except RunAbortedError as e:
+            # Keep going, the other shards may still produce results.
+            watcher.errors.append(str(e))
+            ec = 1
+        if abort_event is not None and watcher.errors:
+            abort_event.set()
+    finally:
+        elapsed = time.perf_counter() - start
+        if gmp_proc is not None:
+            await supervisor.terminate(gmp_proc, tree=False)
+        obs.stop()
+        await asyncio.to_thread(obs.join)
+        # Pick up anything written after the last file system event.
+        watcher.poll()
+        watcher.close()
+
+    logger.info("shard {} exited with code {} in {:.2f} s", shard.index, ec, elapsed)
+    return ShardResult(
+        shard=shard,
+        exit_code=ec,
+        warnings=watcher.warnings,
+        errors=watcher.errors,
+        timings=watcher.timings,
+        elapsed=elapsed,
+    )
+
+
+async def run_shards(
+        supervisor: ProcessSupervisor,
+        shards: list[Shard],
+        server_command: Callable[[Shard], list[str]],
+        gmp_command: Callable[[Shard], list[str]] | None,
+        timeout: float | None,
+        stall_timeout: float | None = None,
+        fail_fast: bool = False,
+) -> ShardReport:
+    start = time.perf_counter()
+    abort_event = asyncio.Event() if fail_fast else None
+    results = await asyncio.gather(*(
+        run_shard(supervisor, shard, server_command, gmp_command,
+                  timeout, stall_timeout, abort_event)
+        for shard in shards
+    ))
+    return merge_results(list(results), time.perf_counter() - start)
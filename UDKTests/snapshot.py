@@ -0,0 +1,224 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cheap working copies of the pristine extracted UDK-Lite tree.
+
+The extracted tree is treated as a read-only base. Test runs happen in
+overlay trees that share the base files through hardlinks. Files and
+directories the harness or UDK modify in place (RESET_PATHS) are real
+copies instead, made with a copy-on-write reflink where the filesystem
+supports it (Linux FICLONE) and a regular copy otherwise. If
+hardlinking is not possible, e.g. the overlay is on another volume,
+all files are copied.
+
+Preparing an existing overlay only resets RESET_PATHS from the base
+and removes files that are not in the base, which takes a fraction of a
+second. Build outputs (KEEP_PATHS) are left alone, so incremental builds
+keep working across resets. An overlay is rebuilt from scratch when its
+base or base id changes.
+"""
+
+import concurrent.futures
+import errno
+import json
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Paths (relative to the tree root) copied from the base on every reset.
+RESET_PATHS = (
+    "Binaries/Win64/UDK.exe",
+    "UDKGame/Config",
+    "UDKGame/Logs",
+)
+
+# Build state preserved across resets.
+KEEP_PATHS = (
+    "Development/Src/FCrypto",
+    "UDKGame/Unpublished",
+)
+
+MARKER_FILE = ".snapshot.json"
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EINVAL, errno.ENOTTY,
+    errno.EOPNOTSUPP, errno.ENOSYS, errno.EACCES,
+}
+
+
+@dataclass
+class SnapshotStats:
+    linked: int = 0
+    cloned: int = 0
+    copied: int = 0
+    rebuilt: bool = False
+
+
+def _under(rel: str, prefixes: tuple[str, ...]) -> bool:
+    return any(rel == p or rel.startswith(p + "/") for p in prefixes)
+
+
+def _above(rel: str, prefixes: tuple[str, ...]) -> bool:
+    return any(p.startswith(rel + "/") for p in prefixes)
+
+
+class Snapshot:
+    def __init__(
+            self,
+            base: Path,
+            base_id: str = "",
+            reset_paths: tuple[str, ...] = RESET_PATHS,
+            keep_paths: tuple[str, ...] = KEEP_PATHS,
+    ):
+        self._base = base.resolve()
+        self._base_id = base_id
+        self._reset_paths = reset_paths
+        self._keep_paths = keep_paths
+        self._can_link = True
+        self._can_clone = sys.platform == "linux"
+
+    @property
+    def base(self) -> Path:
+        return self._base
+
+    def _clone(self, src: Path, dst: Path, stats: SnapshotStats):
+        if self._can_clone:
+            import fcntl
+            try:
+                with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                stats.cloned += 1
+                return
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                self._can_clone = False
+        shutil.copy2(src, dst)
+        stats.copied += 1
+
+    def _link(self, src: Path, dst: Path, stats: SnapshotStats):
+        if self._can_link:
+            try:
+                os.link(src, dst)
+                stats.linked += 1
+                return
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                self._can_link = False
+        self._clone(src, dst, stats)
+
+    def _copy_tree(self, rel: str, tree: Path, stats: SnapshotStats, link: bool):
+        """Populate tree/rel from base/rel."""
+        src_root = self._base / rel
+        if src_root.is_file():
+            (tree / rel).parent.mkdir(parents=True, exist_ok=True)
+            self._clone(src_root, tree / rel, stats)
+            return
+        for dirpath, dirnames, filenames in os.walk(src_root):
+            src_dir = Path(dirpath)
+            rel_dir = src_dir.relative_to(self._base).as_posix()
+            if rel_dir == ".":
+                rel_dir = ""
+            dst_dir = tree / rel_dir
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            for name in filenames:
+                rel_file = f"{rel_dir}/{name}" if rel_dir else name
+                if link and not _under(rel_file, self._reset_paths):
+                    self._link(src_dir / name, dst_dir / name, stats)
+                else:
+                    self._clone(src_dir / name, dst_dir / name, stats)
+
+    def _remove_untracked(self, tree: Path):
+        for dirpath, dirnames, filenames in os.walk(tree):
+            rel_dir = Path(dirpath).relative_to(tree).as_posix()
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            for name in list(dirnames):
+                rel = prefix + name
+                if _under(rel, self._keep_paths):
+                    dirnames.remove(name)
+                elif not (self._base / rel).is_dir() and not _above(rel, self._keep_paths):
+                    shutil.rmtree(tree / rel)
+                    dirnames.remove(name)
+            for name in filenames:
+                rel = prefix + name
+                if rel == MARKER_FILE or _under(rel, self._keep_paths):
+                    continue
+                if not (self._base / rel).is_file():
+                    (tree / rel).unlink()
+
+    def _marker(self) -> dict[str, str]:
+        return {"base": str(self._base), "base_id": self._base_id}
+
+    def _read_marker(self, tree: Path) -> dict[str, str] | None:
+        try:
+            return json.loads((tree / MARKER_FILE).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def create(self, tree: Path) -> SnapshotStats:
+        """Build a new overlay at tree, replacing any existing one."""
+        stats = SnapshotStats(rebuilt=True)
+        if tree.exists():
+            shutil.rmtree(tree)
+        self._copy_tree("", tree, stats, link=True)
+        (tree / MARKER_FILE).write_text(json.dumps(self._marker()))
+        return stats
+
+    def reset(self, tree: Path) -> SnapshotStats:
+        """Restore RESET_PATHS of an existing overlay from the base
+        and remove files that are not in the base.
+        """
+        stats = SnapshotStats()
+        self._remove_untracked(tree)
+        for rel in self._reset_paths:
+            dst = tree / rel
+            if dst.is_dir() and not dst.is_symlink():
+                shutil.rmtree(dst)
+            else:
+                dst.unlink(missing_ok=True)
+            if (self._base / rel).exists():
+                self._copy_tree(rel, tree, stats, link=False)
+        return stats
+
+    def prepare(self, tree: Path) -> SnapshotStats:
+        """Return a fresh overlay at tree, reusing it if possible."""
+        if self._read_marker(tree) == self._marker():
+            return self.reset(tree)
+        return self.create(tree)
+
+    def prepare_many(self, root: Path, count: int, rebuild: bool = False) -> list[Path]:
+        """Prepare count isolated overlays root/0 ... root/count-1,
+        always creating them from scratch if rebuild is True.
+        """
+        trees = [root / str(i) for i in range(count)]
+        func = self.create if rebuild else self.prepare
+        with concurrent.futures.ThreadPoolExecutor(max_workers=count) as pool:
+            for future in [pool.submit(func, t) for t in trees]:
+                future.result()
+        return trees
@@ -0,0 +1,157 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Event driven supervision of the subprocesses spawned by the test harness.
+
+Every process is spawned through a ProcessSupervisor, which keeps track
+of them by PID. Waiting is done purely with asyncio primitives: a wait
+ends when the stop event is set (e.g. by the log watcher thread through
+loop.call_soon_threadsafe), when the process exits or when the timeout
+expires, whichever happens first. Nothing is polled in between.
+
+When the supervisor context exits, normally or due to an exception or
+cancellation (asyncio.run cancels the main task on KeyboardInterrupt),
+all tracked processes that are still running are terminated.
+"""
+
+import asyncio
+import enum
+import os
+import subprocess
+from pathlib import Path
+
+from loguru import logger
+
+DEFAULT_TERMINATE_GRACE = 10.0
+IS_WINDOWS = os.name == "nt"
+
+
+class WaitResult(enum.StrEnum):
+    EVENT = enum.auto()
+    EXITED = enum.auto()
+
+
+class ProcessSupervisor:
+    def __init__(self, terminate_grace: float = DEFAULT_TERMINATE_GRACE):
+        self._terminate_grace = terminate_grace
+        self._procs: dict[int, asyncio.subprocess.Process] = {}
+
+    @property
+    def pids(self) -> list[int]:
+        return list(self._procs)
+
+    def running(self) -> list[asyncio.subprocess.Process]:
+        return [p for p in self._procs.values() if p.returncode is None]
+
+    async def spawn(
+            self,
+            program: str | Path,
+            *args: str,
+            **kwargs,
+    ) -> asyncio.subprocess.Process:
+        proc = await asyncio.create_subprocess_exec(program, *args, **kwargs)
+        self._procs[proc.pid] = proc
+        logger.info("spawned pid={}: {}", proc.pid, program)
+        return proc
+
+    async def wait(
+            self,
+            proc: asyncio.subprocess.Process,
+            *events: asyncio.Event,
+            timeout: float | None,
+    ) -> WaitResult:
+        """Wait until any of events is set or proc exits. Raises
+        TimeoutError if neither happens within timeout seconds.
+        """
+        event_tasks = [asyncio.ensure_future(e.wait()) for e in events]
+        exit_task = asyncio.ensure_future(proc.wait())
+        try:
+            done, _ = await asyncio.wait_for(
+                asyncio.wait(
+                    (*event_tasks, exit_task),
+                    return_when=asyncio.FIRST_COMPLETED,
+                ),
+                timeout=timeout,
+            )
+        finally:
+            for task in (*event_tasks, exit_task):
+                task.cancel()
+        return WaitResult.EXITED if done == {exit_task} else WaitResult.EVENT
+
+    async def terminate(
+            self,
+            proc: asyncio.subprocess.Process,
+            tree: bool = True,
+    ) -> int:
+        """Ask proc to exit, kill it if it has not exited after the
+        grace period. Returns the exit code. On Windows, the whole
+        process tree of proc is stopped with taskkill unless tree is
+        False, in which case only proc itself is signaled.
+        """
+        use_taskkill = IS_WINDOWS and tree
+        if proc.returncode is None:
+            logger.info("terminating pid={}", proc.pid)
+            try:
+                if use_taskkill:
+                    # Without /F, taskkill lets UDK.exe shut down cleanly.
+                    await self._taskkill(proc, "/T")
+                else:
+                    proc.terminate()
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=self._terminate_grace)
+            except TimeoutError:
+                logger.warning("pid={} did not exit, killing it", proc.pid)
+                if use_taskkill:
+                    # proc.kill() would only stop the direct child,
+                    # leaving e.g. UDK.exe under UDK.com running.
+                    await self._taskkill(proc, "/F", "/T")
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+        ec = await proc.wait()
+        self._procs.pop(proc.pid, None)
+        return ec
+
+    @staticmethod
+    async def _taskkill(proc: asyncio.subprocess.Process, *flags: str):
+        await (await asyncio.create_subprocess_exec(
+            "taskkill", *flags, "/pid", str(proc.pid),
+            stderr=subprocess.DEVNULL,
+        )).wait()
+
+    async def terminate_all(self):
+        procs = self.running()
+        if procs:
+            await asyncio.gather(
+                *(self.terminate(p) for p in procs),
+                return_exceptions=True,
+            )
+        self._procs.clear()
+
+    async def __aenter__(self) -> "ProcessSupervisor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.terminate_all()
@@ -0,0 +1,67 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the benchmark comparison tables."""
+
+import pytest
+
+import benchreport
+
+BENCHMARKS = {
+    "read|static|8|inline": [2.0, 1.0],
+    "read|dynamic|8|inline": [3.0],
+    "read|static|8|call": [4.0],
+    "read|dynamic|8|call": [6.0, 5.0],
+    "noop|static|37|call": [0.5],
+    "noop|static|8|call": [0.5],
+}
+
+
+def test_compare_array_kind():
+    rows = benchreport.compare(BENCHMARKS, "kind")
+    assert [r.group for r in rows] == [
+        ("noop", "8", "call"),
+        ("noop", "37", "call"),
+        ("read", "8", "call"),
+        ("read", "8", "inline"),
+    ]
+    assert rows[0].other is None and rows[0].ratio is None
+    assert rows[2].base == 4.0 and rows[2].other == 5.0
+    assert rows[3].ratio == pytest.approx(3.0)
+
+
+def test_compare_call_overhead():
+    rows = {r.group: r for r in benchreport.compare(BENCHMARKS, "mode")}
+    assert rows[("read", "static", "8")].ratio == pytest.approx(4.0)
+    assert rows[("read", "dynamic", "8")].ratio == pytest.approx(5.0 / 3.0)
+    assert rows[("noop", "static", "8")].base is None
+
+
+def test_report():
+    lines = benchreport.report(BENCHMARKS)
+    assert lines[0].startswith("benchmark")
+    header = lines[1].split()
+    assert header == ["op", "size", "mode", "static", "dynamic", "ratio"]
+    assert lines[-1].split() == ["read", "static", "8", "1", "4", "4.00"]
+    # Columns are aligned.
+    assert len({len(line) for line in lines[1:6]}) == 1
+    assert benchreport.report({})[1].split()[0] == "op"
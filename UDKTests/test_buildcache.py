@@ -0,0 +1,141 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for incremental build manifests, using a stub make command."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import buildcache
+
+# Stub "UDK.com make": concatenates the copied sources into the package.
+STUB_MAKE = """
+import sys
+from pathlib import Path
+src_dir, package = Path(sys.argv[1]), Path(sys.argv[2])
+package.parent.mkdir(parents=True, exist_ok=True)
+package.write_bytes(b"".join(p.read_bytes() for p in sorted(src_dir.iterdir())))
+"""
+
+
+class Tree:
+    def __init__(self, root: Path):
+        self.classes = root / "Classes"
+        self.classes.mkdir()
+        self.cfg = root / "DefaultEngine.ini"
+        self.cfg.write_text("[UnrealEd.EditorEngine]\n+EditPackages=FCrypto\n")
+        self.dst = root / "UDK/Development/Src/FCrypto/Classes"
+        self.package = root / "UDK/UDKGame/Script/FCrypto.u"
+        self.manifest: dict[str, str] = {}
+        self.stamp = ""
+        self.builds = 0
+
+    def sources(self) -> list[Path]:
+        return sorted(self.classes.iterdir())
+
+    def plan(self) -> buildcache.BuildPlan:
+        return buildcache.plan_build(
+            self.sources(), [self.cfg], self.dst, self.package,
+            self.manifest, self.stamp)
+
+    def build(self) -> buildcache.BuildPlan:
+        """The harness build phase with a stub make command."""
+        plan = self.plan()
+        if not plan.fresh:
+            buildcache.apply_sources(plan, self.dst)
+            subprocess.run(
+                [sys.executable, "-c", STUB_MAKE, str(self.dst), str(self.package)],
+                check=True,
+            )
+            self.builds += 1
+            self.manifest = plan.manifest
+            self.stamp = buildcache.package_stamp(self.package)
+        return plan
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Tree:
+    t = Tree(tmp_path)
+    (t.classes / "FCryptoA.uc").write_text("class FCryptoA;")
+    (t.classes / "FCryptoB.uc").write_text("class FCryptoB;")
+    (t.classes / "FCryptoMacros.uci").write_text("`define X 1")
+    return t
+
+
+def test_first_build_copies_everything(tree: Tree):
+    plan = tree.build()
+    assert not plan.fresh
+    assert [p.name for p in plan.changed] == [
+        "FCryptoA.uc", "FCryptoB.uc", "FCryptoMacros.uci"]
+    assert tree.package.read_bytes() == b"class FCryptoA;class FCryptoB;`define X 1"
+
+
+def test_unchanged_build_is_skipped(tree: Tree):
+    tree.build()
+    plan = tree.build()
+    assert plan.fresh
+    assert tree.builds == 1
+
+
+def test_only_changed_sources_are_copied(tree: Tree):
+    tree.build()
+    (tree.classes / "FCryptoMacros.uci").write_text("`define X 2")
+    plan = tree.build()
+    assert [p.name for p in plan.changed] == ["FCryptoMacros.uci"]
+    assert tree.builds == 2
+    assert tree.package.read_bytes().endswith(b"`define X 2")
+
+
+def test_removed_source_is_removed(tree: Tree):
+    tree.build()
+    (tree.classes / "FCryptoB.uc").unlink()
+    plan = tree.build()
+    assert plan.removed == ["FCryptoB.uc"]
+    assert not (tree.dst / "FCryptoB.uc").exists()
+    assert tree.package.read_bytes() == b"class FCryptoA;`define X 1"
+
+
+def test_config_change_rebuilds(tree: Tree):
+    tree.build()
+    tree.cfg.write_text(tree.cfg.read_text() + "[IpDrv.TcpNetDriver]\n")
+    plan = tree.build()
+    assert not plan.fresh
+    assert plan.changed == []
+    assert tree.builds == 2
+
+
+def test_missing_or_modified_package_rebuilds(tree: Tree):
+    tree.build()
+    tree.package.unlink()
+    assert not tree.build().fresh
+    tree.package.write_bytes(b"tampered")
+    assert not tree.build().fresh
+    assert tree.builds == 3
+
+
+def test_failed_build_is_not_fresh(tree: Tree):
+    tree.build()
+    tree.stamp = ""
+    assert not tree.plan().fresh
@@ -0,0 +1,142 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for change impact based test suite selection."""
+
+from pathlib import Path
+
+import pytest
+
+import depgraph
+
+CLASSES_DIR = Path(__file__).parent.parent / "Classes"
+
+FILES = {
+    "Macros.uci": """
+`define FCLOG(msg) `log(`msg)
+`define MUL15(x, y) ((`x) * (`y))
+""",
+    "Utils.uc": """
+class Utils extends Object;
+`include(FCrypto\\Classes\\Macros.uci);
+static function int Mul(int A, int B) { return `MUL15(A, B); }
+""",
+    "Hash.uc": """
+class Hash extends Object;
+// BigInt is only mentioned in a comment.
+static function Foo() { class'Utils'.static.Mul(1, 2); }
+""",
+    "BigInt.uc": """
+class BigInt extends Object;
+static function Bar() { `FCLOG("Hash"); }
+""",
+    "Client.uc": """
+class Client extends Object;
+var FCryptoTestMutator Owner;
+""",
+    "FCryptoTestMutator.uc": """
+class FCryptoTestMutator extends Mutator;
+
+var Utils Utils;
+
+private final function int TestHash()
+{
+    class'Hash'.static.Foo();
+    return 0;
+}
+
+private final function int TestBigInt()
+{
+    Helper();
+    return 0;
+}
+
+private final function Helper()
+{
+    class'BigInt'.static.Bar();
+}
+
+private final function int TestUtils()
+{
+    Utils.Mul(1, 2);
+    return 0;
+}
+
+private final function int TestClient()
+{
+    local Client C;
+    return 0;
+}
+""",
+}
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name, text in FILES.items():
+        (tmp_path / name).write_text(text)
+        paths.append(tmp_path / name)
+    return paths
+
+
+def test_graph_dependencies(files: list[Path]):
+    graph = depgraph.DependencyGraph.from_files(files)
+    assert graph.deps["Utils.uc"] == {"Macros.uci"}
+    # Comments and strings do not count as references.
+    assert graph.deps["Hash.uc"] == {"Utils.uc"}
+    assert graph.deps["BigInt.uc"] == {"Macros.uci"}
+    assert graph.affected({"Hash.uc"}) == {"Hash.uc", "FCryptoTestMutator.uc", "Client.uc"}
+
+
+def test_test_dependencies(files: list[Path]):
+    graph = depgraph.DependencyGraph.from_files(files)
+    tests = depgraph.test_dependencies(graph, files[-1])
+    assert tests == {
+        "TestHash": {"Hash.uc"},
+        "TestBigInt": {"BigInt.uc"},
+        "TestUtils": {"Utils.uc"},
+        "TestClient": {"Client.uc"},
+    }
+
+
+@pytest.mark.parametrize("changed, expected", [
+    ({"Hash.uc"}, ["TestHash"]),
+    ({"Utils.uc"}, ["TestHash", "TestUtils"]),
+    ({"Macros.uci"}, ["TestBigInt", "TestHash", "TestUtils"]),
+    # Client references the mutator, which must not affect every suite.
+    ({"Client.uc"}, ["TestClient"]),
+    (set(), []),
+    ({"FCryptoTestMutator.uc"}, None),
+    ({"Removed.uc"}, None),
+])
+def test_select_tests(files: list[Path], changed: set[str], expected: list[str] | None):
+    assert depgraph.select_tests(files, changed) == expected
+
+
+@pytest.mark.skipif(not CLASSES_DIR.is_dir(), reason="no FCrypto sources")
+def test_select_tests_fcrypto_sources():
+    files = sorted(CLASSES_DIR.glob("*.uc*"))
+    all_tests = depgraph.select_tests(files, {"FCryptoMacros.uci"})
+    assert "TestMath" in all_tests
+    assert depgraph.select_tests(files, {"FCryptoQWORD.uc"}) == ["TestQWord", "TestSpeed"]
+    assert "TestMath" in depgraph.select_tests(files, {"FCryptoGMPClient.uc"})
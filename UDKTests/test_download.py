@@ -0,0 +1,211 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for resumable downloads and the archive cache,
+against a local HTTP server with Range support.
+"""
+
+import hashlib
+import http.server
+import random
+import re
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import download
+
+RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class FileServer(http.server.ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileHandler)
+        self.files: dict[str, bytes] = {}
+        self.ranges = True
+        # Drop the connection after this many bytes, once.
+        self.fail_after: int | None = None
+        self.requests: list[tuple[str, str, str | None]] = []
+        self.lock = threading.Lock()
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/{name}"
+
+
+class FileHandler(http.server.BaseHTTPRequestHandler):
+    server: FileServer
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, data: bytes) -> tuple[int, int, int] | None:
+        name = self.path.lstrip("/")
+        rng = self.headers.get("Range")
+        with self.server.lock:
+            self.server.requests.append((self.command, name, rng))
+        if name not in self.server.files:
+            self.send_error(404)
+            return None
+
+        start, end, status = 0, len(data), 200
+        if rng and self.server.ranges:
+            m = RANGE_RE.fullmatch(rng)
+            assert m is not None
+            start = int(m.group(1))
+            end = int(m.group(2)) + 1 if m.group(2) else len(data)
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(end - start))
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(data)}")
+        self.end_headers()
+        return start, end, status
+
+    def do_HEAD(self):
+        self._headers(self.server.files.get(self.path.lstrip("/"), b""))
+
+    def do_GET(self):
+        data = self.server.files.get(self.path.lstrip("/"), b"")
+        if (bounds := self._headers(data)) is None:
+            return
+        start, end, _ = bounds
+        body = data[start:end]
+        with self.server.lock:
+            fail_after, self.server.fail_after = self.server.fail_after, None
+        if fail_after is not None:
+            self.wfile.write(body[:fail_after])
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server() -> Iterator[FileServer]:
+    srv = FileServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def payload(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def gets(server: FileServer) -> list[str | None]:
+    return [rng for method, _, rng in server.requests if method == "GET"]
+
+
+def test_download(server: FileServer, tmp_path: Path):
+    data = payload(100_000)
+    server.files["a.7z"] = data
+    out = tmp_path / "a.7z"
+    digest = download.download(server.url("a.7z"), out, progress_bar=False)
+    assert out.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert not (tmp_path / "a.7z.part").exists()
+
+
+def test_resume_after_interruption(server: FileServer, tmp_path: Path):
+    data = payload(300_000)
+    server.files["a.7z"] = data
+    server.fail_after = 100_000
+    out = tmp_path / "a.7z"
+    digest = download.download(
+        server.url("a.7z"), out, chunk_size=4096, progress_bar=False)
+    assert out.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+    resumed = gets(server)
+    assert resumed[0] is None
+    assert len(resumed) == 2 and resumed[1] is not None
+    m = RANGE_RE.fullmatch(resumed[1])
+    assert m is not None and int(m.group(1)) > 0
+
+
+def test_resume_partial_file_from_previous_run(server: FileServer, tmp_path: Path):
+    data = payload(50_000)
+    server.files["a.7z"] = data
+    out = tmp_path / "a.7z"
+    (tmp_path / "a.7z.part").write_bytes(data[:20_000])
+    digest = download.download(server.url("a.7z"), out, progress_bar=False)
+    assert gets(server) == ["bytes=20000-"]
+    assert out.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_no_range_support_restarts(server: FileServer, tmp_path: Path):
+    data = payload(50_000)
+    server.files["a.7z"] = data
+    server.ranges = False
+    out = tmp_path / "a.7z"
+    (tmp_path / "a.7z.part").write_bytes(b"garbage")
+    digest = download.download(server.url("a.7z"), out, progress_bar=False)
+    assert gets(server) == [None]
+    assert out.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_segmented_download(server: FileServer, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(download, "MIN_SEGMENT_SIZE", 1024)
+    data = payload(200_003)
+    server.files["a.7z"] = data
+    server.fail_after = 10_000
+    out = tmp_path / "a.7z"
+    digest = download.download(
+        server.url("a.7z"), out, segments=4, chunk_size=1024, progress_bar=False)
+    assert out.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+    # One of the segments was interrupted and resumed.
+    assert len(gets(server)) == 5
+    assert all(rng is not None for rng in gets(server))
+    assert not (tmp_path / "a.7z.part.json").exists()
+
+
+def test_archive_cache_reuses_tags(server: FileServer, tmp_path: Path):
+    server.files["UDK-Lite-1.7z"] = payload(10_000, 1)
+    server.files["UDK-Lite-2.7z"] = payload(10_000, 2)
+    cache = download.ArchiveCache(tmp_path / "archives")
+
+    a = cache.fetch("1", server.url("UDK-Lite-1.7z"), progress_bar=False)
+    b = cache.fetch("2", server.url("UDK-Lite-2.7z"), progress_bar=False)
+    num_requests = len(server.requests)
+    assert cache.fetch("1", server.url("UDK-Lite-1.7z"), progress_bar=False) == a
+    assert len(server.requests) == num_requests
+
+    digest_a = hashlib.sha256(server.files["UDK-Lite-1.7z"]).hexdigest()
+    assert a == tmp_path / "archives" / "1" / digest_a / "UDK-Lite-1.7z"
+    assert b.read_bytes() == server.files["UDK-Lite-2.7z"]
+
+
+def test_archive_cache_digest_mismatch(server: FileServer, tmp_path: Path):
+    server.files["a.7z"] = payload(1000)
+    cache = download.ArchiveCache(tmp_path / "archives")
+    with pytest.raises(download.DigestMismatchError):
+        cache.fetch("1", server.url("a.7z"), digest="00" * 32, progress_bar=False)
+    assert cache.lookup("1", "a.7z") is None
@@ -0,0 +1,138 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for manifest based incremental archive extraction."""
+
+import os
+import random
+from pathlib import Path
+
+import py7zr
+import pytest
+
+import extraction
+
+FILES = {
+    "Binaries/Win64/UDK.exe": 5000,
+    "Binaries/Win64/UDK.com": 300,
+    "UDKGame/Config/DefaultEngine.ini": 200,
+    "UDKGame/Script/Core.u": 8000,
+    "UDKGame/Logs/.keep": 0,
+}
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    rng = random.Random(0)
+    src = tmp_path / "src"
+    for name, size in FILES.items():
+        (src / name).parent.mkdir(parents=True, exist_ok=True)
+        (src / name).write_bytes(rng.randbytes(size))
+    out = tmp_path / "UDK-Lite.7z"
+    with py7zr.SevenZipFile(out, "w") as pkg:
+        for name in FILES:
+            pkg.write(src / name, name)
+    return out
+
+
+def sync(archive: Path, out_dir: Path, manifest: extraction.Manifest, **kwargs):
+    return extraction.sync_archive(archive, out_dir, manifest, workers=2, **kwargs)
+
+
+def test_cold_and_warm_sync(archive: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    cold = sync(archive, out, {})
+    assert cold.extracted == sorted(FILES)
+    assert set(cold.manifest) == set(FILES)
+    assert (out / "UDKGame/Script/Core.u").stat().st_size == 8000
+
+    warm = sync(archive, out, cold.manifest)
+    assert warm.extracted == []
+    assert warm.hashed == 0
+    assert warm.manifest == cold.manifest
+
+
+def test_tampered_file_is_extracted(archive: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    manifest = sync(archive, out, {}).manifest
+    core = out / "UDKGame/Script/Core.u"
+    original = core.read_bytes()
+    core.write_bytes(bytes(len(original)))
+
+    result = sync(archive, out, manifest)
+    assert result.extracted == ["UDKGame/Script/Core.u"]
+    assert result.hashed == 1
+    assert core.read_bytes() == original
+
+
+def test_touched_file_is_only_hashed(archive: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    manifest = sync(archive, out, {}).manifest
+    core = out / "UDKGame/Script/Core.u"
+    st = core.stat()
+    os.utime(core, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    result = sync(archive, out, manifest)
+    assert result.extracted == []
+    assert result.hashed == 1
+    assert result.manifest["UDKGame/Script/Core.u"]["mtime_ns"] == st.st_mtime_ns + 10 ** 9
+
+
+def test_missing_and_resized_files_are_extracted(archive: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    manifest = sync(archive, out, {}).manifest
+    (out / "Binaries/Win64/UDK.com").unlink()
+    (out / "UDKGame/Logs/.keep").write_text("x")
+
+    result = sync(archive, out, manifest)
+    assert result.extracted == ["Binaries/Win64/UDK.com", "UDKGame/Logs/.keep"]
+    assert result.hashed == 0
+    assert (out / "UDKGame/Logs/.keep").stat().st_size == 0
+
+
+def test_mutable_members_are_kept(archive: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    manifest = sync(archive, out, {}).manifest
+    ini = out / "UDKGame/Config/DefaultEngine.ini"
+    ini.write_text("[IpDrv.TcpNetDriver]\n")
+
+    mutable = frozenset({"UDKGame/Config/DefaultEngine.ini"})
+    result = sync(archive, out, manifest, mutable=mutable)
+    assert result.extracted == []
+    assert ini.read_text() == "[IpDrv.TcpNetDriver]\n"
+
+    ini.unlink()
+    assert sync(archive, out, manifest, mutable=mutable).extracted == [
+        "UDKGame/Config/DefaultEngine.ini"]
+
+
+def test_extract_groups_by_folder(monkeypatch, tmp_path: Path):
+    calls = []
+    monkeypatch.setattr(
+        extraction, "_extract_group",
+        lambda archive, out_dir, targets: calls.append(sorted(targets)))
+    members = {
+        name: extraction.Member(name, 1, 0, folder, False)
+        for name, folder in [("a", 0), ("b", 1), ("c", 0), ("d", 2)]
+    }
+    extraction.extract(tmp_path / "x.7z", tmp_path, members, ["a", "b", "c", "d"], workers=3)
+    assert sorted(calls) == [["a", "c"], ["b"], ["d"]]
@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the harness log sinks."""
+
+import io
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from loguru import logger
+
+import logsinks
+
+UDK_TEXT = (
+    "[0001.00] Log: Loading package\n"
+    "[0001.10] ScriptLog: caf\u00e9 {not a format field}\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_logger() -> Iterator[None]:
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+@pytest.fixture
+def console() -> io.StringIO:
+    return io.StringIO()
+
+
+def test_udk_lines_go_to_file_only(tmp_path: Path, console: io.StringIO):
+    log_file = tmp_path / "harness.log"
+    logsinks.setup_logging(log_file, stream=console)
+    forwarder = logsinks.UdkLogForwarder("shard 1")
+    logger.info("harness message")
+    forwarder.write(UDK_TEXT)
+    forwarder.error("[0001.20] Error: boom")
+    forwarder.close()
+    logger.complete()
+
+    text = log_file.read_text(encoding="utf-8")
+    assert "[shard 1] [0001.00] Log: Loading package\n" in text
+    assert "[shard 1] [0001.10] ScriptLog: caf\u00e9 {not a format field}\n" in text
+    assert "harness message" in text
+    assert "shard 1: [0001.20] Error: boom" in text
+
+    shown = console.getvalue()
+    assert "harness message" in shown
+    assert "Error: boom" in shown
+    assert "Loading package" not in shown
+
+
+def test_verbose_and_normalized_console(tmp_path: Path, console: io.StringIO):
+    logsinks.setup_logging(
+        tmp_path / "harness.log", verbose=True, normalize=True,
+        enqueue=False, stream=console)
+    forwarder = logsinks.UdkLogForwarder()
+    forwarder.write(UDK_TEXT)
+    forwarder.close()
+    shown = console.getvalue()
+    assert "[UDK] [0001.00] Log: Loading package" in shown
+    assert "cafe\u0301" in shown
+
+
+def test_live_errors_are_limited(monkeypatch, console: io.StringIO):
+    monkeypatch.setattr(logsinks, "MAX_LIVE_ERRORS", 2)
+    logger.remove()
+    logger.add(console, format="{message}")
+    forwarder = logsinks.UdkLogForwarder()
+    for i in range(5):
+        forwarder.error(f"Error: {i}")
+    forwarder.close()
+    assert console.getvalue().splitlines() == ["UDK: Error: 0", "UDK: Error: 1"]
+    assert forwarder.suppressed_errors == 3
+
+
+def test_close_without_writes():
+    logsinks.UdkLogForwarder().close()
+
+
+def test_progress_is_rate_limited(console: io.StringIO):
+    logger.remove()
+    logger.add(console, format="{message}")
+    now = [0.0]
+    progress = logsinks.ProgressReporter("UDK", interval=10.0, clock=lambda: now[0])
+    for _ in range(5):
+        now[0] += 3.0
+        progress.update(UDK_TEXT, "testing", 1, 0, 2)
+    lines = console.getvalue().splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("UDK [testing]: 8 lines")
+    assert progress.lines == 10
@@ -0,0 +1,106 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for incremental log tailing and line classification."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from logtail import LineKind
+from logtail import LogTailer
+from logtail import classify
+from logtail import classify_line
+
+
+@pytest.mark.parametrize("line, kind", [
+    ("[0001.23] ScriptLog: hello", None),
+    ("[0001.23] Error: something broke", LineKind.ERROR),
+    ("[0001.23] error: something broke", LineKind.ERROR),
+    ("[0001.23] Error:", None),
+    ("[0001.23] ScriptLog: ##ERROR## test failed", LineKind.ERROR),
+    ("[0001.23] ScriptWarning: Accessed array 'Arr' out of bounds (5/3)", LineKind.ERROR),
+    ("[0001.23] Warning: ##ERROR## both", LineKind.ERROR),
+    ("[0001.23] Warning: careful", LineKind.WARNING),
+    ("[0001.23] Log: Log file closed, 10/19/26 12:00:00", LineKind.LOG_CLOSED),
+    ("[0001.23] Exit: Exiting.", LineKind.EXITING),
+    ("Log file closed without a timestamp", None),
+    ("[0001.23] Error: with CRLF\r", LineKind.ERROR),
+])
+def test_classify_line(line: str, kind: LineKind | None):
+    assert classify_line(line) == kind
+
+
+def test_classify_block():
+    text = (
+        "[0000.01] Log: start\n"
+        "[0000.02] Warning: w1\r\n"
+        "[0000.03] ScriptLog: ok\n"
+        "[0000.04] Error: e1\n"
+        "[0000.05] Exit: Exiting.\n"
+    )
+    assert [(x.kind, x.line) for x in classify(text)] == [
+        (LineKind.WARNING, "[0000.02] Warning: w1"),
+        (LineKind.ERROR, "[0000.04] Error: e1"),
+        (LineKind.EXITING, "[0000.05] Exit: Exiting."),
+    ]
+
+
+def test_tailer_partial_lines(tmp_path: Path):
+    log = tmp_path / "Launch.log"
+    with LogTailer(log) as tailer:
+        assert tailer.read() == ""
+        with log.open("wb", buffering=0) as f:
+            f.write(b"[0000.01] Log: one\n[0000.02] Log: tw")
+            assert tailer.read() == "[0000.01] Log: one\n"
+            assert tailer.read() == ""
+            f.write(b"o\n[0000.03] Log: \xc3")
+            assert tailer.read() == "[0000.02] Log: two\n"
+            f.write(b"\xa4\n")
+            assert tailer.read() == "[0000.03] Log: ä\n"
+
+
+def test_tailer_truncation(tmp_path: Path):
+    log = tmp_path / "Launch.log"
+    log.write_bytes(b"old line 1\nold line 2\n")
+    with LogTailer(log) as tailer:
+        assert tailer.read_lines() == ["old line 1", "old line 2"]
+        with log.open("wb") as f:
+            f.write(b"new\n")
+        assert tailer.read_lines() == ["new"]
+        assert tailer.truncations == 1
+        assert tailer.rotations == 0
+
+
+def test_tailer_rotation(tmp_path: Path):
+    log = tmp_path / "Launch.log"
+    log.write_bytes(b"first\n")
+    with LogTailer(log) as tailer:
+        assert tailer.read_lines() == ["first"]
+        with log.open("ab") as f:
+            f.write(b"last words")
+        os.replace(log, tmp_path / "Launch-backup.log")
+        log.write_bytes(b"second file line\n")
+        assert tailer.read_lines() == ["last words", "second file line"]
+        assert tailer.rotations == 1
+        assert tailer.position == len(b"second file line\n")
@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the timing history and regression detection."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+import perfgate
+from timings import RunTimings
+
+
+def run(mean: float, n: int = 8, seed: int = 0, sd: float = 0.02) -> RunTimings:
+    rng = random.Random(seed)
+    return RunTimings(suites={"TestMath": [rng.gauss(mean, sd) for _ in range(n)]})
+
+
+def test_t_sf():
+    assert perfgate.t_sf(2.0, 10) == pytest.approx(0.036694, abs=1e-6)
+    assert perfgate.t_sf(-1.0, 5) == pytest.approx(0.818391, abs=1e-6)
+    assert perfgate.t_sf(0.0, 3) == pytest.approx(0.5)
+
+
+def test_no_regression():
+    baseline = [run(1.0, seed=i) for i in range(10)]
+    [c] = perfgate.compare(run(1.0, seed=100), baseline)
+    assert not c.regression
+    assert c.p_value > 0.01
+
+
+def test_regression():
+    baseline = [run(1.0, seed=i) for i in range(10)]
+    [c] = perfgate.compare(run(1.2, seed=100), baseline)
+    assert c.regression
+    assert c.slowdown == pytest.approx(0.2, abs=0.02)
+    assert c.p_value < 1e-6
+    assert c.z_score > 3
+
+
+def test_small_significant_slowdown_is_ignored():
+    baseline = [run(1.0, n=50, seed=i, sd=0.001) for i in range(10)]
+    [c] = perfgate.compare(run(1.02, n=50, seed=100, sd=0.001), baseline)
+    assert c.p_value < 0.01
+    assert not c.regression
+
+
+def test_single_sample_uses_z_score():
+    baseline = [run(1.0, n=1, seed=i) for i in range(5)]
+    [c] = perfgate.compare(run(2.0, n=1, seed=100), baseline)
+    assert c.p_value is None
+    assert c.regression
+
+
+def test_history_baseline(tmp_path: Path):
+    path = tmp_path / "timings.jsonl"
+    for i in range(15):
+        record = perfgate.make_record(run(1.0, seed=i), f"c{i}", False)
+        record["regressions"] = ["TestMath"] if i == 14 else []
+        perfgate.append_record(path, record)
+    other = perfgate.make_record(run(5.0), "x", False)
+    other["host"] = "elsewhere"
+    perfgate.append_record(path, other)
+    with path.open("a") as f:
+        f.write('{"partial": ')
+
+    history = perfgate.load_history(path)
+    assert len(history) == 16
+    baseline = perfgate.select_baseline(history, history[0]["host"], window=10)
+    assert baseline == [
+        RunTimings.from_json(r["timings"]) for r in history[4:14]]
+
+
+def test_git_commit_outside_repo(tmp_path: Path):
+    assert perfgate.git_commit(tmp_path) == ("", False)
+
+
+def test_adaptive_timeout():
+    assert perfgate.adaptive_timeout([10.0, 11.0], 2.0, 1.0, 300.0) == 300.0
+    durations = [10.0, 11.0, 12.0, 30.0]
+    p95 = perfgate.percentile(durations, 95)
+    assert p95 == pytest.approx(27.3)
+    assert perfgate.adaptive_timeout(durations, 2.0, 1.0, 300.0) == pytest.approx(54.6)
+    assert perfgate.adaptive_timeout(durations, 2.0, 1.0, 300.0, scale=4) == \
+           pytest.approx(218.4)
+    assert perfgate.adaptive_timeout(durations, 2.0, 100.0, 300.0) == 100.0
+    assert perfgate.adaptive_timeout(durations, 2.0, 1.0, 50.0) == 50.0
+
+
+def test_phase_durations():
+    host = perfgate.current_host()
+    history = [
+        {"host": host, "phases": {"build": 20.0, "test": 40.0, "test_loops": 4}},
+        {"host": host, "phases": {"test": 30.0, "test_loops": 2}},
+        {"host": "elsewhere", "phases": {"build": 1.0, "test": 1.0}},
+        {"host": host},
+    ]
+    assert perfgate.phase_durations(history, host, "build") == [20.0]
+    assert perfgate.phase_durations(history, host, "test") == [10.0, 15.0]
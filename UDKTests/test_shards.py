@@ -0,0 +1,211 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for sharded test runs, using fake_udk.py in place of UDK.com."""
+
+import asyncio
+import random
+import re
+import socket
+import sys
+from pathlib import Path
+
+import fake_udk
+import run_udk_tests
+import shards
+from logwatch import LogWatcher
+from logwatch import wait_for_log_end
+from shards import Shard
+from supervisor import ProcessSupervisor
+
+FAKE_UDK = str(Path(__file__).parent / "fake_udk.py")
+URL = run_udk_tests.udk_url("FCrypto.FCryptoTestMutator", None)
+RUNNING_RE = re.compile(r"--- RUNNING TestQWord \((\d+)\) ---")
+
+# Stand-in for gmp_server.py, accepts and closes connections.
+LISTENER = """
+import socket, sys
+server = socket.create_server(("127.0.0.1", int(sys.argv[1])))
+while True:
+    server.accept()[0].close()
+"""
+
+
+def free_base_port(count: int) -> int:
+    while True:
+        base = random.randrange(20000, 60000)
+        try:
+            for port in range(base, base + count):
+                with socket.create_server(("127.0.0.1", port)):
+                    pass
+            return base
+        except OSError:
+            continue
+
+
+def server_command(shard: Shard) -> list[str]:
+    return [sys.executable, FAKE_UDK, "server", URL + shard.url_options,
+            f"-PORT={shard.game_port}"]
+
+
+def gmp_command(shard: Shard) -> list[str]:
+    return [sys.executable, "-c", LISTENER, str(shard.gmp_port)]
+
+
+def run(
+        shard_list: list[Shard],
+        timeout: float = 60,
+        stall_timeout: float | None = None,
+        fail_fast: bool = False,
+) -> shards.ShardReport:
+    async def main():
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            return await shards.run_shards(
+                supervisor, shard_list, server_command, gmp_command,
+                timeout, stall_timeout, fail_fast)
+
+    return asyncio.run(main())
+
+
+def test_split_loops():
+    assert shards.split_loops(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert shards.split_loops(4, 4) == [(0, 1), (1, 2), (2, 3), (3, 4)]
+    assert shards.split_loops(2, 4) == [(0, 1), (1, 2)]
+    assert shards.split_loops(5, 1) == [(0, 5)]
+
+
+def test_plan_shards(tmp_path: Path):
+    trees = [tmp_path / str(i) for i in range(3)]
+    plan = shards.plan_shards(trees, 2, 1000, 7777)
+    assert len(plan) == 2
+    assert [(s.root, s.gmp_port, s.game_port) for s in plan] == [
+        (trees[0], 1000, 7777), (trees[1], 1001, 7778)]
+    assert plan[1].url_options == "?FirstTestLoop=1?NumTestLoops=2?GMPPort=1001"
+
+
+def test_sharded_run(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("FAKE_UDK_FAIL_LOOPS", "5")
+    monkeypatch.setenv("FAKE_UDK_WARN_LOOPS", "0,6")
+    trees = [tmp_path / str(i) for i in range(3)]
+    base_port = free_base_port(len(trees))
+    plan = shards.plan_shards(trees, 7, base_port, 7777)
+
+    report = run(plan)
+
+    assert report.exit_code == 0
+    assert sorted(report.shard_elapsed) == [0, 1, 2]
+    assert report.elapsed >= max(report.shard_elapsed.values())
+    assert sorted(report.timings.suites) == sorted(fake_udk.SUITES)
+    assert len(report.timings.suites["TestMath"]) == 7
+    assert len(report.timings.total_clock) == 3
+    assert len(report.errors) == 1
+    assert report.errors[0].startswith("[shard 2] ")
+    assert "(Iteration=5)" in report.errors[0]
+    assert [w.split()[:2] for w in report.warnings] == [
+        ["[shard", "0]"], ["[shard", "2]"]]
+
+    for shard in plan:
+        log = shard.log_file.read_text()
+        assert f"connected to port {shard.gmp_port}" in log
+        loops = [int(i) for i in RUNNING_RE.findall(log)]
+        assert loops == list(range(shard.first_loop, shard.end_loop))
+    assert [(s.first_loop, s.end_loop) for s in plan] == [(0, 3), (3, 5), (5, 7)]
+
+
+def test_parse_options_first_match():
+    options = fake_udk.parse_options(
+        "Entry?NumTestLoops=7?FirstTestLoop=3?numtestloops=5")
+    assert options == {"numtestloops": "7", "firsttestloop": "3"}
+    assert "NumTestLoops" not in URL
+
+
+def test_sharded_run_timeout(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("FAKE_UDK_LINE_DELAY", "1")
+    plan = shards.plan_shards(
+        [tmp_path / "0", tmp_path / "1"], 2, free_base_port(2), 7777)
+
+    report = run(plan, timeout=0.5)
+
+    assert report.exit_code == 2
+    assert len(report.errors) == 2
+    assert all("timed out" in e for e in report.errors)
+
+
+def test_fail_fast_aborts_all_shards(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("FAKE_UDK_FAIL_LOOPS", "0")
+    monkeypatch.setenv("FAKE_UDK_LINE_DELAY", "0.2")
+    plan = shards.plan_shards(
+        [tmp_path / "0", tmp_path / "1"], 20, free_base_port(2), 7777)
+
+    report = run(plan, fail_fast=True)
+
+    # Over 100 log lines per shard at 0.2 s per line without fail-fast.
+    assert report.elapsed < 10
+    assert report.exit_code == 1
+    assert [e.split()[:2] for e in report.errors] == [["[shard", "0]"]] * 2
+    assert "aborted on first error" in report.errors[1]
+    assert len(report.warnings) == 1
+    assert report.warnings[0].startswith("[shard 1] ")
+    assert "another shard failed" in report.warnings[0]
+
+
+def test_stall_detection(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("FAKE_UDK_HANG_LOOP", "1")
+    plan = shards.plan_shards([tmp_path / "0"], 3, free_base_port(1), 7777)
+
+    report = run(plan, timeout=60, stall_timeout=1)
+
+    assert report.elapsed < 10
+    assert report.exit_code == 1
+    assert len(report.errors) == 1
+    assert "has not grown in 1 s" in report.errors[0]
+    assert report.timings.suites["TestMath"]
+
+
+def test_stall_window_starts_with_phase(tmp_path: Path):
+    log_file = tmp_path / "Launch.log"
+    log_file.touch()
+
+    async def main():
+        watcher = LogWatcher(asyncio.get_running_loop(), asyncio.Event(),
+                             asyncio.Event(), log_file)
+        # Long idle time before the phase, e.g. a skipped build.
+        watcher._last_activity -= 100
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            proc = await supervisor.spawn(
+                sys.executable, "-c", "import time; time.sleep(0.5)")
+            return await wait_for_log_end(
+                supervisor, watcher, proc, asyncio.Event(), timeout=30, stall_timeout=5)
+
+    assert asyncio.run(main()) == 0
+
+
+def test_copy_build_outputs(tmp_path: Path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    pkg = src / "UDKGame/Unpublished/CookedPC/Script/FCrypto.u"
+    pkg.parent.mkdir(parents=True)
+    pkg.write_bytes(b"package")
+    shards.copy_build_outputs(src, dst, ("UDKGame/Unpublished",))
+    copied = dst / "UDKGame/Unpublished/CookedPC/Script/FCrypto.u"
+    assert copied.read_bytes() == b"package"
+    assert copied.stat().st_mtime_ns == pkg.stat().st_mtime_ns
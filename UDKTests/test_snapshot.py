@@ -0,0 +1,129 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for UDK-Lite overlay trees."""
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+import snapshot
+
+BASE_FILES = {
+    "Binaries/Win64/UDK.exe": b"original exe",
+    "Binaries/Win64/UDK_norunaway.exe": b"patched exe",
+    "Binaries/Win64/UDK.com": b"com",
+    "UDKGame/Config/DefaultEngine.ini": b"[Engine]\n",
+    "UDKGame/Logs/.keep": b"",
+    "UDKGame/Script/Core.u": b"core" * 100,
+    "Development/Src/Core/Classes/Object.uc": b"class Object;",
+}
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Path:
+    root = tmp_path / "UDK-Lite"
+    for name, data in BASE_FILES.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_bytes(data)
+    return root
+
+
+def same_file(a: Path, b: Path) -> bool:
+    return os.path.samefile(a, b)
+
+
+def test_create_links_immutable_and_copies_reset_paths(base: Path, tmp_path: Path):
+    tree = tmp_path / "trees/0"
+    stats = snapshot.Snapshot(base).create(tree)
+    assert stats.rebuilt
+    for name, data in BASE_FILES.items():
+        assert (tree / name).read_bytes() == data
+    assert same_file(tree / "UDKGame/Script/Core.u", base / "UDKGame/Script/Core.u")
+    assert same_file(tree / "Binaries/Win64/UDK.com", base / "Binaries/Win64/UDK.com")
+    assert not same_file(tree / "Binaries/Win64/UDK.exe", base / "Binaries/Win64/UDK.exe")
+    assert not same_file(
+        tree / "UDKGame/Config/DefaultEngine.ini", base / "UDKGame/Config/DefaultEngine.ini")
+    assert stats.linked == 4
+    assert stats.cloned + stats.copied == 3
+
+
+def test_reset_restores_tree_and_keeps_build_outputs(base: Path, tmp_path: Path):
+    tree = tmp_path / "trees/0"
+    snap = snapshot.Snapshot(base)
+    snap.create(tree)
+
+    # What a test run does to the tree.
+    (tree / "UDKGame/Config/DefaultEngine.ini").write_text("[Engine]\n+EditPackages=FCrypto\n")
+    (tree / "UDKGame/Config/UDKEngine.ini").write_text("generated")
+    (tree / "UDKGame/Logs/Launch.log").write_text("log")
+    (tree / "Binaries/Win64/UDK.exe").rename(tree / "Binaries/Win64/UDK.exe.backup")
+    (tree / "Binaries/Win64/UDK.exe").write_bytes(b"patched exe")
+    (tree / "UDKGame/Autosaves").mkdir()
+    (tree / "UDKGame/Autosaves/x.udk").write_text("x")
+    src = tree / "Development/Src/FCrypto/Classes/FCryptoBigInt.uc"
+    src.parent.mkdir(parents=True)
+    src.write_text("class FCryptoBigInt;")
+    package = tree / "UDKGame/Unpublished/CookedPC/Script/FCrypto.u"
+    package.parent.mkdir(parents=True)
+    package.write_bytes(b"compiled")
+
+    stats = snap.prepare(tree)
+    assert not stats.rebuilt
+    for name, data in BASE_FILES.items():
+        assert (tree / name).read_bytes() == data
+        assert (base / name).read_bytes() == data
+    assert not (tree / "UDKGame/Config/UDKEngine.ini").exists()
+    assert not (tree / "UDKGame/Logs/Launch.log").exists()
+    assert not (tree / "Binaries/Win64/UDK.exe.backup").exists()
+    assert not (tree / "UDKGame/Autosaves").exists()
+    assert src.read_text() == "class FCryptoBigInt;"
+    assert package.read_bytes() == b"compiled"
+
+
+def test_base_id_change_rebuilds(base: Path, tmp_path: Path):
+    tree = tmp_path / "trees/0"
+    snapshot.Snapshot(base, base_id="a").create(tree)
+    assert not snapshot.Snapshot(base, base_id="a").prepare(tree).rebuilt
+    assert snapshot.Snapshot(base, base_id="b").prepare(tree).rebuilt
+
+
+def test_prepare_many_trees_are_isolated(base: Path, tmp_path: Path):
+    trees = snapshot.Snapshot(base).prepare_many(tmp_path / "trees", 3)
+    assert [t.name for t in trees] == ["0", "1", "2"]
+    (trees[0] / "UDKGame/Config/DefaultEngine.ini").write_text("changed")
+    assert (trees[1] / "UDKGame/Config/DefaultEngine.ini").read_bytes() == b"[Engine]\n"
+    assert (base / "UDKGame/Config/DefaultEngine.ini").read_bytes() == b"[Engine]\n"
+
+
+def test_copy_fallback_without_hardlinks(base: Path, tmp_path: Path, monkeypatch):
+    def no_link(src, dst):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(os, "link", no_link)
+    tree = tmp_path / "trees/0"
+    stats = snapshot.Snapshot(base).create(tree)
+    assert stats.linked == 0
+    assert stats.cloned + stats.copied == len(BASE_FILES)
+    assert not same_file(tree / "UDKGame/Script/Core.u", base / "UDKGame/Script/Core.u")
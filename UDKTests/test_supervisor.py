@@ -0,0 +1,136 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for subprocess supervision."""
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+import supervisor as supervisor_mod
+from supervisor import ProcessSupervisor
+from supervisor import WaitResult
+
+SLEEP_FOREVER = ["-c", "import time; time.sleep(600)"]
+
+
+async def spawn_sleeper(supervisor: ProcessSupervisor) -> asyncio.subprocess.Process:
+    return await supervisor.spawn(sys.executable, *SLEEP_FOREVER)
+
+
+def test_wait_event_from_thread():
+    async def run():
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            proc = await spawn_sleeper(supervisor)
+            threading.Timer(0.1, loop.call_soon_threadsafe, (event.set,)).start()
+            assert await supervisor.wait(proc, event, timeout=30) == WaitResult.EVENT
+            assert proc.returncode is None
+        assert proc.returncode is not None
+        assert supervisor.pids == []
+
+    asyncio.run(run())
+
+
+def test_wait_process_exit():
+    async def run():
+        async with ProcessSupervisor() as supervisor:
+            proc = await supervisor.spawn(sys.executable, "-c", "raise SystemExit(3)")
+            assert await supervisor.wait(proc, asyncio.Event(), timeout=30) == \
+                   WaitResult.EXITED
+            assert await supervisor.terminate(proc) == 3
+
+    asyncio.run(run())
+
+
+def test_wait_timeout():
+    async def run():
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            proc = await spawn_sleeper(supervisor)
+            with pytest.raises(TimeoutError):
+                await supervisor.wait(proc, asyncio.Event(), timeout=0.1)
+        assert proc.returncode is not None
+
+    asyncio.run(run())
+
+
+def test_cancellation_terminates_children():
+    procs: list[asyncio.subprocess.Process] = []
+
+    async def supervised():
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            for _ in range(3):
+                procs.append(await spawn_sleeper(supervisor))
+            await asyncio.Event().wait()
+
+    async def run():
+        task = asyncio.create_task(supervised())
+        while len(procs) < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert all(p.returncode is not None for p in procs)
+
+
+def test_wait_any_event():
+    async def run():
+        events = [asyncio.Event() for _ in range(3)]
+        async with ProcessSupervisor(terminate_grace=5) as supervisor:
+            proc = await spawn_sleeper(supervisor)
+            asyncio.get_running_loop().call_later(0.1, events[2].set)
+            assert await supervisor.wait(proc, *events, timeout=30) == WaitResult.EVENT
+            assert events[2].is_set()
+
+    asyncio.run(run())
+
+
+def test_taskkill_forced_after_grace(monkeypatch):
+    calls = []
+
+    async def taskkill(proc: asyncio.subprocess.Process, *flags: str):
+        # Like taskkill, the tree is only stopped when forced.
+        calls.append(flags)
+        if "/F" in flags:
+            proc.kill()
+
+    monkeypatch.setattr(supervisor_mod, "IS_WINDOWS", True)
+    monkeypatch.setattr(ProcessSupervisor, "_taskkill", staticmethod(taskkill))
+
+    async def run():
+        async with ProcessSupervisor(terminate_grace=0.2) as supervisor:
+            proc = await spawn_sleeper(supervisor)
+            assert await supervisor.terminate(proc) != 0
+            assert calls == [("/T",), ("/F", "/T")]
+
+            calls.clear()
+            proc = await spawn_sleeper(supervisor)
+            await supervisor.terminate(proc, tree=False)
+            assert calls == []
+            assert supervisor.pids == []
+
+    asyncio.run(run())
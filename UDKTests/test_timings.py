@@ -0,0 +1,80 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for extracting timings from the UDK log."""
+
+import timings
+from timings import TimingParser
+
+PREFIX = "[0001.00] FCrypto: FCryptoTestMutator::RunTest(): "
+LOG = (
+    f"{PREFIX}--- RUNNING TestMath (0) ---\n"
+    "[0001.10] FCrypto: FCryptoTestMutator::TestMath(): Clock time : 5\n"
+    f"{PREFIX}Clock time : 1500.0\n"
+    f"{PREFIX}Clock time : 1500000.0\n"
+    f"{PREFIX}Clock time : 1500000000.0\n"
+    f"{PREFIX}--- RUNNING TestMath (1) ---\n"
+    f"{PREFIX}Clock time : 2500.0\n"
+    f"{PREFIX}--- RUNNING TestAesCt (1) ---\n"
+    f"{PREFIX}Clock time : 1.5e-3\n"
+    "[0002.00] FCrypto: FCryptoTestMutator::RunNextTest(): --- TOTAL TIME       : 12.5 ---\n"
+    "[0002.00] FCrypto: FCryptoTestMutator::RunNextTest(): --- TOTAL CLOCK TIME : 11.25 ---\n"
+    "[0002.00] FCrypto: FCryptoGMPClient::LogTransferRates(): "
+    "BytesOut : 1000.0 B/s 0.008 Mb/s 0.0100 (avg) 0.0200 (max)\n"
+    "[0002.00] FCrypto: FCryptoGMPClient::LogTransferRates(): "
+    "BytesIn  : 2000.0 B/s 0.016 Mb/s 0.0300 (avg) 0.0400 (max)\n"
+    "[0002.00] ScriptLog: Clock time : 99\n"
+    "[0003.00] FCrypto: FCryptoBenchmarkMutator::Bench_Read_S8_Call(): "
+    "BENCH|read|static|8|call|2000|4.0\n"
+    "[0003.00] FCrypto: FCryptoBenchmarkMutator::Bench_Read_S8_Call(): "
+    "BENCH|read|static|8|call|2000|3.0\n"
+    "[0003.00] ScriptLog: BENCH|read|static|8|call|2000|1.0\n"
+)
+
+
+def test_parse():
+    t = timings.parse(LOG)
+    assert t.suites == {"TestMath": [1.5, 2.5], "TestAesCt": [1.5e-6]}
+    assert t.total_time == [12.5]
+    assert t.total_clock == [11.25]
+    assert t.gmp_out == timings.TransferRates(0.008, 0.01, 0.02)
+    assert t.gmp_in == timings.TransferRates(0.016, 0.03, 0.04)
+    assert t.benchmarks == {"read|static|8|call": [0.002, 0.0015]}
+
+
+def test_feed_in_blocks():
+    parser = TimingParser()
+    lines = LOG.splitlines(keepends=True)
+    for i in range(0, len(lines), 3):
+        parser.feed("".join(lines[i:i + 3]))
+    assert parser.timings == timings.parse(LOG)
+
+
+def test_merge_and_json():
+    a = timings.parse(LOG)
+    merged = a.merge(a)
+    assert merged.suites["TestMath"] == [1.5, 2.5, 1.5, 2.5]
+    assert merged.total_clock == [11.25, 11.25]
+    assert merged.gmp_in.avg_mbps == 0.06
+    assert a.suites["TestMath"] == [1.5, 2.5]
+    assert len(merged.benchmarks["read|static|8|call"]) == 4
+    assert timings.RunTimings.from_json(merged.to_json()) == merged
@@ -0,0 +1,182 @@
+# MIT License
+#
+# Copyright (c) 2023-2024 Tuomo Kriikkula
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Extraction of test timings and GMP transfer rates from the UDK log.
+
+FCryptoTestMutator.RunTest logs a "--- RUNNING <suite> (<iteration>) ---"
+line before each test suite and its Clock() time, scaled by 1000, 10^6
+and 10^9, after it. The first scaled value RunTest logs after a RUNNING
+line is taken as the time of that suite. FCryptoGMPClient logs its
+current, average and maximum transfer rates periodically, the last
+logged values are kept. FCryptoBenchmarkMutator (generated by
+DevUtils/bench_codegen.py) logs one
+"BENCH|<op>|<kind>|<size>|<mode>|<iterations>|<clock>" line per
+sample, kept as Clock() time per iteration, see benchreport.py.
+
+Like logtail.classify, the pattern is run over whole blocks of newly
+read text and only matches lines logged by FCrypto classes.
+"""
+
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+
+def _num(name: str) -> str:
+    return rf"(?P<{name}>-?[\d.]+(?:e[-+]?\d+)?)"
+
+
+TIMING_RE = re.compile(
+    r"^\[[\d.]+]\sFCrypto:\s\w+::(?P<func>\w+)\(\):\s(?:"
+    r"---\sRUNNING\s(?P<suite>\w+)\s\((?P<iteration>\d+)\)\s---"
+    rf"|Clock\stime\s:\s{_num('clock')}"
+    rf"|---\sTOTAL\sCLOCK\sTIME\s:\s{_num('total_clock')}"
+    rf"|---\sTOTAL\sTIME\s+:\s{_num('total_time')}"
+    r"|Bytes(?P<direction>Out|In)\s+:\s[\d.]+\sB/s\s"
+    rf"{_num('mbps')}\sMb/s\s"
+    rf"{_num('avg')}\s\(avg\)\s"
+    rf"{_num('max')}\s\(max\)"
+    r"|BENCH\|(?P<bench>\w+\|\w+\|\d+\|\w+)\|(?P<bench_iterations>\d+)\|"
+    rf"{_num('bench_clock')}"
+    r")",
+    re.MULTILINE,
+)
+
+# Clock time lines are logged as ClockTime * 1000 first.
+CLOCK_SCALE = 1000.0
+
+
+@dataclass
+class TransferRates:
+    mbps: float = 0.0
+    avg_mbps: float = 0.0
+    max_mbps: float = 0.0
+
+
+@dataclass
+class RunTimings:
+    # Suite name -> Clock() times of each run of the suite.
+    suites: dict[str, list[float]] = field(default_factory=dict)
+    # TOTAL CLOCK TIME and TOTAL TIME, one per server (shard).
+    total_clock: list[float] = field(default_factory=list)
+    total_time: list[float] = field(default_factory=list)
+    gmp_out: TransferRates = field(default_factory=TransferRates)
+    gmp_in: TransferRates = field(default_factory=TransferRates)
+    # "op|kind|size|mode" -> Clock() time per iteration of each sample.
+    benchmarks: dict[str, list[float]] = field(default_factory=dict)
+
+    def merge(self, other: "RunTimings") -> "RunTimings":
+        """Return the timings of this and other combined. Transfer
+        rates are summed, the GMP servers of shards run concurrently.
+        """
+        suites = {k: list(v) for k, v in self.suites.items()}
+        for suite, samples in other.suites.items():
+            suites.setdefault(suite, []).extend(samples)
+        benchmarks = {k: list(v) for k, v in self.benchmarks.items()}
+        for case, samples in other.benchmarks.items():
+            benchmarks.setdefault(case, []).extend(samples)
+        return RunTimings(
+            suites=suites,
+            total_clock=self.total_clock + other.total_clock,
+            total_time=self.total_time + other.total_time,
+            gmp_out=_add_rates(self.gmp_out, other.gmp_out),
+            gmp_in=_add_rates(self.gmp_in, other.gmp_in),
+            benchmarks=benchmarks,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "suites": self.suites,
+            "total_clock": self.total_clock,
+            "total_time": self.total_time,
+            "gmp_out": vars(self.gmp_out),
+            "gmp_in": vars(self.gmp_in),
+            "benchmarks": self.benchmarks,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "RunTimings":
+        return cls(
+            suites=data.get("suites", {}),
+            total_clock=data.get("total_clock", []),
+            total_time=data.get("total_time", []),
+            gmp_out=TransferRates(**data.get("gmp_out", {})),
+            gmp_in=TransferRates(**data.get("gmp_in", {})),
+            benchmarks=data.get("benchmarks", {}),
+        )
+
+
+def _add_rates(a: TransferRates, b: TransferRates) -> TransferRates:
+    return TransferRates(
+        mbps=a.mbps + b.mbps,
+        avg_mbps=a.avg_mbps + b.avg_mbps,
+        max_mbps=a.max_mbps + b.max_mbps,
+    )
+
+
+class TimingParser:
+    """Incrementally collects RunTimings from blocks of complete
+    log lines of a single server.
+    """
+
+    def __init__(self):
+        self._timings = RunTimings()
+        self._pending: str | None = None
+
+    @property
+    def timings(self) -> RunTimings:
+        return self._timings
+
+    def feed(self, text: str):
+        t = self._timings
+        for m in TIMING_RE.finditer(text):
+            if suite := m.group("suite"):
+                self._pending = suite
+            elif (clock := m.group("clock")) is not None:
+                if self._pending is not None and m.group("func") == "RunTest":
+                    t.suites.setdefault(self._pending, []).append(
+                        float(clock) / CLOCK_SCALE)
+                    self._pending = None
+            elif (total_clock := m.group("total_clock")) is not None:
+                t.total_clock.append(float(total_clock))
+            elif (total_time := m.group("total_time")) is not None:
+                t.total_time.append(float(total_time))
+            elif bench := m.group("bench"):
+                t.benchmarks.setdefault(bench, []).append(
+                    float(m.group("bench_clock")) / int(m.group("bench_iterations")))
+            elif direction := m.group("direction"):
+                rates = TransferRates(
+                    mbps=float(m.group("mbps")),
+                    avg_mbps=float(m.group("avg")),
+                    max_mbps=float(m.group("max")),
+                )
+                if direction == "Out":
+                    t.gmp_out = rates
+                else:
+                    t.gmp_in = rates
+
+
+def parse(text: str) -> RunTimings:
+    parser = TimingParser()
+    parser.feed(text)
+    return parser.timings